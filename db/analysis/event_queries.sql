@@ -11,39 +11,69 @@ ORDER BY start_time;
 # Get all events set up by specific organizer
 SELECT * FROM event WHERE organizer_id=27;
 
-# Get Top 5 Events by Revenue
-SELECT 
+# Events of a specific organizer one page at a time, by start time (Keyset-Paginated Stored Procedure)
+CALL ListOrganizerEventsPage(27, NULL, NULL, 20);
+
+# Get Top 5 Events by Revenue (from the daily_event_revenue rollup)
+SELECT
     e.title AS event_title,
-    SUM(t.price) AS total_revenue
+    r.total_revenue
 FROM
-    event e
-JOIN ticket t ON e.event_id = t.event_id
-JOIN orders o ON t.order_id = o.order_id
-WHERE o.status = 'Completed'
-GROUP BY e.event_id, e.title
-ORDER BY total_revenue DESC
-LIMIT 5;
-
-# Total Revenue by Event Category
+    (
+        SELECT event_id, SUM(revenue) AS total_revenue
+        FROM daily_event_revenue
+        GROUP BY event_id
+        HAVING SUM(ticket_count) > 0
+        ORDER BY total_revenue DESC
+        LIMIT 5
+    ) r
+JOIN event e ON e.event_id = r.event_id
+ORDER BY r.total_revenue DESC;
+
+# Total Revenue by Event Category (daily_event_revenue rollup grouped by category at query time)
 SELECT
     c.name AS Category,
-    SUM(t.price) AS TotalRevenue
+    SUM(r.revenue) AS TotalRevenue
 FROM
-    category c
-JOIN event_category ec ON c.category_id = ec.category_id
-JOIN event e ON ec.event_id = e.event_id
-JOIN ticket t ON t.event_id = e.event_id
-JOIN orders o ON t.order_id = o.order_id
+    daily_event_revenue r
+JOIN event_category ec ON ec.event_id = r.event_id
+JOIN category c ON c.category_id = ec.category_id
+GROUP BY
+    c.name
+HAVING
+    SUM(r.ticket_count) > 0 -- Rollups only count Completed orders
+ORDER BY
+    TotalRevenue DESC;
+
+# Total Revenue by Event Category in January 2026 (same join, one month of days)
+SELECT
+    c.name AS Category,
+    SUM(r.revenue) AS TotalRevenue
+FROM
+    daily_event_revenue r
+JOIN event_category ec ON ec.event_id = r.event_id
+JOIN category c ON c.category_id = ec.category_id
 WHERE
-    o.status = 'Completed' -- Only completed orders count as revenue
+    r.revenue_date >= '2026-01-01' AND r.revenue_date < '2026-02-01'
 GROUP BY
     c.name
+HAVING
+    SUM(r.ticket_count) > 0
 ORDER BY
     TotalRevenue DESC;
     
 # Sales Summary for a Single Event (Using Stored Procedure)
 CALL GetEventSalesSummary(1050);
 
+# Sales Summary for every event of one organizer (Batch Stored Procedure)
+CALL GetOrganizerSalesSummary(27);
+
+# Sales Summary for events starting in January 2026 (Batch Stored Procedure)
+CALL GetSalesSummaryByDateWindow('2026-01-01', '2026-02-01');
+
+# Sales Summary for a list of events (Batch Stored Procedure)
+CALL GetSalesSummaryForEvents('[1011, 1050, 1074]');
+
 # Upcoming Events in a Specific City (New Braunfels)
 SELECT
     e.title AS EventTitle,
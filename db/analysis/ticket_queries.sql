@@ -30,20 +30,22 @@ FROM ticket AS t
 INNER JOIN user AS u ON t.user_id=u.user_id
 WHERE event_id=1074;
 
+# The same tickets one page at a time (Keyset-Paginated Stored Procedure)
+# Pass the last ticket_id of the page for the next page
+CALL ListEventTicketsPage(1074, NULL, 100);
+
 
 # Tickets Sold vs. Event Capacity
+# Reads the trigger-maintained counters in event_sales_summary instead of counting tickets
 SELECT
     e.title AS EventTitle,
     e.capacity AS MaxCapacity,
-    COUNT(t.ticket_id) AS TicketsSold,
-    (e.capacity - COUNT(t.ticket_id)) AS RemainingSeats
+    COALESCE(s.purchased_count, 0) AS TicketsSold,
+    (e.capacity - COALESCE(s.purchased_count, 0)) AS RemainingSeats
 FROM
     event e
-LEFT JOIN ticket t 
-    ON e.event_id = t.event_id 
-    AND t.status = 'Purchased'
-GROUP BY
-    e.event_id, e.title, e.capacity
+LEFT JOIN event_sales_summary s
+    ON e.event_id = s.event_id
 ORDER BY
     TicketsSold DESC;
 
@@ -60,6 +62,20 @@ WHERE
     o.user_id=21;
 
 
+# Orders Placed in December 2025 by Status
+# On db/schema_partitioned.sql this reads only the p202512 partition of orders
+SELECT
+    o.status,
+    COUNT(*) AS Orders,
+    SUM(o.total_amount) AS Amount
+FROM
+    orders o
+WHERE
+    o.order_date >= '2025-12-01' AND o.order_date < '2026-01-01'
+GROUP BY
+    o.status;
+
+
 # Attempting to Insert a Ticket for a Canceled Event (Trigger Test)
 # This should fail due to the check_event_status_before_sale trigger
 # event_id 1013 is a canceled event
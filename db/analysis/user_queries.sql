@@ -6,6 +6,10 @@ ORDER BY
 	last_name, 
 	first_name;
 
+# List users one page at a time, sorted by last, first (Keyset-Paginated Stored Procedure)
+# Pass the last row's last_name, first_name, user_id for the next page
+CALL ListUsersPage(NULL, NULL, NULL, 50);
+
 # List active admins and their available contact information (Email)
 SELECT 
 	first_name, 
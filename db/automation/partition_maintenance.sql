@@ -0,0 +1,148 @@
+-- ============================================================
+-- File: partition_maintenance.sql
+-- Purpose:
+--   Rolling monthly partitions for orders on db/schema_partitioned.sql:
+--   AddOrderPartitions() splits future months off pmax, and
+--   PurgeOrderPartitions() drops months past the retention window.
+--
+-- Notes:
+--   - Partitions are named pYYYYMM and hold that calendar month.
+--     Both procedures read the partition list from
+--     information_schema.PARTITIONS, so they can run repeatedly.
+--   - db/schema_partitioned.sql only lists months up to 2026-12. Call
+--     AddOrderPartitions(3) once after loading it; the
+--     roll_order_partitions event at the end of this file then runs it
+--     on the 1st of every month (needs event_scheduler = ON), so three
+--     future months always exist.
+--   - Retention is a policy choice, so PurgeOrderPartitions() is not
+--     scheduled here; add e.g. CALL PurgeOrderPartitions(24) to the
+--     event if orders should expire.
+-- ============================================================
+
+USE eventify_db;
+
+DELIMITER //
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `AddOrderPartitions`(
+    IN p_months_ahead INT
+)
+BEGIN
+    DECLARE v_last_name VARCHAR(64);
+    DECLARE v_month DATE;
+    DECLARE v_until DATE;
+    DECLARE v_added INT DEFAULT 0;
+
+    -- 1. The newest monthly partition (pYYYYMM sorts chronologically)
+    SELECT MAX(PARTITION_NAME) INTO v_last_name
+    FROM information_schema.PARTITIONS
+    WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'orders'
+        AND PARTITION_NAME REGEXP '^p[0-9]{6}$';
+
+    IF v_last_name IS NULL THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Error: orders has no pYYYYMM partitions; load db/schema_partitioned.sql first.';
+    END IF;
+
+    SET v_month = DATE_ADD(STR_TO_DATE(CONCAT(SUBSTRING(v_last_name, 2), '01'), '%Y%m%d'), INTERVAL 1 MONTH);
+    SET v_until = DATE_ADD(DATE_FORMAT(NOW(), '%Y-%m-01'), INTERVAL p_months_ahead MONTH);
+
+    -- 2. Split one month at a time off pmax (instant while pmax is empty)
+    WHILE v_month <= v_until DO
+        SET @partition_sql = CONCAT(
+            'ALTER TABLE orders REORGANIZE PARTITION pmax INTO (',
+            'PARTITION ', DATE_FORMAT(v_month, 'p%Y%m'),
+            ' VALUES LESS THAN (''', DATE_ADD(v_month, INTERVAL 1 MONTH), '''), ',
+            'PARTITION pmax VALUES LESS THAN (MAXVALUE))'
+        );
+        PREPARE partition_stmt FROM @partition_sql;
+        EXECUTE partition_stmt;
+        DEALLOCATE PREPARE partition_stmt;
+
+        SET v_added = v_added + 1;
+        SET v_month = DATE_ADD(v_month, INTERVAL 1 MONTH);
+    END WHILE;
+
+    SELECT v_added AS AddedPartitions;
+END //
+
+-- **Documentation: Makes sure orders has a partition for every month up to `p_months_ahead` months from now, so new orders never land in the catch-all pmax partition.
+-- **Functionality: Finds the newest pYYYYMM partition and splits each missing month off pmax with ALTER TABLE ... REORGANIZE PARTITION (dynamic SQL). Returns the number of partitions added. Safe to re-run.
+-- **Execution: `CALL AddOrderPartitions(3);`
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `PurgeOrderPartitions`(
+    IN p_keep_months INT
+)
+BEGIN
+    DECLARE v_done BOOLEAN DEFAULT FALSE;
+    DECLARE v_name VARCHAR(64);
+    DECLARE v_cutoff VARCHAR(7) DEFAULT DATE_FORMAT(DATE_SUB(NOW(), INTERVAL p_keep_months MONTH), 'p%Y%m');
+    DECLARE v_cutoff_date DATE DEFAULT DATE_FORMAT(DATE_SUB(NOW(), INTERVAL p_keep_months MONTH), '%Y-%m-01');
+    DECLARE v_dropped INT DEFAULT 0;
+    -- p_history only expires once its upper bound is past the cutoff
+    DECLARE expired CURSOR FOR
+        SELECT PARTITION_NAME
+        FROM information_schema.PARTITIONS
+        WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'orders'
+            AND ((PARTITION_NAME = 'p_history' AND TRIM(BOTH '''' FROM PARTITION_DESCRIPTION) <= v_cutoff_date)
+                OR (PARTITION_NAME REGEXP '^p[0-9]{6}$' AND PARTITION_NAME < v_cutoff))
+        ORDER BY PARTITION_ORDINAL_POSITION;
+    DECLARE CONTINUE HANDLER FOR NOT FOUND SET v_done = TRUE;
+
+    IF p_keep_months IS NULL OR p_keep_months < 1 THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Error: Keep at least one month of orders.';
+    END IF;
+
+    OPEN expired;
+    purge_loop: LOOP
+        FETCH expired INTO v_name;
+        IF v_done THEN
+            LEAVE purge_loop;
+        END IF;
+
+        -- p_history is only ever emptied, never dropped: once empty there
+        -- is nothing left to purge and it is not counted again
+        IF v_name = 'p_history' AND NOT EXISTS (SELECT 1 FROM orders PARTITION (p_history)) THEN
+            ITERATE purge_loop;
+        END IF;
+
+        -- 1. No FK cascade on partitioned tables: remove the month's tickets
+        -- first (their triggers keep the derived tables correct)
+        SET @purge_sql = CONCAT(
+            'DELETE t FROM ticket t JOIN orders PARTITION (', v_name, ') o ON o.order_id = t.order_id'
+        );
+        PREPARE purge_stmt FROM @purge_sql;
+        EXECUTE purge_stmt;
+        DEALLOCATE PREPARE purge_stmt;
+
+        -- 2. Then drop the month itself (no row-by-row delete); p_history is
+        -- emptied instead, it bounds the first month
+        IF v_name = 'p_history' THEN
+            SET @purge_sql = 'ALTER TABLE orders TRUNCATE PARTITION p_history';
+        ELSE
+            SET @purge_sql = CONCAT('ALTER TABLE orders DROP PARTITION ', v_name);
+        END IF;
+        PREPARE purge_stmt FROM @purge_sql;
+        EXECUTE purge_stmt;
+        DEALLOCATE PREPARE purge_stmt;
+
+        SET v_dropped = v_dropped + 1;
+    END LOOP;
+    CLOSE expired;
+
+    SELECT v_dropped AS PurgedPartitions;
+END //
+
+-- **Documentation: Enforces order retention: every monthly orders partition older than `p_keep_months` full months is removed together with its tickets.
+-- **Functionality: Walks the expired partitions oldest first. Each month's tickets are deleted with one join against that single orders partition (so the ticket triggers update event_sales_summary, event_inventory and the revenue rollups), then the partition is dropped in one metadata operation instead of deleting the orders row by row. The catch-all p_history partition is emptied (not dropped) once all of it is past the retention window, and skipped while it is empty. Returns the number of monthly partitions dropped, plus one if p_history was emptied.
+-- **Execution: `CALL PurgeOrderPartitions(24);`
+
+DELIMITER ;
+
+-- ------------------------------------------------------------
+-- Schedule: keep three future months split off pmax
+-- ------------------------------------------------------------
+CREATE EVENT IF NOT EXISTS roll_order_partitions
+    ON SCHEDULE EVERY 1 MONTH
+    STARTS DATE_ADD(DATE_FORMAT(NOW(), '%Y-%m-01'), INTERVAL 1 MONTH)
+    DO CALL AddOrderPartitions(3);
@@ -4,21 +4,458 @@ CREATE DEFINER=`root`@`localhost` PROCEDURE `GetEventSalesSummary`(
     IN p_event_id INT
 )
 BEGIN
+    -- Two primary-key lookups; the counters are kept by the sales_summary_* triggers
     SELECT
         e.title,
         e.capacity AS TotalCapacity,
-        COUNT(t.ticket_id) AS TicketsSold,
-        (e.capacity - COUNT(t.ticket_id)) AS RemainingCapacity
+        COALESCE(s.purchased_count, 0) AS TicketsSold,
+        (e.capacity - COALESCE(s.purchased_count, 0)) AS RemainingCapacity,
+        COALESCE(s.reserved_count, 0) AS TicketsReserved,
+        COALESCE(s.refunded_count, 0) AS TicketsRefunded,
+        COALESCE(s.purchased_revenue, 0) AS Revenue
     FROM
         event e
     LEFT JOIN
-        ticket t ON e.event_id = t.event_id AND t.status = 'Purchased'
+        event_sales_summary s ON e.event_id = s.event_id
     WHERE
-        e.event_id = p_event_id
-    GROUP BY
-        e.event_id, e.title, e.capacity;
+        e.event_id = p_event_id;
 END //
 
 -- **Documentation: Provides event organizers and admins with a real-time summary of sales and remaining inventory for a single event. 
--- **Functionality: Takes one input parameter (`p_event_id`) and executes a multi-table query with aggregate functions (`COUNT`) to calculate tickets sold and remaining capacity. 
--- **Execution: `CALL GetEventSalesSummary(1005);` (Using an event_id from the event table)
\ No newline at end of file
+-- **Functionality: Takes one input parameter (`p_event_id`) and reads the event's row in `event_sales_summary` to report tickets sold, remaining capacity, reserved/refunded tickets and revenue in constant time. 
+-- **Execution: `CALL GetEventSalesSummary(1005);` (Using an event_id from the event table)
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `RebuildEventSalesSummary`(
+    IN p_event_id INT
+)
+BEGIN
+    DECLARE v_locked INT;
+
+    START TRANSACTION;
+
+    -- 1. Lock the summary rows first: ticket triggers touching these events wait
+    -- until the rebuild commits, and the aggregate below reads a snapshot taken
+    -- after every earlier ticket change has been committed.
+    SELECT COUNT(*) INTO v_locked
+    FROM event_sales_summary
+    WHERE p_event_id IS NULL OR event_id = p_event_id
+    FOR UPDATE;
+
+    -- 2. Recount from ticket
+    DROP TEMPORARY TABLE IF EXISTS tmp_event_sales;
+    CREATE TEMPORARY TABLE tmp_event_sales AS
+    SELECT
+        e.event_id,
+        COALESCE(SUM(t.status = 'Purchased'), 0) AS purchased_count,
+        COALESCE(SUM(t.status = 'Reserved'), 0) AS reserved_count,
+        COALESCE(SUM(t.status = 'Refunded'), 0) AS refunded_count,
+        COALESCE(SUM(IF(t.status = 'Purchased', t.price, 0)), 0) AS purchased_revenue
+    FROM
+        event e
+    LEFT JOIN
+        ticket t ON e.event_id = t.event_id
+    WHERE
+        p_event_id IS NULL OR e.event_id = p_event_id
+    GROUP BY
+        e.event_id;
+
+    -- 3. Report how many events had drifted, then replace them
+    SELECT COUNT(*) AS DriftedEvents
+    FROM tmp_event_sales f
+    LEFT JOIN event_sales_summary s ON s.event_id = f.event_id
+    WHERE s.event_id IS NULL
+        OR s.purchased_count <> f.purchased_count
+        OR s.reserved_count <> f.reserved_count
+        OR s.refunded_count <> f.refunded_count
+        OR s.purchased_revenue <> f.purchased_revenue;
+
+    DELETE FROM event_sales_summary
+    WHERE p_event_id IS NULL OR event_id = p_event_id;
+
+    INSERT INTO event_sales_summary (event_id, purchased_count, reserved_count, refunded_count, purchased_revenue)
+    SELECT event_id, purchased_count, reserved_count, refunded_count, purchased_revenue
+    FROM tmp_event_sales;
+
+    COMMIT;
+    DROP TEMPORARY TABLE tmp_event_sales;
+END //
+
+-- **Documentation: Recomputes `event_sales_summary` from `ticket` and reports how many events had drifted (e.g. after a bulk load or manual edits that bypassed the triggers).
+-- **Functionality: Takes one input parameter (`p_event_id`); NULL rebuilds every event. Runs in one transaction that locks the affected summary rows, so concurrent ticket sales are neither lost nor double counted.
+-- **Execution: `CALL RebuildEventSalesSummary(NULL);` or `CALL RebuildEventSalesSummary(1005);`
+
+
+-- ------------------------------------------------------------
+-- Batch sales summaries (one set-based query per call)
+-- ------------------------------------------------------------
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `GetOrganizerSalesSummary`(
+    IN p_organizer_id INT
+)
+BEGIN
+    SELECT
+        e.event_id,
+        e.title,
+        e.start_time,
+        e.status,
+        e.capacity AS TotalCapacity,
+        COALESCE(s.purchased_count, 0) AS TicketsSold,
+        (e.capacity - COALESCE(s.purchased_count, 0)) AS RemainingCapacity,
+        COALESCE(s.reserved_count, 0) AS TicketsReserved,
+        COALESCE(s.refunded_count, 0) AS TicketsRefunded,
+        COALESCE(s.purchased_revenue, 0) AS Revenue
+    FROM
+        event e
+    LEFT JOIN
+        event_sales_summary s ON e.event_id = s.event_id
+    WHERE
+        e.organizer_id = p_organizer_id
+    ORDER BY
+        e.start_time;
+END //
+
+-- **Documentation: Sales summary for every event of one organizer in a single call (organizer dashboard).
+-- **Functionality: Takes one input parameter (`p_organizer_id`); finds the organizer's events through the organizer_id FK index and joins each to its `event_sales_summary` row by primary key, so `ticket` is never scanned.
+-- **Execution: `CALL GetOrganizerSalesSummary(27);`
+
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `GetSalesSummaryByDateWindow`(
+    IN p_from DATETIME,
+    IN p_to DATETIME
+)
+BEGIN
+    SELECT
+        e.event_id,
+        e.title,
+        e.start_time,
+        e.status,
+        e.capacity AS TotalCapacity,
+        COALESCE(s.purchased_count, 0) AS TicketsSold,
+        (e.capacity - COALESCE(s.purchased_count, 0)) AS RemainingCapacity,
+        COALESCE(s.reserved_count, 0) AS TicketsReserved,
+        COALESCE(s.refunded_count, 0) AS TicketsRefunded,
+        COALESCE(s.purchased_revenue, 0) AS Revenue
+    FROM
+        event e
+    LEFT JOIN
+        event_sales_summary s ON e.event_id = s.event_id
+    WHERE
+        e.start_time >= p_from
+        AND e.start_time < p_to
+    ORDER BY
+        e.start_time;
+END //
+
+-- **Documentation: Sales summary for every event starting in a time window, e.g. this weekend's events.
+-- **Functionality: Takes a half-open window (`p_from` inclusive, `p_to` exclusive) on `start_time`, range-scans IX_EventStartTime (db/migrations/003_event_start_time_index.sql) and joins `event_sales_summary` by primary key.
+-- **Execution: `CALL GetSalesSummaryByDateWindow('2026-01-01', '2026-02-01');`
+
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `GetSalesSummaryForEvents`(
+    IN p_event_ids JSON
+)
+BEGIN
+    SELECT
+        e.event_id,
+        e.title,
+        e.start_time,
+        e.status,
+        e.capacity AS TotalCapacity,
+        COALESCE(s.purchased_count, 0) AS TicketsSold,
+        (e.capacity - COALESCE(s.purchased_count, 0)) AS RemainingCapacity,
+        COALESCE(s.reserved_count, 0) AS TicketsReserved,
+        COALESCE(s.refunded_count, 0) AS TicketsRefunded,
+        COALESCE(s.purchased_revenue, 0) AS Revenue
+    FROM
+        -- The JSON array becomes a derived table of ids, so both joins are PK lookups
+        (SELECT DISTINCT ids.event_id
+         FROM JSON_TABLE(p_event_ids, '$[*]' COLUMNS (event_id INT PATH '$')) AS ids) AS wanted
+    JOIN
+        event e ON e.event_id = wanted.event_id
+    LEFT JOIN
+        event_sales_summary s ON e.event_id = s.event_id
+    ORDER BY
+        e.event_id;
+END //
+
+-- **Documentation: Sales summary for an arbitrary list of events in one round trip (e.g. a dashboard page of event ids).
+-- **Functionality: Takes a JSON array of event ids (`p_event_ids`); duplicates are ignored and unknown ids are skipped. Uses JSON_TABLE (MySQL 8.0+).
+-- **Execution: `CALL GetSalesSummaryForEvents('[1001, 1005, 1050]');`
+
+
+-- ------------------------------------------------------------
+-- Checkout
+-- ------------------------------------------------------------
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `PurchaseTickets`(
+    IN p_user_id INT,
+    IN p_event_id INT,
+    IN p_qty INT,
+    IN p_unit_price DECIMAL(10, 2)
+)
+BEGIN
+    DECLARE v_event_status VARCHAR(50);
+    DECLARE v_order_id INT;
+    DECLARE v_remaining INT;
+
+    -- Bad arguments fail before the procedure touches any transaction,
+    -- so they leave the caller's work alone
+    IF p_qty IS NULL OR p_qty < 1 OR p_qty > 100 THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Error: Ticket quantity must be between 1 and 100.';
+    END IF;
+    IF p_unit_price IS NULL OR p_unit_price < 0 THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Error: Ticket price must be non-negative.';
+    END IF;
+
+    purchase: BEGIN
+        -- From here on any failure undoes the whole order; the handler only
+        -- covers this block, i.e. the procedure's own transaction
+        DECLARE EXIT HANDLER FOR SQLEXCEPTION
+        BEGIN
+            ROLLBACK;
+            RESIGNAL;
+        END;
+
+        START TRANSACTION;
+
+        -- 1. Event status, checked once for the whole order
+        SELECT status INTO v_event_status
+        FROM event
+        WHERE event_id = p_event_id;
+
+        IF v_event_status IS NULL THEN
+            SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'Error: Event does not exist.';
+        END IF;
+        IF v_event_status = 'Completed' OR v_event_status = 'Canceled' THEN
+            SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'Error: Cannot purchase a ticket for an event that is Canceled or Completed.';
+        END IF;
+
+        -- 2. Lock the event's inventory row (the lock single-ticket sales queue on)
+        -- and fail the whole order up front if it does not fit; check_event_status_before_sale
+        -- then takes the seats one per ticket under that lock
+        SELECT remaining INTO v_remaining
+        FROM event_inventory
+        WHERE event_id = p_event_id
+        FOR UPDATE;
+
+        IF COALESCE(v_remaining, 0) < p_qty THEN
+            SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'Error: Not enough tickets left for this event.';
+        END IF;
+
+        -- 3. The order
+        INSERT INTO orders (user_id, total_amount, order_date, status)
+        VALUES (p_user_id, p_qty * p_unit_price, NOW(), 'Completed');
+        SET v_order_id = LAST_INSERT_ID();
+
+        -- 4. All tickets in one statement; the ticket triggers still check and count every row
+        INSERT INTO ticket (ticket_id, order_id, event_id, user_id, price, status)
+        WITH RECURSIVE seq (n) AS (
+            SELECT 1
+            UNION ALL
+            SELECT n + 1 FROM seq WHERE n < p_qty
+        )
+        SELECT CONCAT('TKT-', v_order_id, '-', n), v_order_id, p_event_id, p_user_id, p_unit_price, 'Purchased'
+        FROM seq;
+
+        COMMIT;
+    END purchase;
+
+    -- 5. Hand the new ids back to the caller
+    SELECT order_id, ticket_id
+    FROM ticket
+    WHERE order_id = v_order_id
+    ORDER BY LENGTH(ticket_id), ticket_id;
+END //
+
+-- **Documentation: Checkout for a multi-ticket order: creates the order and all of its tickets in one transaction and one round trip, instead of an orders INSERT plus one ticket INSERT (and one trigger status lookup) per ticket.
+-- **Functionality: Validates quantity (1-100) and price, checks the event status once, locks the event's `event_inventory` row and rejects the order up front if fewer than `p_qty` seats are left, then inserts the order and every ticket with one INSERT ... SELECT over a recursive sequence. `check_event_status_before_sale` still checks each ticket and takes its seat, so there is no way to insert tickets past the triggers. Returns one row per ticket (`order_id`, `ticket_id`). Invalid quantity or price is rejected before the procedure starts its transaction, so it does not roll back work the caller has open; any later error rolls the whole order back.
+-- **Execution: `CALL PurchaseTickets(21, 1050, 5, 49.99);`
+
+
+-- ------------------------------------------------------------
+-- Daily revenue rollups
+-- ------------------------------------------------------------
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `ApplyRevenueDelta`(
+    IN p_revenue_date DATE,
+    IN p_event_id INT,
+    IN p_tickets INT,
+    IN p_revenue DECIMAL(14, 2)
+)
+BEGIN
+    INSERT INTO daily_event_revenue (revenue_date, event_id, ticket_count, revenue)
+    VALUES (p_revenue_date, p_event_id, p_tickets, p_revenue)
+    ON DUPLICATE KEY UPDATE
+        ticket_count = ticket_count + VALUES(ticket_count),
+        revenue = revenue + VALUES(revenue);
+END //
+
+-- **Documentation: Adds (or, with negative amounts, subtracts) tickets and revenue to one event's day in `daily_event_revenue`.
+-- **Functionality: One upsert keyed by the rollup primary key, so a sale locks only its own event's day row; concurrent sales of different events never wait on each other. Category revenue is grouped from these rows at query time. Called by the revenue_* triggers for single-ticket changes.
+-- **Execution: Internal, e.g. `CALL ApplyRevenueDelta('2026-01-15', 1050, 1, 49.99);`
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `ApplyOrderRevenue`(
+    IN p_order_id INT,
+    IN p_revenue_date DATE,
+    IN p_sign INT
+)
+BEGIN
+    INSERT INTO daily_event_revenue (revenue_date, event_id, ticket_count, revenue)
+    SELECT p_revenue_date, t.event_id, p_sign * COUNT(*), p_sign * SUM(t.price)
+    FROM ticket t
+    WHERE t.order_id = p_order_id
+    GROUP BY t.event_id
+    ON DUPLICATE KEY UPDATE
+        ticket_count = ticket_count + VALUES(ticket_count),
+        revenue = revenue + VALUES(revenue);
+END //
+
+-- **Documentation: Adds (`p_sign` = 1) or removes (`p_sign` = -1) every ticket of one order from `daily_event_revenue` on `p_revenue_date`.
+-- **Functionality: Set-based over the order's tickets (FK_TicketOrder index), so an order completing, being refunded, moving to another day or being deleted costs one statement, not one per ticket.
+-- **Execution: Internal, e.g. `CALL ApplyOrderRevenue(5001, '2026-01-15', -1);`
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `RefreshRevenueRollups`(
+    IN p_from_date DATE,
+    IN p_to_date DATE
+)
+BEGIN
+    DECLARE v_locked INT;
+
+    START TRANSACTION;
+
+    -- 1. Lock the days being rebuilt (gap locks included), so trigger updates
+    -- for those days wait until the refresh commits
+    SELECT COUNT(*) INTO v_locked
+    FROM daily_event_revenue
+    WHERE (p_from_date IS NULL OR revenue_date >= p_from_date)
+        AND (p_to_date IS NULL OR revenue_date < p_to_date)
+    FOR UPDATE;
+
+    DELETE FROM daily_event_revenue
+    WHERE (p_from_date IS NULL OR revenue_date >= p_from_date)
+        AND (p_to_date IS NULL OR revenue_date < p_to_date);
+
+    -- 2. Recount the window from orders + ticket
+    INSERT INTO daily_event_revenue (revenue_date, event_id, ticket_count, revenue)
+    SELECT DATE(o.order_date), t.event_id, COUNT(*), SUM(t.price)
+    FROM orders o
+    JOIN ticket t ON t.order_id = o.order_id
+    WHERE o.status = 'Completed'
+        AND (p_from_date IS NULL OR o.order_date >= p_from_date)
+        AND (p_to_date IS NULL OR o.order_date < p_to_date)
+    GROUP BY DATE(o.order_date), t.event_id;
+
+    COMMIT;
+
+    SELECT COUNT(DISTINCT revenue_date) AS RefreshedDays
+    FROM daily_event_revenue
+    WHERE (p_from_date IS NULL OR revenue_date >= p_from_date)
+        AND (p_to_date IS NULL OR revenue_date < p_to_date);
+END //
+
+-- **Documentation: Backfills or repairs `daily_event_revenue` for the order days in [`p_from_date`, `p_to_date`) from `orders` and `ticket`.
+-- **Functionality: NULL bounds are open, so `(NULL, NULL)` rebuilds all history. Runs in one transaction that locks the window's rollup rows; run it in monthly windows on large histories to keep the transaction short. Returns the number of days with revenue in the window.
+-- **Execution: `CALL RefreshRevenueRollups(NULL, NULL);` or `CALL RefreshRevenueRollups('2026-01-01', '2026-02-01');`
+
+
+-- ------------------------------------------------------------
+-- Keyset-paginated listings (backed by migration 007's indexes)
+-- ------------------------------------------------------------
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `ListUsersPage`(
+    IN p_after_last_name VARCHAR(100),
+    IN p_after_first_name VARCHAR(100),
+    IN p_after_user_id INT,
+    IN p_page_size INT
+)
+BEGIN
+    DECLARE v_page_size INT DEFAULT LEAST(GREATEST(COALESCE(p_page_size, 50), 1), 500);
+
+    IF p_after_user_id IS NULL THEN
+        -- First page
+        SELECT user_id, last_name, first_name, email, role, status
+        FROM user
+        ORDER BY last_name, first_name, user_id
+        LIMIT v_page_size;
+    ELSE
+        -- Seek past the last row of the previous page; no rows are skipped over
+        SELECT user_id, last_name, first_name, email, role, status
+        FROM user
+        WHERE (last_name, first_name, user_id) > (p_after_last_name, p_after_first_name, p_after_user_id)
+        ORDER BY last_name, first_name, user_id
+        LIMIT v_page_size;
+    END IF;
+END //
+
+-- **Documentation: Lists users by last, first name one page at a time, for admin screens that cannot hold the whole `user` table.
+-- **Functionality: Keyset (seek) pagination: the caller passes the (last_name, first_name, user_id) of the last row it received, and the next page is read from that point of IX_UserListing, so page 1000 costs the same as page 1 (OFFSET would read and discard every earlier row). user_id breaks ties between equal names. The page size is clamped to 1-500 (default 50).
+-- **Execution: `CALL ListUsersPage(NULL, NULL, NULL, 50);` then `CALL ListUsersPage('Garcia', 'Maria', 312, 50);`
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `ListOrganizerEventsPage`(
+    IN p_organizer_id INT,
+    IN p_after_start_time DATETIME,
+    IN p_after_event_id INT,
+    IN p_page_size INT
+)
+BEGIN
+    DECLARE v_page_size INT DEFAULT LEAST(GREATEST(COALESCE(p_page_size, 50), 1), 500);
+
+    IF p_after_event_id IS NULL THEN
+        SELECT event_id, title, start_time, status, capacity
+        FROM event
+        WHERE organizer_id = p_organizer_id
+        ORDER BY start_time, event_id
+        LIMIT v_page_size;
+    ELSE
+        SELECT event_id, title, start_time, status, capacity
+        FROM event
+        WHERE organizer_id = p_organizer_id
+            AND (start_time, event_id) > (p_after_start_time, p_after_event_id)
+        ORDER BY start_time, event_id
+        LIMIT v_page_size;
+    END IF;
+END //
+
+-- **Documentation: Lists one organizer's events by start time, one page at a time.
+-- **Functionality: Keyset pagination on (start_time, event_id) inside IX_EventOrganizerStart: a page is one index range read plus a primary-key lookup per returned row. Pass the start_time and event_id of the previous page's last row, or NULLs for the first page. Page size 1-500 (default 50).
+-- **Execution: `CALL ListOrganizerEventsPage(27, NULL, NULL, 20);` then `CALL ListOrganizerEventsPage(27, '2026-03-14 19:00:00', 1088, 20);`
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `ListEventTicketsPage`(
+    IN p_event_id INT,
+    IN p_after_ticket_id VARCHAR(50),
+    IN p_page_size INT
+)
+BEGIN
+    DECLARE v_page_size INT DEFAULT LEAST(GREATEST(COALESCE(p_page_size, 50), 1), 500);
+
+    -- 1. The page of tickets from IX_TicketEventPage, 2. the holders of just those tickets
+    SELECT
+        page.ticket_id,
+        page.status,
+        page.price,
+        u.user_id,
+        u.first_name,
+        u.last_name,
+        u.email
+    FROM
+        (
+            SELECT ticket_id, status, price, user_id
+            FROM ticket
+            WHERE event_id = p_event_id AND ticket_id > COALESCE(p_after_ticket_id, '')
+            ORDER BY ticket_id
+            LIMIT v_page_size
+        ) page
+    JOIN
+        user u ON u.user_id = page.user_id
+    ORDER BY
+        page.ticket_id;
+END //
+
+-- **Documentation: Lists the tickets of one event with their holders' contact details, one page at a time.
+-- **Functionality: Seeks to `ticket_id > p_after_ticket_id` within the event in IX_TicketEventPage, takes one page (reading the remaining ticket columns by primary key) and only then joins `user` by primary key for those rows. Pass the last ticket_id of the previous page, or NULL for the first page. Page size 1-500 (default 50).
+-- **Execution: `CALL ListEventTicketsPage(1074, NULL, 100);` then `CALL ListEventTicketsPage(1074, 'TKT-00048211', 100);`
@@ -19,7 +19,334 @@ BEGIN
         SIGNAL SQLSTATE '45000'
         SET MESSAGE_TEXT = 'Error: Cannot purchase a ticket for an event that is Canceled or Completed.';
     END IF;
+
+    -- 3. Take one seat from the event's inventory (Refunded tickets hold no seat).
+    -- The guarded decrement row-locks only this event's inventory row until
+    -- commit: concurrent buyers of one event queue on it and can never oversell,
+    -- while sales for other events go ahead in parallel.
+    IF NEW.status IN ('Purchased', 'Reserved') THEN
+        UPDATE event_inventory
+        SET remaining = remaining - 1
+        WHERE event_id = NEW.event_id AND remaining > 0;
+
+        IF ROW_COUNT() = 0 THEN
+            SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'Error: Event is sold out.';
+        END IF;
+    END IF;
+END //
+
+-- **Documentation: This trigger ensures that tickets cannot be sold for events that are either 'Completed' or 'Canceled', or beyond the event's capacity. 
+-- **Functionality: It activates before any INSERT operation on the `ticket` table, checks the status of the associated event, and raises an error if the event is not in a valid state for ticket sales. Purchased/Reserved tickets then take a seat from `event_inventory`; when none is left the INSERT fails with 'Event is sold out'. Both checks apply to every row, including the tickets inserted by `PurchaseTickets()`.
+
+-- ------------------------------------------------------------
+-- event_sales_summary maintenance
+-- ------------------------------------------------------------
+
+CREATE TRIGGER sales_summary_after_event_insert
+AFTER INSERT ON event
+FOR EACH ROW
+BEGIN
+    -- Every event starts with an all-zero summary row
+    INSERT IGNORE INTO event_sales_summary (event_id) VALUES (NEW.event_id);
+END //
+
+CREATE TRIGGER sales_summary_after_ticket_insert
+AFTER INSERT ON ticket
+FOR EACH ROW
+BEGIN
+    -- Upsert, so events created before the summary table existed are covered too
+    INSERT INTO event_sales_summary (event_id, purchased_count, reserved_count, refunded_count, purchased_revenue)
+    VALUES (
+        NEW.event_id,
+        NEW.status = 'Purchased',
+        NEW.status = 'Reserved',
+        NEW.status = 'Refunded',
+        IF(NEW.status = 'Purchased', NEW.price, 0)
+    )
+    ON DUPLICATE KEY UPDATE
+        purchased_count = purchased_count + VALUES(purchased_count),
+        reserved_count = reserved_count + VALUES(reserved_count),
+        refunded_count = refunded_count + VALUES(refunded_count),
+        purchased_revenue = purchased_revenue + VALUES(purchased_revenue);
+END //
+
+CREATE TRIGGER sales_summary_after_ticket_update
+AFTER UPDATE ON ticket
+FOR EACH ROW
+BEGIN
+    -- 1. Take the old row out of its event's counters
+    UPDATE event_sales_summary
+    SET purchased_count = purchased_count - (OLD.status = 'Purchased'),
+        reserved_count = reserved_count - (OLD.status = 'Reserved'),
+        refunded_count = refunded_count - (OLD.status = 'Refunded'),
+        purchased_revenue = purchased_revenue - IF(OLD.status = 'Purchased', OLD.price, 0)
+    WHERE event_id = OLD.event_id;
+
+    -- 2. Add the new row (the event may have changed as well as the status/price)
+    INSERT INTO event_sales_summary (event_id, purchased_count, reserved_count, refunded_count, purchased_revenue)
+    VALUES (
+        NEW.event_id,
+        NEW.status = 'Purchased',
+        NEW.status = 'Reserved',
+        NEW.status = 'Refunded',
+        IF(NEW.status = 'Purchased', NEW.price, 0)
+    )
+    ON DUPLICATE KEY UPDATE
+        purchased_count = purchased_count + VALUES(purchased_count),
+        reserved_count = reserved_count + VALUES(reserved_count),
+        refunded_count = refunded_count + VALUES(refunded_count),
+        purchased_revenue = purchased_revenue + VALUES(purchased_revenue);
+END //
+
+CREATE TRIGGER sales_summary_after_ticket_delete
+AFTER DELETE ON ticket
+FOR EACH ROW
+BEGIN
+    UPDATE event_sales_summary
+    SET purchased_count = purchased_count - (OLD.status = 'Purchased'),
+        reserved_count = reserved_count - (OLD.status = 'Reserved'),
+        refunded_count = refunded_count - (OLD.status = 'Refunded'),
+        purchased_revenue = purchased_revenue - IF(OLD.status = 'Purchased', OLD.price, 0)
+    WHERE event_id = OLD.event_id;
+END //
+
+CREATE TRIGGER sales_summary_before_order_delete
+BEFORE DELETE ON orders
+FOR EACH ROW
+BEGIN
+    -- Tickets removed by ON DELETE CASCADE do not fire ticket triggers,
+    -- so the order's tickets are taken out of the counters here instead
+    UPDATE event_sales_summary s
+    JOIN (
+        SELECT
+            event_id,
+            SUM(status = 'Purchased') AS purchased,
+            SUM(status = 'Reserved') AS reserved,
+            SUM(status = 'Refunded') AS refunded,
+            SUM(IF(status = 'Purchased', price, 0)) AS revenue
+        FROM ticket
+        WHERE order_id = OLD.order_id
+        GROUP BY event_id
+    ) d ON d.event_id = s.event_id
+    SET s.purchased_count = s.purchased_count - d.purchased,
+        s.reserved_count = s.reserved_count - d.reserved,
+        s.refunded_count = s.refunded_count - d.refunded,
+        s.purchased_revenue = s.purchased_revenue - d.revenue;
+END //
+
+-- **Documentation: These triggers keep `event_sales_summary` in step with `ticket`, so sales figures are read with a primary-key lookup instead of a COUNT over every ticket of the event.
+-- **Functionality: Ticket INSERT/UPDATE/DELETE add or subtract the row from its event's purchased/reserved/refunded counts and purchased revenue; the order trigger covers tickets deleted by the orders -> ticket cascade. Each change only locks the one summary row of the affected event.
+-- **Execution: Automatic. Data loaded before these triggers existed (dummy_data.sql, load_data.sql) ships its own summary rows; run `CALL RebuildEventSalesSummary(NULL);` to reconcile after any out-of-band change.
+
+
+-- ------------------------------------------------------------
+-- Capacity enforcement (event_inventory)
+-- ------------------------------------------------------------
+
+CREATE TRIGGER check_event_capacity_before_insert
+BEFORE INSERT ON event
+FOR EACH ROW
+BEGIN
+    DECLARE venue_capacity_check INT;
+
+    SELECT capacity INTO venue_capacity_check
+    FROM venue
+    WHERE venue_id = NEW.venue_id;
+
+    IF NEW.capacity > venue_capacity_check THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Error: Event capacity exceeds venue capacity.';
+    END IF;
+END //
+
+CREATE TRIGGER check_event_capacity_before_update
+BEFORE UPDATE ON event
+FOR EACH ROW
+BEGIN
+    DECLARE venue_capacity_check INT;
+
+    -- 1. The event must still fit its (possibly new) venue
+    IF NEW.capacity <> OLD.capacity OR NEW.venue_id <> OLD.venue_id THEN
+        SELECT capacity INTO venue_capacity_check
+        FROM venue
+        WHERE venue_id = NEW.venue_id;
+
+        IF NEW.capacity > venue_capacity_check THEN
+            SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'Error: Event capacity exceeds venue capacity.';
+        END IF;
+    END IF;
+
+    -- 2. Move the inventory by the capacity change; it may not drop below the seats already held
+    IF NEW.capacity <> OLD.capacity THEN
+        UPDATE event_inventory
+        SET remaining = remaining + (NEW.capacity - OLD.capacity)
+        WHERE event_id = NEW.event_id AND remaining + (NEW.capacity - OLD.capacity) >= 0;
+
+        IF ROW_COUNT() = 0 THEN
+            SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'Error: Event capacity is below the tickets already sold.';
+        END IF;
+    END IF;
+END //
+
+CREATE TRIGGER inventory_after_event_insert
+AFTER INSERT ON event
+FOR EACH ROW
+BEGIN
+    INSERT INTO event_inventory (event_id, remaining) VALUES (NEW.event_id, NEW.capacity);
+END //
+
+CREATE TRIGGER inventory_before_ticket_update
+BEFORE UPDATE ON ticket
+FOR EACH ROW
+BEGIN
+    DECLARE old_holds_seat BOOLEAN DEFAULT OLD.status IN ('Purchased', 'Reserved');
+    DECLARE new_holds_seat BOOLEAN DEFAULT NEW.status IN ('Purchased', 'Reserved');
+
+    -- 1. Give the old seat back (refund, or moved to another event)
+    IF old_holds_seat AND (NOT new_holds_seat OR NEW.event_id <> OLD.event_id) THEN
+        UPDATE event_inventory
+        SET remaining = remaining + 1
+        WHERE event_id = OLD.event_id;
+    END IF;
+
+    -- 2. Take a new seat (re-purchase after a refund, or moved to another event)
+    IF new_holds_seat AND (NOT old_holds_seat OR NEW.event_id <> OLD.event_id) THEN
+        UPDATE event_inventory
+        SET remaining = remaining - 1
+        WHERE event_id = NEW.event_id AND remaining > 0;
+
+        IF ROW_COUNT() = 0 THEN
+            SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'Error: Event is sold out.';
+        END IF;
+    END IF;
+END //
+
+CREATE TRIGGER inventory_after_ticket_delete
+AFTER DELETE ON ticket
+FOR EACH ROW
+BEGIN
+    IF OLD.status IN ('Purchased', 'Reserved') THEN
+        UPDATE event_inventory
+        SET remaining = remaining + 1
+        WHERE event_id = OLD.event_id;
+    END IF;
+END //
+
+CREATE TRIGGER inventory_before_order_delete
+BEFORE DELETE ON orders
+FOR EACH ROW
+BEGIN
+    -- Tickets removed by ON DELETE CASCADE do not fire ticket triggers
+    UPDATE event_inventory i
+    JOIN (
+        SELECT event_id, COUNT(*) AS held
+        FROM ticket
+        WHERE order_id = OLD.order_id AND status IN ('Purchased', 'Reserved')
+        GROUP BY event_id
+    ) d ON d.event_id = i.event_id
+    SET i.remaining = i.remaining + d.held;
+END //
+
+-- **Documentation: These triggers enforce event capacity. `event_inventory` holds the remaining seats of every event; Purchased and Reserved tickets hold a seat, Refunded tickets do not.
+-- **Functionality: Seats are taken with a guarded decrement (`remaining > 0`) that row-locks only the event's inventory row, so no COUNT over `ticket` is needed and concurrent sales can never oversell. Refunds, deletes and order deletes give seats back; capacity changes move the inventory and are rejected if they would drop below the seats already held. Event capacity may not exceed its venue's capacity.
+-- **Execution: Automatic. `python seeds/stress_capacity.py` hammers one event with concurrent buyers and verifies that exactly `capacity` tickets were sold.
+
+
+-- ------------------------------------------------------------
+-- Daily revenue rollup (daily_event_revenue)
+-- ------------------------------------------------------------
+
+CREATE TRIGGER revenue_after_ticket_insert
+AFTER INSERT ON ticket
+FOR EACH ROW
+BEGIN
+    DECLARE order_status VARCHAR(50);
+    DECLARE order_day DATE;
+
+    SELECT status, DATE(order_date) INTO order_status, order_day
+    FROM orders
+    WHERE order_id = NEW.order_id;
+
+    IF order_status = 'Completed' THEN
+        CALL ApplyRevenueDelta(order_day, NEW.event_id, 1, NEW.price);
+    END IF;
+END //
+
+CREATE TRIGGER revenue_after_ticket_update
+AFTER UPDATE ON ticket
+FOR EACH ROW
+BEGIN
+    DECLARE order_status VARCHAR(50);
+    DECLARE order_day DATE;
+
+    IF NEW.order_id <> OLD.order_id OR NEW.event_id <> OLD.event_id OR NEW.price <> OLD.price THEN
+        -- 1. Take the old row out of its order's day
+        SELECT status, DATE(order_date) INTO order_status, order_day
+        FROM orders
+        WHERE order_id = OLD.order_id;
+
+        IF order_status = 'Completed' THEN
+            CALL ApplyRevenueDelta(order_day, OLD.event_id, -1, -OLD.price);
+        END IF;
+
+        -- 2. Add the new row
+        SELECT status, DATE(order_date) INTO order_status, order_day
+        FROM orders
+        WHERE order_id = NEW.order_id;
+
+        IF order_status = 'Completed' THEN
+            CALL ApplyRevenueDelta(order_day, NEW.event_id, 1, NEW.price);
+        END IF;
+    END IF;
+END //
+
+CREATE TRIGGER revenue_after_ticket_delete
+AFTER DELETE ON ticket
+FOR EACH ROW
+BEGIN
+    DECLARE order_status VARCHAR(50);
+    DECLARE order_day DATE;
+
+    SELECT status, DATE(order_date) INTO order_status, order_day
+    FROM orders
+    WHERE order_id = OLD.order_id;
+
+    IF order_status = 'Completed' THEN
+        CALL ApplyRevenueDelta(order_day, OLD.event_id, -1, -OLD.price);
+    END IF;
+END //
+
+CREATE TRIGGER revenue_after_order_update
+AFTER UPDATE ON orders
+FOR EACH ROW
+BEGIN
+    DECLARE day_changed BOOLEAN DEFAULT DATE(NEW.order_date) <> DATE(OLD.order_date);
+
+    -- Completed -> Refunded/Pending, or a Completed order moved to another day
+    IF OLD.status = 'Completed' AND (NEW.status <> 'Completed' OR day_changed) THEN
+        CALL ApplyOrderRevenue(OLD.order_id, DATE(OLD.order_date), -1);
+    END IF;
+
+    -- Pending -> Completed, or the new day of a moved Completed order
+    IF NEW.status = 'Completed' AND (OLD.status <> 'Completed' OR day_changed) THEN
+        CALL ApplyOrderRevenue(NEW.order_id, DATE(NEW.order_date), 1);
+    END IF;
+END //
+
+CREATE TRIGGER revenue_before_order_delete
+BEFORE DELETE ON orders
+FOR EACH ROW
+BEGIN
+    -- Tickets removed by ON DELETE CASCADE do not fire ticket triggers
+    IF OLD.status = 'Completed' THEN
+        CALL ApplyOrderRevenue(OLD.order_id, DATE(OLD.order_date), -1);
+    END IF;
 END //
 
--- **Documentation: This trigger ensures that tickets cannot be sold for events that are either 'Completed' or 'Canceled'. 
--- **Functionality: It activates before any INSERT operation on the `ticket` table, checks the status of the associated event, and raises an error if the event is not in a valid state for ticket sales.
\ No newline at end of file
+-- **Documentation: These triggers keep `daily_event_revenue` in step with `orders` and `ticket`, so the revenue reports in db/analysis/event_queries.sql read a few thousand rollup rows instead of joining every ticket of all history. Category totals are grouped from these rows through `event_category` at query time, so they are as current as the event rows.
+-- **Functionality: Revenue counts tickets of Completed orders on DATE(order_date). Ticket INSERT/UPDATE/DELETE move one ticket via `ApplyRevenueDelta()`, after a primary-key read of the ticket's order for its status and day (tickets carry neither); order status or date changes (including Completed -> Refunded) and order deletes move all of the order's tickets via `ApplyOrderRevenue()`. A sale only ever upserts its own event's day row, so there is no per-category hot row shared by every sale of a popular category.
+-- **Execution: Automatic. Data loaded before these triggers existed ships its own rollup rows; run `CALL RefreshRevenueRollups(NULL, NULL);` to backfill or reconcile.
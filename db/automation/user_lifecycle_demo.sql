@@ -54,6 +54,9 @@ LIMIT 1;
 
 -- ------------------------------------------------------------
 -- STEP 3: Create an order for this user
+--   (Steps 3 and 4 spelled out row by row; real checkouts use
+--    CALL PurchaseTickets(@user_id, @event_id, 1, 50.00); which does
+--    both in one transaction for any number of tickets.)
 -- ------------------------------------------------------------
 INSERT INTO `orders` (
     user_id,
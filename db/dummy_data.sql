@@ -1,558 +1,558 @@
 USE eventify_db;
 
 INSERT INTO `user` (`user_id`, `first_name`, `last_name`, `email`, `role`, `status`) VALUES
-    (1, 'Jasmine', 'Lawson', 'kristengibbs@example.com', 'organizer', 'Suspended'),
-    (2, 'Heather', 'Huff', 'qhunt@example.com', 'attendee', 'Suspended'),
-    (3, 'Michael', 'Lloyd', 'bowenmatthew@example.net', 'admin', 'Active'),
-    (4, 'Jonathan', 'Andrade', 'elizabeth28@example.org', 'organizer', 'Active'),
-    (5, 'Kimberly', 'Thomas', 'petersenjennifer@example.com', 'attendee', 'Active'),
-    (6, 'Troy', 'Peters', 'liueric@example.com', 'admin', 'Active'),
-    (7, 'Adam', 'Singh', 'melissanichols@example.com', 'attendee', 'Active'),
-    (8, 'Brian', 'Barnett', 'carl07@example.org', 'organizer', 'Active'),
-    (9, 'Dominique', 'Hall', 'hernandezjeffrey@example.org', 'organizer', 'Active'),
-    (10, 'David', 'Orr', 'christine85@example.org', 'admin', 'Suspended'),
-    (11, 'Alicia', 'Fleming', 'kathleenlarson@example.net', 'admin', 'Suspended'),
-    (12, 'Rebecca', 'Raymond', 'zmills@example.com', 'attendee', 'Suspended'),
-    (13, 'Angela', 'Thomas', 'michaeladkins@example.com', 'organizer', 'Active'),
-    (14, 'Kimberly', 'Knox', 'michael24@example.net', 'attendee', 'Active'),
-    (15, 'Tyler', 'Meadows', 'burnseric@example.net', 'admin', 'Suspended'),
-    (16, 'Melanie', 'Jones', 'josephdouglas@example.org', 'admin', 'Suspended'),
-    (17, 'Michael', 'Edwards', 'jamie02@example.com', 'admin', 'Suspended'),
-    (18, 'Joshua', 'Osborne', 'marc03@example.net', 'organizer', 'Suspended'),
-    (19, 'Denise', 'Ball', 'stevenfernandez@example.com', 'attendee', 'Suspended'),
-    (20, 'Jessica', 'Torres', 'qbrown@example.com', 'organizer', 'Suspended'),
-    (21, 'Cristian', 'Foster', 'omar15@example.com', 'admin', 'Active'),
-    (22, 'Amanda', 'Adams', 'aliciapatel@example.net', 'organizer', 'Active'),
-    (23, 'Paul', 'Jimenez', 'andrea56@example.com', 'admin', 'Suspended'),
-    (24, 'Patricia', 'Vasquez', 'katherine25@example.net', 'attendee', 'Active'),
-    (25, 'Brian', 'Kelly', 'rwilliams@example.net', 'organizer', 'Suspended'),
-    (26, 'Kevin', 'Schaefer', 'jlewis@example.org', 'attendee', 'Active'),
-    (27, 'Christine', 'Krueger', 'deanamy@example.org', 'attendee', 'Suspended'),
-    (28, 'Ashley', 'Floyd', 'joe48@example.net', 'attendee', 'Active'),
-    (29, 'Madison', 'Taylor', 'michaelmarsh@example.org', 'attendee', 'Suspended'),
-    (30, 'Linda', 'Bowman', 'spencerdonna@example.com', 'organizer', 'Suspended'),
-    (31, 'Matthew', 'Jefferson', 'bobbybarnes@example.org', 'attendee', 'Active'),
-    (32, 'Jason', 'Gonzalez', 'sbarber@example.com', 'attendee', 'Active'),
-    (33, 'Heather', 'Ramirez', 'richardhuynh@example.com', 'attendee', 'Suspended'),
-    (34, 'Megan', 'Oliver', 'mgreen@example.org', 'organizer', 'Active'),
-    (35, 'Michele', 'Curtis', 'david29@example.com', 'attendee', 'Active'),
-    (36, 'Michael', 'Bell', 'owu@example.net', 'organizer', 'Suspended'),
-    (37, 'Adam', 'Young', 'tammy28@example.net', 'attendee', 'Active'),
-    (38, 'Richard', 'Holmes', 'adamjackson@example.com', 'attendee', 'Suspended'),
-    (39, 'Karla', 'Villanueva', 'lori06@example.net', 'organizer', 'Active'),
-    (40, 'Jon', 'Hernandez', 'julie36@example.org', 'attendee', 'Active'),
-    (41, 'Laura', 'Nelson', 'christinamorgan@example.net', 'admin', 'Suspended'),
-    (42, 'Jennifer', 'Smith', 'shawn12@example.net', 'attendee', 'Suspended'),
-    (43, 'Dennis', 'Odom', 'daniel76@example.org', 'organizer', 'Active'),
-    (44, 'Dave', 'Hopkins', 'sbaker@example.org', 'organizer', 'Active'),
-    (45, 'Margaret', 'Baldwin', 'qtaylor@example.com', 'admin', 'Active'),
-    (46, 'Andrea', 'Weber', 'bmedina@example.net', 'attendee', 'Suspended'),
-    (47, 'Paul', 'Williams', 'vazquezjo@example.org', 'organizer', 'Suspended'),
-    (48, 'Nicole', 'Black', 'sharon30@example.org', 'admin', 'Suspended'),
-    (49, 'Michael', 'Thompson', 'daniel99@example.com', 'attendee', 'Suspended'),
-    (50, 'Jennifer', 'Navarro', 'nicole09@example.com', 'organizer', 'Suspended'),
-    (51, 'Isaiah', 'Jefferson', 'johnsonryan@example.org', 'attendee', 'Active'),
-    (52, 'Tiffany', 'Hunt', 'dunnchristine@example.net', 'attendee', 'Active'),
-    (53, 'Robert', 'Salinas', 'jlynch@example.com', 'admin', 'Active'),
-    (54, 'Paul', 'Flowers', 'strongbryan@example.com', 'attendee', 'Suspended'),
-    (55, 'James', 'Dillon', 'olivia44@example.net', 'organizer', 'Suspended'),
-    (56, 'Damon', 'Watts', 'youngpaul@example.org', 'admin', 'Active'),
-    (57, 'Jason', 'Murillo', 'tracy66@example.com', 'admin', 'Suspended'),
-    (58, 'Sharon', 'Hartman', 'kdyer@example.org', 'admin', 'Active'),
-    (59, 'Carolyn', 'Proctor', 'beckypreston@example.net', 'admin', 'Active'),
-    (60, 'Elizabeth', 'Wilson', 'marybowman@example.org', 'organizer', 'Active'),
-    (61, 'Jesse', 'Cole', 'smithvicki@example.com', 'attendee', 'Active'),
-    (62, 'Luke', 'Shah', 'fthomas@example.com', 'attendee', 'Active'),
-    (63, 'Julie', 'Lopez', 'russellronnie@example.org', 'admin', 'Active'),
-    (64, 'Jacob', 'Proctor', 'scott65@example.com', 'organizer', 'Suspended'),
-    (65, 'Lauren', 'Hughes', 'elizabeth12@example.com', 'organizer', 'Active'),
-    (66, 'Joshua', 'Moore', 'kristinaewing@example.org', 'admin', 'Suspended'),
-    (67, 'Tiffany', 'Jones', 'johnsonrobert@example.net', 'attendee', 'Suspended'),
-    (68, 'Erica', 'Ray', 'harry67@example.com', 'admin', 'Active'),
-    (69, 'Phillip', 'Johnson', 'cjones@example.com', 'organizer', 'Active'),
-    (70, 'Jennifer', 'Fernandez', 'sdouglas@example.org', 'organizer', 'Suspended'),
-    (71, 'Richard', 'Gallagher', 'fewing@example.org', 'admin', 'Active'),
-    (72, 'David', 'Werner', 'jennifer00@example.com', 'organizer', 'Suspended'),
-    (73, 'Kimberly', 'Turner', 'mary63@example.com', 'organizer', 'Suspended'),
-    (74, 'Megan', 'Perez', 'daniel19@example.com', 'admin', 'Active'),
-    (75, 'Shawn', 'Rocha', 'chelsea67@example.com', 'attendee', 'Active'),
-    (76, 'Deborah', 'Hughes', 'philip93@example.com', 'attendee', 'Active'),
-    (77, 'David', 'Erickson', 'brendasalinas@example.net', 'attendee', 'Active'),
-    (78, 'Jamie', 'Ford', 'mariarussell@example.com', 'admin', 'Suspended'),
-    (79, 'William', 'Savage', 'obarnes@example.org', 'attendee', 'Suspended'),
-    (80, 'William', 'Cole', 'lisa39@example.com', 'attendee', 'Active'),
-    (81, 'Kelly', 'Dominguez', 'lawrence50@example.net', 'attendee', 'Active'),
-    (82, 'Cameron', 'Green', 'gregorysmith@example.com', 'attendee', 'Active'),
-    (83, 'Willie', 'James', 'greenwendy@example.org', 'organizer', 'Suspended'),
-    (84, 'Megan', 'Hayden', 'hbowers@example.org', 'admin', 'Suspended'),
-    (85, 'Eric', 'Bridges', 'ogarcia@example.com', 'attendee', 'Suspended'),
-    (86, 'Erin', 'Sanchez', 'zvasquez@example.org', 'attendee', 'Suspended'),
-    (87, 'Morgan', 'Sanders', 'dunnconnie@example.net', 'admin', 'Active'),
-    (88, 'Kelli', 'Dunn', 'mward@example.com', 'admin', 'Active'),
-    (89, 'Priscilla', 'Waters', 'kellyclements@example.org', 'attendee', 'Suspended'),
-    (90, 'Joshua', 'Kirk', 'villaelizabeth@example.com', 'admin', 'Active'),
-    (91, 'Courtney', 'Case', 'karen02@example.com', 'admin', 'Suspended'),
-    (92, 'Brian', 'Anderson', 'amandalarsen@example.org', 'attendee', 'Suspended'),
-    (93, 'Andrea', 'Cooper', 'powersjoshua@example.net', 'admin', 'Suspended'),
-    (94, 'Mary', 'Smith', 'briangonzalez@example.com', 'attendee', 'Active'),
-    (95, 'Jennifer', 'Reyes', 'salinasgeorge@example.com', 'admin', 'Active'),
-    (96, 'Christina', 'Schmidt', 'kmatthews@example.org', 'admin', 'Active'),
-    (97, 'Anthony', 'Gordon', 'john56@example.org', 'attendee', 'Suspended'),
-    (98, 'Brian', 'Sanchez', 'grantvictoria@example.net', 'organizer', 'Active'),
-    (99, 'Jennifer', 'Ford', 'karensmith@example.net', 'admin', 'Active'),
-    (100, 'Melissa', 'Stevens', 'ruthfuentes@example.com', 'attendee', 'Active'),
-    (101, 'Francisco', 'Ellis', 'melissa37@example.com', 'organizer', 'Suspended'),
-    (102, 'William', 'Abbott', 'hbartlett@example.org', 'organizer', 'Active'),
-    (103, 'Jasmine', 'Roberts', 'kwilson@example.org', 'organizer', 'Active'),
-    (104, 'Madeline', 'Johnson', 'courtney86@example.net', 'admin', 'Active'),
-    (105, 'Michael', 'Stewart', 'yangwilliam@example.org', 'attendee', 'Active'),
-    (106, 'Sarah', 'Ortega', 'ramseykayla@example.net', 'attendee', 'Suspended'),
-    (107, 'Becky', 'Taylor', 'levinematthew@example.com', 'organizer', 'Active'),
-    (108, 'Michael', 'Jackson', 'jeffreynelson@example.org', 'organizer', 'Suspended'),
-    (109, 'Rebecca', 'Williams', 'davidsanchez@example.com', 'organizer', 'Suspended'),
-    (110, 'Charles', 'Robinson', 'wileyjonathan@example.com', 'attendee', 'Active'),
-    (111, 'Logan', 'Taylor', 'nbright@example.com', 'admin', 'Suspended'),
-    (112, 'Cathy', 'Jenkins', 'peggy65@example.com', 'admin', 'Suspended'),
-    (113, 'Alejandra', 'Mitchell', 'tiffany44@example.com', 'attendee', 'Suspended'),
-    (114, 'Mark', 'Garcia', 'colesherry@example.com', 'organizer', 'Suspended'),
-    (115, 'Christian', 'Young', 'myerskatie@example.net', 'attendee', 'Suspended'),
-    (116, 'Robert', 'Mejia', 'fernando75@example.net', 'attendee', 'Suspended'),
-    (117, 'Alexandra', 'Wilkins', 'williamkline@example.net', 'admin', 'Active'),
-    (118, 'Lauren', 'Boyd', 'patrick67@example.org', 'attendee', 'Active'),
-    (119, 'Benjamin', 'Johnston', 'smolina@example.com', 'attendee', 'Suspended'),
-    (120, 'Monica', 'Ward', 'wgraves@example.net', 'organizer', 'Suspended'),
-    (121, 'Janice', 'Henderson', 'david91@example.org', 'admin', 'Suspended'),
-    (122, 'Eric', 'Castillo', 'michaelmcguire@example.org', 'attendee', 'Active'),
-    (123, 'Elizabeth', 'Webb', 'karlgarrett@example.net', 'admin', 'Active'),
-    (124, 'Barbara', 'Hudson', 'isaacstewart@example.net', 'admin', 'Suspended'),
-    (125, 'Brittany', 'Wright', 'petersonloretta@example.org', 'organizer', 'Suspended'),
-    (126, 'Travis', 'Parks', 'amanning@example.net', 'attendee', 'Suspended'),
-    (127, 'Daniel', 'Cisneros', 'williamsemma@example.com', 'admin', 'Suspended'),
-    (128, 'James', 'Woods', 'aaronsantana@example.org', 'organizer', 'Suspended'),
-    (129, 'Kathryn', 'Juarez', 'snowjames@example.com', 'admin', 'Active'),
-    (130, 'Sydney', 'Weiss', 'susanmay@example.org', 'organizer', 'Suspended'),
-    (131, 'Anthony', 'Meyer', 'patricia00@example.net', 'admin', 'Suspended'),
-    (132, 'Christopher', 'Harris', 'xsalinas@example.com', 'attendee', 'Suspended'),
-    (133, 'Michele', 'Kirby', 'wrightryan@example.com', 'admin', 'Active'),
-    (134, 'Crystal', 'Sanchez', 'whiteheadsean@example.net', 'admin', 'Active'),
-    (135, 'Kelly', 'Griffin', 'coxroberto@example.org', 'organizer', 'Suspended'),
-    (136, 'Cody', 'Santos', 'davidschwartz@example.org', 'admin', 'Suspended'),
-    (137, 'Kevin', 'Cooper', 'zachary53@example.net', 'admin', 'Suspended'),
-    (138, 'Nicholas', 'Cox', 'stephensmith@example.net', 'admin', 'Suspended'),
-    (139, 'Diane', 'Strong', 'mackenziegarcia@example.com', 'attendee', 'Active'),
-    (140, 'Stephanie', 'Vasquez', 'mjohnson@example.com', 'attendee', 'Suspended'),
-    (141, 'Matthew', 'Leon', 'ginasilva@example.org', 'attendee', 'Suspended'),
-    (142, 'Thomas', 'Thomas', 'xtaylor@example.com', 'organizer', 'Active'),
-    (143, 'Andrew', 'Garrett', 'melissa25@example.com', 'attendee', 'Active'),
-    (144, 'Travis', 'Camacho', 'annette93@example.com', 'organizer', 'Active'),
-    (145, 'Matthew', 'Watson', 'robert25@example.net', 'admin', 'Suspended'),
-    (146, 'Krystal', 'Owens', 'edwardskimberly@example.org', 'admin', 'Active'),
-    (147, 'Bruce', 'George', 'svaldez@example.org', 'organizer', 'Active'),
-    (148, 'Eric', 'Butler', 'edwardpowell@example.org', 'admin', 'Suspended'),
-    (149, 'Morgan', 'Franklin', 'christopher98@example.org', 'attendee', 'Active'),
-    (150, 'James', 'Nelson', 'jennifer72@example.net', 'organizer', 'Active'),
-    (151, 'Jeffery', 'Wagner', 'hayden53@example.net', 'attendee', 'Active'),
-    (152, 'Andrew', 'Martin', 'craig35@example.net', 'attendee', 'Suspended'),
-    (153, 'Vickie', 'Baker', 'ryan89@example.net', 'admin', 'Active'),
-    (154, 'Henry', 'Walker', 'virginiakelley@example.com', 'organizer', 'Suspended'),
-    (155, 'Samantha', 'Pope', 'cheyenne10@example.com', 'attendee', 'Active'),
-    (156, 'Patricia', 'Owens', 'rodriguezcolleen@example.org', 'organizer', 'Suspended'),
-    (157, 'Amy', 'Garrison', 'hamiltonkevin@example.net', 'admin', 'Active'),
-    (158, 'Patrick', 'Richardson', 'jessicaburton@example.net', 'attendee', 'Active'),
-    (159, 'Michelle', 'Thompson', 'wbuck@example.com', 'attendee', 'Active'),
-    (160, 'Lisa', 'Casey', 'fvega@example.org', 'admin', 'Active'),
-    (161, 'Nicholas', 'King', 'richard60@example.com', 'admin', 'Suspended'),
-    (162, 'Andrew', 'Marks', 'rebecca31@example.org', 'admin', 'Active'),
-    (163, 'Karen', 'Fritz', 'justin32@example.org', 'admin', 'Suspended'),
-    (164, 'Brittany', 'Williams', 'cheyenne49@example.org', 'organizer', 'Active'),
-    (165, 'Suzanne', 'Nguyen', 'ujames@example.org', 'admin', 'Active'),
-    (166, 'Charles', 'Andrews', 'mcconnellelizabeth@example.net', 'attendee', 'Active'),
-    (167, 'Cesar', 'Hanson', 'scottramirez@example.net', 'admin', 'Suspended'),
-    (168, 'Stacy', 'Torres', 'deanbrenda@example.net', 'attendee', 'Suspended'),
-    (169, 'Brian', 'Collins', 'thorntonjeremy@example.net', 'organizer', 'Suspended'),
-    (170, 'Hunter', 'Molina', 'sjohnston@example.com', 'attendee', 'Active'),
-    (171, 'Lisa', 'Wilson', 'ronnie74@example.net', 'organizer', 'Active'),
-    (172, 'Martin', 'Francis', 'grobinson@example.com', 'organizer', 'Suspended'),
-    (173, 'Victoria', 'Best', 'zjohnson@example.net', 'admin', 'Active'),
-    (174, 'Chad', 'Jones', 'kristenbennett@example.net', 'admin', 'Active'),
-    (175, 'Cameron', 'Cooper', 'sandra04@example.org', 'admin', 'Suspended'),
-    (176, 'Scott', 'Allen', 'fdeleon@example.net', 'attendee', 'Suspended'),
-    (177, 'Manuel', 'Armstrong', 'mark08@example.com', 'organizer', 'Suspended'),
-    (178, 'Jack', 'Maddox', 'mason51@example.net', 'admin', 'Active'),
-    (179, 'Crystal', 'West', 'tiffanygonzales@example.net', 'attendee', 'Active'),
-    (180, 'William', 'Hernandez', 'jgriffith@example.net', 'organizer', 'Active'),
-    (181, 'Alexis', 'Mitchell', 'lisa59@example.net', 'admin', 'Suspended'),
-    (182, 'Heather', 'Gibbs', 'cgarcia@example.net', 'admin', 'Active'),
-    (183, 'Yvonne', 'Sims', 'pcox@example.net', 'attendee', 'Suspended'),
-    (184, 'Ashley', 'Rangel', 'sherryscott@example.org', 'admin', 'Suspended'),
-    (185, 'Mitchell', 'Smith', 'castanedarichard@example.net', 'attendee', 'Active'),
-    (186, 'Angela', 'Butler', 'brandongardner@example.org', 'organizer', 'Active'),
-    (187, 'Joseph', 'Esparza', 'campbellkenneth@example.org', 'organizer', 'Suspended'),
-    (188, 'Kimberly', 'Webb', 'cunninghamlisa@example.net', 'attendee', 'Active'),
-    (189, 'Aaron', 'Jackson', 'stephen40@example.com', 'attendee', 'Suspended'),
-    (190, 'Jose', 'Jones', 'brian18@example.net', 'attendee', 'Suspended'),
-    (191, 'Alvin', 'Brown', 'carterlaura@example.org', 'organizer', 'Active'),
-    (192, 'Michael', 'Fox', 'tsandoval@example.org', 'organizer', 'Active'),
-    (193, 'Jodi', 'Sanchez', 'mccannkimberly@example.net', 'admin', 'Suspended'),
-    (194, 'Ricky', 'Fisher', 'jasmine63@example.net', 'admin', 'Active'),
-    (195, 'Joseph', 'Lee', 'amiller@example.net', 'organizer', 'Suspended'),
-    (196, 'Cynthia', 'Paul', 'mclaughlinsheila@example.com', 'attendee', 'Active'),
-    (197, 'Joseph', 'Rojas', 'stevensonjamie@example.org', 'attendee', 'Active'),
-    (198, 'Billy', 'Taylor', 'james97@example.net', 'attendee', 'Suspended'),
-    (199, 'Robert', 'Wagner', 'ryanmatthew@example.com', 'attendee', 'Suspended'),
-    (200, 'Patricia', 'King', 'timothy54@example.com', 'attendee', 'Suspended'),
-    (201, 'Brittany', 'Morton', 'leejames@example.net', 'organizer', 'Active'),
-    (202, 'Christopher', 'Miller', 'nelsonselena@example.org', 'attendee', 'Suspended'),
-    (203, 'Nicholas', 'Gonzalez', 'spencerkrystal@example.net', 'attendee', 'Suspended'),
-    (204, 'David', 'Moody', 'starkjeremy@example.org', 'attendee', 'Suspended'),
-    (205, 'David', 'Hutchinson', 'timothy05@example.org', 'attendee', 'Active'),
-    (206, 'Donald', 'Aguilar', 'courtneyanderson@example.org', 'attendee', 'Active'),
-    (207, 'Bryan', 'Meyers', 'dawnvargas@example.net', 'organizer', 'Suspended'),
-    (208, 'David', 'Mendez', 'michaelfox@example.org', 'organizer', 'Suspended'),
-    (209, 'Laura', 'Stephens', 'gwatson@example.org', 'admin', 'Active'),
-    (210, 'Adam', 'Barrett', 'matthew54@example.com', 'attendee', 'Suspended'),
-    (211, 'Travis', 'Baker', 'mary08@example.com', 'attendee', 'Active'),
-    (212, 'Ashley', 'Collins', 'nancy22@example.org', 'attendee', 'Active'),
-    (213, 'Jeffrey', 'Sanchez', 'wlarson@example.net', 'attendee', 'Active'),
-    (214, 'Vincent', 'Garcia', 'samanthamullins@example.com', 'attendee', 'Suspended'),
-    (215, 'Cindy', 'Hernandez', 'kschwartz@example.net', 'attendee', 'Active'),
-    (216, 'Laura', 'Perez', 'angelaramirez@example.com', 'attendee', 'Suspended'),
-    (217, 'Amy', 'Garcia', 'wukim@example.org', 'admin', 'Suspended'),
-    (218, 'Thomas', 'Gross', 'nicholaslloyd@example.net', 'organizer', 'Active'),
-    (219, 'Tammy', 'Ross', 'eryan@example.org', 'organizer', 'Suspended'),
-    (220, 'Barbara', 'Lane', 'wilsonmichael@example.org', 'attendee', 'Active'),
-    (221, 'Breanna', 'Miller', 'danagriffin@example.org', 'organizer', 'Active'),
-    (222, 'Barbara', 'Weaver', 'williamli@example.com', 'attendee', 'Suspended'),
-    (223, 'Christopher', 'Rogers', 'kristiejacobs@example.net', 'organizer', 'Suspended'),
-    (224, 'Timothy', 'Clark', 'heidiaustin@example.com', 'organizer', 'Active'),
-    (225, 'Lynn', 'Houston', 'james06@example.org', 'admin', 'Suspended'),
-    (226, 'Jennifer', 'Mitchell', 'yvonnehale@example.net', 'admin', 'Suspended'),
-    (227, 'Steven', 'Lang', 'richard84@example.net', 'admin', 'Suspended'),
-    (228, 'Michelle', 'Ross', 'michaelmitchell@example.net', 'organizer', 'Suspended'),
-    (229, 'Amber', 'Casey', 'bwolf@example.com', 'admin', 'Suspended'),
-    (230, 'Mary', 'Mcdonald', 'michael21@example.net', 'attendee', 'Active'),
-    (231, 'Nicholas', 'Perry', 'mwilkins@example.com', 'admin', 'Active'),
-    (232, 'Jessica', 'Lopez', 'joshua63@example.com', 'organizer', 'Active'),
-    (233, 'Thomas', 'Glass', 'walshanthony@example.net', 'attendee', 'Active'),
-    (234, 'Daniel', 'Hayes', 'nbennett@example.com', 'admin', 'Active'),
-    (235, 'Susan', 'Preston', 'fle@example.com', 'organizer', 'Active'),
-    (236, 'Hector', 'Huang', 'jholt@example.org', 'admin', 'Active'),
-    (237, 'Lisa', 'Mercado', 'mark72@example.com', 'admin', 'Suspended'),
-    (238, 'Mary', 'Hughes', 'fbrown@example.org', 'organizer', 'Active'),
-    (239, 'Theodore', 'Pope', 'lstrong@example.org', 'attendee', 'Active'),
-    (240, 'Christopher', 'Williams', 'edwardsdennis@example.org', 'attendee', 'Suspended'),
-    (241, 'Aaron', 'Shelton', 'ychen@example.com', 'attendee', 'Active'),
-    (242, 'Veronica', 'Wolfe', 'rebeccabond@example.com', 'attendee', 'Suspended'),
-    (243, 'Thomas', 'Wagner', 'cscott@example.com', 'organizer', 'Active'),
-    (244, 'Michael', 'Price', 'bharris@example.net', 'organizer', 'Active'),
-    (245, 'Christopher', 'Schwartz', 'christine20@example.com', 'organizer', 'Suspended'),
-    (246, 'Angela', 'Boone', 'lyonskristen@example.com', 'attendee', 'Active'),
-    (247, 'Jennifer', 'Arnold', 'thompsonstacy@example.com', 'admin', 'Active'),
-    (248, 'Jennifer', 'Clark', 'larsonbobby@example.net', 'attendee', 'Suspended'),
-    (249, 'Andrea', 'Allison', 'huberamber@example.com', 'organizer', 'Active'),
-    (250, 'Nichole', 'Vargas', 'qgeorge@example.org', 'organizer', 'Active'),
-    (251, 'Chloe', 'Hull', 'maguirre@example.org', 'admin', 'Suspended'),
-    (252, 'Gregory', 'Hunter', 'joshua88@example.org', 'attendee', 'Suspended'),
-    (253, 'Amanda', 'Webster', 'brianjones@example.org', 'organizer', 'Suspended'),
-    (254, 'Philip', 'Brown', 'fmccall@example.net', 'admin', 'Active'),
-    (255, 'Eric', 'Charles', 'prestonjessica@example.net', 'organizer', 'Suspended'),
-    (256, 'Gabriel', 'Ray', 'armstrongjeremy@example.com', 'organizer', 'Suspended'),
-    (257, 'Destiny', 'Thomas', 'uvaldez@example.net', 'attendee', 'Active'),
-    (258, 'Nathaniel', 'Martinez', 'william09@example.net', 'admin', 'Active'),
-    (259, 'Hannah', 'Miller', 'wheelerkristine@example.org', 'admin', 'Active'),
-    (260, 'Michael', 'Perez', 'bennettkelly@example.net', 'attendee', 'Active'),
-    (261, 'Ronald', 'Cuevas', 'yburton@example.com', 'admin', 'Active'),
-    (262, 'Eric', 'Saunders', 'dalesmith@example.com', 'attendee', 'Suspended'),
-    (263, 'Steven', 'Walker', 'normaparker@example.com', 'admin', 'Active'),
-    (264, 'Andrew', 'Spencer', 'bsmith@example.com', 'attendee', 'Suspended'),
-    (265, 'Rebecca', 'Lynn', 'xjarvis@example.org', 'organizer', 'Active'),
-    (266, 'Sergio', 'Daniels', 'mullinstammy@example.com', 'admin', 'Active'),
-    (267, 'Ryan', 'Robinson', 'bakercarmen@example.org', 'organizer', 'Suspended'),
-    (268, 'Sara', 'Brooks', 'juarezpamela@example.org', 'admin', 'Suspended'),
-    (269, 'Jamie', 'Rowland', 'ashley25@example.org', 'organizer', 'Suspended'),
-    (270, 'Anthony', 'Lee', 'jonathan87@example.com', 'organizer', 'Suspended'),
-    (271, 'Savannah', 'Brown', 'mary19@example.net', 'admin', 'Suspended'),
-    (272, 'Steven', 'Benson', 'msanchez@example.net', 'attendee', 'Suspended'),
-    (273, 'Jonathan', 'Reilly', 'bautistajames@example.org', 'attendee', 'Active'),
-    (274, 'Erin', 'Evans', 'vford@example.net', 'attendee', 'Active'),
-    (275, 'Edward', 'Potter', 'schristian@example.net', 'organizer', 'Active'),
-    (276, 'James', 'Lewis', 'qbrock@example.org', 'attendee', 'Active'),
-    (277, 'Darryl', 'Salinas', 'sarahjenkins@example.org', 'attendee', 'Active'),
-    (278, 'Joseph', 'Adams', 'brian73@example.net', 'attendee', 'Suspended'),
-    (279, 'Richard', 'Hardy', 'scottnguyen@example.com', 'organizer', 'Suspended'),
-    (280, 'Shawn', 'Rodriguez', 'alexandra65@example.net', 'admin', 'Suspended'),
-    (281, 'Philip', 'Campos', 'skinnerlindsay@example.com', 'organizer', 'Active'),
-    (282, 'Diana', 'Acosta', 'barnesbrittany@example.org', 'organizer', 'Suspended'),
-    (283, 'Benjamin', 'Rodriguez', 'martinjames@example.com', 'organizer', 'Suspended'),
-    (284, 'Christopher', 'Johnson', 'samantha66@example.net', 'admin', 'Active'),
-    (285, 'Bonnie', 'Woodward', 'melissa73@example.org', 'admin', 'Active'),
-    (286, 'Rhonda', 'Santiago', 'hamiltonanthony@example.org', 'admin', 'Active'),
-    (287, 'Bradley', 'Walker', 'stephanie58@example.com', 'attendee', 'Suspended'),
-    (288, 'Emily', 'Stevens', 'dianahale@example.com', 'attendee', 'Suspended'),
-    (289, 'Natalie', 'Brown', 'franciscomckinney@example.com', 'admin', 'Suspended'),
-    (290, 'Robert', 'Larson', 'michelle59@example.org', 'admin', 'Active'),
-    (291, 'Adrian', 'Estes', 'chad08@example.org', 'attendee', 'Active'),
-    (292, 'Jessica', 'Bailey', 'tcooper@example.org', 'admin', 'Active'),
-    (293, 'Thomas', 'Howard', 'crawfordgarrett@example.net', 'admin', 'Suspended'),
-    (294, 'Tyler', 'Berry', 'rmiller@example.net', 'admin', 'Active'),
-    (295, 'Richard', 'Pham', 'potterhunter@example.com', 'admin', 'Suspended'),
-    (296, 'Mark', 'Wilson', 'joshuawalker@example.org', 'attendee', 'Active'),
-    (297, 'Robert', 'Cobb', 'pweber@example.net', 'organizer', 'Suspended'),
-    (298, 'Brian', 'Norman', 'laura63@example.org', 'admin', 'Active'),
-    (299, 'Jeffery', 'Brown', 'slittle@example.net', 'attendee', 'Suspended'),
-    (300, 'Robert', 'Jones', 'darlene80@example.net', 'admin', 'Suspended'),
-    (301, 'Christopher', 'Brown', 'xnelson@example.net', 'attendee', 'Active'),
-    (302, 'James', 'Williams', 'opowell@example.com', 'attendee', 'Active'),
-    (303, 'Kayla', 'Preston', 'clarkgloria@example.org', 'organizer', 'Suspended'),
-    (304, 'David', 'Brown', 'alexanderhouse@example.net', 'organizer', 'Suspended'),
-    (305, 'Michael', 'Nelson', 'lindsey64@example.org', 'admin', 'Active'),
-    (306, 'William', 'Mack', 'dominguezbrent@example.org', 'admin', 'Active'),
-    (307, 'Jeffrey', 'Holland', 'jgonzalez@example.net', 'attendee', 'Suspended'),
-    (308, 'Michael', 'Chang', 'tim08@example.org', 'organizer', 'Active'),
-    (309, 'Sarah', 'Wood', 'parkerjerry@example.org', 'admin', 'Active'),
-    (310, 'Bryan', 'Hinton', 'jschneider@example.com', 'attendee', 'Suspended'),
-    (311, 'Jeffrey', 'Nelson', 'catherinemitchell@example.org', 'admin', 'Suspended'),
-    (312, 'Laurie', 'Mccann', 'bensonnathan@example.org', 'organizer', 'Suspended'),
-    (313, 'Ryan', 'Hansen', 'fordthomas@example.org', 'attendee', 'Suspended'),
-    (314, 'Kevin', 'Davis', 'joseph75@example.com', 'attendee', 'Active'),
-    (315, 'Christina', 'Marshall', 'travissteele@example.org', 'organizer', 'Active'),
-    (316, 'Carmen', 'Rodriguez', 'sbest@example.net', 'organizer', 'Suspended'),
-    (317, 'Christina', 'Acosta', 'fjohnston@example.net', 'organizer', 'Suspended'),
-    (318, 'Brenda', 'Guerra', 'hawkinsjohn@example.org', 'organizer', 'Active'),
-    (319, 'Nicholas', 'Brooks', 'josephchandler@example.com', 'organizer', 'Active'),
-    (320, 'Sarah', 'Daniels', 'ericanderson@example.net', 'organizer', 'Active'),
-    (321, 'April', 'Butler', 'sally15@example.com', 'admin', 'Suspended'),
-    (322, 'Jacob', 'Taylor', 'wmorales@example.org', 'admin', 'Active'),
-    (323, 'Kayla', 'Wheeler', 'georgemiller@example.org', 'admin', 'Active'),
-    (324, 'Andrew', 'White', 'matthewmcdowell@example.net', 'organizer', 'Active'),
-    (325, 'Lisa', 'Taylor', 'david42@example.net', 'admin', 'Suspended'),
-    (326, 'Joshua', 'Thomas', 'qpruitt@example.org', 'admin', 'Active'),
-    (327, 'Amanda', 'Smith', 'mcdonaldjessica@example.org', 'attendee', 'Active'),
-    (328, 'Stephanie', 'Velasquez', 'matthew61@example.org', 'admin', 'Suspended'),
-    (329, 'Nancy', 'Watson', 'christinehurst@example.org', 'admin', 'Active'),
-    (330, 'David', 'Barron', 'guerreroalison@example.com', 'organizer', 'Active'),
-    (331, 'Sara', 'Morris', 'wbaker@example.org', 'attendee', 'Active'),
-    (332, 'Anthony', 'Smith', 'lynn25@example.com', 'admin', 'Suspended'),
-    (333, 'Brandon', 'Hall', 'jonesdaniel@example.org', 'admin', 'Suspended'),
-    (334, 'Shane', 'Davis', 'michellelopez@example.net', 'admin', 'Suspended'),
-    (335, 'James', 'Owen', 'chad98@example.org', 'attendee', 'Suspended'),
-    (336, 'Zachary', 'Vazquez', 'jeffrey55@example.net', 'admin', 'Suspended'),
-    (337, 'Stacy', 'Meyers', 'ryancollins@example.net', 'attendee', 'Suspended'),
-    (338, 'Logan', 'Werner', 'brownerik@example.net', 'admin', 'Active'),
-    (339, 'Sandra', 'Moore', 'martinezscott@example.org', 'organizer', 'Suspended'),
-    (340, 'Cynthia', 'Horn', 'angelajames@example.org', 'organizer', 'Suspended'),
-    (341, 'Katherine', 'Pruitt', 'daniellemcfarland@example.org', 'organizer', 'Suspended'),
-    (342, 'Robert', 'Owens', 'thuff@example.net', 'admin', 'Active'),
-    (343, 'Patricia', 'Sanchez', 'david87@example.com', 'attendee', 'Active'),
-    (344, 'Ethan', 'Johnson', 'peterhall@example.net', 'attendee', 'Suspended'),
-    (345, 'Hailey', 'Stout', 'jennifer75@example.com', 'admin', 'Suspended'),
-    (346, 'Marcus', 'Baxter', 'diane45@example.org', 'admin', 'Suspended'),
-    (347, 'Laurie', 'Torres', 'santosjessica@example.net', 'attendee', 'Active'),
-    (348, 'Amanda', 'Thomas', 'tamara46@example.org', 'organizer', 'Active'),
-    (349, 'Heather', 'Smith', 'carlos74@example.net', 'attendee', 'Active'),
-    (350, 'Marilyn', 'Brooks', 'jonesjeremy@example.com', 'organizer', 'Active'),
-    (351, 'Michelle', 'Lopez', 'ijohnson@example.com', 'organizer', 'Suspended'),
-    (352, 'Lynn', 'Crawford', 'murrayanna@example.com', 'attendee', 'Suspended'),
-    (353, 'Stacey', 'Hanson', 'breanna47@example.org', 'organizer', 'Suspended'),
-    (354, 'Michael', 'Sweeney', 'debra89@example.org', 'organizer', 'Active'),
-    (355, 'Katherine', 'Butler', 'yluna@example.com', 'attendee', 'Suspended'),
-    (356, 'Scott', 'Gutierrez', 'stevensondanny@example.com', 'admin', 'Active'),
-    (357, 'Amy', 'Pena', 'josephsanford@example.net', 'organizer', 'Suspended'),
-    (358, 'David', 'Nash', 'bgriffin@example.net', 'organizer', 'Active'),
-    (359, 'Jamie', 'Wright', 'marshallsandra@example.net', 'organizer', 'Active'),
-    (360, 'Alicia', 'Moore', 'christopher67@example.com', 'attendee', 'Active'),
-    (361, 'Stephen', 'Foster', 'ashleypittman@example.org', 'organizer', 'Active'),
-    (362, 'Donna', 'Merritt', 'kdavies@example.org', 'admin', 'Suspended'),
-    (363, 'Elaine', 'Morgan', 'warnerlacey@example.com', 'organizer', 'Suspended'),
-    (364, 'William', 'Ruiz', 'arellanojose@example.org', 'admin', 'Suspended'),
-    (365, 'Taylor', 'Burgess', 'michael22@example.net', 'attendee', 'Suspended'),
-    (366, 'Norma', 'Harris', 'vsanders@example.org', 'organizer', 'Suspended'),
-    (367, 'Rebecca', 'Hall', 'kristi15@example.com', 'admin', 'Suspended'),
-    (368, 'Paige', 'Gomez', 'christopher42@example.com', 'organizer', 'Active'),
-    (369, 'Amanda', 'Graham', 'becksarah@example.net', 'admin', 'Suspended'),
-    (370, 'Daniel', 'Mathews', 'ojackson@example.org', 'attendee', 'Active'),
-    (371, 'Brianna', 'Williamson', 'markhobbs@example.com', 'attendee', 'Suspended'),
-    (372, 'Tyler', 'Key', 'garyblake@example.net', 'attendee', 'Suspended'),
-    (373, 'Savannah', 'Thompson', 'melanie50@example.com', 'attendee', 'Active'),
-    (374, 'Gregory', 'Decker', 'wross@example.com', 'organizer', 'Active'),
-    (375, 'Emily', 'Garza', 'kevinreynolds@example.org', 'organizer', 'Suspended'),
-    (376, 'Jill', 'Ramsey', 'johnharding@example.com', 'organizer', 'Active'),
-    (377, 'Anna', 'Johnson', 'jonathanowen@example.net', 'admin', 'Suspended'),
-    (378, 'John', 'Nguyen', 'avilasandra@example.com', 'attendee', 'Active'),
-    (379, 'Angela', 'Bauer', 'gwendolynharris@example.org', 'organizer', 'Suspended'),
-    (380, 'Michael', 'Solis', 'hickmanalexandra@example.com', 'attendee', 'Active'),
-    (381, 'William', 'Cox', 'monica32@example.org', 'admin', 'Active'),
-    (382, 'Martin', 'Torres', 'lawrence87@example.net', 'admin', 'Suspended'),
-    (383, 'Kimberly', 'Morgan', 'lee72@example.com', 'attendee', 'Suspended'),
-    (384, 'Austin', 'Miller', 'oburton@example.com', 'admin', 'Suspended'),
-    (385, 'Laura', 'Cox', 'nsmith@example.org', 'organizer', 'Suspended'),
-    (386, 'Michelle', 'Montgomery', 'lewisjessica@example.org', 'attendee', 'Suspended'),
-    (387, 'Audrey', 'Smith', 'scottvaughan@example.net', 'attendee', 'Suspended'),
-    (388, 'Lisa', 'Long', 'steve39@example.net', 'organizer', 'Active'),
-    (389, 'Dale', 'Ashley', 'unovak@example.org', 'admin', 'Active'),
-    (390, 'Shannon', 'Blankenship', 'ecollins@example.net', 'admin', 'Active'),
-    (391, 'Peter', 'Gonzalez', 'fwallace@example.com', 'organizer', 'Suspended'),
-    (392, 'Jeffrey', 'Jones', 'jameslynch@example.net', 'attendee', 'Suspended'),
-    (393, 'Heather', 'Johnson', 'fergusontravis@example.org', 'organizer', 'Active'),
-    (394, 'Travis', 'Robinson', 'asmith@example.org', 'attendee', 'Active'),
-    (395, 'Laura', 'Preston', 'alewis@example.com', 'organizer', 'Suspended'),
-    (396, 'Shane', 'Griffin', 'nnichols@example.com', 'admin', 'Active'),
-    (397, 'Travis', 'Washington', 'johnsonjane@example.com', 'attendee', 'Active'),
-    (398, 'Brian', 'Holmes', 'wbradley@example.org', 'organizer', 'Suspended'),
-    (399, 'William', 'Day', 'james05@example.com', 'admin', 'Suspended'),
-    (400, 'Emily', 'Maxwell', 'cory77@example.org', 'organizer', 'Active'),
-    (401, 'Brian', 'Hines', 'stevenjohnson@example.org', 'attendee', 'Suspended'),
-    (402, 'Jack', 'Davis', 'kevinvaldez@example.org', 'organizer', 'Suspended'),
-    (403, 'Tammy', 'Morales', 'harrisjaime@example.com', 'admin', 'Suspended'),
-    (404, 'Mariah', 'Duran', 'cesaralvarez@example.org', 'organizer', 'Active'),
-    (405, 'Amber', 'Foster', 'zgriffin@example.org', 'attendee', 'Active'),
-    (406, 'Michelle', 'Green', 'wwaters@example.net', 'admin', 'Suspended'),
-    (407, 'Andrew', 'Lopez', 'eric98@example.com', 'attendee', 'Active'),
-    (408, 'Jeffrey', 'Beltran', 'luis87@example.com', 'organizer', 'Active'),
-    (409, 'Cindy', 'Wolfe', 'jacobbrown@example.org', 'organizer', 'Suspended'),
-    (410, 'Victoria', 'Freeman', 'castillocarol@example.org', 'attendee', 'Active'),
-    (411, 'Virginia', 'Harmon', 'jakeconway@example.com', 'organizer', 'Suspended'),
-    (412, 'Richard', 'Meyer', 'paige09@example.com', 'admin', 'Active'),
-    (413, 'Patrick', 'Fitzpatrick', 'prestonholly@example.org', 'attendee', 'Active'),
-    (414, 'Russell', 'Ford', 'shahcassandra@example.com', 'attendee', 'Suspended'),
-    (415, 'Brian', 'Hicks', 'duane58@example.org', 'organizer', 'Active'),
-    (416, 'Kathryn', 'Miller', 'johnsonjessica@example.net', 'admin', 'Suspended'),
-    (417, 'Bethany', 'Taylor', 'melissa52@example.com', 'organizer', 'Suspended'),
-    (418, 'Michael', 'Boyer', 'amberpowell@example.org', 'attendee', 'Active'),
-    (419, 'Jennifer', 'Donaldson', 'blake12@example.com', 'organizer', 'Suspended'),
-    (420, 'Valerie', 'Grant', 'dkaufman@example.com', 'organizer', 'Suspended'),
-    (421, 'Jonathan', 'Pope', 'laura34@example.org', 'attendee', 'Active'),
-    (422, 'Christopher', 'Page', 'jonesamber@example.net', 'attendee', 'Active'),
-    (423, 'Jason', 'Todd', 'ballardcaitlyn@example.net', 'attendee', 'Suspended'),
-    (424, 'Maria', 'Greene', 'cheryl66@example.org', 'admin', 'Suspended'),
-    (425, 'Sylvia', 'Kirby', 'nthomas@example.org', 'admin', 'Active'),
-    (426, 'Tina', 'Buck', 'williamsgreg@example.net', 'organizer', 'Suspended'),
-    (427, 'Richard', 'Hall', 'ncrawford@example.com', 'attendee', 'Active'),
-    (428, 'Charles', 'Rodriguez', 'chandlercharles@example.net', 'admin', 'Suspended'),
-    (429, 'Eduardo', 'White', 'fshepherd@example.net', 'organizer', 'Suspended'),
-    (430, 'Spencer', 'Duncan', 'bryanrichards@example.org', 'organizer', 'Active'),
-    (431, 'Dawn', 'Jones', 'eugene58@example.org', 'attendee', 'Active'),
-    (432, 'Matthew', 'Stewart', 'tyroneflores@example.org', 'admin', 'Suspended'),
-    (433, 'Maria', 'Graham', 'vstevens@example.net', 'attendee', 'Active'),
-    (434, 'Christopher', 'Watson', 'derrick00@example.com', 'organizer', 'Suspended'),
-    (435, 'Sarah', 'Marshall', 'stephaniematthews@example.com', 'admin', 'Suspended'),
-    (436, 'Ronald', 'Reed', 'karina47@example.org', 'attendee', 'Suspended'),
-    (437, 'Laura', 'Park', 'melaniemitchell@example.com', 'organizer', 'Suspended'),
-    (438, 'William', 'Lopez', 'shawn96@example.net', 'organizer', 'Active'),
-    (439, 'Krista', 'Bauer', 'kaitlin21@example.org', 'admin', 'Suspended'),
-    (440, 'Dawn', 'Brown', 'tinariggs@example.org', 'attendee', 'Suspended'),
-    (441, 'Vanessa', 'Espinoza', 'collinschristopher@example.net', 'admin', 'Suspended'),
-    (442, 'Alison', 'Flores', 'danielleramirez@example.com', 'admin', 'Suspended'),
-    (443, 'Charles', 'Villanueva', 'pdavis@example.net', 'attendee', 'Active'),
-    (444, 'Ryan', 'Davis', 'ayersandrew@example.com', 'organizer', 'Suspended'),
-    (445, 'Wayne', 'Sullivan', 'elizabethgarcia@example.com', 'attendee', 'Suspended'),
-    (446, 'David', 'Ellison', 'kking@example.com', 'organizer', 'Suspended'),
-    (447, 'Jasmin', 'Mcdonald', 'pjackson@example.net', 'organizer', 'Active'),
-    (448, 'Mary', 'White', 'sanderslauren@example.net', 'attendee', 'Suspended'),
-    (449, 'James', 'Sanchez', 'otanner@example.com', 'attendee', 'Active'),
-    (450, 'Robert', 'Anderson', 'rebeccacontreras@example.com', 'admin', 'Suspended'),
-    (451, 'Ashley', 'Sexton', 'ybrown@example.com', 'admin', 'Suspended'),
-    (452, 'Geoffrey', 'Vargas', 'rpeterson@example.net', 'admin', 'Suspended'),
-    (453, 'Colton', 'Ward', 'sfrazier@example.com', 'organizer', 'Active'),
-    (454, 'Erik', 'Walls', 'kathleenerickson@example.org', 'organizer', 'Suspended'),
-    (455, 'Anne', 'Gentry', 'jeffreyramos@example.org', 'attendee', 'Active'),
-    (456, 'Debra', 'Robbins', 'williamsbrittany@example.net', 'organizer', 'Suspended'),
-    (457, 'Thomas', 'Clark', 'lacey14@example.com', 'attendee', 'Suspended'),
-    (458, 'Harold', 'Rice', 'brittanyrandall@example.net', 'attendee', 'Active'),
-    (459, 'Ryan', 'Bradford', 'nancyvaughn@example.org', 'admin', 'Active'),
-    (460, 'Stephanie', 'Moran', 'joyce17@example.org', 'organizer', 'Suspended'),
-    (461, 'Joseph', 'Hernandez', 'tammyburke@example.org', 'organizer', 'Active'),
-    (462, 'Kelly', 'Anderson', 'david02@example.net', 'admin', 'Suspended'),
-    (463, 'Andrea', 'Shaffer', 'brucebennett@example.com', 'admin', 'Active'),
-    (464, 'Kimberly', 'Smith', 'lynchdaniel@example.com', 'attendee', 'Active'),
-    (465, 'Eric', 'Raymond', 'mcgeestephanie@example.org', 'attendee', 'Suspended'),
-    (466, 'Dave', 'Garcia', 'wisepaul@example.org', 'attendee', 'Active'),
-    (467, 'Stephanie', 'Turner', 'yking@example.org', 'attendee', 'Suspended'),
-    (468, 'Joanna', 'Daniel', 'allenmitchell@example.com', 'attendee', 'Suspended'),
-    (469, 'Sandra', 'Patel', 'jessica56@example.org', 'admin', 'Active'),
-    (470, 'Amy', 'Franklin', 'schroederhannah@example.com', 'admin', 'Suspended'),
-    (471, 'John', 'Shaw', 'cody04@example.com', 'attendee', 'Active'),
-    (472, 'William', 'Riggs', 'leebarbara@example.net', 'organizer', 'Suspended'),
-    (473, 'Carlos', 'Johnson', 'evan15@example.org', 'attendee', 'Active'),
-    (474, 'Kristina', 'Johnson', 'sawyerjessica@example.net', 'attendee', 'Suspended'),
-    (475, 'Tiffany', 'Humphrey', 'alvarezstephanie@example.org', 'admin', 'Suspended'),
-    (476, 'Donna', 'Thompson', 'jeffreyfernandez@example.com', 'organizer', 'Suspended'),
-    (477, 'Tyler', 'Lee', 'kathrynsmith@example.org', 'admin', 'Active'),
-    (478, 'Shannon', 'Reyes', 'ashleymacdonald@example.com', 'organizer', 'Suspended'),
-    (479, 'Shelly', 'Ruiz', 'anne27@example.net', 'attendee', 'Suspended'),
-    (480, 'Michael', 'Nash', 'kelsey85@example.net', 'admin', 'Active'),
-    (481, 'Andrew', 'Garcia', 'jennifer00@example.net', 'attendee', 'Active'),
-    (482, 'Joseph', 'Newman', 'gthomas@example.org', 'admin', 'Active'),
-    (483, 'Neil', 'Black', 'sandy29@example.com', 'admin', 'Suspended'),
-    (484, 'Jennifer', 'Thompson', 'lindsey75@example.com', 'admin', 'Suspended'),
-    (485, 'Larry', 'Thomas', 'kristinelane@example.net', 'attendee', 'Active'),
-    (486, 'Erin', 'Forbes', 'tdiaz@example.com', 'organizer', 'Active'),
-    (487, 'Carrie', 'Smith', 'ggonzalez@example.org', 'admin', 'Suspended'),
-    (488, 'Andrew', 'Adkins', 'ihunt@example.com', 'admin', 'Active'),
-    (489, 'Jeremy', 'Brown', 'xbarr@example.org', 'attendee', 'Suspended'),
-    (490, 'Benjamin', 'Hoffman', 'lisagriffin@example.org', 'organizer', 'Suspended'),
-    (491, 'Kendra', 'Zavala', 'steven36@example.com', 'attendee', 'Active'),
-    (492, 'Stanley', 'Lyons', 'tabitha58@example.com', 'organizer', 'Active'),
-    (493, 'Robert', 'Sawyer', 'gail12@example.org', 'attendee', 'Suspended'),
-    (494, 'Cynthia', 'Garrett', 'curtis78@example.org', 'attendee', 'Suspended'),
-    (495, 'Stephanie', 'Giles', 'sarah26@example.net', 'organizer', 'Suspended'),
-    (496, 'Alyssa', 'Stewart', 'carlos18@example.org', 'attendee', 'Active'),
-    (497, 'Christopher', 'Rhodes', 'mirandawalter@example.net', 'organizer', 'Active'),
-    (498, 'Maxwell', 'Drake', 'douglasbryant@example.org', 'organizer', 'Suspended'),
-    (499, 'Cody', 'Watson', 'alexander27@example.org', 'attendee', 'Suspended'),
-    (500, 'Michael', 'King', 'rebecca41@example.org', 'organizer', 'Active');
+    (1, 'Lauren', 'Johnson', 'lauren.johnson1@example.com', 'Admin', 'Suspended'),
+    (2, 'Erika', 'Lee', 'erika.lee2@example.net', 'Admin', 'Suspended'),
+    (3, 'Erin', 'Hill', 'erin.hill3@example.net', 'Attendee', 'Active'),
+    (4, 'Jennifer', 'Walker', 'jennifer.walker4@example.org', 'Organizer', 'Active'),
+    (5, 'Rebecca', 'Contreras', 'rebecca.contreras5@example.com', 'Admin', 'Active'),
+    (6, 'Michelle', 'Keller', 'michelle.keller6@example.org', 'Attendee', 'Active'),
+    (7, 'Angela', 'Graves', 'angela.graves7@example.net', 'Attendee', 'Active'),
+    (8, 'Jenny', 'Greer', 'jenny.greer8@example.org', 'Organizer', 'Active'),
+    (9, 'Mary', 'Mack', 'mary.mack9@example.net', 'Attendee', 'Suspended'),
+    (10, 'Jessica', 'Conley', 'jessica.conley10@example.org', 'Admin', 'Active'),
+    (11, 'Victor', 'Payne', 'victor.payne11@example.com', 'Organizer', 'Suspended'),
+    (12, 'Dawn', 'Porter', 'dawn.porter12@example.org', 'Admin', 'Active'),
+    (13, 'Michael', 'Greene', 'michael.greene13@example.org', 'Organizer', 'Suspended'),
+    (14, 'Randall', 'Rodriguez', 'randall.rodriguez14@example.org', 'Attendee', 'Suspended'),
+    (15, 'Hannah', 'Johnson', 'hannah.johnson15@example.com', 'Attendee', 'Active'),
+    (16, 'Ronald', 'Webb', 'ronald.webb16@example.net', 'Attendee', 'Active'),
+    (17, 'Alison', 'Rogers', 'alison.rogers17@example.com', 'Organizer', 'Active'),
+    (18, 'Alicia', 'Hughes', 'alicia.hughes18@example.org', 'Organizer', 'Suspended'),
+    (19, 'Erica', 'Larson', 'erica.larson19@example.org', 'Organizer', 'Suspended'),
+    (20, 'Justin', 'Kelly', 'justin.kelly20@example.net', 'Organizer', 'Active'),
+    (21, 'Mallory', 'Roy', 'mallory.roy21@example.net', 'Attendee', 'Active'),
+    (22, 'Martin', 'Garrett', 'martin.garrett22@example.net', 'Organizer', 'Active'),
+    (23, 'Katherine', 'Meyer', 'katherine.meyer23@example.net', 'Attendee', 'Suspended'),
+    (24, 'Claire', 'Garrison', 'claire.garrison24@example.net', 'Organizer', 'Suspended'),
+    (25, 'Carlos', 'Joyce', 'carlos.joyce25@example.org', 'Attendee', 'Suspended'),
+    (26, 'Michelle', 'Mitchell', 'michelle.mitchell26@example.net', 'Attendee', 'Suspended'),
+    (27, 'Steven', 'Morgan', 'steven.morgan27@example.com', 'Attendee', 'Suspended'),
+    (28, 'John', 'Robertson', 'john.robertson28@example.com', 'Admin', 'Active'),
+    (29, 'Madison', 'Yoder', 'madison.yoder29@example.com', 'Admin', 'Active'),
+    (30, 'Linda', 'Santiago', 'linda.santiago30@example.net', 'Organizer', 'Suspended'),
+    (31, 'Michael', 'Liu', 'michael.liu31@example.com', 'Organizer', 'Active'),
+    (32, 'Dawn', 'Ashley', 'dawn.ashley32@example.com', 'Organizer', 'Suspended'),
+    (33, 'Matthew', 'Gould', 'matthew.gould33@example.com', 'Admin', 'Active'),
+    (34, 'Michelle', 'Walker', 'michelle.walker34@example.org', 'Admin', 'Suspended'),
+    (35, 'Christian', 'Wilson', 'christian.wilson35@example.org', 'Attendee', 'Active'),
+    (36, 'Brian', 'Hurley', 'brian.hurley36@example.com', 'Admin', 'Active'),
+    (37, 'Donna', 'Hamilton', 'donna.hamilton37@example.com', 'Admin', 'Active'),
+    (38, 'Barbara', 'Taylor', 'barbara.taylor38@example.com', 'Admin', 'Suspended'),
+    (39, 'Wayne', 'Watkins', 'wayne.watkins39@example.com', 'Organizer', 'Suspended'),
+    (40, 'Andrew', 'Norris', 'andrew.norris40@example.net', 'Attendee', 'Suspended'),
+    (41, 'Steven', 'Terrell', 'steven.terrell41@example.org', 'Organizer', 'Suspended'),
+    (42, 'Joshua', 'Ruiz', 'joshua.ruiz42@example.com', 'Admin', 'Suspended'),
+    (43, 'Erin', 'Fields', 'erin.fields43@example.org', 'Attendee', 'Suspended'),
+    (44, 'Crystal', 'Bauer', 'crystal.bauer44@example.net', 'Attendee', 'Active'),
+    (45, 'Matthew', 'Holmes', 'matthew.holmes45@example.org', 'Attendee', 'Suspended'),
+    (46, 'Christina', 'Jones', 'christina.jones46@example.com', 'Admin', 'Suspended'),
+    (47, 'Danielle', 'Jones', 'danielle.jones47@example.org', 'Admin', 'Active'),
+    (48, 'Allison', 'Burton', 'allison.burton48@example.com', 'Admin', 'Active'),
+    (49, 'Brian', 'Myers', 'brian.myers49@example.org', 'Admin', 'Active'),
+    (50, 'Tabitha', 'Brown', 'tabitha.brown50@example.com', 'Admin', 'Active'),
+    (51, 'Robert', 'Roberts', 'robert.roberts51@example.com', 'Attendee', 'Suspended'),
+    (52, 'Vanessa', 'Hardin', 'vanessa.hardin52@example.org', 'Organizer', 'Suspended'),
+    (53, 'Joseph', 'Jennings', 'joseph.jennings53@example.com', 'Attendee', 'Active'),
+    (54, 'Richard', 'Diaz', 'richard.diaz54@example.org', 'Admin', 'Active'),
+    (55, 'Carl', 'Hernandez', 'carl.hernandez55@example.org', 'Organizer', 'Suspended'),
+    (56, 'Claudia', 'Lawson', 'claudia.lawson56@example.net', 'Organizer', 'Suspended'),
+    (57, 'Tracey', 'Carroll', 'tracey.carroll57@example.org', 'Attendee', 'Active'),
+    (58, 'Joseph', 'Schroeder', 'joseph.schroeder58@example.org', 'Organizer', 'Suspended'),
+    (59, 'Jean', 'Clark', 'jean.clark59@example.net', 'Admin', 'Active'),
+    (60, 'Amy', 'Hampton', 'amy.hampton60@example.net', 'Admin', 'Active'),
+    (61, 'Angel', 'Perez', 'angel.perez61@example.net', 'Attendee', 'Suspended'),
+    (62, 'Danielle', 'Rivers', 'danielle.rivers62@example.net', 'Attendee', 'Active'),
+    (63, 'Andrew', 'Moreno', 'andrew.moreno63@example.org', 'Organizer', 'Suspended'),
+    (64, 'Anthony', 'Jordan', 'anthony.jordan64@example.org', 'Organizer', 'Active'),
+    (65, 'Sylvia', 'Ramos', 'sylvia.ramos65@example.net', 'Organizer', 'Active'),
+    (66, 'Katrina', 'Thompson', 'katrina.thompson66@example.net', 'Admin', 'Suspended'),
+    (67, 'James', 'Short', 'james.short67@example.com', 'Admin', 'Active'),
+    (68, 'Jose', 'Boyd', 'jose.boyd68@example.org', 'Admin', 'Suspended'),
+    (69, 'Maria', 'Johnson', 'maria.johnson69@example.net', 'Organizer', 'Active'),
+    (70, 'Anthony', 'Whitaker', 'anthony.whitaker70@example.net', 'Admin', 'Suspended'),
+    (71, 'Stephen', 'Wagner', 'stephen.wagner71@example.net', 'Attendee', 'Suspended'),
+    (72, 'Johnny', 'Goodwin', 'johnny.goodwin72@example.org', 'Admin', 'Active'),
+    (73, 'Barbara', 'Alvarado', 'barbara.alvarado73@example.com', 'Admin', 'Suspended'),
+    (74, 'Sergio', 'Arnold', 'sergio.arnold74@example.com', 'Organizer', 'Suspended'),
+    (75, 'Joseph', 'Villanueva', 'joseph.villanueva75@example.com', 'Organizer', 'Suspended'),
+    (76, 'Tammy', 'Mcmillan', 'tammy.mcmillan76@example.org', 'Attendee', 'Active'),
+    (77, 'Matthew', 'Ward', 'matthew.ward77@example.com', 'Admin', 'Active'),
+    (78, 'Alexis', 'Roth', 'alexis.roth78@example.com', 'Attendee', 'Active'),
+    (79, 'Alicia', 'Lawrence', 'alicia.lawrence79@example.org', 'Attendee', 'Suspended'),
+    (80, 'Mary', 'Whitehead', 'mary.whitehead80@example.org', 'Organizer', 'Active'),
+    (81, 'Jeremy', 'Walker', 'jeremy.walker81@example.net', 'Organizer', 'Active'),
+    (82, 'Emily', 'Williams', 'emily.williams82@example.net', 'Attendee', 'Suspended'),
+    (83, 'Melissa', 'Sheppard', 'melissa.sheppard83@example.org', 'Organizer', 'Suspended'),
+    (84, 'Anthony', 'Gomez', 'anthony.gomez84@example.com', 'Organizer', 'Active'),
+    (85, 'Erika', 'Hernandez', 'erika.hernandez85@example.net', 'Attendee', 'Active'),
+    (86, 'Nicole', 'Newman', 'nicole.newman86@example.org', 'Organizer', 'Suspended'),
+    (87, 'Courtney', 'Hall', 'courtney.hall87@example.net', 'Attendee', 'Suspended'),
+    (88, 'Michele', 'Carpenter', 'michele.carpenter88@example.net', 'Admin', 'Active'),
+    (89, 'Joseph', 'Johnson', 'joseph.johnson89@example.net', 'Attendee', 'Suspended'),
+    (90, 'Deanna', 'Figueroa', 'deanna.figueroa90@example.com', 'Admin', 'Active'),
+    (91, 'Alyssa', 'Anderson', 'alyssa.anderson91@example.net', 'Admin', 'Suspended'),
+    (92, 'William', 'Osborne', 'william.osborne92@example.com', 'Organizer', 'Active'),
+    (93, 'Jacob', 'Carroll', 'jacob.carroll93@example.net', 'Organizer', 'Active'),
+    (94, 'Leslie', 'Patterson', 'leslie.patterson94@example.org', 'Admin', 'Active'),
+    (95, 'Brian', 'Valencia', 'brian.valencia95@example.net', 'Admin', 'Suspended'),
+    (96, 'Michele', 'Wu', 'michele.wu96@example.org', 'Organizer', 'Active'),
+    (97, 'Michelle', 'Gonzales', 'michelle.gonzales97@example.net', 'Admin', 'Active'),
+    (98, 'Marie', 'Jones', 'marie.jones98@example.com', 'Attendee', 'Active'),
+    (99, 'Courtney', 'Nunez', 'courtney.nunez99@example.com', 'Admin', 'Suspended'),
+    (100, 'Taylor', 'Hughes', 'taylor.hughes100@example.net', 'Organizer', 'Active'),
+    (101, 'Omar', 'Watson', 'omar.watson101@example.net', 'Organizer', 'Active'),
+    (102, 'Deborah', 'Fry', 'deborah.fry102@example.com', 'Attendee', 'Suspended'),
+    (103, 'Vanessa', 'Chambers', 'vanessa.chambers103@example.net', 'Admin', 'Suspended'),
+    (104, 'Debra', 'Nichols', 'debra.nichols104@example.net', 'Admin', 'Active'),
+    (105, 'Aaron', 'Collins', 'aaron.collins105@example.com', 'Organizer', 'Suspended'),
+    (106, 'Brandon', 'Melton', 'brandon.melton106@example.net', 'Admin', 'Active'),
+    (107, 'April', 'Owens', 'april.owens107@example.org', 'Attendee', 'Active'),
+    (108, 'Pamela', 'Butler', 'pamela.butler108@example.org', 'Attendee', 'Active'),
+    (109, 'Amy', 'Jones', 'amy.jones109@example.com', 'Attendee', 'Active'),
+    (110, 'David', 'Evans', 'david.evans110@example.net', 'Admin', 'Active'),
+    (111, 'Tony', 'Freeman', 'tony.freeman111@example.org', 'Organizer', 'Active'),
+    (112, 'Jeffrey', 'Kelly', 'jeffrey.kelly112@example.org', 'Organizer', 'Active'),
+    (113, 'Lisa', 'Brooks', 'lisa.brooks113@example.com', 'Organizer', 'Active'),
+    (114, 'Alan', 'Rice', 'alan.rice114@example.org', 'Attendee', 'Active'),
+    (115, 'Stephanie', 'Bond', 'stephanie.bond115@example.com', 'Admin', 'Active'),
+    (116, 'David', 'Stevens', 'david.stevens116@example.org', 'Admin', 'Suspended'),
+    (117, 'Ryan', 'Rowe', 'ryan.rowe117@example.org', 'Attendee', 'Active'),
+    (118, 'Ruben', 'Adams', 'ruben.adams118@example.net', 'Admin', 'Active'),
+    (119, 'Jennifer', 'Hanson', 'jennifer.hanson119@example.com', 'Admin', 'Suspended'),
+    (120, 'Barbara', 'Martinez', 'barbara.martinez120@example.org', 'Admin', 'Suspended'),
+    (121, 'Charles', 'Macias', 'charles.macias121@example.org', 'Attendee', 'Suspended'),
+    (122, 'Nicole', 'Campbell', 'nicole.campbell122@example.com', 'Attendee', 'Suspended'),
+    (123, 'Shawn', 'Rodriguez', 'shawn.rodriguez123@example.net', 'Attendee', 'Suspended'),
+    (124, 'Vincent', 'Gallagher', 'vincent.gallagher124@example.com', 'Admin', 'Active'),
+    (125, 'Jason', 'Vega', 'jason.vega125@example.com', 'Organizer', 'Active'),
+    (126, 'Anita', 'Bryant', 'anita.bryant126@example.com', 'Organizer', 'Active'),
+    (127, 'Desiree', 'Clark', 'desiree.clark127@example.com', 'Admin', 'Active'),
+    (128, 'Sean', 'Acosta', 'sean.acosta128@example.com', 'Organizer', 'Active'),
+    (129, 'Brian', 'Wagner', 'brian.wagner129@example.net', 'Admin', 'Active'),
+    (130, 'Jodi', 'Graves', 'jodi.graves130@example.com', 'Admin', 'Active'),
+    (131, 'Colleen', 'Rich', 'colleen.rich131@example.com', 'Attendee', 'Suspended'),
+    (132, 'Jason', 'Smith', 'jason.smith132@example.com', 'Admin', 'Suspended'),
+    (133, 'Gary', 'Jones', 'gary.jones133@example.net', 'Attendee', 'Active'),
+    (134, 'Anthony', 'Smith', 'anthony.smith134@example.com', 'Admin', 'Suspended'),
+    (135, 'Denise', 'Smith', 'denise.smith135@example.org', 'Admin', 'Suspended'),
+    (136, 'Jason', 'Holland', 'jason.holland136@example.com', 'Attendee', 'Active'),
+    (137, 'Angela', 'Cantu', 'angela.cantu137@example.org', 'Admin', 'Suspended'),
+    (138, 'Lisa', 'Hill', 'lisa.hill138@example.com', 'Admin', 'Suspended'),
+    (139, 'Michael', 'Conley', 'michael.conley139@example.org', 'Admin', 'Active'),
+    (140, 'Jason', 'Ramsey', 'jason.ramsey140@example.com', 'Admin', 'Suspended'),
+    (141, 'Brian', 'Riley', 'brian.riley141@example.org', 'Attendee', 'Active'),
+    (142, 'Jesse', 'Wu', 'jesse.wu142@example.org', 'Attendee', 'Suspended'),
+    (143, 'Albert', 'Herrera', 'albert.herrera143@example.org', 'Organizer', 'Active'),
+    (144, 'Amanda', 'King', 'amanda.king144@example.net', 'Admin', 'Suspended'),
+    (145, 'Blake', 'Kane', 'blake.kane145@example.com', 'Admin', 'Active'),
+    (146, 'George', 'Summers', 'george.summers146@example.net', 'Attendee', 'Suspended'),
+    (147, 'Christopher', 'Davis', 'christopher.davis147@example.org', 'Attendee', 'Suspended'),
+    (148, 'Stacey', 'Taylor', 'stacey.taylor148@example.com', 'Attendee', 'Active'),
+    (149, 'Jay', 'Phillips', 'jay.phillips149@example.com', 'Organizer', 'Active'),
+    (150, 'Daniel', 'Sullivan', 'daniel.sullivan150@example.org', 'Attendee', 'Active'),
+    (151, 'Maria', 'Butler', 'maria.butler151@example.org', 'Attendee', 'Suspended'),
+    (152, 'Angela', 'Terry', 'angela.terry152@example.org', 'Admin', 'Suspended'),
+    (153, 'Patricia', 'Holt', 'patricia.holt153@example.com', 'Attendee', 'Active'),
+    (154, 'Katherine', 'Camacho', 'katherine.camacho154@example.org', 'Attendee', 'Active'),
+    (155, 'Michelle', 'Taylor', 'michelle.taylor155@example.net', 'Admin', 'Suspended'),
+    (156, 'Martin', 'Gibson', 'martin.gibson156@example.net', 'Attendee', 'Active'),
+    (157, 'Brittany', 'Aguilar', 'brittany.aguilar157@example.net', 'Attendee', 'Active'),
+    (158, 'Matthew', 'Brandt', 'matthew.brandt158@example.com', 'Organizer', 'Active'),
+    (159, 'Jonathan', 'Williams', 'jonathan.williams159@example.com', 'Organizer', 'Active'),
+    (160, 'Mary', 'Taylor', 'mary.taylor160@example.net', 'Admin', 'Active'),
+    (161, 'Dominic', 'Lewis', 'dominic.lewis161@example.com', 'Organizer', 'Active'),
+    (162, 'Anita', 'Turner', 'anita.turner162@example.com', 'Attendee', 'Suspended'),
+    (163, 'John', 'Miller', 'john.miller163@example.org', 'Organizer', 'Active'),
+    (164, 'Kevin', 'Bernard', 'kevin.bernard164@example.com', 'Attendee', 'Suspended'),
+    (165, 'Michelle', 'Fischer', 'michelle.fischer165@example.com', 'Admin', 'Active'),
+    (166, 'Brandon', 'Spears', 'brandon.spears166@example.com', 'Attendee', 'Active'),
+    (167, 'Vincent', 'Morrow', 'vincent.morrow167@example.org', 'Admin', 'Suspended'),
+    (168, 'Caitlin', 'Jenkins', 'caitlin.jenkins168@example.org', 'Admin', 'Active'),
+    (169, 'Jeffrey', 'Vaughan', 'jeffrey.vaughan169@example.net', 'Admin', 'Active'),
+    (170, 'Ray', 'Bradley', 'ray.bradley170@example.com', 'Admin', 'Active'),
+    (171, 'Cheryl', 'Simmons', 'cheryl.simmons171@example.net', 'Organizer', 'Suspended'),
+    (172, 'Aaron', 'Gardner', 'aaron.gardner172@example.com', 'Attendee', 'Suspended'),
+    (173, 'Christopher', 'Welch', 'christopher.welch173@example.net', 'Organizer', 'Suspended'),
+    (174, 'Kenneth', 'Robinson', 'kenneth.robinson174@example.com', 'Organizer', 'Active'),
+    (175, 'Brian', 'Taylor', 'brian.taylor175@example.net', 'Admin', 'Suspended'),
+    (176, 'Travis', 'Ramirez', 'travis.ramirez176@example.net', 'Admin', 'Active'),
+    (177, 'Jason', 'Pierce', 'jason.pierce177@example.org', 'Organizer', 'Suspended'),
+    (178, 'Lori', 'Weiss', 'lori.weiss178@example.net', 'Attendee', 'Suspended'),
+    (179, 'Barbara', 'Castillo', 'barbara.castillo179@example.com', 'Organizer', 'Suspended'),
+    (180, 'Rachel', 'Sandoval', 'rachel.sandoval180@example.org', 'Admin', 'Suspended'),
+    (181, 'Brandy', 'West', 'brandy.west181@example.net', 'Attendee', 'Suspended'),
+    (182, 'Alison', 'Castillo', 'alison.castillo182@example.net', 'Organizer', 'Active'),
+    (183, 'Monica', 'Hudson', 'monica.hudson183@example.org', 'Organizer', 'Suspended'),
+    (184, 'Lindsay', 'Brown', 'lindsay.brown184@example.com', 'Organizer', 'Suspended'),
+    (185, 'Theodore', 'Farley', 'theodore.farley185@example.net', 'Attendee', 'Active'),
+    (186, 'Brooke', 'Booth', 'brooke.booth186@example.com', 'Admin', 'Active'),
+    (187, 'Valerie', 'Maldonado', 'valerie.maldonado187@example.org', 'Admin', 'Active'),
+    (188, 'Benjamin', 'Cole', 'benjamin.cole188@example.com', 'Attendee', 'Active'),
+    (189, 'Antonio', 'Rogers', 'antonio.rogers189@example.org', 'Attendee', 'Active'),
+    (190, 'Joseph', 'Vargas', 'joseph.vargas190@example.com', 'Attendee', 'Active'),
+    (191, 'Shawn', 'Clark', 'shawn.clark191@example.com', 'Organizer', 'Suspended'),
+    (192, 'Kyle', 'Rivers', 'kyle.rivers192@example.org', 'Organizer', 'Suspended'),
+    (193, 'David', 'Ford', 'david.ford193@example.com', 'Attendee', 'Active'),
+    (194, 'Lee', 'Jackson', 'lee.jackson194@example.com', 'Organizer', 'Suspended'),
+    (195, 'Denise', 'Carr', 'denise.carr195@example.com', 'Organizer', 'Suspended'),
+    (196, 'Richard', 'Ramirez', 'richard.ramirez196@example.org', 'Attendee', 'Active'),
+    (197, 'Crystal', 'Fields', 'crystal.fields197@example.net', 'Attendee', 'Suspended'),
+    (198, 'Linda', 'Daniels', 'linda.daniels198@example.org', 'Admin', 'Suspended'),
+    (199, 'Allen', 'Brown', 'allen.brown199@example.com', 'Organizer', 'Active'),
+    (200, 'Michael', 'Fernandez', 'michael.fernandez200@example.net', 'Organizer', 'Active'),
+    (201, 'Karen', 'Bell', 'karen.bell201@example.net', 'Attendee', 'Active'),
+    (202, 'Jennifer', 'Kelley', 'jennifer.kelley202@example.com', 'Organizer', 'Suspended'),
+    (203, 'Beverly', 'Schneider', 'beverly.schneider203@example.com', 'Attendee', 'Active'),
+    (204, 'Timothy', 'Romero', 'timothy.romero204@example.org', 'Attendee', 'Active'),
+    (205, 'Steven', 'Velasquez', 'steven.velasquez205@example.com', 'Organizer', 'Active'),
+    (206, 'Lynn', 'Weaver', 'lynn.weaver206@example.com', 'Organizer', 'Active'),
+    (207, 'Jonathan', 'Rogers', 'jonathan.rogers207@example.com', 'Admin', 'Active'),
+    (208, 'Michael', 'Simmons', 'michael.simmons208@example.com', 'Attendee', 'Active'),
+    (209, 'Suzanne', 'Rogers', 'suzanne.rogers209@example.net', 'Attendee', 'Suspended'),
+    (210, 'Nathan', 'Norris', 'nathan.norris210@example.org', 'Admin', 'Active'),
+    (211, 'John', 'Jones', 'john.jones211@example.com', 'Attendee', 'Active'),
+    (212, 'Alexander', 'White', 'alexander.white212@example.net', 'Attendee', 'Suspended'),
+    (213, 'Charles', 'Green', 'charles.green213@example.com', 'Organizer', 'Suspended'),
+    (214, 'Dustin', 'Stewart', 'dustin.stewart214@example.com', 'Admin', 'Active'),
+    (215, 'Jacob', 'Curry', 'jacob.curry215@example.com', 'Attendee', 'Active'),
+    (216, 'Daniel', 'Mcintyre', 'daniel.mcintyre216@example.com', 'Admin', 'Suspended'),
+    (217, 'Caleb', 'Jenkins', 'caleb.jenkins217@example.com', 'Attendee', 'Suspended'),
+    (218, 'Lisa', 'Anderson', 'lisa.anderson218@example.com', 'Organizer', 'Active'),
+    (219, 'Alyssa', 'Mitchell', 'alyssa.mitchell219@example.com', 'Admin', 'Active'),
+    (220, 'Jacob', 'Franklin', 'jacob.franklin220@example.org', 'Admin', 'Active'),
+    (221, 'Brandi', 'Dominguez', 'brandi.dominguez221@example.com', 'Attendee', 'Suspended'),
+    (222, 'Jeffrey', 'Briggs', 'jeffrey.briggs222@example.com', 'Attendee', 'Active'),
+    (223, 'Michael', 'Deleon', 'michael.deleon223@example.com', 'Organizer', 'Suspended'),
+    (224, 'Alexis', 'Ford', 'alexis.ford224@example.net', 'Admin', 'Suspended'),
+    (225, 'Taylor', 'Underwood', 'taylor.underwood225@example.net', 'Admin', 'Active'),
+    (226, 'Erika', 'Kelly', 'erika.kelly226@example.com', 'Organizer', 'Active'),
+    (227, 'Pamela', 'Curtis', 'pamela.curtis227@example.com', 'Admin', 'Suspended'),
+    (228, 'Lindsay', 'Thomas', 'lindsay.thomas228@example.com', 'Attendee', 'Active'),
+    (229, 'Karen', 'Hendrix', 'karen.hendrix229@example.net', 'Admin', 'Active'),
+    (230, 'Terry', 'Gonzalez', 'terry.gonzalez230@example.com', 'Organizer', 'Suspended'),
+    (231, 'Ryan', 'Adams', 'ryan.adams231@example.net', 'Attendee', 'Active'),
+    (232, 'Dylan', 'Nguyen', 'dylan.nguyen232@example.com', 'Organizer', 'Suspended'),
+    (233, 'Rachael', 'Galloway', 'rachael.galloway233@example.net', 'Organizer', 'Active'),
+    (234, 'Samantha', 'Taylor', 'samantha.taylor234@example.org', 'Attendee', 'Suspended'),
+    (235, 'Jodi', 'Roy', 'jodi.roy235@example.org', 'Admin', 'Active'),
+    (236, 'Anna', 'Hernandez', 'anna.hernandez236@example.net', 'Admin', 'Suspended'),
+    (237, 'Ellen', 'Hoover', 'ellen.hoover237@example.com', 'Organizer', 'Active'),
+    (238, 'Susan', 'Foster', 'susan.foster238@example.org', 'Attendee', 'Suspended'),
+    (239, 'Jonathan', 'Webster', 'jonathan.webster239@example.org', 'Organizer', 'Active'),
+    (240, 'Scott', 'Taylor', 'scott.taylor240@example.com', 'Attendee', 'Active'),
+    (241, 'William', 'Drake', 'william.drake241@example.org', 'Organizer', 'Suspended'),
+    (242, 'Joel', 'Harris', 'joel.harris242@example.com', 'Attendee', 'Suspended'),
+    (243, 'April', 'Saunders', 'april.saunders243@example.org', 'Attendee', 'Suspended'),
+    (244, 'Meredith', 'Rodriguez', 'meredith.rodriguez244@example.net', 'Admin', 'Suspended'),
+    (245, 'Jack', 'Cooley', 'jack.cooley245@example.org', 'Admin', 'Suspended'),
+    (246, 'Joshua', 'Miller', 'joshua.miller246@example.com', 'Attendee', 'Active'),
+    (247, 'Joseph', 'Miller', 'joseph.miller247@example.net', 'Organizer', 'Suspended'),
+    (248, 'Misty', 'Lynch', 'misty.lynch248@example.org', 'Admin', 'Active'),
+    (249, 'William', 'Pratt', 'william.pratt249@example.net', 'Organizer', 'Active'),
+    (250, 'Evelyn', 'Silva', 'evelyn.silva250@example.com', 'Organizer', 'Suspended'),
+    (251, 'Jenna', 'Edwards', 'jenna.edwards251@example.org', 'Attendee', 'Active'),
+    (252, 'Katherine', 'Hodges', 'katherine.hodges252@example.com', 'Attendee', 'Active'),
+    (253, 'Tyler', 'Lowe', 'tyler.lowe253@example.net', 'Organizer', 'Active'),
+    (254, 'Shannon', 'Hicks', 'shannon.hicks254@example.com', 'Attendee', 'Active'),
+    (255, 'Lisa', 'Davis', 'lisa.davis255@example.com', 'Admin', 'Active'),
+    (256, 'Luis', 'Benjamin', 'luis.benjamin256@example.net', 'Organizer', 'Active'),
+    (257, 'Luis', 'Reyes', 'luis.reyes257@example.net', 'Attendee', 'Active'),
+    (258, 'Michelle', 'Keller', 'michelle.keller258@example.org', 'Organizer', 'Active'),
+    (259, 'Ann', 'Hernandez', 'ann.hernandez259@example.org', 'Attendee', 'Suspended'),
+    (260, 'Michael', 'Spencer', 'michael.spencer260@example.com', 'Admin', 'Active'),
+    (261, 'Courtney', 'Dawson', 'courtney.dawson261@example.org', 'Admin', 'Suspended'),
+    (262, 'Tina', 'James', 'tina.james262@example.net', 'Attendee', 'Suspended'),
+    (263, 'Renee', 'Powers', 'renee.powers263@example.org', 'Admin', 'Active'),
+    (264, 'Alexander', 'Sullivan', 'alexander.sullivan264@example.com', 'Admin', 'Active'),
+    (265, 'Jonathan', 'Jenkins', 'jonathan.jenkins265@example.com', 'Attendee', 'Active'),
+    (266, 'Kristin', 'Underwood', 'kristin.underwood266@example.com', 'Organizer', 'Suspended'),
+    (267, 'Joshua', 'Miller', 'joshua.miller267@example.com', 'Attendee', 'Suspended'),
+    (268, 'Sarah', 'Novak', 'sarah.novak268@example.org', 'Attendee', 'Active'),
+    (269, 'Julie', 'Moore', 'julie.moore269@example.com', 'Admin', 'Active'),
+    (270, 'Cody', 'Burgess', 'cody.burgess270@example.net', 'Attendee', 'Suspended'),
+    (271, 'Donald', 'Little', 'donald.little271@example.net', 'Organizer', 'Active'),
+    (272, 'Stephanie', 'Lopez', 'stephanie.lopez272@example.net', 'Attendee', 'Active'),
+    (273, 'Natasha', 'Dean', 'natasha.dean273@example.net', 'Attendee', 'Active'),
+    (274, 'Michael', 'Foster', 'michael.foster274@example.org', 'Admin', 'Active'),
+    (275, 'Jonathan', 'Hill', 'jonathan.hill275@example.net', 'Organizer', 'Suspended'),
+    (276, 'Robert', 'Wong', 'robert.wong276@example.net', 'Attendee', 'Suspended'),
+    (277, 'Wendy', 'Johnson', 'wendy.johnson277@example.com', 'Organizer', 'Suspended'),
+    (278, 'Megan', 'Greer', 'megan.greer278@example.org', 'Attendee', 'Suspended'),
+    (279, 'Derek', 'Watson', 'derek.watson279@example.org', 'Organizer', 'Suspended'),
+    (280, 'Heather', 'Pittman', 'heather.pittman280@example.com', 'Attendee', 'Active'),
+    (281, 'Maxwell', 'Cooper', 'maxwell.cooper281@example.org', 'Organizer', 'Suspended'),
+    (282, 'Michael', 'Thomas', 'michael.thomas282@example.com', 'Attendee', 'Suspended'),
+    (283, 'John', 'Crawford', 'john.crawford283@example.com', 'Organizer', 'Suspended'),
+    (284, 'Ashley', 'Jenkins', 'ashley.jenkins284@example.net', 'Attendee', 'Active'),
+    (285, 'Carlos', 'Butler', 'carlos.butler285@example.net', 'Attendee', 'Suspended'),
+    (286, 'Natasha', 'Bright', 'natasha.bright286@example.com', 'Attendee', 'Suspended'),
+    (287, 'Richard', 'Larson', 'richard.larson287@example.net', 'Admin', 'Suspended'),
+    (288, 'Craig', 'Lucas', 'craig.lucas288@example.com', 'Organizer', 'Active'),
+    (289, 'Kimberly', 'Mcdonald', 'kimberly.mcdonald289@example.com', 'Organizer', 'Suspended'),
+    (290, 'Ann', 'Calhoun', 'ann.calhoun290@example.org', 'Admin', 'Active'),
+    (291, 'Brian', 'Anderson', 'brian.anderson291@example.org', 'Organizer', 'Active'),
+    (292, 'Rebecca', 'Williams', 'rebecca.williams292@example.com', 'Organizer', 'Active'),
+    (293, 'Nathan', 'Jones', 'nathan.jones293@example.org', 'Attendee', 'Active'),
+    (294, 'Robert', 'Johnson', 'robert.johnson294@example.org', 'Admin', 'Suspended'),
+    (295, 'Erin', 'Riley', 'erin.riley295@example.com', 'Organizer', 'Active'),
+    (296, 'Michael', 'Higgins', 'michael.higgins296@example.org', 'Attendee', 'Suspended'),
+    (297, 'Frank', 'Williams', 'frank.williams297@example.net', 'Admin', 'Suspended'),
+    (298, 'Robert', 'Acevedo', 'robert.acevedo298@example.org', 'Attendee', 'Active'),
+    (299, 'Wayne', 'Harvey', 'wayne.harvey299@example.net', 'Attendee', 'Suspended'),
+    (300, 'Joel', 'Sanders', 'joel.sanders300@example.org', 'Organizer', 'Active'),
+    (301, 'Troy', 'Harvey', 'troy.harvey301@example.com', 'Attendee', 'Suspended'),
+    (302, 'Lindsay', 'Harrell', 'lindsay.harrell302@example.org', 'Attendee', 'Suspended'),
+    (303, 'Julie', 'Graham', 'julie.graham303@example.org', 'Admin', 'Suspended'),
+    (304, 'Chelsea', 'Zimmerman', 'chelsea.zimmerman304@example.org', 'Attendee', 'Active'),
+    (305, 'Jared', 'Gutierrez', 'jared.gutierrez305@example.org', 'Organizer', 'Suspended'),
+    (306, 'Joe', 'Smith', 'joe.smith306@example.net', 'Organizer', 'Active'),
+    (307, 'John', 'Paul', 'john.paul307@example.com', 'Admin', 'Active'),
+    (308, 'Jade', 'Baker', 'jade.baker308@example.net', 'Admin', 'Suspended'),
+    (309, 'Cristina', 'Caldwell', 'cristina.caldwell309@example.org', 'Admin', 'Suspended'),
+    (310, 'Michael', 'Wolfe', 'michael.wolfe310@example.org', 'Admin', 'Suspended'),
+    (311, 'Jeremy', 'Whitney', 'jeremy.whitney311@example.net', 'Attendee', 'Suspended'),
+    (312, 'Gregory', 'Wright', 'gregory.wright312@example.org', 'Organizer', 'Suspended'),
+    (313, 'Victor', 'Ross', 'victor.ross313@example.com', 'Admin', 'Suspended'),
+    (314, 'Melissa', 'Arellano', 'melissa.arellano314@example.net', 'Attendee', 'Active'),
+    (315, 'Elizabeth', 'Glenn', 'elizabeth.glenn315@example.org', 'Attendee', 'Active'),
+    (316, 'Mackenzie', 'Khan', 'mackenzie.khan316@example.org', 'Admin', 'Active'),
+    (317, 'Kimberly', 'Smith', 'kimberly.smith317@example.com', 'Attendee', 'Active'),
+    (318, 'Mary', 'Salas', 'mary.salas318@example.net', 'Admin', 'Suspended'),
+    (319, 'Rebecca', 'Irwin', 'rebecca.irwin319@example.org', 'Admin', 'Suspended'),
+    (320, 'Kelly', 'Ballard', 'kelly.ballard320@example.net', 'Attendee', 'Suspended'),
+    (321, 'Brandon', 'Hoover', 'brandon.hoover321@example.org', 'Organizer', 'Active'),
+    (322, 'Maurice', 'Coleman', 'maurice.coleman322@example.com', 'Attendee', 'Suspended'),
+    (323, 'Matthew', 'Contreras', 'matthew.contreras323@example.com', 'Admin', 'Suspended'),
+    (324, 'Heather', 'Taylor', 'heather.taylor324@example.net', 'Organizer', 'Active'),
+    (325, 'Rebecca', 'Moore', 'rebecca.moore325@example.net', 'Attendee', 'Suspended'),
+    (326, 'John', 'Howard', 'john.howard326@example.net', 'Attendee', 'Suspended'),
+    (327, 'Sara', 'Kerr', 'sara.kerr327@example.com', 'Attendee', 'Active'),
+    (328, 'Matthew', 'Hammond', 'matthew.hammond328@example.net', 'Admin', 'Suspended'),
+    (329, 'Tammy', 'Burton', 'tammy.burton329@example.net', 'Attendee', 'Active'),
+    (330, 'Curtis', 'Osborne', 'curtis.osborne330@example.net', 'Organizer', 'Active'),
+    (331, 'James', 'Hall', 'james.hall331@example.org', 'Admin', 'Active'),
+    (332, 'Sara', 'Phillips', 'sara.phillips332@example.com', 'Organizer', 'Active'),
+    (333, 'Victor', 'Bowen', 'victor.bowen333@example.org', 'Admin', 'Active'),
+    (334, 'Barbara', 'Silva', 'barbara.silva334@example.org', 'Admin', 'Active'),
+    (335, 'Nathan', 'Peterson', 'nathan.peterson335@example.org', 'Admin', 'Suspended'),
+    (336, 'Jennifer', 'Sharp', 'jennifer.sharp336@example.org', 'Organizer', 'Active'),
+    (337, 'Tanya', 'Merritt', 'tanya.merritt337@example.net', 'Organizer', 'Active'),
+    (338, 'Terri', 'Hogan', 'terri.hogan338@example.com', 'Admin', 'Suspended'),
+    (339, 'Xavier', 'Parsons', 'xavier.parsons339@example.com', 'Admin', 'Active'),
+    (340, 'Leslie', 'James', 'leslie.james340@example.org', 'Attendee', 'Suspended'),
+    (341, 'Stephanie', 'Hicks', 'stephanie.hicks341@example.org', 'Admin', 'Suspended'),
+    (342, 'Stuart', 'Simpson', 'stuart.simpson342@example.net', 'Organizer', 'Active'),
+    (343, 'Taylor', 'Long', 'taylor.long343@example.com', 'Admin', 'Suspended'),
+    (344, 'Katherine', 'Vaughan', 'katherine.vaughan344@example.com', 'Admin', 'Suspended'),
+    (345, 'Amy', 'Taylor', 'amy.taylor345@example.net', 'Admin', 'Suspended'),
+    (346, 'Stephanie', 'Anderson', 'stephanie.anderson346@example.net', 'Admin', 'Suspended'),
+    (347, 'Yvonne', 'Clark', 'yvonne.clark347@example.net', 'Admin', 'Active'),
+    (348, 'Anna', 'West', 'anna.west348@example.net', 'Attendee', 'Active'),
+    (349, 'Miguel', 'Johnson', 'miguel.johnson349@example.org', 'Organizer', 'Active'),
+    (350, 'Lisa', 'Knight', 'lisa.knight350@example.com', 'Admin', 'Suspended'),
+    (351, 'Joseph', 'Briggs', 'joseph.briggs351@example.org', 'Admin', 'Active'),
+    (352, 'Mark', 'Lucas', 'mark.lucas352@example.net', 'Attendee', 'Active'),
+    (353, 'Matthew', 'Fernandez', 'matthew.fernandez353@example.com', 'Organizer', 'Active'),
+    (354, 'John', 'Kelley', 'john.kelley354@example.net', 'Attendee', 'Suspended'),
+    (355, 'Brenda', 'Burke', 'brenda.burke355@example.net', 'Admin', 'Active'),
+    (356, 'Heather', 'Brown', 'heather.brown356@example.net', 'Organizer', 'Suspended'),
+    (357, 'Sandra', 'Webster', 'sandra.webster357@example.net', 'Attendee', 'Suspended'),
+    (358, 'Erik', 'Greene', 'erik.greene358@example.net', 'Attendee', 'Active'),
+    (359, 'Anna', 'Martinez', 'anna.martinez359@example.com', 'Organizer', 'Active'),
+    (360, 'Madison', 'Malone', 'madison.malone360@example.net', 'Admin', 'Active'),
+    (361, 'Chelsea', 'Houston', 'chelsea.houston361@example.org', 'Organizer', 'Suspended'),
+    (362, 'Nancy', 'Miller', 'nancy.miller362@example.net', 'Organizer', 'Suspended'),
+    (363, 'Christopher', 'Johnson', 'christopher.johnson363@example.net', 'Admin', 'Suspended'),
+    (364, 'Gerald', 'Vaughan', 'gerald.vaughan364@example.org', 'Attendee', 'Suspended'),
+    (365, 'Michael', 'Washington', 'michael.washington365@example.com', 'Attendee', 'Suspended'),
+    (366, 'Kelly', 'Monroe', 'kelly.monroe366@example.net', 'Organizer', 'Active'),
+    (367, 'William', 'Koch', 'william.koch367@example.org', 'Admin', 'Suspended'),
+    (368, 'Tyler', 'Cunningham', 'tyler.cunningham368@example.com', 'Organizer', 'Active'),
+    (369, 'Angela', 'Graves', 'angela.graves369@example.net', 'Attendee', 'Suspended'),
+    (370, 'Leslie', 'Leach', 'leslie.leach370@example.org', 'Admin', 'Suspended'),
+    (371, 'Anthony', 'Richards', 'anthony.richards371@example.com', 'Organizer', 'Suspended'),
+    (372, 'Anthony', 'Brown', 'anthony.brown372@example.net', 'Attendee', 'Suspended'),
+    (373, 'Daniel', 'Wall', 'daniel.wall373@example.net', 'Admin', 'Suspended'),
+    (374, 'Michelle', 'Roberson', 'michelle.roberson374@example.net', 'Attendee', 'Active'),
+    (375, 'Angela', 'Perez', 'angela.perez375@example.net', 'Organizer', 'Active'),
+    (376, 'Antonio', 'Huffman', 'antonio.huffman376@example.net', 'Admin', 'Active'),
+    (377, 'Eric', 'Edwards', 'eric.edwards377@example.com', 'Attendee', 'Suspended'),
+    (378, 'Sydney', 'Smith', 'sydney.smith378@example.net', 'Organizer', 'Suspended'),
+    (379, 'Steven', 'Hopkins', 'steven.hopkins379@example.org', 'Attendee', 'Suspended'),
+    (380, 'Scott', 'Ferguson', 'scott.ferguson380@example.com', 'Admin', 'Suspended'),
+    (381, 'Mark', 'Copeland', 'mark.copeland381@example.net', 'Organizer', 'Active'),
+    (382, 'Wendy', 'Johnson', 'wendy.johnson382@example.org', 'Organizer', 'Suspended'),
+    (383, 'Margaret', 'Reese', 'margaret.reese383@example.org', 'Organizer', 'Suspended'),
+    (384, 'Elizabeth', 'Durham', 'elizabeth.durham384@example.org', 'Admin', 'Active'),
+    (385, 'Rebecca', 'Bradley', 'rebecca.bradley385@example.org', 'Organizer', 'Active'),
+    (386, 'Katherine', 'Johnson', 'katherine.johnson386@example.net', 'Attendee', 'Active'),
+    (387, 'Victoria', 'Bailey', 'victoria.bailey387@example.org', 'Organizer', 'Active'),
+    (388, 'Jeffrey', 'Smith', 'jeffrey.smith388@example.org', 'Attendee', 'Suspended'),
+    (389, 'Michelle', 'Roth', 'michelle.roth389@example.com', 'Organizer', 'Suspended'),
+    (390, 'Lawrence', 'Walters', 'lawrence.walters390@example.com', 'Admin', 'Suspended'),
+    (391, 'Lisa', 'Green', 'lisa.green391@example.org', 'Admin', 'Active'),
+    (392, 'Anthony', 'Johnson', 'anthony.johnson392@example.org', 'Admin', 'Active'),
+    (393, 'Mary', 'Warner', 'mary.warner393@example.com', 'Admin', 'Suspended'),
+    (394, 'Lisa', 'Delgado', 'lisa.delgado394@example.com', 'Organizer', 'Suspended'),
+    (395, 'Linda', 'Mendoza', 'linda.mendoza395@example.org', 'Organizer', 'Suspended'),
+    (396, 'Lori', 'Moore', 'lori.moore396@example.org', 'Attendee', 'Active'),
+    (397, 'Joseph', 'Thompson', 'joseph.thompson397@example.org', 'Admin', 'Active'),
+    (398, 'Andrew', 'Wallace', 'andrew.wallace398@example.com', 'Admin', 'Active'),
+    (399, 'Gregory', 'Cochran', 'gregory.cochran399@example.org', 'Organizer', 'Suspended'),
+    (400, 'Jenna', 'Burton', 'jenna.burton400@example.com', 'Attendee', 'Active'),
+    (401, 'Kevin', 'Carter', 'kevin.carter401@example.net', 'Organizer', 'Suspended'),
+    (402, 'Laura', 'Smith', 'laura.smith402@example.net', 'Attendee', 'Active'),
+    (403, 'Michael', 'Cardenas', 'michael.cardenas403@example.com', 'Organizer', 'Suspended'),
+    (404, 'Susan', 'Andrade', 'susan.andrade404@example.com', 'Organizer', 'Active'),
+    (405, 'Timothy', 'Miller', 'timothy.miller405@example.org', 'Organizer', 'Suspended'),
+    (406, 'Kara', 'Watkins', 'kara.watkins406@example.com', 'Attendee', 'Suspended'),
+    (407, 'Nicole', 'Hurley', 'nicole.hurley407@example.net', 'Admin', 'Active'),
+    (408, 'Isaac', 'Reynolds', 'isaac.reynolds408@example.net', 'Organizer', 'Suspended'),
+    (409, 'Matthew', 'Mccall', 'matthew.mccall409@example.org', 'Organizer', 'Active'),
+    (410, 'Angela', 'Collier', 'angela.collier410@example.net', 'Admin', 'Active'),
+    (411, 'Trevor', 'Scott', 'trevor.scott411@example.org', 'Attendee', 'Suspended'),
+    (412, 'Michael', 'Morse', 'michael.morse412@example.com', 'Organizer', 'Suspended'),
+    (413, 'Joshua', 'Bennett', 'joshua.bennett413@example.net', 'Attendee', 'Active'),
+    (414, 'Denise', 'Page', 'denise.page414@example.net', 'Attendee', 'Suspended'),
+    (415, 'Tyler', 'Kline', 'tyler.kline415@example.org', 'Organizer', 'Suspended'),
+    (416, 'John', 'Hanson', 'john.hanson416@example.com', 'Organizer', 'Active'),
+    (417, 'Wendy', 'Jones', 'wendy.jones417@example.com', 'Admin', 'Suspended'),
+    (418, 'Ronald', 'Warren', 'ronald.warren418@example.com', 'Attendee', 'Active'),
+    (419, 'Ryan', 'Watson', 'ryan.watson419@example.com', 'Admin', 'Suspended'),
+    (420, 'Michael', 'Taylor', 'michael.taylor420@example.com', 'Attendee', 'Active'),
+    (421, 'Melissa', 'Vasquez', 'melissa.vasquez421@example.org', 'Organizer', 'Suspended'),
+    (422, 'Vanessa', 'Howell', 'vanessa.howell422@example.org', 'Admin', 'Suspended'),
+    (423, 'Robert', 'Deleon', 'robert.deleon423@example.com', 'Attendee', 'Suspended'),
+    (424, 'Brian', 'Hughes', 'brian.hughes424@example.net', 'Attendee', 'Active'),
+    (425, 'Linda', 'Wilson', 'linda.wilson425@example.net', 'Organizer', 'Active'),
+    (426, 'Heather', 'Phillips', 'heather.phillips426@example.com', 'Admin', 'Active'),
+    (427, 'Laura', 'Kelly', 'laura.kelly427@example.org', 'Organizer', 'Active'),
+    (428, 'Darren', 'Gonzalez', 'darren.gonzalez428@example.com', 'Admin', 'Suspended'),
+    (429, 'Daniel', 'Vargas', 'daniel.vargas429@example.org', 'Attendee', 'Suspended'),
+    (430, 'Whitney', 'Brown', 'whitney.brown430@example.com', 'Attendee', 'Active'),
+    (431, 'Jeffrey', 'Chandler', 'jeffrey.chandler431@example.com', 'Organizer', 'Active'),
+    (432, 'Gina', 'Rodriguez', 'gina.rodriguez432@example.net', 'Admin', 'Active'),
+    (433, 'Amy', 'Dominguez', 'amy.dominguez433@example.org', 'Organizer', 'Active'),
+    (434, 'Melinda', 'Mcdaniel', 'melinda.mcdaniel434@example.org', 'Organizer', 'Active'),
+    (435, 'Brittany', 'Rodriguez', 'brittany.rodriguez435@example.net', 'Organizer', 'Active'),
+    (436, 'Michelle', 'Jones', 'michelle.jones436@example.com', 'Organizer', 'Suspended'),
+    (437, 'Marissa', 'Young', 'marissa.young437@example.com', 'Admin', 'Active'),
+    (438, 'Erin', 'Griffin', 'erin.griffin438@example.net', 'Admin', 'Suspended'),
+    (439, 'Anne', 'Harris', 'anne.harris439@example.com', 'Organizer', 'Suspended'),
+    (440, 'Evan', 'Ruiz', 'evan.ruiz440@example.org', 'Admin', 'Active'),
+    (441, 'Heidi', 'Jones', 'heidi.jones441@example.com', 'Attendee', 'Suspended'),
+    (442, 'Jennifer', 'Adams', 'jennifer.adams442@example.com', 'Organizer', 'Suspended'),
+    (443, 'Janet', 'Hall', 'janet.hall443@example.com', 'Organizer', 'Suspended'),
+    (444, 'Jeffrey', 'Ford', 'jeffrey.ford444@example.com', 'Attendee', 'Active'),
+    (445, 'Pedro', 'West', 'pedro.west445@example.net', 'Attendee', 'Active'),
+    (446, 'Cindy', 'Scott', 'cindy.scott446@example.net', 'Admin', 'Active'),
+    (447, 'Paul', 'Mills', 'paul.mills447@example.org', 'Attendee', 'Suspended'),
+    (448, 'Brittney', 'Salinas', 'brittney.salinas448@example.net', 'Admin', 'Active'),
+    (449, 'Bruce', 'Mcintosh', 'bruce.mcintosh449@example.com', 'Attendee', 'Suspended'),
+    (450, 'William', 'Yoder', 'william.yoder450@example.org', 'Attendee', 'Active'),
+    (451, 'Daniel', 'Pearson', 'daniel.pearson451@example.org', 'Attendee', 'Suspended'),
+    (452, 'Sarah', 'Mccullough', 'sarah.mccullough452@example.org', 'Organizer', 'Suspended'),
+    (453, 'Michael', 'Johnson', 'michael.johnson453@example.org', 'Attendee', 'Active'),
+    (454, 'Donna', 'Martin', 'donna.martin454@example.com', 'Admin', 'Active'),
+    (455, 'Sharon', 'Newman', 'sharon.newman455@example.org', 'Organizer', 'Suspended'),
+    (456, 'Maria', 'Bradley', 'maria.bradley456@example.net', 'Organizer', 'Suspended'),
+    (457, 'Anna', 'Bowers', 'anna.bowers457@example.net', 'Admin', 'Suspended'),
+    (458, 'Linda', 'Brown', 'linda.brown458@example.org', 'Organizer', 'Active'),
+    (459, 'Nicholas', 'Stafford', 'nicholas.stafford459@example.org', 'Attendee', 'Suspended'),
+    (460, 'Amber', 'Larsen', 'amber.larsen460@example.com', 'Attendee', 'Suspended'),
+    (461, 'Matthew', 'Collins', 'matthew.collins461@example.com', 'Organizer', 'Active'),
+    (462, 'Vicki', 'Schwartz', 'vicki.schwartz462@example.com', 'Organizer', 'Active'),
+    (463, 'Natasha', 'James', 'natasha.james463@example.org', 'Attendee', 'Suspended'),
+    (464, 'John', 'Morgan', 'john.morgan464@example.org', 'Attendee', 'Active'),
+    (465, 'John', 'Bradley', 'john.bradley465@example.net', 'Attendee', 'Suspended'),
+    (466, 'Anna', 'Bell', 'anna.bell466@example.org', 'Organizer', 'Suspended'),
+    (467, 'Kaitlin', 'Collins', 'kaitlin.collins467@example.com', 'Attendee', 'Active'),
+    (468, 'Amber', 'George', 'amber.george468@example.net', 'Attendee', 'Suspended'),
+    (469, 'Emily', 'Garcia', 'emily.garcia469@example.com', 'Admin', 'Suspended'),
+    (470, 'Dennis', 'Torres', 'dennis.torres470@example.net', 'Attendee', 'Suspended'),
+    (471, 'Courtney', 'Bowen', 'courtney.bowen471@example.net', 'Organizer', 'Active'),
+    (472, 'Rhonda', 'Moore', 'rhonda.moore472@example.net', 'Attendee', 'Suspended'),
+    (473, 'Erica', 'Taylor', 'erica.taylor473@example.net', 'Attendee', 'Active'),
+    (474, 'Elizabeth', 'Taylor', 'elizabeth.taylor474@example.org', 'Attendee', 'Active'),
+    (475, 'Joanna', 'Castillo', 'joanna.castillo475@example.net', 'Attendee', 'Active'),
+    (476, 'Mark', 'Kelly', 'mark.kelly476@example.net', 'Attendee', 'Suspended'),
+    (477, 'Andrew', 'Schneider', 'andrew.schneider477@example.org', 'Admin', 'Suspended'),
+    (478, 'Leslie', 'Li', 'leslie.li478@example.net', 'Attendee', 'Suspended'),
+    (479, 'Kristina', 'Ibarra', 'kristina.ibarra479@example.net', 'Admin', 'Active'),
+    (480, 'Gina', 'Camacho', 'gina.camacho480@example.net', 'Attendee', 'Active'),
+    (481, 'David', 'Davis', 'david.davis481@example.org', 'Attendee', 'Active'),
+    (482, 'John', 'Howell', 'john.howell482@example.org', 'Organizer', 'Suspended'),
+    (483, 'Tammy', 'Fleming', 'tammy.fleming483@example.net', 'Admin', 'Suspended'),
+    (484, 'Laura', 'Rollins', 'laura.rollins484@example.org', 'Admin', 'Active'),
+    (485, 'Julie', 'Martin', 'julie.martin485@example.org', 'Organizer', 'Active'),
+    (486, 'Paula', 'Parker', 'paula.parker486@example.com', 'Admin', 'Suspended'),
+    (487, 'Kelly', 'Taylor', 'kelly.taylor487@example.com', 'Attendee', 'Suspended'),
+    (488, 'Nicole', 'Brown', 'nicole.brown488@example.org', 'Admin', 'Suspended'),
+    (489, 'Elizabeth', 'Lee', 'elizabeth.lee489@example.org', 'Attendee', 'Active'),
+    (490, 'Timothy', 'Lane', 'timothy.lane490@example.net', 'Attendee', 'Suspended'),
+    (491, 'Stephen', 'King', 'stephen.king491@example.net', 'Admin', 'Suspended'),
+    (492, 'Jason', 'Robertson', 'jason.robertson492@example.org', 'Admin', 'Suspended'),
+    (493, 'Jeffery', 'Freeman', 'jeffery.freeman493@example.net', 'Admin', 'Active'),
+    (494, 'Brett', 'Vance', 'brett.vance494@example.net', 'Organizer', 'Active'),
+    (495, 'Justin', 'Johnson', 'justin.johnson495@example.com', 'Admin', 'Suspended'),
+    (496, 'Steven', 'Mcneil', 'steven.mcneil496@example.org', 'Admin', 'Suspended'),
+    (497, 'John', 'Mitchell', 'john.mitchell497@example.net', 'Attendee', 'Suspended'),
+    (498, 'Casey', 'Brooks', 'casey.brooks498@example.org', 'Organizer', 'Active'),
+    (499, 'Thomas', 'Hamilton', 'thomas.hamilton499@example.org', 'Organizer', 'Suspended'),
+    (500, 'Justin', 'Brown', 'justin.brown500@example.com', 'Admin', 'Active');
 
 INSERT INTO `venue` (`venue_id`, `name`, `capacity`, `address`, `city`) VALUES
-    (101, 'Cibolo Community Center', 9055, '9327 Claudia Road', 'Cibolo'),
-    (102, 'San Marcos Park Pavilion', 5894, '57642 Williams Summit Suite 206', 'San Marcos'),
-    (103, 'Universal City Convention Hall', 5818, '76078 Zachary Mountains', 'Universal City'),
-    (104, 'Seguin Theater', 11192, '819 Foster Expressway', 'Seguin'),
-    (105, 'Cibolo Convention Hall', 6183, '3462 Green Green Suite 862', 'Cibolo'),
-    (106, 'Universal City Theater', 3257, '333 Robbins Lake Suite 430', 'Universal City'),
-    (107, 'Boerne Park Pavilion', 10997, '6994 Tonya Summit', 'Boerne'),
-    (108, 'Seguin Theater', 7078, '7889 Jason Ranch', 'Seguin'),
-    (109, 'New Braunfels Convention Hall', 10177, '4885 Jackson Springs Apt. 565', 'New Braunfels'),
-    (110, 'New Braunfels Park Pavilion', 1132, '697 Williams Plains Suite 705', 'New Braunfels'),
-    (111, 'Schertz Auditorium', 12103, '1278 Emma Plaza Suite 028', 'Schertz'),
-    (112, 'San Antonio Convention Hall', 11788, '2515 Moore Island Apt. 360', 'San Antonio'),
-    (113, 'San Marcos Park Pavilion', 8332, '25384 Scott Parkways Suite 077', 'San Marcos'),
-    (114, 'Boerne Convention Hall', 4150, '3329 Jimmy Mountains Apt. 909', 'Boerne'),
-    (115, 'New Braunfels Park Pavilion', 14447, '6510 Stewart Forks Suite 337', 'New Braunfels'),
-    (116, 'Universal City Community Center', 1744, '4683 Misty Forest Apt. 058', 'Universal City'),
-    (117, 'San Marcos Community Center', 9871, '286 Smith Cliffs', 'San Marcos'),
-    (118, 'Schertz Theater', 13298, '02415 Desiree Light Suite 375', 'Schertz'),
-    (119, 'Schertz Community Center', 10301, '9438 Yates Throughway', 'Schertz'),
-    (120, 'Universal City Park Pavilion', 4842, '941 Mcdowell Roads', 'Universal City'),
-    (121, 'Cibolo Auditorium', 1123, '42181 James Square', 'Cibolo'),
-    (122, 'New Braunfels Park Pavilion', 14759, '340 Rachel River', 'New Braunfels'),
-    (123, 'Schertz Convention Hall', 13141, '108 Pam Greens Apt. 424', 'Schertz'),
-    (124, 'Universal City Auditorium', 7271, '81451 Vargas Trail Suite 260', 'Universal City'),
-    (125, 'Boerne Theater', 12973, '172 Jones Views Apt. 983', 'Boerne'),
-    (126, 'New Braunfels Convention Hall', 9830, '21103 Jackson Branch', 'New Braunfels'),
-    (127, 'Schertz Convention Hall', 8635, '6453 Tammy Mill Suite 361', 'Schertz'),
-    (128, 'Cibolo Convention Hall', 4509, '57986 Schultz Summit Apt. 610', 'Cibolo'),
-    (129, 'Seguin Community Center', 12752, '858 Jason Stravenue Suite 392', 'Seguin'),
-    (130, 'San Marcos Community Center', 12570, '568 Angela Square Suite 798', 'San Marcos'),
-    (131, 'Cibolo Auditorium', 11018, '407 Erin Greens', 'Cibolo'),
-    (132, 'Boerne Auditorium', 8580, '26102 Juan Prairie Apt. 256', 'Boerne'),
-    (133, 'Boerne Auditorium', 966, '593 Glover Club Suite 544', 'Boerne'),
-    (134, 'Boerne Theater', 11109, '5642 Danielle Brooks Suite 538', 'Boerne'),
-    (135, 'Seguin Park Pavilion', 13331, '458 Ellis Centers', 'Seguin'),
-    (136, 'Schertz Theater', 2988, '62384 Holly Square Suite 922', 'Schertz'),
-    (137, 'Boerne Convention Hall', 12000, '74763 Wilson Spring', 'Boerne'),
-    (138, 'Boerne Theater', 8122, '312 Perkins Lights Apt. 518', 'Boerne'),
-    (139, 'Boerne Community Center', 9276, '29957 Robert Branch Apt. 271', 'Boerne'),
-    (140, 'Seguin Auditorium', 1862, '1162 Mary Cove', 'Seguin'),
-    (141, 'New Braunfels Auditorium', 8195, '41325 Rodriguez Crossing Suite 271', 'New Braunfels'),
-    (142, 'Universal City Auditorium', 5779, '25365 Alexander Lodge Suite 789', 'Universal City'),
-    (143, 'Boerne Community Center', 3398, '41082 Marks Rue', 'Boerne'),
-    (144, 'New Braunfels Convention Hall', 7630, '73216 Timothy Freeway', 'New Braunfels'),
-    (145, 'Cibolo Community Center', 9885, '20078 Karen Glens', 'Cibolo'),
-    (146, 'Schertz Theater', 5193, '6290 Kirk Estates', 'Schertz'),
-    (147, 'San Marcos Park Pavilion', 9634, '6648 Andrews Forest Suite 654', 'San Marcos'),
-    (148, 'Seguin Theater', 6167, '6199 Thornton Common Suite 261', 'Seguin'),
-    (149, 'Cibolo Auditorium', 5843, '06394 Jeffrey Junction', 'Cibolo'),
-    (150, 'Universal City Park Pavilion', 12978, '3033 Michael Knolls', 'Universal City');
+    (101, 'Schertz Community Center', 7900, '282 Scott Green', 'Schertz'),
+    (102, 'Seguin Convention Hall', 7193, '0900 Mccoy Prairie', 'Seguin'),
+    (103, 'Seguin Theater', 12622, '72346 Jason Ridge', 'Seguin'),
+    (104, 'Cibolo Community Center', 4932, '0994 Roberts Common', 'Cibolo'),
+    (105, 'Seguin Auditorium', 4085, '27281 Strong Stravenue Apt. 865', 'Seguin'),
+    (106, 'New Braunfels Community Center', 8225, '39595 Evans Village', 'New Braunfels'),
+    (107, 'Boerne Community Center', 2165, '91807 Young Way Suite 003', 'Boerne'),
+    (108, 'San Antonio Park Pavilion', 4597, '65887 Meghan Turnpike', 'San Antonio'),
+    (109, 'Schertz Community Center', 10783, '7546 Long Park', 'Schertz'),
+    (110, 'San Antonio Convention Hall', 11631, '10811 Burke Estate', 'San Antonio'),
+    (111, 'Cibolo Theater', 6421, '3062 Andrea Village', 'Cibolo'),
+    (112, 'Cibolo Community Center', 10231, '37824 Davidson Haven', 'Cibolo'),
+    (113, 'Cibolo Auditorium', 350, '799 Ramirez Road', 'Cibolo'),
+    (114, 'San Marcos Theater', 11176, '637 Richard Lodge', 'San Marcos'),
+    (115, 'Cibolo Community Center', 13114, '8080 Cox Underpass', 'Cibolo'),
+    (116, 'Seguin Park Pavilion', 7719, '385 Castro Drives Suite 494', 'Seguin'),
+    (117, 'San Antonio Community Center', 13751, '73213 Smith Track Suite 229', 'San Antonio'),
+    (118, 'Boerne Theater', 14443, '6979 Ward Throughway Suite 913', 'Boerne'),
+    (119, 'Seguin Convention Hall', 7568, '339 Jennifer Trafficway Apt. 563', 'Seguin'),
+    (120, 'San Antonio Community Center', 12490, '059 Katherine Canyon Suite 987', 'San Antonio'),
+    (121, 'Seguin Park Pavilion', 9472, '55661 Ralph Wells', 'Seguin'),
+    (122, 'San Antonio Community Center', 11024, '3743 Christina Radial Suite 265', 'San Antonio'),
+    (123, 'San Antonio Park Pavilion', 1208, '04218 Julie Streets', 'San Antonio'),
+    (124, 'Boerne Park Pavilion', 7133, '9400 Alvarado Summit', 'Boerne'),
+    (125, 'Cibolo Auditorium', 8098, '713 Patricia Forge', 'Cibolo'),
+    (126, 'Cibolo Auditorium', 3471, '311 Jasmine Flats', 'Cibolo'),
+    (127, 'Universal City Auditorium', 4532, '16780 Smith Bridge', 'Universal City'),
+    (128, 'Schertz Community Center', 12189, '764 Sergio Lakes Suite 861', 'Schertz'),
+    (129, 'Boerne Auditorium', 4070, '14591 Chase Passage', 'Boerne'),
+    (130, 'Universal City Convention Hall', 14790, '8861 Patrick Divide', 'Universal City'),
+    (131, 'Schertz Park Pavilion', 12162, '7962 Michael View Suite 805', 'Schertz'),
+    (132, 'San Marcos Convention Hall', 12505, '10681 Robert Greens Suite 007', 'San Marcos'),
+    (133, 'San Antonio Community Center', 5806, '03987 Richard Fords Apt. 226', 'San Antonio'),
+    (134, 'San Marcos Convention Hall', 1500, '872 Barrett Field Apt. 104', 'San Marcos'),
+    (135, 'San Marcos Auditorium', 4922, '426 Thomas Plains Apt. 896', 'San Marcos'),
+    (136, 'Boerne Community Center', 7660, '21446 Brooks Parkways', 'Boerne'),
+    (137, 'New Braunfels Park Pavilion', 6514, '6482 Taylor Neck Suite 820', 'New Braunfels'),
+    (138, 'Boerne Park Pavilion', 12527, '83431 Matthew River Apt. 660', 'Boerne'),
+    (139, 'Seguin Park Pavilion', 11596, '72845 Wang Shoals Suite 484', 'Seguin'),
+    (140, 'New Braunfels Convention Hall', 2550, '95303 Brown Square', 'New Braunfels'),
+    (141, 'San Marcos Community Center', 11807, '998 Smith Courts', 'San Marcos'),
+    (142, 'Universal City Park Pavilion', 14321, '096 Danielle Glens', 'Universal City'),
+    (143, 'Universal City Convention Hall', 2379, '8120 Matthew Isle', 'Universal City'),
+    (144, 'Seguin Community Center', 12566, '8314 Matthew Plaza Apt. 170', 'Seguin'),
+    (145, 'Universal City Theater', 2691, '49719 Cooper Fields', 'Universal City'),
+    (146, 'Seguin Community Center', 2495, '2708 Donna Via', 'Seguin'),
+    (147, 'San Antonio Auditorium', 4602, '75518 Riley Forks Apt. 676', 'San Antonio'),
+    (148, 'San Antonio Auditorium', 6339, '69351 Alexander Way Apt. 440', 'San Antonio'),
+    (149, 'San Marcos Theater', 7847, '095 Henderson Extensions Suite 951', 'San Marcos'),
+    (150, 'Boerne Convention Hall', 4922, '85905 Cox Islands', 'Boerne');
 
 INSERT INTO `category` (`category_id`, `name`) VALUES
     (1, 'Music'),
@@ -565,3596 +565,4737 @@ INSERT INTO `category` (`category_id`, `name`) VALUES
     (8, 'Exhibition');
 
 INSERT INTO `event` (`event_id`, `organizer_id`, `venue_id`, `title`, `description`, `start_time`, `end_time`, `capacity`, `status`) VALUES
-    (1001, 316, 134, 'Public-key leadingedge software Festival', 'Join us for Public-key leadingedge software Festival, a premier event in the heart of San Antonio! Firm mean concern direction former ahead cover must. Eight might Congress various factor off head. Th', '2026-06-25 12:05:51', '2026-06-25 15:05:51', 9278, 'Published'),
-    (1002, 324, 139, 'Robust motivating superstructure Festival', 'Join us for Robust motivating superstructure Festival, a premier event in the heart of San Antonio! Style again thought woman. Green build moment recent right nor anything. Chance quickly born Congres', '2024-12-07 08:04:03', '2024-12-07 10:04:03', 6939, 'Completed'),
-    (1003, 308, 117, 'Cross-platform 4thgeneration knowledgebase Festival', 'Join us for Cross-platform 4thgeneration knowledgebase Festival, a premier event in the heart of San Antonio! First animal to director. Few represent task election. Organization far ten which. Through', '2026-05-11 01:05:49', '2026-05-11 03:05:49', 1313, 'Published'),
-    (1004, 472, 132, 'Switchable radical success Festival', 'Join us for Switchable radical success Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill levels ', '2026-01-13 13:49:15', '2026-01-13 20:49:15', 1268, 'Published'),
-    (1005, 55, 115, 'Secured user-facing info-mediaries Festival', 'Join us for Secured user-facing info-mediaries Festival, a premier event in the heart of San Antonio! Article unit window land newspaper message board. Thought several trade chair accept key.', '2026-05-28 10:43:14', '2026-05-28 16:43:14', 11713, 'Canceled'),
-    (1006, 135, 136, 'Team-oriented mobile capability Festival', 'Join us for Team-oriented mobile capability Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. P', '2026-12-27 22:29:58', '2026-12-28 04:29:58', 2350, 'Canceled'),
-    (1007, 249, 112, 'Progressive upward-trending application Festival', 'Join us for Progressive upward-trending application Festival, a premier event in the heart of San Antonio! Teacher mean yeah that prove.', '2026-04-08 22:06:16', '2026-04-09 03:06:16', 1413, 'Draft'),
-    (1008, 249, 139, 'Profound multimedia frame Festival', 'Join us for Profound multimedia frame Festival, a premier event in the heart of San Antonio! At discussion skin effect create. Affect wrong whole serious science speak. Can ahead year voice everybody ', '2026-05-13 16:36:01', '2026-05-13 23:36:01', 859, 'Published'),
-    (1009, 353, 105, 'Reverse-engineered encompassing adapter Festival', 'Join us for Reverse-engineered encompassing adapter Festival, a premier event in the heart of San Antonio! Oil couple rise certain. Concern well along carry clearly almost. Current write wonder measur', '2027-02-09 09:35:50', '2027-02-09 13:35:50', 4111, 'Draft'),
-    (1010, 30, 105, 'Business-focused intermediate core Festival', 'Join us for Business-focused intermediate core Festival, a premier event in the heart of San Antonio! Miss doctor reach whose industry everyone property. Perhaps teach behavior. Minute degree state co', '2027-02-06 07:30:06', '2027-02-06 12:30:06', 2764, 'Draft'),
-    (1011, 69, 126, 'Optimized didactic budgetary management Festival', 'Join us for Optimized didactic budgetary management Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical', '2026-02-08 01:18:42', '2026-02-08 05:18:42', 8303, 'Canceled'),
-    (1012, 319, 103, 'Cloned directional groupware Festival', 'Join us for Cloned directional groupware Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. Perf', '2026-08-17 04:18:24', '2026-08-17 08:18:24', 1442, 'Published'),
-    (1013, 498, 146, 'Reverse-engineered 24hour Graphic Interface Festival', 'Join us for Reverse-engineered 24hour Graphic Interface Festival, a premier event in the heart of San Antonio! Guess amount raise from expect space. Heavy discover either successful floor.', '2026-03-05 19:04:57', '2026-03-06 01:04:57', 795, 'Published'),
-    (1014, 98, 137, 'Seamless zero administration concept Festival', 'Join us for Seamless zero administration concept Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical ac', '2027-04-27 14:13:08', '2027-04-27 16:13:08', 7458, 'Published'),
-    (1015, 47, 141, 'Triple-buffered 6thgeneration open architecture Festival', 'Join us for Triple-buffered 6thgeneration open architecture Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs an', '2026-05-19 15:57:48', '2026-05-19 18:57:48', 1871, 'Published'),
-    (1016, 25, 129, 'Front-line methodical solution Festival', 'Join us for Front-line methodical solution Festival, a premier event in the heart of San Antonio! Learn view apply specific world five. Size field right former else mind three. Good what little style ', '2027-09-28 11:48:26', '2027-09-28 18:48:26', 1808, 'Published'),
-    (1017, 164, 149, 'Organized incremental Graphic Interface Festival', 'Join us for Organized incremental Graphic Interface Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical', '2026-08-27 14:58:45', '2026-08-27 16:58:45', 879, 'Published'),
-    (1018, 495, 150, 'Digitized encompassing algorithm Festival', 'Join us for Digitized encompassing algorithm Festival, a premier event in the heart of San Antonio! Rest beat large bit. Together yard great war look language administration. Produce without argue sid', '2026-02-07 19:11:54', '2026-02-08 01:11:54', 6750, 'Draft'),
-    (1019, 44, 118, 'Innovative bandwidth-monitored framework Festival', 'Join us for Innovative bandwidth-monitored framework Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on music and digital marketing. Bring y', '2026-02-12 09:38:09', '2026-02-12 16:38:09', 10452, 'Published'),
-    (1020, 103, 139, 'Persevering foreground methodology Festival', 'Join us for Persevering foreground methodology Festival, a premier event in the heart of San Antonio! Air reflect who whose measure. Simple wall tonight development owner month.', '2027-02-28 21:13:56', '2027-03-01 01:13:56', 4351, 'Published'),
-    (1021, 426, 120, 'Multi-lateral encompassing groupware Festival', 'Join us for Multi-lateral encompassing groupware Festival, a premier event in the heart of San Antonio! Member skill practice end decade care. Featuring local bands, rising stars, and a dynamic sound ', '2026-03-24 21:41:23', '2026-03-25 03:41:23', 177, 'Published'),
-    (1022, 223, 131, 'Advanced stable migration Festival', 'Join us for Advanced stable migration Festival, a premier event in the heart of San Antonio! Sit assume adult trip would head. Man should five value outside already both.', '2025-02-02 07:47:49', '2025-02-02 09:47:49', 7167, 'Draft'),
-    (1023, 353, 121, 'Robust 4thgeneration hierarchy Festival', 'Join us for Robust 4thgeneration hierarchy Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s ', '2027-10-31 11:30:25', '2027-10-31 17:30:25', 146, 'Published'),
-    (1024, 171, 109, 'Open-architected multi-tasking capacity Festival', 'Join us for Open-architected multi-tasking capacity Festival, a premier event in the heart of San Antonio! Interest star mention million effort same along. Meet send high figure before increase return', '2027-09-26 20:30:15', '2027-09-27 04:30:15', 1692, 'Published'),
-    (1025, 340, 131, 'Optimized 3rdgeneration attitude Festival', 'Join us for Optimized 3rdgeneration attitude Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''', '2026-07-02 16:28:01', '2026-07-02 23:28:01', 5480, 'Draft'),
-    (1026, 108, 112, 'Phased uniform encryption Festival', 'Join us for Phased uniform encryption Festival, a premier event in the heart of San Antonio! Third local red her. When send friend age this develop season future. Already allow when with art region.', '2026-10-08 13:56:44', '2026-10-08 15:56:44', 1114, 'Draft'),
-    (1027, 303, 127, 'Balanced disintermediate artificial intelligence Festival', 'Join us for Balanced disintermediate artificial intelligence Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning t', '2025-05-10 20:35:04', '2025-05-11 02:35:04', 2138, 'Completed'),
-    (1028, 50, 104, 'Profound discrete conglomeration Festival', 'Join us for Profound discrete conglomeration Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. ', '2025-08-30 04:54:09', '2025-08-30 07:54:09', 7554, 'Draft'),
-    (1029, 419, 108, 'Function-based 3rdgeneration help-desk Festival', 'Join us for Function-based 3rdgeneration help-desk Festival, a premier event in the heart of San Antonio! Bag author conference good. There available avoid later marriage music two test. Collection ho', '2027-08-15 21:23:07', '2027-08-15 23:23:07', 4072, 'Published'),
-    (1030, 186, 144, 'Adaptive cohesive solution Festival', 'Join us for Adaptive cohesive solution Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Limite', '2025-07-11 13:41:42', '2025-07-11 19:41:42', 987, 'Draft'),
-    (1031, 461, 133, 'User-friendly scalable ability Festival', 'Join us for User-friendly scalable ability Festival, a premier event in the heart of San Antonio! Community price focus body note because song risk tend network. Featuring local bands, rising stars, a', '2026-05-27 08:32:54', '2026-05-27 11:32:54', 864, 'Canceled'),
-    (1032, 60, 114, 'Distributed local encoding Festival', 'Join us for Distributed local encoding Festival, a premier event in the heart of San Antonio! Letter during should team ask change stock. Step media edge. Past instead ever keep.', '2026-07-07 11:04:46', '2026-07-07 18:04:46', 2520, 'Published'),
-    (1033, 44, 141, 'Fundamental contextually-based workforce Festival', 'Join us for Fundamental contextually-based workforce Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food ', '2024-12-22 18:35:44', '2024-12-23 02:35:44', 981, 'Draft'),
-    (1034, 13, 101, 'Face-to-face holistic alliance Festival', 'Join us for Face-to-face holistic alliance Festival, a premier event in the heart of San Antonio! Within example development camera the stand. Take state society activity force. Finally month its diff', '2027-04-08 20:02:45', '2027-04-09 00:02:45', 7896, 'Draft'),
-    (1035, 472, 143, 'Stand-alone scalable functionalities Festival', 'Join us for Stand-alone scalable functionalities Festival, a premier event in the heart of San Antonio! Minute cell agree per usually five. Need wall draw such son.', '2027-01-16 13:36:58', '2027-01-16 20:36:58', 2301, 'Published'),
-    (1036, 245, 140, 'Versatile content-based Graphic Interface Festival', 'Join us for Versatile content-based Graphic Interface Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatric', '2027-09-24 22:22:41', '2027-09-25 04:22:41', 1465, 'Draft'),
-    (1037, 238, 112, 'Customizable composite orchestration Festival', 'Join us for Customizable composite orchestration Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All ski', '2026-03-01 05:54:33', '2026-03-01 10:54:33', 6471, 'Canceled'),
-    (1038, 393, 112, 'Reduced background task-force Festival', 'Join us for Reduced background task-force Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on raise and digital marketing. Bring your laptop ', '2027-07-19 06:06:54', '2027-07-19 12:06:54', 9308, 'Published'),
-    (1039, 411, 101, 'Enterprise-wide leadingedge secured line Festival', 'Join us for Enterprise-wide leadingedge secured line Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food ', '2027-04-24 02:39:25', '2027-04-24 06:39:25', 6501, 'Draft'),
-    (1040, 478, 126, 'User-centric hybrid budgetary management Festival', 'Join us for User-centric hybrid budgetary management Festival, a premier event in the heart of San Antonio! Sort approach letter force name become leader hand front spend two dog wonder. Featuring loc', '2027-08-07 03:26:45', '2027-08-07 10:26:45', 5896, 'Published'),
-    (1041, 446, 107, 'Front-line explicit capability Festival', 'Join us for Front-line explicit capability Festival, a premier event in the heart of San Antonio! Race share develop these. Reveal town local should expert meeting. Throw if answer tough field since c', '2027-11-05 14:54:00', '2027-11-05 19:54:00', 9863, 'Published'),
-    (1042, 426, 110, 'Optional 24hour budgetary management Festival', 'Join us for Optional 24hour budgetary management Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical ac', '2027-08-08 22:05:44', '2027-08-09 02:05:44', 840, 'Published'),
-    (1043, 55, 149, 'Organized local help-desk Festival', 'Join us for Organized local help-desk Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s focus', '2027-02-16 01:56:42', '2027-02-16 03:56:42', 2663, 'Published'),
-    (1044, 250, 148, 'Team-oriented zero administration standardization Festival', 'Join us for Team-oriented zero administration standardization Festival, a premier event in the heart of San Antonio! Decision set all notice open special into. Surface plant subject national. Approach', '2027-08-17 05:49:03', '2027-08-17 08:49:03', 3571, 'Canceled'),
-    (1045, 219, 108, 'Customer-focused modular circuit Festival', 'Join us for Customer-focused modular circuit Festival, a premier event in the heart of San Antonio! Reality member week energy close job will available determine these expert we picture. Featuring loc', '2026-11-11 05:42:36', '2026-11-11 07:42:36', 6291, 'Canceled'),
-    (1046, 102, 111, 'Implemented demand-driven challenge Festival', 'Join us for Implemented demand-driven challenge Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on idea and digital marketing. Bring your la', '2025-03-30 05:48:50', '2025-03-30 08:48:50', 7073, 'Completed'),
-    (1047, 415, 108, 'Robust 24hour open architecture Festival', 'Join us for Robust 24hour open architecture Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. L', '2025-10-12 14:09:03', '2025-10-12 17:09:03', 982, 'Completed'),
-    (1048, 461, 130, 'Optimized next generation Local Area Network Festival', 'Join us for Optimized next generation Local Area Network Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on upon and digital marketing. Brin', '2027-09-23 05:59:35', '2027-09-23 07:59:35', 6947, 'Published'),
-    (1049, 361, 140, 'Enterprise-wide dedicated flexibility Festival', 'Join us for Enterprise-wide dedicated flexibility Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food tru', '2025-10-02 21:17:34', '2025-10-03 02:17:34', 387, 'Completed'),
-    (1050, 388, 104, 'Centralized fresh-thinking knowledge user Festival', 'Join us for Centralized fresh-thinking knowledge user Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. T', '2027-03-17 04:44:22', '2027-03-17 11:44:22', 2991, 'Published'),
-    (1051, 269, 139, 'Organic encompassing workforce Festival', 'Join us for Organic encompassing workforce Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Li', '2026-10-13 04:34:06', '2026-10-13 07:34:06', 2186, 'Draft'),
-    (1052, 438, 121, 'Secured multimedia customer loyalty Festival', 'Join us for Secured multimedia customer loyalty Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food truck', '2025-02-26 05:07:25', '2025-02-26 12:07:25', 921, 'Completed'),
-    (1053, 20, 121, 'Re-contextualized human-resource matrices Festival', 'Join us for Re-contextualized human-resource matrices Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatric', '2026-12-04 02:42:40', '2026-12-04 07:42:40', 470, 'Published'),
-    (1054, 379, 146, 'Public-key incremental productivity Festival', 'Join us for Public-key incremental productivity Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical act', '2026-06-02 14:48:19', '2026-06-02 19:48:19', 3417, 'Published'),
-    (1055, 9, 142, 'Assimilated maximized implementation Festival', 'Join us for Assimilated maximized implementation Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on easy and digital marketing. Bring your l', '2027-08-21 09:13:09', '2027-08-21 14:13:09', 696, 'Canceled'),
-    (1056, 456, 132, 'Object-based solution-oriented intranet Festival', 'Join us for Object-based solution-oriented intranet Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical', '2027-09-23 17:10:07', '2027-09-24 01:10:07', 163, 'Published'),
-    (1057, 250, 149, 'Synergized intangible utilization Festival', 'Join us for Synergized intangible utilization Festival, a premier event in the heart of San Antonio! Particular every magazine serious rise different. Animal firm tough impact add field tonight. Stude', '2026-01-21 04:58:35', '2026-01-21 07:58:35', 4639, 'Draft'),
-    (1058, 250, 113, 'Re-contextualized next generation definition Festival', 'Join us for Re-contextualized next generation definition Festival, a premier event in the heart of San Antonio! Quality individual day child prepare daughter cover work realize matter whom out forget.', '2027-10-09 06:40:45', '2027-10-09 12:40:45', 5121, 'Published'),
-    (1059, 379, 104, 'Exclusive object-oriented info-mediaries Festival', 'Join us for Exclusive object-oriented info-mediaries Festival, a premier event in the heart of San Antonio! Gas war tell likely local radio race they should available better produce major. Featuring l', '2025-07-23 17:04:47', '2025-07-23 20:04:47', 5540, 'Completed'),
-    (1060, 55, 146, 'Mandatory radical structure Festival', 'Join us for Mandatory radical structure Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s foc', '2026-07-09 18:44:44', '2026-07-10 02:44:44', 3630, 'Published'),
-    (1061, 107, 128, 'Seamless solution-oriented circuit Festival', 'Join us for Seamless solution-oriented circuit Festival, a premier event in the heart of San Antonio! Opportunity second particular society. Capital measure similar town key. Behind television strateg', '2026-06-15 13:32:10', '2026-06-15 19:32:10', 661, 'Published'),
-    (1062, 235, 101, 'Configurable tangible info-mediaries Festival', 'Join us for Configurable tangible info-mediaries Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical ac', '2027-07-14 09:15:28', '2027-07-14 16:15:28', 7567, 'Published'),
-    (1063, 366, 129, 'Monitored user-facing open architecture Festival', 'Join us for Monitored user-facing open architecture Festival, a premier event in the heart of San Antonio! Stand season nothing close least. Quite task yard interest certainly. Think design new.', '2027-01-12 10:23:01', '2027-01-12 15:23:01', 5399, 'Published'),
-    (1064, 348, 147, 'Phased client-driven projection Festival', 'Join us for Phased client-driven projection Festival, a premier event in the heart of San Antonio! Growth husband indicate list range tax. Me care kid too PM.', '2024-11-18 04:29:15', '2024-11-18 12:29:15', 7408, 'Completed'),
-    (1065, 275, 146, 'Team-oriented 3rdgeneration emulation Festival', 'Join us for Team-oriented 3rdgeneration emulation Festival, a premier event in the heart of San Antonio! Yet growth possible industry open ability. Prepare hospital decade new. Fear professor movement', '2025-04-23 23:27:30', '2025-04-24 07:27:30', 294, 'Completed'),
-    (1066, 456, 133, 'De-engineered mobile knowledgebase Festival', 'Join us for De-engineered mobile knowledgebase Festival, a premier event in the heart of San Antonio! Many hair former against enjoy another raise participant simple attention. Featuring local bands, ', '2025-02-13 15:08:20', '2025-02-13 18:08:20', 865, 'Draft'),
-    (1067, 472, 124, 'Multi-lateral empowering policy Festival', 'Join us for Multi-lateral empowering policy Festival, a premier event in the heart of San Antonio! Stop may wide participant together act democratic. Plan low budget participant. Message wish public l', '2025-03-09 10:56:12', '2025-03-09 14:56:12', 352, 'Completed'),
-    (1068, 186, 131, 'Reverse-engineered content-based orchestration Festival', 'Join us for Reverse-engineered content-based orchestration Festival, a premier event in the heart of San Antonio! Ask anything chair create eight movement. Name magazine without Mrs others.', '2025-07-10 23:45:45', '2025-07-11 04:45:45', 7678, 'Completed'),
-    (1069, 172, 132, 'Multi-channeled zero tolerance collaboration Festival', 'Join us for Multi-channeled zero tolerance collaboration Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations', '2026-12-22 00:46:50', '2026-12-22 02:46:50', 6324, 'Published'),
-    (1070, 70, 127, 'Reverse-engineered foreground neural-net Festival', 'Join us for Reverse-engineered foreground neural-net Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All', '2027-08-10 19:31:04', '2027-08-11 02:31:04', 112, 'Canceled'),
-    (1071, 191, 138, 'Optimized fault-tolerant alliance Festival', 'Join us for Optimized fault-tolerant alliance Festival, a premier event in the heart of San Antonio! Three situation paper nothing church reality TV defense watch ground first produce. Featuring local', '2025-07-22 18:18:16', '2025-07-23 02:18:16', 1011, 'Completed'),
-    (1072, 500, 107, 'Customer-focused upward-trending secured line Festival', 'Join us for Customer-focused upward-trending secured line Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run', '2027-07-11 00:51:10', '2027-07-11 02:51:10', 5876, 'Published'),
-    (1073, 275, 140, 'Face-to-face modular complexity Festival', 'Join us for Face-to-face modular complexity Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on development and digital marketing. Bring your', '2025-03-15 13:44:43', '2025-03-15 20:44:43', 1233, 'Completed'),
-    (1074, 453, 114, 'Horizontal needs-based protocol Festival', 'Join us for Horizontal needs-based protocol Festival, a premier event in the heart of San Antonio! Happy soon vote. Tough ground join number.', '2027-04-25 03:32:43', '2027-04-25 09:32:43', 2662, 'Published'),
-    (1075, 154, 123, 'Cross-platform dedicated migration Festival', 'Join us for Cross-platform dedicated migration Festival, a premier event in the heart of San Antonio! Moment consider agreement pretty his usually law American family argue. Featuring local bands, ris', '2025-02-13 07:43:05', '2025-02-13 10:43:05', 10301, 'Completed'),
-    (1076, 490, 147, 'Extended static knowledge user Festival', 'Join us for Extended static knowledge user Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. Pe', '2027-08-23 15:24:03', '2027-08-23 20:24:03', 3249, 'Published'),
-    (1077, 30, 131, 'Seamless client-server software Festival', 'Join us for Seamless client-server software Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill le', '2026-12-08 14:33:17', '2026-12-08 18:33:17', 2036, 'Published'),
-    (1078, 4, 114, 'Fully-configurable coherent concept Festival', 'Join us for Fully-configurable coherent concept Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This ye', '2026-01-27 14:56:12', '2026-01-27 18:56:12', 1636, 'Published'),
-    (1079, 164, 118, 'Integrated attitude-oriented product Festival', 'Join us for Integrated attitude-oriented product Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food truc', '2027-09-10 18:22:13', '2027-09-11 01:22:13', 706, 'Published'),
-    (1080, 256, 130, 'Decentralized multi-tasking knowledge user Festival', 'Join us for Decentralized multi-tasking knowledge user Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and foo', '2025-12-29 23:17:14', '2025-12-30 05:17:14', 5092, 'Published'),
-    (1081, 376, 141, 'Business-focused system-worthy synergy Festival', 'Join us for Business-focused system-worthy synergy Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All s', '2025-03-08 02:59:47', '2025-03-08 09:59:47', 3424, 'Completed'),
-    (1082, 72, 117, 'Organized attitude-oriented project Festival', 'Join us for Organized attitude-oriented project Festival, a premier event in the heart of San Antonio! Pass free to decide positive sort. Featuring local bands, rising stars, and a dynamic sound syste', '2026-08-26 22:48:10', '2026-08-27 01:48:10', 4281, 'Published'),
-    (1083, 73, 120, 'Inverse 6thgeneration alliance Festival', 'Join us for Inverse 6thgeneration alliance Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s ', '2026-02-17 18:58:39', '2026-02-18 02:58:39', 1680, 'Canceled'),
-    (1084, 437, 129, 'Cross-platform multimedia ability Festival', 'Join us for Cross-platform multimedia ability Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks.', '2026-08-13 19:15:38', '2026-08-13 22:15:38', 3581, 'Published'),
-    (1085, 453, 147, 'Optional content-based firmware Festival', 'Join us for Optional content-based firmware Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. P', '2026-03-16 23:52:12', '2026-03-17 05:52:12', 4934, 'Draft'),
-    (1086, 73, 144, 'Organic multimedia implementation Festival', 'Join us for Organic multimedia implementation Festival, a premier event in the heart of San Antonio! Attention agreement feel alone per good picture. Yourself at tonight join he next put. Drug differe', '2026-08-28 07:39:37', '2026-08-28 11:39:37', 2220, 'Published'),
-    (1087, 125, 139, 'Expanded motivating product Festival', 'Join us for Expanded motivating product Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on son and digital marketing. Bring your laptop and ', '2025-06-21 20:57:25', '2025-06-21 22:57:25', 8177, 'Completed'),
-    (1088, 243, 108, 'Cross-group modular pricing structure Festival', 'Join us for Cross-group modular pricing structure Festival, a premier event in the heart of San Antonio! On away community measure study near. What investment series red agent early particularly befor', '2025-02-26 01:40:06', '2025-02-26 05:40:06', 1719, 'Completed'),
-    (1089, 315, 122, 'Reactive zero tolerance framework Festival', 'Join us for Reactive zero tolerance framework Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks.', '2027-09-30 02:17:48', '2027-09-30 10:17:48', 4644, 'Canceled'),
-    (1090, 304, 117, 'Multi-lateral clear-thinking emulation Festival', 'Join us for Multi-lateral clear-thinking emulation Festival, a premier event in the heart of San Antonio! Realize past sea available raise approach myself line. Letter same public deal finally. His re', '2027-11-13 17:43:21', '2027-11-14 01:43:21', 8352, 'Published'),
-    (1091, 320, 134, 'Grass-roots human-resource emulation Festival', 'Join us for Grass-roots human-resource emulation Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All ski', '2026-06-03 00:52:34', '2026-06-03 04:52:34', 7046, 'Published'),
-    (1092, 47, 135, 'Front-line 3rdgeneration extranet Festival', 'Join us for Front-line 3rdgeneration extranet Festival, a premier event in the heart of San Antonio! Source hand window may. Property health better real. Security affect though strong need determine r', '2027-11-12 13:00:29', '2027-11-12 16:00:29', 8925, 'Published'),
-    (1093, 438, 106, 'Implemented fresh-thinking definition Festival', 'Join us for Implemented fresh-thinking definition Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food tru', '2024-11-18 23:00:15', '2024-11-19 02:00:15', 2913, 'Completed'),
-    (1094, 172, 119, 'Customizable secondary secured line Festival', 'Join us for Customizable secondary secured line Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skil', '2027-05-25 17:54:36', '2027-05-25 22:54:36', 4322, 'Published'),
-    (1095, 235, 110, 'Triple-buffered local artificial intelligence Festival', 'Join us for Triple-buffered local artificial intelligence Festival, a premier event in the heart of San Antonio! Reduce respond appear fast day chair perform.', '2027-04-14 13:48:11', '2027-04-14 16:48:11', 569, 'Published'),
-    (1096, 232, 134, 'Polarized solution-oriented core Festival', 'Join us for Polarized solution-oriented core Festival, a premier event in the heart of San Antonio! Difference appear toward attack how role design continue recently draw give account build. Featuring', '2025-01-21 15:13:15', '2025-01-21 20:13:15', 6899, 'Completed'),
-    (1097, 315, 111, 'Multi-tiered zero administration core Festival', 'Join us for Multi-tiered zero administration core Festival, a premier event in the heart of San Antonio! Positive task or game science. The stay often Mrs.', '2027-06-03 00:10:14', '2027-06-03 04:10:14', 4214, 'Draft'),
-    (1098, 128, 117, 'Open-source 4thgeneration capability Festival', 'Join us for Open-source 4thgeneration capability Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical ac', '2026-10-04 23:46:35', '2026-10-05 07:46:35', 5387, 'Published'),
-    (1099, 169, 128, 'Cloned global paradigm Festival', 'Join us for Cloned global paradigm Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill levels welc', '2026-01-13 23:00:47', '2026-01-14 07:00:47', 1458, 'Published'),
-    (1100, 444, 111, 'Balanced leadingedge array Festival', 'Join us for Balanced leadingedge array Festival, a premier event in the heart of San Antonio! Day occur fact college third go stuff. Piece week news military the mind yes. Easy paper serious mouth rec', '2025-06-30 08:20:58', '2025-06-30 11:20:58', 2620, 'Completed'),
-    (1101, 434, 134, 'Realigned executive encoding Festival', 'Join us for Realigned executive encoding Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. Perf', '2027-05-11 15:14:18', '2027-05-11 20:14:18', 9022, 'Published'),
-    (1102, 404, 149, 'Enterprise-wide transitional orchestration Festival', 'Join us for Enterprise-wide transitional orchestration Festival, a premier event in the heart of San Antonio! Happy task to president develop compare.', '2026-12-06 00:06:56', '2026-12-06 05:06:56', 3746, 'Draft'),
-    (1103, 319, 146, 'Balanced multimedia synergy Festival', 'Join us for Balanced multimedia synergy Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill levels', '2025-03-07 18:57:14', '2025-03-08 00:57:14', 3386, 'Completed'),
-    (1104, 1, 138, 'Future-proofed 3rdgeneration orchestration Festival', 'Join us for Future-proofed 3rdgeneration orchestration Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatri', '2026-07-15 19:28:28', '2026-07-16 02:28:28', 2817, 'Published'),
-    (1105, 366, 141, 'Intuitive encompassing artificial intelligence Festival', 'Join us for Intuitive encompassing artificial intelligence Festival, a premier event in the heart of San Antonio! Many institution would major usually worry guy. If him picture subject property animal', '2027-04-21 15:22:40', '2027-04-21 17:22:40', 5315, 'Published'),
-    (1106, 297, 144, 'Horizontal human-resource concept Festival', 'Join us for Horizontal human-resource concept Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on TV and digital marketing. Bring your laptop', '2027-05-24 20:04:32', '2027-05-25 01:04:32', 567, 'Published'),
-    (1107, 154, 121, 'Ameliorated 24hour artificial intelligence Festival', 'Join us for Ameliorated 24hour artificial intelligence Festival, a premier event in the heart of San Antonio! Effort big medical. Treat itself per just activity heart.', '2027-02-11 18:02:12', '2027-02-12 01:02:12', 593, 'Published'),
-    (1108, 319, 105, 'Grass-roots actuating structure Festival', 'Join us for Grass-roots actuating structure Festival, a premier event in the heart of San Antonio! Leader quite message country physical play young. Mind during style newspaper forget his. Build wife ', '2025-12-27 16:13:06', '2025-12-27 22:13:06', 5055, 'Published'),
-    (1109, 353, 140, 'Mandatory needs-based product Festival', 'Join us for Mandatory needs-based product Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. Per', '2026-03-30 02:03:45', '2026-03-30 06:03:45', 647, 'Canceled'),
-    (1110, 434, 104, 'Operative value-added monitoring Festival', 'Join us for Operative value-added monitoring Festival, a premier event in the heart of San Antonio! Hospital hundred day. Again boy large me do economic resource phone. Center bad response religious.', '2025-12-27 17:59:21', '2025-12-27 22:59:21', 7745, 'Draft'),
-    (1111, 244, 113, 'Virtual eco-centric archive Festival', 'Join us for Virtual eco-centric archive Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on pay and digital marketing. Bring your laptop and ', '2027-02-25 05:13:32', '2027-02-25 10:13:32', 6937, 'Published'),
-    (1112, 376, 114, 'Business-focused optimizing artificial intelligence Festival', 'Join us for Business-focused optimizing artificial intelligence Festival, a premier event in the heart of San Antonio! Would that every occur field dream view point cell. Featuring local bands, rising', '2026-06-18 10:48:33', '2026-06-18 18:48:33', 3705, 'Published'),
-    (1113, 219, 118, 'Vision-oriented responsive utilization Festival', 'Join us for Vision-oriented responsive utilization Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food tr', '2027-05-12 19:33:15', '2027-05-12 21:33:15', 10671, 'Published'),
-    (1114, 434, 141, 'Multi-channeled national challenge Festival', 'Join us for Multi-channeled national challenge Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts', '2025-09-02 12:36:05', '2025-09-02 18:36:05', 6049, 'Draft'),
-    (1115, 20, 133, 'Fundamental didactic intranet Festival', 'Join us for Fundamental didactic intranet Festival, a premier event in the heart of San Antonio! Improve we car low stuff goal second brother specific single. Featuring local bands, rising stars, and ', '2026-03-18 07:04:14', '2026-03-18 11:04:14', 166, 'Published'),
-    (1116, 18, 114, 'Object-based motivating protocol Festival', 'Join us for Object-based motivating protocol Festival, a premier event in the heart of San Antonio! Color point stop alone can Republican. Wait fact relate give. Shoulder across threat resource total ', '2026-08-08 14:13:18', '2026-08-08 19:13:18', 3070, 'Canceled'),
-    (1117, 8, 145, 'Synchronized heuristic moratorium Festival', 'Join us for Synchronized heuristic moratorium Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year', '2025-01-10 23:07:10', '2025-01-11 03:07:10', 8458, 'Completed'),
-    (1118, 281, 138, 'Re-contextualized empowering archive Festival', 'Join us for Re-contextualized empowering archive Festival, a premier event in the heart of San Antonio! Growth seat he collection such drive home process lawyer course many month use. Featuring local ', '2027-04-07 02:25:15', '2027-04-07 10:25:15', 5444, 'Published'),
-    (1119, 500, 112, 'Innovative 6thgeneration knowledge user Festival', 'Join us for Innovative 6thgeneration knowledge user Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. Thi', '2025-02-08 01:31:59', '2025-02-08 05:31:59', 7045, 'Completed'),
-    (1120, 147, 142, 'Assimilated clear-thinking capacity Festival', 'Join us for Assimilated clear-thinking capacity Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This ye', '2025-04-28 11:08:08', '2025-04-28 16:08:08', 139, 'Draft'),
-    (1121, 253, 111, 'Enhanced discrete neural-net Festival', 'Join us for Enhanced discrete neural-net Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill level', '2026-04-02 18:15:38', '2026-04-03 01:15:38', 6541, 'Published'),
-    (1122, 156, 120, 'Cloned bandwidth-monitored installation Festival', 'Join us for Cloned bandwidth-monitored installation Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on just and digital marketing. Bring you', '2027-01-03 21:04:04', '2027-01-04 04:04:04', 1241, 'Published'),
-    (1123, 125, 118, 'Quality-focused attitude-oriented leverage Festival', 'Join us for Quality-focused attitude-oriented leverage Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and foo', '2027-07-25 11:38:22', '2027-07-25 16:38:22', 11807, 'Published'),
-    (1124, 191, 108, 'Robust intermediate middleware Festival', 'Join us for Robust intermediate middleware Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill lev', '2025-08-08 09:44:31', '2025-08-08 11:44:31', 4318, 'Completed'),
-    (1125, 330, 117, 'Extended bottom-line encoding Festival', 'Join us for Extended bottom-line encoding Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill leve', '2026-05-31 22:31:51', '2026-06-01 02:31:51', 520, 'Published'),
-    (1126, 224, 137, 'Right-sized empowering superstructure Festival', 'Join us for Right-sized empowering superstructure Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on against and digital marketing. Bring yo', '2026-09-06 11:55:31', '2026-09-06 18:55:31', 9378, 'Draft'),
-    (1127, 497, 148, 'Profit-focused grid-enabled attitude Festival', 'Join us for Profit-focused grid-enabled attitude Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on where and digital marketing. Bring your ', '2026-12-15 22:21:03', '2026-12-16 00:21:03', 4992, 'Published'),
-    (1128, 147, 146, 'Monitored transitional instruction set Festival', 'Join us for Monitored transitional instruction set Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All s', '2026-10-21 06:07:31', '2026-10-21 14:07:31', 1058, 'Draft'),
-    (1129, 269, 103, 'Face-to-face hybrid adapter Festival', 'Join us for Face-to-face hybrid adapter Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill levels', '2025-06-23 06:55:43', '2025-06-23 10:55:43', 2830, 'Completed'),
-    (1130, 256, 113, 'Cross-platform tangible superstructure Festival', 'Join us for Cross-platform tangible superstructure Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This', '2027-03-01 15:12:38', '2027-03-01 19:12:38', 107, 'Published'),
-    (1131, 245, 135, 'Innovative dedicated concept Festival', 'Join us for Innovative dedicated concept Festival, a premier event in the heart of San Antonio! Girl kind stop story fly feel trial. Loss finally reflect current must learn.', '2027-05-25 18:36:20', '2027-05-25 20:36:20', 10120, 'Canceled'),
-    (1132, 114, 135, 'Proactive regional complexity Festival', 'Join us for Proactive regional complexity Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. Per', '2025-07-20 20:26:57', '2025-07-20 23:26:57', 1585, 'Completed'),
-    (1133, 44, 106, 'Team-oriented context-sensitive success Festival', 'Join us for Team-oriented context-sensitive success Festival, a premier event in the heart of San Antonio! Lay kid sure prepare. Surface local necessary specific rise.', '2026-02-20 05:34:34', '2026-02-20 12:34:34', 537, 'Draft'),
-    (1134, 498, 115, 'Balanced leadingedge leverage Festival', 'Join us for Balanced leadingedge leverage Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on bag and digital marketing. Bring your laptop an', '2027-10-09 17:48:39', '2027-10-09 20:48:39', 10377, 'Draft'),
-    (1135, 238, 126, 'Expanded foreground neural-net Festival', 'Join us for Expanded foreground neural-net Festival, a premier event in the heart of San Antonio! Action nothing rich mouth police light. Final thousand structure yeah seek even piece. Early say stati', '2027-09-27 16:43:06', '2027-09-27 18:43:06', 1193, 'Published'),
-    (1136, 319, 106, 'Inverse executive pricing structure Festival', 'Join us for Inverse executive pricing structure Festival, a premier event in the heart of San Antonio! Identify wear right business charge business town surface film we seek hold despite. Featuring lo', '2026-02-02 03:17:18', '2026-02-02 05:17:18', 1359, 'Published'),
-    (1137, 191, 123, 'Profit-focused fault-tolerant matrix Festival', 'Join us for Profit-focused fault-tolerant matrix Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical ac', '2026-07-31 20:13:49', '2026-07-31 23:13:49', 5082, 'Published'),
-    (1138, 417, 140, 'Ergonomic methodical standardization Festival', 'Join us for Ergonomic methodical standardization Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on fact and digital marketing. Bring your l', '2026-01-18 03:12:19', '2026-01-18 07:12:19', 473, 'Published'),
-    (1139, 411, 131, 'Robust even-keeled support Festival', 'Join us for Robust even-keeled support Festival, a premier event in the heart of San Antonio! Well American team company involve majority better.', '2027-01-11 14:34:53', '2027-01-11 16:34:53', 6543, 'Published'),
-    (1140, 207, 148, 'Quality-focused asynchronous firmware Festival', 'Join us for Quality-focused asynchronous firmware Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food tru', '2024-12-05 23:36:24', '2024-12-06 03:36:24', 3702, 'Completed'),
-    (1141, 208, 144, 'Proactive interactive time-frame Festival', 'Join us for Proactive interactive time-frame Festival, a premier event in the heart of San Antonio! Year against soldier order product yeah. Red nothing attention likely. Argue institution case.', '2026-10-16 23:43:15', '2026-10-17 07:43:15', 6043, 'Published'),
-    (1142, 330, 134, 'Vision-oriented multi-state hardware Festival', 'Join us for Vision-oriented multi-state hardware Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical ac', '2026-02-21 15:01:14', '2026-02-21 19:01:14', 4440, 'Published'),
-    (1143, 461, 137, 'Automated multi-tasking time-frame Festival', 'Join us for Automated multi-tasking time-frame Festival, a premier event in the heart of San Antonio! Where long rich under out bring what against everyone. Featuring local bands, rising stars, and a ', '2025-02-08 09:18:48', '2025-02-08 11:18:48', 6250, 'Canceled'),
-    (1144, 330, 123, 'Persevering solution-oriented support Festival', 'Join us for Persevering solution-oriented support Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All sk', '2026-10-03 07:25:05', '2026-10-03 09:25:05', 9174, 'Published'),
-    (1145, 34, 124, 'Synergistic intermediate analyzer Festival', 'Join us for Synergistic intermediate analyzer Festival, a premier event in the heart of San Antonio! Ask finish member their face be situation. Financial threat nearly model. Industry company success.', '2027-03-29 10:14:32', '2027-03-29 12:14:32', 2392, 'Draft'),
-    (1146, 283, 141, 'Future-proofed web-enabled algorithm Festival', 'Join us for Future-proofed web-enabled algorithm Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All ski', '2025-01-09 11:21:44', '2025-01-09 17:21:44', 5361, 'Completed'),
-    (1147, 177, 138, 'Optional value-added focus group Festival', 'Join us for Optional value-added focus group Festival, a premier event in the heart of San Antonio! Someone increase across international from parent of. Featuring local bands, rising stars, and a dyn', '2027-04-13 07:47:49', '2027-04-13 10:47:49', 4751, 'Published'),
-    (1148, 366, 127, 'Re-contextualized empowering circuit Festival', 'Join us for Re-contextualized empowering circuit Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food truc', '2026-04-05 08:48:26', '2026-04-05 13:48:26', 4156, 'Draft'),
-    (1149, 70, 116, 'Intuitive human-resource info-mediaries Festival', 'Join us for Intuitive human-resource info-mediaries Festival, a premier event in the heart of San Antonio! People safe air another pick beat. Radio others though heart. Draw note beautiful face there ', '2026-05-03 23:10:16', '2026-05-04 07:10:16', 1377, 'Draft'),
-    (1150, 43, 103, 'Compatible empowering support Festival', 'Join us for Compatible empowering support Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on center and digital marketing. Bring your laptop', '2025-05-05 00:16:41', '2025-05-05 07:16:41', 966, 'Completed'),
-    (1151, 495, 106, 'Fully-configurable secondary infrastructure Festival', 'Join us for Fully-configurable secondary infrastructure Festival, a premier event in the heart of San Antonio! Head allow push adult discuss. Action ground quite individual budget act perform. Traditi', '2027-06-15 02:45:45', '2027-06-15 09:45:45', 2256, 'Published'),
-    (1152, 340, 142, 'Compatible intangible moderator Festival', 'Join us for Compatible intangible moderator Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on brother and digital marketing. Bring your lap', '2025-02-06 19:36:35', '2025-02-07 00:36:35', 2244, 'Completed'),
-    (1153, 13, 143, 'Right-sized motivating projection Festival', 'Join us for Right-sized motivating projection Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts.', '2026-02-27 23:18:34', '2026-02-28 03:18:34', 1102, 'Published'),
-    (1154, 282, 129, 'Multi-lateral encompassing help-desk Festival', 'Join us for Multi-lateral encompassing help-desk Festival, a premier event in the heart of San Antonio! Dream support between now white arrive food drive necessary number remember young. Featuring loc', '2024-12-07 15:01:28', '2024-12-07 22:01:28', 1939, 'Completed'),
-    (1155, 108, 122, 'Persevering optimal productivity Festival', 'Join us for Persevering optimal productivity Festival, a premier event in the heart of San Antonio! Special state power here station. Three leave live nation.', '2025-08-20 06:22:52', '2025-08-20 11:22:52', 369, 'Completed'),
-    (1156, 102, 141, 'Robust zero administration capacity Festival', 'Join us for Robust zero administration capacity Festival, a premier event in the heart of San Antonio! Series down million whether walk huge program laugh.', '2024-12-13 02:11:45', '2024-12-13 09:11:45', 5241, 'Completed'),
-    (1157, 125, 145, 'Open-source regional frame Festival', 'Join us for Open-source regional frame Festival, a premier event in the heart of San Antonio! Voice provide organization behind. Way method fine bill much tough science. Line both focus.', '2026-08-29 12:55:52', '2026-08-29 18:55:52', 50, 'Published'),
-    (1158, 420, 146, 'Business-focused intermediate capacity Festival', 'Join us for Business-focused intermediate capacity Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All s', '2026-01-20 09:01:32', '2026-01-20 15:01:32', 1302, 'Published'),
-    (1159, 426, 111, 'Versatile national task-force Festival', 'Join us for Versatile national task-force Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s f', '2025-06-26 05:33:06', '2025-06-26 09:33:06', 4031, 'Completed'),
-    (1160, 154, 122, 'Inverse bottom-line infrastructure Festival', 'Join us for Inverse bottom-line infrastructure Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts', '2026-02-24 21:31:40', '2026-02-25 03:31:40', 6032, 'Canceled'),
-    (1161, 415, 110, 'Fundamental demand-driven process improvement Festival', 'Join us for Fundamental demand-driven process improvement Festival, a premier event in the heart of San Antonio! Couple tend often industry then meet. Door commercial arm eat factor hospital. Free pos', '2027-08-12 16:05:49', '2027-08-12 21:05:49', 977, 'Published'),
-    (1162, 201, 112, 'Quality-focused uniform collaboration Festival', 'Join us for Quality-focused uniform collaboration Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This ', '2025-07-21 20:03:07', '2025-07-22 02:03:07', 10532, 'Completed'),
-    (1163, 253, 135, 'Multi-layered exuding initiative Festival', 'Join us for Multi-layered exuding initiative Festival, a premier event in the heart of San Antonio! Born they individual happy care affect new recognize middle. Featuring local bands, rising stars, an', '2026-05-07 07:46:25', '2026-05-07 10:46:25', 1784, 'Published'),
-    (1164, 444, 126, 'Function-based even-keeled time-frame Festival', 'Join us for Function-based even-keeled time-frame Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All sk', '2025-02-01 00:52:50', '2025-02-01 05:52:50', 5865, 'Completed'),
-    (1165, 191, 136, 'Visionary static workforce Festival', 'Join us for Visionary static workforce Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. Perfec', '2026-01-13 01:54:24', '2026-01-13 07:54:24', 1439, 'Draft'),
-    (1166, 444, 106, 'Operative context-sensitive infrastructure Festival', 'Join us for Operative context-sensitive infrastructure Festival, a premier event in the heart of San Antonio! Cover writer purpose oil those pick leader number three. Featuring local bands, rising sta', '2026-10-10 13:51:14', '2026-10-10 21:51:14', 2780, 'Draft'),
-    (1167, 354, 129, 'Networked clear-thinking groupware Festival', 'Join us for Networked clear-thinking groupware Festival, a premier event in the heart of San Antonio! Alone foot star try television hit sure the whose recently bag hope. Featuring local bands, rising', '2026-09-11 10:07:26', '2026-09-11 14:07:26', 7399, 'Published'),
-    (1168, 4, 120, 'Balanced tangible protocol Festival', 'Join us for Balanced tangible protocol Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on inside and digital marketing. Bring your laptop an', '2026-12-17 01:50:52', '2026-12-17 09:50:52', 2466, 'Draft'),
-    (1169, 147, 141, 'Future-proofed object-oriented instruction set Festival', 'Join us for Future-proofed object-oriented instruction set Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and', '2027-08-23 02:55:17', '2027-08-23 05:55:17', 1246, 'Published'),
-    (1170, 98, 102, 'Pre-emptive well-modulated data-warehouse Festival', 'Join us for Pre-emptive well-modulated data-warehouse Festival, a premier event in the heart of San Antonio! Model reveal century civil approach when. On least them. Imagine news year different Americ', '2026-04-29 06:32:39', '2026-04-29 14:32:39', 779, 'Published'),
-    (1171, 312, 137, 'Virtual empowering customer loyalty Festival', 'Join us for Virtual empowering customer loyalty Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skil', '2025-02-27 09:39:33', '2025-02-27 17:39:33', 8696, 'Completed'),
-    (1172, 354, 118, 'User-centric hybrid alliance Festival', 'Join us for User-centric hybrid alliance Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s fo', '2026-12-20 13:27:27', '2026-12-20 15:27:27', 8456, 'Draft'),
-    (1173, 444, 133, 'Universal encompassing matrices Festival', 'Join us for Universal encompassing matrices Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on push and digital marketing. Bring your laptop', '2025-05-30 03:54:28', '2025-05-30 08:54:28', 293, 'Completed'),
-    (1174, 420, 111, 'Compatible asymmetric framework Festival', 'Join us for Compatible asymmetric framework Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. L', '2027-02-14 21:22:51', '2027-02-15 00:22:51', 2828, 'Published'),
-    (1175, 224, 140, 'Distributed zero administration function Festival', 'Join us for Distributed zero administration function Festival, a premier event in the heart of San Antonio! Before hour manage story. System who person garden poor west. Remain kid detail everybody on', '2027-04-16 13:09:55', '2027-04-16 18:09:55', 1158, 'Draft'),
-    (1176, 317, 119, 'Multi-layered fault-tolerant protocol Festival', 'Join us for Multi-layered fault-tolerant protocol Festival, a premier event in the heart of San Antonio! Worry talk while anything. Mind name east person.', '2025-09-28 06:38:18', '2025-09-28 12:38:18', 7386, 'Completed'),
-    (1177, 351, 113, 'Multi-lateral maximized leverage Festival', 'Join us for Multi-lateral maximized leverage Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on similar and digital marketing. Bring your la', '2026-11-19 17:07:52', '2026-11-20 00:07:52', 3480, 'Published'),
-    (1178, 147, 123, 'Streamlined hybrid initiative Festival', 'Join us for Streamlined hybrid initiative Festival, a premier event in the heart of San Antonio! Scene book national break continue indeed need drug.', '2026-07-22 21:24:30', '2026-07-23 03:24:30', 810, 'Canceled'),
-    (1179, 348, 114, 'Automated needs-based algorithm Festival', 'Join us for Automated needs-based algorithm Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on full and digital marketing. Bring your laptop', '2025-10-09 00:04:57', '2025-10-09 03:04:57', 483, 'Completed'),
-    (1180, 249, 131, 'Managed zero administration toolset Festival', 'Join us for Managed zero administration toolset Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on owner and digital marketing. Bring your l', '2027-11-14 11:50:33', '2027-11-14 15:50:33', 556, 'Draft'),
-    (1181, 368, 136, 'Enterprise-wide executive moratorium Festival', 'Join us for Enterprise-wide executive moratorium Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food truc', '2027-09-29 21:51:20', '2027-09-30 00:51:20', 775, 'Published'),
-    (1182, 348, 130, 'Optional regional projection Festival', 'Join us for Optional regional projection Festival, a premier event in the heart of San Antonio! Assume nearly might trip of manage current. Food might opportunity allow state for lead.', '2025-05-31 06:56:03', '2025-05-31 09:56:03', 10097, 'Completed'),
-    (1183, 243, 134, 'Synchronized heuristic Graphic Interface Festival', 'Join us for Synchronized heuristic Graphic Interface Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All', '2025-04-07 08:39:40', '2025-04-07 15:39:40', 3902, 'Completed'),
-    (1184, 348, 134, 'User-centric static initiative Festival', 'Join us for User-centric static initiative Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Li', '2026-03-13 05:15:35', '2026-03-13 13:15:35', 51, 'Draft'),
-    (1185, 317, 106, 'Face-to-face mobile analyzer Festival', 'Join us for Face-to-face mobile analyzer Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s fo', '2026-06-05 12:18:38', '2026-06-05 15:18:38', 2011, 'Published'),
-    (1186, 456, 130, 'Grass-roots well-modulated encoding Festival', 'Join us for Grass-roots well-modulated encoding Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food truck', '2027-01-02 20:38:22', '2027-01-03 03:38:22', 5341, 'Canceled'),
-    (1187, 447, 105, 'Horizontal even-keeled intranet Festival', 'Join us for Horizontal even-keeled intranet Festival, a premier event in the heart of San Antonio! Pass color when us. Floor candidate key recent people natural walk. Thousand collection lay action st', '2025-10-13 22:06:26', '2025-10-14 03:06:26', 4442, 'Completed'),
-    (1188, 486, 118, 'Robust even-keeled productivity Festival', 'Join us for Robust even-keeled productivity Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s', '2025-12-31 11:36:32', '2025-12-31 18:36:32', 8935, 'Published'),
-    (1189, 65, 123, 'Assimilated modular flexibility Festival', 'Join us for Assimilated modular flexibility Festival, a premier event in the heart of San Antonio! Quickly explain forward worry for three not develop possible race cell. Featuring local bands, rising', '2026-12-08 06:10:33', '2026-12-08 13:10:33', 4992, 'Published'),
-    (1190, 320, 119, 'Enterprise-wide discrete challenge Festival', 'Join us for Enterprise-wide discrete challenge Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on truth and digital marketing. Bring your la', '2027-08-18 17:50:36', '2027-08-18 21:50:36', 1510, 'Published'),
-    (1191, 207, 123, 'Self-enabling motivating time-frame Festival', 'Join us for Self-enabling motivating time-frame Festival, a premier event in the heart of San Antonio! Open cup while walk once when will. Yet enter piece responsibility realize.', '2025-01-23 09:30:54', '2025-01-23 15:30:54', 6382, 'Completed'),
-    (1192, 404, 125, 'Expanded systemic adapter Festival', 'Join us for Expanded systemic adapter Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill levels w', '2027-07-31 15:19:40', '2027-07-31 23:19:40', 2456, 'Published'),
-    (1193, 18, 108, 'Profit-focused scalable frame Festival', 'Join us for Profit-focused scalable frame Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill leve', '2027-07-16 07:47:29', '2027-07-16 10:47:29', 520, 'Draft'),
-    (1194, 350, 107, 'Automated web-enabled data-warehouse Festival', 'Join us for Automated web-enabled data-warehouse Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food truc', '2027-03-25 08:24:56', '2027-03-25 10:24:56', 747, 'Published'),
-    (1195, 64, 129, 'Robust national help-desk Festival', 'Join us for Robust national help-desk Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on world and digital marketing. Bring your laptop and ', '2026-07-01 18:51:14', '2026-07-02 02:51:14', 10521, 'Published'),
-    (1196, 243, 148, 'Reactive holistic system engine Festival', 'Join us for Reactive holistic system engine Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on member and digital marketing. Bring your lapt', '2026-12-05 05:18:28', '2026-12-05 07:18:28', 4025, 'Draft'),
-    (1197, 385, 105, 'Implemented heuristic monitoring Festival', 'Join us for Implemented heuristic monitoring Festival, a premier event in the heart of San Antonio! Citizen Mrs statement discover speak miss. Featuring local bands, rising stars, and a dynamic sound ', '2025-09-15 07:30:28', '2025-09-15 15:30:28', 3325, 'Canceled'),
-    (1198, 354, 123, 'Seamless asynchronous concept Festival', 'Join us for Seamless asynchronous concept Festival, a premier event in the heart of San Antonio! His necessary if. Right spend story foreign.', '2026-10-11 18:36:56', '2026-10-11 22:36:56', 7197, 'Published'),
-    (1199, 265, 143, 'Optimized local help-desk Festival', 'Join us for Optimized local help-desk Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. Perfect', '2026-10-28 15:14:39', '2026-10-28 19:14:39', 2701, 'Published'),
-    (1200, 164, 123, 'Persistent static Graphical User Interface Festival', 'Join us for Persistent static Graphical User Interface Festival, a premier event in the heart of San Antonio! Receive organization successful individual positive. Meeting president cell paper trip.', '2027-07-17 03:03:40', '2027-07-17 05:03:40', 5092, 'Draft');
+    (1001, 52, 142, 'Devolved zero administration leverage Festival', 'Join us for Devolved zero administration leverage Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All sk', '2028-04-19 15:14:00', '2028-04-19 21:14:00', 6055, 'Published'),
+    (1002, 359, 110, 'Fully-configurable encompassing concept Festival', 'Join us for Fully-configurable encompassing concept Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food t', '2027-03-27 00:31:29', '2027-03-27 05:31:29', 10161, 'Published'),
+    (1003, 461, 143, 'Multi-tiered content-based matrices Festival', 'Join us for Multi-tiered content-based matrices Festival, a premier event in the heart of San Antonio! Both affect without talk man middle standard weight. Democrat quite part summer air. Success toni', '2028-08-30 19:49:09', '2028-08-31 03:49:09', 1436, 'Published'),
+    (1004, 174, 109, 'Multi-lateral mission-critical superstructure Festival', 'Join us for Multi-lateral mission-critical superstructure Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on experience and digital marketin', '2026-11-30 13:37:13', '2026-11-30 21:37:13', 3233, 'Canceled'),
+    (1005, 371, 127, 'Diverse optimizing access Festival', 'Join us for Diverse optimizing access Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill levels w', '2028-01-04 08:26:52', '2028-01-04 16:26:52', 1805, 'Canceled'),
+    (1006, 361, 134, 'Profit-focused tertiary concept Festival', 'Join us for Profit-focused tertiary concept Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill le', '2026-05-15 03:38:40', '2026-05-15 07:38:40', 1129, 'Completed'),
+    (1007, 192, 118, 'Diverse high-level ability Festival', 'Join us for Diverse high-level ability Festival, a premier event in the heart of San Antonio! Store space new writer stuff society system very Mr beautiful movement strategy deal tell. Featuring local', '2025-11-23 04:22:31', '2025-11-23 10:22:31', 1084, 'Canceled'),
+    (1008, 378, 132, 'Organized full-range productivity Festival', 'Join us for Organized full-range productivity Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year', '2026-02-01 23:11:15', '2026-02-02 01:11:15', 3220, 'Completed'),
+    (1009, 266, 139, 'Mandatory stable database Festival', 'Join us for Mandatory stable database Festival, a premier event in the heart of San Antonio! Become couple allow yes thing mind remember. Featuring local bands, rising stars, and a dynamic sound syste', '2026-01-13 11:34:02', '2026-01-13 18:34:02', 4815, 'Completed'),
+    (1010, 427, 112, 'Triple-buffered secondary secured line Festival', 'Join us for Triple-buffered secondary secured line Festival, a premier event in the heart of San Antonio! Under store suggest campaign artist do police activity. Benefit over special benefit short par', '2028-08-28 13:50:29', '2028-08-28 19:50:29', 1150, 'Published'),
+    (1011, 336, 122, 'Synergized user-facing portal Festival', 'Join us for Synergized user-facing portal Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Lim', '2026-02-11 04:57:06', '2026-02-11 09:57:06', 3878, 'Completed'),
+    (1012, 179, 113, 'Upgradable didactic superstructure Festival', 'Join us for Upgradable didactic superstructure Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill', '2027-04-21 15:05:05', '2027-04-21 17:05:05', 164, 'Published'),
+    (1013, 101, 136, 'Multi-tiered disintermediate pricing structure Festival', 'Join us for Multi-tiered disintermediate pricing structure Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun ru', '2028-06-22 23:57:25', '2028-06-23 03:57:25', 4377, 'Published'),
+    (1014, 275, 108, 'Focused interactive algorithm Festival', 'Join us for Focused interactive algorithm Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on court and digital marketing. Bring your laptop ', '2026-03-08 14:37:23', '2026-03-08 20:37:23', 1378, 'Draft'),
+    (1015, 330, 117, 'Enterprise-wide bi-directional definition Festival', 'Join us for Enterprise-wide bi-directional definition Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. Al', '2026-07-15 11:29:15', '2026-07-15 17:29:15', 4559, 'Completed'),
+    (1016, 442, 122, 'Horizontal dedicated software Festival', 'Join us for Horizontal dedicated software Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. Per', '2027-07-20 22:06:32', '2027-07-21 06:06:32', 9486, 'Published'),
+    (1017, 83, 144, 'Future-proofed 24/7 middleware Festival', 'Join us for Future-proofed 24/7 middleware Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on answer and digital marketing. Bring your lapto', '2028-08-25 03:28:40', '2028-08-25 11:28:40', 4048, 'Published'),
+    (1018, 494, 132, 'User-friendly 24hour conglomeration Festival', 'Join us for User-friendly 24hour conglomeration Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food truck', '2026-12-24 03:15:09', '2026-12-24 05:15:09', 2270, 'Published'),
+    (1019, 158, 102, 'Upgradable 24hour contingency Festival', 'Join us for Upgradable 24hour contingency Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill leve', '2027-11-10 12:40:56', '2027-11-10 16:40:56', 548, 'Draft'),
+    (1020, 11, 111, 'Cloned coherent pricing structure Festival', 'Join us for Cloned coherent pricing structure Festival, a premier event in the heart of San Antonio! Where heart maintain design show herself risk care wind board television. Featuring local bands, ri', '2027-06-29 02:32:35', '2027-06-29 07:32:35', 400, 'Canceled'),
+    (1021, 409, 149, 'Vision-oriented stable ability Festival', 'Join us for Vision-oriented stable ability Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on college and digital marketing. Bring your lapt', '2025-10-25 09:37:43', '2025-10-25 15:37:43', 2786, 'Completed'),
+    (1022, 433, 126, 'Digitized actuating alliance Festival', 'Join us for Digitized actuating alliance Festival, a premier event in the heart of San Antonio! Respond mother parent recently state agent beyond land store worry. Featuring local bands, rising stars,', '2028-07-03 05:08:49', '2028-07-03 07:08:49', 2118, 'Published'),
+    (1023, 171, 117, 'Robust composite protocol Festival', 'Join us for Robust composite protocol Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Limited', '2028-09-26 14:56:28', '2028-09-26 22:56:28', 10382, 'Published'),
+    (1024, 194, 147, 'Team-oriented uniform ability Festival', 'Join us for Team-oriented uniform ability Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on nice and digital marketing. Bring your laptop a', '2028-03-09 02:50:32', '2028-03-09 08:50:32', 3572, 'Published'),
+    (1025, 366, 102, 'Organic bandwidth-monitored firmware Festival', 'Join us for Organic bandwidth-monitored firmware Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All ski', '2028-03-31 02:31:53', '2028-03-31 05:31:53', 412, 'Published'),
+    (1026, 416, 133, 'Multi-layered scalable installation Festival', 'Join us for Multi-layered scalable installation Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical act', '2028-06-29 08:13:30', '2028-06-29 16:13:30', 2869, 'Published'),
+    (1027, 149, 145, 'Integrated 24/7 approach Festival', 'Join us for Integrated 24/7 approach Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s focus ', '2027-06-15 01:26:39', '2027-06-15 08:26:39', 587, 'Published'),
+    (1028, 213, 134, 'Visionary grid-enabled Graphical User Interface Festival', 'Join us for Visionary grid-enabled Graphical User Interface Festival, a premier event in the heart of San Antonio! Magazine power of follow forget continue two. Seat less stop opportunity ahead hair. ', '2028-01-27 16:57:19', '2028-01-27 22:57:19', 162, 'Published'),
+    (1029, 342, 114, 'Innovative bifurcated methodology Festival', 'Join us for Innovative bifurcated methodology Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts.', '2028-04-14 18:23:58', '2028-04-15 00:23:58', 2892, 'Draft'),
+    (1030, 96, 128, 'Synchronized actuating extranet Festival', 'Join us for Synchronized actuating extranet Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill le', '2026-01-28 23:48:27', '2026-01-29 02:48:27', 6760, 'Completed'),
+    (1031, 20, 131, 'Open-architected asymmetric moderator Festival', 'Join us for Open-architected asymmetric moderator Festival, a premier event in the heart of San Antonio! Movement industry eye arm seek seat. Featuring local bands, rising stars, and a dynamic sound s', '2026-02-19 20:33:44', '2026-02-20 04:33:44', 9411, 'Canceled'),
+    (1032, 22, 144, 'User-friendly attitude-oriented conglomeration Festival', 'Join us for User-friendly attitude-oriented conglomeration Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstratio', '2027-07-29 01:03:30', '2027-07-29 03:03:30', 7330, 'Published'),
+    (1033, 84, 149, 'Extended disintermediate pricing structure Festival', 'Join us for Extended disintermediate pricing structure Festival, a premier event in the heart of San Antonio! Save compare write poor culture increase reflect many choose thousand. Featuring local ban', '2028-05-14 02:49:32', '2028-05-14 07:49:32', 695, 'Draft'),
+    (1034, 56, 107, 'Organic dedicated instruction set Festival', 'Join us for Organic dedicated instruction set Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill ', '2027-03-30 21:52:55', '2027-03-31 01:52:55', 1628, 'Published'),
+    (1035, 39, 150, 'User-centric national intranet Festival', 'Join us for User-centric national intranet Festival, a premier event in the heart of San Antonio! Individual day student piece just executive guy science score leader I. Featuring local bands, rising ', '2028-05-05 01:06:13', '2028-05-05 07:06:13', 446, 'Published'),
+    (1036, 63, 136, 'Secured multi-state attitude Festival', 'Join us for Secured multi-state attitude Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill level', '2027-07-27 14:33:58', '2027-07-27 21:33:58', 6195, 'Draft'),
+    (1037, 86, 131, 'Re-contextualized encompassing protocol Festival', 'Join us for Re-contextualized encompassing protocol Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on view and digital marketing. Bring you', '2027-10-25 20:00:45', '2027-10-26 01:00:45', 4108, 'Published'),
+    (1038, 421, 129, 'Optimized intermediate matrix Festival', 'Join us for Optimized intermediate matrix Festival, a premier event in the heart of San Antonio! Occur defense dog. Season industry after matter example rise consider. Order program Democrat hospital ', '2028-02-12 00:14:53', '2028-02-12 02:14:53', 2239, 'Published'),
+    (1039, 232, 124, 'Innovative zero administration methodology Festival', 'Join us for Innovative zero administration methodology Festival, a premier event in the heart of San Antonio! Part huge positive never not hope current face. Minute remember expect both. Reach appear ', '2027-10-29 11:39:53', '2027-10-29 13:39:53', 3976, 'Published'),
+    (1040, 387, 138, 'Right-sized 5thgeneration moratorium Festival', 'Join us for Right-sized 5thgeneration moratorium Festival, a premier event in the heart of San Antonio! Republican nice look order again protect.', '2026-09-01 07:56:00', '2026-09-01 11:56:00', 2526, 'Draft'),
+    (1041, 65, 119, 'Enhanced bandwidth-monitored capability Festival', 'Join us for Enhanced bandwidth-monitored capability Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food t', '2027-03-17 05:13:01', '2027-03-17 13:13:01', 1992, 'Canceled'),
+    (1042, 305, 102, 'Devolved impactful complexity Festival', 'Join us for Devolved impactful complexity Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s f', '2026-11-19 13:53:04', '2026-11-19 16:53:04', 3907, 'Draft'),
+    (1043, 456, 137, 'Advanced web-enabled migration Festival', 'Join us for Advanced web-enabled migration Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on thus and digital marketing. Bring your laptop ', '2025-11-05 23:14:37', '2025-11-06 02:14:37', 2970, 'Draft'),
+    (1044, 494, 112, 'Expanded 24/7 interface Festival', 'Join us for Expanded 24/7 interface Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Limited V', '2028-05-25 21:49:00', '2028-05-25 23:49:00', 4572, 'Published'),
+    (1045, 412, 118, 'Distributed methodical capability Festival', 'Join us for Distributed methodical capability Festival, a premier event in the heart of San Antonio! Learn why plan wear adult hard care actually nearly run. Featuring local bands, rising stars, and a', '2028-10-05 18:18:34', '2028-10-05 21:18:34', 1058, 'Published'),
+    (1046, 182, 118, 'Robust asymmetric monitoring Festival', 'Join us for Robust asymmetric monitoring Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill level', '2028-02-04 10:58:22', '2028-02-04 17:58:22', 12629, 'Published'),
+    (1047, 412, 126, 'Programmable mobile monitoring Festival', 'Join us for Programmable mobile monitoring Festival, a premier event in the heart of San Antonio! Pressure great plan talk environmental successful account bed ability include task. Featuring local ba', '2027-06-26 18:34:33', '2027-06-26 20:34:33', 1360, 'Published'),
+    (1048, 65, 101, 'Organic maximized analyzer Festival', 'Join us for Organic maximized analyzer Festival, a premier event in the heart of San Antonio! Trial section idea later. Sister physical about tree. Huge sing prepare thousand house respond reach.', '2027-02-13 08:38:34', '2027-02-13 11:38:34', 4580, 'Draft'),
+    (1049, 288, 117, 'Horizontal intermediate analyzer Festival', 'Join us for Horizontal intermediate analyzer Festival, a premier event in the heart of San Antonio! Though apply another stand interesting another center bad.', '2028-05-21 10:52:39', '2028-05-21 17:52:39', 4507, 'Published'),
+    (1050, 359, 133, 'Upgradable systematic budgetary management Festival', 'Join us for Upgradable systematic budgetary management Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on although and digital marketing. Br', '2025-11-29 02:22:16', '2025-11-29 07:22:16', 3303, 'Completed'),
+    (1051, 266, 110, 'Synergized hybrid alliance Festival', 'Join us for Synergized hybrid alliance Festival, a premier event in the heart of San Antonio! Later take common realize stop. Indicate whose list effort machine head ability cultural. Work field yet n', '2026-02-08 15:17:25', '2026-02-08 19:17:25', 1667, 'Completed'),
+    (1052, 361, 101, 'Quality-focused 6thgeneration moderator Festival', 'Join us for Quality-focused 6thgeneration moderator Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on why and digital marketing. Bring your', '2026-03-23 05:44:43', '2026-03-23 09:44:43', 6767, 'Completed'),
+    (1053, 283, 114, 'Reverse-engineered mission-critical process improvement Festival', 'Join us for Reverse-engineered mission-critical process improvement Festival, a premier event in the heart of San Antonio! Subject low who mouth to drive good tax president item meeting. Featuring loc', '2028-06-05 17:14:02', '2028-06-06 01:14:02', 3515, 'Draft'),
+    (1054, 416, 140, 'Organized 4thgeneration success Festival', 'Join us for Organized 4thgeneration success Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s', '2027-10-01 01:06:31', '2027-10-01 04:06:31', 80, 'Published'),
+    (1055, 113, 112, 'Centralized web-enabled focus group Festival', 'Join us for Centralized web-enabled focus group Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food truck', '2028-02-09 04:50:13', '2028-02-09 12:50:13', 1812, 'Published'),
+    (1056, 415, 105, 'Advanced object-oriented throughput Festival', 'Join us for Advanced object-oriented throughput Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food truck', '2028-06-11 11:27:04', '2028-06-11 15:27:04', 1457, 'Published'),
+    (1057, 466, 119, 'Synergized leadingedge throughput Festival', 'Join us for Synergized leadingedge throughput Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill ', '2028-04-08 17:04:12', '2028-04-09 01:04:12', 2378, 'Published'),
+    (1058, 324, 127, 'Phased 4thgeneration utilization Festival', 'Join us for Phased 4thgeneration utilization Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. ', '2026-06-28 20:58:11', '2026-06-29 01:58:11', 3847, 'Draft'),
+    (1059, 205, 129, 'Implemented mobile analyzer Festival', 'Join us for Implemented mobile analyzer Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on recognize and digital marketing. Bring your lapto', '2027-09-18 19:30:12', '2027-09-19 02:30:12', 2112, 'Published'),
+    (1060, 434, 110, 'Programmable explicit architecture Festival', 'Join us for Programmable explicit architecture Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks', '2027-12-21 07:15:07', '2027-12-21 11:15:07', 6790, 'Published'),
+    (1061, 401, 103, 'Mandatory discrete contingency Festival', 'Join us for Mandatory discrete contingency Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Li', '2026-06-26 00:44:49', '2026-06-26 06:44:49', 1004, 'Completed'),
+    (1062, 288, 148, 'Devolved object-oriented service-desk Festival', 'Join us for Devolved object-oriented service-desk Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All sk', '2028-07-10 00:23:39', '2028-07-10 02:23:39', 1597, 'Published'),
+    (1063, 93, 142, 'Devolved multi-state customer loyalty Festival', 'Join us for Devolved multi-state customer loyalty Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on finish and digital marketing. Bring you', '2028-02-20 05:24:20', '2028-02-20 11:24:20', 1163, 'Published'),
+    (1064, 4, 102, 'Re-engineered human-resource capacity Festival', 'Join us for Re-engineered human-resource capacity Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on deep and digital marketing. Bring your ', '2028-07-02 22:33:26', '2028-07-03 04:33:26', 5119, 'Published'),
+    (1065, 342, 109, 'Proactive 6thgeneration capacity Festival', 'Join us for Proactive 6thgeneration capacity Festival, a premier event in the heart of San Antonio! Plan through enjoy per of industry pass nature author model hand. Featuring local bands, rising star', '2027-04-02 17:09:46', '2027-04-02 22:09:46', 5416, 'Published'),
+    (1066, 100, 122, 'Synchronized solution-oriented time-frame Festival', 'Join us for Synchronized solution-oriented time-frame Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. Al', '2027-01-15 22:56:51', '2027-01-16 06:56:51', 7176, 'Published'),
+    (1067, 378, 141, 'Multi-channeled maximized utilization Festival', 'Join us for Multi-channeled maximized utilization Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical a', '2027-05-16 19:15:06', '2027-05-16 21:15:06', 3884, 'Published'),
+    (1068, 385, 132, 'Progressive 4thgeneration concept Festival', 'Join us for Progressive 4thgeneration concept Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year', '2027-05-14 10:20:58', '2027-05-14 14:20:58', 10422, 'Published'),
+    (1069, 466, 114, 'Right-sized upward-trending migration Festival', 'Join us for Right-sized upward-trending migration Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food tru', '2027-11-29 09:21:30', '2027-11-29 15:21:30', 2785, 'Draft'),
+    (1070, 55, 101, 'Extended fresh-thinking forecast Festival', 'Join us for Extended fresh-thinking forecast Festival, a premier event in the heart of San Antonio! Carry boy man certainly ready arm others threat cup rich tree meet half. Featuring local bands, risi', '2026-06-19 20:58:07', '2026-06-20 01:58:07', 6888, 'Completed'),
+    (1071, 381, 118, 'Phased secondary paradigm Festival', 'Join us for Phased secondary paradigm Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on safe and digital marketing. Bring your laptop and y', '2027-12-01 02:10:00', '2027-12-01 10:10:00', 3615, 'Published'),
+    (1072, 256, 147, 'Down-sized zero tolerance Local Area Network Festival', 'Join us for Down-sized zero tolerance Local Area Network Festival, a premier event in the heart of San Antonio! Value whatever region. Data forward away. Order wait thing page child receive spend. Pus', '2026-07-10 02:52:05', '2026-07-10 06:52:05', 4010, 'Completed'),
+    (1073, 56, 138, 'Focused even-keeled contingency Festival', 'Join us for Focused even-keeled contingency Festival, a premier event in the heart of San Antonio! Animal simply form want opportunity good for. Now either animal degree four mouth. Value require demo', '2028-08-06 17:27:27', '2028-08-07 00:27:27', 4466, 'Published'),
+    (1074, 279, 118, 'Multi-lateral dedicated structure Festival', 'Join us for Multi-lateral dedicated structure Festival, a premier event in the heart of San Antonio! Share together forward reason statement everyone. Featuring local bands, rising stars, and a dynami', '2028-07-10 08:44:29', '2028-07-10 16:44:29', 1781, 'Published'),
+    (1075, 337, 112, 'Innovative static interface Festival', 'Join us for Innovative static interface Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Limit', '2028-06-12 22:05:56', '2028-06-13 00:05:56', 8784, 'Published'),
+    (1076, 177, 115, 'Public-key encompassing time-frame Festival', 'Join us for Public-key encompassing time-frame Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This yea', '2027-02-25 06:57:51', '2027-02-25 10:57:51', 3436, 'Draft'),
+    (1077, 330, 116, 'Realigned zero tolerance orchestration Festival', 'Join us for Realigned zero tolerance orchestration Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All s', '2026-12-04 22:14:19', '2026-12-05 03:14:19', 1618, 'Published'),
+    (1078, 283, 131, 'Decentralized multi-tasking capability Festival', 'Join us for Decentralized multi-tasking capability Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This', '2028-06-21 22:43:08', '2028-06-22 01:43:08', 6048, 'Published'),
+    (1079, 75, 113, 'Diverse national hub Festival', 'Join us for Diverse national hub Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on what and digital marketing. Bring your laptop and your l', '2027-07-28 04:33:13', '2027-07-28 10:33:13', 50, 'Published'),
+    (1080, 399, 139, 'Re-contextualized zero-defect model Festival', 'Join us for Re-contextualized zero-defect model Festival, a premier event in the heart of San Antonio! Involve century up good trial. Fly require discover almost likely.', '2028-01-15 22:12:59', '2028-01-16 06:12:59', 6600, 'Published'),
+    (1081, 277, 141, 'Realigned dynamic synergy Festival', 'Join us for Realigned dynamic synergy Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. Perfect', '2027-07-15 03:15:46', '2027-07-15 11:15:46', 6773, 'Draft'),
+    (1082, 31, 149, 'Face-to-face 5thgeneration customer loyalty Festival', 'Join us for Face-to-face 5thgeneration customer loyalty Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. ', '2027-06-29 17:49:29', '2027-06-30 01:49:29', 2104, 'Draft'),
+    (1083, 173, 121, 'Vision-oriented multimedia knowledgebase Festival', 'Join us for Vision-oriented multimedia knowledgebase Festival, a premier event in the heart of San Antonio! Huge for early wide choose Democrat these. Camera which think civil color company follow. Ac', '2025-12-22 07:13:24', '2025-12-22 14:13:24', 5478, 'Completed'),
+    (1084, 312, 142, 'Multi-channeled executive service-desk Festival', 'Join us for Multi-channeled executive service-desk Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All s', '2027-02-05 05:45:23', '2027-02-05 08:45:23', 9993, 'Draft'),
+    (1085, 105, 130, 'Fully-configurable explicit function Festival', 'Join us for Fully-configurable explicit function Festival, a premier event in the heart of San Antonio! Never majority represent present sound office. Billion though sell former card book piece find. ', '2027-08-04 09:39:51', '2027-08-04 17:39:51', 2750, 'Draft'),
+    (1086, 247, 103, 'Secured disintermediate application Festival', 'Join us for Secured disintermediate application Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on discussion and digital marketing. Bring y', '2026-08-21 07:16:52', '2026-08-21 15:16:52', 6809, 'Completed'),
+    (1087, 200, 128, 'Triple-buffered 6thgeneration hierarchy Festival', 'Join us for Triple-buffered 6thgeneration hierarchy Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food t', '2026-01-21 14:45:04', '2026-01-21 19:45:04', 8119, 'Completed'),
+    (1088, 466, 110, 'Automated optimizing methodology Festival', 'Join us for Automated optimizing methodology Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill l', '2026-04-01 20:29:38', '2026-04-02 02:29:38', 150, 'Completed'),
+    (1089, 362, 150, 'Down-sized real-time projection Festival', 'Join us for Down-sized real-time projection Festival, a premier event in the heart of San Antonio! Scientist take wide down open they up. Ask wait mention bed budget address. Picture support senior.', '2027-10-23 14:45:01', '2027-10-23 17:45:01', 1449, 'Published'),
+    (1090, 433, 135, 'Progressive systemic structure Festival', 'Join us for Progressive systemic structure Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. Pe', '2028-04-27 03:40:22', '2028-04-27 08:40:22', 4220, 'Published'),
+    (1091, 462, 142, 'Future-proofed grid-enabled migration Festival', 'Join us for Future-proofed grid-enabled migration Festival, a premier event in the heart of San Antonio! Perhaps face enjoy sense challenge ten red current forget to result threat push. Featuring loca', '2026-01-17 23:11:02', '2026-01-18 01:11:02', 408, 'Canceled'),
+    (1092, 24, 128, 'Grass-roots demand-driven algorithm Festival', 'Join us for Grass-roots demand-driven algorithm Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skil', '2027-08-07 04:23:39', '2027-08-07 10:23:39', 7736, 'Canceled'),
+    (1093, 64, 126, 'Devolved maximized encoding Festival', 'Join us for Devolved maximized encoding Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill levels', '2025-11-18 21:16:19', '2025-11-19 01:16:19', 2081, 'Completed'),
+    (1094, 84, 108, 'Automated 5thgeneration Graphical User Interface Festival', 'Join us for Automated 5thgeneration Graphical User Interface Festival, a premier event in the heart of San Antonio! Recently at seven over six may. Featuring local bands, rising stars, and a dynamic s', '2027-01-28 14:37:26', '2027-01-28 19:37:26', 2812, 'Published'),
+    (1095, 256, 109, 'Distributed content-based standardization Festival', 'Join us for Distributed content-based standardization Festival, a premier event in the heart of San Antonio! Story than if common eight tax. Threat particularly message offer both run friend. Educatio', '2025-12-30 06:25:04', '2025-12-30 10:25:04', 4496, 'Completed'),
+    (1096, 111, 147, 'User-centric 5thgeneration framework Festival', 'Join us for User-centric 5thgeneration framework Festival, a premier event in the heart of San Antonio! Soon TV somebody score middle increase office. Featuring local bands, rising stars, and a dynami', '2028-09-24 19:08:59', '2028-09-25 03:08:59', 3109, 'Published'),
+    (1097, 128, 146, 'User-friendly non-volatile product Festival', 'Join us for User-friendly non-volatile product Festival, a premier event in the heart of San Antonio! Toward power plan item side recently. Environment section which write choose dinner foreign we.', '2028-09-26 20:07:59', '2028-09-27 00:07:59', 1988, 'Published'),
+    (1098, 499, 116, 'Integrated demand-driven productivity Festival', 'Join us for Integrated demand-driven productivity Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This ', '2027-05-22 06:47:30', '2027-05-22 10:47:30', 2988, 'Canceled'),
+    (1099, 409, 123, 'Future-proofed coherent info-mediaries Festival', 'Join us for Future-proofed coherent info-mediaries Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All s', '2027-02-19 00:12:39', '2027-02-19 04:12:39', 514, 'Published'),
+    (1100, 305, 113, 'Focused methodical access Festival', 'Join us for Focused methodical access Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s focus', '2026-04-12 03:49:13', '2026-04-12 08:49:13', 308, 'Completed'),
+    (1101, 439, 136, 'Managed systematic migration Festival', 'Join us for Managed systematic migration Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill level', '2028-09-06 09:08:04', '2028-09-06 11:08:04', 3866, 'Canceled'),
+    (1102, 163, 145, 'Total upward-trending function Festival', 'Join us for Total upward-trending function Festival, a premier event in the heart of San Antonio! Should deep appear yes opportunity. Share give number. Trip accept single different teacher throughout', '2025-12-30 01:07:45', '2025-12-30 06:07:45', 1661, 'Completed'),
+    (1103, 427, 123, 'Future-proofed motivating instruction set Festival', 'Join us for Future-proofed motivating instruction set Festival, a premier event in the heart of San Antonio! Eight resource wait tax understand phone information family. Pressure less indeed street si', '2028-04-28 17:30:54', '2028-04-28 21:30:54', 331, 'Published'),
+    (1104, 24, 109, 'Exclusive interactive attitude Festival', 'Join us for Exclusive interactive attitude Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on past and digital marketing. Bring your laptop ', '2028-09-03 20:11:19', '2028-09-04 03:11:19', 2306, 'Published'),
+    (1105, 58, 124, 'Ergonomic methodical benchmark Festival', 'Join us for Ergonomic methodical benchmark Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. Pe', '2027-01-11 12:48:31', '2027-01-11 17:48:31', 2258, 'Published'),
+    (1106, 359, 137, 'Business-focused global collaboration Festival', 'Join us for Business-focused global collaboration Festival, a premier event in the heart of San Antonio! Science list line affect. Market view ago business character eat mother. Determine Mrs do prepa', '2028-03-05 18:47:01', '2028-03-06 01:47:01', 4635, 'Published'),
+    (1107, 404, 143, 'Mandatory contextually-based policy Festival', 'Join us for Mandatory contextually-based policy Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food truck', '2028-04-19 03:16:30', '2028-04-19 06:16:30', 283, 'Published'),
+    (1108, 230, 128, 'Programmable eco-centric projection Festival', 'Join us for Programmable eco-centric projection Festival, a premier event in the heart of San Antonio! Source describe way mean south score organization recent free exactly specific dinner foot. Featu', '2028-09-02 15:33:28', '2028-09-02 17:33:28', 10407, 'Published'),
+    (1109, 81, 115, 'Total human-resource focus group Festival', 'Join us for Total human-resource focus group Festival, a premier event in the heart of San Antonio! Letter ask foreign she appear take company huge. Why member behind be mouth then test.', '2028-06-13 22:50:52', '2028-06-14 05:50:52', 547, 'Canceled'),
+    (1110, 281, 136, 'Polarized system-worthy paradigm Festival', 'Join us for Polarized system-worthy paradigm Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. ', '2027-08-21 14:35:46', '2027-08-21 22:35:46', 6503, 'Canceled'),
+    (1111, 19, 126, 'Balanced actuating methodology Festival', 'Join us for Balanced actuating methodology Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s ', '2028-07-30 13:43:01', '2028-07-30 15:43:01', 2429, 'Published'),
+    (1112, 93, 104, 'Automated uniform Internet solution Festival', 'Join us for Automated uniform Internet solution Festival, a premier event in the heart of San Antonio! Network keep effort specific mission bank which. Else subject speak a one marriage on choose.', '2027-02-17 04:36:45', '2027-02-17 06:36:45', 2911, 'Published'),
+    (1113, 194, 129, 'Ameliorated static help-desk Festival', 'Join us for Ameliorated static help-desk Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Limi', '2028-01-31 17:46:20', '2028-02-01 01:46:20', 3037, 'Published'),
+    (1114, 366, 116, 'Right-sized bifurcated knowledge user Festival', 'Join us for Right-sized bifurcated knowledge user Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on find and digital marketing. Bring your ', '2028-05-28 01:17:15', '2028-05-28 09:17:15', 4944, 'Published'),
+    (1115, 81, 128, 'Team-oriented asynchronous extranet Festival', 'Join us for Team-oriented asynchronous extranet Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This ye', '2027-06-17 06:46:34', '2027-06-17 09:46:34', 4752, 'Published'),
+    (1116, 433, 125, 'Synchronized solution-oriented access Festival', 'Join us for Synchronized solution-oriented access Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical a', '2028-06-28 18:00:38', '2028-06-28 21:00:38', 4877, 'Published'),
+    (1117, 471, 122, 'Multi-channeled zero-defect archive Festival', 'Join us for Multi-channeled zero-defect archive Festival, a premier event in the heart of San Antonio! Special whatever sometimes or. Economic about manage still many understand. Usually blood area la', '2027-11-17 19:23:13', '2027-11-18 03:23:13', 8072, 'Published'),
+    (1118, 69, 124, 'Profound discrete budgetary management Festival', 'Join us for Profound discrete budgetary management Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on question and digital marketing. Bring ', '2028-08-13 03:28:42', '2028-08-13 08:28:42', 6147, 'Published'),
+    (1119, 86, 142, 'Progressive impactful customer loyalty Festival', 'Join us for Progressive impactful customer loyalty Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food tr', '2026-03-18 11:47:21', '2026-03-18 19:47:21', 149, 'Completed'),
+    (1120, 100, 115, 'Upgradable logistical database Festival', 'Join us for Upgradable logistical database Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on usually and digital marketing. Bring your lapt', '2026-11-30 11:23:07', '2026-11-30 15:23:07', 4602, 'Published'),
+    (1121, 171, 105, 'Visionary upward-trending structure Festival', 'Join us for Visionary upward-trending structure Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on ahead and digital marketing. Bring your l', '2027-07-16 12:37:22', '2027-07-16 19:37:22', 2213, 'Canceled'),
+    (1122, 436, 104, 'Re-contextualized even-keeled process improvement Festival', 'Join us for Re-contextualized even-keeled process improvement Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun', '2028-10-02 22:08:38', '2028-10-03 01:08:38', 2373, 'Published'),
+    (1123, 292, 150, 'Multi-lateral explicit algorithm Festival', 'Join us for Multi-lateral explicit algorithm Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill l', '2028-04-18 11:45:56', '2028-04-18 14:45:56', 2730, 'Draft'),
+    (1124, 289, 141, 'Public-key asymmetric migration Festival', 'Join us for Public-key asymmetric migration Festival, a premier event in the heart of San Antonio! Capital budget society defense music. Listen executive bit second leg his.', '2027-09-10 18:29:20', '2027-09-10 23:29:20', 7330, 'Draft'),
+    (1125, 81, 101, 'Assimilated incremental projection Festival', 'Join us for Assimilated incremental projection Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on inside and digital marketing. Bring your l', '2027-01-20 18:30:33', '2027-01-21 02:30:33', 5665, 'Published'),
+    (1126, 183, 133, 'Re-engineered encompassing utilization Festival', 'Join us for Re-engineered encompassing utilization Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This', '2026-09-11 14:08:04', '2026-09-11 19:08:04', 5105, 'Completed'),
+    (1127, 63, 103, 'Balanced multimedia frame Festival', 'Join us for Balanced multimedia frame Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Limited', '2027-12-13 17:13:52', '2027-12-13 22:13:52', 11277, 'Draft'),
+    (1128, 382, 120, 'Intuitive heuristic firmware Festival', 'Join us for Intuitive heuristic firmware Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on sound and digital marketing. Bring your laptop a', '2027-02-22 01:21:52', '2027-02-22 05:21:52', 2124, 'Published'),
+    (1129, 362, 140, 'Profound methodical Internet solution Festival', 'Join us for Profound methodical Internet solution Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical a', '2026-09-03 03:47:34', '2026-09-03 05:47:34', 1925, 'Completed'),
+    (1130, 81, 119, 'Organized 5thgeneration monitoring Festival', 'Join us for Organized 5thgeneration monitoring Festival, a premier event in the heart of San Antonio! Soon respond family between system use score dark maintain record seat. Featuring local bands, ris', '2028-04-19 12:05:59', '2028-04-19 16:05:59', 6771, 'Published'),
+    (1131, 498, 137, 'Cloned hybrid leverage Festival', 'Join us for Cloned hybrid leverage Festival, a premier event in the heart of San Antonio! Provide job president. Seven blood indeed police.', '2025-12-26 23:05:48', '2025-12-27 05:05:48', 5140, 'Completed'),
+    (1132, 366, 106, 'Cross-platform clear-thinking artificial intelligence Festival', 'Join us for Cross-platform clear-thinking artificial intelligence Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunn', '2027-10-28 11:23:21', '2027-10-28 15:23:21', 1095, 'Draft'),
+    (1133, 435, 122, 'Fully-configurable bottom-line interface Festival', 'Join us for Fully-configurable bottom-line interface Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on tell and digital marketing. Bring yo', '2027-07-20 21:24:30', '2027-07-21 01:24:30', 7304, 'Published'),
+    (1134, 452, 128, 'Intuitive zero administration strategy Festival', 'Join us for Intuitive zero administration strategy Festival, a premier event in the heart of San Antonio! Me including in available agree kind PM free. Answer around relate pressure often rule.', '2028-07-06 12:58:06', '2028-07-06 16:58:06', 6238, 'Draft'),
+    (1135, 291, 129, 'Multi-channeled systemic solution Festival', 'Join us for Multi-channeled systemic solution Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill ', '2027-01-08 17:51:40', '2027-01-08 21:51:40', 2046, 'Published'),
+    (1136, 101, 123, 'Enhanced multi-state middleware Festival', 'Join us for Enhanced multi-state middleware Festival, a premier event in the heart of San Antonio! Free action listen chair order road project bring smile avoid theory agreement concern. Featuring loc', '2026-04-11 13:35:57', '2026-04-11 17:35:57', 490, 'Completed'),
+    (1137, 126, 111, 'Self-enabling incremental ability Festival', 'Join us for Self-enabling incremental ability Festival, a premier event in the heart of San Antonio! Ten evidence art really computer site notice body. Though including own game.', '2028-08-17 08:38:21', '2028-08-17 15:38:21', 3771, 'Draft'),
+    (1138, 75, 119, 'Seamless dynamic hub Festival', 'Join us for Seamless dynamic hub Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on them and digital marketing. Bring your laptop and your l', '2027-09-08 15:24:43', '2027-09-08 17:24:43', 2251, 'Draft'),
+    (1139, 194, 137, 'User-centric neutral moderator Festival', 'Join us for User-centric neutral moderator Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Li', '2027-05-01 18:58:47', '2027-05-01 23:58:47', 5748, 'Canceled'),
+    (1140, 24, 130, 'Total national moderator Festival', 'Join us for Total national moderator Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Limited ', '2028-09-21 10:42:56', '2028-09-21 12:42:56', 4789, 'Draft'),
+    (1141, 349, 104, 'Right-sized grid-enabled capability Festival', 'Join us for Right-sized grid-enabled capability Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on game and digital marketing. Bring your la', '2028-06-18 18:57:28', '2028-06-19 02:57:28', 3189, 'Published'),
+    (1142, 64, 105, 'Self-enabling didactic function Festival', 'Join us for Self-enabling didactic function Festival, a premier event in the heart of San Antonio! Detail education usually south here attention want consider. Ability age agent partner improve full c', '2028-02-19 11:21:12', '2028-02-19 17:21:12', 1853, 'Published'),
+    (1143, 249, 119, 'Advanced contextually-based software Festival', 'Join us for Advanced contextually-based software Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on career and digital marketing. Bring your', '2026-05-08 22:27:10', '2026-05-09 02:27:10', 2185, 'Completed'),
+    (1144, 362, 137, 'Extended non-volatile policy Festival', 'Join us for Extended non-volatile policy Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on much and digital marketing. Bring your laptop an', '2028-03-29 02:06:16', '2028-03-29 06:06:16', 1460, 'Published'),
+    (1145, 499, 124, 'Upgradable maximized emulation Festival', 'Join us for Upgradable maximized emulation Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill lev', '2026-11-20 18:46:46', '2026-11-20 23:46:46', 6414, 'Canceled'),
+    (1146, 161, 124, 'Business-focused optimal product Festival', 'Join us for Business-focused optimal product Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. ', '2028-03-17 17:00:45', '2028-03-17 23:00:45', 5195, 'Published'),
+    (1147, 177, 131, 'Profit-focused mission-critical process improvement Festival', 'Join us for Profit-focused mission-critical process improvement Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on sister and digital market', '2028-01-20 19:42:50', '2028-01-20 23:42:50', 7566, 'Published'),
+    (1148, 421, 105, 'Seamless modular productivity Festival', 'Join us for Seamless modular productivity Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on system and digital marketing. Bring your laptop', '2026-12-20 03:03:58', '2026-12-20 08:03:58', 992, 'Published'),
+    (1149, 356, 136, 'Reactive systemic standardization Festival', 'Join us for Reactive systemic standardization Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill ', '2026-11-18 12:58:53', '2026-11-18 19:58:53', 4382, 'Published'),
+    (1150, 80, 143, 'Managed radical attitude Festival', 'Join us for Managed radical attitude Festival, a premier event in the heart of San Antonio! Save right attack recently prevent local budget information gas argue poor. Featuring local bands, rising st', '2028-02-04 16:49:37', '2028-02-05 00:49:37', 1594, 'Published'),
+    (1151, 96, 107, 'Persevering context-sensitive website Festival', 'Join us for Persevering context-sensitive website Festival, a premier event in the heart of San Antonio! In government teach response source. Other especially effect.', '2026-04-09 14:00:17', '2026-04-09 16:00:17', 1783, 'Completed'),
+    (1152, 191, 134, 'Expanded coherent alliance Festival', 'Join us for Expanded coherent alliance Festival, a premier event in the heart of San Antonio! Newspaper lose lawyer theory also far city. Soon role increase maintain minute. Vote nature someone common', '2027-04-01 13:48:02', '2027-04-01 15:48:02', 518, 'Published'),
+    (1153, 83, 111, 'Organized transitional complexity Festival', 'Join us for Organized transitional complexity Festival, a premier event in the heart of San Antonio! Animal office business investment. Value bank threat bar wonder.', '2025-12-01 02:36:05', '2025-12-01 06:36:05', 1177, 'Completed'),
+    (1154, 24, 144, 'Exclusive contextually-based software Festival', 'Join us for Exclusive contextually-based software Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical a', '2028-06-02 15:26:02', '2028-06-02 22:26:02', 1957, 'Canceled'),
+    (1155, 56, 126, 'Team-oriented 24hour infrastructure Festival', 'Join us for Team-oriented 24hour infrastructure Festival, a premier event in the heart of San Antonio! Eye partner machine attorney. Listen financial bag manager. Safe detail reveal seat assume tree c', '2026-12-15 06:44:56', '2026-12-15 08:44:56', 1856, 'Published'),
+    (1156, 183, 136, 'Multi-layered 6thgeneration circuit Festival', 'Join us for Multi-layered 6thgeneration circuit Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on economy and digital marketing. Bring your', '2028-07-22 16:14:48', '2028-07-22 20:14:48', 2955, 'Published'),
+    (1157, 30, 108, 'Team-oriented 6thgeneration alliance Festival', 'Join us for Team-oriented 6thgeneration alliance Festival, a premier event in the heart of San Antonio! Wall election democratic respond inside experience type. Featuring local bands, rising stars, an', '2027-11-19 10:02:30', '2027-11-19 17:02:30', 126, 'Published'),
+    (1158, 226, 128, 'Robust intangible monitoring Festival', 'Join us for Robust intangible monitoring Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s fo', '2028-10-15 19:08:20', '2028-10-15 23:08:20', 10637, 'Draft'),
+    (1159, 200, 129, 'Ergonomic asynchronous benchmark Festival', 'Join us for Ergonomic asynchronous benchmark Festival, a premier event in the heart of San Antonio! Information someone over door.', '2026-01-20 22:03:46', '2026-01-21 04:03:46', 1622, 'Completed'),
+    (1160, 312, 128, 'Business-focused didactic success Festival', 'Join us for Business-focused didactic success Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts.', '2027-09-27 05:50:27', '2027-09-27 12:50:27', 495, 'Published'),
+    (1161, 395, 145, 'Secured grid-enabled extranet Festival', 'Join us for Secured grid-enabled extranet Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This year''s f', '2027-10-09 22:30:40', '2027-10-10 06:30:40', 2369, 'Published'),
+    (1162, 395, 131, 'Compatible scalable throughput Festival', 'Join us for Compatible scalable throughput Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. Pe', '2026-02-24 10:39:02', '2026-02-24 12:39:02', 7777, 'Completed'),
+    (1163, 368, 107, 'Multi-lateral dynamic solution Festival', 'Join us for Multi-lateral dynamic solution Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Li', '2027-03-30 15:34:18', '2027-03-30 20:34:18', 1026, 'Canceled'),
+    (1164, 194, 129, 'Future-proofed asymmetric database Festival', 'Join us for Future-proofed asymmetric database Festival, a premier event in the heart of San Antonio! Own history gas modern just maybe effect. Featuring local bands, rising stars, and a dynamic sound', '2028-08-29 22:09:25', '2028-08-30 00:09:25', 1102, 'Published'),
+    (1165, 336, 120, 'Exclusive local encoding Festival', 'Join us for Exclusive local encoding Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on miss and digital marketing. Bring your laptop and yo', '2027-05-01 03:07:07', '2027-05-01 07:07:07', 4228, 'Published'),
+    (1166, 22, 145, 'Extended needs-based infrastructure Festival', 'Join us for Extended needs-based infrastructure Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This ye', '2026-01-12 16:50:42', '2026-01-12 22:50:42', 410, 'Completed'),
+    (1167, 443, 102, 'Persistent contextually-based application Festival', 'Join us for Persistent contextually-based application Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food', '2025-11-30 06:18:16', '2025-11-30 08:18:16', 3321, 'Completed'),
+    (1168, 226, 106, 'Optional multimedia success Festival', 'Join us for Optional multimedia success Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on skill and digital marketing. Bring your laptop an', '2028-05-24 14:17:59', '2028-05-24 19:17:59', 839, 'Published'),
+    (1169, 93, 105, 'Multi-tiered methodical infrastructure Festival', 'Join us for Multi-tiered methodical infrastructure Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All s', '2026-09-02 15:25:30', '2026-09-02 17:25:30', 228, 'Canceled'),
+    (1170, 471, 111, 'De-engineered full-range process improvement Festival', 'Join us for De-engineered full-range process improvement Festival, a premier event in the heart of San Antonio! Along report affect one age try cause. Arrive newspaper key on end ask officer. Eight re', '2027-11-05 00:53:47', '2027-11-05 03:53:47', 2601, 'Published'),
+    (1171, 52, 102, 'Virtual didactic groupware Festival', 'Join us for Virtual didactic groupware Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. Limite', '2028-01-31 09:09:27', '2028-01-31 16:09:27', 5020, 'Draft'),
+    (1172, 55, 115, 'Re-engineered global orchestration Festival', 'Join us for Re-engineered global orchestration Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill', '2027-01-21 07:11:25', '2027-01-21 12:11:25', 1092, 'Published'),
+    (1173, 163, 114, 'Progressive interactive matrices Festival', 'Join us for Progressive interactive matrices Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks. ', '2026-12-30 19:13:11', '2026-12-30 22:13:11', 5890, 'Published'),
+    (1174, 241, 122, 'Managed intangible product Festival', 'Join us for Managed intangible product Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on draw and digital marketing. Bring your laptop and ', '2026-04-26 06:35:30', '2026-04-26 10:35:30', 3899, 'Draft'),
+    (1175, 81, 115, 'Upgradable intangible portal Festival', 'Join us for Upgradable intangible portal Festival, a premier event in the heart of San Antonio! Town from travel station clearly final market. Speech concern finally size wait organization. Could busi', '2027-01-05 01:08:52', '2027-01-05 06:08:52', 6468, 'Published'),
+    (1176, 241, 135, 'Ameliorated solution-oriented matrices Festival', 'Join us for Ameliorated solution-oriented matrices Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food tr', '2027-12-13 07:51:16', '2027-12-13 12:51:16', 2029, 'Draft'),
+    (1177, 362, 147, 'Virtual multi-state orchestration Festival', 'Join us for Virtual multi-state orchestration Festival, a premier event in the heart of San Antonio! Brother ago live conference serious. National lay offer benefit treatment history step. Century wit', '2027-02-23 06:06:30', '2027-02-23 13:06:30', 3730, 'Draft'),
+    (1178, 288, 135, 'Function-based dynamic task-force Festival', 'Join us for Function-based dynamic task-force Festival, a premier event in the heart of San Antonio! New blood product reason evening executive same why none poor look still action. Featuring local ba', '2026-05-08 19:25:20', '2026-05-09 02:25:20', 1924, 'Completed'),
+    (1179, 253, 142, 'Mandatory intermediate Internet solution Festival', 'Join us for Mandatory intermediate Internet solution Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food ', '2028-06-03 15:24:02', '2028-06-03 18:24:02', 10053, 'Published'),
+    (1180, 126, 117, 'Progressive multi-tasking Local Area Network Festival', 'Join us for Progressive multi-tasking Local Area Network Festival, a premier event in the heart of San Antonio! Hair that skin outside. Instead late eight. Participant media risk evening something eno', '2026-08-26 19:05:52', '2026-08-27 01:05:52', 2175, 'Completed'),
+    (1181, 394, 118, 'Cloned homogeneous flexibility Festival', 'Join us for Cloned homogeneous flexibility Festival, a premier event in the heart of San Antonio! Attorney citizen treatment town treatment office often. Trouble game music last quickly call customer.', '2027-08-02 17:58:10', '2027-08-02 19:58:10', 6225, 'Draft'),
+    (1182, 383, 124, 'Cloned solution-oriented hierarchy Festival', 'Join us for Cloned solution-oriented hierarchy Festival, a premier event in the heart of San Antonio! A gastronomic journey awaits! Sample delicious offerings from the best local chefs and food trucks', '2028-06-09 16:57:21', '2028-06-09 18:57:21', 4903, 'Published'),
+    (1183, 253, 130, 'Multi-tiered object-oriented project Festival', 'Join us for Multi-tiered object-oriented project Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. This y', '2027-03-24 18:07:39', '2027-03-25 01:07:39', 12420, 'Draft'),
+    (1184, 247, 115, 'Configurable multi-tasking framework Festival', 'Join us for Configurable multi-tasking framework Festival, a premier event in the heart of San Antonio! Forward artist nothing site would safe born born try. Featuring local bands, rising stars, and a', '2027-10-17 13:42:38', '2027-10-17 18:42:38', 356, 'Canceled'),
+    (1185, 289, 128, 'Reverse-engineered intermediate hardware Festival', 'Join us for Reverse-engineered intermediate hardware Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on vote and digital marketing. Bring yo', '2026-12-24 22:02:04', '2026-12-25 05:02:04', 6195, 'Draft'),
+    (1186, 247, 147, 'Ergonomic coherent structure Festival', 'Join us for Ergonomic coherent structure Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill level', '2026-11-30 00:21:30', '2026-11-30 03:21:30', 1921, 'Published'),
+    (1187, 271, 117, 'Advanced composite core Festival', 'Join us for Advanced composite core Festival, a premier event in the heart of San Antonio! Feel career church concern trip eight night company together plant. Featuring local bands, rising stars, and ', '2027-05-02 16:18:31', '2027-05-02 18:18:31', 7700, 'Published'),
+    (1188, 431, 143, 'Profound solution-oriented focus group Festival', 'Join us for Profound solution-oriented focus group Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical ', '2027-07-08 10:30:10', '2027-07-08 16:30:10', 1453, 'Draft'),
+    (1189, 336, 122, 'Balanced tertiary info-mediaries Festival', 'Join us for Balanced tertiary info-mediaries Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill l', '2026-07-04 23:19:52', '2026-07-05 02:19:52', 5561, 'Canceled'),
+    (1190, 205, 149, 'Enterprise-wide holistic policy Festival', 'Join us for Enterprise-wide holistic policy Festival, a premier event in the heart of San Antonio! Immerse yourself in creativity with local artists, live performances, and stunning theatrical acts. P', '2028-09-23 22:19:06', '2028-09-24 06:19:06', 7015, 'Published'),
+    (1191, 375, 119, 'Business-focused client-server open system Festival', 'Join us for Business-focused client-server open system Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. ', '2026-06-19 01:33:01', '2026-06-19 06:33:01', 6097, 'Completed'),
+    (1192, 65, 133, 'Adaptive attitude-oriented system engine Festival', 'Join us for Adaptive attitude-oriented system engine Festival, a premier event in the heart of San Antonio! Explore the future of technology with industry leaders and groundbreaking demonstrations. Th', '2027-11-10 04:45:37', '2027-11-10 11:45:37', 1921, 'Published'),
+    (1193, 466, 122, 'Secured content-based circuit Festival', 'Join us for Secured content-based circuit Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on stand and digital marketing. Bring your laptop ', '2028-06-30 23:28:21', '2028-07-01 04:28:21', 172, 'Canceled'),
+    (1194, 403, 117, 'Distributed heuristic data-warehouse Festival', 'Join us for Distributed heuristic data-warehouse Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All ski', '2025-12-05 22:23:48', '2025-12-06 02:23:48', 526, 'Completed'),
+    (1195, 368, 107, 'Innovative homogeneous attitude Festival', 'Join us for Innovative homogeneous attitude Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill le', '2027-04-02 13:48:11', '2027-04-02 19:48:11', 414, 'Published'),
+    (1196, 101, 145, 'Distributed zero tolerance core Festival', 'Join us for Distributed zero tolerance core Festival, a premier event in the heart of San Antonio! Red rule look perhaps card stock none thousand cell. Featuring local bands, rising stars, and a dynam', '2026-12-30 23:40:14', '2026-12-31 03:40:14', 2380, 'Published'),
+    (1197, 218, 120, 'Proactive national support Festival', 'Join us for Proactive national support Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on high and digital marketing. Bring your laptop and ', '2026-04-25 06:20:08', '2026-04-25 08:20:08', 962, 'Completed'),
+    (1198, 371, 115, 'Grass-roots eco-centric framework Festival', 'Join us for Grass-roots eco-centric framework Festival, a premier event in the heart of San Antonio! High-octane action! Cheer on your favorite team or participate in the city-wide fun run. All skill ', '2026-12-05 21:24:10', '2026-12-06 02:24:10', 3304, 'Published'),
+    (1199, 74, 149, 'Total systemic infrastructure Festival', 'Join us for Total systemic infrastructure Festival, a premier event in the heart of San Antonio! Boost your skills with our hands-on workshop focused on agency and digital marketing. Bring your laptop', '2026-12-28 04:05:45', '2026-12-28 06:05:45', 2147, 'Draft'),
+    (1200, 461, 103, 'Synchronized secondary projection Festival', 'Join us for Synchronized secondary projection Festival, a premier event in the heart of San Antonio! Evening report American take. Purpose across air.', '2026-07-30 22:07:18', '2026-07-31 01:07:18', 6672, 'Completed');
 
 INSERT INTO `event_category` (`event_id`, `category_id`) VALUES
     (1001, 5),
-    (1001, 7),
-    (1002, 1),
-    (1002, 6),
-    (1003, 4),
-    (1003, 6),
+    (1002, 5),
+    (1003, 7),
+    (1004, 2),
     (1004, 4),
-    (1004, 3),
-    (1005, 5),
-    (1005, 8),
+    (1005, 4),
+    (1006, 7),
+    (1006, 6),
     (1008, 1),
-    (1008, 4),
-    (1010, 3),
-    (1010, 7),
-    (1011, 5),
+    (1009, 2),
+    (1009, 3),
+    (1010, 6),
     (1011, 2),
+    (1011, 7),
     (1012, 2),
     (1012, 5),
-    (1013, 3),
-    (1014, 1),
-    (1015, 2),
-    (1016, 1),
-    (1017, 7),
-    (1018, 2),
-    (1019, 4),
-    (1019, 2),
-    (1020, 7),
-    (1021, 3),
-    (1022, 3),
+    (1013, 1),
+    (1015, 7),
+    (1015, 4),
+    (1016, 5),
+    (1017, 6),
+    (1018, 8),
+    (1018, 6),
+    (1019, 8),
+    (1019, 5),
+    (1020, 8),
+    (1022, 6),
+    (1023, 6),
     (1023, 3),
-    (1023, 5),
     (1024, 6),
-    (1025, 4),
+    (1024, 4),
+    (1025, 8),
+    (1026, 5),
     (1026, 6),
-    (1027, 1),
-    (1029, 1),
-    (1029, 2),
-    (1032, 2),
-    (1033, 4),
-    (1033, 5),
-    (1034, 6),
-    (1034, 8),
-    (1035, 8),
-    (1036, 4),
-    (1037, 6),
+    (1027, 3),
+    (1028, 8),
+    (1032, 7),
+    (1033, 6),
+    (1034, 7),
+    (1034, 2),
+    (1035, 3),
+    (1035, 4),
+    (1036, 3),
+    (1036, 7),
+    (1037, 5),
+    (1038, 7),
     (1038, 4),
-    (1039, 3),
-    (1040, 8),
-    (1040, 4),
-    (1041, 5),
-    (1041, 7),
-    (1042, 3),
-    (1042, 4),
-    (1043, 2),
+    (1039, 2),
+    (1039, 6),
+    (1041, 4),
+    (1041, 8),
     (1044, 7),
-    (1044, 2),
-    (1048, 4),
-    (1048, 1),
-    (1050, 5),
-    (1051, 5),
-    (1052, 6),
-    (1053, 4),
-    (1053, 1),
+    (1045, 6),
+    (1045, 7),
+    (1046, 6),
+    (1047, 3),
+    (1047, 2),
+    (1049, 4),
+    (1049, 5),
+    (1050, 2),
+    (1050, 4),
+    (1051, 2),
+    (1051, 3),
+    (1052, 3),
+    (1054, 6),
     (1054, 2),
-    (1056, 6),
-    (1058, 8),
-    (1058, 7),
-    (1060, 6),
-    (1060, 5),
-    (1061, 1),
+    (1055, 2),
+    (1055, 5),
+    (1056, 2),
+    (1056, 8),
+    (1057, 2),
+    (1057, 8),
+    (1059, 7),
+    (1059, 8),
+    (1060, 2),
+    (1061, 8),
     (1062, 8),
-    (1063, 1),
-    (1064, 5),
-    (1066, 1),
-    (1067, 1),
-    (1067, 5),
-    (1068, 8),
-    (1068, 1),
-    (1069, 8),
-    (1070, 3),
+    (1063, 2),
+    (1063, 8),
+    (1064, 4),
+    (1064, 7),
+    (1065, 1),
+    (1066, 2),
+    (1066, 3),
+    (1067, 7),
+    (1067, 4),
+    (1068, 6),
+    (1068, 5),
+    (1070, 8),
+    (1070, 1),
+    (1071, 5),
     (1072, 2),
-    (1074, 6),
+    (1072, 7),
+    (1073, 3),
+    (1074, 5),
+    (1075, 1),
     (1075, 8),
-    (1075, 3),
-    (1076, 8),
-    (1076, 4),
-    (1077, 7),
-    (1078, 1),
-    (1079, 6),
-    (1079, 4),
+    (1077, 2),
+    (1078, 2),
+    (1079, 1),
+    (1079, 2),
     (1080, 5),
-    (1080, 7),
-    (1082, 6),
     (1082, 4),
-    (1083, 6),
-    (1083, 8),
+    (1082, 6),
+    (1083, 3),
     (1084, 7),
-    (1084, 6),
-    (1085, 3),
-    (1086, 6),
-    (1086, 2),
-    (1090, 7),
-    (1091, 6),
-    (1091, 3),
-    (1092, 3),
-    (1094, 7),
+    (1085, 4),
+    (1086, 4),
+    (1087, 7),
+    (1089, 2),
+    (1090, 6),
+    (1090, 3),
+    (1091, 4),
+    (1091, 2),
+    (1092, 7),
+    (1094, 5),
+    (1094, 1),
     (1095, 7),
-    (1097, 5),
-    (1097, 7),
-    (1098, 8),
-    (1099, 6),
-    (1100, 1),
-    (1100, 7),
-    (1101, 6),
-    (1101, 7),
-    (1102, 1),
+    (1096, 6),
+    (1096, 4),
+    (1097, 3),
+    (1098, 1),
+    (1099, 8),
+    (1099, 1),
+    (1103, 6),
     (1103, 1),
-    (1103, 5),
-    (1104, 3),
-    (1105, 7),
-    (1105, 2),
-    (1106, 1),
-    (1107, 3),
-    (1108, 4),
-    (1108, 7),
-    (1109, 2),
-    (1109, 6),
-    (1110, 2),
-    (1110, 3),
-    (1111, 7),
-    (1112, 1),
+    (1104, 4),
+    (1105, 8),
+    (1105, 1),
+    (1106, 8),
+    (1107, 8),
+    (1107, 2),
+    (1108, 8),
+    (1108, 1),
+    (1109, 7),
+    (1109, 1),
+    (1110, 7),
+    (1111, 2),
     (1112, 3),
     (1113, 5),
-    (1113, 3),
-    (1114, 2),
+    (1114, 5),
     (1114, 1),
-    (1115, 3),
-    (1115, 2),
-    (1116, 2),
+    (1115, 5),
+    (1115, 8),
+    (1116, 7),
     (1116, 1),
-    (1118, 4),
+    (1117, 1),
+    (1117, 6),
+    (1118, 1),
+    (1118, 5),
     (1120, 4),
-    (1120, 1),
-    (1121, 7),
-    (1121, 6),
-    (1122, 1),
-    (1123, 2),
-    (1123, 8),
-    (1124, 7),
-    (1124, 6),
-    (1125, 6),
-    (1126, 3),
-    (1127, 6),
-    (1128, 3),
-    (1128, 4),
-    (1130, 8),
-    (1130, 6),
-    (1133, 8),
+    (1120, 7),
+    (1121, 4),
+    (1121, 2),
+    (1122, 7),
+    (1122, 3),
+    (1124, 3),
+    (1124, 1),
+    (1125, 8),
+    (1127, 4),
+    (1128, 6),
+    (1130, 4),
+    (1131, 7),
+    (1133, 3),
     (1134, 7),
-    (1134, 5),
-    (1135, 1),
-    (1136, 8),
-    (1137, 2),
-    (1137, 1),
-    (1138, 4),
-    (1138, 1),
-    (1139, 3),
-    (1139, 4),
-    (1141, 6),
+    (1135, 3),
+    (1135, 6),
+    (1138, 8),
+    (1138, 3),
+    (1139, 6),
+    (1139, 2),
+    (1140, 3),
+    (1140, 1),
+    (1141, 2),
+    (1142, 6),
     (1142, 3),
-    (1143, 1),
+    (1143, 5),
     (1144, 8),
+    (1144, 2),
     (1145, 2),
-    (1146, 7),
-    (1146, 4),
-    (1147, 6),
-    (1148, 1),
+    (1145, 4),
+    (1146, 6),
+    (1147, 4),
     (1148, 5),
-    (1149, 1),
-    (1149, 6),
+    (1149, 7),
+    (1150, 7),
     (1151, 5),
+    (1152, 2),
     (1153, 4),
-    (1153, 6),
-    (1154, 7),
-    (1155, 4),
-    (1156, 3),
+    (1153, 3),
+    (1155, 8),
     (1156, 2),
-    (1157, 2),
-    (1157, 5),
-    (1158, 2),
+    (1157, 7),
+    (1158, 1),
+    (1160, 6),
     (1160, 3),
-    (1160, 2),
-    (1161, 6),
+    (1161, 1),
+    (1161, 2),
+    (1162, 5),
     (1162, 4),
-    (1162, 3),
+    (1163, 7),
     (1163, 1),
-    (1163, 8),
-    (1165, 8),
-    (1166, 3),
-    (1167, 3),
-    (1169, 7),
-    (1169, 4),
-    (1170, 3),
-    (1171, 4),
-    (1171, 7),
-    (1172, 4),
-    (1172, 2),
+    (1164, 6),
+    (1165, 1),
+    (1165, 5),
+    (1166, 6),
+    (1166, 8),
+    (1167, 7),
+    (1167, 4),
+    (1168, 8),
+    (1168, 6),
+    (1170, 6),
+    (1172, 1),
+    (1172, 7),
+    (1173, 3),
     (1174, 8),
+    (1174, 6),
+    (1175, 7),
+    (1176, 7),
     (1176, 4),
-    (1176, 3),
-    (1177, 2),
     (1177, 1),
-    (1178, 4),
-    (1178, 5),
+    (1177, 8),
+    (1178, 3),
     (1179, 8),
-    (1179, 5),
-    (1181, 7),
+    (1180, 1),
+    (1180, 4),
+    (1181, 5),
     (1182, 1),
-    (1182, 4),
-    (1183, 8),
-    (1183, 5),
     (1184, 1),
-    (1184, 2),
-    (1185, 5),
-    (1186, 8),
-    (1187, 5),
+    (1184, 3),
+    (1185, 1),
+    (1185, 8),
+    (1186, 3),
+    (1186, 2),
+    (1187, 6),
+    (1187, 1),
     (1188, 5),
-    (1188, 4),
+    (1189, 2),
     (1189, 5),
-    (1189, 8),
-    (1190, 8),
-    (1190, 6),
-    (1191, 8),
+    (1190, 4),
+    (1190, 1),
     (1192, 3),
-    (1194, 5),
-    (1194, 4),
-    (1195, 4),
-    (1196, 8),
-    (1197, 5),
-    (1198, 8),
-    (1199, 4),
-    (1199, 1),
-    (1200, 7);
+    (1192, 4),
+    (1193, 1),
+    (1195, 7),
+    (1195, 6),
+    (1196, 5),
+    (1197, 8),
+    (1198, 2),
+    (1198, 5),
+    (1199, 3),
+    (1199, 8),
+    (1200, 3);
 
 INSERT INTO `orders` (`order_id`, `user_id`, `total_amount`, `order_date`, `status`) VALUES
-    (5001, 274, 23.33, '2025-11-17 15:36:52', 'Completed'),
-    (5002, 198, 73.6, '2025-11-17 15:40:16', 'Completed'),
-    (5003, 378, 63.11, '2025-11-17 15:40:33', 'Pending'),
-    (5004, 92, 236.38, '2025-11-17 15:36:15', 'Completed'),
-    (5005, 40, 371.13, '2025-11-17 15:39:11', 'Completed'),
-    (5006, 86, 430.29, '2025-11-17 15:37:13', 'Pending'),
-    (5007, 139, 101.96, '2025-11-17 15:35:50', 'Completed'),
-    (5008, 360, 206.05, '2025-11-17 15:39:55', 'Pending'),
-    (5009, 401, 125.56, '2025-11-17 15:38:54', 'Completed'),
-    (5010, 29, 204.49, '2025-11-17 15:39:51', 'Completed'),
-    (5011, 27, 113.99, '2025-11-17 15:37:35', 'Completed'),
-    (5012, 199, 451.37, '2025-11-17 15:37:04', 'Completed'),
-    (5013, 105, 482.58, '2025-11-17 15:39:54', 'Completed'),
-    (5014, 372, 373.55, '2025-11-17 15:39:35', 'Completed'),
-    (5015, 211, 321.31, '2025-11-17 15:39:05', 'Completed'),
-    (5016, 465, 317.46, '2025-11-17 15:35:05', 'Completed'),
-    (5017, 386, 236.79, '2025-11-17 15:35:36', 'Completed'),
-    (5018, 405, 483.35, '2025-11-17 15:40:30', 'Completed'),
-    (5019, 176, 64.56, '2025-11-17 15:37:42', 'Completed'),
-    (5020, 474, 443.76, '2025-11-17 15:37:03', 'Completed'),
-    (5021, 189, 456.71, '2025-11-17 15:39:26', 'Completed'),
-    (5022, 464, 39.39, '2025-11-17 15:38:14', 'Completed'),
-    (5023, 205, 232.89, '2025-11-17 15:38:16', 'Pending'),
-    (5024, 458, 51.81, '2025-11-17 15:36:55', 'Completed'),
-    (5025, 86, 256.72, '2025-11-17 15:39:57', 'Completed'),
-    (5026, 213, 207.18, '2025-11-17 15:40:24', 'Completed'),
-    (5027, 301, 447.46, '2025-11-17 15:39:11', 'Pending'),
-    (5028, 277, 394.23, '2025-11-17 15:35:31', 'Completed'),
-    (5029, 116, 453.91, '2025-11-17 15:39:57', 'Completed'),
-    (5030, 92, 476.99, '2025-11-17 15:36:33', 'Completed'),
-    (5031, 443, 39.77, '2025-11-17 15:36:43', 'Completed'),
-    (5032, 206, 417.92, '2025-11-17 15:35:01', 'Completed'),
-    (5033, 37, 262.14, '2025-11-17 15:40:44', 'Completed'),
-    (5034, 179, 403.18, '2025-11-17 15:39:21', 'Completed'),
-    (5035, 46, 167.22, '2025-11-17 15:40:02', 'Completed'),
-    (5036, 378, 224.9, '2025-11-17 15:38:20', 'Pending'),
-    (5037, 423, 365.43, '2025-11-17 15:36:57', 'Completed'),
-    (5038, 179, 329.39, '2025-11-17 15:35:07', 'Pending'),
-    (5039, 262, 168.37, '2025-11-17 15:40:26', 'Refunded'),
-    (5040, 433, 498.29, '2025-11-17 15:35:28', 'Refunded'),
-    (5041, 206, 263.1, '2025-11-17 15:36:59', 'Completed'),
-    (5042, 433, 301.34, '2025-11-17 15:40:01', 'Completed'),
-    (5043, 458, 270.93, '2025-11-17 15:38:45', 'Completed'),
-    (5044, 436, 354.28, '2025-11-17 15:39:22', 'Completed'),
-    (5045, 310, 52.48, '2025-11-17 15:35:19', 'Completed'),
-    (5046, 344, 182.02, '2025-11-17 15:38:14', 'Refunded'),
-    (5047, 383, 233.6, '2025-11-17 15:39:31', 'Completed'),
-    (5048, 31, 185.8, '2025-11-17 15:39:06', 'Completed'),
-    (5049, 413, 408.16, '2025-11-17 15:37:37', 'Completed'),
-    (5050, 474, 86.88, '2025-11-17 15:40:55', 'Pending'),
-    (5051, 75, 287.76, '2025-11-17 15:36:48', 'Completed'),
-    (5052, 410, 385.34, '2025-11-17 15:39:28', 'Completed'),
-    (5053, 494, 495.14, '2025-11-17 15:37:07', 'Pending'),
-    (5054, 301, 34.57, '2025-11-17 15:38:51', 'Completed'),
-    (5055, 204, 424.84, '2025-11-17 15:37:14', 'Completed'),
-    (5056, 106, 112.25, '2025-11-17 15:37:52', 'Pending'),
-    (5057, 479, 212.26, '2025-11-17 15:36:24', 'Refunded'),
-    (5058, 176, 340.61, '2025-11-17 15:36:17', 'Completed'),
-    (5059, 331, 375.03, '2025-11-17 15:38:36', 'Pending'),
-    (5060, 414, 219.37, '2025-11-17 15:37:35', 'Completed'),
-    (5061, 115, 375.32, '2025-11-17 15:35:00', 'Completed'),
-    (5062, 344, 137.23, '2025-11-17 15:40:34', 'Refunded'),
-    (5063, 75, 447.19, '2025-11-17 15:36:16', 'Refunded'),
-    (5064, 106, 60.65, '2025-11-17 15:37:16', 'Completed'),
-    (5065, 141, 463.17, '2025-11-17 15:38:20', 'Completed'),
-    (5066, 155, 312.77, '2025-11-17 15:39:04', 'Completed'),
-    (5067, 110, 108.1, '2025-11-17 15:35:08', 'Completed'),
-    (5068, 122, 436.46, '2025-11-17 15:39:59', 'Completed'),
-    (5069, 440, 248.12, '2025-11-17 15:37:48', 'Completed'),
-    (5070, 105, 470.66, '2025-11-17 15:38:54', 'Completed'),
-    (5071, 24, 183.05, '2025-11-17 15:36:58', 'Pending'),
-    (5072, 176, 181.25, '2025-11-17 15:36:22', 'Completed'),
-    (5073, 440, 372.45, '2025-11-17 15:35:06', 'Pending'),
-    (5074, 199, 467.98, '2025-11-17 15:39:59', 'Pending'),
-    (5075, 407, 434.01, '2025-11-17 15:39:37', 'Completed'),
-    (5076, 387, 56.8, '2025-11-17 15:37:08', 'Pending'),
-    (5077, 183, 193.46, '2025-11-17 15:37:40', 'Completed'),
-    (5078, 299, 86.48, '2025-11-17 15:39:20', 'Completed'),
-    (5079, 242, 306.89, '2025-11-17 15:37:02', 'Completed'),
-    (5080, 212, 74.69, '2025-11-17 15:37:02', 'Completed'),
-    (5081, 159, 455.36, '2025-11-17 15:35:10', 'Completed'),
-    (5082, 310, 454.09, '2025-11-17 15:36:05', 'Refunded'),
-    (5083, 62, 174.62, '2025-11-17 15:38:57', 'Completed'),
-    (5084, 54, 296.08, '2025-11-17 15:37:23', 'Completed'),
-    (5085, 499, 360.76, '2025-11-17 15:40:07', 'Completed'),
-    (5086, 448, 499.41, '2025-11-17 15:36:38', 'Completed'),
-    (5087, 387, 53.19, '2025-11-17 15:35:50', 'Refunded'),
-    (5088, 51, 125.72, '2025-11-17 15:34:56', 'Completed'),
-    (5089, 100, 303.12, '2025-11-17 15:37:13', 'Completed'),
-    (5090, 28, 370.18, '2025-11-17 15:36:11', 'Refunded'),
-    (5091, 458, 467.7, '2025-11-17 15:40:46', 'Completed'),
-    (5092, 299, 163.85, '2025-11-17 15:36:16', 'Pending'),
-    (5093, 14, 26.11, '2025-11-17 15:35:18', 'Completed'),
-    (5094, 126, 69.92, '2025-11-17 15:39:21', 'Pending'),
-    (5095, 110, 205.52, '2025-11-17 15:39:54', 'Completed'),
-    (5096, 170, 285.9, '2025-11-17 15:39:08', 'Completed'),
-    (5097, 277, 45.63, '2025-11-17 15:36:55', 'Refunded'),
-    (5098, 246, 199.83, '2025-11-17 15:35:23', 'Completed'),
-    (5099, 474, 393.96, '2025-11-17 15:38:36', 'Refunded'),
-    (5100, 479, 130.74, '2025-11-17 15:38:47', 'Pending'),
-    (5101, 151, 234.62, '2025-11-17 15:35:25', 'Pending'),
-    (5102, 313, 114.01, '2025-11-17 15:40:50', 'Completed'),
-    (5103, 29, 280.66, '2025-11-17 15:39:29', 'Completed'),
-    (5104, 190, 27.84, '2025-11-17 15:39:36', 'Completed'),
-    (5105, 378, 196.05, '2025-11-17 15:38:55', 'Completed'),
-    (5106, 433, 180.53, '2025-11-17 15:40:17', 'Refunded'),
-    (5107, 473, 152.61, '2025-11-17 15:40:29', 'Pending'),
-    (5108, 443, 237.21, '2025-11-17 15:38:02', 'Pending'),
-    (5109, 126, 450.99, '2025-11-17 15:36:56', 'Completed'),
-    (5110, 85, 220.42, '2025-11-17 15:35:53', 'Completed'),
-    (5111, 216, 474.76, '2025-11-17 15:39:07', 'Completed'),
-    (5112, 222, 92.55, '2025-11-17 15:37:45', 'Pending'),
-    (5113, 113, 284.0, '2025-11-17 15:38:28', 'Completed'),
-    (5114, 67, 402.39, '2025-11-17 15:37:21', 'Pending'),
-    (5115, 159, 248.86, '2025-11-17 15:40:48', 'Refunded'),
-    (5116, 378, 25.14, '2025-11-17 15:36:54', 'Completed'),
-    (5117, 468, 288.53, '2025-11-17 15:38:22', 'Completed'),
-    (5118, 467, 41.12, '2025-11-17 15:35:30', 'Completed'),
-    (5119, 122, 463.86, '2025-11-17 15:35:08', 'Completed'),
-    (5120, 410, 325.08, '2025-11-17 15:36:16', 'Completed'),
-    (5121, 118, 240.47, '2025-11-17 15:35:08', 'Pending'),
-    (5122, 407, 389.56, '2025-11-17 15:36:58', 'Completed'),
-    (5123, 155, 240.41, '2025-11-17 15:37:39', 'Pending'),
-    (5124, 291, 310.8, '2025-11-17 15:38:16', 'Completed'),
-    (5125, 76, 154.24, '2025-11-17 15:39:24', 'Completed'),
-    (5126, 343, 286.64, '2025-11-17 15:40:47', 'Completed'),
-    (5127, 159, 96.28, '2025-11-17 15:38:56', 'Completed'),
-    (5128, 183, 85.58, '2025-11-17 15:35:15', 'Pending'),
-    (5129, 159, 296.9, '2025-11-17 15:39:33', 'Completed'),
-    (5130, 100, 361.64, '2025-11-17 15:39:52', 'Completed'),
-    (5131, 140, 92.19, '2025-11-17 15:37:33', 'Completed'),
-    (5132, 32, 52.38, '2025-11-17 15:37:28', 'Completed'),
-    (5133, 394, 392.84, '2025-11-17 15:35:47', 'Completed'),
-    (5134, 24, 299.21, '2025-11-17 15:39:00', 'Completed'),
-    (5135, 26, 63.52, '2025-11-17 15:40:52', 'Completed'),
-    (5136, 203, 40.55, '2025-11-17 15:35:46', 'Completed'),
-    (5137, 410, 210.3, '2025-11-17 15:37:36', 'Pending'),
-    (5138, 179, 193.48, '2025-11-17 15:37:31', 'Completed'),
-    (5139, 378, 282.64, '2025-11-17 15:35:39', 'Completed'),
-    (5140, 139, 391.99, '2025-11-17 15:35:45', 'Completed'),
-    (5141, 380, 445.52, '2025-11-17 15:38:03', 'Refunded'),
-    (5142, 427, 373.83, '2025-11-17 15:36:49', 'Completed'),
-    (5143, 110, 56.13, '2025-11-17 15:40:47', 'Pending'),
-    (5144, 152, 426.14, '2025-11-17 15:36:43', 'Completed'),
-    (5145, 197, 106.17, '2025-11-17 15:38:12', 'Completed'),
-    (5146, 158, 269.92, '2025-11-17 15:38:06', 'Completed'),
-    (5147, 440, 334.3, '2025-11-17 15:38:31', 'Completed'),
-    (5148, 189, 405.02, '2025-11-17 15:37:02', 'Completed'),
-    (5149, 380, 252.53, '2025-11-17 15:38:09', 'Completed'),
-    (5150, 457, 436.05, '2025-11-17 15:38:47', 'Refunded'),
-    (5151, 5, 204.72, '2025-11-17 15:36:51', 'Completed'),
-    (5152, 86, 112.07, '2025-11-17 15:39:44', 'Refunded'),
-    (5153, 494, 305.39, '2025-11-17 15:39:52', 'Completed'),
-    (5154, 299, 405.88, '2025-11-17 15:39:39', 'Pending'),
-    (5155, 422, 494.95, '2025-11-17 15:35:12', 'Completed'),
-    (5156, 246, 210.38, '2025-11-17 15:35:31', 'Completed'),
-    (5157, 407, 309.02, '2025-11-17 15:40:41', 'Refunded'),
-    (5158, 264, 209.21, '2025-11-17 15:37:21', 'Completed'),
-    (5159, 210, 40.88, '2025-11-17 15:38:44', 'Completed'),
-    (5160, 272, 377.09, '2025-11-17 15:36:27', 'Completed'),
-    (5161, 230, 135.7, '2025-11-17 15:36:39', 'Completed'),
-    (5162, 347, 113.11, '2025-11-17 15:40:22', 'Completed'),
-    (5163, 273, 337.18, '2025-11-17 15:39:39', 'Refunded'),
-    (5164, 7, 183.59, '2025-11-17 15:36:43', 'Completed'),
-    (5165, 407, 375.13, '2025-11-17 15:38:21', 'Pending'),
-    (5166, 274, 424.33, '2025-11-17 15:38:34', 'Pending'),
-    (5167, 79, 290.91, '2025-11-17 15:40:40', 'Completed'),
-    (5168, 86, 121.65, '2025-11-17 15:38:55', 'Completed'),
-    (5169, 455, 26.4, '2025-11-17 15:35:42', 'Completed'),
-    (5170, 494, 284.85, '2025-11-17 15:37:19', 'Completed'),
-    (5171, 436, 93.77, '2025-11-17 15:37:51', 'Completed'),
-    (5172, 185, 462.94, '2025-11-17 15:38:15', 'Pending'),
-    (5173, 188, 441.57, '2025-11-17 15:37:20', 'Pending'),
-    (5174, 445, 186.05, '2025-11-17 15:36:49', 'Completed'),
-    (5175, 110, 473.17, '2025-11-17 15:38:35', 'Pending'),
-    (5176, 493, 98.45, '2025-11-17 15:38:55', 'Completed'),
-    (5177, 189, 320.41, '2025-11-17 15:39:16', 'Completed'),
-    (5178, 106, 183.63, '2025-11-17 15:35:41', 'Completed'),
-    (5179, 149, 163.24, '2025-11-17 15:40:18', 'Refunded'),
-    (5180, 383, 407.69, '2025-11-17 15:38:59', 'Completed'),
-    (5181, 499, 414.45, '2025-11-17 15:38:08', 'Pending'),
-    (5182, 310, 218.84, '2025-11-17 15:38:28', 'Completed'),
-    (5183, 422, 255.11, '2025-11-17 15:40:46', 'Pending'),
-    (5184, 313, 154.22, '2025-11-17 15:38:54', 'Completed'),
-    (5185, 410, 214.21, '2025-11-17 15:36:01', 'Completed'),
-    (5186, 273, 293.29, '2025-11-17 15:39:01', 'Completed'),
-    (5187, 113, 250.11, '2025-11-17 15:38:31', 'Pending'),
-    (5188, 170, 197.4, '2025-11-17 15:34:58', 'Refunded'),
-    (5189, 272, 174.25, '2025-11-17 15:38:08', 'Completed'),
-    (5190, 287, 304.53, '2025-11-17 15:37:05', 'Completed'),
-    (5191, 113, 237.77, '2025-11-17 15:36:23', 'Completed'),
-    (5192, 386, 388.49, '2025-11-17 15:37:46', 'Completed'),
-    (5193, 355, 431.53, '2025-11-17 15:35:35', 'Completed'),
-    (5194, 465, 292.42, '2025-11-17 15:37:13', 'Completed'),
-    (5195, 106, 263.29, '2025-11-17 15:40:43', 'Completed'),
-    (5196, 2, 373.33, '2025-11-17 15:40:47', 'Completed'),
-    (5197, 158, 261.86, '2025-11-17 15:38:20', 'Completed'),
-    (5198, 465, 230.37, '2025-11-17 15:36:51', 'Completed'),
-    (5199, 465, 304.32, '2025-11-17 15:38:34', 'Completed'),
-    (5200, 313, 235.98, '2025-11-17 15:36:25', 'Completed'),
-    (5201, 27, 198.77, '2025-11-17 15:40:51', 'Completed'),
-    (5202, 299, 33.62, '2025-11-17 15:35:52', 'Refunded'),
-    (5203, 473, 53.69, '2025-11-17 15:36:10', 'Completed'),
-    (5204, 77, 338.77, '2025-11-17 15:40:28', 'Completed'),
-    (5205, 372, 382.49, '2025-11-17 15:37:50', 'Completed'),
-    (5206, 436, 189.94, '2025-11-17 15:36:09', 'Completed'),
-    (5207, 203, 412.53, '2025-11-17 15:40:00', 'Refunded'),
-    (5208, 299, 200.74, '2025-11-17 15:37:26', 'Refunded'),
-    (5209, 204, 73.44, '2025-11-17 15:40:39', 'Pending'),
-    (5210, 213, 280.37, '2025-11-17 15:39:57', 'Completed'),
-    (5211, 27, 416.14, '2025-11-17 15:38:58', 'Completed'),
-    (5212, 327, 288.6, '2025-11-17 15:39:22', 'Pending'),
-    (5213, 199, 53.9, '2025-11-17 15:39:20', 'Completed'),
-    (5214, 421, 117.46, '2025-11-17 15:36:27', 'Completed'),
-    (5215, 276, 314.38, '2025-11-17 15:35:45', 'Completed'),
-    (5216, 252, 283.2, '2025-11-17 15:36:23', 'Completed'),
-    (5217, 327, 51.17, '2025-11-17 15:39:40', 'Refunded'),
-    (5218, 213, 438.29, '2025-11-17 15:37:46', 'Refunded'),
-    (5219, 51, 59.38, '2025-11-17 15:36:20', 'Completed'),
-    (5220, 31, 272.77, '2025-11-17 15:37:11', 'Refunded'),
-    (5221, 239, 72.98, '2025-11-17 15:38:52', 'Refunded'),
-    (5222, 499, 20.17, '2025-11-17 15:37:53', 'Completed'),
-    (5223, 170, 362.26, '2025-11-17 15:38:55', 'Completed'),
-    (5224, 405, 209.14, '2025-11-17 15:37:37', 'Completed'),
-    (5225, 28, 102.96, '2025-11-17 15:39:42', 'Pending'),
-    (5226, 433, 178.28, '2025-11-17 15:39:52', 'Completed'),
-    (5227, 200, 366.14, '2025-11-17 15:39:59', 'Completed'),
-    (5228, 82, 65.38, '2025-11-17 15:35:42', 'Pending'),
-    (5229, 113, 114.94, '2025-11-17 15:35:01', 'Completed'),
-    (5230, 92, 459.48, '2025-11-17 15:39:10', 'Pending'),
-    (5231, 49, 148.56, '2025-11-17 15:37:37', 'Completed'),
-    (5232, 216, 346.39, '2025-11-17 15:40:56', 'Completed'),
-    (5233, 216, 231.38, '2025-11-17 15:39:20', 'Completed'),
-    (5234, 299, 195.05, '2025-11-17 15:35:35', 'Completed'),
-    (5235, 212, 444.62, '2025-11-17 15:35:37', 'Completed'),
-    (5236, 299, 49.59, '2025-11-17 15:37:00', 'Pending'),
-    (5237, 466, 288.4, '2025-11-17 15:38:46', 'Completed'),
-    (5238, 352, 439.91, '2025-11-17 15:37:39', 'Completed'),
-    (5239, 31, 461.53, '2025-11-17 15:35:24', 'Pending'),
-    (5240, 67, 117.96, '2025-11-17 15:35:55', 'Refunded'),
-    (5241, 106, 460.04, '2025-11-17 15:39:58', 'Refunded'),
-    (5242, 190, 90.85, '2025-11-17 15:38:52', 'Completed'),
-    (5243, 206, 419.34, '2025-11-17 15:38:26', 'Refunded'),
-    (5244, 273, 117.48, '2025-11-17 15:38:57', 'Completed'),
-    (5245, 465, 251.94, '2025-11-17 15:35:23', 'Completed'),
-    (5246, 466, 189.25, '2025-11-17 15:35:48', 'Pending'),
-    (5247, 274, 100.7, '2025-11-17 15:35:28', 'Completed'),
-    (5248, 273, 51.15, '2025-11-17 15:39:05', 'Completed'),
-    (5249, 14, 23.09, '2025-11-17 15:35:02', 'Completed'),
-    (5250, 387, 362.22, '2025-11-17 15:40:26', 'Completed'),
-    (5251, 105, 399.1, '2025-11-17 15:35:06', 'Completed'),
-    (5252, 431, 403.86, '2025-11-17 15:37:00', 'Completed'),
-    (5253, 464, 376.48, '2025-11-17 15:40:14', 'Pending'),
-    (5254, 277, 472.3, '2025-11-17 15:39:02', 'Pending'),
-    (5255, 347, 151.68, '2025-11-17 15:39:45', 'Completed'),
-    (5256, 35, 79.04, '2025-11-17 15:36:10', 'Refunded'),
-    (5257, 24, 370.68, '2025-11-17 15:39:18', 'Completed'),
-    (5258, 310, 68.95, '2025-11-17 15:39:45', 'Pending'),
-    (5259, 485, 365.24, '2025-11-17 15:35:22', 'Pending'),
-    (5260, 436, 190.46, '2025-11-17 15:38:55', 'Completed'),
-    (5261, 331, 30.29, '2025-11-17 15:40:01', 'Refunded'),
-    (5262, 42, 72.42, '2025-11-17 15:40:10', 'Completed'),
-    (5263, 380, 105.73, '2025-11-17 15:36:51', 'Completed'),
-    (5264, 183, 243.52, '2025-11-17 15:40:17', 'Completed'),
-    (5265, 54, 158.35, '2025-11-17 15:35:40', 'Refunded'),
-    (5266, 204, 499.5, '2025-11-17 15:37:02', 'Completed'),
-    (5267, 445, 21.08, '2025-11-17 15:36:05', 'Pending'),
-    (5268, 14, 303.64, '2025-11-17 15:38:06', 'Completed'),
-    (5269, 205, 339.46, '2025-11-17 15:38:35', 'Completed'),
-    (5270, 61, 229.78, '2025-11-17 15:37:30', 'Completed'),
-    (5271, 113, 374.7, '2025-11-17 15:35:58', 'Completed'),
-    (5272, 92, 167.25, '2025-11-17 15:40:10', 'Completed'),
-    (5273, 335, 140.65, '2025-11-17 15:35:07', 'Completed'),
-    (5274, 31, 261.92, '2025-11-17 15:35:18', 'Refunded'),
-    (5275, 307, 100.16, '2025-11-17 15:38:04', 'Completed'),
-    (5276, 296, 370.12, '2025-11-17 15:39:36', 'Completed'),
-    (5277, 212, 415.17, '2025-11-17 15:35:19', 'Pending'),
-    (5278, 262, 115.48, '2025-11-17 15:35:19', 'Completed'),
-    (5279, 288, 460.56, '2025-11-17 15:37:02', 'Pending'),
-    (5280, 440, 290.25, '2025-11-17 15:37:14', 'Completed'),
-    (5281, 100, 346.9, '2025-11-17 15:38:59', 'Completed'),
-    (5282, 471, 318.79, '2025-11-17 15:35:59', 'Completed'),
-    (5283, 474, 67.29, '2025-11-17 15:37:30', 'Completed'),
-    (5284, 197, 412.7, '2025-11-17 15:35:23', 'Refunded'),
-    (5285, 77, 62.95, '2025-11-17 15:38:07', 'Pending'),
-    (5286, 246, 445.82, '2025-11-17 15:39:16', 'Completed'),
-    (5287, 32, 32.52, '2025-11-17 15:38:45', 'Completed'),
-    (5288, 473, 80.17, '2025-11-17 15:40:54', 'Completed'),
-    (5289, 466, 112.14, '2025-11-17 15:37:33', 'Refunded'),
-    (5290, 455, 270.41, '2025-11-17 15:35:30', 'Completed'),
-    (5291, 29, 419.13, '2025-11-17 15:35:56', 'Completed'),
-    (5292, 196, 343.06, '2025-11-17 15:38:44', 'Completed'),
-    (5293, 100, 306.02, '2025-11-17 15:36:53', 'Completed'),
-    (5294, 252, 98.08, '2025-11-17 15:40:28', 'Completed'),
-    (5295, 355, 496.35, '2025-11-17 15:36:06', 'Completed'),
-    (5296, 352, 351.82, '2025-11-17 15:37:27', 'Refunded'),
-    (5297, 196, 116.21, '2025-11-17 15:35:29', 'Completed'),
-    (5298, 205, 355.15, '2025-11-17 15:36:14', 'Completed'),
-    (5299, 212, 344.47, '2025-11-17 15:40:01', 'Pending'),
-    (5300, 313, 122.3, '2025-11-17 15:37:08', 'Completed'),
-    (5301, 196, 262.05, '2025-11-17 15:36:21', 'Pending'),
-    (5302, 240, 175.32, '2025-11-17 15:37:05', 'Refunded'),
-    (5303, 92, 314.16, '2025-11-17 15:36:07', 'Completed'),
-    (5304, 35, 483.81, '2025-11-17 15:36:39', 'Completed'),
-    (5305, 76, 38.38, '2025-11-17 15:37:33', 'Completed'),
-    (5306, 448, 127.13, '2025-11-17 15:35:06', 'Completed'),
-    (5307, 372, 206.23, '2025-11-17 15:38:36', 'Completed'),
-    (5308, 116, 58.58, '2025-11-17 15:38:18', 'Completed'),
-    (5309, 423, 381.45, '2025-11-17 15:37:53', 'Pending'),
-    (5310, 118, 385.7, '2025-11-17 15:35:06', 'Refunded'),
-    (5311, 343, 262.9, '2025-11-17 15:38:29', 'Completed'),
-    (5312, 222, 330.72, '2025-11-17 15:38:04', 'Pending'),
-    (5313, 302, 184.12, '2025-11-17 15:38:39', 'Pending'),
-    (5314, 19, 405.68, '2025-11-17 15:37:21', 'Completed'),
-    (5315, 276, 60.16, '2025-11-17 15:37:35', 'Completed'),
-    (5316, 212, 382.41, '2025-11-17 15:36:00', 'Refunded'),
-    (5317, 42, 386.22, '2025-11-17 15:35:49', 'Completed'),
-    (5318, 213, 490.42, '2025-11-17 15:35:47', 'Completed'),
-    (5319, 493, 101.36, '2025-11-17 15:35:17', 'Refunded'),
-    (5320, 468, 81.31, '2025-11-17 15:39:48', 'Pending'),
-    (5321, 489, 140.82, '2025-11-17 15:38:11', 'Completed'),
-    (5322, 149, 422.58, '2025-11-17 15:39:53', 'Completed'),
-    (5323, 401, 463.34, '2025-11-17 15:36:25', 'Pending'),
-    (5324, 394, 418.93, '2025-11-17 15:39:40', 'Completed'),
-    (5325, 51, 124.9, '2025-11-17 15:35:46', 'Pending'),
-    (5326, 440, 237.65, '2025-11-17 15:39:53', 'Completed'),
-    (5327, 198, 271.63, '2025-11-17 15:35:23', 'Completed'),
-    (5328, 210, 347.79, '2025-11-17 15:40:24', 'Completed'),
-    (5329, 473, 136.32, '2025-11-17 15:36:15', 'Pending'),
-    (5330, 213, 402.82, '2025-11-17 15:39:16', 'Completed'),
-    (5331, 401, 391.04, '2025-11-17 15:39:04', 'Completed'),
-    (5332, 77, 395.09, '2025-11-17 15:35:24', 'Completed'),
-    (5333, 242, 46.84, '2025-11-17 15:40:25', 'Refunded'),
-    (5334, 198, 210.1, '2025-11-17 15:35:16', 'Refunded'),
-    (5335, 314, 190.16, '2025-11-17 15:40:45', 'Completed'),
-    (5336, 122, 355.66, '2025-11-17 15:40:23', 'Completed'),
-    (5337, 413, 372.93, '2025-11-17 15:36:26', 'Completed'),
-    (5338, 397, 279.9, '2025-11-17 15:39:33', 'Completed'),
-    (5339, 485, 63.08, '2025-11-17 15:39:31', 'Completed'),
-    (5340, 80, 290.33, '2025-11-17 15:36:59', 'Completed'),
-    (5341, 355, 157.47, '2025-11-17 15:39:03', 'Completed'),
-    (5342, 211, 398.66, '2025-11-17 15:38:10', 'Pending'),
-    (5343, 386, 298.02, '2025-11-17 15:37:46', 'Completed'),
-    (5344, 468, 256.04, '2025-11-17 15:38:32', 'Completed'),
-    (5345, 151, 193.5, '2025-11-17 15:39:01', 'Refunded'),
-    (5346, 118, 209.32, '2025-11-17 15:37:26', 'Pending'),
-    (5347, 493, 36.12, '2025-11-17 15:39:01', 'Completed'),
-    (5348, 37, 446.5, '2025-11-17 15:39:24', 'Completed'),
-    (5349, 230, 442.33, '2025-11-17 15:39:57', 'Completed'),
-    (5350, 37, 185.6, '2025-11-17 15:39:05', 'Pending'),
-    (5351, 240, 479.99, '2025-11-17 15:39:24', 'Completed'),
-    (5352, 410, 291.59, '2025-11-17 15:39:38', 'Completed'),
-    (5353, 140, 123.36, '2025-11-17 15:38:55', 'Completed'),
-    (5354, 252, 220.73, '2025-11-17 15:37:44', 'Completed'),
-    (5355, 397, 478.48, '2025-11-17 15:35:14', 'Pending'),
-    (5356, 140, 163.12, '2025-11-17 15:40:20', 'Completed'),
-    (5357, 42, 87.99, '2025-11-17 15:38:22', 'Pending'),
-    (5358, 75, 142.05, '2025-11-17 15:38:11', 'Refunded'),
-    (5359, 49, 74.46, '2025-11-17 15:37:49', 'Refunded'),
-    (5360, 276, 212.26, '2025-11-17 15:35:04', 'Pending'),
-    (5361, 158, 22.03, '2025-11-17 15:38:52', 'Pending'),
-    (5362, 240, 200.44, '2025-11-17 15:39:51', 'Refunded'),
-    (5363, 85, 390.71, '2025-11-17 15:35:02', 'Completed'),
-    (5364, 360, 159.38, '2025-11-17 15:39:49', 'Completed'),
-    (5365, 26, 22.8, '2025-11-17 15:37:27', 'Pending'),
-    (5366, 158, 72.05, '2025-11-17 15:36:07', 'Completed'),
-    (5367, 143, 236.6, '2025-11-17 15:40:55', 'Completed'),
-    (5368, 499, 477.97, '2025-11-17 15:37:48', 'Completed'),
-    (5369, 188, 87.09, '2025-11-17 15:36:42', 'Completed'),
-    (5370, 314, 305.31, '2025-11-17 15:36:10', 'Completed'),
-    (5371, 77, 212.66, '2025-11-17 15:40:34', 'Refunded'),
-    (5372, 42, 387.11, '2025-11-17 15:40:32', 'Completed'),
-    (5373, 35, 326.93, '2025-11-17 15:35:52', 'Completed'),
-    (5374, 387, 476.01, '2025-11-17 15:36:08', 'Completed'),
-    (5375, 233, 87.44, '2025-11-17 15:36:35', 'Completed'),
-    (5376, 440, 288.81, '2025-11-17 15:36:28', 'Completed'),
-    (5377, 458, 280.59, '2025-11-17 15:35:07', 'Refunded'),
-    (5378, 204, 157.92, '2025-11-17 15:38:52', 'Completed'),
-    (5379, 471, 257.59, '2025-11-17 15:38:47', 'Completed'),
-    (5380, 422, 276.63, '2025-11-17 15:40:25', 'Pending'),
-    (5381, 372, 239.45, '2025-11-17 15:37:08', 'Completed'),
-    (5382, 76, 450.81, '2025-11-17 15:37:22', 'Completed'),
-    (5383, 170, 438.39, '2025-11-17 15:40:14', 'Completed'),
-    (5384, 155, 392.12, '2025-11-17 15:35:33', 'Pending'),
-    (5385, 35, 440.4, '2025-11-17 15:37:25', 'Completed'),
-    (5386, 212, 361.45, '2025-11-17 15:35:30', 'Completed'),
-    (5387, 276, 437.29, '2025-11-17 15:36:56', 'Completed'),
-    (5388, 189, 225.27, '2025-11-17 15:38:46', 'Completed'),
-    (5389, 158, 234.81, '2025-11-17 15:40:54', 'Pending'),
-    (5390, 355, 451.44, '2025-11-17 15:38:04', 'Completed'),
-    (5391, 443, 349.63, '2025-11-17 15:40:27', 'Pending'),
-    (5392, 372, 99.16, '2025-11-17 15:37:23', 'Completed'),
-    (5393, 42, 88.8, '2025-11-17 15:40:07', 'Completed'),
-    (5394, 27, 71.05, '2025-11-17 15:36:33', 'Completed'),
-    (5395, 252, 330.2, '2025-11-17 15:36:37', 'Completed'),
-    (5396, 273, 338.29, '2025-11-17 15:39:24', 'Refunded'),
-    (5397, 189, 412.36, '2025-11-17 15:36:14', 'Completed'),
-    (5398, 211, 72.66, '2025-11-17 15:38:13', 'Pending'),
-    (5399, 372, 24.46, '2025-11-17 15:39:54', 'Completed'),
-    (5400, 210, 169.74, '2025-11-17 15:39:27', 'Completed'),
-    (5401, 110, 112.51, '2025-11-17 15:36:57', 'Pending'),
-    (5402, 122, 133.31, '2025-11-17 15:38:10', 'Completed'),
-    (5403, 116, 252.11, '2025-11-17 15:37:37', 'Refunded'),
-    (5404, 31, 422.7, '2025-11-17 15:37:55', 'Completed'),
-    (5405, 272, 375.56, '2025-11-17 15:36:09', 'Completed'),
-    (5406, 31, 237.51, '2025-11-17 15:37:40', 'Completed'),
-    (5407, 67, 494.54, '2025-11-17 15:36:53', 'Completed'),
-    (5408, 241, 469.85, '2025-11-17 15:35:51', 'Completed'),
-    (5409, 100, 90.69, '2025-11-17 15:38:00', 'Pending'),
-    (5410, 474, 311.29, '2025-11-17 15:39:02', 'Refunded'),
-    (5411, 100, 175.59, '2025-11-17 15:35:44', 'Pending'),
-    (5412, 5, 447.89, '2025-11-17 15:39:09', 'Completed'),
-    (5413, 80, 165.38, '2025-11-17 15:38:59', 'Completed'),
-    (5414, 166, 452.26, '2025-11-17 15:39:27', 'Completed'),
-    (5415, 392, 163.01, '2025-11-17 15:36:58', 'Completed'),
-    (5416, 42, 323.1, '2025-11-17 15:34:59', 'Pending'),
-    (5417, 52, 394.34, '2025-11-17 15:39:37', 'Completed'),
-    (5418, 277, 432.38, '2025-11-17 15:36:09', 'Refunded'),
-    (5419, 185, 376.96, '2025-11-17 15:38:22', 'Pending'),
-    (5420, 210, 283.25, '2025-11-17 15:39:02', 'Completed'),
-    (5421, 457, 103.73, '2025-11-17 15:39:27', 'Pending'),
-    (5422, 152, 281.05, '2025-11-17 15:35:52', 'Completed'),
-    (5423, 410, 382.29, '2025-11-17 15:40:13', 'Pending'),
-    (5424, 360, 330.54, '2025-11-17 15:37:11', 'Completed'),
-    (5425, 118, 225.73, '2025-11-17 15:40:25', 'Completed'),
-    (5426, 405, 103.94, '2025-11-17 15:38:39', 'Completed'),
-    (5427, 337, 289.07, '2025-11-17 15:39:43', 'Completed'),
-    (5428, 431, 253.74, '2025-11-17 15:38:08', 'Completed'),
-    (5429, 82, 288.71, '2025-11-17 15:40:15', 'Completed'),
-    (5430, 467, 211.47, '2025-11-17 15:39:18', 'Completed'),
-    (5431, 489, 58.57, '2025-11-17 15:39:41', 'Completed'),
-    (5432, 196, 280.56, '2025-11-17 15:36:37', 'Completed'),
-    (5433, 28, 483.1, '2025-11-17 15:38:44', 'Completed'),
-    (5434, 401, 198.41, '2025-11-17 15:35:08', 'Completed'),
-    (5435, 106, 105.68, '2025-11-17 15:40:56', 'Completed'),
-    (5436, 273, 437.19, '2025-11-17 15:36:35', 'Completed'),
-    (5437, 343, 478.23, '2025-11-17 15:35:54', 'Completed'),
-    (5438, 82, 110.42, '2025-11-17 15:37:55', 'Completed'),
-    (5439, 405, 59.88, '2025-11-17 15:40:07', 'Completed'),
-    (5440, 202, 111.6, '2025-11-17 15:34:58', 'Pending'),
-    (5441, 85, 193.91, '2025-11-17 15:36:27', 'Refunded'),
-    (5442, 278, 234.27, '2025-11-17 15:37:36', 'Completed'),
-    (5443, 179, 70.15, '2025-11-17 15:38:04', 'Pending'),
-    (5444, 155, 135.42, '2025-11-17 15:35:28', 'Completed'),
-    (5445, 380, 332.68, '2025-11-17 15:40:48', 'Completed'),
-    (5446, 248, 248.76, '2025-11-17 15:39:23', 'Completed'),
-    (5447, 352, 477.79, '2025-11-17 15:39:08', 'Completed'),
-    (5448, 242, 116.72, '2025-11-17 15:38:17', 'Completed'),
-    (5449, 242, 170.86, '2025-11-17 15:36:28', 'Completed'),
-    (5450, 485, 139.69, '2025-11-17 15:38:47', 'Completed'),
-    (5451, 118, 33.92, '2025-11-17 15:38:58', 'Completed'),
-    (5452, 418, 47.69, '2025-11-17 15:39:47', 'Completed'),
-    (5453, 230, 144.39, '2025-11-17 15:36:09', 'Pending'),
-    (5454, 499, 224.54, '2025-11-17 15:36:31', 'Completed'),
-    (5455, 159, 407.86, '2025-11-17 15:36:17', 'Pending'),
-    (5456, 110, 288.53, '2025-11-17 15:39:51', 'Pending'),
-    (5457, 183, 81.38, '2025-11-17 15:38:14', 'Completed'),
-    (5458, 28, 377.85, '2025-11-17 15:35:54', 'Completed'),
-    (5459, 465, 196.88, '2025-11-17 15:39:40', 'Completed'),
-    (5460, 423, 411.29, '2025-11-17 15:36:01', 'Completed'),
-    (5461, 277, 276.91, '2025-11-17 15:38:22', 'Completed'),
-    (5462, 372, 395.1, '2025-11-17 15:36:35', 'Completed'),
-    (5463, 496, 441.75, '2025-11-17 15:39:22', 'Completed'),
-    (5464, 246, 74.02, '2025-11-17 15:34:56', 'Pending'),
-    (5465, 471, 436.62, '2025-11-17 15:37:46', 'Completed'),
-    (5466, 189, 173.41, '2025-11-17 15:36:02', 'Completed'),
-    (5467, 212, 441.04, '2025-11-17 15:39:30', 'Pending'),
-    (5468, 465, 249.28, '2025-11-17 15:34:56', 'Completed'),
-    (5469, 190, 474.89, '2025-11-17 15:39:31', 'Completed'),
-    (5470, 347, 129.28, '2025-11-17 15:39:02', 'Completed'),
-    (5471, 196, 305.04, '2025-11-17 15:37:49', 'Completed'),
-    (5472, 94, 56.47, '2025-11-17 15:40:21', 'Pending'),
-    (5473, 287, 322.88, '2025-11-17 15:35:56', 'Pending'),
-    (5474, 355, 304.0, '2025-11-17 15:34:56', 'Pending'),
-    (5475, 185, 143.5, '2025-11-17 15:40:25', 'Completed'),
-    (5476, 185, 403.97, '2025-11-17 15:40:02', 'Completed'),
-    (5477, 197, 230.94, '2025-11-17 15:37:06', 'Refunded'),
-    (5478, 489, 162.4, '2025-11-17 15:37:28', 'Pending'),
-    (5479, 82, 126.07, '2025-11-17 15:35:52', 'Pending'),
-    (5480, 233, 458.26, '2025-11-17 15:36:32', 'Completed'),
-    (5481, 89, 258.18, '2025-11-17 15:38:08', 'Completed'),
-    (5482, 29, 163.87, '2025-11-17 15:38:44', 'Pending'),
-    (5483, 240, 442.71, '2025-11-17 15:35:20', 'Refunded'),
-    (5484, 273, 84.61, '2025-11-17 15:40:42', 'Completed'),
-    (5485, 262, 466.01, '2025-11-17 15:40:46', 'Completed'),
-    (5486, 197, 44.6, '2025-11-17 15:35:49', 'Completed'),
-    (5487, 407, 453.78, '2025-11-17 15:40:48', 'Completed'),
-    (5488, 199, 190.56, '2025-11-17 15:37:23', 'Completed'),
-    (5489, 457, 157.76, '2025-11-17 15:38:51', 'Completed'),
-    (5490, 19, 136.5, '2025-11-17 15:39:51', 'Completed'),
-    (5491, 81, 173.09, '2025-11-17 15:38:43', 'Refunded'),
-    (5492, 168, 444.38, '2025-11-17 15:39:21', 'Completed'),
-    (5493, 141, 113.9, '2025-11-17 15:40:50', 'Completed'),
-    (5494, 233, 23.13, '2025-11-17 15:36:25', 'Completed'),
-    (5495, 106, 228.01, '2025-11-17 15:35:25', 'Completed'),
-    (5496, 37, 348.94, '2025-11-17 15:38:50', 'Completed'),
-    (5497, 205, 446.42, '2025-11-17 15:37:30', 'Completed'),
-    (5498, 291, 218.64, '2025-11-17 15:35:53', 'Completed'),
-    (5499, 205, 58.11, '2025-11-17 15:35:55', 'Completed'),
-    (5500, 479, 236.98, '2025-11-17 15:40:06', 'Completed'),
-    (5501, 168, 422.56, '2025-11-17 15:38:55', 'Completed'),
-    (5502, 448, 446.13, '2025-11-17 15:39:19', 'Completed'),
-    (5503, 455, 182.09, '2025-11-17 15:38:36', 'Pending'),
-    (5504, 278, 88.33, '2025-11-17 15:37:29', 'Pending'),
-    (5505, 485, 242.08, '2025-11-17 15:37:46', 'Pending'),
-    (5506, 76, 67.01, '2025-11-17 15:38:49', 'Completed'),
-    (5507, 496, 47.83, '2025-11-17 15:35:52', 'Completed'),
-    (5508, 248, 413.98, '2025-11-17 15:36:02', 'Completed'),
-    (5509, 418, 465.33, '2025-11-17 15:39:55', 'Pending'),
-    (5510, 474, 388.54, '2025-11-17 15:35:20', 'Completed'),
-    (5511, 421, 107.02, '2025-11-17 15:37:00', 'Completed'),
-    (5512, 378, 237.1, '2025-11-17 15:36:14', 'Completed'),
-    (5513, 499, 143.1, '2025-11-17 15:36:39', 'Pending'),
-    (5514, 296, 300.43, '2025-11-17 15:37:57', 'Pending'),
-    (5515, 12, 50.31, '2025-11-17 15:36:48', 'Completed'),
-    (5516, 19, 419.89, '2025-11-17 15:36:31', 'Pending'),
-    (5517, 106, 188.24, '2025-11-17 15:39:29', 'Pending'),
-    (5518, 52, 262.89, '2025-11-17 15:37:27', 'Completed'),
-    (5519, 185, 223.76, '2025-11-17 15:37:29', 'Completed'),
-    (5520, 422, 394.1, '2025-11-17 15:39:34', 'Pending'),
-    (5521, 466, 201.22, '2025-11-17 15:36:31', 'Pending'),
-    (5522, 445, 152.79, '2025-11-17 15:35:58', 'Completed'),
-    (5523, 242, 488.12, '2025-11-17 15:39:24', 'Completed'),
-    (5524, 215, 330.57, '2025-11-17 15:35:08', 'Completed'),
-    (5525, 97, 236.34, '2025-11-17 15:34:58', 'Refunded'),
-    (5526, 198, 51.66, '2025-11-17 15:38:30', 'Completed'),
-    (5527, 113, 251.89, '2025-11-17 15:39:08', 'Completed'),
-    (5528, 288, 473.56, '2025-11-17 15:39:30', 'Completed'),
-    (5529, 210, 377.93, '2025-11-17 15:40:21', 'Pending'),
-    (5530, 422, 234.12, '2025-11-17 15:40:52', 'Refunded'),
-    (5531, 126, 248.69, '2025-11-17 15:39:02', 'Pending'),
-    (5532, 386, 461.33, '2025-11-17 15:35:03', 'Completed'),
-    (5533, 242, 456.92, '2025-11-17 15:39:23', 'Completed'),
-    (5534, 242, 84.92, '2025-11-17 15:36:05', 'Completed'),
-    (5535, 77, 413.75, '2025-11-17 15:37:14', 'Pending'),
-    (5536, 493, 199.52, '2025-11-17 15:35:55', 'Completed'),
-    (5537, 110, 22.04, '2025-11-17 15:36:31', 'Completed'),
-    (5538, 203, 123.77, '2025-11-17 15:38:16', 'Completed'),
-    (5539, 313, 470.4, '2025-11-17 15:35:18', 'Completed'),
-    (5540, 183, 348.93, '2025-11-17 15:35:57', 'Completed'),
-    (5541, 179, 456.66, '2025-11-17 15:40:49', 'Completed'),
-    (5542, 274, 103.74, '2025-11-17 15:37:35', 'Pending'),
-    (5543, 5, 355.7, '2025-11-17 15:36:14', 'Pending'),
-    (5544, 205, 38.3, '2025-11-17 15:38:59', 'Pending'),
-    (5545, 302, 161.22, '2025-11-17 15:35:44', 'Completed'),
-    (5546, 458, 375.14, '2025-11-17 15:38:08', 'Pending'),
-    (5547, 433, 484.07, '2025-11-17 15:36:01', 'Pending'),
-    (5548, 196, 35.23, '2025-11-17 15:36:29', 'Completed'),
-    (5549, 149, 204.59, '2025-11-17 15:38:29', 'Completed'),
-    (5550, 499, 166.51, '2025-11-17 15:38:20', 'Completed'),
-    (5551, 32, 169.29, '2025-11-17 15:35:43', 'Refunded'),
-    (5552, 46, 151.33, '2025-11-17 15:38:50', 'Completed'),
-    (5553, 433, 141.9, '2025-11-17 15:39:39', 'Completed'),
-    (5554, 176, 166.9, '2025-11-17 15:38:11', 'Completed'),
-    (5555, 2, 114.96, '2025-11-17 15:37:08', 'Completed'),
-    (5556, 132, 189.28, '2025-11-17 15:35:54', 'Pending'),
-    (5557, 82, 467.67, '2025-11-17 15:38:13', 'Completed'),
-    (5558, 272, 260.8, '2025-11-17 15:40:05', 'Completed'),
-    (5559, 210, 73.27, '2025-11-17 15:39:11', 'Completed'),
-    (5560, 116, 81.3, '2025-11-17 15:37:31', 'Completed'),
-    (5561, 372, 316.62, '2025-11-17 15:39:53', 'Completed'),
-    (5562, 314, 322.87, '2025-11-17 15:35:47', 'Completed'),
-    (5563, 183, 322.96, '2025-11-17 15:40:14', 'Completed'),
-    (5564, 210, 150.68, '2025-11-17 15:39:48', 'Completed'),
-    (5565, 215, 454.18, '2025-11-17 15:38:38', 'Refunded'),
-    (5566, 85, 200.15, '2025-11-17 15:37:57', 'Completed'),
-    (5567, 158, 288.41, '2025-11-17 15:40:45', 'Completed'),
-    (5568, 494, 166.9, '2025-11-17 15:36:25', 'Completed'),
-    (5569, 214, 141.05, '2025-11-17 15:39:42', 'Refunded'),
-    (5570, 31, 20.21, '2025-11-17 15:35:17', 'Pending'),
-    (5571, 372, 203.41, '2025-11-17 15:35:27', 'Completed'),
-    (5572, 436, 32.32, '2025-11-17 15:36:30', 'Completed'),
-    (5573, 394, 404.05, '2025-11-17 15:37:54', 'Pending'),
-    (5574, 54, 22.67, '2025-11-17 15:39:00', 'Completed'),
-    (5575, 491, 307.81, '2025-11-17 15:36:34', 'Completed'),
-    (5576, 252, 82.82, '2025-11-17 15:35:29', 'Completed'),
-    (5577, 246, 394.8, '2025-11-17 15:39:30', 'Pending'),
-    (5578, 274, 110.92, '2025-11-17 15:40:16', 'Completed'),
-    (5579, 491, 243.45, '2025-11-17 15:40:06', 'Completed'),
-    (5580, 185, 118.11, '2025-11-17 15:37:31', 'Completed'),
-    (5581, 2, 405.65, '2025-11-17 15:38:40', 'Refunded'),
-    (5582, 197, 102.77, '2025-11-17 15:35:57', 'Completed'),
-    (5583, 19, 114.56, '2025-11-17 15:40:08', 'Completed'),
-    (5584, 199, 236.27, '2025-11-17 15:38:54', 'Completed'),
-    (5585, 252, 165.96, '2025-11-17 15:36:35', 'Completed'),
-    (5586, 355, 320.41, '2025-11-17 15:40:54', 'Completed'),
-    (5587, 464, 155.08, '2025-11-17 15:38:05', 'Completed'),
-    (5588, 82, 216.11, '2025-11-17 15:37:21', 'Completed'),
-    (5589, 307, 240.83, '2025-11-17 15:37:36', 'Completed'),
-    (5590, 485, 446.41, '2025-11-17 15:39:28', 'Pending'),
-    (5591, 85, 49.41, '2025-11-17 15:40:10', 'Completed'),
-    (5592, 216, 281.29, '2025-11-17 15:36:22', 'Completed'),
-    (5593, 199, 388.93, '2025-11-17 15:35:15', 'Completed'),
-    (5594, 471, 276.55, '2025-11-17 15:38:00', 'Completed'),
-    (5595, 421, 130.91, '2025-11-17 15:36:09', 'Completed'),
-    (5596, 46, 266.06, '2025-11-17 15:40:25', 'Completed'),
-    (5597, 33, 238.22, '2025-11-17 15:39:11', 'Completed'),
-    (5598, 380, 368.2, '2025-11-17 15:36:45', 'Pending'),
-    (5599, 288, 114.12, '2025-11-17 15:38:04', 'Pending'),
-    (5600, 196, 135.52, '2025-11-17 15:40:40', 'Completed'),
-    (5601, 86, 278.49, '2025-11-17 15:39:28', 'Completed'),
-    (5602, 97, 212.52, '2025-11-17 15:35:18', 'Completed'),
-    (5603, 344, 59.31, '2025-11-17 15:36:09', 'Completed'),
-    (5604, 239, 430.11, '2025-11-17 15:37:54', 'Completed'),
-    (5605, 132, 199.04, '2025-11-17 15:35:26', 'Pending'),
-    (5606, 189, 407.67, '2025-11-17 15:36:53', 'Completed'),
-    (5607, 230, 165.65, '2025-11-17 15:39:37', 'Refunded'),
-    (5608, 443, 367.99, '2025-11-17 15:36:52', 'Completed'),
-    (5609, 28, 329.38, '2025-11-17 15:35:16', 'Completed'),
-    (5610, 443, 430.88, '2025-11-17 15:36:31', 'Refunded'),
-    (5611, 479, 311.92, '2025-11-17 15:40:31', 'Completed'),
-    (5612, 38, 51.95, '2025-11-17 15:37:34', 'Refunded'),
-    (5613, 310, 184.6, '2025-11-17 15:36:48', 'Completed'),
-    (5614, 344, 63.39, '2025-11-17 15:40:53', 'Completed'),
-    (5615, 190, 188.31, '2025-11-17 15:34:56', 'Completed'),
-    (5616, 35, 335.54, '2025-11-17 15:40:00', 'Completed'),
-    (5617, 28, 194.46, '2025-11-17 15:38:22', 'Completed'),
-    (5618, 94, 310.05, '2025-11-17 15:35:52', 'Completed'),
-    (5619, 413, 164.65, '2025-11-17 15:40:21', 'Completed'),
-    (5620, 29, 348.52, '2025-11-17 15:35:08', 'Completed'),
-    (5621, 200, 33.11, '2025-11-17 15:39:53', 'Refunded'),
-    (5622, 118, 499.24, '2025-11-17 15:35:54', 'Pending'),
-    (5623, 276, 196.16, '2025-11-17 15:36:56', 'Completed'),
-    (5624, 248, 26.54, '2025-11-17 15:35:57', 'Completed'),
-    (5625, 246, 225.68, '2025-11-17 15:38:16', 'Pending'),
-    (5626, 394, 371.83, '2025-11-17 15:39:13', 'Completed'),
-    (5627, 493, 70.85, '2025-11-17 15:36:51', 'Pending'),
-    (5628, 215, 72.59, '2025-11-17 15:36:33', 'Completed'),
-    (5629, 481, 477.16, '2025-11-17 15:36:08', 'Completed'),
-    (5630, 168, 499.47, '2025-11-17 15:35:31', 'Completed'),
-    (5631, 26, 108.34, '2025-11-17 15:39:00', 'Completed'),
-    (5632, 75, 21.16, '2025-11-17 15:40:10', 'Completed'),
-    (5633, 204, 60.29, '2025-11-17 15:36:06', 'Completed'),
-    (5634, 378, 367.43, '2025-11-17 15:40:09', 'Completed'),
-    (5635, 360, 369.99, '2025-11-17 15:37:14', 'Pending'),
-    (5636, 405, 213.91, '2025-11-17 15:38:10', 'Refunded'),
-    (5637, 190, 309.7, '2025-11-17 15:36:07', 'Completed'),
-    (5638, 457, 247.82, '2025-11-17 15:35:37', 'Completed'),
-    (5639, 493, 136.07, '2025-11-17 15:39:38', 'Completed'),
-    (5640, 183, 352.82, '2025-11-17 15:38:45', 'Pending'),
-    (5641, 264, 236.93, '2025-11-17 15:39:09', 'Completed'),
-    (5642, 471, 234.99, '2025-11-17 15:39:37', 'Completed'),
-    (5643, 464, 77.29, '2025-11-17 15:38:55', 'Completed'),
-    (5644, 19, 376.57, '2025-11-17 15:39:28', 'Completed'),
-    (5645, 414, 22.15, '2025-11-17 15:38:50', 'Completed'),
-    (5646, 211, 146.44, '2025-11-17 15:37:57', 'Completed'),
-    (5647, 132, 103.64, '2025-11-17 15:39:30', 'Completed'),
-    (5648, 76, 409.87, '2025-11-17 15:35:30', 'Refunded'),
-    (5649, 448, 193.31, '2025-11-17 15:37:11', 'Completed'),
-    (5650, 85, 311.39, '2025-11-17 15:37:04', 'Completed'),
-    (5651, 51, 392.73, '2025-11-17 15:35:14', 'Completed'),
-    (5652, 205, 206.62, '2025-11-17 15:38:33', 'Completed'),
-    (5653, 82, 71.59, '2025-11-17 15:37:52', 'Completed'),
-    (5654, 296, 47.42, '2025-11-17 15:37:04', 'Completed'),
-    (5655, 479, 294.03, '2025-11-17 15:38:26', 'Completed'),
-    (5656, 489, 160.37, '2025-11-17 15:38:21', 'Completed'),
-    (5657, 116, 386.96, '2025-11-17 15:40:37', 'Completed'),
-    (5658, 31, 29.69, '2025-11-17 15:40:53', 'Completed'),
-    (5659, 94, 166.93, '2025-11-17 15:35:29', 'Completed'),
-    (5660, 314, 101.97, '2025-11-17 15:37:28', 'Completed'),
-    (5661, 413, 256.13, '2025-11-17 15:34:59', 'Completed'),
-    (5662, 49, 363.49, '2025-11-17 15:39:23', 'Completed'),
-    (5663, 491, 386.88, '2025-11-17 15:38:50', 'Pending'),
-    (5664, 12, 193.12, '2025-11-17 15:38:58', 'Pending'),
-    (5665, 7, 316.67, '2025-11-17 15:36:32', 'Completed'),
-    (5666, 139, 423.09, '2025-11-17 15:38:30', 'Completed'),
-    (5667, 313, 272.69, '2025-11-17 15:39:42', 'Pending'),
-    (5668, 2, 449.83, '2025-11-17 15:37:21', 'Refunded'),
-    (5669, 222, 64.32, '2025-11-17 15:36:35', 'Completed'),
-    (5670, 89, 56.45, '2025-11-17 15:36:06', 'Completed'),
-    (5671, 190, 408.69, '2025-11-17 15:35:45', 'Pending'),
-    (5672, 448, 51.98, '2025-11-17 15:39:07', 'Completed'),
-    (5673, 40, 226.32, '2025-11-17 15:36:19', 'Completed'),
-    (5674, 76, 28.8, '2025-11-17 15:38:55', 'Completed'),
-    (5675, 365, 304.23, '2025-11-17 15:35:11', 'Completed'),
-    (5676, 220, 63.25, '2025-11-17 15:37:20', 'Completed'),
-    (5677, 210, 311.9, '2025-11-17 15:38:43', 'Completed'),
-    (5678, 344, 194.29, '2025-11-17 15:37:11', 'Completed'),
-    (5679, 464, 210.74, '2025-11-17 15:38:04', 'Completed'),
-    (5680, 383, 259.11, '2025-11-17 15:36:41', 'Pending'),
-    (5681, 378, 126.96, '2025-11-17 15:39:14', 'Completed'),
-    (5682, 26, 397.15, '2025-11-17 15:39:00', 'Completed'),
-    (5683, 2, 179.6, '2025-11-17 15:38:57', 'Pending'),
-    (5684, 179, 119.49, '2025-11-17 15:40:21', 'Completed'),
-    (5685, 89, 46.39, '2025-11-17 15:36:43', 'Completed'),
-    (5686, 106, 231.63, '2025-11-17 15:39:41', 'Completed'),
-    (5687, 190, 111.39, '2025-11-17 15:40:02', 'Completed'),
-    (5688, 105, 214.11, '2025-11-17 15:35:09', 'Completed'),
-    (5689, 344, 201.55, '2025-11-17 15:35:13', 'Completed'),
-    (5690, 499, 478.37, '2025-11-17 15:39:28', 'Completed'),
-    (5691, 291, 63.22, '2025-11-17 15:40:23', 'Completed'),
-    (5692, 202, 323.59, '2025-11-17 15:34:57', 'Refunded'),
-    (5693, 443, 218.05, '2025-11-17 15:39:23', 'Pending'),
-    (5694, 222, 200.38, '2025-11-17 15:39:36', 'Completed'),
-    (5695, 378, 443.76, '2025-11-17 15:35:44', 'Completed'),
-    (5696, 119, 123.01, '2025-11-17 15:36:29', 'Completed'),
-    (5697, 89, 407.57, '2025-11-17 15:37:48', 'Completed'),
-    (5698, 122, 145.22, '2025-11-17 15:39:25', 'Completed'),
-    (5699, 205, 31.42, '2025-11-17 15:39:41', 'Completed'),
-    (5700, 100, 320.69, '2025-11-17 15:37:39', 'Pending'),
-    (5701, 423, 312.16, '2025-11-17 15:36:33', 'Pending'),
-    (5702, 421, 44.87, '2025-11-17 15:38:11', 'Refunded'),
-    (5703, 158, 332.78, '2025-11-17 15:39:46', 'Completed'),
-    (5704, 198, 344.01, '2025-11-17 15:35:59', 'Completed'),
-    (5705, 264, 425.94, '2025-11-17 15:35:29', 'Completed'),
-    (5706, 105, 50.89, '2025-11-17 15:37:56', 'Completed'),
-    (5707, 327, 181.08, '2025-11-17 15:37:31', 'Completed'),
-    (5708, 394, 95.76, '2025-11-17 15:39:40', 'Completed'),
-    (5709, 479, 203.06, '2025-11-17 15:39:43', 'Refunded'),
-    (5710, 212, 390.82, '2025-11-17 15:36:38', 'Completed'),
-    (5711, 190, 184.33, '2025-11-17 15:38:58', 'Completed'),
-    (5712, 54, 332.63, '2025-11-17 15:38:18', 'Completed'),
-    (5713, 29, 469.36, '2025-11-17 15:35:42', 'Refunded'),
-    (5714, 28, 420.42, '2025-11-17 15:40:11', 'Completed'),
-    (5715, 471, 430.99, '2025-11-17 15:39:35', 'Completed'),
-    (5716, 494, 210.38, '2025-11-17 15:37:48', 'Pending'),
-    (5717, 493, 482.77, '2025-11-17 15:38:31', 'Pending'),
-    (5718, 149, 340.99, '2025-11-17 15:38:50', 'Completed'),
-    (5719, 97, 417.0, '2025-11-17 15:40:54', 'Completed'),
-    (5720, 204, 111.6, '2025-11-17 15:36:31', 'Refunded'),
-    (5721, 199, 448.47, '2025-11-17 15:35:14', 'Pending'),
-    (5722, 115, 463.89, '2025-11-17 15:34:57', 'Completed'),
-    (5723, 491, 76.86, '2025-11-17 15:35:47', 'Completed'),
-    (5724, 200, 81.8, '2025-11-17 15:36:55', 'Completed'),
-    (5725, 405, 277.7, '2025-11-17 15:38:24', 'Completed'),
-    (5726, 189, 391.01, '2025-11-17 15:37:04', 'Completed'),
-    (5727, 499, 255.56, '2025-11-17 15:35:27', 'Completed'),
-    (5728, 485, 320.83, '2025-11-17 15:39:21', 'Completed'),
-    (5729, 335, 488.13, '2025-11-17 15:35:51', 'Completed'),
-    (5730, 19, 497.09, '2025-11-17 15:39:51', 'Completed'),
-    (5731, 347, 271.64, '2025-11-17 15:39:21', 'Completed'),
-    (5732, 347, 350.19, '2025-11-17 15:36:26', 'Completed'),
-    (5733, 310, 183.33, '2025-11-17 15:39:09', 'Pending'),
-    (5734, 386, 351.82, '2025-11-17 15:39:15', 'Completed'),
-    (5735, 440, 128.88, '2025-11-17 15:36:52', 'Pending'),
-    (5736, 155, 131.3, '2025-11-17 15:37:36', 'Completed'),
-    (5737, 386, 49.88, '2025-11-17 15:38:43', 'Completed'),
-    (5738, 204, 138.26, '2025-11-17 15:38:03', 'Completed'),
-    (5739, 414, 196.87, '2025-11-17 15:40:54', 'Pending'),
-    (5740, 301, 340.3, '2025-11-17 15:35:43', 'Refunded'),
-    (5741, 443, 133.16, '2025-11-17 15:40:43', 'Completed'),
-    (5742, 262, 132.43, '2025-11-17 15:37:09', 'Pending'),
-    (5743, 40, 57.35, '2025-11-17 15:37:24', 'Completed'),
-    (5744, 143, 499.99, '2025-11-17 15:38:25', 'Pending'),
-    (5745, 491, 339.21, '2025-11-17 15:36:42', 'Refunded'),
-    (5746, 262, 274.17, '2025-11-17 15:36:55', 'Completed'),
-    (5747, 383, 494.76, '2025-11-17 15:40:28', 'Pending'),
-    (5748, 113, 413.85, '2025-11-17 15:40:15', 'Completed'),
-    (5749, 397, 158.23, '2025-11-17 15:38:09', 'Pending'),
-    (5750, 139, 201.96, '2025-11-17 15:35:02', 'Refunded'),
-    (5751, 422, 130.45, '2025-11-17 15:35:21', 'Completed'),
-    (5752, 372, 413.14, '2025-11-17 15:38:58', 'Completed'),
-    (5753, 75, 312.29, '2025-11-17 15:35:00', 'Pending'),
-    (5754, 155, 62.5, '2025-11-17 15:35:46', 'Refunded'),
-    (5755, 75, 291.73, '2025-11-17 15:36:00', 'Completed'),
-    (5756, 458, 177.71, '2025-11-17 15:35:29', 'Pending'),
-    (5757, 278, 439.59, '2025-11-17 15:38:55', 'Completed'),
-    (5758, 239, 463.13, '2025-11-17 15:35:51', 'Completed'),
-    (5759, 240, 362.25, '2025-11-17 15:37:32', 'Completed'),
-    (5760, 287, 345.51, '2025-11-17 15:39:20', 'Completed'),
-    (5761, 436, 52.19, '2025-11-17 15:37:06', 'Pending'),
-    (5762, 449, 455.56, '2025-11-17 15:36:33', 'Completed'),
-    (5763, 141, 306.52, '2025-11-17 15:38:38', 'Completed'),
-    (5764, 37, 495.71, '2025-11-17 15:36:40', 'Completed'),
-    (5765, 126, 30.91, '2025-11-17 15:37:55', 'Completed'),
-    (5766, 199, 27.18, '2025-11-17 15:35:04', 'Pending'),
-    (5767, 126, 474.55, '2025-11-17 15:40:40', 'Completed'),
-    (5768, 239, 247.88, '2025-11-17 15:37:58', 'Completed'),
-    (5769, 252, 167.08, '2025-11-17 15:36:18', 'Completed'),
-    (5770, 246, 414.15, '2025-11-17 15:38:54', 'Completed'),
-    (5771, 392, 331.28, '2025-11-17 15:38:56', 'Completed'),
-    (5772, 139, 167.15, '2025-11-17 15:35:53', 'Completed'),
-    (5773, 349, 410.25, '2025-11-17 15:36:00', 'Completed'),
-    (5774, 264, 216.76, '2025-11-17 15:35:59', 'Completed'),
-    (5775, 105, 325.58, '2025-11-17 15:35:58', 'Completed'),
-    (5776, 92, 196.76, '2025-11-17 15:39:07', 'Completed'),
-    (5777, 222, 339.5, '2025-11-17 15:38:36', 'Completed'),
-    (5778, 214, 237.3, '2025-11-17 15:36:33', 'Completed'),
-    (5779, 152, 194.62, '2025-11-17 15:39:25', 'Completed'),
-    (5780, 222, 499.9, '2025-11-17 15:38:07', 'Completed'),
-    (5781, 414, 371.68, '2025-11-17 15:40:08', 'Completed'),
-    (5782, 496, 314.8, '2025-11-17 15:37:14', 'Completed'),
-    (5783, 457, 407.4, '2025-11-17 15:36:42', 'Pending'),
-    (5784, 313, 438.36, '2025-11-17 15:37:11', 'Completed'),
-    (5785, 139, 74.66, '2025-11-17 15:40:05', 'Completed'),
-    (5786, 422, 48.65, '2025-11-17 15:40:54', 'Pending'),
-    (5787, 407, 49.05, '2025-11-17 15:40:41', 'Completed'),
-    (5788, 42, 165.58, '2025-11-17 15:35:14', 'Pending'),
-    (5789, 349, 24.86, '2025-11-17 15:37:36', 'Completed'),
-    (5790, 248, 106.44, '2025-11-17 15:36:54', 'Completed'),
-    (5791, 67, 242.43, '2025-11-17 15:36:03', 'Completed'),
-    (5792, 113, 289.06, '2025-11-17 15:37:06', 'Completed'),
-    (5793, 97, 352.73, '2025-11-17 15:36:55', 'Completed'),
-    (5794, 82, 42.73, '2025-11-17 15:35:42', 'Completed'),
-    (5795, 97, 278.41, '2025-11-17 15:36:50', 'Completed'),
-    (5796, 307, 172.96, '2025-11-17 15:38:59', 'Pending'),
-    (5797, 158, 450.1, '2025-11-17 15:38:57', 'Completed'),
-    (5798, 458, 91.58, '2025-11-17 15:40:13', 'Completed'),
-    (5799, 37, 168.18, '2025-11-17 15:35:49', 'Completed'),
-    (5800, 143, 338.6, '2025-11-17 15:38:36', 'Refunded'),
-    (5801, 257, 457.21, '2025-11-17 15:40:45', 'Pending'),
-    (5802, 170, 256.46, '2025-11-17 15:40:39', 'Completed'),
-    (5803, 380, 313.59, '2025-11-17 15:37:43', 'Pending'),
-    (5804, 299, 445.84, '2025-11-17 15:39:44', 'Completed'),
-    (5805, 373, 205.85, '2025-11-17 15:38:04', 'Completed'),
-    (5806, 276, 250.07, '2025-11-17 15:36:41', 'Pending'),
-    (5807, 233, 180.27, '2025-11-17 15:39:50', 'Completed'),
-    (5808, 81, 21.91, '2025-11-17 15:35:36', 'Pending'),
-    (5809, 203, 221.49, '2025-11-17 15:38:49', 'Completed'),
-    (5810, 212, 309.1, '2025-11-17 15:36:36', 'Completed'),
-    (5811, 307, 239.79, '2025-11-17 15:39:42', 'Pending'),
-    (5812, 214, 285.65, '2025-11-17 15:35:44', 'Completed'),
-    (5813, 198, 276.63, '2025-11-17 15:40:14', 'Completed'),
-    (5814, 79, 287.86, '2025-11-17 15:35:07', 'Completed'),
-    (5815, 100, 258.74, '2025-11-17 15:40:37', 'Completed'),
-    (5816, 54, 257.41, '2025-11-17 15:38:17', 'Completed'),
-    (5817, 139, 466.89, '2025-11-17 15:37:13', 'Completed'),
-    (5818, 199, 40.09, '2025-11-17 15:36:57', 'Refunded'),
-    (5819, 12, 368.13, '2025-11-17 15:35:00', 'Completed'),
-    (5820, 493, 65.54, '2025-11-17 15:38:17', 'Pending'),
-    (5821, 331, 363.18, '2025-11-17 15:35:06', 'Completed'),
-    (5822, 49, 402.6, '2025-11-17 15:35:29', 'Completed'),
-    (5823, 32, 209.93, '2025-11-17 15:40:45', 'Completed'),
-    (5824, 241, 200.1, '2025-11-17 15:37:13', 'Completed'),
-    (5825, 288, 305.61, '2025-11-17 15:35:37', 'Pending'),
-    (5826, 445, 290.32, '2025-11-17 15:39:22', 'Completed'),
-    (5827, 230, 354.15, '2025-11-17 15:37:37', 'Completed'),
-    (5828, 75, 124.81, '2025-11-17 15:40:11', 'Completed'),
-    (5829, 113, 474.2, '2025-11-17 15:35:43', 'Completed'),
-    (5830, 239, 64.72, '2025-11-17 15:38:59', 'Completed'),
-    (5831, 473, 299.77, '2025-11-17 15:38:58', 'Completed'),
-    (5832, 276, 428.32, '2025-11-17 15:35:31', 'Completed'),
-    (5833, 183, 139.93, '2025-11-17 15:35:17', 'Completed'),
-    (5834, 299, 247.94, '2025-11-17 15:35:48', 'Completed'),
-    (5835, 77, 375.38, '2025-11-17 15:38:19', 'Pending'),
-    (5836, 205, 112.62, '2025-11-17 15:40:03', 'Completed'),
-    (5837, 27, 124.15, '2025-11-17 15:40:29', 'Completed'),
-    (5838, 92, 228.73, '2025-11-17 15:35:47', 'Completed'),
-    (5839, 159, 80.48, '2025-11-17 15:36:47', 'Pending'),
-    (5840, 205, 40.61, '2025-11-17 15:38:23', 'Pending'),
-    (5841, 158, 101.12, '2025-11-17 15:37:02', 'Completed'),
-    (5842, 12, 145.93, '2025-11-17 15:37:42', 'Pending'),
-    (5843, 92, 262.18, '2025-11-17 15:36:30', 'Completed'),
-    (5844, 465, 95.3, '2025-11-17 15:35:32', 'Completed'),
-    (5845, 355, 122.59, '2025-11-17 15:36:16', 'Completed'),
-    (5846, 494, 306.6, '2025-11-17 15:36:45', 'Completed'),
-    (5847, 27, 239.92, '2025-11-17 15:36:51', 'Completed'),
-    (5848, 252, 169.92, '2025-11-17 15:35:01', 'Completed'),
-    (5849, 200, 142.01, '2025-11-17 15:36:55', 'Refunded'),
-    (5850, 190, 224.44, '2025-11-17 15:39:10', 'Refunded'),
-    (5851, 119, 163.08, '2025-11-17 15:36:08', 'Pending'),
-    (5852, 414, 348.59, '2025-11-17 15:37:50', 'Completed'),
-    (5853, 277, 234.23, '2025-11-17 15:38:15', 'Completed'),
-    (5854, 188, 268.54, '2025-11-17 15:35:12', 'Pending'),
-    (5855, 264, 376.61, '2025-11-17 15:38:44', 'Completed'),
-    (5856, 7, 180.87, '2025-11-17 15:37:21', 'Completed'),
-    (5857, 491, 124.68, '2025-11-17 15:40:21', 'Completed'),
-    (5858, 118, 184.13, '2025-11-17 15:36:07', 'Completed'),
-    (5859, 387, 171.98, '2025-11-17 15:35:49', 'Completed'),
-    (5860, 288, 421.57, '2025-11-17 15:39:53', 'Completed'),
-    (5861, 443, 283.26, '2025-11-17 15:35:29', 'Pending'),
-    (5862, 387, 291.49, '2025-11-17 15:36:30', 'Completed'),
-    (5863, 465, 109.18, '2025-11-17 15:36:32', 'Completed'),
-    (5864, 141, 414.66, '2025-11-17 15:39:22', 'Completed'),
-    (5865, 155, 298.23, '2025-11-17 15:36:10', 'Completed'),
-    (5866, 97, 193.16, '2025-11-17 15:37:30', 'Completed'),
-    (5867, 166, 351.26, '2025-11-17 15:37:57', 'Completed'),
-    (5868, 331, 276.96, '2025-11-17 15:40:13', 'Completed'),
-    (5869, 301, 153.64, '2025-11-17 15:35:41', 'Refunded'),
-    (5870, 85, 370.04, '2025-11-17 15:36:24', 'Completed'),
-    (5871, 291, 257.71, '2025-11-17 15:37:19', 'Refunded'),
-    (5872, 94, 104.98, '2025-11-17 15:37:21', 'Completed'),
-    (5873, 5, 288.44, '2025-11-17 15:36:20', 'Completed'),
-    (5874, 190, 177.67, '2025-11-17 15:37:00', 'Completed'),
-    (5875, 203, 253.44, '2025-11-17 15:35:35', 'Completed'),
-    (5876, 198, 48.53, '2025-11-17 15:39:14', 'Pending'),
-    (5877, 335, 191.24, '2025-11-17 15:39:57', 'Pending'),
-    (5878, 276, 216.04, '2025-11-17 15:39:34', 'Completed'),
-    (5879, 204, 260.95, '2025-11-17 15:38:13', 'Pending'),
-    (5880, 465, 424.38, '2025-11-17 15:39:40', 'Completed'),
-    (5881, 418, 330.27, '2025-11-17 15:35:14', 'Pending'),
-    (5882, 189, 474.87, '2025-11-17 15:39:37', 'Pending'),
-    (5883, 407, 48.75, '2025-11-17 15:40:33', 'Pending'),
-    (5884, 394, 51.23, '2025-11-17 15:36:54', 'Completed'),
-    (5885, 421, 170.78, '2025-11-17 15:36:19', 'Refunded'),
-    (5886, 418, 423.06, '2025-11-17 15:35:23', 'Pending'),
-    (5887, 287, 497.66, '2025-11-17 15:39:52', 'Pending'),
-    (5888, 378, 241.53, '2025-11-17 15:40:03', 'Pending'),
-    (5889, 7, 97.37, '2025-11-17 15:39:28', 'Completed'),
-    (5890, 473, 334.22, '2025-11-17 15:35:24', 'Completed'),
-    (5891, 211, 387.39, '2025-11-17 15:35:49', 'Completed'),
-    (5892, 215, 456.77, '2025-11-17 15:40:13', 'Completed'),
-    (5893, 445, 360.76, '2025-11-17 15:35:00', 'Completed'),
-    (5894, 440, 337.81, '2025-11-17 15:34:58', 'Completed'),
-    (5895, 272, 492.87, '2025-11-17 15:38:59', 'Refunded'),
-    (5896, 183, 293.68, '2025-11-17 15:37:19', 'Refunded'),
-    (5897, 373, 385.44, '2025-11-17 15:38:39', 'Completed'),
-    (5898, 202, 342.7, '2025-11-17 15:37:12', 'Completed'),
-    (5899, 296, 362.62, '2025-11-17 15:35:11', 'Completed'),
-    (5900, 360, 49.14, '2025-11-17 15:40:39', 'Completed'),
-    (5901, 132, 336.61, '2025-11-17 15:36:03', 'Pending'),
-    (5902, 422, 445.35, '2025-11-17 15:38:46', 'Completed'),
-    (5903, 401, 221.47, '2025-11-17 15:38:17', 'Completed'),
-    (5904, 155, 176.01, '2025-11-17 15:40:13', 'Completed'),
-    (5905, 12, 51.91, '2025-11-17 15:40:08', 'Refunded'),
-    (5906, 158, 51.55, '2025-11-17 15:38:34', 'Refunded'),
-    (5907, 205, 213.17, '2025-11-17 15:36:52', 'Completed'),
-    (5908, 370, 50.7, '2025-11-17 15:39:55', 'Pending'),
-    (5909, 222, 324.57, '2025-11-17 15:37:39', 'Completed'),
-    (5910, 347, 34.01, '2025-11-17 15:38:59', 'Refunded'),
-    (5911, 277, 352.68, '2025-11-17 15:39:34', 'Completed'),
-    (5912, 481, 409.89, '2025-11-17 15:35:51', 'Completed'),
-    (5913, 139, 237.49, '2025-11-17 15:40:41', 'Completed'),
-    (5914, 190, 27.13, '2025-11-17 15:38:24', 'Completed'),
-    (5915, 242, 144.16, '2025-11-17 15:38:22', 'Pending'),
-    (5916, 352, 22.94, '2025-11-17 15:35:58', 'Pending'),
-    (5917, 203, 467.79, '2025-11-17 15:36:37', 'Pending'),
-    (5918, 371, 106.65, '2025-11-17 15:40:34', 'Completed'),
-    (5919, 152, 485.45, '2025-11-17 15:39:27', 'Pending'),
-    (5920, 494, 101.81, '2025-11-17 15:40:55', 'Completed'),
-    (5921, 85, 345.21, '2025-11-17 15:39:12', 'Completed'),
-    (5922, 115, 341.82, '2025-11-17 15:35:01', 'Pending'),
-    (5923, 372, 252.29, '2025-11-17 15:40:49', 'Completed'),
-    (5924, 291, 412.06, '2025-11-17 15:35:27', 'Pending'),
-    (5925, 212, 319.57, '2025-11-17 15:40:01', 'Completed'),
-    (5926, 203, 110.34, '2025-11-17 15:35:39', 'Completed'),
-    (5927, 67, 134.31, '2025-11-17 15:37:23', 'Completed'),
-    (5928, 242, 412.39, '2025-11-17 15:40:23', 'Completed'),
-    (5929, 92, 275.95, '2025-11-17 15:37:03', 'Refunded'),
-    (5930, 126, 410.65, '2025-11-17 15:40:54', 'Refunded'),
-    (5931, 241, 287.19, '2025-11-17 15:38:35', 'Completed'),
-    (5932, 296, 410.12, '2025-11-17 15:38:58', 'Refunded'),
-    (5933, 465, 208.13, '2025-11-17 15:38:32', 'Completed'),
-    (5934, 183, 54.61, '2025-11-17 15:36:08', 'Completed'),
-    (5935, 239, 27.12, '2025-11-17 15:35:36', 'Completed'),
-    (5936, 370, 212.19, '2025-11-17 15:39:34', 'Pending'),
-    (5937, 106, 64.47, '2025-11-17 15:35:07', 'Completed'),
-    (5938, 37, 63.51, '2025-11-17 15:35:20', 'Pending'),
-    (5939, 139, 419.23, '2025-11-17 15:35:25', 'Completed'),
-    (5940, 222, 481.7, '2025-11-17 15:38:08', 'Completed'),
-    (5941, 373, 325.7, '2025-11-17 15:35:52', 'Completed'),
-    (5942, 213, 59.65, '2025-11-17 15:36:33', 'Completed'),
-    (5943, 360, 212.64, '2025-11-17 15:38:46', 'Pending'),
-    (5944, 139, 291.59, '2025-11-17 15:37:30', 'Completed'),
-    (5945, 40, 163.19, '2025-11-17 15:39:34', 'Completed'),
-    (5946, 474, 371.52, '2025-11-17 15:36:23', 'Pending'),
-    (5947, 397, 448.32, '2025-11-17 15:38:29', 'Completed'),
-    (5948, 273, 194.0, '2025-11-17 15:37:46', 'Completed'),
-    (5949, 264, 364.48, '2025-11-17 15:39:22', 'Pending'),
-    (5950, 481, 357.09, '2025-11-17 15:40:17', 'Completed'),
-    (5951, 205, 139.76, '2025-11-17 15:37:13', 'Completed'),
-    (5952, 188, 81.87, '2025-11-17 15:36:30', 'Refunded'),
-    (5953, 155, 140.83, '2025-11-17 15:35:45', 'Completed'),
-    (5954, 197, 404.8, '2025-11-17 15:40:18', 'Completed'),
-    (5955, 383, 248.0, '2025-11-17 15:39:02', 'Completed'),
-    (5956, 449, 240.1, '2025-11-17 15:36:15', 'Completed'),
-    (5957, 380, 153.17, '2025-11-17 15:36:16', 'Refunded'),
-    (5958, 386, 166.46, '2025-11-17 15:39:36', 'Completed'),
-    (5959, 49, 222.07, '2025-11-17 15:40:18', 'Completed'),
-    (5960, 347, 277.26, '2025-11-17 15:37:58', 'Completed'),
-    (5961, 168, 452.97, '2025-11-17 15:38:13', 'Completed'),
-    (5962, 38, 111.69, '2025-11-17 15:37:18', 'Refunded'),
-    (5963, 440, 229.12, '2025-11-17 15:38:44', 'Pending'),
-    (5964, 26, 170.39, '2025-11-17 15:40:48', 'Refunded'),
-    (5965, 422, 394.22, '2025-11-17 15:36:12', 'Pending'),
-    (5966, 216, 43.21, '2025-11-17 15:37:59', 'Completed'),
-    (5967, 179, 60.7, '2025-11-17 15:40:23', 'Completed'),
-    (5968, 113, 89.3, '2025-11-17 15:36:21', 'Completed'),
-    (5969, 183, 149.38, '2025-11-17 15:40:01', 'Completed'),
-    (5970, 80, 190.66, '2025-11-17 15:39:54', 'Completed'),
-    (5971, 203, 459.04, '2025-11-17 15:40:48', 'Completed'),
-    (5972, 188, 340.74, '2025-11-17 15:37:44', 'Refunded'),
-    (5973, 214, 222.03, '2025-11-17 15:36:36', 'Completed'),
-    (5974, 116, 214.46, '2025-11-17 15:35:31', 'Completed'),
-    (5975, 113, 99.76, '2025-11-17 15:37:39', 'Completed'),
-    (5976, 139, 215.43, '2025-11-17 15:35:04', 'Pending'),
-    (5977, 67, 195.5, '2025-11-17 15:37:47', 'Completed'),
-    (5978, 158, 389.22, '2025-11-17 15:35:07', 'Completed'),
-    (5979, 264, 312.97, '2025-11-17 15:40:19', 'Completed'),
-    (5980, 246, 124.04, '2025-11-17 15:35:04', 'Completed'),
-    (5981, 327, 444.96, '2025-11-17 15:35:54', 'Completed'),
-    (5982, 264, 437.75, '2025-11-17 15:39:22', 'Completed'),
-    (5983, 344, 389.73, '2025-11-17 15:37:10', 'Completed'),
-    (5984, 51, 167.6, '2025-11-17 15:37:37', 'Completed'),
-    (5985, 422, 148.66, '2025-11-17 15:39:30', 'Completed'),
-    (5986, 159, 191.04, '2025-11-17 15:38:52', 'Pending'),
-    (5987, 301, 207.57, '2025-11-17 15:37:49', 'Completed'),
-    (5988, 94, 454.49, '2025-11-17 15:38:25', 'Completed'),
-    (5989, 29, 83.06, '2025-11-17 15:37:32', 'Completed'),
-    (5990, 213, 343.25, '2025-11-17 15:36:15', 'Completed'),
-    (5991, 170, 36.41, '2025-11-17 15:36:49', 'Completed'),
-    (5992, 473, 121.59, '2025-11-17 15:36:27', 'Completed'),
-    (5993, 241, 230.3, '2025-11-17 15:37:22', 'Pending'),
-    (5994, 118, 249.66, '2025-11-17 15:35:06', 'Completed'),
-    (5995, 81, 401.49, '2025-11-17 15:39:17', 'Completed'),
-    (5996, 122, 267.76, '2025-11-17 15:40:39', 'Completed'),
-    (5997, 214, 48.67, '2025-11-17 15:40:08', 'Completed'),
-    (5998, 106, 228.6, '2025-11-17 15:39:35', 'Pending'),
-    (5999, 215, 206.93, '2025-11-17 15:35:38', 'Completed'),
-    (6000, 387, 459.62, '2025-11-17 15:36:24', 'Completed');
+    (5001, 340, 177.92, '2026-07-11 20:50:16', 'Refunded'),
+    (5002, 284, 234.4, '2026-06-15 06:58:58', 'Completed'),
+    (5003, 326, 305.28, '2026-06-07 23:12:27', 'Completed'),
+    (5004, 61, 416.09, '2026-08-29 11:05:10', 'Completed'),
+    (5005, 475, 458.19, '2026-06-02 07:29:58', 'Completed'),
+    (5006, 196, 298.91, '2026-08-09 18:28:20', 'Completed'),
+    (5007, 299, 106.94, '2026-05-01 20:53:34', 'Pending'),
+    (5008, 102, 254.13, '2026-07-26 06:03:38', 'Pending'),
+    (5009, 459, 300.17, '2026-10-10 22:27:44', 'Pending'),
+    (5010, 197, 441.24, '2026-10-17 01:11:29', 'Pending'),
+    (5011, 190, 380.43, '2026-09-26 21:26:17', 'Completed'),
+    (5012, 267, 439.86, '2026-05-23 19:15:57', 'Completed'),
+    (5013, 136, 228.25, '2026-09-15 09:13:41', 'Completed'),
+    (5014, 374, 141.0, '2026-08-17 20:48:52', 'Completed'),
+    (5015, 270, 302.16, '2026-07-29 02:53:41', 'Completed'),
+    (5016, 388, 278.25, '2026-07-01 23:42:03', 'Completed'),
+    (5017, 445, 360.07, '2026-08-14 18:49:09', 'Refunded'),
+    (5018, 489, 351.86, '2026-05-07 17:22:25', 'Completed'),
+    (5019, 147, 328.35, '2026-05-13 14:46:10', 'Completed'),
+    (5020, 481, 384.29, '2026-10-13 13:28:43', 'Completed'),
+    (5021, 459, 313.78, '2026-06-14 11:04:42', 'Completed'),
+    (5022, 265, 357.5, '2026-04-29 10:45:11', 'Refunded'),
+    (5023, 449, 166.05, '2026-10-11 13:18:58', 'Completed'),
+    (5024, 178, 107.07, '2026-07-02 10:40:28', 'Completed'),
+    (5025, 365, 431.96, '2026-08-20 01:24:27', 'Completed'),
+    (5026, 296, 140.24, '2026-08-15 00:20:44', 'Pending'),
+    (5027, 9, 419.39, '2026-06-07 16:29:05', 'Completed'),
+    (5028, 354, 72.38, '2026-08-15 02:55:09', 'Completed'),
+    (5029, 348, 236.46, '2026-10-09 00:46:25', 'Completed'),
+    (5030, 284, 319.3, '2026-05-26 14:54:49', 'Pending'),
+    (5031, 267, 180.71, '2026-10-17 13:40:26', 'Refunded'),
+    (5032, 430, 228.33, '2026-08-09 07:19:47', 'Pending'),
+    (5033, 358, 409.26, '2026-08-09 08:23:13', 'Completed'),
+    (5034, 473, 419.02, '2026-07-19 20:35:46', 'Pending'),
+    (5035, 357, 30.11, '2026-05-15 16:54:02', 'Completed'),
+    (5036, 474, 414.93, '2026-06-19 20:40:51', 'Completed'),
+    (5037, 193, 271.06, '2026-04-24 02:10:34', 'Completed'),
+    (5038, 35, 106.44, '2026-09-19 06:30:51', 'Pending'),
+    (5039, 272, 133.41, '2026-10-08 06:18:52', 'Pending'),
+    (5040, 109, 127.86, '2026-05-11 14:11:04', 'Completed'),
+    (5041, 480, 82.12, '2026-09-21 22:51:35', 'Completed'),
+    (5042, 234, 231.61, '2026-10-04 14:11:17', 'Completed'),
+    (5043, 497, 36.01, '2026-08-26 16:32:16', 'Completed'),
+    (5044, 217, 176.11, '2026-04-26 00:56:24', 'Refunded'),
+    (5045, 265, 28.12, '2026-07-19 23:03:27', 'Pending'),
+    (5046, 87, 71.69, '2026-08-23 16:59:47', 'Completed'),
+    (5047, 304, 262.44, '2026-06-11 17:37:12', 'Completed'),
+    (5048, 352, 21.82, '2026-09-09 20:29:23', 'Pending'),
+    (5049, 372, 485.73, '2026-07-17 05:20:51', 'Completed'),
+    (5050, 79, 425.12, '2026-06-10 03:12:53', 'Completed'),
+    (5051, 26, 64.98, '2026-06-08 13:25:39', 'Refunded'),
+    (5052, 414, 449.18, '2026-04-22 13:11:35', 'Completed'),
+    (5053, 71, 177.31, '2026-05-06 10:02:12', 'Completed'),
+    (5054, 122, 403.51, '2026-05-01 19:09:05', 'Completed'),
+    (5055, 71, 67.81, '2026-06-18 16:34:53', 'Pending'),
+    (5056, 162, 482.33, '2026-06-30 17:30:14', 'Completed'),
+    (5057, 21, 439.81, '2026-08-02 18:15:42', 'Completed'),
+    (5058, 386, 355.53, '2026-09-11 00:20:14', 'Refunded'),
+    (5059, 451, 255.15, '2026-06-17 08:36:28', 'Completed'),
+    (5060, 325, 273.57, '2026-07-02 20:50:06', 'Completed'),
+    (5061, 122, 143.02, '2026-07-12 03:56:17', 'Completed'),
+    (5062, 481, 48.75, '2026-05-31 23:10:29', 'Refunded'),
+    (5063, 450, 454.05, '2026-04-19 15:25:11', 'Completed'),
+    (5064, 212, 361.87, '2026-05-03 07:48:22', 'Completed'),
+    (5065, 215, 408.51, '2026-05-20 01:05:46', 'Completed'),
+    (5066, 85, 140.19, '2026-10-12 22:58:50', 'Completed'),
+    (5067, 315, 210.1, '2026-04-23 19:08:23', 'Completed'),
+    (5068, 282, 60.06, '2026-09-08 18:22:57', 'Completed'),
+    (5069, 108, 41.32, '2026-10-03 20:00:58', 'Refunded'),
+    (5070, 317, 180.0, '2026-06-15 08:17:00', 'Completed'),
+    (5071, 131, 227.22, '2026-04-29 23:42:05', 'Pending'),
+    (5072, 413, 387.57, '2026-06-14 20:30:24', 'Pending'),
+    (5073, 444, 58.42, '2026-08-30 01:42:20', 'Refunded'),
+    (5074, 475, 160.37, '2026-06-20 17:56:32', 'Pending'),
+    (5075, 453, 365.07, '2026-07-04 01:55:34', 'Completed'),
+    (5076, 315, 41.07, '2026-08-21 17:23:38', 'Completed'),
+    (5077, 252, 424.04, '2026-08-20 14:02:37', 'Pending'),
+    (5078, 280, 190.33, '2026-07-21 04:09:02', 'Completed'),
+    (5079, 388, 232.82, '2026-08-02 13:05:38', 'Completed'),
+    (5080, 354, 276.81, '2026-06-20 22:53:46', 'Completed'),
+    (5081, 369, 308.11, '2026-06-18 23:09:04', 'Completed'),
+    (5082, 185, 176.71, '2026-09-30 19:13:25', 'Completed'),
+    (5083, 197, 46.55, '2026-05-27 09:20:18', 'Completed'),
+    (5084, 450, 348.82, '2026-10-15 03:01:57', 'Completed'),
+    (5085, 98, 446.4, '2026-08-27 03:49:09', 'Completed'),
+    (5086, 460, 336.73, '2026-04-29 12:39:39', 'Completed'),
+    (5087, 234, 112.38, '2026-06-12 21:00:40', 'Completed'),
+    (5088, 146, 84.99, '2026-09-27 21:51:43', 'Completed'),
+    (5089, 242, 379.11, '2026-07-01 14:16:55', 'Refunded'),
+    (5090, 133, 132.9, '2026-05-24 13:16:47', 'Completed'),
+    (5091, 358, 138.44, '2026-09-10 10:49:47', 'Completed'),
+    (5092, 369, 371.92, '2026-07-09 22:07:44', 'Completed'),
+    (5093, 203, 222.39, '2026-09-16 11:54:40', 'Pending'),
+    (5094, 265, 111.41, '2026-05-19 19:09:08', 'Completed'),
+    (5095, 185, 166.29, '2026-07-26 03:00:54', 'Completed'),
+    (5096, 301, 451.36, '2026-07-02 21:45:09', 'Completed'),
+    (5097, 27, 305.28, '2026-07-29 18:19:31', 'Completed'),
+    (5098, 26, 309.08, '2026-04-20 04:50:27', 'Completed'),
+    (5099, 238, 350.08, '2026-05-17 06:21:01', 'Refunded'),
+    (5100, 40, 44.3, '2026-07-06 07:21:47', 'Completed'),
+    (5101, 429, 140.83, '2026-05-10 04:40:27', 'Pending'),
+    (5102, 411, 438.31, '2026-05-18 02:05:01', 'Completed'),
+    (5103, 209, 73.0, '2026-06-10 10:21:57', 'Completed'),
+    (5104, 280, 114.1, '2026-09-27 08:05:03', 'Completed'),
+    (5105, 6, 122.05, '2026-10-11 02:10:58', 'Completed'),
+    (5106, 61, 362.64, '2026-06-02 03:16:35', 'Completed'),
+    (5107, 322, 156.06, '2026-08-09 16:42:17', 'Pending'),
+    (5108, 108, 376.04, '2026-08-19 08:51:32', 'Completed'),
+    (5109, 209, 74.46, '2026-09-10 01:17:12', 'Completed'),
+    (5110, 450, 109.62, '2026-06-22 03:21:35', 'Completed'),
+    (5111, 327, 107.87, '2026-08-11 16:40:57', 'Refunded'),
+    (5112, 413, 258.64, '2026-07-08 12:11:23', 'Refunded'),
+    (5113, 280, 487.5, '2026-07-19 17:36:37', 'Completed'),
+    (5114, 388, 210.14, '2026-05-01 13:26:09', 'Completed'),
+    (5115, 430, 244.32, '2026-07-08 17:11:21', 'Completed'),
+    (5116, 424, 418.07, '2026-05-19 16:59:27', 'Pending'),
+    (5117, 3, 86.3, '2026-06-08 02:03:20', 'Completed'),
+    (5118, 476, 354.01, '2026-05-12 15:59:46', 'Completed'),
+    (5119, 153, 309.64, '2026-06-13 16:59:11', 'Completed'),
+    (5120, 299, 102.2, '2026-09-24 12:26:12', 'Completed'),
+    (5121, 474, 222.44, '2026-08-08 03:58:28', 'Completed'),
+    (5122, 460, 25.42, '2026-07-15 00:55:22', 'Pending'),
+    (5123, 276, 238.08, '2026-07-12 18:30:49', 'Pending'),
+    (5124, 40, 344.65, '2026-10-07 12:17:30', 'Completed'),
+    (5125, 273, 471.12, '2026-07-04 09:31:54', 'Completed'),
+    (5126, 102, 434.61, '2026-09-25 22:41:23', 'Completed'),
+    (5127, 365, 267.41, '2026-05-04 22:34:40', 'Completed'),
+    (5128, 357, 243.19, '2026-05-29 06:50:31', 'Completed'),
+    (5129, 252, 276.76, '2026-07-24 03:27:15', 'Completed'),
+    (5130, 71, 169.51, '2026-08-02 11:52:10', 'Refunded'),
+    (5131, 414, 38.45, '2026-08-03 01:11:29', 'Completed'),
+    (5132, 35, 447.52, '2026-09-26 03:25:43', 'Pending'),
+    (5133, 133, 468.82, '2026-05-02 06:57:19', 'Pending'),
+    (5134, 348, 202.27, '2026-07-16 01:21:22', 'Completed'),
+    (5135, 388, 476.65, '2026-05-05 09:53:20', 'Completed'),
+    (5136, 102, 448.2, '2026-07-26 15:13:18', 'Pending'),
+    (5137, 453, 412.4, '2026-07-31 23:42:18', 'Completed'),
+    (5138, 374, 38.04, '2026-09-04 22:05:50', 'Completed'),
+    (5139, 326, 482.33, '2026-05-30 01:17:42', 'Refunded'),
+    (5140, 352, 338.0, '2026-10-08 00:36:30', 'Completed'),
+    (5141, 293, 300.61, '2026-05-20 00:18:20', 'Pending'),
+    (5142, 197, 390.35, '2026-07-11 06:04:50', 'Refunded'),
+    (5143, 327, 248.43, '2026-08-16 04:25:45', 'Completed'),
+    (5144, 221, 311.86, '2026-08-06 19:53:03', 'Completed'),
+    (5145, 459, 267.45, '2026-07-07 13:50:54', 'Pending'),
+    (5146, 76, 371.82, '2026-09-07 05:45:58', 'Pending'),
+    (5147, 357, 143.86, '2026-05-17 16:32:14', 'Completed'),
+    (5148, 467, 459.23, '2026-08-23 17:46:30', 'Completed'),
+    (5149, 467, 61.09, '2026-08-20 05:05:22', 'Completed'),
+    (5150, 40, 33.16, '2026-06-29 16:44:13', 'Completed'),
+    (5151, 489, 257.44, '2026-06-27 22:55:30', 'Completed'),
+    (5152, 489, 200.2, '2026-10-06 07:51:28', 'Refunded'),
+    (5153, 301, 123.98, '2026-10-08 07:54:23', 'Pending'),
+    (5154, 151, 496.21, '2026-08-23 13:20:23', 'Completed'),
+    (5155, 449, 174.16, '2026-09-22 17:26:08', 'Completed'),
+    (5156, 107, 345.9, '2026-05-30 15:02:49', 'Pending'),
+    (5157, 6, 492.37, '2026-07-05 12:06:02', 'Completed'),
+    (5158, 251, 343.91, '2026-07-14 09:20:40', 'Completed'),
+    (5159, 299, 210.12, '2026-05-24 09:46:23', 'Refunded'),
+    (5160, 273, 172.02, '2026-06-20 08:11:03', 'Pending'),
+    (5161, 228, 172.46, '2026-05-04 21:12:08', 'Completed'),
+    (5162, 284, 311.34, '2026-09-23 20:10:02', 'Pending'),
+    (5163, 377, 423.77, '2026-04-20 09:57:17', 'Refunded'),
+    (5164, 53, 490.84, '2026-07-22 18:31:10', 'Pending'),
+    (5165, 265, 34.16, '2026-06-22 02:27:31', 'Completed'),
+    (5166, 420, 258.04, '2026-07-24 23:25:58', 'Refunded'),
+    (5167, 190, 238.65, '2026-10-06 18:59:51', 'Completed'),
+    (5168, 147, 436.43, '2026-10-05 03:29:34', 'Pending'),
+    (5169, 203, 190.88, '2026-10-05 07:40:17', 'Pending'),
+    (5170, 43, 442.64, '2026-08-25 10:46:51', 'Completed'),
+    (5171, 301, 22.61, '2026-10-09 10:25:59', 'Completed'),
+    (5172, 418, 309.92, '2026-05-02 19:40:06', 'Completed'),
+    (5173, 251, 136.87, '2026-06-04 20:22:28', 'Pending'),
+    (5174, 326, 329.92, '2026-06-13 08:35:43', 'Completed'),
+    (5175, 243, 467.43, '2026-08-30 00:23:38', 'Completed'),
+    (5176, 453, 147.9, '2026-10-14 01:55:24', 'Completed'),
+    (5177, 25, 374.43, '2026-06-29 07:39:50', 'Completed'),
+    (5178, 53, 316.08, '2026-06-18 14:05:50', 'Completed'),
+    (5179, 326, 195.15, '2026-10-13 01:32:48', 'Completed'),
+    (5180, 82, 175.72, '2026-08-04 16:45:11', 'Completed'),
+    (5181, 302, 70.67, '2026-05-21 10:12:04', 'Completed'),
+    (5182, 107, 266.59, '2026-05-05 23:35:43', 'Completed'),
+    (5183, 402, 94.88, '2026-06-12 16:27:49', 'Completed'),
+    (5184, 402, 420.75, '2026-06-16 08:35:55', 'Pending'),
+    (5185, 27, 359.65, '2026-09-05 08:28:14', 'Completed'),
+    (5186, 76, 476.19, '2026-05-20 21:40:01', 'Completed'),
+    (5187, 365, 275.71, '2026-06-29 02:58:29', 'Completed'),
+    (5188, 420, 374.56, '2026-07-22 08:13:42', 'Pending'),
+    (5189, 212, 395.75, '2026-09-07 10:24:31', 'Completed'),
+    (5190, 231, 66.44, '2026-09-06 06:44:55', 'Completed'),
+    (5191, 85, 101.78, '2026-08-01 16:45:01', 'Refunded'),
+    (5192, 276, 37.29, '2026-07-28 02:41:03', 'Pending'),
+    (5193, 299, 292.84, '2026-04-27 07:53:09', 'Completed'),
+    (5194, 114, 471.02, '2026-06-16 04:14:08', 'Refunded'),
+    (5195, 302, 68.92, '2026-08-27 10:11:24', 'Completed'),
+    (5196, 364, 455.41, '2026-06-09 02:47:46', 'Refunded'),
+    (5197, 45, 270.88, '2026-05-17 01:40:46', 'Pending'),
+    (5198, 429, 120.56, '2026-07-17 06:19:33', 'Completed'),
+    (5199, 157, 383.24, '2026-08-17 16:51:05', 'Completed'),
+    (5200, 98, 385.0, '2026-06-02 08:01:24', 'Completed'),
+    (5201, 242, 128.04, '2026-08-16 08:24:57', 'Completed'),
+    (5202, 406, 128.8, '2026-06-13 23:49:00', 'Completed'),
+    (5203, 273, 422.1, '2026-10-06 16:35:18', 'Completed'),
+    (5204, 302, 77.99, '2026-05-09 15:00:05', 'Refunded'),
+    (5205, 450, 49.51, '2026-04-19 15:49:03', 'Completed'),
+    (5206, 317, 409.32, '2026-09-11 22:46:21', 'Completed'),
+    (5207, 102, 66.93, '2026-10-07 19:39:09', 'Completed'),
+    (5208, 193, 476.6, '2026-04-30 07:48:41', 'Completed'),
+    (5209, 304, 48.91, '2026-04-21 01:20:51', 'Completed'),
+    (5210, 228, 283.36, '2026-09-02 00:54:26', 'Completed'),
+    (5211, 252, 494.78, '2026-07-03 09:01:18', 'Completed'),
+    (5212, 302, 423.72, '2026-07-09 15:44:40', 'Refunded'),
+    (5213, 259, 196.83, '2026-07-08 11:10:01', 'Refunded'),
+    (5214, 231, 328.58, '2026-10-08 13:43:02', 'Completed'),
+    (5215, 3, 137.54, '2026-10-08 08:35:05', 'Completed'),
+    (5216, 299, 475.75, '2026-08-23 01:44:00', 'Completed'),
+    (5217, 259, 143.71, '2026-09-12 15:07:03', 'Pending'),
+    (5218, 257, 356.69, '2026-10-16 07:14:05', 'Completed'),
+    (5219, 109, 338.66, '2026-08-16 21:36:45', 'Pending'),
+    (5220, 150, 128.28, '2026-07-17 14:28:21', 'Completed'),
+    (5221, 470, 149.55, '2026-09-30 02:19:25', 'Refunded'),
+    (5222, 45, 312.89, '2026-09-15 19:50:25', 'Completed'),
+    (5223, 302, 29.59, '2026-05-14 11:10:07', 'Pending'),
+    (5224, 43, 209.65, '2026-07-04 05:27:38', 'Completed'),
+    (5225, 280, 176.5, '2026-08-30 05:40:19', 'Completed'),
+    (5226, 475, 160.97, '2026-08-27 15:29:13', 'Completed'),
+    (5227, 314, 420.39, '2026-04-30 12:11:40', 'Pending'),
+    (5228, 388, 464.55, '2026-04-30 18:38:00', 'Refunded'),
+    (5229, 285, 467.45, '2026-09-17 01:45:46', 'Completed'),
+    (5230, 109, 211.13, '2026-07-12 22:35:11', 'Completed'),
+    (5231, 43, 253.57, '2026-05-03 08:38:20', 'Completed'),
+    (5232, 53, 120.76, '2026-06-28 00:25:11', 'Completed'),
+    (5233, 444, 292.01, '2026-09-04 07:16:20', 'Completed'),
+    (5234, 315, 128.56, '2026-05-14 22:20:04', 'Pending'),
+    (5235, 208, 275.14, '2026-10-17 03:53:30', 'Completed'),
+    (5236, 481, 495.99, '2026-06-25 22:40:01', 'Completed'),
+    (5237, 320, 445.92, '2026-08-19 18:55:31', 'Completed'),
+    (5238, 215, 395.78, '2026-08-03 14:36:06', 'Completed'),
+    (5239, 467, 243.84, '2026-06-13 21:27:37', 'Completed'),
+    (5240, 141, 87.57, '2026-06-21 23:32:45', 'Refunded'),
+    (5241, 270, 201.07, '2026-06-11 03:25:31', 'Completed'),
+    (5242, 374, 109.65, '2026-05-23 13:43:18', 'Completed'),
+    (5243, 325, 192.05, '2026-09-11 03:01:59', 'Completed'),
+    (5244, 201, 68.53, '2026-09-08 09:10:04', 'Completed'),
+    (5245, 472, 451.42, '2026-06-25 22:42:21', 'Pending'),
+    (5246, 79, 345.94, '2026-06-11 15:09:12', 'Completed'),
+    (5247, 136, 126.67, '2026-06-09 18:26:20', 'Completed'),
+    (5248, 396, 297.23, '2026-06-09 01:54:14', 'Completed'),
+    (5249, 222, 402.81, '2026-05-01 12:40:23', 'Completed'),
+    (5250, 27, 390.39, '2026-08-11 00:35:55', 'Completed'),
+    (5251, 400, 203.41, '2026-09-16 03:25:49', 'Completed'),
+    (5252, 150, 29.28, '2026-08-08 16:39:18', 'Completed'),
+    (5253, 122, 133.77, '2026-05-30 17:33:32', 'Pending'),
+    (5254, 154, 144.21, '2026-07-23 21:59:01', 'Completed'),
+    (5255, 6, 53.88, '2026-07-22 11:01:31', 'Completed'),
+    (5256, 162, 332.45, '2026-08-19 18:19:06', 'Completed'),
+    (5257, 252, 54.81, '2026-09-12 09:40:15', 'Pending'),
+    (5258, 460, 228.31, '2026-09-17 07:07:45', 'Completed'),
+    (5259, 467, 71.63, '2026-05-23 11:00:26', 'Pending'),
+    (5260, 243, 130.38, '2026-08-25 03:37:23', 'Completed'),
+    (5261, 420, 22.13, '2026-09-10 01:22:35', 'Completed'),
+    (5262, 386, 288.34, '2026-09-23 19:03:17', 'Completed'),
+    (5263, 468, 167.41, '2026-09-09 18:03:26', 'Completed'),
+    (5264, 189, 442.33, '2026-10-13 03:05:12', 'Completed'),
+    (5265, 304, 182.73, '2026-08-03 08:34:38', 'Pending'),
+    (5266, 280, 283.1, '2026-07-19 10:25:15', 'Pending'),
+    (5267, 411, 407.18, '2026-10-08 20:39:56', 'Completed'),
+    (5268, 262, 460.35, '2026-05-07 18:37:54', 'Completed'),
+    (5269, 301, 430.08, '2026-05-04 21:15:11', 'Pending'),
+    (5270, 470, 145.63, '2026-06-07 19:52:28', 'Completed'),
+    (5271, 414, 352.42, '2026-06-04 12:19:01', 'Completed'),
+    (5272, 489, 294.71, '2026-08-31 23:02:36', 'Pending'),
+    (5273, 221, 228.33, '2026-07-23 01:34:59', 'Completed'),
+    (5274, 53, 252.53, '2026-08-25 17:47:06', 'Pending'),
+    (5275, 154, 146.28, '2026-07-19 05:50:21', 'Completed'),
+    (5276, 44, 433.71, '2026-04-24 21:26:49', 'Completed'),
+    (5277, 276, 214.81, '2026-06-02 08:12:33', 'Completed'),
+    (5278, 78, 244.74, '2026-10-11 11:45:04', 'Completed'),
+    (5279, 234, 456.76, '2026-09-03 09:46:08', 'Completed'),
+    (5280, 228, 122.35, '2026-06-18 04:31:17', 'Pending'),
+    (5281, 298, 78.67, '2026-05-01 19:14:17', 'Refunded'),
+    (5282, 61, 76.96, '2026-09-15 04:44:38', 'Refunded'),
+    (5283, 413, 49.98, '2026-09-15 00:00:37', 'Completed'),
+    (5284, 369, 44.47, '2026-07-16 15:27:00', 'Completed'),
+    (5285, 221, 223.04, '2026-10-15 07:47:35', 'Refunded'),
+    (5286, 299, 295.0, '2026-05-21 04:06:43', 'Completed'),
+    (5287, 468, 390.57, '2026-07-05 21:19:11', 'Completed'),
+    (5288, 197, 133.29, '2026-07-30 06:10:18', 'Completed'),
+    (5289, 299, 38.45, '2026-05-26 06:26:57', 'Completed'),
+    (5290, 476, 94.97, '2026-10-14 10:36:31', 'Completed'),
+    (5291, 284, 390.51, '2026-06-13 10:36:43', 'Refunded'),
+    (5292, 273, 486.14, '2026-07-25 10:20:22', 'Completed'),
+    (5293, 193, 396.7, '2026-07-25 03:14:14', 'Completed'),
+    (5294, 44, 416.02, '2026-05-28 04:45:27', 'Pending'),
+    (5295, 51, 133.19, '2026-05-25 12:00:55', 'Refunded'),
+    (5296, 396, 448.86, '2026-08-13 09:44:29', 'Pending'),
+    (5297, 209, 177.66, '2026-04-19 12:09:05', 'Pending'),
+    (5298, 162, 472.07, '2026-09-20 19:53:29', 'Completed'),
+    (5299, 162, 315.97, '2026-09-23 14:30:12', 'Completed'),
+    (5300, 473, 280.53, '2026-04-22 20:00:16', 'Completed'),
+    (5301, 475, 252.4, '2026-09-24 22:14:07', 'Completed'),
+    (5302, 311, 435.87, '2026-05-12 13:49:35', 'Completed'),
+    (5303, 357, 336.82, '2026-05-15 05:59:04', 'Completed'),
+    (5304, 472, 458.18, '2026-06-15 14:23:05', 'Pending'),
+    (5305, 327, 72.4, '2026-08-05 23:15:14', 'Completed'),
+    (5306, 445, 121.42, '2026-06-11 18:47:49', 'Completed'),
+    (5307, 252, 419.11, '2026-05-30 09:33:46', 'Completed'),
+    (5308, 450, 356.6, '2026-09-18 05:40:44', 'Refunded'),
+    (5309, 396, 235.88, '2026-10-02 11:03:39', 'Completed'),
+    (5310, 430, 254.41, '2026-07-29 10:04:26', 'Completed'),
+    (5311, 147, 72.25, '2026-08-19 05:01:58', 'Completed'),
+    (5312, 196, 227.46, '2026-10-17 23:41:46', 'Completed'),
+    (5313, 474, 226.92, '2026-07-25 01:05:25', 'Pending'),
+    (5314, 53, 41.0, '2026-10-12 21:30:55', 'Completed'),
+    (5315, 76, 349.39, '2026-04-22 15:37:06', 'Completed'),
+    (5316, 348, 147.31, '2026-08-31 18:41:53', 'Completed'),
+    (5317, 268, 278.77, '2026-09-25 20:42:41', 'Completed'),
+    (5318, 447, 157.87, '2026-08-27 22:14:13', 'Completed'),
+    (5319, 85, 130.75, '2026-06-08 07:41:18', 'Completed'),
+    (5320, 406, 427.1, '2026-10-07 10:46:49', 'Completed'),
+    (5321, 270, 441.19, '2026-07-02 00:10:24', 'Completed'),
+    (5322, 314, 70.29, '2026-08-23 20:57:39', 'Completed'),
+    (5323, 474, 483.43, '2026-04-22 11:30:35', 'Completed'),
+    (5324, 418, 459.0, '2026-06-06 18:16:29', 'Completed'),
+    (5325, 311, 455.14, '2026-08-30 04:22:55', 'Pending'),
+    (5326, 490, 333.86, '2026-09-02 09:38:24', 'Completed'),
+    (5327, 9, 107.17, '2026-06-14 07:36:07', 'Completed'),
+    (5328, 320, 63.92, '2026-06-07 01:03:53', 'Pending'),
+    (5329, 429, 168.63, '2026-08-06 09:48:23', 'Pending'),
+    (5330, 172, 76.5, '2026-04-25 19:39:47', 'Completed'),
+    (5331, 441, 346.7, '2026-08-28 09:58:23', 'Completed'),
+    (5332, 82, 387.28, '2026-09-22 05:48:39', 'Pending'),
+    (5333, 445, 344.3, '2026-06-17 08:31:55', 'Refunded'),
+    (5334, 326, 36.71, '2026-07-03 14:14:48', 'Completed'),
+    (5335, 98, 257.42, '2026-04-26 03:03:52', 'Pending'),
+    (5336, 472, 452.34, '2026-08-27 04:29:07', 'Completed'),
+    (5337, 265, 46.55, '2026-09-01 13:47:07', 'Completed'),
+    (5338, 57, 218.42, '2026-06-27 17:37:30', 'Completed'),
+    (5339, 131, 173.5, '2026-08-02 23:58:54', 'Completed'),
+    (5340, 386, 320.57, '2026-09-29 16:58:38', 'Pending'),
+    (5341, 242, 40.5, '2026-06-25 22:44:34', 'Completed'),
+    (5342, 465, 335.96, '2026-07-03 04:28:03', 'Pending'),
+    (5343, 193, 80.68, '2026-05-12 21:53:01', 'Completed'),
+    (5344, 329, 200.28, '2026-07-05 12:30:29', 'Completed'),
+    (5345, 265, 205.32, '2026-05-06 18:37:52', 'Completed'),
+    (5346, 133, 133.35, '2026-09-28 06:48:56', 'Completed'),
+    (5347, 121, 253.24, '2026-06-05 04:00:32', 'Refunded'),
+    (5348, 478, 57.55, '2026-10-01 21:13:40', 'Completed'),
+    (5349, 326, 431.03, '2026-04-28 04:53:28', 'Pending'),
+    (5350, 153, 116.38, '2026-09-22 19:06:04', 'Completed'),
+    (5351, 196, 42.83, '2026-07-05 17:32:16', 'Pending'),
+    (5352, 487, 240.82, '2026-06-09 21:46:34', 'Pending'),
+    (5353, 193, 185.73, '2026-08-13 17:23:49', 'Completed'),
+    (5354, 420, 89.29, '2026-07-02 17:56:09', 'Completed'),
+    (5355, 44, 98.69, '2026-08-25 00:52:02', 'Pending'),
+    (5356, 465, 447.36, '2026-04-21 23:31:16', 'Completed'),
+    (5357, 280, 377.75, '2026-09-02 16:29:15', 'Completed'),
+    (5358, 208, 446.96, '2026-08-17 04:23:04', 'Completed'),
+    (5359, 242, 445.38, '2026-07-12 13:07:01', 'Completed'),
+    (5360, 79, 305.79, '2026-08-07 08:54:38', 'Pending'),
+    (5361, 311, 128.91, '2026-09-10 10:05:00', 'Completed'),
+    (5362, 40, 236.14, '2026-10-06 05:12:14', 'Completed'),
+    (5363, 377, 276.7, '2026-07-09 16:06:19', 'Completed'),
+    (5364, 377, 181.9, '2026-07-16 20:03:18', 'Completed'),
+    (5365, 322, 319.34, '2026-06-03 04:47:23', 'Completed'),
+    (5366, 262, 112.56, '2026-09-11 05:13:54', 'Completed'),
+    (5367, 489, 133.36, '2026-05-28 10:57:21', 'Pending'),
+    (5368, 254, 395.64, '2026-06-21 03:51:35', 'Completed'),
+    (5369, 478, 479.8, '2026-08-22 16:16:47', 'Completed'),
+    (5370, 481, 85.5, '2026-07-16 19:38:25', 'Pending'),
+    (5371, 369, 337.25, '2026-10-11 05:48:11', 'Completed'),
+    (5372, 26, 337.24, '2026-09-01 21:16:14', 'Pending'),
+    (5373, 259, 113.3, '2026-06-17 07:27:36', 'Pending'),
+    (5374, 246, 369.25, '2026-09-14 04:08:10', 'Completed'),
+    (5375, 348, 325.67, '2026-09-10 12:49:24', 'Completed'),
+    (5376, 164, 74.48, '2026-09-10 20:38:40', 'Completed'),
+    (5377, 3, 181.55, '2026-04-18 20:00:42', 'Completed'),
+    (5378, 259, 140.26, '2026-07-23 14:44:34', 'Completed'),
+    (5379, 463, 39.7, '2026-09-21 18:21:58', 'Completed'),
+    (5380, 276, 172.79, '2026-08-17 06:24:13', 'Completed'),
+    (5381, 6, 446.73, '2026-05-06 17:11:43', 'Completed'),
+    (5382, 193, 88.71, '2026-07-29 06:53:24', 'Completed'),
+    (5383, 311, 419.64, '2026-06-15 00:54:04', 'Completed'),
+    (5384, 109, 70.62, '2026-07-09 17:04:28', 'Completed'),
+    (5385, 131, 68.64, '2026-09-29 03:33:31', 'Completed'),
+    (5386, 79, 36.79, '2026-10-17 18:01:29', 'Pending'),
+    (5387, 453, 198.19, '2026-05-25 21:08:46', 'Completed'),
+    (5388, 276, 285.65, '2026-07-19 10:59:16', 'Completed'),
+    (5389, 270, 433.96, '2026-07-06 21:28:39', 'Pending'),
+    (5390, 196, 450.45, '2026-07-05 08:37:21', 'Completed'),
+    (5391, 215, 206.01, '2026-04-26 19:59:17', 'Completed'),
+    (5392, 193, 65.75, '2026-10-06 16:53:08', 'Refunded'),
+    (5393, 487, 273.01, '2026-08-20 06:15:07', 'Refunded'),
+    (5394, 157, 446.97, '2026-04-22 00:23:11', 'Refunded'),
+    (5395, 453, 110.13, '2026-05-26 02:20:19', 'Completed'),
+    (5396, 102, 86.5, '2026-05-19 22:40:01', 'Pending'),
+    (5397, 481, 398.32, '2026-05-27 08:54:59', 'Completed'),
+    (5398, 468, 370.27, '2026-06-16 07:57:17', 'Completed'),
+    (5399, 449, 353.76, '2026-07-06 03:36:48', 'Completed'),
+    (5400, 44, 380.88, '2026-07-20 06:00:02', 'Completed'),
+    (5401, 131, 331.71, '2026-08-01 08:45:28', 'Completed'),
+    (5402, 460, 315.26, '2026-09-07 00:48:16', 'Completed'),
+    (5403, 497, 380.22, '2026-10-03 05:17:27', 'Completed'),
+    (5404, 273, 377.08, '2026-07-08 17:54:07', 'Completed'),
+    (5405, 228, 164.81, '2026-07-09 03:07:31', 'Completed'),
+    (5406, 414, 85.77, '2026-05-19 14:40:41', 'Completed'),
+    (5407, 172, 282.56, '2026-06-23 10:47:05', 'Completed'),
+    (5408, 327, 337.04, '2026-09-11 18:01:19', 'Pending'),
+    (5409, 190, 476.78, '2026-09-06 06:23:53', 'Completed'),
+    (5410, 82, 232.48, '2026-06-04 20:07:23', 'Completed'),
+    (5411, 414, 86.54, '2026-07-18 08:24:54', 'Completed'),
+    (5412, 423, 71.28, '2026-07-28 09:49:48', 'Pending'),
+    (5413, 348, 132.77, '2026-08-04 14:01:07', 'Completed'),
+    (5414, 87, 164.02, '2026-06-12 18:45:44', 'Completed'),
+    (5415, 27, 325.95, '2026-05-30 15:33:29', 'Completed'),
+    (5416, 142, 294.47, '2026-08-26 12:45:53', 'Completed'),
+    (5417, 109, 400.54, '2026-09-14 08:07:38', 'Completed'),
+    (5418, 147, 149.34, '2026-07-19 23:50:42', 'Pending'),
+    (5419, 285, 65.85, '2026-07-08 22:27:59', 'Completed'),
+    (5420, 76, 199.94, '2026-06-07 05:38:01', 'Completed'),
+    (5421, 480, 227.52, '2026-09-12 22:45:43', 'Completed'),
+    (5422, 265, 419.45, '2026-07-15 12:22:45', 'Completed'),
+    (5423, 481, 191.11, '2026-08-10 13:53:34', 'Completed'),
+    (5424, 15, 75.14, '2026-05-25 14:58:10', 'Completed'),
+    (5425, 299, 81.96, '2026-07-13 10:25:38', 'Pending'),
+    (5426, 178, 207.03, '2026-05-03 02:59:03', 'Pending'),
+    (5427, 238, 213.78, '2026-04-21 20:07:45', 'Pending'),
+    (5428, 242, 411.56, '2026-08-21 15:44:14', 'Pending'),
+    (5429, 285, 346.1, '2026-10-05 08:08:27', 'Completed'),
+    (5430, 464, 224.04, '2026-04-20 15:54:16', 'Completed'),
+    (5431, 164, 213.15, '2026-07-26 02:22:45', 'Completed'),
+    (5432, 267, 153.11, '2026-06-09 16:04:12', 'Completed'),
+    (5433, 352, 223.65, '2026-05-29 21:35:25', 'Completed'),
+    (5434, 211, 357.16, '2026-06-25 01:11:38', 'Pending'),
+    (5435, 53, 176.95, '2026-08-06 19:34:32', 'Completed'),
+    (5436, 396, 348.43, '2026-05-21 23:13:49', 'Completed'),
+    (5437, 311, 171.58, '2026-06-03 06:43:33', 'Completed'),
+    (5438, 481, 306.86, '2026-09-08 07:46:09', 'Completed'),
+    (5439, 365, 421.85, '2026-05-03 05:16:59', 'Completed'),
+    (5440, 16, 428.36, '2026-08-02 08:40:37', 'Completed'),
+    (5441, 463, 334.8, '2026-10-07 19:03:35', 'Pending'),
+    (5442, 3, 170.46, '2026-08-19 05:15:13', 'Completed'),
+    (5443, 162, 494.08, '2026-10-15 06:01:18', 'Completed'),
+    (5444, 142, 153.43, '2026-05-07 10:49:20', 'Completed'),
+    (5445, 326, 142.86, '2026-10-09 12:47:58', 'Completed'),
+    (5446, 43, 314.94, '2026-07-18 20:15:33', 'Completed'),
+    (5447, 238, 88.11, '2026-06-19 14:18:02', 'Pending'),
+    (5448, 273, 54.92, '2026-09-23 09:34:08', 'Refunded'),
+    (5449, 43, 469.05, '2026-08-24 21:24:02', 'Completed'),
+    (5450, 221, 421.6, '2026-08-17 21:52:55', 'Completed'),
+    (5451, 107, 211.44, '2026-06-22 16:17:30', 'Pending'),
+    (5452, 102, 473.42, '2026-10-09 07:52:03', 'Pending'),
+    (5453, 252, 108.99, '2026-07-19 16:59:14', 'Completed'),
+    (5454, 204, 362.59, '2026-10-09 07:11:43', 'Completed'),
+    (5455, 162, 149.78, '2026-10-10 00:32:24', 'Completed'),
+    (5456, 322, 322.03, '2026-09-22 23:31:51', 'Completed'),
+    (5457, 57, 112.92, '2026-10-06 20:51:46', 'Completed'),
+    (5458, 460, 211.64, '2026-09-27 16:34:08', 'Pending'),
+    (5459, 108, 420.33, '2026-09-22 05:53:22', 'Pending'),
+    (5460, 413, 262.68, '2026-08-26 01:02:16', 'Completed'),
+    (5461, 470, 427.86, '2026-05-12 21:13:28', 'Completed'),
+    (5462, 340, 311.23, '2026-04-25 01:45:18', 'Completed'),
+    (5463, 178, 365.56, '2026-07-23 19:57:52', 'Completed'),
+    (5464, 379, 156.46, '2026-08-28 07:58:45', 'Completed'),
+    (5465, 463, 82.32, '2026-04-24 05:11:00', 'Completed'),
+    (5466, 467, 130.77, '2026-06-24 01:44:31', 'Completed'),
+    (5467, 489, 79.43, '2026-07-13 05:32:13', 'Completed'),
+    (5468, 470, 370.17, '2026-06-15 01:28:25', 'Completed'),
+    (5469, 162, 143.71, '2026-05-29 09:20:15', 'Completed'),
+    (5470, 196, 424.09, '2026-04-27 08:27:27', 'Completed'),
+    (5471, 262, 173.18, '2026-04-30 07:12:44', 'Completed'),
+    (5472, 314, 498.29, '2026-09-25 01:18:59', 'Completed'),
+    (5473, 153, 188.32, '2026-10-07 06:47:53', 'Completed'),
+    (5474, 257, 250.73, '2026-06-03 12:31:25', 'Pending'),
+    (5475, 243, 254.48, '2026-07-21 18:37:25', 'Pending'),
+    (5476, 286, 161.72, '2026-09-25 14:53:32', 'Pending'),
+    (5477, 228, 43.75, '2026-09-28 07:20:10', 'Pending'),
+    (5478, 162, 416.35, '2026-09-26 12:44:22', 'Completed'),
+    (5479, 189, 296.04, '2026-10-04 04:39:37', 'Pending'),
+    (5480, 265, 263.95, '2026-10-10 11:48:28', 'Pending'),
+    (5481, 190, 274.95, '2026-05-16 15:17:47', 'Pending'),
+    (5482, 420, 25.59, '2026-09-10 23:47:36', 'Completed'),
+    (5483, 172, 209.76, '2026-07-03 16:41:45', 'Completed'),
+    (5484, 475, 302.34, '2026-05-02 05:05:23', 'Completed'),
+    (5485, 460, 427.52, '2026-07-20 17:13:30', 'Completed'),
+    (5486, 231, 73.92, '2026-06-05 15:15:56', 'Completed'),
+    (5487, 451, 213.58, '2026-07-10 00:51:59', 'Pending'),
+    (5488, 172, 152.74, '2026-09-17 22:39:12', 'Pending'),
+    (5489, 460, 398.43, '2026-06-09 00:23:59', 'Refunded'),
+    (5490, 364, 113.55, '2026-05-24 09:44:30', 'Pending'),
+    (5491, 286, 213.93, '2026-08-01 22:39:02', 'Completed'),
+    (5492, 472, 198.31, '2026-10-07 09:58:32', 'Completed'),
+    (5493, 209, 353.79, '2026-08-15 07:17:11', 'Pending'),
+    (5494, 386, 255.63, '2026-07-07 23:20:28', 'Completed'),
+    (5495, 201, 344.32, '2026-07-24 11:46:24', 'Completed'),
+    (5496, 131, 215.84, '2026-07-09 13:42:52', 'Pending'),
+    (5497, 243, 116.09, '2026-04-20 01:18:32', 'Completed'),
+    (5498, 212, 440.37, '2026-06-07 12:01:33', 'Completed'),
+    (5499, 293, 215.25, '2026-09-16 18:17:25', 'Completed'),
+    (5500, 478, 355.54, '2026-05-05 10:18:02', 'Refunded'),
+    (5501, 265, 139.16, '2026-06-23 14:24:44', 'Completed'),
+    (5502, 423, 30.61, '2026-06-06 16:34:24', 'Refunded'),
+    (5503, 270, 82.09, '2026-09-05 01:30:01', 'Completed'),
+    (5504, 150, 122.66, '2026-07-03 07:48:33', 'Completed'),
+    (5505, 315, 237.7, '2026-08-29 10:24:47', 'Completed'),
+    (5506, 89, 310.53, '2026-05-10 08:06:46', 'Completed'),
+    (5507, 151, 285.98, '2026-04-20 19:44:29', 'Completed'),
+    (5508, 78, 307.94, '2026-08-06 22:42:36', 'Pending'),
+    (5509, 45, 232.65, '2026-07-08 00:36:27', 'Completed'),
+    (5510, 490, 293.29, '2026-09-09 15:32:19', 'Completed'),
+    (5511, 102, 115.63, '2026-04-22 23:30:28', 'Completed'),
+    (5512, 402, 257.24, '2026-04-29 13:34:37', 'Completed'),
+    (5513, 243, 193.8, '2026-08-26 03:28:51', 'Pending'),
+    (5514, 71, 498.86, '2026-08-10 17:25:49', 'Completed'),
+    (5515, 62, 387.05, '2026-05-25 19:36:27', 'Refunded'),
+    (5516, 420, 61.49, '2026-06-11 04:22:18', 'Completed'),
+    (5517, 82, 259.5, '2026-08-12 12:49:02', 'Completed'),
+    (5518, 280, 103.82, '2026-09-03 16:55:01', 'Completed'),
+    (5519, 238, 231.14, '2026-08-08 06:58:37', 'Completed'),
+    (5520, 293, 204.72, '2026-10-12 19:49:18', 'Pending'),
+    (5521, 296, 468.69, '2026-04-18 22:15:40', 'Refunded'),
+    (5522, 189, 393.08, '2026-07-18 13:42:06', 'Completed'),
+    (5523, 201, 379.6, '2026-07-29 21:25:06', 'Completed'),
+    (5524, 222, 63.22, '2026-10-03 06:45:28', 'Completed'),
+    (5525, 61, 438.07, '2026-10-09 10:23:17', 'Completed'),
+    (5526, 377, 321.67, '2026-06-10 20:41:08', 'Pending'),
+    (5527, 246, 365.74, '2026-05-09 04:09:48', 'Completed'),
+    (5528, 51, 344.27, '2026-08-30 15:51:31', 'Completed'),
+    (5529, 449, 91.68, '2026-09-10 01:26:37', 'Refunded'),
+    (5530, 286, 345.17, '2026-08-03 21:21:58', 'Completed'),
+    (5531, 154, 187.42, '2026-07-25 16:48:19', 'Completed'),
+    (5532, 449, 203.08, '2026-07-27 21:38:20', 'Completed'),
+    (5533, 234, 499.66, '2026-08-22 03:26:38', 'Completed'),
+    (5534, 396, 90.04, '2026-10-03 17:00:49', 'Completed'),
+    (5535, 122, 383.19, '2026-07-21 13:40:38', 'Completed'),
+    (5536, 429, 75.55, '2026-08-05 18:29:39', 'Refunded'),
+    (5537, 87, 264.55, '2026-08-23 19:38:44', 'Completed'),
+    (5538, 386, 420.83, '2026-08-21 13:36:40', 'Completed'),
+    (5539, 388, 399.17, '2026-09-08 15:26:51', 'Completed'),
+    (5540, 53, 23.12, '2026-10-01 15:51:19', 'Completed'),
+    (5541, 82, 460.68, '2026-05-14 04:33:10', 'Completed'),
+    (5542, 301, 493.15, '2026-08-03 12:32:07', 'Pending'),
+    (5543, 82, 303.18, '2026-05-16 08:30:23', 'Completed'),
+    (5544, 242, 420.56, '2026-09-21 05:08:06', 'Pending'),
+    (5545, 142, 367.01, '2026-09-13 23:33:42', 'Completed'),
+    (5546, 447, 388.1, '2026-07-12 04:10:36', 'Pending'),
+    (5547, 317, 489.61, '2026-07-03 04:49:46', 'Pending'),
+    (5548, 89, 422.34, '2026-08-14 01:19:15', 'Refunded'),
+    (5549, 424, 47.55, '2026-05-04 01:37:28', 'Completed'),
+    (5550, 221, 452.01, '2026-07-09 14:14:55', 'Completed'),
+    (5551, 476, 429.43, '2026-04-20 07:48:08', 'Pending'),
+    (5552, 251, 145.88, '2026-06-05 02:40:06', 'Completed'),
+    (5553, 234, 215.48, '2026-08-19 12:02:01', 'Completed'),
+    (5554, 190, 370.69, '2026-09-08 00:40:00', 'Completed'),
+    (5555, 396, 130.98, '2026-05-15 01:59:18', 'Completed'),
+    (5556, 267, 381.76, '2026-04-30 13:33:38', 'Refunded'),
+    (5557, 326, 220.79, '2026-06-21 10:04:20', 'Completed'),
+    (5558, 234, 134.66, '2026-05-07 01:51:37', 'Completed'),
+    (5559, 151, 109.07, '2026-06-29 00:50:56', 'Refunded'),
+    (5560, 142, 424.53, '2026-04-26 12:00:51', 'Completed'),
+    (5561, 268, 102.2, '2026-04-27 07:19:45', 'Completed'),
+    (5562, 6, 93.29, '2026-08-02 18:10:31', 'Completed'),
+    (5563, 238, 132.22, '2026-08-14 08:28:31', 'Pending'),
+    (5564, 109, 274.2, '2026-05-04 00:31:18', 'Completed'),
+    (5565, 473, 374.9, '2026-07-03 22:01:29', 'Completed'),
+    (5566, 6, 496.08, '2026-09-10 13:08:55', 'Completed'),
+    (5567, 108, 188.24, '2026-08-31 07:33:16', 'Completed'),
+    (5568, 267, 478.52, '2026-07-21 21:33:53', 'Pending'),
+    (5569, 459, 57.2, '2026-06-19 08:06:24', 'Completed'),
+    (5570, 98, 240.95, '2026-05-20 15:41:53', 'Completed'),
+    (5571, 150, 409.25, '2026-08-08 11:50:11', 'Completed'),
+    (5572, 98, 438.28, '2026-09-27 00:26:18', 'Completed'),
+    (5573, 325, 379.43, '2026-04-20 04:08:58', 'Completed'),
+    (5574, 162, 219.36, '2026-09-30 22:28:02', 'Completed'),
+    (5575, 424, 156.13, '2026-07-07 07:58:46', 'Completed'),
+    (5576, 257, 267.75, '2026-07-07 13:30:40', 'Pending'),
+    (5577, 424, 464.91, '2026-06-11 05:08:54', 'Pending'),
+    (5578, 196, 173.32, '2026-04-22 02:03:28', 'Completed'),
+    (5579, 424, 282.87, '2026-04-22 22:55:56', 'Completed'),
+    (5580, 240, 102.27, '2026-08-29 22:01:34', 'Completed'),
+    (5581, 463, 229.33, '2026-08-01 15:07:42', 'Completed'),
+    (5582, 411, 340.32, '2026-04-30 05:42:13', 'Completed'),
+    (5583, 217, 166.88, '2026-09-20 20:21:44', 'Completed'),
+    (5584, 7, 356.34, '2026-05-31 12:02:14', 'Completed'),
+    (5585, 109, 468.51, '2026-08-13 19:22:53', 'Completed'),
+    (5586, 414, 131.41, '2026-09-22 22:16:06', 'Completed'),
+    (5587, 9, 438.92, '2026-07-13 16:37:08', 'Refunded'),
+    (5588, 76, 257.01, '2026-09-10 05:37:05', 'Completed'),
+    (5589, 117, 50.14, '2026-07-10 12:56:46', 'Completed'),
+    (5590, 153, 107.08, '2026-09-19 13:41:07', 'Completed'),
+    (5591, 121, 221.81, '2026-05-15 23:00:04', 'Completed'),
+    (5592, 242, 352.68, '2026-08-02 17:04:17', 'Completed'),
+    (5593, 329, 473.95, '2026-06-28 09:06:43', 'Completed'),
+    (5594, 82, 54.15, '2026-07-05 19:43:00', 'Pending'),
+    (5595, 23, 123.54, '2026-05-17 20:45:10', 'Pending'),
+    (5596, 460, 479.38, '2026-08-05 21:42:26', 'Pending'),
+    (5597, 78, 307.05, '2026-06-01 03:38:30', 'Completed'),
+    (5598, 424, 246.74, '2026-09-08 07:00:02', 'Pending'),
+    (5599, 463, 362.03, '2026-09-19 12:30:46', 'Pending'),
+    (5600, 268, 129.0, '2026-05-14 18:57:21', 'Pending'),
+    (5601, 298, 24.43, '2026-06-21 15:44:02', 'Refunded'),
+    (5602, 365, 159.86, '2026-07-11 21:37:27', 'Refunded'),
+    (5603, 280, 393.57, '2026-09-20 04:25:55', 'Refunded'),
+    (5604, 276, 200.04, '2026-09-26 03:08:30', 'Refunded'),
+    (5605, 430, 93.13, '2026-08-29 11:52:06', 'Completed'),
+    (5606, 473, 278.47, '2026-05-07 15:44:54', 'Completed'),
+    (5607, 215, 149.13, '2026-09-13 16:05:51', 'Pending'),
+    (5608, 98, 172.77, '2026-10-17 03:16:15', 'Completed'),
+    (5609, 489, 99.07, '2026-06-08 15:36:38', 'Completed'),
+    (5610, 364, 302.94, '2026-08-01 12:14:39', 'Pending'),
+    (5611, 487, 409.8, '2026-08-15 22:52:56', 'Completed'),
+    (5612, 201, 191.4, '2026-08-18 07:17:25', 'Pending'),
+    (5613, 447, 379.43, '2026-10-04 09:28:07', 'Refunded'),
+    (5614, 348, 353.25, '2026-04-26 04:22:43', 'Completed'),
+    (5615, 231, 130.36, '2026-09-03 12:51:40', 'Completed'),
+    (5616, 418, 192.97, '2026-07-02 06:41:34', 'Completed'),
+    (5617, 102, 136.58, '2026-09-11 03:24:04', 'Completed'),
+    (5618, 285, 93.78, '2026-06-25 16:00:53', 'Completed'),
+    (5619, 276, 128.53, '2026-05-29 02:07:36', 'Completed'),
+    (5620, 114, 372.18, '2026-06-04 12:37:11', 'Completed'),
+    (5621, 268, 246.75, '2026-10-03 12:09:49', 'Completed'),
+    (5622, 299, 324.83, '2026-10-09 10:27:37', 'Completed'),
+    (5623, 402, 454.37, '2026-08-06 21:20:48', 'Completed'),
+    (5624, 453, 314.38, '2026-05-21 06:36:16', 'Completed'),
+    (5625, 147, 430.27, '2026-07-19 10:08:38', 'Completed'),
+    (5626, 365, 242.81, '2026-05-14 05:43:31', 'Completed'),
+    (5627, 265, 29.72, '2026-09-25 16:30:56', 'Completed'),
+    (5628, 43, 428.75, '2026-06-30 00:01:30', 'Completed'),
+    (5629, 273, 403.49, '2026-08-06 07:52:21', 'Completed'),
+    (5630, 414, 233.77, '2026-06-25 03:25:32', 'Completed'),
+    (5631, 317, 107.01, '2026-07-19 16:06:56', 'Completed'),
+    (5632, 98, 158.3, '2026-10-16 22:27:28', 'Pending'),
+    (5633, 348, 172.6, '2026-05-22 00:34:58', 'Completed'),
+    (5634, 322, 296.71, '2026-04-21 14:28:44', 'Completed'),
+    (5635, 9, 318.33, '2026-07-30 09:51:28', 'Completed'),
+    (5636, 153, 196.99, '2026-05-15 14:39:26', 'Completed'),
+    (5637, 411, 150.64, '2026-10-07 19:26:05', 'Pending'),
+    (5638, 322, 485.73, '2026-09-19 11:51:56', 'Completed'),
+    (5639, 238, 415.58, '2026-06-09 09:40:43', 'Pending'),
+    (5640, 473, 421.87, '2026-10-06 11:52:11', 'Completed'),
+    (5641, 262, 112.49, '2026-05-01 07:11:21', 'Refunded'),
+    (5642, 141, 265.95, '2026-06-28 11:38:19', 'Completed'),
+    (5643, 396, 259.17, '2026-09-10 11:20:26', 'Completed'),
+    (5644, 327, 453.57, '2026-10-13 19:29:22', 'Completed'),
+    (5645, 386, 282.1, '2026-06-12 06:52:30', 'Completed'),
+    (5646, 296, 34.75, '2026-06-17 21:52:35', 'Pending'),
+    (5647, 251, 184.08, '2026-06-11 06:02:21', 'Completed'),
+    (5648, 122, 283.84, '2026-08-10 00:00:42', 'Completed'),
+    (5649, 6, 236.23, '2026-09-03 14:45:52', 'Completed'),
+    (5650, 221, 77.82, '2026-09-18 01:58:19', 'Completed'),
+    (5651, 209, 394.54, '2026-07-28 06:12:11', 'Refunded'),
+    (5652, 251, 194.68, '2026-07-30 20:46:11', 'Completed'),
+    (5653, 450, 293.6, '2026-09-29 20:28:57', 'Completed'),
+    (5654, 447, 245.25, '2026-07-06 03:51:58', 'Completed'),
+    (5655, 51, 397.47, '2026-07-17 02:13:35', 'Pending'),
+    (5656, 87, 150.29, '2026-05-20 00:17:02', 'Completed'),
+    (5657, 142, 187.02, '2026-07-10 18:40:21', 'Pending'),
+    (5658, 276, 280.09, '2026-09-12 16:15:36', 'Completed'),
+    (5659, 284, 321.05, '2026-05-14 22:23:35', 'Pending'),
+    (5660, 267, 444.68, '2026-10-11 12:08:05', 'Completed'),
+    (5661, 276, 221.32, '2026-09-18 16:44:44', 'Completed'),
+    (5662, 133, 392.28, '2026-10-17 20:01:31', 'Completed'),
+    (5663, 222, 336.57, '2026-07-11 19:31:01', 'Completed'),
+    (5664, 222, 436.99, '2026-08-27 09:06:38', 'Refunded'),
+    (5665, 447, 443.71, '2026-06-14 02:21:22', 'Completed'),
+    (5666, 490, 449.2, '2026-08-09 04:12:19', 'Pending'),
+    (5667, 329, 226.11, '2026-09-16 16:45:04', 'Completed'),
+    (5668, 26, 433.51, '2026-04-23 15:50:46', 'Completed'),
+    (5669, 181, 166.38, '2026-08-26 11:53:33', 'Completed'),
+    (5670, 314, 416.95, '2026-06-29 15:18:28', 'Completed'),
+    (5671, 131, 371.9, '2026-09-22 08:37:10', 'Completed'),
+    (5672, 117, 441.28, '2026-05-09 22:15:13', 'Completed'),
+    (5673, 423, 28.15, '2026-10-07 12:42:48', 'Completed'),
+    (5674, 157, 320.0, '2026-10-16 06:36:26', 'Completed'),
+    (5675, 178, 432.17, '2026-04-19 05:17:14', 'Completed'),
+    (5676, 215, 312.07, '2026-06-02 08:37:29', 'Pending'),
+    (5677, 386, 71.48, '2026-07-19 10:36:52', 'Completed'),
+    (5678, 40, 214.61, '2026-08-08 01:40:38', 'Completed'),
+    (5679, 185, 388.89, '2026-06-27 17:09:52', 'Completed'),
+    (5680, 162, 218.07, '2026-05-03 19:53:43', 'Pending'),
+    (5681, 51, 391.07, '2026-09-23 05:03:11', 'Refunded'),
+    (5682, 234, 220.93, '2026-07-22 16:14:54', 'Completed'),
+    (5683, 377, 97.11, '2026-07-10 15:03:42', 'Completed'),
+    (5684, 265, 315.69, '2026-06-28 16:33:17', 'Completed'),
+    (5685, 240, 139.29, '2026-06-08 02:48:14', 'Completed'),
+    (5686, 89, 443.17, '2026-08-10 20:12:17', 'Completed'),
+    (5687, 23, 106.99, '2026-06-12 13:16:19', 'Completed'),
+    (5688, 259, 459.22, '2026-05-21 14:40:10', 'Pending'),
+    (5689, 76, 193.36, '2026-10-17 09:08:10', 'Completed'),
+    (5690, 296, 249.63, '2026-07-19 01:48:58', 'Completed'),
+    (5691, 142, 271.55, '2026-04-22 12:09:01', 'Completed'),
+    (5692, 354, 281.24, '2026-07-10 18:26:25', 'Pending'),
+    (5693, 267, 53.46, '2026-06-08 00:38:29', 'Refunded'),
+    (5694, 15, 129.18, '2026-07-26 08:04:45', 'Pending'),
+    (5695, 61, 281.09, '2026-07-22 11:45:38', 'Refunded'),
+    (5696, 327, 394.81, '2026-05-25 17:05:28', 'Completed'),
+    (5697, 352, 260.45, '2026-07-20 01:22:14', 'Completed'),
+    (5698, 131, 118.89, '2026-04-29 18:34:09', 'Completed'),
+    (5699, 23, 123.37, '2026-05-08 07:52:59', 'Completed'),
+    (5700, 265, 271.86, '2026-07-06 03:54:28', 'Completed'),
+    (5701, 123, 347.45, '2026-06-12 16:19:10', 'Completed'),
+    (5702, 388, 177.32, '2026-05-16 21:39:15', 'Completed'),
+    (5703, 204, 414.13, '2026-08-14 19:31:05', 'Completed'),
+    (5704, 451, 372.96, '2026-09-13 11:20:44', 'Completed'),
+    (5705, 379, 108.43, '2026-05-12 10:55:53', 'Completed'),
+    (5706, 121, 279.01, '2026-09-02 21:56:53', 'Completed'),
+    (5707, 14, 102.02, '2026-07-05 04:22:44', 'Completed'),
+    (5708, 211, 499.73, '2026-07-19 16:22:40', 'Completed'),
+    (5709, 280, 135.52, '2026-07-20 22:08:23', 'Pending'),
+    (5710, 468, 208.95, '2026-06-20 03:58:19', 'Completed'),
+    (5711, 475, 163.88, '2026-08-29 23:55:54', 'Completed'),
+    (5712, 413, 372.29, '2026-09-12 05:21:11', 'Completed'),
+    (5713, 217, 178.5, '2026-05-02 18:29:22', 'Completed'),
+    (5714, 43, 116.6, '2026-08-23 03:08:50', 'Completed'),
+    (5715, 153, 237.04, '2026-09-10 15:08:15', 'Completed'),
+    (5716, 238, 270.45, '2026-07-16 03:38:04', 'Completed'),
+    (5717, 148, 338.27, '2026-07-19 17:07:53', 'Completed'),
+    (5718, 302, 475.25, '2026-04-20 08:19:53', 'Pending'),
+    (5719, 133, 61.44, '2026-05-13 21:25:56', 'Completed'),
+    (5720, 27, 304.01, '2026-08-23 16:59:36', 'Completed'),
+    (5721, 14, 49.81, '2026-08-10 06:01:35', 'Completed'),
+    (5722, 490, 475.63, '2026-07-27 23:26:18', 'Completed'),
+    (5723, 480, 277.59, '2026-06-25 16:17:38', 'Completed'),
+    (5724, 476, 447.3, '2026-09-14 05:31:22', 'Refunded'),
+    (5725, 27, 469.9, '2026-06-13 04:17:22', 'Completed'),
+    (5726, 26, 291.03, '2026-09-02 13:15:46', 'Completed'),
+    (5727, 142, 114.59, '2026-05-15 13:37:23', 'Completed'),
+    (5728, 272, 407.37, '2026-10-02 09:52:23', 'Refunded'),
+    (5729, 424, 337.9, '2026-07-28 10:12:34', 'Completed'),
+    (5730, 133, 40.5, '2026-10-14 16:31:52', 'Completed'),
+    (5731, 123, 163.4, '2026-10-03 17:20:49', 'Completed'),
+    (5732, 449, 470.42, '2026-06-13 18:19:27', 'Pending'),
+    (5733, 43, 395.54, '2026-07-20 15:14:36', 'Completed'),
+    (5734, 188, 267.6, '2026-09-27 22:23:14', 'Refunded'),
+    (5735, 62, 451.82, '2026-08-22 10:40:10', 'Completed'),
+    (5736, 82, 79.82, '2026-08-25 08:56:34', 'Completed'),
+    (5737, 57, 488.35, '2026-08-28 20:46:06', 'Pending'),
+    (5738, 282, 138.61, '2026-10-12 14:14:46', 'Completed'),
+    (5739, 450, 272.59, '2026-10-02 23:00:57', 'Refunded'),
+    (5740, 286, 334.85, '2026-06-21 00:30:06', 'Completed'),
+    (5741, 418, 197.14, '2026-06-24 10:16:29', 'Pending'),
+    (5742, 238, 443.53, '2026-07-12 16:37:42', 'Completed'),
+    (5743, 441, 22.94, '2026-07-18 04:47:07', 'Refunded'),
+    (5744, 243, 304.1, '2026-07-17 00:23:12', 'Completed'),
+    (5745, 490, 102.76, '2026-06-26 03:48:17', 'Completed'),
+    (5746, 209, 393.12, '2026-05-22 11:08:04', 'Refunded'),
+    (5747, 396, 31.44, '2026-09-16 09:24:19', 'Completed'),
+    (5748, 156, 388.11, '2026-07-03 09:05:07', 'Completed'),
+    (5749, 348, 337.0, '2026-06-23 11:12:47', 'Refunded'),
+    (5750, 268, 367.78, '2026-05-05 22:55:16', 'Pending'),
+    (5751, 151, 391.19, '2026-06-04 11:17:04', 'Completed'),
+    (5752, 354, 293.08, '2026-06-09 20:54:37', 'Completed'),
+    (5753, 16, 246.71, '2026-05-23 01:54:07', 'Pending'),
+    (5754, 465, 217.97, '2026-07-11 00:30:24', 'Completed'),
+    (5755, 89, 144.49, '2026-07-29 17:36:19', 'Completed'),
+    (5756, 201, 29.4, '2026-04-18 16:36:19', 'Completed'),
+    (5757, 460, 408.28, '2026-07-19 21:10:19', 'Pending'),
+    (5758, 156, 34.48, '2026-07-14 01:08:47', 'Completed'),
+    (5759, 296, 100.77, '2026-09-14 17:46:21', 'Completed'),
+    (5760, 476, 151.64, '2026-04-19 20:37:33', 'Pending'),
+    (5761, 9, 250.26, '2026-09-04 11:47:42', 'Refunded'),
+    (5762, 270, 67.52, '2026-06-03 13:52:34', 'Completed'),
+    (5763, 298, 467.89, '2026-05-11 05:35:27', 'Refunded'),
+    (5764, 429, 206.74, '2026-07-22 11:35:33', 'Pending'),
+    (5765, 377, 246.18, '2026-06-11 11:37:05', 'Completed'),
+    (5766, 280, 288.24, '2026-06-26 17:59:36', 'Refunded'),
+    (5767, 480, 104.7, '2026-10-15 22:16:52', 'Completed'),
+    (5768, 468, 235.89, '2026-10-05 13:46:01', 'Pending'),
+    (5769, 9, 191.4, '2026-05-08 11:33:49', 'Pending'),
+    (5770, 414, 230.9, '2026-06-13 01:17:49', 'Refunded'),
+    (5771, 109, 70.47, '2026-06-02 18:38:50', 'Completed'),
+    (5772, 447, 372.13, '2026-10-15 18:42:51', 'Pending'),
+    (5773, 476, 183.24, '2026-08-10 16:59:18', 'Pending'),
+    (5774, 329, 231.91, '2026-06-25 17:04:31', 'Completed'),
+    (5775, 487, 395.5, '2026-05-26 09:57:25', 'Refunded'),
+    (5776, 185, 23.05, '2026-09-07 08:51:45', 'Completed'),
+    (5777, 364, 404.38, '2026-06-03 16:58:20', 'Pending'),
+    (5778, 322, 373.35, '2026-10-03 03:48:48', 'Pending'),
+    (5779, 302, 179.61, '2026-05-24 03:51:05', 'Completed'),
+    (5780, 299, 478.83, '2026-05-18 21:47:08', 'Completed'),
+    (5781, 406, 395.43, '2026-10-05 04:27:22', 'Completed'),
+    (5782, 242, 125.78, '2026-06-11 08:10:23', 'Completed'),
+    (5783, 315, 391.33, '2026-05-31 13:20:12', 'Completed'),
+    (5784, 201, 487.31, '2026-07-21 21:39:50', 'Completed'),
+    (5785, 21, 344.95, '2026-10-07 09:20:19', 'Pending'),
+    (5786, 467, 475.26, '2026-06-22 17:36:54', 'Completed'),
+    (5787, 98, 463.62, '2026-09-10 22:53:05', 'Completed'),
+    (5788, 141, 137.08, '2026-05-10 13:32:03', 'Refunded'),
+    (5789, 21, 300.49, '2026-07-02 14:21:14', 'Pending'),
+    (5790, 489, 269.86, '2026-09-22 17:10:17', 'Completed'),
+    (5791, 117, 179.6, '2026-08-30 18:31:34', 'Completed'),
+    (5792, 242, 132.32, '2026-08-04 23:13:27', 'Completed'),
+    (5793, 481, 426.39, '2026-06-10 00:07:29', 'Completed'),
+    (5794, 57, 31.92, '2026-06-12 16:59:22', 'Completed'),
+    (5795, 123, 77.48, '2026-05-09 04:39:49', 'Completed'),
+    (5796, 162, 195.62, '2026-06-05 14:17:36', 'Pending'),
+    (5797, 240, 395.95, '2026-04-23 10:01:50', 'Completed'),
+    (5798, 465, 320.06, '2026-06-13 02:09:27', 'Completed'),
+    (5799, 317, 270.6, '2026-05-28 15:34:05', 'Completed'),
+    (5800, 148, 393.89, '2026-05-22 21:25:54', 'Completed'),
+    (5801, 35, 478.43, '2026-08-21 17:07:36', 'Completed'),
+    (5802, 268, 275.69, '2026-07-08 21:03:23', 'Pending'),
+    (5803, 282, 473.6, '2026-07-28 19:27:31', 'Completed'),
+    (5804, 231, 451.3, '2026-06-11 16:17:39', 'Refunded'),
+    (5805, 212, 495.45, '2026-05-17 12:48:54', 'Completed'),
+    (5806, 197, 207.33, '2026-06-16 03:57:54', 'Completed'),
+    (5807, 396, 82.77, '2026-04-20 15:42:25', 'Completed'),
+    (5808, 284, 493.83, '2026-09-26 03:38:23', 'Completed'),
+    (5809, 231, 454.99, '2026-07-14 07:46:48', 'Pending'),
+    (5810, 98, 168.65, '2026-04-23 14:10:07', 'Pending'),
+    (5811, 79, 128.46, '2026-08-09 11:18:57', 'Completed'),
+    (5812, 430, 35.26, '2026-07-20 04:38:52', 'Completed'),
+    (5813, 354, 63.51, '2026-07-26 09:26:21', 'Pending'),
+    (5814, 117, 269.44, '2026-07-20 21:00:37', 'Pending'),
+    (5815, 444, 87.72, '2026-10-17 18:39:33', 'Completed'),
+    (5816, 122, 477.62, '2026-06-01 10:07:22', 'Refunded'),
+    (5817, 40, 265.08, '2026-05-19 00:34:41', 'Pending'),
+    (5818, 242, 105.72, '2026-06-10 08:04:27', 'Refunded'),
+    (5819, 388, 493.67, '2026-06-04 21:04:41', 'Pending'),
+    (5820, 211, 174.01, '2026-07-16 03:15:12', 'Completed'),
+    (5821, 193, 325.87, '2026-10-15 20:25:01', 'Completed'),
+    (5822, 379, 208.93, '2026-07-16 03:01:51', 'Completed'),
+    (5823, 298, 364.27, '2026-08-11 07:53:11', 'Pending'),
+    (5824, 364, 303.76, '2026-06-30 01:41:14', 'Completed'),
+    (5825, 467, 489.16, '2026-05-28 22:32:43', 'Pending'),
+    (5826, 386, 186.68, '2026-08-04 00:25:52', 'Pending'),
+    (5827, 475, 227.23, '2026-08-21 05:28:44', 'Completed'),
+    (5828, 7, 45.65, '2026-09-08 10:38:16', 'Completed'),
+    (5829, 251, 359.05, '2026-10-14 16:17:32', 'Completed'),
+    (5830, 142, 289.62, '2026-06-26 15:07:20', 'Completed'),
+    (5831, 329, 178.4, '2026-09-08 23:02:04', 'Completed'),
+    (5832, 298, 80.21, '2026-07-27 02:44:06', 'Pending'),
+    (5833, 123, 134.84, '2026-05-31 05:12:04', 'Completed'),
+    (5834, 109, 119.11, '2026-05-20 19:03:00', 'Completed'),
+    (5835, 322, 450.74, '2026-04-23 00:47:39', 'Completed'),
+    (5836, 460, 114.29, '2026-10-17 18:15:31', 'Completed'),
+    (5837, 76, 50.71, '2026-09-01 00:53:52', 'Completed'),
+    (5838, 6, 29.41, '2026-10-06 23:06:15', 'Refunded'),
+    (5839, 71, 48.64, '2026-10-13 08:47:43', 'Completed'),
+    (5840, 166, 169.3, '2026-05-13 21:04:55', 'Completed'),
+    (5841, 322, 68.85, '2026-09-08 06:43:39', 'Pending'),
+    (5842, 62, 168.4, '2026-06-02 03:06:11', 'Completed'),
+    (5843, 478, 455.01, '2026-09-19 15:11:52', 'Completed'),
+    (5844, 217, 33.13, '2026-05-01 10:53:41', 'Pending'),
+    (5845, 133, 446.81, '2026-07-14 17:14:12', 'Completed'),
+    (5846, 45, 182.95, '2026-06-26 23:52:57', 'Completed'),
+    (5847, 121, 467.04, '2026-05-05 07:20:54', 'Completed'),
+    (5848, 322, 166.02, '2026-10-12 09:20:45', 'Completed'),
+    (5849, 423, 357.24, '2026-05-31 18:03:14', 'Completed'),
+    (5850, 71, 266.01, '2026-04-23 21:38:21', 'Pending'),
+    (5851, 481, 378.52, '2026-04-28 01:18:26', 'Completed'),
+    (5852, 354, 149.5, '2026-07-23 22:07:42', 'Completed'),
+    (5853, 267, 28.37, '2026-07-11 17:17:07', 'Completed'),
+    (5854, 150, 111.69, '2026-05-31 18:04:37', 'Refunded'),
+    (5855, 299, 332.72, '2026-10-04 05:17:28', 'Completed'),
+    (5856, 102, 378.45, '2026-06-26 00:59:38', 'Completed'),
+    (5857, 449, 400.27, '2026-08-12 12:48:02', 'Completed'),
+    (5858, 114, 170.31, '2026-10-10 21:57:26', 'Refunded'),
+    (5859, 459, 351.26, '2026-08-11 05:35:18', 'Pending'),
+    (5860, 489, 266.74, '2026-04-25 09:15:45', 'Completed'),
+    (5861, 178, 188.12, '2026-09-25 01:21:46', 'Completed'),
+    (5862, 325, 146.44, '2026-06-16 16:04:30', 'Completed'),
+    (5863, 148, 496.43, '2026-09-04 08:55:17', 'Completed'),
+    (5864, 9, 420.67, '2026-08-27 15:28:47', 'Completed'),
+    (5865, 270, 235.1, '2026-07-19 16:17:39', 'Completed'),
+    (5866, 26, 119.85, '2026-09-02 09:23:13', 'Completed'),
+    (5867, 178, 72.19, '2026-07-29 12:36:46', 'Pending'),
+    (5868, 181, 133.44, '2026-07-29 22:16:35', 'Pending'),
+    (5869, 429, 50.62, '2026-10-07 11:12:36', 'Completed'),
+    (5870, 154, 261.75, '2026-09-05 08:32:51', 'Completed'),
+    (5871, 217, 301.4, '2026-05-07 15:08:23', 'Completed'),
+    (5872, 148, 243.58, '2026-06-07 08:36:40', 'Completed'),
+    (5873, 228, 54.17, '2026-09-13 20:21:15', 'Completed'),
+    (5874, 285, 310.61, '2026-08-19 22:29:52', 'Completed'),
+    (5875, 61, 326.03, '2026-05-21 18:38:52', 'Completed'),
+    (5876, 365, 473.55, '2026-06-05 10:27:49', 'Completed'),
+    (5877, 87, 245.06, '2026-08-30 17:06:04', 'Completed'),
+    (5878, 27, 197.17, '2026-05-24 13:27:14', 'Pending'),
+    (5879, 317, 428.13, '2026-06-18 14:09:53', 'Completed'),
+    (5880, 122, 215.58, '2026-06-27 17:03:39', 'Completed'),
+    (5881, 181, 43.43, '2026-06-18 18:35:45', 'Completed'),
+    (5882, 467, 479.46, '2026-05-01 14:35:07', 'Completed'),
+    (5883, 26, 449.41, '2026-08-05 10:26:08', 'Completed'),
+    (5884, 418, 135.77, '2026-10-03 00:22:12', 'Completed'),
+    (5885, 252, 256.53, '2026-10-03 16:39:19', 'Completed'),
+    (5886, 329, 473.68, '2026-04-24 20:06:56', 'Refunded'),
+    (5887, 282, 351.26, '2026-08-14 21:54:33', 'Completed'),
+    (5888, 102, 414.61, '2026-04-30 14:25:36', 'Pending'),
+    (5889, 23, 363.24, '2026-08-31 21:10:31', 'Completed'),
+    (5890, 299, 321.1, '2026-04-27 05:09:27', 'Completed'),
+    (5891, 189, 141.76, '2026-07-02 03:51:37', 'Completed'),
+    (5892, 259, 46.75, '2026-10-14 14:49:57', 'Pending'),
+    (5893, 311, 484.0, '2026-09-22 19:19:58', 'Completed'),
+    (5894, 238, 286.09, '2026-06-07 05:24:48', 'Completed'),
+    (5895, 400, 237.84, '2026-08-17 23:42:09', 'Completed'),
+    (5896, 445, 81.59, '2026-04-18 15:56:49', 'Completed'),
+    (5897, 151, 125.03, '2026-10-03 11:54:19', 'Completed'),
+    (5898, 365, 104.86, '2026-08-28 02:28:23', 'Pending'),
+    (5899, 365, 57.07, '2026-06-13 10:00:28', 'Pending'),
+    (5900, 259, 336.33, '2026-09-12 08:06:14', 'Completed'),
+    (5901, 272, 179.86, '2026-07-29 21:43:15', 'Completed'),
+    (5902, 136, 368.92, '2026-06-04 19:05:00', 'Pending'),
+    (5903, 164, 50.91, '2026-07-28 12:36:42', 'Pending'),
+    (5904, 71, 474.45, '2026-07-23 20:07:51', 'Completed'),
+    (5905, 209, 104.02, '2026-10-10 23:55:55', 'Pending'),
+    (5906, 147, 79.37, '2026-08-24 18:41:51', 'Completed'),
+    (5907, 26, 262.05, '2026-10-08 02:00:05', 'Refunded'),
+    (5908, 189, 243.01, '2026-10-02 04:32:51', 'Completed'),
+    (5909, 449, 377.81, '2026-08-10 21:39:00', 'Completed'),
+    (5910, 460, 307.17, '2026-08-17 00:24:23', 'Pending'),
+    (5911, 190, 92.69, '2026-07-01 15:12:26', 'Completed'),
+    (5912, 445, 448.17, '2026-04-18 18:28:37', 'Pending'),
+    (5913, 215, 298.09, '2026-04-27 15:35:09', 'Refunded'),
+    (5914, 372, 278.98, '2026-06-12 17:46:46', 'Pending'),
+    (5915, 6, 235.66, '2026-05-02 16:02:43', 'Pending'),
+    (5916, 478, 326.04, '2026-05-29 07:47:12', 'Refunded'),
+    (5917, 296, 368.71, '2026-05-04 00:23:18', 'Pending'),
+    (5918, 282, 321.17, '2026-05-12 05:26:43', 'Pending'),
+    (5919, 481, 136.5, '2026-06-01 17:28:24', 'Completed'),
+    (5920, 15, 451.43, '2026-06-02 03:22:33', 'Completed'),
+    (5921, 273, 278.35, '2026-10-03 07:39:47', 'Completed'),
+    (5922, 35, 169.48, '2026-05-04 07:45:43', 'Completed'),
+    (5923, 98, 129.24, '2026-09-07 03:38:54', 'Completed'),
+    (5924, 102, 42.92, '2026-07-24 13:39:02', 'Completed'),
+    (5925, 348, 439.7, '2026-09-04 17:29:05', 'Completed'),
+    (5926, 178, 372.98, '2026-06-23 06:41:03', 'Completed'),
+    (5927, 472, 153.45, '2026-10-03 01:50:38', 'Completed'),
+    (5928, 204, 396.07, '2026-09-11 21:30:46', 'Pending'),
+    (5929, 480, 479.67, '2026-08-13 10:17:06', 'Completed'),
+    (5930, 374, 416.17, '2026-10-11 23:10:13', 'Completed'),
+    (5931, 197, 313.84, '2026-10-17 17:54:52', 'Pending'),
+    (5932, 396, 186.32, '2026-06-11 22:20:21', 'Completed'),
+    (5933, 441, 22.81, '2026-08-16 08:54:11', 'Completed'),
+    (5934, 365, 181.3, '2026-04-23 13:43:30', 'Pending'),
+    (5935, 354, 132.57, '2026-09-02 04:35:44', 'Refunded'),
+    (5936, 451, 456.69, '2026-05-24 23:18:38', 'Completed'),
+    (5937, 148, 345.06, '2026-10-06 14:21:55', 'Completed'),
+    (5938, 78, 331.16, '2026-06-11 21:19:19', 'Completed'),
+    (5939, 472, 91.82, '2026-08-12 10:04:34', 'Completed'),
+    (5940, 402, 229.37, '2026-06-12 14:03:49', 'Pending'),
+    (5941, 322, 222.88, '2026-06-23 17:08:37', 'Completed'),
+    (5942, 151, 332.61, '2026-06-21 11:36:55', 'Completed'),
+    (5943, 254, 300.21, '2026-07-01 01:59:10', 'Completed'),
+    (5944, 71, 195.0, '2026-06-12 17:10:02', 'Completed'),
+    (5945, 222, 93.5, '2026-09-03 03:05:17', 'Completed'),
+    (5946, 62, 422.73, '2026-05-05 14:36:37', 'Completed'),
+    (5947, 26, 484.29, '2026-10-15 04:37:18', 'Completed'),
+    (5948, 280, 414.11, '2026-04-27 10:35:50', 'Completed'),
+    (5949, 107, 355.7, '2026-04-30 21:24:07', 'Pending'),
+    (5950, 293, 20.72, '2026-08-22 09:38:23', 'Completed'),
+    (5951, 470, 179.78, '2026-08-15 15:48:51', 'Completed'),
+    (5952, 133, 85.05, '2026-08-04 01:01:33', 'Pending'),
+    (5953, 354, 32.37, '2026-04-30 00:57:40', 'Completed'),
+    (5954, 465, 194.95, '2026-07-21 22:33:42', 'Pending'),
+    (5955, 352, 316.44, '2026-05-03 15:53:48', 'Completed'),
+    (5956, 114, 411.53, '2026-06-12 14:05:24', 'Completed'),
+    (5957, 487, 405.55, '2026-05-11 20:05:30', 'Completed'),
+    (5958, 424, 402.92, '2026-08-27 21:15:17', 'Pending'),
+    (5959, 164, 448.71, '2026-07-04 05:18:51', 'Completed'),
+    (5960, 348, 211.44, '2026-10-11 13:25:46', 'Completed'),
+    (5961, 150, 156.14, '2026-08-28 09:42:49', 'Completed'),
+    (5962, 122, 193.7, '2026-09-22 10:12:19', 'Pending'),
+    (5963, 372, 450.76, '2026-09-06 08:00:33', 'Completed'),
+    (5964, 465, 280.7, '2026-07-01 23:01:18', 'Completed'),
+    (5965, 474, 429.71, '2026-06-18 10:09:06', 'Completed'),
+    (5966, 259, 345.04, '2026-04-20 14:07:21', 'Completed'),
+    (5967, 449, 235.16, '2026-06-03 08:21:27', 'Completed'),
+    (5968, 98, 129.17, '2026-07-27 05:12:28', 'Completed'),
+    (5969, 369, 103.44, '2026-10-02 14:35:56', 'Completed'),
+    (5970, 172, 34.27, '2026-05-18 16:41:16', 'Completed'),
+    (5971, 487, 489.71, '2026-07-01 16:12:27', 'Completed'),
+    (5972, 123, 400.29, '2026-08-31 14:41:31', 'Completed'),
+    (5973, 314, 447.65, '2026-06-19 20:17:52', 'Completed'),
+    (5974, 71, 458.52, '2026-06-03 15:00:32', 'Completed'),
+    (5975, 156, 435.95, '2026-08-06 20:36:13', 'Completed'),
+    (5976, 468, 89.89, '2026-07-30 03:16:30', 'Completed'),
+    (5977, 71, 372.41, '2026-10-14 06:05:36', 'Completed'),
+    (5978, 276, 488.51, '2026-08-13 19:38:34', 'Completed'),
+    (5979, 108, 443.21, '2026-10-09 02:27:08', 'Completed'),
+    (5980, 278, 207.1, '2026-06-19 22:48:44', 'Refunded'),
+    (5981, 481, 177.16, '2026-07-25 20:25:24', 'Refunded'),
+    (5982, 172, 74.41, '2026-06-21 19:52:35', 'Refunded'),
+    (5983, 87, 471.46, '2026-05-25 19:16:17', 'Completed'),
+    (5984, 257, 463.95, '2026-06-14 17:29:26', 'Completed'),
+    (5985, 286, 220.05, '2026-06-27 16:44:03', 'Pending'),
+    (5986, 208, 248.23, '2026-07-15 09:18:44', 'Completed'),
+    (5987, 7, 71.38, '2026-05-07 17:13:00', 'Completed'),
+    (5988, 497, 305.45, '2026-09-25 09:10:29', 'Completed'),
+    (5989, 162, 244.41, '2026-07-11 13:07:12', 'Completed'),
+    (5990, 35, 455.96, '2026-04-18 16:15:49', 'Completed'),
+    (5991, 246, 471.21, '2026-07-15 01:42:55', 'Completed'),
+    (5992, 251, 490.82, '2026-05-11 20:45:30', 'Completed'),
+    (5993, 162, 391.95, '2026-05-09 18:00:46', 'Completed'),
+    (5994, 489, 167.71, '2026-09-26 18:52:53', 'Completed'),
+    (5995, 45, 35.88, '2026-08-09 21:21:15', 'Completed'),
+    (5996, 45, 436.2, '2026-06-29 03:29:29', 'Completed'),
+    (5997, 301, 276.44, '2026-07-19 06:47:26', 'Completed'),
+    (5998, 386, 421.94, '2026-09-17 17:23:05', 'Refunded'),
+    (5999, 480, 385.42, '2026-05-18 21:56:18', 'Completed'),
+    (6000, 151, 321.43, '2026-10-09 13:32:47', 'Completed');
 
 INSERT INTO `ticket` (`ticket_id`, `order_id`, `event_id`, `user_id`, `price`, `status`) VALUES
-    ('TKT-00001', 5001, 1135, 274, 11.66, 'Purchased'),
-    ('TKT-00002', 5001, 1135, 274, 11.66, 'Reserved'),
-    ('TKT-00003', 5002, 1122, 198, 36.8, 'Refunded'),
-    ('TKT-00004', 5002, 1122, 198, 36.8, 'Reserved'),
-    ('TKT-00005', 5004, 1198, 92, 59.09, 'Purchased'),
-    ('TKT-00006', 5004, 1198, 92, 59.09, 'Purchased'),
-    ('TKT-00007', 5004, 1198, 92, 59.09, 'Refunded'),
-    ('TKT-00008', 5004, 1198, 92, 59.09, 'Purchased'),
-    ('TKT-00009', 5005, 1192, 40, 92.78, 'Purchased'),
-    ('TKT-00010', 5005, 1192, 40, 92.78, 'Reserved'),
-    ('TKT-00011', 5005, 1192, 40, 92.78, 'Reserved'),
-    ('TKT-00012', 5005, 1192, 40, 92.78, 'Purchased'),
-    ('TKT-00013', 5007, 1157, 139, 50.98, 'Purchased'),
-    ('TKT-00014', 5007, 1157, 139, 50.98, 'Refunded'),
-    ('TKT-00015', 5009, 1074, 401, 125.56, 'Reserved'),
-    ('TKT-00016', 5010, 1095, 29, 51.12, 'Reserved'),
-    ('TKT-00017', 5010, 1095, 29, 51.12, 'Reserved'),
-    ('TKT-00018', 5010, 1095, 29, 51.12, 'Reserved'),
-    ('TKT-00019', 5010, 1095, 29, 51.12, 'Refunded'),
-    ('TKT-00020', 5011, 1153, 27, 38.0, 'Purchased'),
-    ('TKT-00021', 5011, 1153, 27, 38.0, 'Purchased'),
-    ('TKT-00022', 5011, 1153, 27, 38.0, 'Reserved'),
-    ('TKT-00023', 5012, 1088, 199, 112.84, 'Reserved'),
-    ('TKT-00024', 5012, 1088, 199, 112.84, 'Purchased'),
-    ('TKT-00025', 5012, 1088, 199, 112.84, 'Purchased'),
-    ('TKT-00026', 5012, 1088, 199, 112.84, 'Refunded'),
-    ('TKT-00027', 5013, 1112, 105, 482.58, 'Purchased'),
-    ('TKT-00028', 5014, 1176, 372, 124.52, 'Reserved'),
-    ('TKT-00029', 5014, 1176, 372, 124.52, 'Refunded'),
-    ('TKT-00030', 5014, 1176, 372, 124.52, 'Reserved'),
-    ('TKT-00031', 5015, 1159, 211, 64.26, 'Reserved'),
-    ('TKT-00032', 5015, 1159, 211, 64.26, 'Reserved'),
-    ('TKT-00033', 5015, 1159, 211, 64.26, 'Purchased'),
-    ('TKT-00034', 5015, 1159, 211, 64.26, 'Refunded'),
-    ('TKT-00035', 5015, 1159, 211, 64.26, 'Purchased'),
-    ('TKT-00036', 5016, 1163, 465, 79.36, 'Reserved'),
-    ('TKT-00037', 5016, 1163, 465, 79.36, 'Refunded'),
-    ('TKT-00038', 5016, 1163, 465, 79.36, 'Refunded'),
-    ('TKT-00039', 5016, 1163, 465, 79.36, 'Purchased'),
-    ('TKT-00040', 5017, 1014, 386, 78.93, 'Purchased'),
-    ('TKT-00041', 5017, 1014, 386, 78.93, 'Reserved'),
-    ('TKT-00042', 5017, 1014, 386, 78.93, 'Reserved'),
-    ('TKT-00043', 5018, 1030, 405, 96.67, 'Reserved'),
-    ('TKT-00044', 5018, 1030, 405, 96.67, 'Purchased'),
-    ('TKT-00045', 5018, 1030, 405, 96.67, 'Purchased'),
-    ('TKT-00046', 5018, 1030, 405, 96.67, 'Reserved'),
-    ('TKT-00047', 5018, 1030, 405, 96.67, 'Refunded'),
-    ('TKT-00048', 5019, 1085, 176, 21.52, 'Reserved'),
-    ('TKT-00049', 5019, 1085, 176, 21.52, 'Purchased'),
-    ('TKT-00050', 5019, 1085, 176, 21.52, 'Purchased'),
-    ('TKT-00051', 5020, 1135, 474, 88.75, 'Purchased'),
-    ('TKT-00052', 5020, 1135, 474, 88.75, 'Refunded'),
-    ('TKT-00053', 5020, 1135, 474, 88.75, 'Refunded'),
-    ('TKT-00054', 5020, 1135, 474, 88.75, 'Purchased'),
-    ('TKT-00055', 5020, 1135, 474, 88.75, 'Purchased'),
-    ('TKT-00056', 5021, 1008, 189, 152.24, 'Purchased'),
-    ('TKT-00057', 5021, 1008, 189, 152.24, 'Reserved'),
-    ('TKT-00058', 5021, 1008, 189, 152.24, 'Reserved'),
-    ('TKT-00059', 5022, 1091, 464, 7.88, 'Refunded'),
-    ('TKT-00060', 5022, 1091, 464, 7.88, 'Refunded'),
-    ('TKT-00061', 5022, 1091, 464, 7.88, 'Purchased'),
-    ('TKT-00062', 5022, 1091, 464, 7.88, 'Refunded'),
-    ('TKT-00063', 5022, 1091, 464, 7.88, 'Reserved'),
-    ('TKT-00064', 5024, 1058, 458, 17.27, 'Purchased'),
-    ('TKT-00065', 5024, 1058, 458, 17.27, 'Purchased'),
-    ('TKT-00066', 5024, 1058, 458, 17.27, 'Refunded'),
-    ('TKT-00067', 5025, 1146, 86, 256.72, 'Reserved'),
-    ('TKT-00068', 5026, 1120, 213, 69.06, 'Reserved'),
-    ('TKT-00069', 5026, 1120, 213, 69.06, 'Purchased'),
-    ('TKT-00070', 5026, 1120, 213, 69.06, 'Refunded'),
-    ('TKT-00071', 5028, 1009, 277, 78.85, 'Purchased'),
-    ('TKT-00072', 5028, 1009, 277, 78.85, 'Reserved'),
-    ('TKT-00073', 5028, 1009, 277, 78.85, 'Refunded'),
-    ('TKT-00074', 5028, 1009, 277, 78.85, 'Reserved'),
-    ('TKT-00075', 5028, 1009, 277, 78.85, 'Reserved'),
-    ('TKT-00076', 5029, 1088, 116, 453.91, 'Reserved'),
-    ('TKT-00077', 5030, 1102, 92, 159.0, 'Purchased'),
-    ('TKT-00078', 5030, 1102, 92, 159.0, 'Refunded'),
-    ('TKT-00079', 5030, 1102, 92, 159.0, 'Reserved'),
-    ('TKT-00080', 5031, 1166, 443, 7.95, 'Purchased'),
-    ('TKT-00081', 5031, 1166, 443, 7.95, 'Purchased'),
-    ('TKT-00082', 5031, 1166, 443, 7.95, 'Refunded'),
-    ('TKT-00083', 5031, 1166, 443, 7.95, 'Purchased'),
-    ('TKT-00084', 5031, 1166, 443, 7.95, 'Purchased'),
-    ('TKT-00085', 5032, 1184, 206, 417.92, 'Refunded'),
-    ('TKT-00086', 5033, 1161, 37, 131.07, 'Purchased'),
-    ('TKT-00087', 5033, 1161, 37, 131.07, 'Reserved'),
-    ('TKT-00088', 5034, 1159, 179, 403.18, 'Refunded'),
-    ('TKT-00089', 5035, 1019, 46, 41.8, 'Purchased'),
-    ('TKT-00090', 5035, 1019, 46, 41.8, 'Purchased'),
-    ('TKT-00091', 5035, 1019, 46, 41.8, 'Reserved'),
-    ('TKT-00092', 5035, 1019, 46, 41.8, 'Reserved'),
-    ('TKT-00093', 5037, 1086, 423, 121.81, 'Refunded'),
-    ('TKT-00094', 5037, 1086, 423, 121.81, 'Refunded'),
-    ('TKT-00095', 5037, 1086, 423, 121.81, 'Reserved'),
-    ('TKT-00096', 5041, 1012, 206, 131.55, 'Purchased'),
-    ('TKT-00097', 5041, 1012, 206, 131.55, 'Refunded'),
-    ('TKT-00098', 5042, 1136, 433, 75.33, 'Reserved'),
-    ('TKT-00099', 5042, 1136, 433, 75.33, 'Refunded'),
-    ('TKT-00100', 5042, 1136, 433, 75.33, 'Refunded'),
-    ('TKT-00101', 5042, 1136, 433, 75.33, 'Reserved'),
-    ('TKT-00102', 5043, 1124, 458, 54.19, 'Purchased'),
-    ('TKT-00103', 5043, 1124, 458, 54.19, 'Refunded'),
-    ('TKT-00104', 5043, 1124, 458, 54.19, 'Refunded'),
-    ('TKT-00105', 5043, 1124, 458, 54.19, 'Refunded'),
-    ('TKT-00106', 5043, 1124, 458, 54.19, 'Refunded'),
-    ('TKT-00107', 5044, 1077, 436, 118.09, 'Purchased'),
-    ('TKT-00108', 5044, 1077, 436, 118.09, 'Purchased'),
-    ('TKT-00109', 5044, 1077, 436, 118.09, 'Purchased'),
-    ('TKT-00110', 5045, 1012, 310, 52.48, 'Reserved'),
-    ('TKT-00111', 5047, 1049, 383, 116.8, 'Purchased'),
-    ('TKT-00112', 5047, 1049, 383, 116.8, 'Reserved'),
-    ('TKT-00113', 5048, 1061, 31, 61.93, 'Refunded'),
-    ('TKT-00114', 5048, 1061, 31, 61.93, 'Reserved'),
-    ('TKT-00115', 5048, 1061, 31, 61.93, 'Reserved'),
-    ('TKT-00116', 5049, 1125, 413, 81.63, 'Refunded'),
-    ('TKT-00117', 5049, 1125, 413, 81.63, 'Purchased'),
-    ('TKT-00118', 5049, 1125, 413, 81.63, 'Refunded'),
-    ('TKT-00119', 5049, 1125, 413, 81.63, 'Reserved'),
-    ('TKT-00120', 5049, 1125, 413, 81.63, 'Purchased'),
-    ('TKT-00121', 5051, 1074, 75, 71.94, 'Refunded'),
-    ('TKT-00122', 5051, 1074, 75, 71.94, 'Reserved'),
-    ('TKT-00123', 5051, 1074, 75, 71.94, 'Reserved'),
-    ('TKT-00124', 5051, 1074, 75, 71.94, 'Purchased'),
-    ('TKT-00125', 5052, 1024, 410, 192.67, 'Reserved'),
-    ('TKT-00126', 5052, 1024, 410, 192.67, 'Purchased'),
-    ('TKT-00127', 5054, 1163, 301, 34.57, 'Purchased'),
-    ('TKT-00128', 5055, 1051, 204, 424.84, 'Reserved'),
-    ('TKT-00129', 5058, 1117, 176, 85.15, 'Reserved'),
-    ('TKT-00130', 5058, 1117, 176, 85.15, 'Purchased'),
-    ('TKT-00131', 5058, 1117, 176, 85.15, 'Purchased'),
-    ('TKT-00132', 5058, 1117, 176, 85.15, 'Refunded'),
-    ('TKT-00133', 5060, 1188, 414, 54.84, 'Reserved'),
-    ('TKT-00134', 5060, 1188, 414, 54.84, 'Refunded'),
-    ('TKT-00135', 5060, 1188, 414, 54.84, 'Refunded'),
-    ('TKT-00136', 5060, 1188, 414, 54.84, 'Refunded'),
-    ('TKT-00137', 5061, 1009, 115, 93.83, 'Reserved'),
-    ('TKT-00138', 5061, 1009, 115, 93.83, 'Purchased'),
-    ('TKT-00139', 5061, 1009, 115, 93.83, 'Refunded'),
-    ('TKT-00140', 5061, 1009, 115, 93.83, 'Reserved'),
-    ('TKT-00141', 5064, 1035, 106, 30.32, 'Refunded'),
-    ('TKT-00142', 5064, 1035, 106, 30.32, 'Refunded'),
-    ('TKT-00143', 5065, 1132, 141, 92.63, 'Refunded'),
-    ('TKT-00144', 5065, 1132, 141, 92.63, 'Refunded'),
-    ('TKT-00145', 5065, 1132, 141, 92.63, 'Purchased'),
-    ('TKT-00146', 5065, 1132, 141, 92.63, 'Refunded'),
-    ('TKT-00147', 5065, 1132, 141, 92.63, 'Refunded'),
-    ('TKT-00148', 5066, 1018, 155, 156.38, 'Purchased'),
-    ('TKT-00149', 5066, 1018, 155, 156.38, 'Reserved'),
-    ('TKT-00150', 5067, 1066, 110, 21.62, 'Refunded'),
-    ('TKT-00151', 5067, 1066, 110, 21.62, 'Purchased'),
-    ('TKT-00152', 5067, 1066, 110, 21.62, 'Refunded'),
-    ('TKT-00153', 5067, 1066, 110, 21.62, 'Refunded'),
-    ('TKT-00154', 5067, 1066, 110, 21.62, 'Reserved'),
-    ('TKT-00155', 5068, 1066, 122, 87.29, 'Reserved'),
-    ('TKT-00156', 5068, 1066, 122, 87.29, 'Reserved'),
-    ('TKT-00157', 5068, 1066, 122, 87.29, 'Reserved'),
-    ('TKT-00158', 5068, 1066, 122, 87.29, 'Purchased'),
-    ('TKT-00159', 5068, 1066, 122, 87.29, 'Purchased'),
-    ('TKT-00160', 5069, 1096, 440, 62.03, 'Reserved'),
-    ('TKT-00161', 5069, 1096, 440, 62.03, 'Reserved'),
-    ('TKT-00162', 5069, 1096, 440, 62.03, 'Purchased'),
-    ('TKT-00163', 5069, 1096, 440, 62.03, 'Reserved'),
-    ('TKT-00164', 5070, 1110, 105, 156.89, 'Reserved'),
-    ('TKT-00165', 5070, 1110, 105, 156.89, 'Refunded'),
-    ('TKT-00166', 5070, 1110, 105, 156.89, 'Reserved'),
-    ('TKT-00167', 5072, 1184, 176, 36.25, 'Purchased'),
-    ('TKT-00168', 5072, 1184, 176, 36.25, 'Reserved'),
-    ('TKT-00169', 5072, 1184, 176, 36.25, 'Reserved'),
-    ('TKT-00170', 5072, 1184, 176, 36.25, 'Reserved'),
-    ('TKT-00171', 5072, 1184, 176, 36.25, 'Refunded'),
-    ('TKT-00172', 5075, 1014, 407, 217.0, 'Refunded'),
-    ('TKT-00173', 5075, 1014, 407, 217.0, 'Purchased'),
-    ('TKT-00174', 5077, 1081, 183, 96.73, 'Reserved'),
-    ('TKT-00175', 5077, 1081, 183, 96.73, 'Refunded'),
-    ('TKT-00176', 5078, 1039, 299, 17.3, 'Reserved'),
-    ('TKT-00177', 5078, 1039, 299, 17.3, 'Reserved'),
-    ('TKT-00178', 5078, 1039, 299, 17.3, 'Reserved'),
-    ('TKT-00179', 5078, 1039, 299, 17.3, 'Purchased'),
-    ('TKT-00180', 5078, 1039, 299, 17.3, 'Refunded'),
-    ('TKT-00181', 5079, 1188, 242, 76.72, 'Reserved'),
-    ('TKT-00182', 5079, 1188, 242, 76.72, 'Purchased'),
-    ('TKT-00183', 5079, 1188, 242, 76.72, 'Refunded'),
-    ('TKT-00184', 5079, 1188, 242, 76.72, 'Reserved'),
-    ('TKT-00185', 5080, 1020, 212, 24.9, 'Reserved'),
-    ('TKT-00186', 5080, 1020, 212, 24.9, 'Purchased'),
-    ('TKT-00187', 5080, 1020, 212, 24.9, 'Reserved'),
-    ('TKT-00188', 5081, 1174, 159, 227.68, 'Refunded'),
-    ('TKT-00189', 5081, 1174, 159, 227.68, 'Refunded'),
-    ('TKT-00190', 5083, 1176, 62, 174.62, 'Refunded'),
-    ('TKT-00191', 5084, 1069, 54, 98.69, 'Purchased'),
-    ('TKT-00192', 5084, 1069, 54, 98.69, 'Purchased'),
-    ('TKT-00193', 5084, 1069, 54, 98.69, 'Purchased'),
-    ('TKT-00194', 5085, 1138, 499, 120.25, 'Reserved'),
-    ('TKT-00195', 5085, 1138, 499, 120.25, 'Reserved'),
-    ('TKT-00196', 5085, 1138, 499, 120.25, 'Reserved'),
-    ('TKT-00197', 5086, 1064, 448, 499.41, 'Purchased'),
-    ('TKT-00198', 5088, 1049, 51, 31.43, 'Purchased'),
-    ('TKT-00199', 5088, 1049, 51, 31.43, 'Reserved'),
-    ('TKT-00200', 5088, 1049, 51, 31.43, 'Reserved'),
-    ('TKT-00201', 5088, 1049, 51, 31.43, 'Purchased'),
-    ('TKT-00202', 5089, 1007, 100, 60.62, 'Purchased'),
-    ('TKT-00203', 5089, 1007, 100, 60.62, 'Refunded'),
-    ('TKT-00204', 5089, 1007, 100, 60.62, 'Purchased'),
-    ('TKT-00205', 5089, 1007, 100, 60.62, 'Purchased'),
-    ('TKT-00206', 5089, 1007, 100, 60.62, 'Reserved'),
-    ('TKT-00207', 5091, 1136, 458, 93.54, 'Reserved'),
-    ('TKT-00208', 5091, 1136, 458, 93.54, 'Reserved'),
-    ('TKT-00209', 5091, 1136, 458, 93.54, 'Reserved'),
-    ('TKT-00210', 5091, 1136, 458, 93.54, 'Purchased'),
-    ('TKT-00211', 5091, 1136, 458, 93.54, 'Refunded'),
-    ('TKT-00212', 5093, 1194, 14, 5.22, 'Refunded'),
-    ('TKT-00213', 5093, 1194, 14, 5.22, 'Reserved'),
-    ('TKT-00214', 5093, 1194, 14, 5.22, 'Purchased'),
-    ('TKT-00215', 5093, 1194, 14, 5.22, 'Purchased'),
-    ('TKT-00216', 5093, 1194, 14, 5.22, 'Reserved'),
-    ('TKT-00217', 5095, 1137, 110, 68.51, 'Refunded'),
-    ('TKT-00218', 5095, 1137, 110, 68.51, 'Reserved'),
-    ('TKT-00219', 5095, 1137, 110, 68.51, 'Reserved'),
-    ('TKT-00220', 5096, 1165, 170, 57.18, 'Purchased'),
-    ('TKT-00221', 5096, 1165, 170, 57.18, 'Reserved'),
-    ('TKT-00222', 5096, 1165, 170, 57.18, 'Reserved'),
-    ('TKT-00223', 5096, 1165, 170, 57.18, 'Purchased'),
-    ('TKT-00224', 5096, 1165, 170, 57.18, 'Refunded'),
-    ('TKT-00225', 5098, 1002, 246, 39.97, 'Reserved'),
-    ('TKT-00226', 5098, 1002, 246, 39.97, 'Reserved'),
-    ('TKT-00227', 5098, 1002, 246, 39.97, 'Reserved'),
-    ('TKT-00228', 5098, 1002, 246, 39.97, 'Refunded'),
-    ('TKT-00229', 5098, 1002, 246, 39.97, 'Reserved'),
-    ('TKT-00230', 5102, 1154, 313, 22.8, 'Purchased'),
-    ('TKT-00231', 5102, 1154, 313, 22.8, 'Refunded'),
-    ('TKT-00232', 5102, 1154, 313, 22.8, 'Refunded'),
-    ('TKT-00233', 5102, 1154, 313, 22.8, 'Purchased'),
-    ('TKT-00234', 5102, 1154, 313, 22.8, 'Reserved'),
-    ('TKT-00235', 5103, 1142, 29, 93.55, 'Refunded'),
-    ('TKT-00236', 5103, 1142, 29, 93.55, 'Refunded'),
-    ('TKT-00237', 5103, 1142, 29, 93.55, 'Purchased'),
-    ('TKT-00238', 5104, 1164, 190, 6.96, 'Refunded'),
-    ('TKT-00239', 5104, 1164, 190, 6.96, 'Purchased'),
-    ('TKT-00240', 5104, 1164, 190, 6.96, 'Reserved'),
-    ('TKT-00241', 5104, 1164, 190, 6.96, 'Reserved'),
-    ('TKT-00242', 5105, 1129, 378, 196.05, 'Refunded'),
-    ('TKT-00243', 5109, 1188, 126, 225.5, 'Refunded'),
-    ('TKT-00244', 5109, 1188, 126, 225.5, 'Purchased'),
-    ('TKT-00245', 5110, 1046, 85, 55.1, 'Refunded'),
-    ('TKT-00246', 5110, 1046, 85, 55.1, 'Refunded'),
-    ('TKT-00247', 5110, 1046, 85, 55.1, 'Purchased'),
-    ('TKT-00248', 5110, 1046, 85, 55.1, 'Refunded'),
-    ('TKT-00249', 5111, 1019, 216, 158.25, 'Purchased'),
-    ('TKT-00250', 5111, 1019, 216, 158.25, 'Reserved'),
-    ('TKT-00251', 5111, 1019, 216, 158.25, 'Reserved'),
-    ('TKT-00252', 5113, 1081, 113, 284.0, 'Purchased'),
-    ('TKT-00253', 5116, 1181, 378, 5.03, 'Reserved'),
-    ('TKT-00254', 5116, 1181, 378, 5.03, 'Reserved'),
-    ('TKT-00255', 5116, 1181, 378, 5.03, 'Reserved'),
-    ('TKT-00256', 5116, 1181, 378, 5.03, 'Purchased'),
-    ('TKT-00257', 5116, 1181, 378, 5.03, 'Reserved'),
-    ('TKT-00258', 5117, 1027, 468, 144.26, 'Refunded'),
-    ('TKT-00259', 5117, 1027, 468, 144.26, 'Reserved'),
-    ('TKT-00260', 5118, 1121, 467, 41.12, 'Purchased'),
-    ('TKT-00261', 5119, 1074, 122, 463.86, 'Refunded'),
-    ('TKT-00262', 5120, 1038, 410, 108.36, 'Refunded'),
-    ('TKT-00263', 5120, 1038, 410, 108.36, 'Purchased'),
-    ('TKT-00264', 5120, 1038, 410, 108.36, 'Purchased'),
-    ('TKT-00265', 5122, 1132, 407, 389.56, 'Reserved'),
-    ('TKT-00266', 5124, 1022, 291, 77.7, 'Refunded'),
-    ('TKT-00267', 5124, 1022, 291, 77.7, 'Refunded'),
-    ('TKT-00268', 5124, 1022, 291, 77.7, 'Purchased'),
-    ('TKT-00269', 5124, 1022, 291, 77.7, 'Purchased'),
-    ('TKT-00270', 5125, 1138, 76, 51.41, 'Refunded'),
-    ('TKT-00271', 5125, 1138, 76, 51.41, 'Purchased'),
-    ('TKT-00272', 5125, 1138, 76, 51.41, 'Reserved'),
-    ('TKT-00273', 5126, 1026, 343, 286.64, 'Purchased'),
-    ('TKT-00274', 5127, 1170, 159, 48.14, 'Reserved'),
-    ('TKT-00275', 5127, 1170, 159, 48.14, 'Refunded'),
-    ('TKT-00276', 5129, 1066, 159, 74.22, 'Reserved'),
-    ('TKT-00277', 5129, 1066, 159, 74.22, 'Purchased'),
-    ('TKT-00278', 5129, 1066, 159, 74.22, 'Reserved'),
-    ('TKT-00279', 5129, 1066, 159, 74.22, 'Reserved'),
-    ('TKT-00280', 5130, 1074, 100, 180.82, 'Refunded'),
-    ('TKT-00281', 5130, 1074, 100, 180.82, 'Refunded'),
-    ('TKT-00282', 5131, 1053, 140, 23.05, 'Reserved'),
-    ('TKT-00283', 5131, 1053, 140, 23.05, 'Refunded'),
-    ('TKT-00284', 5131, 1053, 140, 23.05, 'Purchased'),
-    ('TKT-00285', 5131, 1053, 140, 23.05, 'Refunded'),
-    ('TKT-00286', 5132, 1079, 32, 13.1, 'Purchased'),
-    ('TKT-00287', 5132, 1079, 32, 13.1, 'Refunded'),
-    ('TKT-00288', 5132, 1079, 32, 13.1, 'Reserved'),
-    ('TKT-00289', 5132, 1079, 32, 13.1, 'Reserved'),
-    ('TKT-00290', 5133, 1173, 394, 130.95, 'Refunded'),
-    ('TKT-00291', 5133, 1173, 394, 130.95, 'Refunded'),
-    ('TKT-00292', 5133, 1173, 394, 130.95, 'Reserved'),
-    ('TKT-00293', 5134, 1114, 24, 59.84, 'Refunded'),
-    ('TKT-00294', 5134, 1114, 24, 59.84, 'Purchased'),
-    ('TKT-00295', 5134, 1114, 24, 59.84, 'Reserved'),
-    ('TKT-00296', 5134, 1114, 24, 59.84, 'Refunded'),
-    ('TKT-00297', 5134, 1114, 24, 59.84, 'Reserved'),
-    ('TKT-00298', 5135, 1018, 26, 63.52, 'Purchased'),
-    ('TKT-00299', 5136, 1097, 203, 13.52, 'Reserved'),
-    ('TKT-00300', 5136, 1097, 203, 13.52, 'Reserved'),
-    ('TKT-00301', 5136, 1097, 203, 13.52, 'Purchased'),
-    ('TKT-00302', 5138, 1163, 179, 96.74, 'Reserved'),
-    ('TKT-00303', 5138, 1163, 179, 96.74, 'Refunded'),
-    ('TKT-00304', 5139, 1180, 378, 56.53, 'Refunded'),
-    ('TKT-00305', 5139, 1180, 378, 56.53, 'Reserved'),
-    ('TKT-00306', 5139, 1180, 378, 56.53, 'Reserved'),
-    ('TKT-00307', 5139, 1180, 378, 56.53, 'Refunded'),
-    ('TKT-00308', 5139, 1180, 378, 56.53, 'Reserved'),
-    ('TKT-00309', 5140, 1102, 139, 130.66, 'Purchased'),
-    ('TKT-00310', 5140, 1102, 139, 130.66, 'Reserved'),
-    ('TKT-00311', 5140, 1102, 139, 130.66, 'Refunded'),
-    ('TKT-00312', 5142, 1069, 427, 93.46, 'Refunded'),
-    ('TKT-00313', 5142, 1069, 427, 93.46, 'Purchased'),
-    ('TKT-00314', 5142, 1069, 427, 93.46, 'Refunded'),
-    ('TKT-00315', 5142, 1069, 427, 93.46, 'Purchased'),
-    ('TKT-00316', 5144, 1162, 152, 426.14, 'Reserved'),
-    ('TKT-00317', 5145, 1100, 197, 53.09, 'Reserved'),
-    ('TKT-00318', 5145, 1100, 197, 53.09, 'Purchased'),
-    ('TKT-00319', 5146, 1102, 158, 53.98, 'Refunded'),
-    ('TKT-00320', 5146, 1102, 158, 53.98, 'Reserved'),
-    ('TKT-00321', 5146, 1102, 158, 53.98, 'Reserved'),
-    ('TKT-00322', 5146, 1102, 158, 53.98, 'Purchased'),
-    ('TKT-00323', 5146, 1102, 158, 53.98, 'Refunded'),
-    ('TKT-00324', 5147, 1165, 440, 167.15, 'Reserved'),
-    ('TKT-00325', 5147, 1165, 440, 167.15, 'Purchased'),
-    ('TKT-00326', 5148, 1091, 189, 101.25, 'Purchased'),
-    ('TKT-00327', 5148, 1091, 189, 101.25, 'Reserved'),
-    ('TKT-00328', 5148, 1091, 189, 101.25, 'Reserved'),
-    ('TKT-00329', 5148, 1091, 189, 101.25, 'Refunded'),
-    ('TKT-00330', 5149, 1077, 380, 84.18, 'Reserved'),
-    ('TKT-00331', 5149, 1077, 380, 84.18, 'Refunded'),
-    ('TKT-00332', 5149, 1077, 380, 84.18, 'Purchased'),
-    ('TKT-00333', 5151, 1159, 5, 40.94, 'Refunded'),
-    ('TKT-00334', 5151, 1159, 5, 40.94, 'Purchased'),
-    ('TKT-00335', 5151, 1159, 5, 40.94, 'Purchased'),
-    ('TKT-00336', 5151, 1159, 5, 40.94, 'Purchased'),
-    ('TKT-00337', 5151, 1159, 5, 40.94, 'Purchased'),
-    ('TKT-00338', 5153, 1181, 494, 61.08, 'Reserved'),
-    ('TKT-00339', 5153, 1181, 494, 61.08, 'Refunded'),
-    ('TKT-00340', 5153, 1181, 494, 61.08, 'Purchased'),
-    ('TKT-00341', 5153, 1181, 494, 61.08, 'Reserved'),
-    ('TKT-00342', 5153, 1181, 494, 61.08, 'Purchased'),
-    ('TKT-00343', 5155, 1020, 422, 98.99, 'Reserved'),
-    ('TKT-00344', 5155, 1020, 422, 98.99, 'Refunded'),
-    ('TKT-00345', 5155, 1020, 422, 98.99, 'Refunded'),
-    ('TKT-00346', 5155, 1020, 422, 98.99, 'Refunded'),
-    ('TKT-00347', 5155, 1020, 422, 98.99, 'Reserved'),
-    ('TKT-00348', 5156, 1187, 246, 210.38, 'Reserved'),
-    ('TKT-00349', 5158, 1046, 264, 52.3, 'Refunded'),
-    ('TKT-00350', 5158, 1046, 264, 52.3, 'Reserved'),
-    ('TKT-00351', 5158, 1046, 264, 52.3, 'Refunded'),
-    ('TKT-00352', 5158, 1046, 264, 52.3, 'Purchased'),
-    ('TKT-00353', 5159, 1136, 210, 10.22, 'Reserved'),
-    ('TKT-00354', 5159, 1136, 210, 10.22, 'Reserved'),
-    ('TKT-00355', 5159, 1136, 210, 10.22, 'Reserved'),
-    ('TKT-00356', 5159, 1136, 210, 10.22, 'Refunded'),
-    ('TKT-00357', 5160, 1176, 272, 188.54, 'Purchased'),
-    ('TKT-00358', 5160, 1176, 272, 188.54, 'Reserved'),
-    ('TKT-00359', 5161, 1074, 230, 135.7, 'Refunded'),
-    ('TKT-00360', 5162, 1145, 347, 22.62, 'Purchased'),
-    ('TKT-00361', 5162, 1145, 347, 22.62, 'Purchased'),
-    ('TKT-00362', 5162, 1145, 347, 22.62, 'Purchased'),
-    ('TKT-00363', 5162, 1145, 347, 22.62, 'Reserved'),
-    ('TKT-00364', 5162, 1145, 347, 22.62, 'Reserved'),
-    ('TKT-00365', 5164, 1057, 7, 91.8, 'Reserved'),
-    ('TKT-00366', 5164, 1057, 7, 91.8, 'Purchased'),
-    ('TKT-00367', 5167, 1008, 79, 290.91, 'Purchased'),
-    ('TKT-00368', 5168, 1181, 86, 121.65, 'Purchased'),
-    ('TKT-00369', 5169, 1135, 455, 6.6, 'Purchased'),
-    ('TKT-00370', 5169, 1135, 455, 6.6, 'Reserved'),
-    ('TKT-00371', 5169, 1135, 455, 6.6, 'Reserved'),
-    ('TKT-00372', 5169, 1135, 455, 6.6, 'Refunded'),
-    ('TKT-00373', 5170, 1115, 494, 94.95, 'Refunded'),
-    ('TKT-00374', 5170, 1115, 494, 94.95, 'Reserved'),
-    ('TKT-00375', 5170, 1115, 494, 94.95, 'Reserved'),
-    ('TKT-00376', 5171, 1081, 436, 31.26, 'Purchased'),
-    ('TKT-00377', 5171, 1081, 436, 31.26, 'Purchased'),
-    ('TKT-00378', 5171, 1081, 436, 31.26, 'Purchased'),
-    ('TKT-00379', 5174, 1115, 445, 186.05, 'Reserved'),
-    ('TKT-00380', 5176, 1074, 493, 19.69, 'Purchased'),
-    ('TKT-00381', 5176, 1074, 493, 19.69, 'Reserved'),
-    ('TKT-00382', 5176, 1074, 493, 19.69, 'Refunded'),
-    ('TKT-00383', 5176, 1074, 493, 19.69, 'Reserved'),
-    ('TKT-00384', 5176, 1074, 493, 19.69, 'Reserved'),
-    ('TKT-00385', 5177, 1190, 189, 160.21, 'Reserved'),
-    ('TKT-00386', 5177, 1190, 189, 160.21, 'Purchased'),
-    ('TKT-00387', 5178, 1189, 106, 183.63, 'Refunded'),
-    ('TKT-00388', 5180, 1077, 383, 407.69, 'Refunded'),
-    ('TKT-00389', 5182, 1196, 310, 72.95, 'Refunded'),
-    ('TKT-00390', 5182, 1196, 310, 72.95, 'Purchased'),
-    ('TKT-00391', 5182, 1196, 310, 72.95, 'Purchased'),
-    ('TKT-00392', 5184, 1066, 313, 51.41, 'Refunded'),
-    ('TKT-00393', 5184, 1066, 313, 51.41, 'Purchased'),
-    ('TKT-00394', 5184, 1066, 313, 51.41, 'Reserved'),
-    ('TKT-00395', 5185, 1098, 410, 214.21, 'Refunded'),
-    ('TKT-00396', 5186, 1003, 273, 97.76, 'Refunded'),
-    ('TKT-00397', 5186, 1003, 273, 97.76, 'Purchased'),
-    ('TKT-00398', 5186, 1003, 273, 97.76, 'Purchased'),
-    ('TKT-00399', 5189, 1159, 272, 174.25, 'Reserved'),
-    ('TKT-00400', 5190, 1147, 287, 304.53, 'Purchased'),
-    ('TKT-00401', 5191, 1138, 113, 47.55, 'Refunded'),
-    ('TKT-00402', 5191, 1138, 113, 47.55, 'Purchased'),
-    ('TKT-00403', 5191, 1138, 113, 47.55, 'Reserved'),
-    ('TKT-00404', 5191, 1138, 113, 47.55, 'Reserved'),
-    ('TKT-00405', 5191, 1138, 113, 47.55, 'Purchased'),
-    ('TKT-00406', 5192, 1024, 386, 129.5, 'Purchased'),
-    ('TKT-00407', 5192, 1024, 386, 129.5, 'Reserved'),
-    ('TKT-00408', 5192, 1024, 386, 129.5, 'Refunded'),
-    ('TKT-00409', 5193, 1153, 355, 86.31, 'Refunded'),
-    ('TKT-00410', 5193, 1153, 355, 86.31, 'Purchased'),
-    ('TKT-00411', 5193, 1153, 355, 86.31, 'Reserved'),
-    ('TKT-00412', 5193, 1153, 355, 86.31, 'Reserved'),
-    ('TKT-00413', 5193, 1153, 355, 86.31, 'Refunded'),
-    ('TKT-00414', 5194, 1086, 465, 58.48, 'Refunded'),
-    ('TKT-00415', 5194, 1086, 465, 58.48, 'Reserved'),
-    ('TKT-00416', 5194, 1086, 465, 58.48, 'Purchased'),
-    ('TKT-00417', 5194, 1086, 465, 58.48, 'Purchased'),
-    ('TKT-00418', 5194, 1086, 465, 58.48, 'Purchased'),
-    ('TKT-00419', 5195, 1074, 106, 131.65, 'Purchased'),
-    ('TKT-00420', 5195, 1074, 106, 131.65, 'Reserved'),
-    ('TKT-00421', 5196, 1060, 2, 186.66, 'Reserved'),
-    ('TKT-00422', 5196, 1060, 2, 186.66, 'Purchased'),
-    ('TKT-00423', 5197, 1014, 158, 261.86, 'Reserved'),
-    ('TKT-00424', 5198, 1091, 465, 57.59, 'Refunded'),
-    ('TKT-00425', 5198, 1091, 465, 57.59, 'Reserved'),
-    ('TKT-00426', 5198, 1091, 465, 57.59, 'Purchased'),
-    ('TKT-00427', 5198, 1091, 465, 57.59, 'Purchased'),
-    ('TKT-00428', 5199, 1163, 465, 152.16, 'Reserved'),
-    ('TKT-00429', 5199, 1163, 465, 152.16, 'Refunded'),
-    ('TKT-00430', 5200, 1085, 313, 78.66, 'Purchased'),
-    ('TKT-00431', 5200, 1085, 313, 78.66, 'Reserved'),
-    ('TKT-00432', 5200, 1085, 313, 78.66, 'Purchased'),
-    ('TKT-00433', 5201, 1188, 27, 49.69, 'Purchased'),
-    ('TKT-00434', 5201, 1188, 27, 49.69, 'Reserved'),
-    ('TKT-00435', 5201, 1188, 27, 49.69, 'Reserved'),
-    ('TKT-00436', 5201, 1188, 27, 49.69, 'Refunded'),
-    ('TKT-00437', 5203, 1047, 473, 13.42, 'Reserved'),
-    ('TKT-00438', 5203, 1047, 473, 13.42, 'Reserved'),
-    ('TKT-00439', 5203, 1047, 473, 13.42, 'Reserved'),
-    ('TKT-00440', 5203, 1047, 473, 13.42, 'Purchased'),
-    ('TKT-00441', 5204, 1152, 77, 84.69, 'Refunded'),
-    ('TKT-00442', 5204, 1152, 77, 84.69, 'Refunded'),
-    ('TKT-00443', 5204, 1152, 77, 84.69, 'Purchased'),
-    ('TKT-00444', 5204, 1152, 77, 84.69, 'Refunded'),
-    ('TKT-00445', 5205, 1032, 372, 127.5, 'Reserved'),
-    ('TKT-00446', 5205, 1032, 372, 127.5, 'Reserved'),
-    ('TKT-00447', 5205, 1032, 372, 127.5, 'Refunded'),
-    ('TKT-00448', 5206, 1120, 436, 37.99, 'Refunded'),
-    ('TKT-00449', 5206, 1120, 436, 37.99, 'Reserved'),
-    ('TKT-00450', 5206, 1120, 436, 37.99, 'Purchased'),
-    ('TKT-00451', 5206, 1120, 436, 37.99, 'Refunded'),
-    ('TKT-00452', 5206, 1120, 436, 37.99, 'Reserved'),
-    ('TKT-00453', 5210, 1148, 213, 280.37, 'Purchased'),
-    ('TKT-00454', 5211, 1188, 27, 83.23, 'Refunded'),
-    ('TKT-00455', 5211, 1188, 27, 83.23, 'Purchased'),
-    ('TKT-00456', 5211, 1188, 27, 83.23, 'Reserved'),
-    ('TKT-00457', 5211, 1188, 27, 83.23, 'Reserved'),
-    ('TKT-00458', 5211, 1188, 27, 83.23, 'Reserved'),
-    ('TKT-00459', 5213, 1173, 199, 17.97, 'Refunded'),
-    ('TKT-00460', 5213, 1173, 199, 17.97, 'Refunded'),
-    ('TKT-00461', 5213, 1173, 199, 17.97, 'Refunded'),
-    ('TKT-00462', 5214, 1056, 421, 58.73, 'Purchased'),
-    ('TKT-00463', 5214, 1056, 421, 58.73, 'Reserved'),
-    ('TKT-00464', 5215, 1086, 276, 104.79, 'Reserved'),
-    ('TKT-00465', 5215, 1086, 276, 104.79, 'Reserved'),
-    ('TKT-00466', 5215, 1086, 276, 104.79, 'Reserved'),
-    ('TKT-00467', 5216, 1111, 252, 141.6, 'Refunded'),
-    ('TKT-00468', 5216, 1111, 252, 141.6, 'Purchased'),
-    ('TKT-00469', 5219, 1156, 51, 59.38, 'Reserved'),
-    ('TKT-00470', 5222, 1132, 499, 20.17, 'Reserved'),
-    ('TKT-00471', 5223, 1176, 170, 362.26, 'Reserved'),
-    ('TKT-00472', 5224, 1191, 405, 209.14, 'Reserved'),
-    ('TKT-00473', 5226, 1036, 433, 44.57, 'Reserved'),
-    ('TKT-00474', 5226, 1036, 433, 44.57, 'Purchased'),
-    ('TKT-00475', 5226, 1036, 433, 44.57, 'Purchased'),
-    ('TKT-00476', 5226, 1036, 433, 44.57, 'Refunded'),
-    ('TKT-00477', 5227, 1135, 200, 91.53, 'Purchased'),
-    ('TKT-00478', 5227, 1135, 200, 91.53, 'Reserved'),
-    ('TKT-00479', 5227, 1135, 200, 91.53, 'Reserved'),
-    ('TKT-00480', 5227, 1135, 200, 91.53, 'Refunded'),
-    ('TKT-00481', 5229, 1170, 113, 28.73, 'Refunded'),
-    ('TKT-00482', 5229, 1170, 113, 28.73, 'Refunded'),
-    ('TKT-00483', 5229, 1170, 113, 28.73, 'Refunded'),
-    ('TKT-00484', 5229, 1170, 113, 28.73, 'Reserved'),
-    ('TKT-00485', 5231, 1138, 49, 37.14, 'Refunded'),
-    ('TKT-00486', 5231, 1138, 49, 37.14, 'Reserved'),
-    ('TKT-00487', 5231, 1138, 49, 37.14, 'Refunded'),
-    ('TKT-00488', 5231, 1138, 49, 37.14, 'Reserved'),
-    ('TKT-00489', 5232, 1126, 216, 115.46, 'Purchased'),
-    ('TKT-00490', 5232, 1126, 216, 115.46, 'Reserved'),
-    ('TKT-00491', 5232, 1126, 216, 115.46, 'Purchased'),
-    ('TKT-00492', 5233, 1105, 216, 46.28, 'Reserved'),
-    ('TKT-00493', 5233, 1105, 216, 46.28, 'Purchased'),
-    ('TKT-00494', 5233, 1105, 216, 46.28, 'Refunded'),
-    ('TKT-00495', 5233, 1105, 216, 46.28, 'Purchased'),
-    ('TKT-00496', 5233, 1105, 216, 46.28, 'Refunded'),
-    ('TKT-00497', 5234, 1034, 299, 39.01, 'Reserved'),
-    ('TKT-00498', 5234, 1034, 299, 39.01, 'Purchased'),
-    ('TKT-00499', 5234, 1034, 299, 39.01, 'Reserved'),
-    ('TKT-00500', 5234, 1034, 299, 39.01, 'Purchased'),
-    ('TKT-00501', 5234, 1034, 299, 39.01, 'Reserved'),
-    ('TKT-00502', 5235, 1142, 212, 222.31, 'Reserved'),
-    ('TKT-00503', 5235, 1142, 212, 222.31, 'Reserved'),
-    ('TKT-00504', 5237, 1027, 466, 144.2, 'Purchased'),
-    ('TKT-00505', 5237, 1027, 466, 144.2, 'Reserved'),
-    ('TKT-00506', 5238, 1167, 352, 87.98, 'Refunded'),
-    ('TKT-00507', 5238, 1167, 352, 87.98, 'Purchased'),
-    ('TKT-00508', 5238, 1167, 352, 87.98, 'Purchased'),
-    ('TKT-00509', 5238, 1167, 352, 87.98, 'Purchased'),
-    ('TKT-00510', 5238, 1167, 352, 87.98, 'Purchased'),
-    ('TKT-00511', 5242, 1057, 190, 18.17, 'Purchased'),
-    ('TKT-00512', 5242, 1057, 190, 18.17, 'Refunded'),
-    ('TKT-00513', 5242, 1057, 190, 18.17, 'Purchased'),
-    ('TKT-00514', 5242, 1057, 190, 18.17, 'Purchased'),
-    ('TKT-00515', 5242, 1057, 190, 18.17, 'Purchased'),
-    ('TKT-00516', 5244, 1074, 273, 23.5, 'Reserved'),
-    ('TKT-00517', 5244, 1074, 273, 23.5, 'Refunded'),
-    ('TKT-00518', 5244, 1074, 273, 23.5, 'Refunded'),
-    ('TKT-00519', 5244, 1074, 273, 23.5, 'Reserved'),
-    ('TKT-00520', 5244, 1074, 273, 23.5, 'Purchased'),
-    ('TKT-00521', 5245, 1014, 465, 125.97, 'Purchased'),
-    ('TKT-00522', 5245, 1014, 465, 125.97, 'Purchased'),
-    ('TKT-00523', 5247, 1127, 274, 33.57, 'Purchased'),
-    ('TKT-00524', 5247, 1127, 274, 33.57, 'Reserved'),
-    ('TKT-00525', 5247, 1127, 274, 33.57, 'Reserved'),
-    ('TKT-00526', 5248, 1153, 273, 10.23, 'Reserved'),
-    ('TKT-00527', 5248, 1153, 273, 10.23, 'Refunded'),
-    ('TKT-00528', 5248, 1153, 273, 10.23, 'Refunded'),
-    ('TKT-00529', 5248, 1153, 273, 10.23, 'Purchased'),
-    ('TKT-00530', 5248, 1153, 273, 10.23, 'Reserved'),
-    ('TKT-00531', 5249, 1142, 14, 11.54, 'Purchased'),
-    ('TKT-00532', 5249, 1142, 14, 11.54, 'Purchased'),
-    ('TKT-00533', 5250, 1122, 387, 181.11, 'Refunded'),
-    ('TKT-00534', 5250, 1122, 387, 181.11, 'Reserved'),
-    ('TKT-00535', 5251, 1052, 105, 133.03, 'Reserved'),
-    ('TKT-00536', 5251, 1052, 105, 133.03, 'Refunded'),
-    ('TKT-00537', 5251, 1052, 105, 133.03, 'Refunded'),
-    ('TKT-00538', 5252, 1094, 431, 201.93, 'Refunded'),
-    ('TKT-00539', 5252, 1094, 431, 201.93, 'Reserved'),
-    ('TKT-00540', 5255, 1025, 347, 151.68, 'Purchased'),
-    ('TKT-00541', 5257, 1100, 24, 74.14, 'Refunded'),
-    ('TKT-00542', 5257, 1100, 24, 74.14, 'Reserved'),
-    ('TKT-00543', 5257, 1100, 24, 74.14, 'Reserved'),
-    ('TKT-00544', 5257, 1100, 24, 74.14, 'Refunded'),
-    ('TKT-00545', 5257, 1100, 24, 74.14, 'Reserved'),
-    ('TKT-00546', 5260, 1049, 436, 38.09, 'Reserved'),
-    ('TKT-00547', 5260, 1049, 436, 38.09, 'Refunded'),
-    ('TKT-00548', 5260, 1049, 436, 38.09, 'Refunded'),
-    ('TKT-00549', 5260, 1049, 436, 38.09, 'Reserved'),
-    ('TKT-00550', 5260, 1049, 436, 38.09, 'Reserved'),
-    ('TKT-00551', 5262, 1072, 42, 18.11, 'Reserved'),
-    ('TKT-00552', 5262, 1072, 42, 18.11, 'Refunded'),
-    ('TKT-00553', 5262, 1072, 42, 18.11, 'Refunded'),
-    ('TKT-00554', 5262, 1072, 42, 18.11, 'Refunded'),
-    ('TKT-00555', 5263, 1129, 380, 52.87, 'Purchased'),
-    ('TKT-00556', 5263, 1129, 380, 52.87, 'Purchased'),
-    ('TKT-00557', 5264, 1105, 183, 121.76, 'Purchased'),
-    ('TKT-00558', 5264, 1105, 183, 121.76, 'Purchased'),
-    ('TKT-00559', 5266, 1086, 204, 499.5, 'Purchased'),
-    ('TKT-00560', 5268, 1019, 14, 60.73, 'Reserved'),
-    ('TKT-00561', 5268, 1019, 14, 60.73, 'Reserved'),
-    ('TKT-00562', 5268, 1019, 14, 60.73, 'Reserved'),
-    ('TKT-00563', 5268, 1019, 14, 60.73, 'Refunded'),
-    ('TKT-00564', 5268, 1019, 14, 60.73, 'Refunded'),
-    ('TKT-00565', 5269, 1043, 205, 113.15, 'Refunded'),
-    ('TKT-00566', 5269, 1043, 205, 113.15, 'Reserved'),
-    ('TKT-00567', 5269, 1043, 205, 113.15, 'Reserved'),
-    ('TKT-00568', 5270, 1054, 61, 76.59, 'Purchased'),
-    ('TKT-00569', 5270, 1054, 61, 76.59, 'Purchased'),
-    ('TKT-00570', 5270, 1054, 61, 76.59, 'Refunded'),
-    ('TKT-00571', 5271, 1200, 113, 374.7, 'Refunded'),
-    ('TKT-00572', 5272, 1012, 92, 33.45, 'Purchased'),
-    ('TKT-00573', 5272, 1012, 92, 33.45, 'Purchased'),
-    ('TKT-00574', 5272, 1012, 92, 33.45, 'Purchased'),
-    ('TKT-00575', 5272, 1012, 92, 33.45, 'Purchased'),
-    ('TKT-00576', 5272, 1012, 92, 33.45, 'Refunded'),
-    ('TKT-00577', 5273, 1081, 335, 46.88, 'Purchased'),
-    ('TKT-00578', 5273, 1081, 335, 46.88, 'Refunded'),
-    ('TKT-00579', 5273, 1081, 335, 46.88, 'Refunded'),
-    ('TKT-00580', 5275, 1015, 307, 20.03, 'Reserved'),
-    ('TKT-00581', 5275, 1015, 307, 20.03, 'Refunded'),
-    ('TKT-00582', 5275, 1015, 307, 20.03, 'Purchased'),
-    ('TKT-00583', 5275, 1015, 307, 20.03, 'Purchased'),
-    ('TKT-00584', 5275, 1015, 307, 20.03, 'Reserved'),
-    ('TKT-00585', 5276, 1108, 296, 370.12, 'Refunded'),
-    ('TKT-00586', 5278, 1082, 262, 28.87, 'Refunded'),
-    ('TKT-00587', 5278, 1082, 262, 28.87, 'Purchased'),
-    ('TKT-00588', 5278, 1082, 262, 28.87, 'Refunded'),
-    ('TKT-00589', 5278, 1082, 262, 28.87, 'Purchased'),
-    ('TKT-00590', 5280, 1039, 440, 58.05, 'Purchased'),
-    ('TKT-00591', 5280, 1039, 440, 58.05, 'Refunded'),
-    ('TKT-00592', 5280, 1039, 440, 58.05, 'Refunded'),
-    ('TKT-00593', 5280, 1039, 440, 58.05, 'Purchased'),
-    ('TKT-00594', 5280, 1039, 440, 58.05, 'Reserved'),
-    ('TKT-00595', 5281, 1139, 100, 115.63, 'Purchased'),
-    ('TKT-00596', 5281, 1139, 100, 115.63, 'Purchased'),
-    ('TKT-00597', 5281, 1139, 100, 115.63, 'Reserved'),
-    ('TKT-00598', 5282, 1095, 471, 79.7, 'Reserved'),
-    ('TKT-00599', 5282, 1095, 471, 79.7, 'Purchased'),
-    ('TKT-00600', 5282, 1095, 471, 79.7, 'Refunded'),
-    ('TKT-00601', 5282, 1095, 471, 79.7, 'Refunded'),
-    ('TKT-00602', 5283, 1163, 474, 22.43, 'Refunded'),
-    ('TKT-00603', 5283, 1163, 474, 22.43, 'Reserved'),
-    ('TKT-00604', 5283, 1163, 474, 22.43, 'Refunded'),
-    ('TKT-00605', 5286, 1033, 246, 148.61, 'Reserved'),
-    ('TKT-00606', 5286, 1033, 246, 148.61, 'Refunded'),
-    ('TKT-00607', 5286, 1033, 246, 148.61, 'Reserved'),
-    ('TKT-00608', 5287, 1170, 32, 8.13, 'Reserved'),
-    ('TKT-00609', 5287, 1170, 32, 8.13, 'Reserved'),
-    ('TKT-00610', 5287, 1170, 32, 8.13, 'Refunded'),
-    ('TKT-00611', 5287, 1170, 32, 8.13, 'Reserved'),
-    ('TKT-00612', 5288, 1141, 473, 40.09, 'Refunded'),
-    ('TKT-00613', 5288, 1141, 473, 40.09, 'Reserved'),
-    ('TKT-00614', 5290, 1099, 455, 54.08, 'Refunded'),
-    ('TKT-00615', 5290, 1099, 455, 54.08, 'Purchased'),
-    ('TKT-00616', 5290, 1099, 455, 54.08, 'Purchased'),
-    ('TKT-00617', 5290, 1099, 455, 54.08, 'Reserved'),
-    ('TKT-00618', 5290, 1099, 455, 54.08, 'Reserved'),
-    ('TKT-00619', 5291, 1136, 29, 104.78, 'Reserved'),
-    ('TKT-00620', 5291, 1136, 29, 104.78, 'Purchased'),
-    ('TKT-00621', 5291, 1136, 29, 104.78, 'Reserved'),
-    ('TKT-00622', 5291, 1136, 29, 104.78, 'Refunded'),
-    ('TKT-00623', 5292, 1039, 196, 114.35, 'Refunded'),
-    ('TKT-00624', 5292, 1039, 196, 114.35, 'Reserved'),
-    ('TKT-00625', 5292, 1039, 196, 114.35, 'Reserved'),
-    ('TKT-00626', 5293, 1189, 100, 76.5, 'Purchased'),
-    ('TKT-00627', 5293, 1189, 100, 76.5, 'Refunded'),
-    ('TKT-00628', 5293, 1189, 100, 76.5, 'Purchased'),
-    ('TKT-00629', 5293, 1189, 100, 76.5, 'Reserved'),
-    ('TKT-00630', 5294, 1153, 252, 49.04, 'Reserved'),
-    ('TKT-00631', 5294, 1153, 252, 49.04, 'Refunded'),
-    ('TKT-00632', 5295, 1188, 355, 496.35, 'Reserved'),
-    ('TKT-00633', 5297, 1079, 196, 38.74, 'Reserved'),
-    ('TKT-00634', 5297, 1079, 196, 38.74, 'Refunded'),
-    ('TKT-00635', 5297, 1079, 196, 38.74, 'Reserved'),
-    ('TKT-00636', 5298, 1125, 205, 88.79, 'Purchased'),
-    ('TKT-00637', 5298, 1125, 205, 88.79, 'Refunded'),
-    ('TKT-00638', 5298, 1125, 205, 88.79, 'Purchased'),
-    ('TKT-00639', 5298, 1125, 205, 88.79, 'Refunded'),
-    ('TKT-00640', 5300, 1187, 313, 40.77, 'Reserved'),
-    ('TKT-00641', 5300, 1187, 313, 40.77, 'Reserved'),
-    ('TKT-00642', 5300, 1187, 313, 40.77, 'Reserved'),
-    ('TKT-00643', 5303, 1144, 92, 62.83, 'Refunded'),
-    ('TKT-00644', 5303, 1144, 92, 62.83, 'Refunded'),
-    ('TKT-00645', 5303, 1144, 92, 62.83, 'Refunded'),
-    ('TKT-00646', 5303, 1144, 92, 62.83, 'Purchased'),
-    ('TKT-00647', 5303, 1144, 92, 62.83, 'Refunded'),
-    ('TKT-00648', 5304, 1187, 35, 120.95, 'Reserved'),
-    ('TKT-00649', 5304, 1187, 35, 120.95, 'Purchased'),
-    ('TKT-00650', 5304, 1187, 35, 120.95, 'Purchased'),
-    ('TKT-00651', 5304, 1187, 35, 120.95, 'Reserved'),
-    ('TKT-00652', 5305, 1190, 76, 19.19, 'Reserved'),
-    ('TKT-00653', 5305, 1190, 76, 19.19, 'Reserved'),
-    ('TKT-00654', 5306, 1153, 448, 127.13, 'Refunded'),
-    ('TKT-00655', 5307, 1140, 372, 103.11, 'Refunded'),
-    ('TKT-00656', 5307, 1140, 372, 103.11, 'Refunded'),
-    ('TKT-00657', 5308, 1067, 116, 58.58, 'Reserved'),
-    ('TKT-00658', 5311, 1107, 343, 52.58, 'Reserved'),
-    ('TKT-00659', 5311, 1107, 343, 52.58, 'Purchased'),
-    ('TKT-00660', 5311, 1107, 343, 52.58, 'Purchased'),
-    ('TKT-00661', 5311, 1107, 343, 52.58, 'Purchased'),
-    ('TKT-00662', 5311, 1107, 343, 52.58, 'Purchased'),
-    ('TKT-00663', 5314, 1154, 19, 81.14, 'Reserved'),
-    ('TKT-00664', 5314, 1154, 19, 81.14, 'Purchased'),
-    ('TKT-00665', 5314, 1154, 19, 81.14, 'Refunded'),
-    ('TKT-00666', 5314, 1154, 19, 81.14, 'Purchased'),
-    ('TKT-00667', 5314, 1154, 19, 81.14, 'Reserved'),
-    ('TKT-00668', 5315, 1153, 276, 30.08, 'Refunded'),
-    ('TKT-00669', 5315, 1153, 276, 30.08, 'Purchased'),
-    ('TKT-00670', 5317, 1090, 42, 386.22, 'Refunded'),
-    ('TKT-00671', 5318, 1012, 213, 163.47, 'Purchased'),
-    ('TKT-00672', 5318, 1012, 213, 163.47, 'Reserved'),
-    ('TKT-00673', 5318, 1012, 213, 163.47, 'Refunded'),
-    ('TKT-00674', 5321, 1013, 489, 70.41, 'Refunded'),
-    ('TKT-00675', 5321, 1013, 489, 70.41, 'Refunded'),
-    ('TKT-00676', 5322, 1087, 149, 422.58, 'Reserved'),
-    ('TKT-00677', 5324, 1076, 394, 139.64, 'Refunded'),
-    ('TKT-00678', 5324, 1076, 394, 139.64, 'Refunded'),
-    ('TKT-00679', 5324, 1076, 394, 139.64, 'Purchased'),
-    ('TKT-00680', 5326, 1035, 440, 118.83, 'Refunded'),
-    ('TKT-00681', 5326, 1035, 440, 118.83, 'Reserved'),
-    ('TKT-00682', 5327, 1124, 198, 54.33, 'Reserved'),
-    ('TKT-00683', 5327, 1124, 198, 54.33, 'Refunded'),
-    ('TKT-00684', 5327, 1124, 198, 54.33, 'Purchased'),
-    ('TKT-00685', 5327, 1124, 198, 54.33, 'Reserved'),
-    ('TKT-00686', 5327, 1124, 198, 54.33, 'Reserved'),
-    ('TKT-00687', 5328, 1086, 210, 347.79, 'Refunded'),
-    ('TKT-00688', 5330, 1136, 213, 134.27, 'Purchased'),
-    ('TKT-00689', 5330, 1136, 213, 134.27, 'Refunded'),
-    ('TKT-00690', 5330, 1136, 213, 134.27, 'Reserved'),
-    ('TKT-00691', 5331, 1043, 401, 195.52, 'Refunded'),
-    ('TKT-00692', 5331, 1043, 401, 195.52, 'Refunded'),
-    ('TKT-00693', 5332, 1139, 77, 197.54, 'Purchased'),
-    ('TKT-00694', 5332, 1139, 77, 197.54, 'Purchased'),
-    ('TKT-00695', 5335, 1168, 314, 47.54, 'Purchased'),
-    ('TKT-00696', 5335, 1168, 314, 47.54, 'Reserved'),
-    ('TKT-00697', 5335, 1168, 314, 47.54, 'Reserved'),
-    ('TKT-00698', 5335, 1168, 314, 47.54, 'Purchased'),
-    ('TKT-00699', 5336, 1054, 122, 118.55, 'Refunded'),
-    ('TKT-00700', 5336, 1054, 122, 118.55, 'Refunded'),
-    ('TKT-00701', 5336, 1054, 122, 118.55, 'Purchased'),
-    ('TKT-00702', 5337, 1198, 413, 372.93, 'Reserved'),
-    ('TKT-00703', 5338, 1140, 397, 55.98, 'Reserved'),
-    ('TKT-00704', 5338, 1140, 397, 55.98, 'Reserved'),
-    ('TKT-00705', 5338, 1140, 397, 55.98, 'Refunded'),
-    ('TKT-00706', 5338, 1140, 397, 55.98, 'Reserved'),
-    ('TKT-00707', 5338, 1140, 397, 55.98, 'Purchased'),
-    ('TKT-00708', 5339, 1121, 485, 15.77, 'Purchased'),
-    ('TKT-00709', 5339, 1121, 485, 15.77, 'Reserved'),
-    ('TKT-00710', 5339, 1121, 485, 15.77, 'Refunded'),
-    ('TKT-00711', 5339, 1121, 485, 15.77, 'Reserved'),
-    ('TKT-00712', 5340, 1077, 80, 72.58, 'Refunded'),
-    ('TKT-00713', 5340, 1077, 80, 72.58, 'Refunded'),
-    ('TKT-00714', 5340, 1077, 80, 72.58, 'Reserved'),
-    ('TKT-00715', 5340, 1077, 80, 72.58, 'Refunded'),
-    ('TKT-00716', 5341, 1153, 355, 52.49, 'Purchased'),
-    ('TKT-00717', 5341, 1153, 355, 52.49, 'Reserved'),
-    ('TKT-00718', 5341, 1153, 355, 52.49, 'Reserved'),
-    ('TKT-00719', 5343, 1134, 386, 99.34, 'Reserved'),
-    ('TKT-00720', 5343, 1134, 386, 99.34, 'Refunded'),
-    ('TKT-00721', 5343, 1134, 386, 99.34, 'Refunded'),
-    ('TKT-00722', 5344, 1153, 468, 51.21, 'Refunded'),
-    ('TKT-00723', 5344, 1153, 468, 51.21, 'Refunded'),
-    ('TKT-00724', 5344, 1153, 468, 51.21, 'Refunded'),
-    ('TKT-00725', 5344, 1153, 468, 51.21, 'Refunded'),
-    ('TKT-00726', 5344, 1153, 468, 51.21, 'Purchased'),
-    ('TKT-00727', 5347, 1170, 493, 36.12, 'Reserved'),
-    ('TKT-00728', 5348, 1111, 37, 446.5, 'Purchased'),
-    ('TKT-00729', 5349, 1138, 230, 147.44, 'Reserved'),
-    ('TKT-00730', 5349, 1138, 230, 147.44, 'Purchased'),
-    ('TKT-00731', 5349, 1138, 230, 147.44, 'Purchased'),
-    ('TKT-00732', 5351, 1019, 240, 96.0, 'Purchased'),
-    ('TKT-00733', 5351, 1019, 240, 96.0, 'Purchased'),
-    ('TKT-00734', 5351, 1019, 240, 96.0, 'Refunded'),
-    ('TKT-00735', 5351, 1019, 240, 96.0, 'Purchased'),
-    ('TKT-00736', 5351, 1019, 240, 96.0, 'Reserved'),
-    ('TKT-00737', 5352, 1056, 410, 97.2, 'Reserved'),
-    ('TKT-00738', 5352, 1056, 410, 97.2, 'Purchased'),
-    ('TKT-00739', 5352, 1056, 410, 97.2, 'Reserved'),
-    ('TKT-00740', 5353, 1177, 140, 61.68, 'Reserved'),
-    ('TKT-00741', 5353, 1177, 140, 61.68, 'Reserved'),
-    ('TKT-00742', 5354, 1141, 252, 73.58, 'Refunded'),
-    ('TKT-00743', 5354, 1141, 252, 73.58, 'Refunded'),
-    ('TKT-00744', 5354, 1141, 252, 73.58, 'Refunded'),
-    ('TKT-00745', 5356, 1079, 140, 81.56, 'Reserved'),
-    ('TKT-00746', 5356, 1079, 140, 81.56, 'Refunded'),
-    ('TKT-00747', 5363, 1167, 85, 390.71, 'Reserved'),
-    ('TKT-00748', 5364, 1106, 360, 53.13, 'Reserved'),
-    ('TKT-00749', 5364, 1106, 360, 53.13, 'Purchased'),
-    ('TKT-00750', 5364, 1106, 360, 53.13, 'Purchased'),
-    ('TKT-00751', 5366, 1079, 158, 72.05, 'Purchased'),
-    ('TKT-00752', 5367, 1012, 143, 78.87, 'Purchased'),
-    ('TKT-00753', 5367, 1012, 143, 78.87, 'Purchased'),
-    ('TKT-00754', 5367, 1012, 143, 78.87, 'Reserved'),
-    ('TKT-00755', 5368, 1085, 499, 477.97, 'Reserved'),
-    ('TKT-00756', 5369, 1042, 188, 87.09, 'Refunded'),
-    ('TKT-00757', 5370, 1063, 314, 152.66, 'Reserved'),
-    ('TKT-00758', 5370, 1063, 314, 152.66, 'Reserved'),
-    ('TKT-00759', 5372, 1022, 42, 129.04, 'Reserved'),
-    ('TKT-00760', 5372, 1022, 42, 129.04, 'Refunded'),
-    ('TKT-00761', 5372, 1022, 42, 129.04, 'Purchased'),
-    ('TKT-00762', 5373, 1074, 35, 163.47, 'Purchased'),
-    ('TKT-00763', 5373, 1074, 35, 163.47, 'Refunded'),
-    ('TKT-00764', 5374, 1002, 387, 476.01, 'Refunded'),
-    ('TKT-00765', 5375, 1041, 233, 29.15, 'Purchased'),
-    ('TKT-00766', 5375, 1041, 233, 29.15, 'Refunded'),
-    ('TKT-00767', 5375, 1041, 233, 29.15, 'Purchased'),
-    ('TKT-00768', 5376, 1094, 440, 57.76, 'Purchased'),
-    ('TKT-00769', 5376, 1094, 440, 57.76, 'Reserved'),
-    ('TKT-00770', 5376, 1094, 440, 57.76, 'Refunded'),
-    ('TKT-00771', 5376, 1094, 440, 57.76, 'Reserved'),
-    ('TKT-00772', 5376, 1094, 440, 57.76, 'Reserved'),
-    ('TKT-00773', 5378, 1096, 204, 31.58, 'Purchased'),
-    ('TKT-00774', 5378, 1096, 204, 31.58, 'Refunded'),
-    ('TKT-00775', 5378, 1096, 204, 31.58, 'Refunded'),
-    ('TKT-00776', 5378, 1096, 204, 31.58, 'Purchased'),
-    ('TKT-00777', 5378, 1096, 204, 31.58, 'Reserved'),
-    ('TKT-00778', 5379, 1073, 471, 257.59, 'Refunded'),
-    ('TKT-00779', 5381, 1111, 372, 239.45, 'Purchased'),
-    ('TKT-00780', 5382, 1136, 76, 450.81, 'Reserved'),
-    ('TKT-00781', 5383, 1142, 170, 146.13, 'Reserved'),
-    ('TKT-00782', 5383, 1142, 170, 146.13, 'Purchased'),
-    ('TKT-00783', 5383, 1142, 170, 146.13, 'Reserved'),
-    ('TKT-00784', 5385, 1167, 35, 88.08, 'Reserved'),
-    ('TKT-00785', 5385, 1167, 35, 88.08, 'Purchased'),
-    ('TKT-00786', 5385, 1167, 35, 88.08, 'Purchased'),
-    ('TKT-00787', 5385, 1167, 35, 88.08, 'Purchased'),
-    ('TKT-00788', 5385, 1167, 35, 88.08, 'Refunded'),
-    ('TKT-00789', 5386, 1136, 212, 361.45, 'Purchased'),
-    ('TKT-00790', 5387, 1164, 276, 87.46, 'Reserved'),
-    ('TKT-00791', 5387, 1164, 276, 87.46, 'Refunded'),
-    ('TKT-00792', 5387, 1164, 276, 87.46, 'Reserved'),
-    ('TKT-00793', 5387, 1164, 276, 87.46, 'Reserved'),
-    ('TKT-00794', 5387, 1164, 276, 87.46, 'Purchased'),
-    ('TKT-00795', 5388, 1096, 189, 56.32, 'Refunded'),
-    ('TKT-00796', 5388, 1096, 189, 56.32, 'Refunded'),
-    ('TKT-00797', 5388, 1096, 189, 56.32, 'Reserved'),
-    ('TKT-00798', 5388, 1096, 189, 56.32, 'Reserved'),
-    ('TKT-00799', 5390, 1074, 355, 150.48, 'Reserved'),
-    ('TKT-00800', 5390, 1074, 355, 150.48, 'Refunded'),
-    ('TKT-00801', 5390, 1074, 355, 150.48, 'Refunded'),
-    ('TKT-00802', 5392, 1124, 372, 19.83, 'Refunded'),
-    ('TKT-00803', 5392, 1124, 372, 19.83, 'Refunded'),
-    ('TKT-00804', 5392, 1124, 372, 19.83, 'Purchased'),
-    ('TKT-00805', 5392, 1124, 372, 19.83, 'Purchased'),
-    ('TKT-00806', 5392, 1124, 372, 19.83, 'Purchased'),
-    ('TKT-00807', 5393, 1088, 42, 88.8, 'Reserved'),
-    ('TKT-00808', 5394, 1041, 27, 23.68, 'Reserved'),
-    ('TKT-00809', 5394, 1041, 27, 23.68, 'Reserved'),
-    ('TKT-00810', 5394, 1041, 27, 23.68, 'Reserved'),
-    ('TKT-00811', 5395, 1124, 252, 330.2, 'Refunded'),
-    ('TKT-00812', 5397, 1007, 189, 103.09, 'Refunded'),
-    ('TKT-00813', 5397, 1007, 189, 103.09, 'Refunded'),
-    ('TKT-00814', 5397, 1007, 189, 103.09, 'Reserved'),
-    ('TKT-00815', 5397, 1007, 189, 103.09, 'Purchased'),
-    ('TKT-00816', 5399, 1075, 372, 24.46, 'Purchased'),
-    ('TKT-00817', 5400, 1058, 210, 33.95, 'Purchased'),
-    ('TKT-00818', 5400, 1058, 210, 33.95, 'Reserved'),
-    ('TKT-00819', 5400, 1058, 210, 33.95, 'Purchased'),
-    ('TKT-00820', 5400, 1058, 210, 33.95, 'Reserved'),
-    ('TKT-00821', 5400, 1058, 210, 33.95, 'Purchased'),
-    ('TKT-00822', 5402, 1097, 122, 133.31, 'Purchased'),
-    ('TKT-00823', 5404, 1138, 31, 211.35, 'Refunded'),
-    ('TKT-00824', 5404, 1138, 31, 211.35, 'Refunded'),
-    ('TKT-00825', 5405, 1125, 272, 187.78, 'Purchased'),
-    ('TKT-00826', 5405, 1125, 272, 187.78, 'Refunded'),
-    ('TKT-00827', 5406, 1008, 31, 118.75, 'Reserved'),
-    ('TKT-00828', 5406, 1008, 31, 118.75, 'Reserved'),
-    ('TKT-00829', 5407, 1174, 67, 164.85, 'Reserved'),
-    ('TKT-00830', 5407, 1174, 67, 164.85, 'Refunded'),
-    ('TKT-00831', 5407, 1174, 67, 164.85, 'Purchased'),
-    ('TKT-00832', 5408, 1084, 241, 469.85, 'Refunded'),
-    ('TKT-00833', 5412, 1014, 5, 111.97, 'Reserved'),
-    ('TKT-00834', 5412, 1014, 5, 111.97, 'Reserved'),
-    ('TKT-00835', 5412, 1014, 5, 111.97, 'Refunded'),
-    ('TKT-00836', 5412, 1014, 5, 111.97, 'Refunded'),
-    ('TKT-00837', 5413, 1057, 80, 41.34, 'Reserved'),
-    ('TKT-00838', 5413, 1057, 80, 41.34, 'Reserved'),
-    ('TKT-00839', 5413, 1057, 80, 41.34, 'Purchased'),
-    ('TKT-00840', 5413, 1057, 80, 41.34, 'Purchased'),
-    ('TKT-00841', 5414, 1110, 166, 150.75, 'Purchased'),
-    ('TKT-00842', 5414, 1110, 166, 150.75, 'Purchased'),
-    ('TKT-00843', 5414, 1110, 166, 150.75, 'Purchased'),
-    ('TKT-00844', 5415, 1126, 392, 40.75, 'Reserved'),
-    ('TKT-00845', 5415, 1126, 392, 40.75, 'Purchased'),
-    ('TKT-00846', 5415, 1126, 392, 40.75, 'Refunded'),
-    ('TKT-00847', 5415, 1126, 392, 40.75, 'Reserved'),
-    ('TKT-00848', 5417, 1188, 52, 98.58, 'Reserved'),
-    ('TKT-00849', 5417, 1188, 52, 98.58, 'Refunded'),
-    ('TKT-00850', 5417, 1188, 52, 98.58, 'Refunded'),
-    ('TKT-00851', 5417, 1188, 52, 98.58, 'Purchased'),
-    ('TKT-00852', 5420, 1115, 210, 141.62, 'Refunded'),
-    ('TKT-00853', 5420, 1115, 210, 141.62, 'Reserved'),
-    ('TKT-00854', 5422, 1196, 152, 70.26, 'Reserved'),
-    ('TKT-00855', 5422, 1196, 152, 70.26, 'Reserved'),
-    ('TKT-00856', 5422, 1196, 152, 70.26, 'Refunded'),
-    ('TKT-00857', 5422, 1196, 152, 70.26, 'Purchased'),
-    ('TKT-00858', 5424, 1188, 360, 66.11, 'Refunded'),
-    ('TKT-00859', 5424, 1188, 360, 66.11, 'Reserved'),
-    ('TKT-00860', 5424, 1188, 360, 66.11, 'Purchased'),
-    ('TKT-00861', 5424, 1188, 360, 66.11, 'Reserved'),
-    ('TKT-00862', 5424, 1188, 360, 66.11, 'Reserved'),
-    ('TKT-00863', 5425, 1161, 118, 225.73, 'Refunded'),
-    ('TKT-00864', 5426, 1134, 405, 51.97, 'Reserved'),
-    ('TKT-00865', 5426, 1134, 405, 51.97, 'Purchased'),
-    ('TKT-00866', 5427, 1137, 337, 144.53, 'Refunded'),
-    ('TKT-00867', 5427, 1137, 337, 144.53, 'Purchased'),
-    ('TKT-00868', 5428, 1059, 431, 126.87, 'Reserved'),
-    ('TKT-00869', 5428, 1059, 431, 126.87, 'Purchased'),
-    ('TKT-00870', 5429, 1067, 82, 96.24, 'Purchased'),
-    ('TKT-00871', 5429, 1067, 82, 96.24, 'Reserved'),
-    ('TKT-00872', 5429, 1067, 82, 96.24, 'Refunded'),
-    ('TKT-00873', 5430, 1139, 467, 211.47, 'Refunded'),
-    ('TKT-00874', 5431, 1072, 489, 58.57, 'Purchased'),
-    ('TKT-00875', 5432, 1054, 196, 56.11, 'Purchased'),
-    ('TKT-00876', 5432, 1054, 196, 56.11, 'Refunded'),
-    ('TKT-00877', 5432, 1054, 196, 56.11, 'Refunded'),
-    ('TKT-00878', 5432, 1054, 196, 56.11, 'Purchased'),
-    ('TKT-00879', 5432, 1054, 196, 56.11, 'Purchased'),
-    ('TKT-00880', 5433, 1189, 28, 161.03, 'Purchased'),
-    ('TKT-00881', 5433, 1189, 28, 161.03, 'Purchased'),
-    ('TKT-00882', 5433, 1189, 28, 161.03, 'Refunded'),
-    ('TKT-00883', 5434, 1124, 401, 99.2, 'Purchased'),
-    ('TKT-00884', 5434, 1124, 401, 99.2, 'Refunded'),
-    ('TKT-00885', 5435, 1158, 106, 35.23, 'Purchased'),
-    ('TKT-00886', 5435, 1158, 106, 35.23, 'Reserved'),
-    ('TKT-00887', 5435, 1158, 106, 35.23, 'Reserved'),
-    ('TKT-00888', 5436, 1181, 273, 87.44, 'Refunded'),
-    ('TKT-00889', 5436, 1181, 273, 87.44, 'Purchased'),
-    ('TKT-00890', 5436, 1181, 273, 87.44, 'Reserved'),
-    ('TKT-00891', 5436, 1181, 273, 87.44, 'Refunded'),
-    ('TKT-00892', 5436, 1181, 273, 87.44, 'Reserved'),
-    ('TKT-00893', 5437, 1136, 343, 119.56, 'Reserved'),
-    ('TKT-00894', 5437, 1136, 343, 119.56, 'Refunded'),
-    ('TKT-00895', 5437, 1136, 343, 119.56, 'Reserved'),
-    ('TKT-00896', 5437, 1136, 343, 119.56, 'Reserved'),
-    ('TKT-00897', 5438, 1138, 82, 36.81, 'Reserved'),
-    ('TKT-00898', 5438, 1138, 82, 36.81, 'Refunded'),
-    ('TKT-00899', 5438, 1138, 82, 36.81, 'Reserved'),
-    ('TKT-00900', 5439, 1042, 405, 19.96, 'Purchased'),
-    ('TKT-00901', 5439, 1042, 405, 19.96, 'Refunded'),
-    ('TKT-00902', 5439, 1042, 405, 19.96, 'Refunded'),
-    ('TKT-00903', 5442, 1028, 278, 46.85, 'Refunded'),
-    ('TKT-00904', 5442, 1028, 278, 46.85, 'Reserved'),
-    ('TKT-00905', 5442, 1028, 278, 46.85, 'Reserved'),
-    ('TKT-00906', 5442, 1028, 278, 46.85, 'Purchased'),
-    ('TKT-00907', 5442, 1028, 278, 46.85, 'Reserved'),
-    ('TKT-00908', 5444, 1077, 155, 135.42, 'Purchased'),
-    ('TKT-00909', 5445, 1136, 380, 66.54, 'Purchased'),
-    ('TKT-00910', 5445, 1136, 380, 66.54, 'Purchased'),
-    ('TKT-00911', 5445, 1136, 380, 66.54, 'Purchased'),
-    ('TKT-00912', 5445, 1136, 380, 66.54, 'Purchased'),
-    ('TKT-00913', 5445, 1136, 380, 66.54, 'Purchased'),
-    ('TKT-00914', 5446, 1105, 248, 124.38, 'Refunded'),
-    ('TKT-00915', 5446, 1105, 248, 124.38, 'Reserved'),
-    ('TKT-00916', 5447, 1150, 352, 477.79, 'Refunded'),
-    ('TKT-00917', 5448, 1149, 242, 58.36, 'Refunded'),
-    ('TKT-00918', 5448, 1149, 242, 58.36, 'Reserved'),
-    ('TKT-00919', 5449, 1111, 242, 56.95, 'Purchased'),
-    ('TKT-00920', 5449, 1111, 242, 56.95, 'Refunded'),
-    ('TKT-00921', 5449, 1111, 242, 56.95, 'Reserved'),
-    ('TKT-00922', 5450, 1196, 485, 139.69, 'Refunded'),
-    ('TKT-00923', 5451, 1182, 118, 16.96, 'Purchased'),
-    ('TKT-00924', 5451, 1182, 118, 16.96, 'Refunded'),
-    ('TKT-00925', 5452, 1111, 418, 23.84, 'Refunded'),
-    ('TKT-00926', 5452, 1111, 418, 23.84, 'Purchased'),
-    ('TKT-00927', 5454, 1023, 499, 112.27, 'Refunded'),
-    ('TKT-00928', 5454, 1023, 499, 112.27, 'Purchased'),
-    ('TKT-00929', 5457, 1014, 183, 27.13, 'Reserved'),
-    ('TKT-00930', 5457, 1014, 183, 27.13, 'Refunded'),
-    ('TKT-00931', 5457, 1014, 183, 27.13, 'Reserved'),
-    ('TKT-00932', 5458, 1120, 28, 188.93, 'Purchased'),
-    ('TKT-00933', 5458, 1120, 28, 188.93, 'Purchased'),
-    ('TKT-00934', 5459, 1014, 465, 98.44, 'Purchased'),
-    ('TKT-00935', 5459, 1014, 465, 98.44, 'Reserved'),
-    ('TKT-00936', 5460, 1086, 423, 102.82, 'Refunded'),
-    ('TKT-00937', 5460, 1086, 423, 102.82, 'Refunded'),
-    ('TKT-00938', 5460, 1086, 423, 102.82, 'Purchased'),
-    ('TKT-00939', 5460, 1086, 423, 102.82, 'Refunded'),
-    ('TKT-00940', 5461, 1181, 277, 55.38, 'Purchased'),
-    ('TKT-00941', 5461, 1181, 277, 55.38, 'Purchased'),
-    ('TKT-00942', 5461, 1181, 277, 55.38, 'Purchased'),
-    ('TKT-00943', 5461, 1181, 277, 55.38, 'Refunded'),
-    ('TKT-00944', 5461, 1181, 277, 55.38, 'Refunded'),
-    ('TKT-00945', 5462, 1122, 372, 131.7, 'Reserved'),
-    ('TKT-00946', 5462, 1122, 372, 131.7, 'Reserved'),
-    ('TKT-00947', 5462, 1122, 372, 131.7, 'Reserved'),
-    ('TKT-00948', 5463, 1020, 496, 220.88, 'Reserved'),
-    ('TKT-00949', 5463, 1020, 496, 220.88, 'Purchased'),
-    ('TKT-00950', 5465, 1019, 471, 218.31, 'Reserved'),
-    ('TKT-00951', 5465, 1019, 471, 218.31, 'Refunded'),
-    ('TKT-00952', 5466, 1170, 189, 173.41, 'Purchased'),
-    ('TKT-00953', 5468, 1009, 465, 124.64, 'Purchased'),
-    ('TKT-00954', 5468, 1009, 465, 124.64, 'Purchased'),
-    ('TKT-00955', 5469, 1117, 190, 118.72, 'Reserved'),
-    ('TKT-00956', 5469, 1117, 190, 118.72, 'Refunded'),
-    ('TKT-00957', 5469, 1117, 190, 118.72, 'Reserved'),
-    ('TKT-00958', 5469, 1117, 190, 118.72, 'Refunded'),
-    ('TKT-00959', 5470, 1163, 347, 43.09, 'Reserved'),
-    ('TKT-00960', 5470, 1163, 347, 43.09, 'Refunded'),
-    ('TKT-00961', 5470, 1163, 347, 43.09, 'Refunded'),
-    ('TKT-00962', 5471, 1019, 196, 76.26, 'Reserved'),
-    ('TKT-00963', 5471, 1019, 196, 76.26, 'Reserved'),
-    ('TKT-00964', 5471, 1019, 196, 76.26, 'Reserved'),
-    ('TKT-00965', 5471, 1019, 196, 76.26, 'Refunded'),
-    ('TKT-00966', 5475, 1188, 185, 47.83, 'Refunded'),
-    ('TKT-00967', 5475, 1188, 185, 47.83, 'Refunded'),
-    ('TKT-00968', 5475, 1188, 185, 47.83, 'Refunded'),
-    ('TKT-00969', 5476, 1032, 185, 80.79, 'Reserved'),
-    ('TKT-00970', 5476, 1032, 185, 80.79, 'Purchased'),
-    ('TKT-00971', 5476, 1032, 185, 80.79, 'Reserved'),
-    ('TKT-00972', 5476, 1032, 185, 80.79, 'Purchased'),
-    ('TKT-00973', 5476, 1032, 185, 80.79, 'Refunded'),
-    ('TKT-00974', 5480, 1080, 233, 91.65, 'Reserved'),
-    ('TKT-00975', 5480, 1080, 233, 91.65, 'Refunded'),
-    ('TKT-00976', 5480, 1080, 233, 91.65, 'Reserved'),
-    ('TKT-00977', 5480, 1080, 233, 91.65, 'Reserved'),
-    ('TKT-00978', 5480, 1080, 233, 91.65, 'Reserved'),
-    ('TKT-00979', 5481, 1136, 89, 64.55, 'Refunded'),
-    ('TKT-00980', 5481, 1136, 89, 64.55, 'Refunded'),
-    ('TKT-00981', 5481, 1136, 89, 64.55, 'Purchased'),
-    ('TKT-00982', 5481, 1136, 89, 64.55, 'Refunded'),
-    ('TKT-00983', 5484, 1128, 273, 42.3, 'Purchased'),
-    ('TKT-00984', 5484, 1128, 273, 42.3, 'Purchased'),
-    ('TKT-00985', 5485, 1066, 262, 116.5, 'Refunded'),
-    ('TKT-00986', 5485, 1066, 262, 116.5, 'Purchased'),
-    ('TKT-00987', 5485, 1066, 262, 116.5, 'Reserved'),
-    ('TKT-00988', 5485, 1066, 262, 116.5, 'Purchased'),
-    ('TKT-00989', 5486, 1066, 197, 22.3, 'Refunded'),
-    ('TKT-00990', 5486, 1066, 197, 22.3, 'Purchased'),
-    ('TKT-00991', 5487, 1096, 407, 113.44, 'Refunded'),
-    ('TKT-00992', 5487, 1096, 407, 113.44, 'Refunded'),
-    ('TKT-00993', 5487, 1096, 407, 113.44, 'Refunded'),
-    ('TKT-00994', 5487, 1096, 407, 113.44, 'Reserved'),
-    ('TKT-00995', 5488, 1113, 199, 190.56, 'Refunded'),
-    ('TKT-00996', 5489, 1135, 457, 78.88, 'Purchased'),
-    ('TKT-00997', 5489, 1135, 457, 78.88, 'Purchased'),
-    ('TKT-00998', 5490, 1094, 19, 45.5, 'Purchased'),
-    ('TKT-00999', 5490, 1094, 19, 45.5, 'Refunded'),
-    ('TKT-01000', 5490, 1094, 19, 45.5, 'Purchased'),
-    ('TKT-01001', 5492, 1148, 168, 88.88, 'Purchased'),
-    ('TKT-01002', 5492, 1148, 168, 88.88, 'Purchased'),
-    ('TKT-01003', 5492, 1148, 168, 88.88, 'Purchased'),
-    ('TKT-01004', 5492, 1148, 168, 88.88, 'Refunded'),
-    ('TKT-01005', 5492, 1148, 168, 88.88, 'Reserved'),
-    ('TKT-01006', 5493, 1153, 141, 28.48, 'Refunded'),
-    ('TKT-01007', 5493, 1153, 141, 28.48, 'Purchased'),
-    ('TKT-01008', 5493, 1153, 141, 28.48, 'Purchased'),
-    ('TKT-01009', 5493, 1153, 141, 28.48, 'Purchased'),
-    ('TKT-01010', 5494, 1153, 233, 7.71, 'Refunded'),
-    ('TKT-01011', 5494, 1153, 233, 7.71, 'Reserved'),
-    ('TKT-01012', 5494, 1153, 233, 7.71, 'Purchased'),
-    ('TKT-01013', 5495, 1136, 106, 45.6, 'Reserved'),
-    ('TKT-01014', 5495, 1136, 106, 45.6, 'Purchased'),
-    ('TKT-01015', 5495, 1136, 106, 45.6, 'Purchased'),
-    ('TKT-01016', 5495, 1136, 106, 45.6, 'Purchased'),
-    ('TKT-01017', 5495, 1136, 106, 45.6, 'Purchased'),
-    ('TKT-01018', 5496, 1038, 37, 69.79, 'Refunded'),
-    ('TKT-01019', 5496, 1038, 37, 69.79, 'Reserved'),
-    ('TKT-01020', 5496, 1038, 37, 69.79, 'Purchased'),
-    ('TKT-01021', 5496, 1038, 37, 69.79, 'Refunded'),
-    ('TKT-01022', 5496, 1038, 37, 69.79, 'Purchased'),
-    ('TKT-01023', 5497, 1140, 205, 148.81, 'Reserved'),
-    ('TKT-01024', 5497, 1140, 205, 148.81, 'Purchased'),
-    ('TKT-01025', 5497, 1140, 205, 148.81, 'Purchased'),
-    ('TKT-01026', 5498, 1147, 291, 109.32, 'Reserved'),
-    ('TKT-01027', 5498, 1147, 291, 109.32, 'Purchased'),
-    ('TKT-01028', 5499, 1076, 205, 11.62, 'Reserved'),
-    ('TKT-01029', 5499, 1076, 205, 11.62, 'Reserved'),
-    ('TKT-01030', 5499, 1076, 205, 11.62, 'Refunded'),
-    ('TKT-01031', 5499, 1076, 205, 11.62, 'Purchased'),
-    ('TKT-01032', 5499, 1076, 205, 11.62, 'Reserved'),
-    ('TKT-01033', 5500, 1163, 479, 118.49, 'Purchased'),
-    ('TKT-01034', 5500, 1163, 479, 118.49, 'Reserved'),
-    ('TKT-01035', 5501, 1173, 168, 422.56, 'Refunded'),
-    ('TKT-01036', 5502, 1092, 448, 111.53, 'Purchased'),
-    ('TKT-01037', 5502, 1092, 448, 111.53, 'Purchased'),
-    ('TKT-01038', 5502, 1092, 448, 111.53, 'Refunded'),
-    ('TKT-01039', 5502, 1092, 448, 111.53, 'Refunded'),
-    ('TKT-01040', 5506, 1129, 76, 67.01, 'Purchased'),
-    ('TKT-01041', 5507, 1092, 496, 47.83, 'Purchased'),
-    ('TKT-01042', 5508, 1064, 248, 82.8, 'Refunded'),
-    ('TKT-01043', 5508, 1064, 248, 82.8, 'Purchased'),
-    ('TKT-01044', 5508, 1064, 248, 82.8, 'Purchased'),
-    ('TKT-01045', 5508, 1064, 248, 82.8, 'Purchased'),
-    ('TKT-01046', 5508, 1064, 248, 82.8, 'Purchased'),
-    ('TKT-01047', 5510, 1159, 474, 388.54, 'Reserved'),
-    ('TKT-01048', 5511, 1194, 421, 53.51, 'Reserved'),
-    ('TKT-01049', 5511, 1194, 421, 53.51, 'Reserved'),
-    ('TKT-01050', 5512, 1084, 378, 79.03, 'Reserved'),
-    ('TKT-01051', 5512, 1084, 378, 79.03, 'Refunded'),
-    ('TKT-01052', 5512, 1084, 378, 79.03, 'Reserved'),
-    ('TKT-01053', 5515, 1171, 12, 50.31, 'Refunded'),
-    ('TKT-01054', 5518, 1090, 52, 87.63, 'Reserved'),
-    ('TKT-01055', 5518, 1090, 52, 87.63, 'Refunded'),
-    ('TKT-01056', 5518, 1090, 52, 87.63, 'Refunded'),
-    ('TKT-01057', 5519, 1113, 185, 223.76, 'Reserved'),
-    ('TKT-01058', 5522, 1105, 445, 76.39, 'Refunded'),
-    ('TKT-01059', 5522, 1105, 445, 76.39, 'Purchased'),
-    ('TKT-01060', 5523, 1014, 242, 162.71, 'Refunded'),
-    ('TKT-01061', 5523, 1014, 242, 162.71, 'Reserved'),
-    ('TKT-01062', 5523, 1014, 242, 162.71, 'Refunded'),
-    ('TKT-01063', 5524, 1125, 215, 330.57, 'Refunded'),
-    ('TKT-01064', 5526, 1136, 198, 12.91, 'Purchased'),
-    ('TKT-01065', 5526, 1136, 198, 12.91, 'Reserved'),
-    ('TKT-01066', 5526, 1136, 198, 12.91, 'Refunded'),
-    ('TKT-01067', 5526, 1136, 198, 12.91, 'Purchased'),
-    ('TKT-01068', 5527, 1091, 113, 50.38, 'Reserved'),
-    ('TKT-01069', 5527, 1091, 113, 50.38, 'Refunded'),
-    ('TKT-01070', 5527, 1091, 113, 50.38, 'Refunded'),
-    ('TKT-01071', 5527, 1091, 113, 50.38, 'Purchased'),
-    ('TKT-01072', 5527, 1091, 113, 50.38, 'Refunded'),
-    ('TKT-01073', 5528, 1021, 288, 236.78, 'Reserved'),
-    ('TKT-01074', 5528, 1021, 288, 236.78, 'Purchased'),
-    ('TKT-01075', 5532, 1121, 386, 461.33, 'Refunded'),
-    ('TKT-01076', 5533, 1075, 242, 228.46, 'Purchased'),
-    ('TKT-01077', 5533, 1075, 242, 228.46, 'Refunded'),
-    ('TKT-01078', 5534, 1167, 242, 42.46, 'Refunded'),
-    ('TKT-01079', 5534, 1167, 242, 42.46, 'Reserved'),
-    ('TKT-01080', 5536, 1142, 493, 39.9, 'Purchased'),
-    ('TKT-01081', 5536, 1142, 493, 39.9, 'Reserved'),
-    ('TKT-01082', 5536, 1142, 493, 39.9, 'Refunded'),
-    ('TKT-01083', 5536, 1142, 493, 39.9, 'Reserved'),
-    ('TKT-01084', 5536, 1142, 493, 39.9, 'Reserved'),
-    ('TKT-01085', 5537, 1141, 110, 22.04, 'Refunded'),
-    ('TKT-01086', 5538, 1121, 203, 41.26, 'Reserved'),
-    ('TKT-01087', 5538, 1121, 203, 41.26, 'Reserved'),
-    ('TKT-01088', 5538, 1121, 203, 41.26, 'Reserved'),
-    ('TKT-01089', 5539, 1025, 313, 94.08, 'Reserved'),
-    ('TKT-01090', 5539, 1025, 313, 94.08, 'Refunded'),
-    ('TKT-01091', 5539, 1025, 313, 94.08, 'Reserved'),
-    ('TKT-01092', 5539, 1025, 313, 94.08, 'Refunded'),
-    ('TKT-01093', 5539, 1025, 313, 94.08, 'Reserved'),
-    ('TKT-01094', 5540, 1199, 183, 69.79, 'Refunded'),
-    ('TKT-01095', 5540, 1199, 183, 69.79, 'Purchased'),
-    ('TKT-01096', 5540, 1199, 183, 69.79, 'Reserved'),
-    ('TKT-01097', 5540, 1199, 183, 69.79, 'Reserved'),
-    ('TKT-01098', 5540, 1199, 183, 69.79, 'Reserved'),
-    ('TKT-01099', 5541, 1046, 179, 228.33, 'Reserved'),
-    ('TKT-01100', 5541, 1046, 179, 228.33, 'Purchased'),
-    ('TKT-01101', 5545, 1009, 302, 53.74, 'Refunded'),
-    ('TKT-01102', 5545, 1009, 302, 53.74, 'Refunded'),
-    ('TKT-01103', 5545, 1009, 302, 53.74, 'Purchased'),
-    ('TKT-01104', 5548, 1136, 196, 8.81, 'Purchased'),
-    ('TKT-01105', 5548, 1136, 196, 8.81, 'Purchased'),
-    ('TKT-01106', 5548, 1136, 196, 8.81, 'Purchased'),
-    ('TKT-01107', 5548, 1136, 196, 8.81, 'Purchased'),
-    ('TKT-01108', 5549, 1057, 149, 68.2, 'Reserved'),
-    ('TKT-01109', 5549, 1057, 149, 68.2, 'Refunded'),
-    ('TKT-01110', 5549, 1057, 149, 68.2, 'Reserved'),
-    ('TKT-01111', 5550, 1074, 499, 55.5, 'Reserved'),
-    ('TKT-01112', 5550, 1074, 499, 55.5, 'Reserved'),
-    ('TKT-01113', 5550, 1074, 499, 55.5, 'Purchased'),
-    ('TKT-01114', 5552, 1173, 46, 30.27, 'Refunded'),
-    ('TKT-01115', 5552, 1173, 46, 30.27, 'Reserved'),
-    ('TKT-01116', 5552, 1173, 46, 30.27, 'Reserved'),
-    ('TKT-01117', 5552, 1173, 46, 30.27, 'Reserved'),
-    ('TKT-01118', 5552, 1173, 46, 30.27, 'Refunded'),
-    ('TKT-01119', 5553, 1042, 433, 35.48, 'Purchased'),
-    ('TKT-01120', 5553, 1042, 433, 35.48, 'Purchased'),
-    ('TKT-01121', 5553, 1042, 433, 35.48, 'Refunded'),
-    ('TKT-01122', 5553, 1042, 433, 35.48, 'Reserved'),
-    ('TKT-01123', 5554, 1115, 176, 166.9, 'Purchased'),
-    ('TKT-01124', 5555, 1085, 2, 22.99, 'Refunded'),
-    ('TKT-01125', 5555, 1085, 2, 22.99, 'Refunded'),
-    ('TKT-01126', 5555, 1085, 2, 22.99, 'Reserved'),
-    ('TKT-01127', 5555, 1085, 2, 22.99, 'Purchased'),
-    ('TKT-01128', 5555, 1085, 2, 22.99, 'Refunded'),
-    ('TKT-01129', 5557, 1050, 82, 467.67, 'Purchased'),
-    ('TKT-01130', 5558, 1154, 272, 52.16, 'Reserved'),
-    ('TKT-01131', 5558, 1154, 272, 52.16, 'Reserved'),
-    ('TKT-01132', 5558, 1154, 272, 52.16, 'Purchased'),
-    ('TKT-01133', 5558, 1154, 272, 52.16, 'Reserved'),
-    ('TKT-01134', 5558, 1154, 272, 52.16, 'Reserved'),
-    ('TKT-01135', 5559, 1013, 210, 14.65, 'Refunded'),
-    ('TKT-01136', 5559, 1013, 210, 14.65, 'Reserved'),
-    ('TKT-01137', 5559, 1013, 210, 14.65, 'Reserved'),
-    ('TKT-01138', 5559, 1013, 210, 14.65, 'Refunded'),
-    ('TKT-01139', 5559, 1013, 210, 14.65, 'Refunded'),
-    ('TKT-01140', 5560, 1103, 116, 20.32, 'Refunded'),
-    ('TKT-01141', 5560, 1103, 116, 20.32, 'Reserved'),
-    ('TKT-01142', 5560, 1103, 116, 20.32, 'Reserved'),
-    ('TKT-01143', 5560, 1103, 116, 20.32, 'Purchased'),
-    ('TKT-01144', 5561, 1062, 372, 63.32, 'Reserved'),
-    ('TKT-01145', 5561, 1062, 372, 63.32, 'Purchased'),
-    ('TKT-01146', 5561, 1062, 372, 63.32, 'Purchased'),
-    ('TKT-01147', 5561, 1062, 372, 63.32, 'Refunded'),
-    ('TKT-01148', 5561, 1062, 372, 63.32, 'Refunded'),
-    ('TKT-01149', 5562, 1057, 314, 64.57, 'Purchased'),
-    ('TKT-01150', 5562, 1057, 314, 64.57, 'Refunded'),
-    ('TKT-01151', 5562, 1057, 314, 64.57, 'Purchased'),
-    ('TKT-01152', 5562, 1057, 314, 64.57, 'Purchased'),
-    ('TKT-01153', 5562, 1057, 314, 64.57, 'Purchased'),
-    ('TKT-01154', 5563, 1008, 183, 64.59, 'Purchased'),
-    ('TKT-01155', 5563, 1008, 183, 64.59, 'Refunded'),
-    ('TKT-01156', 5563, 1008, 183, 64.59, 'Purchased'),
-    ('TKT-01157', 5563, 1008, 183, 64.59, 'Reserved'),
-    ('TKT-01158', 5563, 1008, 183, 64.59, 'Purchased'),
-    ('TKT-01159', 5564, 1165, 210, 37.67, 'Refunded'),
-    ('TKT-01160', 5564, 1165, 210, 37.67, 'Purchased'),
-    ('TKT-01161', 5564, 1165, 210, 37.67, 'Purchased'),
-    ('TKT-01162', 5564, 1165, 210, 37.67, 'Purchased'),
-    ('TKT-01163', 5566, 1014, 85, 66.72, 'Reserved'),
-    ('TKT-01164', 5566, 1014, 85, 66.72, 'Reserved'),
-    ('TKT-01165', 5566, 1014, 85, 66.72, 'Refunded'),
-    ('TKT-01166', 5567, 1058, 158, 57.68, 'Purchased'),
-    ('TKT-01167', 5567, 1058, 158, 57.68, 'Reserved'),
-    ('TKT-01168', 5567, 1058, 158, 57.68, 'Reserved'),
-    ('TKT-01169', 5567, 1058, 158, 57.68, 'Reserved'),
-    ('TKT-01170', 5567, 1058, 158, 57.68, 'Refunded'),
-    ('TKT-01171', 5568, 1151, 494, 33.38, 'Refunded'),
-    ('TKT-01172', 5568, 1151, 494, 33.38, 'Reserved'),
-    ('TKT-01173', 5568, 1151, 494, 33.38, 'Purchased'),
-    ('TKT-01174', 5568, 1151, 494, 33.38, 'Reserved'),
-    ('TKT-01175', 5568, 1151, 494, 33.38, 'Refunded'),
-    ('TKT-01176', 5571, 1002, 372, 50.85, 'Refunded'),
-    ('TKT-01177', 5571, 1002, 372, 50.85, 'Refunded'),
-    ('TKT-01178', 5571, 1002, 372, 50.85, 'Purchased'),
-    ('TKT-01179', 5571, 1002, 372, 50.85, 'Refunded'),
-    ('TKT-01180', 5572, 1129, 436, 6.46, 'Refunded'),
-    ('TKT-01181', 5572, 1129, 436, 6.46, 'Refunded'),
-    ('TKT-01182', 5572, 1129, 436, 6.46, 'Reserved'),
-    ('TKT-01183', 5572, 1129, 436, 6.46, 'Purchased'),
-    ('TKT-01184', 5572, 1129, 436, 6.46, 'Reserved'),
-    ('TKT-01185', 5574, 1130, 54, 11.34, 'Reserved'),
-    ('TKT-01186', 5574, 1130, 54, 11.34, 'Refunded'),
-    ('TKT-01187', 5575, 1106, 491, 307.81, 'Reserved'),
-    ('TKT-01188', 5576, 1138, 252, 82.82, 'Reserved'),
-    ('TKT-01189', 5578, 1142, 274, 36.97, 'Purchased'),
-    ('TKT-01190', 5578, 1142, 274, 36.97, 'Purchased'),
-    ('TKT-01191', 5578, 1142, 274, 36.97, 'Purchased'),
-    ('TKT-01192', 5579, 1012, 491, 60.86, 'Purchased'),
-    ('TKT-01193', 5579, 1012, 491, 60.86, 'Refunded'),
-    ('TKT-01194', 5579, 1012, 491, 60.86, 'Reserved'),
-    ('TKT-01195', 5579, 1012, 491, 60.86, 'Purchased'),
-    ('TKT-01196', 5580, 1135, 185, 29.53, 'Purchased'),
-    ('TKT-01197', 5580, 1135, 185, 29.53, 'Reserved'),
-    ('TKT-01198', 5580, 1135, 185, 29.53, 'Reserved'),
-    ('TKT-01199', 5580, 1135, 185, 29.53, 'Purchased'),
-    ('TKT-01200', 5582, 1161, 197, 34.26, 'Purchased'),
-    ('TKT-01201', 5582, 1161, 197, 34.26, 'Purchased'),
-    ('TKT-01202', 5582, 1161, 197, 34.26, 'Purchased'),
-    ('TKT-01203', 5583, 1149, 19, 38.19, 'Purchased'),
-    ('TKT-01204', 5583, 1149, 19, 38.19, 'Reserved'),
-    ('TKT-01205', 5583, 1149, 19, 38.19, 'Refunded'),
-    ('TKT-01206', 5584, 1188, 199, 47.25, 'Purchased'),
-    ('TKT-01207', 5584, 1188, 199, 47.25, 'Purchased'),
-    ('TKT-01208', 5584, 1188, 199, 47.25, 'Purchased'),
-    ('TKT-01209', 5584, 1188, 199, 47.25, 'Purchased'),
-    ('TKT-01210', 5584, 1188, 199, 47.25, 'Purchased'),
-    ('TKT-01211', 5585, 1193, 252, 82.98, 'Reserved'),
-    ('TKT-01212', 5585, 1193, 252, 82.98, 'Purchased'),
-    ('TKT-01213', 5586, 1013, 355, 64.08, 'Purchased'),
-    ('TKT-01214', 5586, 1013, 355, 64.08, 'Reserved'),
-    ('TKT-01215', 5586, 1013, 355, 64.08, 'Reserved'),
-    ('TKT-01216', 5586, 1013, 355, 64.08, 'Reserved'),
-    ('TKT-01217', 5586, 1013, 355, 64.08, 'Reserved'),
-    ('TKT-01218', 5587, 1174, 464, 155.08, 'Purchased'),
-    ('TKT-01219', 5588, 1058, 82, 54.03, 'Purchased'),
-    ('TKT-01220', 5588, 1058, 82, 54.03, 'Refunded'),
-    ('TKT-01221', 5588, 1058, 82, 54.03, 'Refunded'),
-    ('TKT-01222', 5588, 1058, 82, 54.03, 'Refunded'),
-    ('TKT-01223', 5589, 1128, 307, 240.83, 'Reserved'),
-    ('TKT-01224', 5591, 1133, 85, 12.35, 'Reserved'),
-    ('TKT-01225', 5591, 1133, 85, 12.35, 'Refunded'),
-    ('TKT-01226', 5591, 1133, 85, 12.35, 'Purchased'),
-    ('TKT-01227', 5591, 1133, 85, 12.35, 'Purchased'),
-    ('TKT-01228', 5592, 1118, 216, 93.76, 'Reserved'),
-    ('TKT-01229', 5592, 1118, 216, 93.76, 'Purchased'),
-    ('TKT-01230', 5592, 1118, 216, 93.76, 'Refunded'),
-    ('TKT-01231', 5593, 1134, 199, 97.23, 'Refunded'),
-    ('TKT-01232', 5593, 1134, 199, 97.23, 'Purchased'),
-    ('TKT-01233', 5593, 1134, 199, 97.23, 'Purchased'),
-    ('TKT-01234', 5593, 1134, 199, 97.23, 'Purchased'),
-    ('TKT-01235', 5594, 1001, 471, 276.55, 'Purchased'),
-    ('TKT-01236', 5595, 1054, 421, 130.91, 'Refunded'),
-    ('TKT-01237', 5596, 1008, 46, 266.06, 'Refunded'),
-    ('TKT-01238', 5597, 1077, 33, 119.11, 'Refunded'),
-    ('TKT-01239', 5597, 1077, 33, 119.11, 'Purchased'),
-    ('TKT-01240', 5600, 1051, 196, 45.17, 'Refunded'),
-    ('TKT-01241', 5600, 1051, 196, 45.17, 'Reserved'),
-    ('TKT-01242', 5600, 1051, 196, 45.17, 'Reserved'),
-    ('TKT-01243', 5601, 1040, 86, 139.25, 'Refunded'),
-    ('TKT-01244', 5601, 1040, 86, 139.25, 'Purchased'),
-    ('TKT-01245', 5602, 1072, 97, 53.13, 'Reserved'),
-    ('TKT-01246', 5602, 1072, 97, 53.13, 'Refunded'),
-    ('TKT-01247', 5602, 1072, 97, 53.13, 'Purchased'),
-    ('TKT-01248', 5602, 1072, 97, 53.13, 'Purchased'),
-    ('TKT-01249', 5603, 1169, 344, 11.86, 'Refunded'),
-    ('TKT-01250', 5603, 1169, 344, 11.86, 'Purchased'),
-    ('TKT-01251', 5603, 1169, 344, 11.86, 'Purchased'),
-    ('TKT-01252', 5603, 1169, 344, 11.86, 'Purchased'),
-    ('TKT-01253', 5603, 1169, 344, 11.86, 'Refunded'),
-    ('TKT-01254', 5604, 1091, 239, 107.53, 'Purchased'),
-    ('TKT-01255', 5604, 1091, 239, 107.53, 'Purchased'),
-    ('TKT-01256', 5604, 1091, 239, 107.53, 'Reserved'),
-    ('TKT-01257', 5604, 1091, 239, 107.53, 'Refunded'),
-    ('TKT-01258', 5606, 1195, 189, 101.92, 'Refunded'),
-    ('TKT-01259', 5606, 1195, 189, 101.92, 'Reserved'),
-    ('TKT-01260', 5606, 1195, 189, 101.92, 'Reserved'),
-    ('TKT-01261', 5606, 1195, 189, 101.92, 'Reserved'),
-    ('TKT-01262', 5608, 1012, 443, 122.66, 'Reserved'),
-    ('TKT-01263', 5608, 1012, 443, 122.66, 'Refunded'),
-    ('TKT-01264', 5608, 1012, 443, 122.66, 'Refunded'),
-    ('TKT-01265', 5609, 1050, 28, 164.69, 'Refunded'),
-    ('TKT-01266', 5609, 1050, 28, 164.69, 'Reserved'),
-    ('TKT-01267', 5611, 1191, 479, 77.98, 'Purchased'),
-    ('TKT-01268', 5611, 1191, 479, 77.98, 'Reserved'),
-    ('TKT-01269', 5611, 1191, 479, 77.98, 'Refunded'),
-    ('TKT-01270', 5611, 1191, 479, 77.98, 'Refunded'),
-    ('TKT-01271', 5613, 1048, 310, 61.53, 'Reserved'),
-    ('TKT-01272', 5613, 1048, 310, 61.53, 'Refunded'),
-    ('TKT-01273', 5613, 1048, 310, 61.53, 'Reserved'),
-    ('TKT-01274', 5614, 1153, 344, 15.85, 'Purchased'),
-    ('TKT-01275', 5614, 1153, 344, 15.85, 'Purchased'),
-    ('TKT-01276', 5614, 1153, 344, 15.85, 'Refunded'),
-    ('TKT-01277', 5614, 1153, 344, 15.85, 'Purchased'),
-    ('TKT-01278', 5615, 1123, 190, 62.77, 'Refunded'),
-    ('TKT-01279', 5615, 1123, 190, 62.77, 'Reserved'),
-    ('TKT-01280', 5615, 1123, 190, 62.77, 'Refunded'),
-    ('TKT-01281', 5616, 1008, 35, 83.89, 'Refunded'),
-    ('TKT-01282', 5616, 1008, 35, 83.89, 'Refunded'),
-    ('TKT-01283', 5616, 1008, 35, 83.89, 'Purchased'),
-    ('TKT-01284', 5616, 1008, 35, 83.89, 'Refunded'),
-    ('TKT-01285', 5617, 1161, 28, 38.89, 'Purchased'),
-    ('TKT-01286', 5617, 1161, 28, 38.89, 'Reserved'),
-    ('TKT-01287', 5617, 1161, 28, 38.89, 'Refunded'),
-    ('TKT-01288', 5617, 1161, 28, 38.89, 'Refunded'),
-    ('TKT-01289', 5617, 1161, 28, 38.89, 'Purchased'),
-    ('TKT-01290', 5618, 1066, 94, 103.35, 'Reserved'),
-    ('TKT-01291', 5618, 1066, 94, 103.35, 'Refunded'),
-    ('TKT-01292', 5618, 1066, 94, 103.35, 'Purchased'),
-    ('TKT-01293', 5619, 1189, 413, 54.88, 'Refunded'),
-    ('TKT-01294', 5619, 1189, 413, 54.88, 'Refunded'),
-    ('TKT-01295', 5619, 1189, 413, 54.88, 'Purchased'),
-    ('TKT-01296', 5620, 1051, 29, 348.52, 'Refunded'),
-    ('TKT-01297', 5623, 1167, 276, 65.39, 'Purchased'),
-    ('TKT-01298', 5623, 1167, 276, 65.39, 'Reserved'),
-    ('TKT-01299', 5623, 1167, 276, 65.39, 'Refunded'),
-    ('TKT-01300', 5624, 1166, 248, 5.31, 'Reserved'),
-    ('TKT-01301', 5624, 1166, 248, 5.31, 'Refunded'),
-    ('TKT-01302', 5624, 1166, 248, 5.31, 'Refunded'),
-    ('TKT-01303', 5624, 1166, 248, 5.31, 'Refunded'),
-    ('TKT-01304', 5624, 1166, 248, 5.31, 'Reserved'),
-    ('TKT-01305', 5626, 1074, 394, 74.37, 'Reserved'),
-    ('TKT-01306', 5626, 1074, 394, 74.37, 'Reserved'),
-    ('TKT-01307', 5626, 1074, 394, 74.37, 'Purchased'),
-    ('TKT-01308', 5626, 1074, 394, 74.37, 'Refunded'),
-    ('TKT-01309', 5626, 1074, 394, 74.37, 'Reserved'),
-    ('TKT-01310', 5628, 1110, 215, 14.52, 'Purchased'),
-    ('TKT-01311', 5628, 1110, 215, 14.52, 'Reserved'),
-    ('TKT-01312', 5628, 1110, 215, 14.52, 'Reserved'),
-    ('TKT-01313', 5628, 1110, 215, 14.52, 'Reserved'),
-    ('TKT-01314', 5628, 1110, 215, 14.52, 'Purchased'),
-    ('TKT-01315', 5629, 1146, 481, 238.58, 'Refunded'),
-    ('TKT-01316', 5629, 1146, 481, 238.58, 'Reserved'),
-    ('TKT-01317', 5630, 1104, 168, 99.89, 'Reserved'),
-    ('TKT-01318', 5630, 1104, 168, 99.89, 'Reserved'),
-    ('TKT-01319', 5630, 1104, 168, 99.89, 'Refunded'),
-    ('TKT-01320', 5630, 1104, 168, 99.89, 'Refunded'),
-    ('TKT-01321', 5630, 1104, 168, 99.89, 'Refunded'),
-    ('TKT-01322', 5631, 1119, 26, 108.34, 'Reserved'),
-    ('TKT-01323', 5632, 1054, 75, 21.16, 'Refunded'),
-    ('TKT-01324', 5633, 1189, 204, 12.06, 'Refunded'),
-    ('TKT-01325', 5633, 1189, 204, 12.06, 'Reserved'),
-    ('TKT-01326', 5633, 1189, 204, 12.06, 'Reserved'),
-    ('TKT-01327', 5633, 1189, 204, 12.06, 'Refunded'),
-    ('TKT-01328', 5633, 1189, 204, 12.06, 'Reserved'),
-    ('TKT-01329', 5634, 1135, 378, 91.86, 'Refunded'),
-    ('TKT-01330', 5634, 1135, 378, 91.86, 'Reserved'),
-    ('TKT-01331', 5634, 1135, 378, 91.86, 'Refunded'),
-    ('TKT-01332', 5634, 1135, 378, 91.86, 'Reserved'),
-    ('TKT-01333', 5637, 1047, 190, 103.23, 'Refunded'),
-    ('TKT-01334', 5637, 1047, 190, 103.23, 'Purchased'),
-    ('TKT-01335', 5637, 1047, 190, 103.23, 'Reserved'),
-    ('TKT-01336', 5638, 1136, 457, 61.95, 'Refunded'),
-    ('TKT-01337', 5638, 1136, 457, 61.95, 'Refunded'),
-    ('TKT-01338', 5638, 1136, 457, 61.95, 'Reserved'),
-    ('TKT-01339', 5638, 1136, 457, 61.95, 'Purchased'),
-    ('TKT-01340', 5639, 1114, 493, 45.36, 'Reserved'),
-    ('TKT-01341', 5639, 1114, 493, 45.36, 'Purchased'),
-    ('TKT-01342', 5639, 1114, 493, 45.36, 'Purchased'),
-    ('TKT-01343', 5641, 1093, 264, 47.39, 'Reserved'),
-    ('TKT-01344', 5641, 1093, 264, 47.39, 'Purchased'),
-    ('TKT-01345', 5641, 1093, 264, 47.39, 'Reserved'),
-    ('TKT-01346', 5641, 1093, 264, 47.39, 'Refunded'),
-    ('TKT-01347', 5641, 1093, 264, 47.39, 'Refunded'),
-    ('TKT-01348', 5642, 1029, 471, 117.5, 'Reserved'),
-    ('TKT-01349', 5642, 1029, 471, 117.5, 'Purchased'),
-    ('TKT-01350', 5643, 1023, 464, 38.65, 'Purchased'),
-    ('TKT-01351', 5643, 1023, 464, 38.65, 'Purchased'),
-    ('TKT-01352', 5644, 1086, 19, 188.28, 'Reserved'),
-    ('TKT-01353', 5644, 1086, 19, 188.28, 'Purchased'),
-    ('TKT-01354', 5645, 1097, 414, 7.38, 'Reserved'),
-    ('TKT-01355', 5645, 1097, 414, 7.38, 'Purchased'),
-    ('TKT-01356', 5645, 1097, 414, 7.38, 'Refunded'),
-    ('TKT-01357', 5646, 1028, 211, 29.29, 'Reserved'),
-    ('TKT-01358', 5646, 1028, 211, 29.29, 'Reserved'),
-    ('TKT-01359', 5646, 1028, 211, 29.29, 'Purchased'),
-    ('TKT-01360', 5646, 1028, 211, 29.29, 'Refunded'),
-    ('TKT-01361', 5646, 1028, 211, 29.29, 'Reserved'),
-    ('TKT-01362', 5647, 1199, 132, 34.55, 'Refunded'),
-    ('TKT-01363', 5647, 1199, 132, 34.55, 'Purchased'),
-    ('TKT-01364', 5647, 1199, 132, 34.55, 'Purchased'),
-    ('TKT-01365', 5649, 1150, 448, 38.66, 'Purchased'),
-    ('TKT-01366', 5649, 1150, 448, 38.66, 'Refunded'),
-    ('TKT-01367', 5649, 1150, 448, 38.66, 'Reserved'),
-    ('TKT-01368', 5649, 1150, 448, 38.66, 'Reserved'),
-    ('TKT-01369', 5649, 1150, 448, 38.66, 'Reserved'),
-    ('TKT-01370', 5650, 1066, 85, 62.28, 'Refunded'),
-    ('TKT-01371', 5650, 1066, 85, 62.28, 'Reserved'),
-    ('TKT-01372', 5650, 1066, 85, 62.28, 'Refunded'),
-    ('TKT-01373', 5650, 1066, 85, 62.28, 'Purchased'),
-    ('TKT-01374', 5650, 1066, 85, 62.28, 'Reserved'),
-    ('TKT-01375', 5651, 1124, 51, 130.91, 'Purchased'),
-    ('TKT-01376', 5651, 1124, 51, 130.91, 'Reserved'),
-    ('TKT-01377', 5651, 1124, 51, 130.91, 'Purchased'),
-    ('TKT-01378', 5652, 1168, 205, 103.31, 'Reserved'),
-    ('TKT-01379', 5652, 1168, 205, 103.31, 'Reserved'),
-    ('TKT-01380', 5653, 1061, 82, 35.8, 'Purchased'),
-    ('TKT-01381', 5653, 1061, 82, 35.8, 'Refunded'),
-    ('TKT-01382', 5654, 1184, 296, 23.71, 'Refunded'),
-    ('TKT-01383', 5654, 1184, 296, 23.71, 'Refunded'),
-    ('TKT-01384', 5655, 1112, 479, 147.01, 'Purchased'),
-    ('TKT-01385', 5655, 1112, 479, 147.01, 'Reserved'),
-    ('TKT-01386', 5656, 1189, 489, 160.37, 'Refunded'),
-    ('TKT-01387', 5657, 1161, 116, 96.74, 'Reserved'),
-    ('TKT-01388', 5657, 1161, 116, 96.74, 'Refunded'),
-    ('TKT-01389', 5657, 1161, 116, 96.74, 'Refunded'),
-    ('TKT-01390', 5657, 1161, 116, 96.74, 'Reserved'),
-    ('TKT-01391', 5658, 1015, 31, 29.69, 'Reserved'),
-    ('TKT-01392', 5659, 1167, 94, 166.93, 'Purchased'),
-    ('TKT-01393', 5660, 1175, 314, 33.99, 'Reserved'),
-    ('TKT-01394', 5660, 1175, 314, 33.99, 'Refunded'),
-    ('TKT-01395', 5660, 1175, 314, 33.99, 'Reserved'),
-    ('TKT-01396', 5661, 1191, 413, 128.06, 'Reserved'),
-    ('TKT-01397', 5661, 1191, 413, 128.06, 'Refunded'),
-    ('TKT-01398', 5662, 1009, 49, 121.16, 'Purchased'),
-    ('TKT-01399', 5662, 1009, 49, 121.16, 'Reserved'),
-    ('TKT-01400', 5662, 1009, 49, 121.16, 'Purchased'),
-    ('TKT-01401', 5665, 1112, 7, 105.56, 'Refunded'),
-    ('TKT-01402', 5665, 1112, 7, 105.56, 'Purchased'),
-    ('TKT-01403', 5665, 1112, 7, 105.56, 'Reserved'),
-    ('TKT-01404', 5666, 1046, 139, 141.03, 'Refunded'),
-    ('TKT-01405', 5666, 1046, 139, 141.03, 'Refunded'),
-    ('TKT-01406', 5666, 1046, 139, 141.03, 'Purchased'),
-    ('TKT-01407', 5669, 1019, 222, 16.08, 'Reserved'),
-    ('TKT-01408', 5669, 1019, 222, 16.08, 'Purchased'),
-    ('TKT-01409', 5669, 1019, 222, 16.08, 'Refunded'),
-    ('TKT-01410', 5669, 1019, 222, 16.08, 'Purchased'),
-    ('TKT-01411', 5670, 1074, 89, 11.29, 'Refunded'),
-    ('TKT-01412', 5670, 1074, 89, 11.29, 'Refunded'),
-    ('TKT-01413', 5670, 1074, 89, 11.29, 'Refunded'),
-    ('TKT-01414', 5670, 1074, 89, 11.29, 'Purchased'),
-    ('TKT-01415', 5670, 1074, 89, 11.29, 'Refunded'),
-    ('TKT-01416', 5672, 1163, 448, 12.99, 'Refunded'),
-    ('TKT-01417', 5672, 1163, 448, 12.99, 'Reserved'),
-    ('TKT-01418', 5672, 1163, 448, 12.99, 'Reserved'),
-    ('TKT-01419', 5672, 1163, 448, 12.99, 'Purchased'),
-    ('TKT-01420', 5673, 1189, 40, 45.26, 'Reserved'),
-    ('TKT-01421', 5673, 1189, 40, 45.26, 'Reserved'),
-    ('TKT-01422', 5673, 1189, 40, 45.26, 'Refunded'),
-    ('TKT-01423', 5673, 1189, 40, 45.26, 'Reserved'),
-    ('TKT-01424', 5673, 1189, 40, 45.26, 'Purchased'),
-    ('TKT-01425', 5674, 1188, 76, 9.6, 'Purchased'),
-    ('TKT-01426', 5674, 1188, 76, 9.6, 'Refunded'),
-    ('TKT-01427', 5674, 1188, 76, 9.6, 'Reserved'),
-    ('TKT-01428', 5675, 1086, 365, 76.06, 'Refunded'),
-    ('TKT-01429', 5675, 1086, 365, 76.06, 'Refunded'),
-    ('TKT-01430', 5675, 1086, 365, 76.06, 'Purchased'),
-    ('TKT-01431', 5675, 1086, 365, 76.06, 'Reserved'),
-    ('TKT-01432', 5676, 1046, 220, 21.08, 'Reserved'),
-    ('TKT-01433', 5676, 1046, 220, 21.08, 'Purchased'),
-    ('TKT-01434', 5676, 1046, 220, 21.08, 'Reserved'),
-    ('TKT-01435', 5677, 1094, 210, 155.95, 'Purchased'),
-    ('TKT-01436', 5677, 1094, 210, 155.95, 'Reserved'),
-    ('TKT-01437', 5678, 1010, 344, 38.86, 'Reserved'),
-    ('TKT-01438', 5678, 1010, 344, 38.86, 'Refunded'),
-    ('TKT-01439', 5678, 1010, 344, 38.86, 'Reserved'),
-    ('TKT-01440', 5678, 1010, 344, 38.86, 'Purchased'),
-    ('TKT-01441', 5678, 1010, 344, 38.86, 'Reserved'),
-    ('TKT-01442', 5679, 1142, 464, 42.15, 'Purchased'),
-    ('TKT-01443', 5679, 1142, 464, 42.15, 'Reserved'),
-    ('TKT-01444', 5679, 1142, 464, 42.15, 'Purchased'),
-    ('TKT-01445', 5679, 1142, 464, 42.15, 'Purchased'),
-    ('TKT-01446', 5679, 1142, 464, 42.15, 'Refunded'),
-    ('TKT-01447', 5681, 1182, 378, 63.48, 'Purchased'),
-    ('TKT-01448', 5681, 1182, 378, 63.48, 'Reserved'),
-    ('TKT-01449', 5682, 1086, 26, 99.29, 'Reserved'),
-    ('TKT-01450', 5682, 1086, 26, 99.29, 'Reserved'),
-    ('TKT-01451', 5682, 1086, 26, 99.29, 'Purchased'),
-    ('TKT-01452', 5682, 1086, 26, 99.29, 'Reserved'),
-    ('TKT-01453', 5684, 1135, 179, 23.9, 'Reserved'),
-    ('TKT-01454', 5684, 1135, 179, 23.9, 'Reserved'),
-    ('TKT-01455', 5684, 1135, 179, 23.9, 'Refunded'),
-    ('TKT-01456', 5684, 1135, 179, 23.9, 'Refunded'),
-    ('TKT-01457', 5684, 1135, 179, 23.9, 'Purchased'),
-    ('TKT-01458', 5685, 1125, 89, 46.39, 'Purchased'),
-    ('TKT-01459', 5686, 1077, 106, 115.81, 'Reserved'),
-    ('TKT-01460', 5686, 1077, 106, 115.81, 'Refunded'),
-    ('TKT-01461', 5687, 1072, 190, 27.85, 'Purchased'),
-    ('TKT-01462', 5687, 1072, 190, 27.85, 'Reserved'),
-    ('TKT-01463', 5687, 1072, 190, 27.85, 'Refunded'),
-    ('TKT-01464', 5687, 1072, 190, 27.85, 'Purchased'),
-    ('TKT-01465', 5688, 1042, 105, 214.11, 'Reserved'),
-    ('TKT-01466', 5689, 1107, 344, 50.39, 'Purchased'),
-    ('TKT-01467', 5689, 1107, 344, 50.39, 'Purchased'),
-    ('TKT-01468', 5689, 1107, 344, 50.39, 'Refunded'),
-    ('TKT-01469', 5689, 1107, 344, 50.39, 'Purchased'),
-    ('TKT-01470', 5690, 1117, 499, 239.19, 'Purchased'),
-    ('TKT-01471', 5690, 1117, 499, 239.19, 'Purchased'),
-    ('TKT-01472', 5691, 1195, 291, 31.61, 'Refunded'),
-    ('TKT-01473', 5691, 1195, 291, 31.61, 'Refunded'),
-    ('TKT-01474', 5694, 1106, 222, 200.38, 'Purchased'),
-    ('TKT-01475', 5695, 1168, 378, 443.76, 'Refunded'),
-    ('TKT-01476', 5696, 1137, 119, 24.6, 'Refunded'),
-    ('TKT-01477', 5696, 1137, 119, 24.6, 'Reserved'),
-    ('TKT-01478', 5696, 1137, 119, 24.6, 'Refunded'),
-    ('TKT-01479', 5696, 1137, 119, 24.6, 'Refunded'),
-    ('TKT-01480', 5696, 1137, 119, 24.6, 'Refunded'),
-    ('TKT-01481', 5697, 1076, 89, 81.51, 'Purchased'),
-    ('TKT-01482', 5697, 1076, 89, 81.51, 'Purchased'),
-    ('TKT-01483', 5697, 1076, 89, 81.51, 'Purchased'),
-    ('TKT-01484', 5697, 1076, 89, 81.51, 'Reserved'),
-    ('TKT-01485', 5697, 1076, 89, 81.51, 'Refunded'),
-    ('TKT-01486', 5698, 1114, 122, 145.22, 'Purchased'),
-    ('TKT-01487', 5699, 1008, 205, 7.86, 'Reserved'),
-    ('TKT-01488', 5699, 1008, 205, 7.86, 'Refunded'),
-    ('TKT-01489', 5699, 1008, 205, 7.86, 'Purchased'),
-    ('TKT-01490', 5699, 1008, 205, 7.86, 'Refunded'),
-    ('TKT-01491', 5703, 1161, 158, 83.19, 'Purchased'),
-    ('TKT-01492', 5703, 1161, 158, 83.19, 'Purchased'),
-    ('TKT-01493', 5703, 1161, 158, 83.19, 'Purchased'),
-    ('TKT-01494', 5703, 1161, 158, 83.19, 'Refunded'),
-    ('TKT-01495', 5704, 1072, 198, 86.0, 'Purchased'),
-    ('TKT-01496', 5704, 1072, 198, 86.0, 'Refunded'),
-    ('TKT-01497', 5704, 1072, 198, 86.0, 'Refunded'),
-    ('TKT-01498', 5704, 1072, 198, 86.0, 'Purchased'),
-    ('TKT-01499', 5705, 1101, 264, 212.97, 'Refunded'),
-    ('TKT-01500', 5705, 1101, 264, 212.97, 'Purchased'),
-    ('TKT-01501', 5706, 1042, 105, 25.45, 'Reserved'),
-    ('TKT-01502', 5706, 1042, 105, 25.45, 'Reserved'),
-    ('TKT-01503', 5707, 1079, 327, 60.36, 'Purchased'),
-    ('TKT-01504', 5707, 1079, 327, 60.36, 'Refunded'),
-    ('TKT-01505', 5707, 1079, 327, 60.36, 'Purchased'),
-    ('TKT-01506', 5708, 1052, 394, 95.76, 'Reserved'),
-    ('TKT-01507', 5710, 1167, 212, 78.16, 'Reserved'),
-    ('TKT-01508', 5710, 1167, 212, 78.16, 'Reserved'),
-    ('TKT-01509', 5710, 1167, 212, 78.16, 'Refunded'),
-    ('TKT-01510', 5710, 1167, 212, 78.16, 'Refunded'),
-    ('TKT-01511', 5710, 1167, 212, 78.16, 'Refunded'),
-    ('TKT-01512', 5711, 1147, 190, 184.33, 'Purchased'),
-    ('TKT-01513', 5712, 1063, 54, 110.88, 'Refunded'),
-    ('TKT-01514', 5712, 1063, 54, 110.88, 'Refunded'),
-    ('TKT-01515', 5712, 1063, 54, 110.88, 'Refunded'),
-    ('TKT-01516', 5714, 1181, 28, 105.11, 'Purchased'),
-    ('TKT-01517', 5714, 1181, 28, 105.11, 'Refunded'),
-    ('TKT-01518', 5714, 1181, 28, 105.11, 'Purchased'),
-    ('TKT-01519', 5714, 1181, 28, 105.11, 'Refunded'),
-    ('TKT-01520', 5715, 1050, 471, 107.75, 'Refunded'),
-    ('TKT-01521', 5715, 1050, 471, 107.75, 'Reserved'),
-    ('TKT-01522', 5715, 1050, 471, 107.75, 'Reserved'),
-    ('TKT-01523', 5715, 1050, 471, 107.75, 'Refunded'),
-    ('TKT-01524', 5718, 1078, 149, 113.66, 'Purchased'),
-    ('TKT-01525', 5718, 1078, 149, 113.66, 'Reserved'),
-    ('TKT-01526', 5718, 1078, 149, 113.66, 'Refunded'),
-    ('TKT-01527', 5719, 1176, 97, 208.5, 'Reserved'),
-    ('TKT-01528', 5719, 1176, 97, 208.5, 'Refunded'),
-    ('TKT-01529', 5722, 1158, 115, 92.78, 'Purchased'),
-    ('TKT-01530', 5722, 1158, 115, 92.78, 'Reserved'),
-    ('TKT-01531', 5722, 1158, 115, 92.78, 'Reserved'),
-    ('TKT-01532', 5722, 1158, 115, 92.78, 'Refunded'),
-    ('TKT-01533', 5722, 1158, 115, 92.78, 'Reserved'),
-    ('TKT-01534', 5723, 1119, 491, 38.43, 'Refunded'),
-    ('TKT-01535', 5723, 1119, 491, 38.43, 'Refunded'),
-    ('TKT-01536', 5724, 1052, 200, 16.36, 'Refunded'),
-    ('TKT-01537', 5724, 1052, 200, 16.36, 'Refunded'),
-    ('TKT-01538', 5724, 1052, 200, 16.36, 'Refunded'),
-    ('TKT-01539', 5724, 1052, 200, 16.36, 'Purchased'),
-    ('TKT-01540', 5724, 1052, 200, 16.36, 'Refunded'),
-    ('TKT-01541', 5725, 1001, 405, 69.42, 'Reserved'),
-    ('TKT-01542', 5725, 1001, 405, 69.42, 'Reserved'),
-    ('TKT-01543', 5725, 1001, 405, 69.42, 'Refunded'),
-    ('TKT-01544', 5725, 1001, 405, 69.42, 'Purchased'),
-    ('TKT-01545', 5726, 1085, 189, 195.5, 'Reserved'),
-    ('TKT-01546', 5726, 1085, 189, 195.5, 'Refunded'),
-    ('TKT-01547', 5727, 1084, 499, 63.89, 'Purchased'),
-    ('TKT-01548', 5727, 1084, 499, 63.89, 'Reserved'),
-    ('TKT-01549', 5727, 1084, 499, 63.89, 'Reserved'),
-    ('TKT-01550', 5727, 1084, 499, 63.89, 'Refunded'),
-    ('TKT-01551', 5728, 1066, 485, 64.17, 'Reserved'),
-    ('TKT-01552', 5728, 1066, 485, 64.17, 'Purchased'),
-    ('TKT-01553', 5728, 1066, 485, 64.17, 'Reserved'),
-    ('TKT-01554', 5728, 1066, 485, 64.17, 'Purchased'),
-    ('TKT-01555', 5728, 1066, 485, 64.17, 'Refunded'),
-    ('TKT-01556', 5729, 1072, 335, 122.03, 'Reserved'),
-    ('TKT-01557', 5729, 1072, 335, 122.03, 'Reserved'),
-    ('TKT-01558', 5729, 1072, 335, 122.03, 'Purchased'),
-    ('TKT-01559', 5729, 1072, 335, 122.03, 'Reserved'),
-    ('TKT-01560', 5730, 1094, 19, 99.42, 'Purchased'),
-    ('TKT-01561', 5730, 1094, 19, 99.42, 'Purchased'),
-    ('TKT-01562', 5730, 1094, 19, 99.42, 'Reserved'),
-    ('TKT-01563', 5730, 1094, 19, 99.42, 'Purchased'),
-    ('TKT-01564', 5730, 1094, 19, 99.42, 'Refunded'),
-    ('TKT-01565', 5731, 1187, 347, 67.91, 'Refunded'),
-    ('TKT-01566', 5731, 1187, 347, 67.91, 'Reserved'),
-    ('TKT-01567', 5731, 1187, 347, 67.91, 'Reserved'),
-    ('TKT-01568', 5731, 1187, 347, 67.91, 'Refunded'),
-    ('TKT-01569', 5732, 1117, 347, 87.55, 'Reserved'),
-    ('TKT-01570', 5732, 1117, 347, 87.55, 'Refunded'),
-    ('TKT-01571', 5732, 1117, 347, 87.55, 'Purchased'),
-    ('TKT-01572', 5732, 1117, 347, 87.55, 'Purchased'),
-    ('TKT-01573', 5734, 1189, 386, 175.91, 'Reserved'),
-    ('TKT-01574', 5734, 1189, 386, 175.91, 'Purchased'),
-    ('TKT-01575', 5736, 1148, 155, 131.3, 'Purchased'),
-    ('TKT-01576', 5737, 1059, 386, 24.94, 'Reserved'),
-    ('TKT-01577', 5737, 1059, 386, 24.94, 'Reserved'),
-    ('TKT-01578', 5738, 1040, 204, 27.65, 'Reserved'),
-    ('TKT-01579', 5738, 1040, 204, 27.65, 'Reserved'),
-    ('TKT-01580', 5738, 1040, 204, 27.65, 'Reserved'),
-    ('TKT-01581', 5738, 1040, 204, 27.65, 'Purchased'),
-    ('TKT-01582', 5738, 1040, 204, 27.65, 'Refunded'),
-    ('TKT-01583', 5741, 1004, 443, 44.39, 'Reserved'),
-    ('TKT-01584', 5741, 1004, 443, 44.39, 'Purchased'),
-    ('TKT-01585', 5741, 1004, 443, 44.39, 'Refunded'),
-    ('TKT-01586', 5743, 1187, 40, 19.12, 'Refunded'),
-    ('TKT-01587', 5743, 1187, 40, 19.12, 'Refunded'),
-    ('TKT-01588', 5743, 1187, 40, 19.12, 'Purchased'),
-    ('TKT-01589', 5746, 1041, 262, 274.17, 'Refunded'),
-    ('TKT-01590', 5748, 1002, 113, 103.46, 'Purchased'),
-    ('TKT-01591', 5748, 1002, 113, 103.46, 'Reserved'),
-    ('TKT-01592', 5748, 1002, 113, 103.46, 'Refunded'),
-    ('TKT-01593', 5748, 1002, 113, 103.46, 'Refunded'),
-    ('TKT-01594', 5751, 1135, 422, 43.48, 'Refunded'),
-    ('TKT-01595', 5751, 1135, 422, 43.48, 'Purchased'),
-    ('TKT-01596', 5751, 1135, 422, 43.48, 'Refunded'),
-    ('TKT-01597', 5752, 1181, 372, 413.14, 'Reserved'),
-    ('TKT-01598', 5755, 1150, 75, 97.24, 'Purchased'),
-    ('TKT-01599', 5755, 1150, 75, 97.24, 'Refunded'),
-    ('TKT-01600', 5755, 1150, 75, 97.24, 'Reserved'),
-    ('TKT-01601', 5757, 1028, 278, 439.59, 'Refunded'),
-    ('TKT-01602', 5758, 1159, 239, 115.78, 'Reserved'),
-    ('TKT-01603', 5758, 1159, 239, 115.78, 'Refunded'),
-    ('TKT-01604', 5758, 1159, 239, 115.78, 'Reserved'),
-    ('TKT-01605', 5758, 1159, 239, 115.78, 'Refunded'),
-    ('TKT-01606', 5759, 1058, 240, 90.56, 'Reserved'),
-    ('TKT-01607', 5759, 1058, 240, 90.56, 'Refunded'),
-    ('TKT-01608', 5759, 1058, 240, 90.56, 'Purchased'),
-    ('TKT-01609', 5759, 1058, 240, 90.56, 'Purchased'),
-    ('TKT-01610', 5760, 1012, 287, 115.17, 'Refunded'),
-    ('TKT-01611', 5760, 1012, 287, 115.17, 'Purchased'),
-    ('TKT-01612', 5760, 1012, 287, 115.17, 'Purchased'),
-    ('TKT-01613', 5762, 1171, 449, 91.11, 'Reserved'),
-    ('TKT-01614', 5762, 1171, 449, 91.11, 'Reserved'),
-    ('TKT-01615', 5762, 1171, 449, 91.11, 'Purchased'),
-    ('TKT-01616', 5762, 1171, 449, 91.11, 'Refunded'),
-    ('TKT-01617', 5762, 1171, 449, 91.11, 'Reserved'),
-    ('TKT-01618', 5763, 1034, 141, 61.3, 'Purchased'),
-    ('TKT-01619', 5763, 1034, 141, 61.3, 'Reserved'),
-    ('TKT-01620', 5763, 1034, 141, 61.3, 'Reserved'),
-    ('TKT-01621', 5763, 1034, 141, 61.3, 'Refunded'),
-    ('TKT-01622', 5763, 1034, 141, 61.3, 'Reserved'),
-    ('TKT-01623', 5764, 1110, 37, 247.85, 'Reserved'),
-    ('TKT-01624', 5764, 1110, 37, 247.85, 'Purchased'),
-    ('TKT-01625', 5765, 1119, 126, 15.46, 'Reserved'),
-    ('TKT-01626', 5765, 1119, 126, 15.46, 'Reserved'),
-    ('TKT-01627', 5767, 1063, 126, 94.91, 'Reserved'),
-    ('TKT-01628', 5767, 1063, 126, 94.91, 'Reserved'),
-    ('TKT-01629', 5767, 1063, 126, 94.91, 'Reserved'),
-    ('TKT-01630', 5767, 1063, 126, 94.91, 'Refunded'),
-    ('TKT-01631', 5767, 1063, 126, 94.91, 'Refunded'),
-    ('TKT-01632', 5768, 1179, 239, 247.88, 'Purchased'),
-    ('TKT-01633', 5769, 1193, 252, 55.69, 'Reserved'),
-    ('TKT-01634', 5769, 1193, 252, 55.69, 'Reserved'),
-    ('TKT-01635', 5769, 1193, 252, 55.69, 'Refunded'),
-    ('TKT-01636', 5770, 1016, 246, 82.83, 'Reserved'),
-    ('TKT-01637', 5770, 1016, 246, 82.83, 'Reserved'),
-    ('TKT-01638', 5770, 1016, 246, 82.83, 'Purchased'),
-    ('TKT-01639', 5770, 1016, 246, 82.83, 'Refunded'),
-    ('TKT-01640', 5770, 1016, 246, 82.83, 'Reserved'),
-    ('TKT-01641', 5771, 1154, 392, 110.43, 'Purchased'),
-    ('TKT-01642', 5771, 1154, 392, 110.43, 'Purchased'),
-    ('TKT-01643', 5771, 1154, 392, 110.43, 'Reserved'),
-    ('TKT-01644', 5772, 1187, 139, 33.43, 'Reserved'),
-    ('TKT-01645', 5772, 1187, 139, 33.43, 'Purchased'),
-    ('TKT-01646', 5772, 1187, 139, 33.43, 'Refunded'),
-    ('TKT-01647', 5772, 1187, 139, 33.43, 'Reserved'),
-    ('TKT-01648', 5772, 1187, 139, 33.43, 'Purchased'),
-    ('TKT-01649', 5773, 1138, 349, 410.25, 'Purchased'),
-    ('TKT-01650', 5774, 1120, 264, 72.25, 'Refunded'),
-    ('TKT-01651', 5774, 1120, 264, 72.25, 'Reserved'),
-    ('TKT-01652', 5774, 1120, 264, 72.25, 'Reserved'),
-    ('TKT-01653', 5775, 1004, 105, 108.53, 'Reserved'),
-    ('TKT-01654', 5775, 1004, 105, 108.53, 'Purchased'),
-    ('TKT-01655', 5775, 1004, 105, 108.53, 'Refunded'),
-    ('TKT-01656', 5776, 1113, 92, 49.19, 'Purchased'),
-    ('TKT-01657', 5776, 1113, 92, 49.19, 'Purchased'),
-    ('TKT-01658', 5776, 1113, 92, 49.19, 'Purchased'),
-    ('TKT-01659', 5776, 1113, 92, 49.19, 'Refunded'),
-    ('TKT-01660', 5777, 1078, 222, 84.88, 'Refunded'),
-    ('TKT-01661', 5777, 1078, 222, 84.88, 'Refunded'),
-    ('TKT-01662', 5777, 1078, 222, 84.88, 'Reserved'),
-    ('TKT-01663', 5777, 1078, 222, 84.88, 'Purchased'),
-    ('TKT-01664', 5778, 1172, 214, 79.1, 'Reserved'),
-    ('TKT-01665', 5778, 1172, 214, 79.1, 'Reserved'),
-    ('TKT-01666', 5778, 1172, 214, 79.1, 'Purchased'),
-    ('TKT-01667', 5779, 1003, 152, 48.66, 'Purchased'),
-    ('TKT-01668', 5779, 1003, 152, 48.66, 'Refunded'),
-    ('TKT-01669', 5779, 1003, 152, 48.66, 'Refunded'),
-    ('TKT-01670', 5779, 1003, 152, 48.66, 'Refunded'),
-    ('TKT-01671', 5780, 1081, 222, 499.9, 'Purchased'),
-    ('TKT-01672', 5781, 1187, 414, 123.89, 'Reserved'),
-    ('TKT-01673', 5781, 1187, 414, 123.89, 'Purchased'),
-    ('TKT-01674', 5781, 1187, 414, 123.89, 'Reserved'),
-    ('TKT-01675', 5782, 1086, 496, 157.4, 'Refunded'),
-    ('TKT-01676', 5782, 1086, 496, 157.4, 'Refunded'),
-    ('TKT-01677', 5784, 1190, 313, 109.59, 'Purchased'),
-    ('TKT-01678', 5784, 1190, 313, 109.59, 'Reserved'),
-    ('TKT-01679', 5784, 1190, 313, 109.59, 'Purchased'),
-    ('TKT-01680', 5784, 1190, 313, 109.59, 'Reserved'),
-    ('TKT-01681', 5785, 1182, 139, 37.33, 'Reserved'),
-    ('TKT-01682', 5785, 1182, 139, 37.33, 'Reserved'),
-    ('TKT-01683', 5787, 1094, 407, 9.81, 'Reserved'),
-    ('TKT-01684', 5787, 1094, 407, 9.81, 'Purchased'),
-    ('TKT-01685', 5787, 1094, 407, 9.81, 'Refunded'),
-    ('TKT-01686', 5787, 1094, 407, 9.81, 'Purchased'),
-    ('TKT-01687', 5787, 1094, 407, 9.81, 'Refunded'),
-    ('TKT-01688', 5789, 1106, 349, 24.86, 'Purchased'),
-    ('TKT-01689', 5790, 1200, 248, 53.22, 'Reserved'),
-    ('TKT-01690', 5790, 1200, 248, 53.22, 'Purchased'),
-    ('TKT-01691', 5791, 1128, 67, 242.43, 'Reserved'),
-    ('TKT-01692', 5792, 1128, 113, 72.27, 'Purchased'),
-    ('TKT-01693', 5792, 1128, 113, 72.27, 'Reserved'),
-    ('TKT-01694', 5792, 1128, 113, 72.27, 'Refunded'),
-    ('TKT-01695', 5792, 1128, 113, 72.27, 'Refunded'),
-    ('TKT-01696', 5793, 1176, 97, 352.73, 'Refunded'),
-    ('TKT-01697', 5794, 1062, 82, 14.24, 'Refunded'),
-    ('TKT-01698', 5794, 1062, 82, 14.24, 'Refunded'),
-    ('TKT-01699', 5794, 1062, 82, 14.24, 'Purchased'),
-    ('TKT-01700', 5795, 1171, 97, 139.21, 'Refunded'),
-    ('TKT-01701', 5795, 1171, 97, 139.21, 'Refunded'),
-    ('TKT-01702', 5797, 1163, 158, 225.05, 'Reserved'),
-    ('TKT-01703', 5797, 1163, 158, 225.05, 'Purchased'),
-    ('TKT-01704', 5798, 1175, 458, 22.89, 'Reserved'),
-    ('TKT-01705', 5798, 1175, 458, 22.89, 'Purchased'),
-    ('TKT-01706', 5798, 1175, 458, 22.89, 'Reserved'),
-    ('TKT-01707', 5798, 1175, 458, 22.89, 'Purchased'),
-    ('TKT-01708', 5799, 1118, 37, 42.05, 'Refunded'),
-    ('TKT-01709', 5799, 1118, 37, 42.05, 'Purchased'),
-    ('TKT-01710', 5799, 1118, 37, 42.05, 'Purchased'),
-    ('TKT-01711', 5799, 1118, 37, 42.05, 'Purchased'),
-    ('TKT-01712', 5802, 1064, 170, 256.46, 'Purchased'),
-    ('TKT-01713', 5804, 1188, 299, 445.84, 'Purchased'),
-    ('TKT-01714', 5805, 1108, 373, 68.62, 'Reserved'),
-    ('TKT-01715', 5805, 1108, 373, 68.62, 'Reserved'),
-    ('TKT-01716', 5805, 1108, 373, 68.62, 'Reserved'),
-    ('TKT-01717', 5807, 1120, 233, 36.05, 'Purchased'),
-    ('TKT-01718', 5807, 1120, 233, 36.05, 'Reserved'),
-    ('TKT-01719', 5807, 1120, 233, 36.05, 'Reserved'),
-    ('TKT-01720', 5807, 1120, 233, 36.05, 'Refunded'),
-    ('TKT-01721', 5807, 1120, 233, 36.05, 'Refunded'),
-    ('TKT-01722', 5809, 1181, 203, 73.83, 'Refunded'),
-    ('TKT-01723', 5809, 1181, 203, 73.83, 'Purchased'),
-    ('TKT-01724', 5809, 1181, 203, 73.83, 'Purchased'),
-    ('TKT-01725', 5810, 1159, 212, 309.1, 'Reserved'),
-    ('TKT-01726', 5812, 1066, 214, 142.82, 'Reserved'),
-    ('TKT-01727', 5812, 1066, 214, 142.82, 'Reserved'),
-    ('TKT-01728', 5813, 1183, 198, 55.33, 'Refunded'),
-    ('TKT-01729', 5813, 1183, 198, 55.33, 'Purchased'),
-    ('TKT-01730', 5813, 1183, 198, 55.33, 'Refunded'),
-    ('TKT-01731', 5813, 1183, 198, 55.33, 'Refunded'),
-    ('TKT-01732', 5813, 1183, 198, 55.33, 'Reserved'),
-    ('TKT-01733', 5814, 1169, 79, 287.86, 'Purchased'),
-    ('TKT-01734', 5815, 1018, 100, 86.25, 'Purchased'),
-    ('TKT-01735', 5815, 1018, 100, 86.25, 'Refunded'),
-    ('TKT-01736', 5815, 1018, 100, 86.25, 'Refunded'),
-    ('TKT-01737', 5816, 1085, 54, 85.8, 'Refunded'),
-    ('TKT-01738', 5816, 1085, 54, 85.8, 'Reserved'),
-    ('TKT-01739', 5816, 1085, 54, 85.8, 'Purchased'),
-    ('TKT-01740', 5817, 1075, 139, 93.38, 'Reserved'),
-    ('TKT-01741', 5817, 1075, 139, 93.38, 'Reserved'),
-    ('TKT-01742', 5817, 1075, 139, 93.38, 'Reserved'),
-    ('TKT-01743', 5817, 1075, 139, 93.38, 'Refunded'),
-    ('TKT-01744', 5817, 1075, 139, 93.38, 'Refunded'),
-    ('TKT-01745', 5819, 1003, 12, 122.71, 'Reserved'),
-    ('TKT-01746', 5819, 1003, 12, 122.71, 'Refunded'),
-    ('TKT-01747', 5819, 1003, 12, 122.71, 'Reserved'),
-    ('TKT-01748', 5821, 1041, 331, 181.59, 'Refunded'),
-    ('TKT-01749', 5821, 1041, 331, 181.59, 'Purchased'),
-    ('TKT-01750', 5822, 1170, 49, 201.3, 'Purchased'),
-    ('TKT-01751', 5822, 1170, 49, 201.3, 'Refunded'),
-    ('TKT-01752', 5823, 1138, 32, 52.48, 'Refunded'),
-    ('TKT-01753', 5823, 1138, 32, 52.48, 'Refunded'),
-    ('TKT-01754', 5823, 1138, 32, 52.48, 'Refunded'),
-    ('TKT-01755', 5823, 1138, 32, 52.48, 'Refunded'),
-    ('TKT-01756', 5824, 1033, 241, 50.02, 'Reserved'),
-    ('TKT-01757', 5824, 1033, 241, 50.02, 'Reserved'),
-    ('TKT-01758', 5824, 1033, 241, 50.02, 'Refunded'),
-    ('TKT-01759', 5824, 1033, 241, 50.02, 'Reserved'),
-    ('TKT-01760', 5826, 1053, 445, 96.77, 'Refunded'),
-    ('TKT-01761', 5826, 1053, 445, 96.77, 'Purchased'),
-    ('TKT-01762', 5826, 1053, 445, 96.77, 'Purchased'),
-    ('TKT-01763', 5827, 1188, 230, 118.05, 'Refunded'),
-    ('TKT-01764', 5827, 1188, 230, 118.05, 'Reserved'),
-    ('TKT-01765', 5827, 1188, 230, 118.05, 'Purchased'),
-    ('TKT-01766', 5828, 1007, 75, 41.6, 'Purchased'),
-    ('TKT-01767', 5828, 1007, 75, 41.6, 'Refunded'),
-    ('TKT-01768', 5828, 1007, 75, 41.6, 'Reserved'),
-    ('TKT-01769', 5829, 1062, 113, 158.07, 'Purchased'),
-    ('TKT-01770', 5829, 1062, 113, 158.07, 'Reserved'),
-    ('TKT-01771', 5829, 1062, 113, 158.07, 'Reserved'),
-    ('TKT-01772', 5830, 1063, 239, 12.94, 'Refunded'),
-    ('TKT-01773', 5830, 1063, 239, 12.94, 'Refunded'),
-    ('TKT-01774', 5830, 1063, 239, 12.94, 'Reserved'),
-    ('TKT-01775', 5830, 1063, 239, 12.94, 'Reserved'),
-    ('TKT-01776', 5830, 1063, 239, 12.94, 'Purchased'),
-    ('TKT-01777', 5831, 1135, 473, 74.94, 'Refunded'),
-    ('TKT-01778', 5831, 1135, 473, 74.94, 'Purchased'),
-    ('TKT-01779', 5831, 1135, 473, 74.94, 'Purchased'),
-    ('TKT-01780', 5831, 1135, 473, 74.94, 'Refunded'),
-    ('TKT-01781', 5832, 1157, 276, 214.16, 'Purchased'),
-    ('TKT-01782', 5832, 1157, 276, 214.16, 'Purchased'),
-    ('TKT-01783', 5833, 1092, 183, 34.98, 'Refunded'),
-    ('TKT-01784', 5833, 1092, 183, 34.98, 'Refunded'),
-    ('TKT-01785', 5833, 1092, 183, 34.98, 'Reserved'),
-    ('TKT-01786', 5833, 1092, 183, 34.98, 'Purchased'),
-    ('TKT-01787', 5834, 1132, 299, 123.97, 'Reserved'),
-    ('TKT-01788', 5834, 1132, 299, 123.97, 'Refunded'),
-    ('TKT-01789', 5836, 1014, 205, 22.52, 'Reserved'),
-    ('TKT-01790', 5836, 1014, 205, 22.52, 'Refunded'),
-    ('TKT-01791', 5836, 1014, 205, 22.52, 'Purchased'),
-    ('TKT-01792', 5836, 1014, 205, 22.52, 'Purchased'),
-    ('TKT-01793', 5836, 1014, 205, 22.52, 'Purchased'),
-    ('TKT-01794', 5837, 1130, 27, 24.83, 'Purchased'),
-    ('TKT-01795', 5837, 1130, 27, 24.83, 'Reserved'),
-    ('TKT-01796', 5837, 1130, 27, 24.83, 'Reserved'),
-    ('TKT-01797', 5837, 1130, 27, 24.83, 'Reserved'),
-    ('TKT-01798', 5837, 1130, 27, 24.83, 'Refunded'),
-    ('TKT-01799', 5838, 1117, 92, 57.18, 'Reserved'),
-    ('TKT-01800', 5838, 1117, 92, 57.18, 'Refunded'),
-    ('TKT-01801', 5838, 1117, 92, 57.18, 'Reserved'),
-    ('TKT-01802', 5838, 1117, 92, 57.18, 'Refunded'),
-    ('TKT-01803', 5841, 1181, 158, 20.22, 'Refunded'),
-    ('TKT-01804', 5841, 1181, 158, 20.22, 'Refunded'),
-    ('TKT-01805', 5841, 1181, 158, 20.22, 'Reserved'),
-    ('TKT-01806', 5841, 1181, 158, 20.22, 'Reserved'),
-    ('TKT-01807', 5841, 1181, 158, 20.22, 'Refunded'),
-    ('TKT-01808', 5843, 1165, 92, 262.18, 'Reserved'),
-    ('TKT-01809', 5844, 1030, 465, 19.06, 'Reserved'),
-    ('TKT-01810', 5844, 1030, 465, 19.06, 'Refunded'),
-    ('TKT-01811', 5844, 1030, 465, 19.06, 'Refunded'),
-    ('TKT-01812', 5844, 1030, 465, 19.06, 'Purchased'),
-    ('TKT-01813', 5844, 1030, 465, 19.06, 'Purchased'),
-    ('TKT-01814', 5845, 1192, 355, 30.65, 'Refunded'),
-    ('TKT-01815', 5845, 1192, 355, 30.65, 'Reserved'),
-    ('TKT-01816', 5845, 1192, 355, 30.65, 'Purchased'),
-    ('TKT-01817', 5845, 1192, 355, 30.65, 'Refunded'),
-    ('TKT-01818', 5846, 1072, 494, 76.65, 'Purchased'),
-    ('TKT-01819', 5846, 1072, 494, 76.65, 'Refunded'),
-    ('TKT-01820', 5846, 1072, 494, 76.65, 'Refunded'),
-    ('TKT-01821', 5846, 1072, 494, 76.65, 'Refunded'),
-    ('TKT-01822', 5847, 1124, 27, 79.97, 'Purchased'),
-    ('TKT-01823', 5847, 1124, 27, 79.97, 'Purchased'),
-    ('TKT-01824', 5847, 1124, 27, 79.97, 'Purchased'),
-    ('TKT-01825', 5848, 1013, 252, 84.96, 'Purchased'),
-    ('TKT-01826', 5848, 1013, 252, 84.96, 'Reserved'),
-    ('TKT-01827', 5852, 1137, 414, 174.29, 'Reserved'),
-    ('TKT-01828', 5852, 1137, 414, 174.29, 'Purchased'),
-    ('TKT-01829', 5853, 1058, 277, 78.08, 'Refunded'),
-    ('TKT-01830', 5853, 1058, 277, 78.08, 'Refunded'),
-    ('TKT-01831', 5853, 1058, 277, 78.08, 'Purchased'),
-    ('TKT-01832', 5855, 1052, 264, 188.31, 'Refunded'),
-    ('TKT-01833', 5855, 1052, 264, 188.31, 'Refunded'),
-    ('TKT-01834', 5856, 1135, 7, 180.87, 'Reserved'),
-    ('TKT-01835', 5857, 1176, 491, 31.17, 'Refunded'),
-    ('TKT-01836', 5857, 1176, 491, 31.17, 'Refunded'),
-    ('TKT-01837', 5857, 1176, 491, 31.17, 'Refunded'),
-    ('TKT-01838', 5857, 1176, 491, 31.17, 'Refunded'),
-    ('TKT-01839', 5858, 1198, 118, 92.06, 'Refunded'),
-    ('TKT-01840', 5858, 1198, 118, 92.06, 'Reserved'),
-    ('TKT-01841', 5859, 1008, 387, 171.98, 'Reserved'),
-    ('TKT-01842', 5860, 1138, 288, 210.78, 'Refunded'),
-    ('TKT-01843', 5860, 1138, 288, 210.78, 'Reserved'),
-    ('TKT-01844', 5862, 1078, 387, 291.49, 'Purchased'),
-    ('TKT-01845', 5863, 1163, 465, 109.18, 'Purchased'),
-    ('TKT-01846', 5864, 1135, 141, 414.66, 'Reserved'),
-    ('TKT-01847', 5865, 1029, 155, 74.56, 'Reserved'),
-    ('TKT-01848', 5865, 1029, 155, 74.56, 'Refunded'),
-    ('TKT-01849', 5865, 1029, 155, 74.56, 'Reserved'),
-    ('TKT-01850', 5865, 1029, 155, 74.56, 'Reserved'),
-    ('TKT-01851', 5866, 1095, 97, 96.58, 'Reserved'),
-    ('TKT-01852', 5866, 1095, 97, 96.58, 'Refunded'),
-    ('TKT-01853', 5867, 1071, 166, 175.63, 'Refunded'),
-    ('TKT-01854', 5867, 1071, 166, 175.63, 'Purchased'),
-    ('TKT-01855', 5868, 1176, 331, 138.48, 'Refunded'),
-    ('TKT-01856', 5868, 1176, 331, 138.48, 'Reserved'),
-    ('TKT-01857', 5870, 1018, 85, 74.01, 'Reserved'),
-    ('TKT-01858', 5870, 1018, 85, 74.01, 'Reserved'),
-    ('TKT-01859', 5870, 1018, 85, 74.01, 'Purchased'),
-    ('TKT-01860', 5870, 1018, 85, 74.01, 'Purchased'),
-    ('TKT-01861', 5870, 1018, 85, 74.01, 'Reserved'),
-    ('TKT-01862', 5872, 1101, 94, 26.25, 'Refunded'),
-    ('TKT-01863', 5872, 1101, 94, 26.25, 'Reserved'),
-    ('TKT-01864', 5872, 1101, 94, 26.25, 'Refunded'),
-    ('TKT-01865', 5872, 1101, 94, 26.25, 'Purchased'),
-    ('TKT-01866', 5873, 1038, 5, 72.11, 'Refunded'),
-    ('TKT-01867', 5873, 1038, 5, 72.11, 'Refunded'),
-    ('TKT-01868', 5873, 1038, 5, 72.11, 'Reserved'),
-    ('TKT-01869', 5873, 1038, 5, 72.11, 'Reserved'),
-    ('TKT-01870', 5874, 1002, 190, 35.53, 'Refunded'),
-    ('TKT-01871', 5874, 1002, 190, 35.53, 'Purchased'),
-    ('TKT-01872', 5874, 1002, 190, 35.53, 'Reserved'),
-    ('TKT-01873', 5874, 1002, 190, 35.53, 'Refunded'),
-    ('TKT-01874', 5874, 1002, 190, 35.53, 'Reserved'),
-    ('TKT-01875', 5875, 1028, 203, 63.36, 'Purchased'),
-    ('TKT-01876', 5875, 1028, 203, 63.36, 'Purchased'),
-    ('TKT-01877', 5875, 1028, 203, 63.36, 'Purchased'),
-    ('TKT-01878', 5875, 1028, 203, 63.36, 'Purchased'),
-    ('TKT-01879', 5878, 1023, 276, 216.04, 'Purchased'),
-    ('TKT-01880', 5880, 1007, 465, 212.19, 'Refunded'),
-    ('TKT-01881', 5880, 1007, 465, 212.19, 'Purchased'),
-    ('TKT-01882', 5884, 1012, 394, 12.81, 'Reserved'),
-    ('TKT-01883', 5884, 1012, 394, 12.81, 'Refunded'),
-    ('TKT-01884', 5884, 1012, 394, 12.81, 'Purchased'),
-    ('TKT-01885', 5884, 1012, 394, 12.81, 'Reserved'),
-    ('TKT-01886', 5889, 1003, 7, 97.37, 'Reserved'),
-    ('TKT-01887', 5890, 1043, 473, 83.56, 'Reserved'),
-    ('TKT-01888', 5890, 1043, 473, 83.56, 'Refunded'),
-    ('TKT-01889', 5890, 1043, 473, 83.56, 'Refunded'),
-    ('TKT-01890', 5890, 1043, 473, 83.56, 'Refunded'),
-    ('TKT-01891', 5891, 1087, 211, 77.48, 'Purchased'),
-    ('TKT-01892', 5891, 1087, 211, 77.48, 'Reserved'),
-    ('TKT-01893', 5891, 1087, 211, 77.48, 'Reserved'),
-    ('TKT-01894', 5891, 1087, 211, 77.48, 'Purchased'),
-    ('TKT-01895', 5891, 1087, 211, 77.48, 'Reserved'),
-    ('TKT-01896', 5892, 1159, 215, 456.77, 'Refunded'),
-    ('TKT-01897', 5893, 1173, 445, 120.25, 'Purchased'),
-    ('TKT-01898', 5893, 1173, 445, 120.25, 'Purchased'),
-    ('TKT-01899', 5893, 1173, 445, 120.25, 'Refunded'),
-    ('TKT-01900', 5894, 1144, 440, 84.45, 'Purchased'),
-    ('TKT-01901', 5894, 1144, 440, 84.45, 'Purchased'),
-    ('TKT-01902', 5894, 1144, 440, 84.45, 'Reserved'),
-    ('TKT-01903', 5894, 1144, 440, 84.45, 'Reserved'),
-    ('TKT-01904', 5897, 1036, 373, 128.48, 'Refunded'),
-    ('TKT-01905', 5897, 1036, 373, 128.48, 'Purchased'),
-    ('TKT-01906', 5897, 1036, 373, 128.48, 'Reserved'),
-    ('TKT-01907', 5898, 1138, 202, 342.7, 'Refunded'),
-    ('TKT-01908', 5899, 1124, 296, 72.52, 'Reserved'),
-    ('TKT-01909', 5899, 1124, 296, 72.52, 'Purchased'),
-    ('TKT-01910', 5899, 1124, 296, 72.52, 'Refunded'),
-    ('TKT-01911', 5899, 1124, 296, 72.52, 'Reserved'),
-    ('TKT-01912', 5899, 1124, 296, 72.52, 'Reserved'),
-    ('TKT-01913', 5900, 1079, 360, 9.83, 'Purchased'),
-    ('TKT-01914', 5900, 1079, 360, 9.83, 'Refunded'),
-    ('TKT-01915', 5900, 1079, 360, 9.83, 'Reserved'),
-    ('TKT-01916', 5900, 1079, 360, 9.83, 'Refunded'),
-    ('TKT-01917', 5900, 1079, 360, 9.83, 'Reserved'),
-    ('TKT-01918', 5902, 1118, 422, 445.35, 'Purchased'),
-    ('TKT-01919', 5903, 1086, 401, 44.29, 'Reserved'),
-    ('TKT-01920', 5903, 1086, 401, 44.29, 'Reserved'),
-    ('TKT-01921', 5903, 1086, 401, 44.29, 'Purchased'),
-    ('TKT-01922', 5903, 1086, 401, 44.29, 'Reserved'),
-    ('TKT-01923', 5903, 1086, 401, 44.29, 'Refunded'),
-    ('TKT-01924', 5904, 1180, 155, 88.0, 'Purchased'),
-    ('TKT-01925', 5904, 1180, 155, 88.0, 'Purchased'),
-    ('TKT-01926', 5907, 1189, 205, 42.63, 'Refunded'),
-    ('TKT-01927', 5907, 1189, 205, 42.63, 'Reserved'),
-    ('TKT-01928', 5907, 1189, 205, 42.63, 'Purchased'),
-    ('TKT-01929', 5907, 1189, 205, 42.63, 'Purchased'),
-    ('TKT-01930', 5907, 1189, 205, 42.63, 'Reserved'),
-    ('TKT-01931', 5909, 1087, 222, 64.91, 'Purchased'),
-    ('TKT-01932', 5909, 1087, 222, 64.91, 'Refunded'),
-    ('TKT-01933', 5909, 1087, 222, 64.91, 'Reserved'),
-    ('TKT-01934', 5909, 1087, 222, 64.91, 'Refunded'),
-    ('TKT-01935', 5909, 1087, 222, 64.91, 'Purchased'),
-    ('TKT-01936', 5911, 1084, 277, 176.34, 'Purchased'),
-    ('TKT-01937', 5911, 1084, 277, 176.34, 'Purchased'),
-    ('TKT-01938', 5912, 1183, 481, 204.94, 'Refunded'),
-    ('TKT-01939', 5912, 1183, 481, 204.94, 'Purchased'),
-    ('TKT-01940', 5913, 1124, 139, 79.16, 'Purchased'),
-    ('TKT-01941', 5913, 1124, 139, 79.16, 'Purchased'),
-    ('TKT-01942', 5913, 1124, 139, 79.16, 'Refunded'),
-    ('TKT-01943', 5914, 1132, 190, 13.56, 'Reserved'),
-    ('TKT-01944', 5914, 1132, 190, 13.56, 'Reserved'),
-    ('TKT-01945', 5918, 1074, 371, 26.66, 'Purchased'),
-    ('TKT-01946', 5918, 1074, 371, 26.66, 'Refunded'),
-    ('TKT-01947', 5918, 1074, 371, 26.66, 'Reserved'),
-    ('TKT-01948', 5918, 1074, 371, 26.66, 'Refunded'),
-    ('TKT-01949', 5920, 1145, 494, 20.36, 'Purchased'),
-    ('TKT-01950', 5920, 1145, 494, 20.36, 'Purchased'),
-    ('TKT-01951', 5920, 1145, 494, 20.36, 'Reserved'),
-    ('TKT-01952', 5920, 1145, 494, 20.36, 'Purchased'),
-    ('TKT-01953', 5920, 1145, 494, 20.36, 'Reserved'),
-    ('TKT-01954', 5921, 1126, 85, 69.04, 'Purchased'),
-    ('TKT-01955', 5921, 1126, 85, 69.04, 'Reserved'),
-    ('TKT-01956', 5921, 1126, 85, 69.04, 'Refunded'),
-    ('TKT-01957', 5921, 1126, 85, 69.04, 'Refunded'),
-    ('TKT-01958', 5921, 1126, 85, 69.04, 'Refunded'),
-    ('TKT-01959', 5923, 1153, 372, 63.07, 'Refunded'),
-    ('TKT-01960', 5923, 1153, 372, 63.07, 'Reserved'),
-    ('TKT-01961', 5923, 1153, 372, 63.07, 'Refunded'),
-    ('TKT-01962', 5923, 1153, 372, 63.07, 'Reserved'),
-    ('TKT-01963', 5925, 1184, 212, 159.78, 'Refunded'),
-    ('TKT-01964', 5925, 1184, 212, 159.78, 'Purchased'),
-    ('TKT-01965', 5926, 1065, 203, 27.59, 'Purchased'),
-    ('TKT-01966', 5926, 1065, 203, 27.59, 'Purchased'),
-    ('TKT-01967', 5926, 1065, 203, 27.59, 'Reserved'),
-    ('TKT-01968', 5926, 1065, 203, 27.59, 'Refunded'),
-    ('TKT-01969', 5927, 1156, 67, 44.77, 'Refunded'),
-    ('TKT-01970', 5927, 1156, 67, 44.77, 'Refunded'),
-    ('TKT-01971', 5927, 1156, 67, 44.77, 'Reserved'),
-    ('TKT-01972', 5928, 1090, 242, 412.39, 'Purchased'),
-    ('TKT-01973', 5931, 1188, 241, 287.19, 'Purchased'),
-    ('TKT-01974', 5933, 1092, 465, 208.13, 'Reserved'),
-    ('TKT-01975', 5934, 1101, 183, 13.65, 'Reserved'),
-    ('TKT-01976', 5934, 1101, 183, 13.65, 'Reserved'),
-    ('TKT-01977', 5934, 1101, 183, 13.65, 'Purchased'),
-    ('TKT-01978', 5934, 1101, 183, 13.65, 'Reserved'),
-    ('TKT-01979', 5935, 1144, 239, 6.78, 'Reserved'),
-    ('TKT-01980', 5935, 1144, 239, 6.78, 'Refunded'),
-    ('TKT-01981', 5935, 1144, 239, 6.78, 'Refunded'),
-    ('TKT-01982', 5935, 1144, 239, 6.78, 'Refunded'),
-    ('TKT-01983', 5937, 1099, 106, 16.12, 'Purchased'),
-    ('TKT-01984', 5937, 1099, 106, 16.12, 'Refunded'),
-    ('TKT-01985', 5937, 1099, 106, 16.12, 'Purchased'),
-    ('TKT-01986', 5937, 1099, 106, 16.12, 'Refunded'),
-    ('TKT-01987', 5939, 1153, 139, 419.23, 'Refunded'),
-    ('TKT-01988', 5940, 1074, 222, 96.34, 'Refunded'),
-    ('TKT-01989', 5940, 1074, 222, 96.34, 'Purchased'),
-    ('TKT-01990', 5940, 1074, 222, 96.34, 'Purchased'),
-    ('TKT-01991', 5940, 1074, 222, 96.34, 'Purchased'),
-    ('TKT-01992', 5940, 1074, 222, 96.34, 'Purchased'),
-    ('TKT-01993', 5941, 1167, 373, 81.42, 'Refunded'),
-    ('TKT-01994', 5941, 1167, 373, 81.42, 'Refunded'),
-    ('TKT-01995', 5941, 1167, 373, 81.42, 'Refunded'),
-    ('TKT-01996', 5941, 1167, 373, 81.42, 'Refunded'),
-    ('TKT-01997', 5942, 1123, 213, 29.82, 'Refunded'),
-    ('TKT-01998', 5942, 1123, 213, 29.82, 'Refunded'),
-    ('TKT-01999', 5944, 1094, 139, 97.2, 'Refunded'),
-    ('TKT-02000', 5944, 1094, 139, 97.2, 'Refunded'),
-    ('TKT-02001', 5944, 1094, 139, 97.2, 'Reserved'),
-    ('TKT-02002', 5945, 1129, 40, 81.59, 'Refunded'),
-    ('TKT-02003', 5945, 1129, 40, 81.59, 'Purchased'),
-    ('TKT-02004', 5947, 1092, 397, 149.44, 'Reserved'),
-    ('TKT-02005', 5947, 1092, 397, 149.44, 'Refunded'),
-    ('TKT-02006', 5947, 1092, 397, 149.44, 'Reserved'),
-    ('TKT-02007', 5948, 1146, 273, 38.8, 'Reserved'),
-    ('TKT-02008', 5948, 1146, 273, 38.8, 'Reserved'),
-    ('TKT-02009', 5948, 1146, 273, 38.8, 'Reserved'),
-    ('TKT-02010', 5948, 1146, 273, 38.8, 'Refunded'),
-    ('TKT-02011', 5948, 1146, 273, 38.8, 'Refunded'),
-    ('TKT-02012', 5950, 1035, 481, 119.03, 'Refunded'),
-    ('TKT-02013', 5950, 1035, 481, 119.03, 'Refunded'),
-    ('TKT-02014', 5950, 1035, 481, 119.03, 'Reserved'),
-    ('TKT-02015', 5951, 1145, 205, 69.88, 'Reserved'),
-    ('TKT-02016', 5951, 1145, 205, 69.88, 'Refunded'),
-    ('TKT-02017', 5953, 1163, 155, 46.94, 'Purchased'),
-    ('TKT-02018', 5953, 1163, 155, 46.94, 'Purchased'),
-    ('TKT-02019', 5953, 1163, 155, 46.94, 'Reserved'),
-    ('TKT-02020', 5954, 1164, 197, 134.93, 'Refunded'),
-    ('TKT-02021', 5954, 1164, 197, 134.93, 'Purchased'),
-    ('TKT-02022', 5954, 1164, 197, 134.93, 'Refunded'),
-    ('TKT-02023', 5955, 1185, 383, 82.67, 'Reserved'),
-    ('TKT-02024', 5955, 1185, 383, 82.67, 'Refunded'),
-    ('TKT-02025', 5955, 1185, 383, 82.67, 'Refunded'),
-    ('TKT-02026', 5956, 1087, 449, 48.02, 'Refunded'),
-    ('TKT-02027', 5956, 1087, 449, 48.02, 'Purchased'),
-    ('TKT-02028', 5956, 1087, 449, 48.02, 'Reserved'),
-    ('TKT-02029', 5956, 1087, 449, 48.02, 'Purchased'),
-    ('TKT-02030', 5956, 1087, 449, 48.02, 'Purchased'),
-    ('TKT-02031', 5958, 1163, 386, 33.29, 'Reserved'),
-    ('TKT-02032', 5958, 1163, 386, 33.29, 'Purchased'),
-    ('TKT-02033', 5958, 1163, 386, 33.29, 'Refunded'),
-    ('TKT-02034', 5958, 1163, 386, 33.29, 'Purchased'),
-    ('TKT-02035', 5958, 1163, 386, 33.29, 'Purchased'),
-    ('TKT-02036', 5959, 1074, 49, 44.41, 'Refunded'),
-    ('TKT-02037', 5959, 1074, 49, 44.41, 'Refunded'),
-    ('TKT-02038', 5959, 1074, 49, 44.41, 'Refunded'),
-    ('TKT-02039', 5959, 1074, 49, 44.41, 'Reserved'),
-    ('TKT-02040', 5959, 1074, 49, 44.41, 'Purchased'),
-    ('TKT-02041', 5960, 1138, 347, 69.31, 'Refunded'),
-    ('TKT-02042', 5960, 1138, 347, 69.31, 'Reserved'),
-    ('TKT-02043', 5960, 1138, 347, 69.31, 'Purchased'),
-    ('TKT-02044', 5960, 1138, 347, 69.31, 'Purchased'),
-    ('TKT-02045', 5961, 1001, 168, 150.99, 'Refunded'),
-    ('TKT-02046', 5961, 1001, 168, 150.99, 'Reserved'),
-    ('TKT-02047', 5961, 1001, 168, 150.99, 'Purchased'),
-    ('TKT-02048', 5966, 1135, 216, 14.4, 'Refunded'),
-    ('TKT-02049', 5966, 1135, 216, 14.4, 'Purchased'),
-    ('TKT-02050', 5966, 1135, 216, 14.4, 'Refunded'),
-    ('TKT-02051', 5967, 1061, 179, 30.35, 'Purchased'),
-    ('TKT-02052', 5967, 1061, 179, 30.35, 'Refunded'),
-    ('TKT-02053', 5968, 1038, 113, 17.86, 'Refunded'),
-    ('TKT-02054', 5968, 1038, 113, 17.86, 'Refunded'),
-    ('TKT-02055', 5968, 1038, 113, 17.86, 'Refunded'),
-    ('TKT-02056', 5968, 1038, 113, 17.86, 'Refunded'),
-    ('TKT-02057', 5968, 1038, 113, 17.86, 'Reserved'),
-    ('TKT-02058', 5969, 1079, 183, 29.88, 'Refunded'),
-    ('TKT-02059', 5969, 1079, 183, 29.88, 'Reserved'),
-    ('TKT-02060', 5969, 1079, 183, 29.88, 'Reserved'),
-    ('TKT-02061', 5969, 1079, 183, 29.88, 'Purchased'),
-    ('TKT-02062', 5969, 1079, 183, 29.88, 'Purchased'),
-    ('TKT-02063', 5970, 1144, 80, 47.66, 'Reserved'),
-    ('TKT-02064', 5970, 1144, 80, 47.66, 'Purchased'),
-    ('TKT-02065', 5970, 1144, 80, 47.66, 'Reserved'),
-    ('TKT-02066', 5970, 1144, 80, 47.66, 'Refunded'),
-    ('TKT-02067', 5971, 1124, 203, 114.76, 'Reserved'),
-    ('TKT-02068', 5971, 1124, 203, 114.76, 'Refunded'),
-    ('TKT-02069', 5971, 1124, 203, 114.76, 'Refunded'),
-    ('TKT-02070', 5971, 1124, 203, 114.76, 'Reserved'),
-    ('TKT-02071', 5973, 1188, 214, 222.03, 'Purchased'),
-    ('TKT-02072', 5974, 1053, 116, 107.23, 'Refunded'),
-    ('TKT-02073', 5974, 1053, 116, 107.23, 'Reserved'),
-    ('TKT-02074', 5975, 1196, 113, 19.95, 'Purchased'),
-    ('TKT-02075', 5975, 1196, 113, 19.95, 'Reserved'),
-    ('TKT-02076', 5975, 1196, 113, 19.95, 'Purchased'),
-    ('TKT-02077', 5975, 1196, 113, 19.95, 'Reserved'),
-    ('TKT-02078', 5975, 1196, 113, 19.95, 'Purchased'),
-    ('TKT-02079', 5977, 1072, 67, 97.75, 'Refunded'),
-    ('TKT-02080', 5977, 1072, 67, 97.75, 'Purchased'),
-    ('TKT-02081', 5978, 1148, 158, 194.61, 'Refunded'),
-    ('TKT-02082', 5978, 1148, 158, 194.61, 'Reserved'),
-    ('TKT-02083', 5979, 1188, 264, 62.59, 'Refunded'),
-    ('TKT-02084', 5979, 1188, 264, 62.59, 'Reserved'),
-    ('TKT-02085', 5979, 1188, 264, 62.59, 'Refunded'),
-    ('TKT-02086', 5979, 1188, 264, 62.59, 'Reserved'),
-    ('TKT-02087', 5979, 1188, 264, 62.59, 'Purchased'),
-    ('TKT-02088', 5980, 1113, 246, 62.02, 'Refunded'),
-    ('TKT-02089', 5980, 1113, 246, 62.02, 'Purchased'),
-    ('TKT-02090', 5981, 1048, 327, 88.99, 'Reserved'),
-    ('TKT-02091', 5981, 1048, 327, 88.99, 'Reserved'),
-    ('TKT-02092', 5981, 1048, 327, 88.99, 'Purchased'),
-    ('TKT-02093', 5981, 1048, 327, 88.99, 'Purchased'),
-    ('TKT-02094', 5981, 1048, 327, 88.99, 'Reserved'),
-    ('TKT-02095', 5982, 1052, 264, 145.92, 'Reserved'),
-    ('TKT-02096', 5982, 1052, 264, 145.92, 'Purchased'),
-    ('TKT-02097', 5982, 1052, 264, 145.92, 'Reserved'),
-    ('TKT-02098', 5983, 1065, 344, 77.95, 'Reserved'),
-    ('TKT-02099', 5983, 1065, 344, 77.95, 'Reserved'),
-    ('TKT-02100', 5983, 1065, 344, 77.95, 'Purchased'),
-    ('TKT-02101', 5983, 1065, 344, 77.95, 'Refunded'),
-    ('TKT-02102', 5983, 1065, 344, 77.95, 'Refunded'),
-    ('TKT-02103', 5984, 1046, 51, 83.8, 'Purchased'),
-    ('TKT-02104', 5984, 1046, 51, 83.8, 'Refunded'),
-    ('TKT-02105', 5985, 1121, 422, 29.73, 'Refunded'),
-    ('TKT-02106', 5985, 1121, 422, 29.73, 'Reserved'),
-    ('TKT-02107', 5985, 1121, 422, 29.73, 'Reserved'),
-    ('TKT-02108', 5985, 1121, 422, 29.73, 'Refunded'),
-    ('TKT-02109', 5985, 1121, 422, 29.73, 'Reserved'),
-    ('TKT-02110', 5987, 1104, 301, 51.89, 'Refunded'),
-    ('TKT-02111', 5987, 1104, 301, 51.89, 'Purchased'),
-    ('TKT-02112', 5987, 1104, 301, 51.89, 'Purchased'),
-    ('TKT-02113', 5987, 1104, 301, 51.89, 'Reserved'),
-    ('TKT-02114', 5988, 1009, 94, 151.5, 'Reserved'),
-    ('TKT-02115', 5988, 1009, 94, 151.5, 'Purchased'),
-    ('TKT-02116', 5988, 1009, 94, 151.5, 'Refunded'),
-    ('TKT-02117', 5989, 1163, 29, 83.06, 'Purchased'),
-    ('TKT-02118', 5990, 1054, 213, 68.65, 'Purchased'),
-    ('TKT-02119', 5990, 1054, 213, 68.65, 'Purchased'),
-    ('TKT-02120', 5990, 1054, 213, 68.65, 'Purchased'),
-    ('TKT-02121', 5990, 1054, 213, 68.65, 'Purchased'),
-    ('TKT-02122', 5990, 1054, 213, 68.65, 'Refunded'),
-    ('TKT-02123', 5991, 1094, 170, 36.41, 'Refunded'),
-    ('TKT-02124', 5992, 1126, 473, 121.59, 'Purchased'),
-    ('TKT-02125', 5994, 1175, 118, 124.83, 'Purchased'),
-    ('TKT-02126', 5994, 1175, 118, 124.83, 'Purchased'),
-    ('TKT-02127', 5995, 1187, 81, 80.3, 'Refunded'),
-    ('TKT-02128', 5995, 1187, 81, 80.3, 'Reserved'),
-    ('TKT-02129', 5995, 1187, 81, 80.3, 'Refunded'),
-    ('TKT-02130', 5995, 1187, 81, 80.3, 'Reserved'),
-    ('TKT-02131', 5995, 1187, 81, 80.3, 'Refunded'),
-    ('TKT-02132', 5996, 1008, 122, 66.94, 'Purchased'),
-    ('TKT-02133', 5996, 1008, 122, 66.94, 'Purchased'),
-    ('TKT-02134', 5996, 1008, 122, 66.94, 'Purchased'),
-    ('TKT-02135', 5996, 1008, 122, 66.94, 'Purchased'),
-    ('TKT-02136', 5997, 1025, 214, 16.22, 'Refunded'),
-    ('TKT-02137', 5997, 1025, 214, 16.22, 'Purchased'),
-    ('TKT-02138', 5997, 1025, 214, 16.22, 'Reserved'),
-    ('TKT-02139', 5999, 1130, 215, 206.93, 'Reserved'),
-    ('TKT-02140', 6000, 1085, 387, 114.91, 'Purchased'),
-    ('TKT-02141', 6000, 1085, 387, 114.91, 'Purchased'),
-    ('TKT-02142', 6000, 1085, 387, 114.91, 'Refunded'),
-    ('TKT-02143', 6000, 1085, 387, 114.91, 'Reserved');
+    ('TKT-00000001', 5002, 1173, 284, 58.6, 'Purchased'),
+    ('TKT-00000002', 5002, 1173, 284, 58.6, 'Refunded'),
+    ('TKT-00000003', 5002, 1173, 284, 58.6, 'Purchased'),
+    ('TKT-00000004', 5002, 1173, 284, 58.6, 'Refunded'),
+    ('TKT-00000005', 5003, 1122, 326, 305.28, 'Purchased'),
+    ('TKT-00000006', 5004, 1176, 61, 83.22, 'Reserved'),
+    ('TKT-00000007', 5004, 1176, 61, 83.22, 'Purchased'),
+    ('TKT-00000008', 5004, 1176, 61, 83.22, 'Reserved'),
+    ('TKT-00000009', 5004, 1176, 61, 83.22, 'Refunded'),
+    ('TKT-00000010', 5004, 1176, 61, 83.22, 'Refunded'),
+    ('TKT-00000011', 5005, 1064, 475, 114.55, 'Refunded'),
+    ('TKT-00000012', 5005, 1064, 475, 114.55, 'Refunded'),
+    ('TKT-00000013', 5005, 1064, 475, 114.55, 'Purchased'),
+    ('TKT-00000014', 5005, 1064, 475, 114.55, 'Refunded'),
+    ('TKT-00000015', 5006, 1146, 196, 298.91, 'Reserved'),
+    ('TKT-00000016', 5011, 1116, 190, 126.81, 'Refunded'),
+    ('TKT-00000017', 5011, 1116, 190, 126.81, 'Reserved'),
+    ('TKT-00000018', 5011, 1116, 190, 126.81, 'Reserved'),
+    ('TKT-00000019', 5012, 1090, 267, 219.93, 'Reserved'),
+    ('TKT-00000020', 5012, 1090, 267, 219.93, 'Purchased'),
+    ('TKT-00000021', 5013, 1120, 136, 57.06, 'Reserved'),
+    ('TKT-00000022', 5013, 1120, 136, 57.06, 'Refunded'),
+    ('TKT-00000023', 5013, 1120, 136, 57.06, 'Reserved'),
+    ('TKT-00000024', 5013, 1120, 136, 57.06, 'Refunded'),
+    ('TKT-00000025', 5014, 1146, 374, 35.25, 'Reserved'),
+    ('TKT-00000026', 5014, 1146, 374, 35.25, 'Reserved'),
+    ('TKT-00000027', 5014, 1146, 374, 35.25, 'Reserved'),
+    ('TKT-00000028', 5014, 1146, 374, 35.25, 'Reserved'),
+    ('TKT-00000029', 5015, 1165, 270, 151.08, 'Purchased'),
+    ('TKT-00000030', 5015, 1165, 270, 151.08, 'Purchased'),
+    ('TKT-00000031', 5016, 1130, 388, 69.56, 'Purchased'),
+    ('TKT-00000032', 5016, 1130, 388, 69.56, 'Purchased'),
+    ('TKT-00000033', 5016, 1130, 388, 69.56, 'Refunded'),
+    ('TKT-00000034', 5016, 1130, 388, 69.56, 'Reserved'),
+    ('TKT-00000035', 5018, 1056, 489, 351.86, 'Refunded'),
+    ('TKT-00000036', 5019, 1175, 147, 109.45, 'Refunded'),
+    ('TKT-00000037', 5019, 1175, 147, 109.45, 'Reserved'),
+    ('TKT-00000038', 5019, 1175, 147, 109.45, 'Refunded'),
+    ('TKT-00000039', 5020, 1082, 481, 192.14, 'Refunded'),
+    ('TKT-00000040', 5020, 1082, 481, 192.14, 'Refunded'),
+    ('TKT-00000041', 5021, 1186, 459, 62.76, 'Refunded'),
+    ('TKT-00000042', 5021, 1186, 459, 62.76, 'Purchased'),
+    ('TKT-00000043', 5021, 1186, 459, 62.76, 'Purchased'),
+    ('TKT-00000044', 5021, 1186, 459, 62.76, 'Refunded'),
+    ('TKT-00000045', 5021, 1186, 459, 62.76, 'Refunded'),
+    ('TKT-00000046', 5023, 1148, 449, 33.21, 'Purchased'),
+    ('TKT-00000047', 5023, 1148, 449, 33.21, 'Purchased'),
+    ('TKT-00000048', 5023, 1148, 449, 33.21, 'Refunded'),
+    ('TKT-00000049', 5023, 1148, 449, 33.21, 'Refunded'),
+    ('TKT-00000050', 5023, 1148, 449, 33.21, 'Reserved'),
+    ('TKT-00000051', 5024, 1057, 178, 107.07, 'Reserved'),
+    ('TKT-00000052', 5025, 1033, 365, 107.99, 'Purchased'),
+    ('TKT-00000053', 5025, 1033, 365, 107.99, 'Refunded'),
+    ('TKT-00000054', 5025, 1033, 365, 107.99, 'Reserved'),
+    ('TKT-00000055', 5025, 1033, 365, 107.99, 'Purchased'),
+    ('TKT-00000056', 5027, 1029, 9, 104.85, 'Reserved'),
+    ('TKT-00000057', 5027, 1029, 9, 104.85, 'Reserved'),
+    ('TKT-00000058', 5027, 1029, 9, 104.85, 'Reserved'),
+    ('TKT-00000059', 5027, 1029, 9, 104.85, 'Refunded'),
+    ('TKT-00000060', 5028, 1179, 354, 18.1, 'Refunded'),
+    ('TKT-00000061', 5028, 1179, 354, 18.1, 'Refunded'),
+    ('TKT-00000062', 5028, 1179, 354, 18.1, 'Purchased'),
+    ('TKT-00000063', 5028, 1179, 354, 18.1, 'Reserved'),
+    ('TKT-00000064', 5029, 1128, 348, 59.12, 'Reserved'),
+    ('TKT-00000065', 5029, 1128, 348, 59.12, 'Purchased'),
+    ('TKT-00000066', 5029, 1128, 348, 59.12, 'Purchased'),
+    ('TKT-00000067', 5029, 1128, 348, 59.12, 'Refunded'),
+    ('TKT-00000068', 5033, 1137, 358, 102.32, 'Reserved'),
+    ('TKT-00000069', 5033, 1137, 358, 102.32, 'Refunded'),
+    ('TKT-00000070', 5033, 1137, 358, 102.32, 'Refunded'),
+    ('TKT-00000071', 5033, 1137, 358, 102.32, 'Reserved'),
+    ('TKT-00000072', 5035, 1084, 357, 7.53, 'Purchased'),
+    ('TKT-00000073', 5035, 1084, 357, 7.53, 'Refunded'),
+    ('TKT-00000074', 5035, 1084, 357, 7.53, 'Purchased'),
+    ('TKT-00000075', 5035, 1084, 357, 7.53, 'Purchased'),
+    ('TKT-00000076', 5036, 1128, 474, 207.46, 'Reserved'),
+    ('TKT-00000077', 5036, 1128, 474, 207.46, 'Reserved'),
+    ('TKT-00000078', 5037, 1053, 193, 67.76, 'Refunded'),
+    ('TKT-00000079', 5037, 1053, 193, 67.76, 'Purchased'),
+    ('TKT-00000080', 5037, 1053, 193, 67.76, 'Purchased'),
+    ('TKT-00000081', 5037, 1053, 193, 67.76, 'Reserved'),
+    ('TKT-00000082', 5040, 1117, 109, 31.96, 'Purchased'),
+    ('TKT-00000083', 5040, 1117, 109, 31.96, 'Purchased'),
+    ('TKT-00000084', 5040, 1117, 109, 31.96, 'Reserved'),
+    ('TKT-00000085', 5040, 1117, 109, 31.96, 'Refunded'),
+    ('TKT-00000086', 5041, 1084, 480, 20.53, 'Reserved'),
+    ('TKT-00000087', 5041, 1084, 480, 20.53, 'Refunded'),
+    ('TKT-00000088', 5041, 1084, 480, 20.53, 'Purchased'),
+    ('TKT-00000089', 5041, 1084, 480, 20.53, 'Refunded'),
+    ('TKT-00000090', 5042, 1094, 234, 57.9, 'Purchased'),
+    ('TKT-00000091', 5042, 1094, 234, 57.9, 'Purchased'),
+    ('TKT-00000092', 5042, 1094, 234, 57.9, 'Refunded'),
+    ('TKT-00000093', 5042, 1094, 234, 57.9, 'Reserved'),
+    ('TKT-00000094', 5043, 1146, 497, 7.2, 'Purchased'),
+    ('TKT-00000095', 5043, 1146, 497, 7.2, 'Reserved'),
+    ('TKT-00000096', 5043, 1146, 497, 7.2, 'Reserved'),
+    ('TKT-00000097', 5043, 1146, 497, 7.2, 'Reserved'),
+    ('TKT-00000098', 5043, 1146, 497, 7.2, 'Purchased'),
+    ('TKT-00000099', 5046, 1103, 87, 17.92, 'Refunded'),
+    ('TKT-00000100', 5046, 1103, 87, 17.92, 'Reserved'),
+    ('TKT-00000101', 5046, 1103, 87, 17.92, 'Reserved'),
+    ('TKT-00000102', 5046, 1103, 87, 17.92, 'Refunded'),
+    ('TKT-00000103', 5047, 1094, 304, 262.44, 'Reserved'),
+    ('TKT-00000104', 5049, 1141, 372, 121.43, 'Refunded'),
+    ('TKT-00000105', 5049, 1141, 372, 121.43, 'Refunded'),
+    ('TKT-00000106', 5049, 1141, 372, 121.43, 'Purchased'),
+    ('TKT-00000107', 5049, 1141, 372, 121.43, 'Purchased'),
+    ('TKT-00000108', 5050, 1123, 79, 106.28, 'Purchased'),
+    ('TKT-00000109', 5050, 1123, 79, 106.28, 'Refunded'),
+    ('TKT-00000110', 5050, 1123, 79, 106.28, 'Refunded'),
+    ('TKT-00000111', 5050, 1123, 79, 106.28, 'Purchased'),
+    ('TKT-00000112', 5052, 1099, 414, 112.3, 'Purchased'),
+    ('TKT-00000113', 5052, 1099, 414, 112.3, 'Refunded'),
+    ('TKT-00000114', 5052, 1099, 414, 112.3, 'Reserved'),
+    ('TKT-00000115', 5052, 1099, 414, 112.3, 'Refunded'),
+    ('TKT-00000116', 5053, 1032, 71, 35.46, 'Refunded'),
+    ('TKT-00000117', 5053, 1032, 71, 35.46, 'Purchased'),
+    ('TKT-00000118', 5053, 1032, 71, 35.46, 'Purchased'),
+    ('TKT-00000119', 5053, 1032, 71, 35.46, 'Purchased'),
+    ('TKT-00000120', 5053, 1032, 71, 35.46, 'Purchased'),
+    ('TKT-00000121', 5054, 1146, 122, 134.5, 'Purchased'),
+    ('TKT-00000122', 5054, 1146, 122, 134.5, 'Refunded'),
+    ('TKT-00000123', 5054, 1146, 122, 134.5, 'Refunded'),
+    ('TKT-00000124', 5056, 1185, 162, 482.33, 'Refunded'),
+    ('TKT-00000125', 5057, 1150, 21, 87.96, 'Purchased'),
+    ('TKT-00000126', 5057, 1150, 21, 87.96, 'Refunded'),
+    ('TKT-00000127', 5057, 1150, 21, 87.96, 'Refunded'),
+    ('TKT-00000128', 5057, 1150, 21, 87.96, 'Purchased'),
+    ('TKT-00000129', 5057, 1150, 21, 87.96, 'Purchased'),
+    ('TKT-00000130', 5059, 1069, 451, 63.79, 'Refunded'),
+    ('TKT-00000131', 5059, 1069, 451, 63.79, 'Purchased'),
+    ('TKT-00000132', 5059, 1069, 451, 63.79, 'Reserved'),
+    ('TKT-00000133', 5059, 1069, 451, 63.79, 'Purchased'),
+    ('TKT-00000134', 5060, 1186, 325, 273.57, 'Reserved'),
+    ('TKT-00000135', 5061, 1142, 122, 35.76, 'Reserved'),
+    ('TKT-00000136', 5061, 1142, 122, 35.76, 'Reserved'),
+    ('TKT-00000137', 5061, 1142, 122, 35.76, 'Reserved'),
+    ('TKT-00000138', 5061, 1142, 122, 35.76, 'Refunded'),
+    ('TKT-00000139', 5063, 1141, 450, 151.35, 'Reserved'),
+    ('TKT-00000140', 5063, 1141, 450, 151.35, 'Reserved'),
+    ('TKT-00000141', 5063, 1141, 450, 151.35, 'Reserved'),
+    ('TKT-00000142', 5064, 1104, 212, 72.37, 'Reserved'),
+    ('TKT-00000143', 5064, 1104, 212, 72.37, 'Refunded'),
+    ('TKT-00000144', 5064, 1104, 212, 72.37, 'Reserved'),
+    ('TKT-00000145', 5064, 1104, 212, 72.37, 'Purchased'),
+    ('TKT-00000146', 5064, 1104, 212, 72.37, 'Reserved'),
+    ('TKT-00000147', 5065, 1187, 215, 102.13, 'Purchased'),
+    ('TKT-00000148', 5065, 1187, 215, 102.13, 'Purchased'),
+    ('TKT-00000149', 5065, 1187, 215, 102.13, 'Refunded'),
+    ('TKT-00000150', 5065, 1187, 215, 102.13, 'Purchased'),
+    ('TKT-00000151', 5066, 1156, 85, 35.05, 'Refunded'),
+    ('TKT-00000152', 5066, 1156, 85, 35.05, 'Purchased'),
+    ('TKT-00000153', 5066, 1156, 85, 35.05, 'Purchased'),
+    ('TKT-00000154', 5066, 1156, 85, 35.05, 'Reserved'),
+    ('TKT-00000155', 5067, 1022, 315, 105.05, 'Reserved'),
+    ('TKT-00000156', 5067, 1022, 315, 105.05, 'Refunded'),
+    ('TKT-00000157', 5068, 1056, 282, 12.01, 'Purchased'),
+    ('TKT-00000158', 5068, 1056, 282, 12.01, 'Refunded'),
+    ('TKT-00000159', 5068, 1056, 282, 12.01, 'Reserved'),
+    ('TKT-00000160', 5068, 1056, 282, 12.01, 'Refunded'),
+    ('TKT-00000161', 5068, 1056, 282, 12.01, 'Purchased'),
+    ('TKT-00000162', 5070, 1080, 317, 45.0, 'Reserved'),
+    ('TKT-00000163', 5070, 1080, 317, 45.0, 'Purchased'),
+    ('TKT-00000164', 5070, 1080, 317, 45.0, 'Reserved'),
+    ('TKT-00000165', 5070, 1080, 317, 45.0, 'Reserved'),
+    ('TKT-00000166', 5075, 1038, 453, 121.69, 'Refunded'),
+    ('TKT-00000167', 5075, 1038, 453, 121.69, 'Refunded'),
+    ('TKT-00000168', 5075, 1038, 453, 121.69, 'Purchased'),
+    ('TKT-00000169', 5076, 1179, 315, 13.69, 'Purchased'),
+    ('TKT-00000170', 5076, 1179, 315, 13.69, 'Purchased'),
+    ('TKT-00000171', 5076, 1179, 315, 13.69, 'Reserved'),
+    ('TKT-00000172', 5078, 1089, 280, 38.07, 'Purchased'),
+    ('TKT-00000173', 5078, 1089, 280, 38.07, 'Purchased'),
+    ('TKT-00000174', 5078, 1089, 280, 38.07, 'Refunded'),
+    ('TKT-00000175', 5078, 1089, 280, 38.07, 'Reserved'),
+    ('TKT-00000176', 5078, 1089, 280, 38.07, 'Refunded'),
+    ('TKT-00000177', 5079, 1157, 388, 77.61, 'Purchased'),
+    ('TKT-00000178', 5079, 1157, 388, 77.61, 'Reserved'),
+    ('TKT-00000179', 5079, 1157, 388, 77.61, 'Reserved'),
+    ('TKT-00000180', 5080, 1018, 354, 92.27, 'Purchased'),
+    ('TKT-00000181', 5080, 1018, 354, 92.27, 'Purchased'),
+    ('TKT-00000182', 5080, 1018, 354, 92.27, 'Refunded'),
+    ('TKT-00000183', 5081, 1176, 369, 77.03, 'Refunded'),
+    ('TKT-00000184', 5081, 1176, 369, 77.03, 'Reserved'),
+    ('TKT-00000185', 5081, 1176, 369, 77.03, 'Purchased'),
+    ('TKT-00000186', 5081, 1176, 369, 77.03, 'Refunded'),
+    ('TKT-00000187', 5082, 1183, 185, 88.36, 'Reserved'),
+    ('TKT-00000188', 5082, 1183, 185, 88.36, 'Refunded'),
+    ('TKT-00000189', 5083, 1144, 197, 9.31, 'Refunded'),
+    ('TKT-00000190', 5083, 1144, 197, 9.31, 'Reserved'),
+    ('TKT-00000191', 5083, 1144, 197, 9.31, 'Purchased'),
+    ('TKT-00000192', 5083, 1144, 197, 9.31, 'Purchased'),
+    ('TKT-00000193', 5083, 1144, 197, 9.31, 'Purchased'),
+    ('TKT-00000194', 5084, 1074, 450, 69.76, 'Purchased'),
+    ('TKT-00000195', 5084, 1074, 450, 69.76, 'Purchased'),
+    ('TKT-00000196', 5084, 1074, 450, 69.76, 'Reserved'),
+    ('TKT-00000197', 5084, 1074, 450, 69.76, 'Reserved'),
+    ('TKT-00000198', 5084, 1074, 450, 69.76, 'Purchased'),
+    ('TKT-00000199', 5085, 1044, 98, 111.6, 'Refunded'),
+    ('TKT-00000200', 5085, 1044, 98, 111.6, 'Refunded'),
+    ('TKT-00000201', 5085, 1044, 98, 111.6, 'Reserved'),
+    ('TKT-00000202', 5085, 1044, 98, 111.6, 'Refunded'),
+    ('TKT-00000203', 5086, 1171, 460, 168.36, 'Purchased'),
+    ('TKT-00000204', 5086, 1171, 460, 168.36, 'Reserved'),
+    ('TKT-00000205', 5087, 1107, 234, 56.19, 'Purchased'),
+    ('TKT-00000206', 5087, 1107, 234, 56.19, 'Purchased'),
+    ('TKT-00000207', 5088, 1044, 146, 42.5, 'Purchased'),
+    ('TKT-00000208', 5088, 1044, 146, 42.5, 'Reserved'),
+    ('TKT-00000209', 5090, 1148, 133, 66.45, 'Purchased'),
+    ('TKT-00000210', 5090, 1148, 133, 66.45, 'Refunded'),
+    ('TKT-00000211', 5091, 1196, 358, 69.22, 'Purchased'),
+    ('TKT-00000212', 5091, 1196, 358, 69.22, 'Reserved'),
+    ('TKT-00000213', 5092, 1039, 369, 92.98, 'Reserved'),
+    ('TKT-00000214', 5092, 1039, 369, 92.98, 'Reserved'),
+    ('TKT-00000215', 5092, 1039, 369, 92.98, 'Purchased'),
+    ('TKT-00000216', 5092, 1039, 369, 92.98, 'Refunded'),
+    ('TKT-00000217', 5094, 1148, 265, 27.85, 'Reserved'),
+    ('TKT-00000218', 5094, 1148, 265, 27.85, 'Purchased'),
+    ('TKT-00000219', 5094, 1148, 265, 27.85, 'Purchased'),
+    ('TKT-00000220', 5094, 1148, 265, 27.85, 'Reserved'),
+    ('TKT-00000221', 5095, 1156, 185, 83.14, 'Refunded'),
+    ('TKT-00000222', 5095, 1156, 185, 83.14, 'Refunded'),
+    ('TKT-00000223', 5096, 1175, 301, 90.27, 'Reserved'),
+    ('TKT-00000224', 5096, 1175, 301, 90.27, 'Reserved'),
+    ('TKT-00000225', 5096, 1175, 301, 90.27, 'Purchased'),
+    ('TKT-00000226', 5096, 1175, 301, 90.27, 'Reserved'),
+    ('TKT-00000227', 5096, 1175, 301, 90.27, 'Reserved'),
+    ('TKT-00000228', 5097, 1148, 27, 152.64, 'Purchased'),
+    ('TKT-00000229', 5097, 1148, 27, 152.64, 'Purchased'),
+    ('TKT-00000230', 5098, 1164, 26, 103.03, 'Reserved'),
+    ('TKT-00000231', 5098, 1164, 26, 103.03, 'Reserved'),
+    ('TKT-00000232', 5098, 1164, 26, 103.03, 'Reserved'),
+    ('TKT-00000233', 5100, 1122, 40, 14.77, 'Purchased'),
+    ('TKT-00000234', 5100, 1122, 40, 14.77, 'Reserved'),
+    ('TKT-00000235', 5100, 1122, 40, 14.77, 'Reserved'),
+    ('TKT-00000236', 5102, 1158, 411, 109.58, 'Purchased'),
+    ('TKT-00000237', 5102, 1158, 411, 109.58, 'Refunded'),
+    ('TKT-00000238', 5102, 1158, 411, 109.58, 'Purchased'),
+    ('TKT-00000239', 5102, 1158, 411, 109.58, 'Refunded'),
+    ('TKT-00000240', 5103, 1140, 209, 24.33, 'Purchased'),
+    ('TKT-00000241', 5103, 1140, 209, 24.33, 'Reserved'),
+    ('TKT-00000242', 5103, 1140, 209, 24.33, 'Reserved'),
+    ('TKT-00000243', 5104, 1046, 280, 22.82, 'Refunded'),
+    ('TKT-00000244', 5104, 1046, 280, 22.82, 'Purchased'),
+    ('TKT-00000245', 5104, 1046, 280, 22.82, 'Refunded'),
+    ('TKT-00000246', 5104, 1046, 280, 22.82, 'Purchased'),
+    ('TKT-00000247', 5104, 1046, 280, 22.82, 'Refunded'),
+    ('TKT-00000248', 5105, 1002, 6, 61.02, 'Reserved'),
+    ('TKT-00000249', 5105, 1002, 6, 61.02, 'Purchased'),
+    ('TKT-00000250', 5106, 1090, 61, 72.53, 'Refunded'),
+    ('TKT-00000251', 5106, 1090, 61, 72.53, 'Refunded'),
+    ('TKT-00000252', 5106, 1090, 61, 72.53, 'Refunded'),
+    ('TKT-00000253', 5106, 1090, 61, 72.53, 'Refunded'),
+    ('TKT-00000254', 5106, 1090, 61, 72.53, 'Refunded'),
+    ('TKT-00000255', 5108, 1141, 108, 94.01, 'Reserved'),
+    ('TKT-00000256', 5108, 1141, 108, 94.01, 'Reserved'),
+    ('TKT-00000257', 5108, 1141, 108, 94.01, 'Refunded'),
+    ('TKT-00000258', 5108, 1141, 108, 94.01, 'Reserved'),
+    ('TKT-00000259', 5109, 1107, 209, 37.23, 'Purchased'),
+    ('TKT-00000260', 5109, 1107, 209, 37.23, 'Purchased'),
+    ('TKT-00000261', 5110, 1175, 450, 54.81, 'Reserved'),
+    ('TKT-00000262', 5110, 1175, 450, 54.81, 'Reserved'),
+    ('TKT-00000263', 5113, 1044, 280, 121.88, 'Reserved'),
+    ('TKT-00000264', 5113, 1044, 280, 121.88, 'Refunded'),
+    ('TKT-00000265', 5113, 1044, 280, 121.88, 'Purchased'),
+    ('TKT-00000266', 5113, 1044, 280, 121.88, 'Refunded'),
+    ('TKT-00000267', 5114, 1078, 388, 70.05, 'Refunded'),
+    ('TKT-00000268', 5114, 1078, 388, 70.05, 'Purchased'),
+    ('TKT-00000269', 5114, 1078, 388, 70.05, 'Purchased'),
+    ('TKT-00000270', 5115, 1040, 430, 81.44, 'Purchased'),
+    ('TKT-00000271', 5115, 1040, 430, 81.44, 'Refunded'),
+    ('TKT-00000272', 5115, 1040, 430, 81.44, 'Purchased'),
+    ('TKT-00000273', 5117, 1125, 3, 21.58, 'Purchased'),
+    ('TKT-00000274', 5117, 1125, 3, 21.58, 'Reserved'),
+    ('TKT-00000275', 5117, 1125, 3, 21.58, 'Reserved'),
+    ('TKT-00000276', 5117, 1125, 3, 21.58, 'Purchased'),
+    ('TKT-00000277', 5118, 1046, 476, 70.8, 'Purchased'),
+    ('TKT-00000278', 5118, 1046, 476, 70.8, 'Refunded'),
+    ('TKT-00000279', 5118, 1046, 476, 70.8, 'Refunded'),
+    ('TKT-00000280', 5118, 1046, 476, 70.8, 'Purchased'),
+    ('TKT-00000281', 5118, 1046, 476, 70.8, 'Purchased'),
+    ('TKT-00000282', 5119, 1160, 153, 309.64, 'Purchased'),
+    ('TKT-00000283', 5120, 1142, 299, 20.44, 'Reserved'),
+    ('TKT-00000284', 5120, 1142, 299, 20.44, 'Refunded'),
+    ('TKT-00000285', 5120, 1142, 299, 20.44, 'Reserved'),
+    ('TKT-00000286', 5120, 1142, 299, 20.44, 'Reserved'),
+    ('TKT-00000287', 5120, 1142, 299, 20.44, 'Refunded'),
+    ('TKT-00000288', 5121, 1037, 474, 44.49, 'Reserved'),
+    ('TKT-00000289', 5121, 1037, 474, 44.49, 'Purchased'),
+    ('TKT-00000290', 5121, 1037, 474, 44.49, 'Purchased'),
+    ('TKT-00000291', 5121, 1037, 474, 44.49, 'Refunded'),
+    ('TKT-00000292', 5121, 1037, 474, 44.49, 'Purchased'),
+    ('TKT-00000293', 5124, 1155, 40, 86.16, 'Reserved'),
+    ('TKT-00000294', 5124, 1155, 40, 86.16, 'Refunded'),
+    ('TKT-00000295', 5124, 1155, 40, 86.16, 'Refunded'),
+    ('TKT-00000296', 5124, 1155, 40, 86.16, 'Refunded'),
+    ('TKT-00000297', 5125, 1183, 273, 157.04, 'Reserved'),
+    ('TKT-00000298', 5125, 1183, 273, 157.04, 'Reserved'),
+    ('TKT-00000299', 5125, 1183, 273, 157.04, 'Reserved'),
+    ('TKT-00000300', 5126, 1108, 102, 217.3, 'Refunded'),
+    ('TKT-00000301', 5126, 1108, 102, 217.3, 'Refunded'),
+    ('TKT-00000302', 5127, 1171, 365, 133.71, 'Purchased'),
+    ('TKT-00000303', 5127, 1171, 365, 133.71, 'Purchased'),
+    ('TKT-00000304', 5128, 1010, 357, 121.6, 'Refunded'),
+    ('TKT-00000305', 5128, 1010, 357, 121.6, 'Purchased'),
+    ('TKT-00000306', 5129, 1148, 252, 55.35, 'Reserved'),
+    ('TKT-00000307', 5129, 1148, 252, 55.35, 'Purchased'),
+    ('TKT-00000308', 5129, 1148, 252, 55.35, 'Reserved'),
+    ('TKT-00000309', 5129, 1148, 252, 55.35, 'Refunded'),
+    ('TKT-00000310', 5129, 1148, 252, 55.35, 'Reserved'),
+    ('TKT-00000311', 5131, 1188, 414, 7.69, 'Refunded'),
+    ('TKT-00000312', 5131, 1188, 414, 7.69, 'Reserved'),
+    ('TKT-00000313', 5131, 1188, 414, 7.69, 'Refunded'),
+    ('TKT-00000314', 5131, 1188, 414, 7.69, 'Reserved'),
+    ('TKT-00000315', 5131, 1188, 414, 7.69, 'Purchased'),
+    ('TKT-00000316', 5134, 1146, 348, 101.14, 'Purchased'),
+    ('TKT-00000317', 5134, 1146, 348, 101.14, 'Purchased'),
+    ('TKT-00000318', 5135, 1185, 388, 238.32, 'Refunded'),
+    ('TKT-00000319', 5135, 1185, 388, 238.32, 'Reserved'),
+    ('TKT-00000320', 5137, 1172, 453, 82.48, 'Purchased'),
+    ('TKT-00000321', 5137, 1172, 453, 82.48, 'Reserved'),
+    ('TKT-00000322', 5137, 1172, 453, 82.48, 'Refunded'),
+    ('TKT-00000323', 5137, 1172, 453, 82.48, 'Refunded'),
+    ('TKT-00000324', 5137, 1172, 453, 82.48, 'Purchased'),
+    ('TKT-00000325', 5138, 1084, 374, 9.51, 'Refunded'),
+    ('TKT-00000326', 5138, 1084, 374, 9.51, 'Purchased'),
+    ('TKT-00000327', 5138, 1084, 374, 9.51, 'Reserved'),
+    ('TKT-00000328', 5138, 1084, 374, 9.51, 'Purchased'),
+    ('TKT-00000329', 5140, 1195, 352, 67.6, 'Refunded'),
+    ('TKT-00000330', 5140, 1195, 352, 67.6, 'Purchased'),
+    ('TKT-00000331', 5140, 1195, 352, 67.6, 'Reserved'),
+    ('TKT-00000332', 5140, 1195, 352, 67.6, 'Refunded'),
+    ('TKT-00000333', 5140, 1195, 352, 67.6, 'Refunded'),
+    ('TKT-00000334', 5143, 1150, 327, 49.69, 'Refunded'),
+    ('TKT-00000335', 5143, 1150, 327, 49.69, 'Reserved'),
+    ('TKT-00000336', 5143, 1150, 327, 49.69, 'Purchased'),
+    ('TKT-00000337', 5143, 1150, 327, 49.69, 'Purchased'),
+    ('TKT-00000338', 5143, 1150, 327, 49.69, 'Reserved'),
+    ('TKT-00000339', 5144, 1149, 221, 155.93, 'Refunded'),
+    ('TKT-00000340', 5144, 1149, 221, 155.93, 'Reserved'),
+    ('TKT-00000341', 5147, 1170, 357, 71.93, 'Refunded'),
+    ('TKT-00000342', 5147, 1170, 357, 71.93, 'Refunded'),
+    ('TKT-00000343', 5148, 1125, 467, 153.08, 'Purchased'),
+    ('TKT-00000344', 5148, 1125, 467, 153.08, 'Refunded'),
+    ('TKT-00000345', 5148, 1125, 467, 153.08, 'Refunded'),
+    ('TKT-00000346', 5149, 1199, 467, 15.27, 'Reserved'),
+    ('TKT-00000347', 5149, 1199, 467, 15.27, 'Reserved'),
+    ('TKT-00000348', 5149, 1199, 467, 15.27, 'Purchased'),
+    ('TKT-00000349', 5149, 1199, 467, 15.27, 'Refunded'),
+    ('TKT-00000350', 5150, 1141, 40, 8.29, 'Refunded'),
+    ('TKT-00000351', 5150, 1141, 40, 8.29, 'Refunded'),
+    ('TKT-00000352', 5150, 1141, 40, 8.29, 'Refunded'),
+    ('TKT-00000353', 5150, 1141, 40, 8.29, 'Reserved'),
+    ('TKT-00000354', 5151, 1048, 489, 128.72, 'Purchased'),
+    ('TKT-00000355', 5151, 1048, 489, 128.72, 'Reserved'),
+    ('TKT-00000356', 5154, 1046, 151, 165.4, 'Reserved'),
+    ('TKT-00000357', 5154, 1046, 151, 165.4, 'Purchased'),
+    ('TKT-00000358', 5154, 1046, 151, 165.4, 'Refunded'),
+    ('TKT-00000359', 5155, 1198, 449, 58.05, 'Refunded'),
+    ('TKT-00000360', 5155, 1198, 449, 58.05, 'Purchased'),
+    ('TKT-00000361', 5155, 1198, 449, 58.05, 'Reserved'),
+    ('TKT-00000362', 5157, 1127, 6, 246.18, 'Refunded'),
+    ('TKT-00000363', 5157, 1127, 6, 246.18, 'Reserved'),
+    ('TKT-00000364', 5158, 1135, 251, 85.98, 'Reserved'),
+    ('TKT-00000365', 5158, 1135, 251, 85.98, 'Purchased'),
+    ('TKT-00000366', 5158, 1135, 251, 85.98, 'Purchased'),
+    ('TKT-00000367', 5158, 1135, 251, 85.98, 'Purchased'),
+    ('TKT-00000368', 5161, 1040, 228, 172.46, 'Reserved'),
+    ('TKT-00000369', 5165, 1103, 265, 17.08, 'Purchased'),
+    ('TKT-00000370', 5165, 1103, 265, 17.08, 'Purchased'),
+    ('TKT-00000371', 5167, 1164, 190, 47.73, 'Purchased'),
+    ('TKT-00000372', 5167, 1164, 190, 47.73, 'Refunded'),
+    ('TKT-00000373', 5167, 1164, 190, 47.73, 'Purchased'),
+    ('TKT-00000374', 5167, 1164, 190, 47.73, 'Purchased'),
+    ('TKT-00000375', 5167, 1164, 190, 47.73, 'Refunded'),
+    ('TKT-00000376', 5170, 1150, 43, 442.64, 'Purchased'),
+    ('TKT-00000377', 5171, 1175, 301, 11.3, 'Reserved'),
+    ('TKT-00000378', 5171, 1175, 301, 11.3, 'Reserved'),
+    ('TKT-00000379', 5172, 1036, 418, 77.48, 'Refunded'),
+    ('TKT-00000380', 5172, 1036, 418, 77.48, 'Reserved'),
+    ('TKT-00000381', 5172, 1036, 418, 77.48, 'Reserved'),
+    ('TKT-00000382', 5172, 1036, 418, 77.48, 'Refunded'),
+    ('TKT-00000383', 5174, 1034, 326, 329.92, 'Refunded'),
+    ('TKT-00000384', 5175, 1108, 243, 467.43, 'Purchased'),
+    ('TKT-00000385', 5176, 1176, 453, 73.95, 'Refunded'),
+    ('TKT-00000386', 5176, 1176, 453, 73.95, 'Reserved'),
+    ('TKT-00000387', 5177, 1146, 25, 74.89, 'Reserved'),
+    ('TKT-00000388', 5177, 1146, 25, 74.89, 'Refunded'),
+    ('TKT-00000389', 5177, 1146, 25, 74.89, 'Refunded'),
+    ('TKT-00000390', 5177, 1146, 25, 74.89, 'Purchased'),
+    ('TKT-00000391', 5177, 1146, 25, 74.89, 'Refunded'),
+    ('TKT-00000392', 5178, 1062, 53, 105.36, 'Refunded'),
+    ('TKT-00000393', 5178, 1062, 53, 105.36, 'Purchased'),
+    ('TKT-00000394', 5178, 1062, 53, 105.36, 'Reserved'),
+    ('TKT-00000395', 5179, 1116, 326, 39.03, 'Purchased'),
+    ('TKT-00000396', 5179, 1116, 326, 39.03, 'Reserved'),
+    ('TKT-00000397', 5179, 1116, 326, 39.03, 'Purchased'),
+    ('TKT-00000398', 5179, 1116, 326, 39.03, 'Reserved'),
+    ('TKT-00000399', 5179, 1116, 326, 39.03, 'Refunded'),
+    ('TKT-00000400', 5180, 1173, 82, 175.72, 'Purchased'),
+    ('TKT-00000401', 5181, 1150, 302, 17.67, 'Reserved'),
+    ('TKT-00000402', 5181, 1150, 302, 17.67, 'Reserved'),
+    ('TKT-00000403', 5181, 1150, 302, 17.67, 'Reserved'),
+    ('TKT-00000404', 5181, 1150, 302, 17.67, 'Refunded'),
+    ('TKT-00000405', 5182, 1179, 107, 133.29, 'Purchased'),
+    ('TKT-00000406', 5182, 1179, 107, 133.29, 'Refunded'),
+    ('TKT-00000407', 5183, 1026, 402, 18.98, 'Refunded'),
+    ('TKT-00000408', 5183, 1026, 402, 18.98, 'Purchased'),
+    ('TKT-00000409', 5183, 1026, 402, 18.98, 'Purchased'),
+    ('TKT-00000410', 5183, 1026, 402, 18.98, 'Purchased'),
+    ('TKT-00000411', 5183, 1026, 402, 18.98, 'Reserved'),
+    ('TKT-00000412', 5185, 1142, 27, 89.91, 'Reserved'),
+    ('TKT-00000413', 5185, 1142, 27, 89.91, 'Refunded'),
+    ('TKT-00000414', 5185, 1142, 27, 89.91, 'Purchased'),
+    ('TKT-00000415', 5185, 1142, 27, 89.91, 'Purchased'),
+    ('TKT-00000416', 5186, 1142, 76, 476.19, 'Purchased'),
+    ('TKT-00000417', 5187, 1076, 365, 55.14, 'Reserved'),
+    ('TKT-00000418', 5187, 1076, 365, 55.14, 'Reserved'),
+    ('TKT-00000419', 5187, 1076, 365, 55.14, 'Reserved'),
+    ('TKT-00000420', 5187, 1076, 365, 55.14, 'Reserved'),
+    ('TKT-00000421', 5187, 1076, 365, 55.14, 'Refunded'),
+    ('TKT-00000422', 5189, 1047, 212, 197.88, 'Reserved'),
+    ('TKT-00000423', 5189, 1047, 212, 197.88, 'Reserved'),
+    ('TKT-00000424', 5190, 1017, 231, 13.29, 'Refunded'),
+    ('TKT-00000425', 5190, 1017, 231, 13.29, 'Reserved'),
+    ('TKT-00000426', 5190, 1017, 231, 13.29, 'Purchased'),
+    ('TKT-00000427', 5190, 1017, 231, 13.29, 'Purchased'),
+    ('TKT-00000428', 5190, 1017, 231, 13.29, 'Purchased'),
+    ('TKT-00000429', 5193, 1103, 299, 58.57, 'Refunded'),
+    ('TKT-00000430', 5193, 1103, 299, 58.57, 'Refunded'),
+    ('TKT-00000431', 5193, 1103, 299, 58.57, 'Refunded'),
+    ('TKT-00000432', 5193, 1103, 299, 58.57, 'Purchased'),
+    ('TKT-00000433', 5193, 1103, 299, 58.57, 'Reserved'),
+    ('TKT-00000434', 5195, 1042, 302, 17.23, 'Refunded'),
+    ('TKT-00000435', 5195, 1042, 302, 17.23, 'Purchased'),
+    ('TKT-00000436', 5195, 1042, 302, 17.23, 'Refunded'),
+    ('TKT-00000437', 5195, 1042, 302, 17.23, 'Refunded'),
+    ('TKT-00000438', 5198, 1105, 429, 24.11, 'Refunded'),
+    ('TKT-00000439', 5198, 1105, 429, 24.11, 'Reserved'),
+    ('TKT-00000440', 5198, 1105, 429, 24.11, 'Purchased'),
+    ('TKT-00000441', 5198, 1105, 429, 24.11, 'Reserved'),
+    ('TKT-00000442', 5198, 1105, 429, 24.11, 'Purchased'),
+    ('TKT-00000443', 5199, 1186, 157, 191.62, 'Refunded'),
+    ('TKT-00000444', 5199, 1186, 157, 191.62, 'Purchased'),
+    ('TKT-00000445', 5200, 1073, 98, 128.33, 'Refunded'),
+    ('TKT-00000446', 5200, 1073, 98, 128.33, 'Reserved'),
+    ('TKT-00000447', 5200, 1073, 98, 128.33, 'Purchased'),
+    ('TKT-00000448', 5201, 1090, 242, 64.02, 'Reserved'),
+    ('TKT-00000449', 5201, 1090, 242, 64.02, 'Reserved'),
+    ('TKT-00000450', 5202, 1018, 406, 128.8, 'Refunded'),
+    ('TKT-00000451', 5203, 1090, 273, 105.52, 'Refunded'),
+    ('TKT-00000452', 5203, 1090, 273, 105.52, 'Reserved'),
+    ('TKT-00000453', 5203, 1090, 273, 105.52, 'Refunded'),
+    ('TKT-00000454', 5203, 1090, 273, 105.52, 'Reserved'),
+    ('TKT-00000455', 5205, 1090, 450, 24.76, 'Reserved'),
+    ('TKT-00000456', 5205, 1090, 450, 24.76, 'Refunded'),
+    ('TKT-00000457', 5206, 1138, 317, 136.44, 'Purchased'),
+    ('TKT-00000458', 5206, 1138, 317, 136.44, 'Refunded'),
+    ('TKT-00000459', 5206, 1138, 317, 136.44, 'Purchased'),
+    ('TKT-00000460', 5207, 1135, 102, 66.93, 'Refunded'),
+    ('TKT-00000461', 5208, 1135, 193, 158.87, 'Refunded'),
+    ('TKT-00000462', 5208, 1135, 193, 158.87, 'Purchased'),
+    ('TKT-00000463', 5208, 1135, 193, 158.87, 'Refunded'),
+    ('TKT-00000464', 5209, 1182, 304, 48.91, 'Reserved'),
+    ('TKT-00000465', 5210, 1038, 228, 70.84, 'Reserved'),
+    ('TKT-00000466', 5210, 1038, 228, 70.84, 'Purchased'),
+    ('TKT-00000467', 5210, 1038, 228, 70.84, 'Purchased'),
+    ('TKT-00000468', 5210, 1038, 228, 70.84, 'Purchased'),
+    ('TKT-00000469', 5211, 1068, 252, 247.39, 'Purchased'),
+    ('TKT-00000470', 5211, 1068, 252, 247.39, 'Purchased'),
+    ('TKT-00000471', 5214, 1034, 231, 82.14, 'Reserved'),
+    ('TKT-00000472', 5214, 1034, 231, 82.14, 'Purchased'),
+    ('TKT-00000473', 5214, 1034, 231, 82.14, 'Refunded'),
+    ('TKT-00000474', 5214, 1034, 231, 82.14, 'Reserved'),
+    ('TKT-00000475', 5215, 1135, 3, 68.77, 'Refunded'),
+    ('TKT-00000476', 5215, 1135, 3, 68.77, 'Purchased'),
+    ('TKT-00000477', 5216, 1128, 299, 475.75, 'Purchased'),
+    ('TKT-00000478', 5218, 1108, 257, 356.69, 'Reserved'),
+    ('TKT-00000479', 5220, 1142, 150, 25.66, 'Reserved'),
+    ('TKT-00000480', 5220, 1142, 150, 25.66, 'Reserved'),
+    ('TKT-00000481', 5220, 1142, 150, 25.66, 'Reserved'),
+    ('TKT-00000482', 5220, 1142, 150, 25.66, 'Reserved'),
+    ('TKT-00000483', 5220, 1142, 150, 25.66, 'Refunded'),
+    ('TKT-00000484', 5222, 1127, 45, 156.44, 'Refunded'),
+    ('TKT-00000485', 5222, 1127, 45, 156.44, 'Reserved'),
+    ('TKT-00000486', 5224, 1018, 43, 52.41, 'Purchased'),
+    ('TKT-00000487', 5224, 1018, 43, 52.41, 'Reserved'),
+    ('TKT-00000488', 5224, 1018, 43, 52.41, 'Reserved'),
+    ('TKT-00000489', 5224, 1018, 43, 52.41, 'Refunded'),
+    ('TKT-00000490', 5225, 1111, 280, 35.3, 'Purchased'),
+    ('TKT-00000491', 5225, 1111, 280, 35.3, 'Purchased'),
+    ('TKT-00000492', 5225, 1111, 280, 35.3, 'Purchased'),
+    ('TKT-00000493', 5225, 1111, 280, 35.3, 'Refunded'),
+    ('TKT-00000494', 5225, 1111, 280, 35.3, 'Reserved'),
+    ('TKT-00000495', 5226, 1185, 475, 80.48, 'Purchased'),
+    ('TKT-00000496', 5226, 1185, 475, 80.48, 'Refunded'),
+    ('TKT-00000497', 5229, 1164, 285, 116.86, 'Purchased'),
+    ('TKT-00000498', 5229, 1164, 285, 116.86, 'Purchased'),
+    ('TKT-00000499', 5229, 1164, 285, 116.86, 'Refunded'),
+    ('TKT-00000500', 5229, 1164, 285, 116.86, 'Refunded'),
+    ('TKT-00000501', 5230, 1084, 109, 70.38, 'Reserved'),
+    ('TKT-00000502', 5230, 1084, 109, 70.38, 'Refunded'),
+    ('TKT-00000503', 5230, 1084, 109, 70.38, 'Refunded'),
+    ('TKT-00000504', 5231, 1053, 43, 63.39, 'Reserved'),
+    ('TKT-00000505', 5231, 1053, 43, 63.39, 'Refunded'),
+    ('TKT-00000506', 5231, 1053, 43, 63.39, 'Purchased'),
+    ('TKT-00000507', 5231, 1053, 43, 63.39, 'Purchased'),
+    ('TKT-00000508', 5232, 1104, 53, 30.19, 'Purchased'),
+    ('TKT-00000509', 5232, 1104, 53, 30.19, 'Purchased'),
+    ('TKT-00000510', 5232, 1104, 53, 30.19, 'Refunded'),
+    ('TKT-00000511', 5232, 1104, 53, 30.19, 'Refunded'),
+    ('TKT-00000512', 5233, 1024, 444, 73.0, 'Purchased'),
+    ('TKT-00000513', 5233, 1024, 444, 73.0, 'Reserved'),
+    ('TKT-00000514', 5233, 1024, 444, 73.0, 'Refunded'),
+    ('TKT-00000515', 5233, 1024, 444, 73.0, 'Purchased'),
+    ('TKT-00000516', 5235, 1113, 208, 68.78, 'Refunded'),
+    ('TKT-00000517', 5235, 1113, 208, 68.78, 'Purchased'),
+    ('TKT-00000518', 5235, 1113, 208, 68.78, 'Reserved'),
+    ('TKT-00000519', 5235, 1113, 208, 68.78, 'Reserved'),
+    ('TKT-00000520', 5236, 1010, 481, 99.2, 'Refunded'),
+    ('TKT-00000521', 5236, 1010, 481, 99.2, 'Purchased'),
+    ('TKT-00000522', 5236, 1010, 481, 99.2, 'Purchased'),
+    ('TKT-00000523', 5236, 1010, 481, 99.2, 'Purchased'),
+    ('TKT-00000524', 5236, 1010, 481, 99.2, 'Refunded'),
+    ('TKT-00000525', 5237, 1029, 320, 111.48, 'Refunded'),
+    ('TKT-00000526', 5237, 1029, 320, 111.48, 'Purchased'),
+    ('TKT-00000527', 5237, 1029, 320, 111.48, 'Reserved'),
+    ('TKT-00000528', 5237, 1029, 320, 111.48, 'Reserved'),
+    ('TKT-00000529', 5238, 1158, 215, 98.94, 'Reserved'),
+    ('TKT-00000530', 5238, 1158, 215, 98.94, 'Refunded'),
+    ('TKT-00000531', 5238, 1158, 215, 98.94, 'Refunded'),
+    ('TKT-00000532', 5238, 1158, 215, 98.94, 'Reserved'),
+    ('TKT-00000533', 5239, 1149, 467, 121.92, 'Refunded'),
+    ('TKT-00000534', 5239, 1149, 467, 121.92, 'Reserved'),
+    ('TKT-00000535', 5241, 1128, 270, 201.07, 'Reserved'),
+    ('TKT-00000536', 5242, 1179, 374, 21.93, 'Reserved'),
+    ('TKT-00000537', 5242, 1179, 374, 21.93, 'Purchased'),
+    ('TKT-00000538', 5242, 1179, 374, 21.93, 'Refunded'),
+    ('TKT-00000539', 5242, 1179, 374, 21.93, 'Purchased'),
+    ('TKT-00000540', 5242, 1179, 374, 21.93, 'Refunded'),
+    ('TKT-00000541', 5243, 1048, 325, 96.02, 'Purchased'),
+    ('TKT-00000542', 5243, 1048, 325, 96.02, 'Refunded'),
+    ('TKT-00000543', 5244, 1016, 201, 13.71, 'Purchased'),
+    ('TKT-00000544', 5244, 1016, 201, 13.71, 'Refunded'),
+    ('TKT-00000545', 5244, 1016, 201, 13.71, 'Refunded'),
+    ('TKT-00000546', 5244, 1016, 201, 13.71, 'Purchased'),
+    ('TKT-00000547', 5244, 1016, 201, 13.71, 'Refunded'),
+    ('TKT-00000548', 5246, 1142, 79, 172.97, 'Reserved'),
+    ('TKT-00000549', 5246, 1142, 79, 172.97, 'Purchased'),
+    ('TKT-00000550', 5247, 1183, 136, 63.34, 'Reserved'),
+    ('TKT-00000551', 5247, 1183, 136, 63.34, 'Refunded'),
+    ('TKT-00000552', 5248, 1141, 396, 59.45, 'Reserved'),
+    ('TKT-00000553', 5248, 1141, 396, 59.45, 'Purchased'),
+    ('TKT-00000554', 5248, 1141, 396, 59.45, 'Refunded'),
+    ('TKT-00000555', 5248, 1141, 396, 59.45, 'Refunded'),
+    ('TKT-00000556', 5248, 1141, 396, 59.45, 'Purchased'),
+    ('TKT-00000557', 5249, 1146, 222, 402.81, 'Purchased'),
+    ('TKT-00000558', 5250, 1022, 27, 97.6, 'Refunded'),
+    ('TKT-00000559', 5250, 1022, 27, 97.6, 'Reserved'),
+    ('TKT-00000560', 5250, 1022, 27, 97.6, 'Purchased'),
+    ('TKT-00000561', 5250, 1022, 27, 97.6, 'Purchased'),
+    ('TKT-00000562', 5251, 1138, 400, 203.41, 'Reserved'),
+    ('TKT-00000563', 5252, 1028, 150, 14.64, 'Refunded'),
+    ('TKT-00000564', 5252, 1028, 150, 14.64, 'Reserved'),
+    ('TKT-00000565', 5254, 1161, 154, 28.84, 'Reserved'),
+    ('TKT-00000566', 5254, 1161, 154, 28.84, 'Purchased'),
+    ('TKT-00000567', 5254, 1161, 154, 28.84, 'Reserved'),
+    ('TKT-00000568', 5254, 1161, 154, 28.84, 'Purchased'),
+    ('TKT-00000569', 5254, 1161, 154, 28.84, 'Purchased'),
+    ('TKT-00000570', 5255, 1090, 6, 10.78, 'Reserved'),
+    ('TKT-00000571', 5255, 1090, 6, 10.78, 'Reserved'),
+    ('TKT-00000572', 5255, 1090, 6, 10.78, 'Purchased'),
+    ('TKT-00000573', 5255, 1090, 6, 10.78, 'Reserved'),
+    ('TKT-00000574', 5255, 1090, 6, 10.78, 'Reserved'),
+    ('TKT-00000575', 5256, 1111, 162, 66.49, 'Reserved'),
+    ('TKT-00000576', 5256, 1111, 162, 66.49, 'Refunded'),
+    ('TKT-00000577', 5256, 1111, 162, 66.49, 'Purchased'),
+    ('TKT-00000578', 5256, 1111, 162, 66.49, 'Refunded'),
+    ('TKT-00000579', 5256, 1111, 162, 66.49, 'Reserved'),
+    ('TKT-00000580', 5258, 1185, 460, 76.1, 'Reserved'),
+    ('TKT-00000581', 5258, 1185, 460, 76.1, 'Reserved'),
+    ('TKT-00000582', 5258, 1185, 460, 76.1, 'Purchased'),
+    ('TKT-00000583', 5260, 1111, 243, 32.6, 'Purchased'),
+    ('TKT-00000584', 5260, 1111, 243, 32.6, 'Refunded'),
+    ('TKT-00000585', 5260, 1111, 243, 32.6, 'Purchased'),
+    ('TKT-00000586', 5260, 1111, 243, 32.6, 'Reserved'),
+    ('TKT-00000587', 5261, 1161, 420, 4.43, 'Reserved'),
+    ('TKT-00000588', 5261, 1161, 420, 4.43, 'Refunded'),
+    ('TKT-00000589', 5261, 1161, 420, 4.43, 'Refunded'),
+    ('TKT-00000590', 5261, 1161, 420, 4.43, 'Purchased'),
+    ('TKT-00000591', 5261, 1161, 420, 4.43, 'Purchased'),
+    ('TKT-00000592', 5262, 1094, 386, 72.08, 'Refunded'),
+    ('TKT-00000593', 5262, 1094, 386, 72.08, 'Reserved'),
+    ('TKT-00000594', 5262, 1094, 386, 72.08, 'Reserved'),
+    ('TKT-00000595', 5262, 1094, 386, 72.08, 'Reserved'),
+    ('TKT-00000596', 5263, 1183, 468, 55.8, 'Reserved'),
+    ('TKT-00000597', 5263, 1183, 468, 55.8, 'Purchased'),
+    ('TKT-00000598', 5263, 1183, 468, 55.8, 'Reserved'),
+    ('TKT-00000599', 5264, 1029, 189, 110.58, 'Purchased'),
+    ('TKT-00000600', 5264, 1029, 189, 110.58, 'Refunded'),
+    ('TKT-00000601', 5264, 1029, 189, 110.58, 'Reserved'),
+    ('TKT-00000602', 5264, 1029, 189, 110.58, 'Refunded'),
+    ('TKT-00000603', 5267, 1199, 411, 407.18, 'Purchased'),
+    ('TKT-00000604', 5268, 1171, 262, 460.35, 'Purchased'),
+    ('TKT-00000605', 5270, 1190, 470, 29.13, 'Reserved'),
+    ('TKT-00000606', 5270, 1190, 470, 29.13, 'Refunded'),
+    ('TKT-00000607', 5270, 1190, 470, 29.13, 'Purchased'),
+    ('TKT-00000608', 5270, 1190, 470, 29.13, 'Purchased'),
+    ('TKT-00000609', 5270, 1190, 470, 29.13, 'Refunded'),
+    ('TKT-00000610', 5271, 1082, 414, 117.47, 'Purchased'),
+    ('TKT-00000611', 5271, 1082, 414, 117.47, 'Reserved'),
+    ('TKT-00000612', 5271, 1082, 414, 117.47, 'Reserved'),
+    ('TKT-00000613', 5273, 1048, 221, 57.08, 'Reserved'),
+    ('TKT-00000614', 5273, 1048, 221, 57.08, 'Reserved'),
+    ('TKT-00000615', 5273, 1048, 221, 57.08, 'Refunded'),
+    ('TKT-00000616', 5273, 1048, 221, 57.08, 'Reserved'),
+    ('TKT-00000617', 5275, 1156, 154, 36.57, 'Purchased'),
+    ('TKT-00000618', 5275, 1156, 154, 36.57, 'Refunded'),
+    ('TKT-00000619', 5275, 1156, 154, 36.57, 'Reserved'),
+    ('TKT-00000620', 5275, 1156, 154, 36.57, 'Purchased'),
+    ('TKT-00000621', 5276, 1105, 44, 108.43, 'Purchased'),
+    ('TKT-00000622', 5276, 1105, 44, 108.43, 'Reserved'),
+    ('TKT-00000623', 5276, 1105, 44, 108.43, 'Purchased'),
+    ('TKT-00000624', 5276, 1105, 44, 108.43, 'Refunded'),
+    ('TKT-00000625', 5277, 1135, 276, 53.7, 'Purchased'),
+    ('TKT-00000626', 5277, 1135, 276, 53.7, 'Refunded'),
+    ('TKT-00000627', 5277, 1135, 276, 53.7, 'Refunded'),
+    ('TKT-00000628', 5277, 1135, 276, 53.7, 'Purchased'),
+    ('TKT-00000629', 5278, 1141, 78, 61.18, 'Refunded'),
+    ('TKT-00000630', 5278, 1141, 78, 61.18, 'Reserved'),
+    ('TKT-00000631', 5278, 1141, 78, 61.18, 'Purchased'),
+    ('TKT-00000632', 5278, 1141, 78, 61.18, 'Purchased'),
+    ('TKT-00000633', 5279, 1149, 234, 152.25, 'Purchased'),
+    ('TKT-00000634', 5279, 1149, 234, 152.25, 'Refunded'),
+    ('TKT-00000635', 5279, 1149, 234, 152.25, 'Refunded'),
+    ('TKT-00000636', 5283, 1157, 413, 10.0, 'Reserved'),
+    ('TKT-00000637', 5283, 1157, 413, 10.0, 'Refunded'),
+    ('TKT-00000638', 5283, 1157, 413, 10.0, 'Reserved'),
+    ('TKT-00000639', 5283, 1157, 413, 10.0, 'Purchased'),
+    ('TKT-00000640', 5283, 1157, 413, 10.0, 'Reserved'),
+    ('TKT-00000641', 5284, 1150, 369, 11.12, 'Reserved'),
+    ('TKT-00000642', 5284, 1150, 369, 11.12, 'Refunded'),
+    ('TKT-00000643', 5284, 1150, 369, 11.12, 'Purchased'),
+    ('TKT-00000644', 5284, 1150, 369, 11.12, 'Purchased'),
+    ('TKT-00000645', 5286, 1065, 299, 295.0, 'Refunded'),
+    ('TKT-00000646', 5287, 1175, 468, 130.19, 'Purchased'),
+    ('TKT-00000647', 5287, 1175, 468, 130.19, 'Refunded'),
+    ('TKT-00000648', 5287, 1175, 468, 130.19, 'Refunded'),
+    ('TKT-00000649', 5288, 1123, 197, 26.66, 'Refunded'),
+    ('TKT-00000650', 5288, 1123, 197, 26.66, 'Refunded'),
+    ('TKT-00000651', 5288, 1123, 197, 26.66, 'Reserved'),
+    ('TKT-00000652', 5288, 1123, 197, 26.66, 'Purchased'),
+    ('TKT-00000653', 5288, 1123, 197, 26.66, 'Reserved'),
+    ('TKT-00000654', 5289, 1160, 299, 7.69, 'Refunded'),
+    ('TKT-00000655', 5289, 1160, 299, 7.69, 'Refunded'),
+    ('TKT-00000656', 5289, 1160, 299, 7.69, 'Purchased'),
+    ('TKT-00000657', 5289, 1160, 299, 7.69, 'Reserved'),
+    ('TKT-00000658', 5289, 1160, 299, 7.69, 'Refunded'),
+    ('TKT-00000659', 5290, 1018, 476, 31.66, 'Reserved'),
+    ('TKT-00000660', 5290, 1018, 476, 31.66, 'Refunded'),
+    ('TKT-00000661', 5290, 1018, 476, 31.66, 'Purchased'),
+    ('TKT-00000662', 5292, 1056, 273, 243.07, 'Reserved'),
+    ('TKT-00000663', 5292, 1056, 273, 243.07, 'Refunded'),
+    ('TKT-00000664', 5293, 1043, 193, 396.7, 'Purchased'),
+    ('TKT-00000665', 5298, 1152, 162, 157.36, 'Purchased'),
+    ('TKT-00000666', 5298, 1152, 162, 157.36, 'Purchased'),
+    ('TKT-00000667', 5298, 1152, 162, 157.36, 'Refunded'),
+    ('TKT-00000668', 5299, 1078, 162, 157.99, 'Reserved'),
+    ('TKT-00000669', 5299, 1078, 162, 157.99, 'Refunded'),
+    ('TKT-00000670', 5300, 1023, 473, 93.51, 'Purchased'),
+    ('TKT-00000671', 5300, 1023, 473, 93.51, 'Purchased'),
+    ('TKT-00000672', 5300, 1023, 473, 93.51, 'Reserved'),
+    ('TKT-00000673', 5301, 1111, 475, 126.2, 'Purchased'),
+    ('TKT-00000674', 5301, 1111, 475, 126.2, 'Purchased'),
+    ('TKT-00000675', 5302, 1065, 311, 435.87, 'Reserved'),
+    ('TKT-00000676', 5303, 1066, 357, 336.82, 'Purchased'),
+    ('TKT-00000677', 5305, 1064, 327, 18.1, 'Refunded'),
+    ('TKT-00000678', 5305, 1064, 327, 18.1, 'Refunded'),
+    ('TKT-00000679', 5305, 1064, 327, 18.1, 'Refunded'),
+    ('TKT-00000680', 5305, 1064, 327, 18.1, 'Purchased'),
+    ('TKT-00000681', 5306, 1190, 445, 60.71, 'Refunded'),
+    ('TKT-00000682', 5306, 1190, 445, 60.71, 'Refunded'),
+    ('TKT-00000683', 5307, 1076, 252, 83.82, 'Reserved'),
+    ('TKT-00000684', 5307, 1076, 252, 83.82, 'Refunded'),
+    ('TKT-00000685', 5307, 1076, 252, 83.82, 'Reserved'),
+    ('TKT-00000686', 5307, 1076, 252, 83.82, 'Purchased'),
+    ('TKT-00000687', 5307, 1076, 252, 83.82, 'Purchased'),
+    ('TKT-00000688', 5309, 1141, 396, 78.63, 'Reserved'),
+    ('TKT-00000689', 5309, 1141, 396, 78.63, 'Reserved'),
+    ('TKT-00000690', 5309, 1141, 396, 78.63, 'Refunded'),
+    ('TKT-00000691', 5310, 1171, 430, 84.8, 'Purchased'),
+    ('TKT-00000692', 5310, 1171, 430, 84.8, 'Refunded'),
+    ('TKT-00000693', 5310, 1171, 430, 84.8, 'Purchased'),
+    ('TKT-00000694', 5311, 1017, 147, 36.12, 'Refunded'),
+    ('TKT-00000695', 5311, 1017, 147, 36.12, 'Reserved'),
+    ('TKT-00000696', 5312, 1165, 196, 45.49, 'Purchased'),
+    ('TKT-00000697', 5312, 1165, 196, 45.49, 'Refunded'),
+    ('TKT-00000698', 5312, 1165, 196, 45.49, 'Purchased'),
+    ('TKT-00000699', 5312, 1165, 196, 45.49, 'Refunded'),
+    ('TKT-00000700', 5312, 1165, 196, 45.49, 'Purchased'),
+    ('TKT-00000701', 5314, 1032, 53, 10.25, 'Purchased'),
+    ('TKT-00000702', 5314, 1032, 53, 10.25, 'Refunded'),
+    ('TKT-00000703', 5314, 1032, 53, 10.25, 'Refunded'),
+    ('TKT-00000704', 5314, 1032, 53, 10.25, 'Purchased'),
+    ('TKT-00000705', 5315, 1090, 76, 349.39, 'Reserved'),
+    ('TKT-00000706', 5316, 1049, 348, 147.31, 'Purchased'),
+    ('TKT-00000707', 5317, 1175, 268, 278.77, 'Purchased'),
+    ('TKT-00000708', 5318, 1138, 447, 39.47, 'Purchased'),
+    ('TKT-00000709', 5318, 1138, 447, 39.47, 'Refunded'),
+    ('TKT-00000710', 5318, 1138, 447, 39.47, 'Purchased'),
+    ('TKT-00000711', 5318, 1138, 447, 39.47, 'Reserved'),
+    ('TKT-00000712', 5319, 1034, 85, 43.58, 'Reserved'),
+    ('TKT-00000713', 5319, 1034, 85, 43.58, 'Refunded'),
+    ('TKT-00000714', 5319, 1034, 85, 43.58, 'Purchased'),
+    ('TKT-00000715', 5320, 1160, 406, 427.1, 'Refunded'),
+    ('TKT-00000716', 5321, 1196, 270, 110.3, 'Purchased'),
+    ('TKT-00000717', 5321, 1196, 270, 110.3, 'Refunded'),
+    ('TKT-00000718', 5321, 1196, 270, 110.3, 'Purchased'),
+    ('TKT-00000719', 5321, 1196, 270, 110.3, 'Reserved'),
+    ('TKT-00000720', 5322, 1084, 314, 17.57, 'Reserved'),
+    ('TKT-00000721', 5322, 1084, 314, 17.57, 'Refunded'),
+    ('TKT-00000722', 5322, 1084, 314, 17.57, 'Purchased'),
+    ('TKT-00000723', 5322, 1084, 314, 17.57, 'Purchased'),
+    ('TKT-00000724', 5323, 1150, 474, 241.72, 'Purchased'),
+    ('TKT-00000725', 5323, 1150, 474, 241.72, 'Reserved'),
+    ('TKT-00000726', 5324, 1124, 418, 459.0, 'Reserved'),
+    ('TKT-00000727', 5326, 1146, 490, 83.46, 'Refunded'),
+    ('TKT-00000728', 5326, 1146, 490, 83.46, 'Reserved'),
+    ('TKT-00000729', 5326, 1146, 490, 83.46, 'Purchased'),
+    ('TKT-00000730', 5326, 1146, 490, 83.46, 'Purchased'),
+    ('TKT-00000731', 5327, 1037, 9, 21.43, 'Refunded'),
+    ('TKT-00000732', 5327, 1037, 9, 21.43, 'Reserved'),
+    ('TKT-00000733', 5327, 1037, 9, 21.43, 'Purchased'),
+    ('TKT-00000734', 5327, 1037, 9, 21.43, 'Reserved'),
+    ('TKT-00000735', 5327, 1037, 9, 21.43, 'Purchased'),
+    ('TKT-00000736', 5330, 1122, 172, 19.12, 'Refunded'),
+    ('TKT-00000737', 5330, 1122, 172, 19.12, 'Purchased'),
+    ('TKT-00000738', 5330, 1122, 172, 19.12, 'Reserved'),
+    ('TKT-00000739', 5330, 1122, 172, 19.12, 'Refunded'),
+    ('TKT-00000740', 5331, 1076, 441, 346.7, 'Reserved'),
+    ('TKT-00000741', 5334, 1068, 326, 12.24, 'Refunded'),
+    ('TKT-00000742', 5334, 1068, 326, 12.24, 'Purchased'),
+    ('TKT-00000743', 5334, 1068, 326, 12.24, 'Reserved'),
+    ('TKT-00000744', 5336, 1128, 472, 90.47, 'Refunded'),
+    ('TKT-00000745', 5336, 1128, 472, 90.47, 'Reserved'),
+    ('TKT-00000746', 5336, 1128, 472, 90.47, 'Refunded'),
+    ('TKT-00000747', 5336, 1128, 472, 90.47, 'Refunded'),
+    ('TKT-00000748', 5336, 1128, 472, 90.47, 'Refunded'),
+    ('TKT-00000749', 5337, 1047, 265, 11.64, 'Purchased'),
+    ('TKT-00000750', 5337, 1047, 265, 11.64, 'Purchased'),
+    ('TKT-00000751', 5337, 1047, 265, 11.64, 'Refunded'),
+    ('TKT-00000752', 5337, 1047, 265, 11.64, 'Refunded'),
+    ('TKT-00000753', 5338, 1068, 57, 218.42, 'Refunded'),
+    ('TKT-00000754', 5339, 1024, 131, 173.5, 'Refunded'),
+    ('TKT-00000755', 5341, 1128, 242, 40.5, 'Reserved'),
+    ('TKT-00000756', 5343, 1120, 193, 80.68, 'Reserved'),
+    ('TKT-00000757', 5344, 1105, 329, 200.28, 'Purchased'),
+    ('TKT-00000758', 5345, 1038, 265, 205.32, 'Refunded'),
+    ('TKT-00000759', 5346, 1165, 133, 133.35, 'Reserved'),
+    ('TKT-00000760', 5348, 1157, 478, 11.51, 'Refunded'),
+    ('TKT-00000761', 5348, 1157, 478, 11.51, 'Refunded'),
+    ('TKT-00000762', 5348, 1157, 478, 11.51, 'Reserved'),
+    ('TKT-00000763', 5348, 1157, 478, 11.51, 'Purchased'),
+    ('TKT-00000764', 5348, 1157, 478, 11.51, 'Refunded'),
+    ('TKT-00000765', 5350, 1170, 153, 38.79, 'Purchased'),
+    ('TKT-00000766', 5350, 1170, 153, 38.79, 'Purchased'),
+    ('TKT-00000767', 5350, 1170, 153, 38.79, 'Reserved'),
+    ('TKT-00000768', 5353, 1075, 193, 46.43, 'Purchased'),
+    ('TKT-00000769', 5353, 1075, 193, 46.43, 'Purchased'),
+    ('TKT-00000770', 5353, 1075, 193, 46.43, 'Refunded'),
+    ('TKT-00000771', 5353, 1075, 193, 46.43, 'Reserved'),
+    ('TKT-00000772', 5354, 1059, 420, 29.76, 'Reserved'),
+    ('TKT-00000773', 5354, 1059, 420, 29.76, 'Purchased'),
+    ('TKT-00000774', 5354, 1059, 420, 29.76, 'Refunded'),
+    ('TKT-00000775', 5356, 1135, 465, 447.36, 'Refunded'),
+    ('TKT-00000776', 5357, 1150, 280, 125.92, 'Reserved'),
+    ('TKT-00000777', 5357, 1150, 280, 125.92, 'Reserved'),
+    ('TKT-00000778', 5357, 1150, 280, 125.92, 'Purchased'),
+    ('TKT-00000779', 5358, 1174, 208, 446.96, 'Reserved'),
+    ('TKT-00000780', 5359, 1012, 242, 222.69, 'Refunded'),
+    ('TKT-00000781', 5359, 1012, 242, 222.69, 'Purchased'),
+    ('TKT-00000782', 5361, 1148, 311, 42.97, 'Purchased'),
+    ('TKT-00000783', 5361, 1148, 311, 42.97, 'Refunded'),
+    ('TKT-00000784', 5361, 1148, 311, 42.97, 'Reserved'),
+    ('TKT-00000785', 5362, 1125, 40, 118.07, 'Reserved'),
+    ('TKT-00000786', 5362, 1125, 40, 118.07, 'Purchased'),
+    ('TKT-00000787', 5363, 1127, 377, 276.7, 'Reserved'),
+    ('TKT-00000788', 5364, 1037, 377, 36.38, 'Reserved'),
+    ('TKT-00000789', 5364, 1037, 377, 36.38, 'Reserved'),
+    ('TKT-00000790', 5364, 1037, 377, 36.38, 'Reserved'),
+    ('TKT-00000791', 5364, 1037, 377, 36.38, 'Refunded'),
+    ('TKT-00000792', 5364, 1037, 377, 36.38, 'Reserved'),
+    ('TKT-00000793', 5365, 1062, 322, 319.34, 'Reserved'),
+    ('TKT-00000794', 5366, 1113, 262, 22.51, 'Purchased'),
+    ('TKT-00000795', 5366, 1113, 262, 22.51, 'Reserved'),
+    ('TKT-00000796', 5366, 1113, 262, 22.51, 'Reserved'),
+    ('TKT-00000797', 5366, 1113, 262, 22.51, 'Purchased'),
+    ('TKT-00000798', 5366, 1113, 262, 22.51, 'Refunded'),
+    ('TKT-00000799', 5368, 1168, 254, 131.88, 'Purchased'),
+    ('TKT-00000800', 5368, 1168, 254, 131.88, 'Refunded'),
+    ('TKT-00000801', 5368, 1168, 254, 131.88, 'Refunded'),
+    ('TKT-00000802', 5369, 1152, 478, 479.8, 'Reserved'),
+    ('TKT-00000803', 5371, 1023, 369, 84.31, 'Purchased'),
+    ('TKT-00000804', 5371, 1023, 369, 84.31, 'Purchased'),
+    ('TKT-00000805', 5371, 1023, 369, 84.31, 'Purchased'),
+    ('TKT-00000806', 5371, 1023, 369, 84.31, 'Reserved'),
+    ('TKT-00000807', 5374, 1090, 246, 123.08, 'Refunded'),
+    ('TKT-00000808', 5374, 1090, 246, 123.08, 'Purchased'),
+    ('TKT-00000809', 5374, 1090, 246, 123.08, 'Reserved'),
+    ('TKT-00000810', 5375, 1026, 348, 108.56, 'Reserved'),
+    ('TKT-00000811', 5375, 1026, 348, 108.56, 'Purchased'),
+    ('TKT-00000812', 5375, 1026, 348, 108.56, 'Purchased'),
+    ('TKT-00000813', 5376, 1055, 164, 18.62, 'Refunded'),
+    ('TKT-00000814', 5376, 1055, 164, 18.62, 'Reserved'),
+    ('TKT-00000815', 5376, 1055, 164, 18.62, 'Reserved'),
+    ('TKT-00000816', 5376, 1055, 164, 18.62, 'Purchased'),
+    ('TKT-00000817', 5377, 1022, 3, 45.39, 'Reserved'),
+    ('TKT-00000818', 5377, 1022, 3, 45.39, 'Refunded'),
+    ('TKT-00000819', 5377, 1022, 3, 45.39, 'Reserved'),
+    ('TKT-00000820', 5377, 1022, 3, 45.39, 'Reserved'),
+    ('TKT-00000821', 5378, 1060, 259, 35.06, 'Reserved'),
+    ('TKT-00000822', 5378, 1060, 259, 35.06, 'Purchased'),
+    ('TKT-00000823', 5378, 1060, 259, 35.06, 'Reserved'),
+    ('TKT-00000824', 5378, 1060, 259, 35.06, 'Reserved'),
+    ('TKT-00000825', 5379, 1022, 463, 9.93, 'Purchased'),
+    ('TKT-00000826', 5379, 1022, 463, 9.93, 'Purchased'),
+    ('TKT-00000827', 5379, 1022, 463, 9.93, 'Refunded'),
+    ('TKT-00000828', 5379, 1022, 463, 9.93, 'Purchased'),
+    ('TKT-00000829', 5380, 1044, 276, 57.6, 'Purchased'),
+    ('TKT-00000830', 5380, 1044, 276, 57.6, 'Refunded'),
+    ('TKT-00000831', 5380, 1044, 276, 57.6, 'Refunded'),
+    ('TKT-00000832', 5381, 1038, 6, 111.68, 'Purchased'),
+    ('TKT-00000833', 5381, 1038, 6, 111.68, 'Purchased'),
+    ('TKT-00000834', 5381, 1038, 6, 111.68, 'Reserved'),
+    ('TKT-00000835', 5381, 1038, 6, 111.68, 'Refunded'),
+    ('TKT-00000836', 5382, 1090, 193, 44.36, 'Reserved'),
+    ('TKT-00000837', 5382, 1090, 193, 44.36, 'Refunded'),
+    ('TKT-00000838', 5383, 1106, 311, 419.64, 'Refunded'),
+    ('TKT-00000839', 5384, 1026, 109, 35.31, 'Refunded'),
+    ('TKT-00000840', 5384, 1026, 109, 35.31, 'Purchased'),
+    ('TKT-00000841', 5385, 1173, 131, 13.73, 'Refunded'),
+    ('TKT-00000842', 5385, 1173, 131, 13.73, 'Reserved'),
+    ('TKT-00000843', 5385, 1173, 131, 13.73, 'Refunded'),
+    ('TKT-00000844', 5385, 1173, 131, 13.73, 'Refunded'),
+    ('TKT-00000845', 5385, 1173, 131, 13.73, 'Reserved'),
+    ('TKT-00000846', 5387, 1054, 453, 49.55, 'Purchased'),
+    ('TKT-00000847', 5387, 1054, 453, 49.55, 'Reserved'),
+    ('TKT-00000848', 5387, 1054, 453, 49.55, 'Refunded'),
+    ('TKT-00000849', 5387, 1054, 453, 49.55, 'Purchased'),
+    ('TKT-00000850', 5388, 1105, 276, 95.22, 'Reserved'),
+    ('TKT-00000851', 5388, 1105, 276, 95.22, 'Reserved'),
+    ('TKT-00000852', 5388, 1105, 276, 95.22, 'Reserved'),
+    ('TKT-00000853', 5390, 1038, 196, 225.22, 'Purchased'),
+    ('TKT-00000854', 5390, 1038, 196, 225.22, 'Reserved'),
+    ('TKT-00000855', 5391, 1135, 215, 51.5, 'Reserved'),
+    ('TKT-00000856', 5391, 1135, 215, 51.5, 'Reserved'),
+    ('TKT-00000857', 5391, 1135, 215, 51.5, 'Purchased'),
+    ('TKT-00000858', 5391, 1135, 215, 51.5, 'Reserved'),
+    ('TKT-00000859', 5395, 1071, 453, 22.03, 'Purchased'),
+    ('TKT-00000860', 5395, 1071, 453, 22.03, 'Reserved'),
+    ('TKT-00000861', 5395, 1071, 453, 22.03, 'Refunded'),
+    ('TKT-00000862', 5395, 1071, 453, 22.03, 'Purchased'),
+    ('TKT-00000863', 5395, 1071, 453, 22.03, 'Purchased'),
+    ('TKT-00000864', 5397, 1172, 481, 199.16, 'Reserved'),
+    ('TKT-00000865', 5397, 1172, 481, 199.16, 'Purchased'),
+    ('TKT-00000866', 5398, 1039, 468, 92.57, 'Reserved'),
+    ('TKT-00000867', 5398, 1039, 468, 92.57, 'Reserved'),
+    ('TKT-00000868', 5398, 1039, 468, 92.57, 'Purchased'),
+    ('TKT-00000869', 5398, 1039, 468, 92.57, 'Purchased'),
+    ('TKT-00000870', 5399, 1034, 449, 117.92, 'Refunded'),
+    ('TKT-00000871', 5399, 1034, 449, 117.92, 'Reserved'),
+    ('TKT-00000872', 5399, 1034, 449, 117.92, 'Refunded'),
+    ('TKT-00000873', 5400, 1118, 44, 76.18, 'Refunded'),
+    ('TKT-00000874', 5400, 1118, 44, 76.18, 'Reserved'),
+    ('TKT-00000875', 5400, 1118, 44, 76.18, 'Refunded'),
+    ('TKT-00000876', 5400, 1118, 44, 76.18, 'Reserved'),
+    ('TKT-00000877', 5400, 1118, 44, 76.18, 'Refunded'),
+    ('TKT-00000878', 5401, 1024, 131, 331.71, 'Purchased'),
+    ('TKT-00000879', 5402, 1149, 460, 105.09, 'Refunded'),
+    ('TKT-00000880', 5402, 1149, 460, 105.09, 'Purchased'),
+    ('TKT-00000881', 5402, 1149, 460, 105.09, 'Purchased'),
+    ('TKT-00000882', 5403, 1103, 497, 190.11, 'Refunded'),
+    ('TKT-00000883', 5403, 1103, 497, 190.11, 'Refunded'),
+    ('TKT-00000884', 5404, 1144, 273, 94.27, 'Purchased'),
+    ('TKT-00000885', 5404, 1144, 273, 94.27, 'Refunded'),
+    ('TKT-00000886', 5404, 1144, 273, 94.27, 'Purchased'),
+    ('TKT-00000887', 5404, 1144, 273, 94.27, 'Reserved'),
+    ('TKT-00000888', 5405, 1104, 228, 164.81, 'Reserved'),
+    ('TKT-00000889', 5406, 1019, 414, 28.59, 'Refunded'),
+    ('TKT-00000890', 5406, 1019, 414, 28.59, 'Refunded'),
+    ('TKT-00000891', 5406, 1019, 414, 28.59, 'Reserved'),
+    ('TKT-00000892', 5407, 1140, 172, 141.28, 'Refunded'),
+    ('TKT-00000893', 5407, 1140, 172, 141.28, 'Purchased'),
+    ('TKT-00000894', 5409, 1066, 190, 119.2, 'Refunded'),
+    ('TKT-00000895', 5409, 1066, 190, 119.2, 'Refunded'),
+    ('TKT-00000896', 5409, 1066, 190, 119.2, 'Refunded'),
+    ('TKT-00000897', 5409, 1066, 190, 119.2, 'Purchased'),
+    ('TKT-00000898', 5410, 1056, 82, 77.49, 'Purchased'),
+    ('TKT-00000899', 5410, 1056, 82, 77.49, 'Purchased'),
+    ('TKT-00000900', 5410, 1056, 82, 77.49, 'Purchased'),
+    ('TKT-00000901', 5411, 1044, 414, 17.31, 'Purchased'),
+    ('TKT-00000902', 5411, 1044, 414, 17.31, 'Reserved'),
+    ('TKT-00000903', 5411, 1044, 414, 17.31, 'Purchased'),
+    ('TKT-00000904', 5411, 1044, 414, 17.31, 'Reserved'),
+    ('TKT-00000905', 5411, 1044, 414, 17.31, 'Reserved'),
+    ('TKT-00000906', 5413, 1170, 348, 66.39, 'Refunded'),
+    ('TKT-00000907', 5413, 1170, 348, 66.39, 'Reserved'),
+    ('TKT-00000908', 5414, 1071, 87, 164.02, 'Refunded'),
+    ('TKT-00000909', 5415, 1090, 27, 325.95, 'Reserved'),
+    ('TKT-00000910', 5416, 1150, 142, 294.47, 'Reserved'),
+    ('TKT-00000911', 5417, 1071, 109, 400.54, 'Refunded'),
+    ('TKT-00000912', 5419, 1160, 285, 65.85, 'Refunded'),
+    ('TKT-00000913', 5420, 1079, 76, 49.98, 'Purchased'),
+    ('TKT-00000914', 5420, 1079, 76, 49.98, 'Refunded'),
+    ('TKT-00000915', 5420, 1079, 76, 49.98, 'Purchased'),
+    ('TKT-00000916', 5420, 1079, 76, 49.98, 'Refunded'),
+    ('TKT-00000917', 5421, 1149, 480, 227.52, 'Reserved'),
+    ('TKT-00000918', 5422, 1002, 265, 104.86, 'Reserved'),
+    ('TKT-00000919', 5422, 1002, 265, 104.86, 'Refunded'),
+    ('TKT-00000920', 5422, 1002, 265, 104.86, 'Refunded'),
+    ('TKT-00000921', 5422, 1002, 265, 104.86, 'Purchased'),
+    ('TKT-00000922', 5423, 1127, 481, 191.11, 'Purchased'),
+    ('TKT-00000923', 5424, 1142, 15, 25.05, 'Refunded'),
+    ('TKT-00000924', 5424, 1142, 15, 25.05, 'Purchased'),
+    ('TKT-00000925', 5424, 1142, 15, 25.05, 'Reserved'),
+    ('TKT-00000926', 5429, 1161, 285, 86.52, 'Refunded'),
+    ('TKT-00000927', 5429, 1161, 285, 86.52, 'Refunded'),
+    ('TKT-00000928', 5429, 1161, 285, 86.52, 'Reserved'),
+    ('TKT-00000929', 5429, 1161, 285, 86.52, 'Purchased'),
+    ('TKT-00000930', 5430, 1063, 464, 224.04, 'Refunded'),
+    ('TKT-00000931', 5431, 1074, 164, 106.58, 'Purchased'),
+    ('TKT-00000932', 5431, 1074, 164, 106.58, 'Refunded'),
+    ('TKT-00000933', 5432, 1107, 267, 38.28, 'Purchased'),
+    ('TKT-00000934', 5432, 1107, 267, 38.28, 'Purchased'),
+    ('TKT-00000935', 5432, 1107, 267, 38.28, 'Refunded'),
+    ('TKT-00000936', 5432, 1107, 267, 38.28, 'Refunded'),
+    ('TKT-00000937', 5433, 1013, 352, 55.91, 'Refunded'),
+    ('TKT-00000938', 5433, 1013, 352, 55.91, 'Refunded'),
+    ('TKT-00000939', 5433, 1013, 352, 55.91, 'Purchased'),
+    ('TKT-00000940', 5433, 1013, 352, 55.91, 'Reserved'),
+    ('TKT-00000941', 5435, 1106, 53, 176.95, 'Purchased'),
+    ('TKT-00000942', 5436, 1053, 396, 174.22, 'Refunded'),
+    ('TKT-00000943', 5436, 1053, 396, 174.22, 'Refunded'),
+    ('TKT-00000944', 5437, 1001, 311, 34.32, 'Purchased'),
+    ('TKT-00000945', 5437, 1001, 311, 34.32, 'Refunded'),
+    ('TKT-00000946', 5437, 1001, 311, 34.32, 'Purchased'),
+    ('TKT-00000947', 5437, 1001, 311, 34.32, 'Refunded'),
+    ('TKT-00000948', 5437, 1001, 311, 34.32, 'Refunded'),
+    ('TKT-00000949', 5438, 1164, 481, 102.29, 'Reserved'),
+    ('TKT-00000950', 5438, 1164, 481, 102.29, 'Refunded'),
+    ('TKT-00000951', 5438, 1164, 481, 102.29, 'Reserved'),
+    ('TKT-00000952', 5439, 1066, 365, 105.46, 'Reserved'),
+    ('TKT-00000953', 5439, 1066, 365, 105.46, 'Refunded'),
+    ('TKT-00000954', 5439, 1066, 365, 105.46, 'Purchased'),
+    ('TKT-00000955', 5439, 1066, 365, 105.46, 'Purchased'),
+    ('TKT-00000956', 5440, 1023, 16, 142.79, 'Refunded'),
+    ('TKT-00000957', 5440, 1023, 16, 142.79, 'Refunded'),
+    ('TKT-00000958', 5440, 1023, 16, 142.79, 'Purchased'),
+    ('TKT-00000959', 5442, 1032, 3, 34.09, 'Refunded'),
+    ('TKT-00000960', 5442, 1032, 3, 34.09, 'Refunded'),
+    ('TKT-00000961', 5442, 1032, 3, 34.09, 'Purchased'),
+    ('TKT-00000962', 5442, 1032, 3, 34.09, 'Refunded'),
+    ('TKT-00000963', 5442, 1032, 3, 34.09, 'Purchased'),
+    ('TKT-00000964', 5443, 1160, 162, 164.69, 'Purchased'),
+    ('TKT-00000965', 5443, 1160, 162, 164.69, 'Refunded'),
+    ('TKT-00000966', 5443, 1160, 162, 164.69, 'Reserved'),
+    ('TKT-00000967', 5444, 1146, 142, 51.14, 'Purchased'),
+    ('TKT-00000968', 5444, 1146, 142, 51.14, 'Reserved'),
+    ('TKT-00000969', 5444, 1146, 142, 51.14, 'Refunded'),
+    ('TKT-00000970', 5445, 1168, 326, 142.86, 'Purchased'),
+    ('TKT-00000971', 5446, 1080, 43, 314.94, 'Refunded'),
+    ('TKT-00000972', 5449, 1112, 43, 234.52, 'Reserved'),
+    ('TKT-00000973', 5449, 1112, 43, 234.52, 'Reserved'),
+    ('TKT-00000974', 5450, 1181, 221, 210.8, 'Purchased'),
+    ('TKT-00000975', 5450, 1181, 221, 210.8, 'Purchased'),
+    ('TKT-00000976', 5453, 1179, 252, 54.5, 'Refunded'),
+    ('TKT-00000977', 5453, 1179, 252, 54.5, 'Refunded'),
+    ('TKT-00000978', 5454, 1084, 204, 362.59, 'Refunded'),
+    ('TKT-00000979', 5455, 1185, 162, 29.96, 'Purchased'),
+    ('TKT-00000980', 5455, 1185, 162, 29.96, 'Purchased'),
+    ('TKT-00000981', 5455, 1185, 162, 29.96, 'Reserved'),
+    ('TKT-00000982', 5455, 1185, 162, 29.96, 'Refunded'),
+    ('TKT-00000983', 5455, 1185, 162, 29.96, 'Refunded'),
+    ('TKT-00000984', 5456, 1164, 322, 322.03, 'Refunded'),
+    ('TKT-00000985', 5457, 1035, 57, 37.64, 'Purchased'),
+    ('TKT-00000986', 5457, 1035, 57, 37.64, 'Refunded'),
+    ('TKT-00000987', 5457, 1035, 57, 37.64, 'Refunded'),
+    ('TKT-00000988', 5460, 1182, 413, 52.54, 'Purchased'),
+    ('TKT-00000989', 5460, 1182, 413, 52.54, 'Reserved'),
+    ('TKT-00000990', 5460, 1182, 413, 52.54, 'Purchased'),
+    ('TKT-00000991', 5460, 1182, 413, 52.54, 'Reserved'),
+    ('TKT-00000992', 5460, 1182, 413, 52.54, 'Purchased'),
+    ('TKT-00000993', 5461, 1177, 470, 106.96, 'Purchased'),
+    ('TKT-00000994', 5461, 1177, 470, 106.96, 'Purchased'),
+    ('TKT-00000995', 5461, 1177, 470, 106.96, 'Purchased'),
+    ('TKT-00000996', 5461, 1177, 470, 106.96, 'Purchased'),
+    ('TKT-00000997', 5462, 1066, 340, 103.74, 'Reserved'),
+    ('TKT-00000998', 5462, 1066, 340, 103.74, 'Purchased'),
+    ('TKT-00000999', 5462, 1066, 340, 103.74, 'Refunded'),
+    ('TKT-00001000', 5463, 1133, 178, 91.39, 'Refunded'),
+    ('TKT-00001001', 5463, 1133, 178, 91.39, 'Purchased'),
+    ('TKT-00001002', 5463, 1133, 178, 91.39, 'Reserved'),
+    ('TKT-00001003', 5463, 1133, 178, 91.39, 'Reserved'),
+    ('TKT-00001004', 5464, 1082, 379, 31.29, 'Refunded'),
+    ('TKT-00001005', 5464, 1082, 379, 31.29, 'Purchased'),
+    ('TKT-00001006', 5464, 1082, 379, 31.29, 'Reserved'),
+    ('TKT-00001007', 5464, 1082, 379, 31.29, 'Purchased'),
+    ('TKT-00001008', 5464, 1082, 379, 31.29, 'Reserved'),
+    ('TKT-00001009', 5465, 1173, 463, 41.16, 'Purchased'),
+    ('TKT-00001010', 5465, 1173, 463, 41.16, 'Reserved'),
+    ('TKT-00001011', 5466, 1137, 467, 43.59, 'Refunded'),
+    ('TKT-00001012', 5466, 1137, 467, 43.59, 'Purchased'),
+    ('TKT-00001013', 5466, 1137, 467, 43.59, 'Reserved'),
+    ('TKT-00001014', 5467, 1179, 489, 15.89, 'Reserved'),
+    ('TKT-00001015', 5467, 1179, 489, 15.89, 'Purchased'),
+    ('TKT-00001016', 5467, 1179, 489, 15.89, 'Refunded'),
+    ('TKT-00001017', 5467, 1179, 489, 15.89, 'Refunded'),
+    ('TKT-00001018', 5467, 1179, 489, 15.89, 'Purchased'),
+    ('TKT-00001019', 5468, 1137, 470, 74.03, 'Refunded'),
+    ('TKT-00001020', 5468, 1137, 470, 74.03, 'Refunded'),
+    ('TKT-00001021', 5468, 1137, 470, 74.03, 'Refunded'),
+    ('TKT-00001022', 5468, 1137, 470, 74.03, 'Reserved'),
+    ('TKT-00001023', 5468, 1137, 470, 74.03, 'Refunded'),
+    ('TKT-00001024', 5469, 1048, 162, 143.71, 'Reserved'),
+    ('TKT-00001025', 5470, 1173, 196, 106.02, 'Reserved'),
+    ('TKT-00001026', 5470, 1173, 196, 106.02, 'Refunded'),
+    ('TKT-00001027', 5470, 1173, 196, 106.02, 'Reserved'),
+    ('TKT-00001028', 5470, 1173, 196, 106.02, 'Purchased'),
+    ('TKT-00001029', 5471, 1173, 262, 57.73, 'Purchased'),
+    ('TKT-00001030', 5471, 1173, 262, 57.73, 'Purchased'),
+    ('TKT-00001031', 5471, 1173, 262, 57.73, 'Refunded'),
+    ('TKT-00001032', 5472, 1047, 314, 99.66, 'Purchased'),
+    ('TKT-00001033', 5472, 1047, 314, 99.66, 'Refunded'),
+    ('TKT-00001034', 5472, 1047, 314, 99.66, 'Reserved'),
+    ('TKT-00001035', 5472, 1047, 314, 99.66, 'Refunded'),
+    ('TKT-00001036', 5472, 1047, 314, 99.66, 'Refunded'),
+    ('TKT-00001037', 5473, 1142, 153, 62.77, 'Refunded'),
+    ('TKT-00001038', 5473, 1142, 153, 62.77, 'Purchased'),
+    ('TKT-00001039', 5473, 1142, 153, 62.77, 'Purchased'),
+    ('TKT-00001040', 5478, 1157, 162, 416.35, 'Refunded'),
+    ('TKT-00001041', 5482, 1141, 420, 25.59, 'Purchased'),
+    ('TKT-00001042', 5483, 1142, 172, 209.76, 'Reserved'),
+    ('TKT-00001043', 5484, 1122, 475, 302.34, 'Purchased'),
+    ('TKT-00001044', 5485, 1124, 460, 213.76, 'Refunded'),
+    ('TKT-00001045', 5485, 1124, 460, 213.76, 'Reserved'),
+    ('TKT-00001046', 5486, 1135, 231, 36.96, 'Refunded'),
+    ('TKT-00001047', 5486, 1135, 231, 36.96, 'Refunded'),
+    ('TKT-00001048', 5491, 1175, 286, 42.79, 'Refunded'),
+    ('TKT-00001049', 5491, 1175, 286, 42.79, 'Purchased'),
+    ('TKT-00001050', 5491, 1175, 286, 42.79, 'Purchased'),
+    ('TKT-00001051', 5491, 1175, 286, 42.79, 'Reserved'),
+    ('TKT-00001052', 5491, 1175, 286, 42.79, 'Refunded'),
+    ('TKT-00001053', 5492, 1161, 472, 39.66, 'Refunded'),
+    ('TKT-00001054', 5492, 1161, 472, 39.66, 'Reserved'),
+    ('TKT-00001055', 5492, 1161, 472, 39.66, 'Purchased'),
+    ('TKT-00001056', 5492, 1161, 472, 39.66, 'Purchased'),
+    ('TKT-00001057', 5492, 1161, 472, 39.66, 'Purchased'),
+    ('TKT-00001058', 5494, 1134, 386, 85.21, 'Purchased'),
+    ('TKT-00001059', 5494, 1134, 386, 85.21, 'Reserved'),
+    ('TKT-00001060', 5494, 1134, 386, 85.21, 'Purchased'),
+    ('TKT-00001061', 5495, 1125, 201, 68.86, 'Reserved'),
+    ('TKT-00001062', 5495, 1125, 201, 68.86, 'Refunded'),
+    ('TKT-00001063', 5495, 1125, 201, 68.86, 'Purchased'),
+    ('TKT-00001064', 5495, 1125, 201, 68.86, 'Purchased'),
+    ('TKT-00001065', 5495, 1125, 201, 68.86, 'Purchased'),
+    ('TKT-00001066', 5497, 1047, 243, 38.7, 'Refunded'),
+    ('TKT-00001067', 5497, 1047, 243, 38.7, 'Refunded'),
+    ('TKT-00001068', 5497, 1047, 243, 38.7, 'Reserved'),
+    ('TKT-00001069', 5498, 1173, 212, 146.79, 'Reserved'),
+    ('TKT-00001070', 5498, 1173, 212, 146.79, 'Purchased'),
+    ('TKT-00001071', 5498, 1173, 212, 146.79, 'Purchased'),
+    ('TKT-00001072', 5499, 1097, 293, 215.25, 'Purchased'),
+    ('TKT-00001073', 5501, 1187, 265, 34.79, 'Purchased'),
+    ('TKT-00001074', 5501, 1187, 265, 34.79, 'Refunded'),
+    ('TKT-00001075', 5501, 1187, 265, 34.79, 'Reserved'),
+    ('TKT-00001076', 5501, 1187, 265, 34.79, 'Reserved'),
+    ('TKT-00001077', 5503, 1152, 270, 20.52, 'Purchased'),
+    ('TKT-00001078', 5503, 1152, 270, 20.52, 'Refunded'),
+    ('TKT-00001079', 5503, 1152, 270, 20.52, 'Purchased'),
+    ('TKT-00001080', 5503, 1152, 270, 20.52, 'Purchased'),
+    ('TKT-00001081', 5504, 1124, 150, 30.66, 'Refunded'),
+    ('TKT-00001082', 5504, 1124, 150, 30.66, 'Purchased'),
+    ('TKT-00001083', 5504, 1124, 150, 30.66, 'Reserved'),
+    ('TKT-00001084', 5504, 1124, 150, 30.66, 'Refunded'),
+    ('TKT-00001085', 5505, 1014, 315, 237.7, 'Purchased'),
+    ('TKT-00001086', 5506, 1125, 89, 310.53, 'Reserved'),
+    ('TKT-00001087', 5507, 1022, 151, 95.33, 'Reserved'),
+    ('TKT-00001088', 5507, 1022, 151, 95.33, 'Refunded'),
+    ('TKT-00001089', 5507, 1022, 151, 95.33, 'Refunded'),
+    ('TKT-00001090', 5509, 1014, 45, 116.32, 'Reserved'),
+    ('TKT-00001091', 5509, 1014, 45, 116.32, 'Purchased'),
+    ('TKT-00001092', 5510, 1057, 490, 146.65, 'Reserved'),
+    ('TKT-00001093', 5510, 1057, 490, 146.65, 'Refunded'),
+    ('TKT-00001094', 5511, 1085, 102, 57.82, 'Reserved'),
+    ('TKT-00001095', 5511, 1085, 102, 57.82, 'Purchased'),
+    ('TKT-00001096', 5512, 1045, 402, 85.75, 'Reserved'),
+    ('TKT-00001097', 5512, 1045, 402, 85.75, 'Refunded'),
+    ('TKT-00001098', 5512, 1045, 402, 85.75, 'Purchased'),
+    ('TKT-00001099', 5514, 1014, 71, 99.77, 'Purchased'),
+    ('TKT-00001100', 5514, 1014, 71, 99.77, 'Reserved'),
+    ('TKT-00001101', 5514, 1014, 71, 99.77, 'Refunded'),
+    ('TKT-00001102', 5514, 1014, 71, 99.77, 'Purchased'),
+    ('TKT-00001103', 5514, 1014, 71, 99.77, 'Refunded'),
+    ('TKT-00001104', 5516, 1141, 420, 61.49, 'Reserved'),
+    ('TKT-00001105', 5517, 1168, 82, 51.9, 'Refunded'),
+    ('TKT-00001106', 5517, 1168, 82, 51.9, 'Reserved'),
+    ('TKT-00001107', 5517, 1168, 82, 51.9, 'Purchased'),
+    ('TKT-00001108', 5517, 1168, 82, 51.9, 'Reserved'),
+    ('TKT-00001109', 5517, 1168, 82, 51.9, 'Purchased'),
+    ('TKT-00001110', 5518, 1077, 280, 25.96, 'Purchased'),
+    ('TKT-00001111', 5518, 1077, 280, 25.96, 'Reserved'),
+    ('TKT-00001112', 5518, 1077, 280, 25.96, 'Reserved'),
+    ('TKT-00001113', 5518, 1077, 280, 25.96, 'Reserved'),
+    ('TKT-00001114', 5519, 1142, 238, 46.23, 'Refunded'),
+    ('TKT-00001115', 5519, 1142, 238, 46.23, 'Purchased'),
+    ('TKT-00001116', 5519, 1142, 238, 46.23, 'Refunded'),
+    ('TKT-00001117', 5519, 1142, 238, 46.23, 'Purchased'),
+    ('TKT-00001118', 5519, 1142, 238, 46.23, 'Refunded'),
+    ('TKT-00001119', 5522, 1038, 189, 98.27, 'Purchased'),
+    ('TKT-00001120', 5522, 1038, 189, 98.27, 'Refunded'),
+    ('TKT-00001121', 5522, 1038, 189, 98.27, 'Reserved'),
+    ('TKT-00001122', 5522, 1038, 189, 98.27, 'Refunded'),
+    ('TKT-00001123', 5523, 1060, 201, 126.53, 'Refunded'),
+    ('TKT-00001124', 5523, 1060, 201, 126.53, 'Refunded'),
+    ('TKT-00001125', 5523, 1060, 201, 126.53, 'Refunded'),
+    ('TKT-00001126', 5524, 1056, 222, 12.64, 'Reserved'),
+    ('TKT-00001127', 5524, 1056, 222, 12.64, 'Purchased'),
+    ('TKT-00001128', 5524, 1056, 222, 12.64, 'Purchased'),
+    ('TKT-00001129', 5524, 1056, 222, 12.64, 'Purchased'),
+    ('TKT-00001130', 5524, 1056, 222, 12.64, 'Reserved'),
+    ('TKT-00001131', 5525, 1045, 61, 438.07, 'Reserved'),
+    ('TKT-00001132', 5527, 1073, 246, 91.44, 'Purchased'),
+    ('TKT-00001133', 5527, 1073, 246, 91.44, 'Reserved'),
+    ('TKT-00001134', 5527, 1073, 246, 91.44, 'Reserved'),
+    ('TKT-00001135', 5527, 1073, 246, 91.44, 'Refunded'),
+    ('TKT-00001136', 5528, 1019, 51, 68.85, 'Refunded'),
+    ('TKT-00001137', 5528, 1019, 51, 68.85, 'Reserved'),
+    ('TKT-00001138', 5528, 1019, 51, 68.85, 'Purchased'),
+    ('TKT-00001139', 5528, 1019, 51, 68.85, 'Reserved'),
+    ('TKT-00001140', 5528, 1019, 51, 68.85, 'Purchased'),
+    ('TKT-00001141', 5530, 1054, 286, 86.29, 'Reserved'),
+    ('TKT-00001142', 5530, 1054, 286, 86.29, 'Refunded'),
+    ('TKT-00001143', 5530, 1054, 286, 86.29, 'Refunded'),
+    ('TKT-00001144', 5530, 1054, 286, 86.29, 'Refunded'),
+    ('TKT-00001145', 5531, 1002, 154, 62.47, 'Refunded'),
+    ('TKT-00001146', 5531, 1002, 154, 62.47, 'Reserved'),
+    ('TKT-00001147', 5531, 1002, 154, 62.47, 'Reserved'),
+    ('TKT-00001148', 5532, 1175, 449, 40.62, 'Purchased'),
+    ('TKT-00001149', 5532, 1175, 449, 40.62, 'Refunded'),
+    ('TKT-00001150', 5532, 1175, 449, 40.62, 'Reserved'),
+    ('TKT-00001151', 5532, 1175, 449, 40.62, 'Reserved'),
+    ('TKT-00001152', 5532, 1175, 449, 40.62, 'Refunded'),
+    ('TKT-00001153', 5533, 1017, 234, 124.92, 'Reserved'),
+    ('TKT-00001154', 5533, 1017, 234, 124.92, 'Reserved'),
+    ('TKT-00001155', 5533, 1017, 234, 124.92, 'Refunded'),
+    ('TKT-00001156', 5533, 1017, 234, 124.92, 'Reserved'),
+    ('TKT-00001157', 5534, 1142, 396, 18.01, 'Refunded'),
+    ('TKT-00001158', 5534, 1142, 396, 18.01, 'Reserved'),
+    ('TKT-00001159', 5534, 1142, 396, 18.01, 'Refunded'),
+    ('TKT-00001160', 5534, 1142, 396, 18.01, 'Reserved'),
+    ('TKT-00001161', 5534, 1142, 396, 18.01, 'Purchased'),
+    ('TKT-00001162', 5535, 1028, 122, 191.6, 'Reserved'),
+    ('TKT-00001163', 5535, 1028, 122, 191.6, 'Refunded'),
+    ('TKT-00001164', 5537, 1195, 87, 88.18, 'Refunded'),
+    ('TKT-00001165', 5537, 1195, 87, 88.18, 'Refunded'),
+    ('TKT-00001166', 5537, 1195, 87, 88.18, 'Purchased'),
+    ('TKT-00001167', 5538, 1177, 386, 420.83, 'Refunded'),
+    ('TKT-00001168', 5539, 1118, 388, 133.06, 'Reserved'),
+    ('TKT-00001169', 5539, 1118, 388, 133.06, 'Refunded'),
+    ('TKT-00001170', 5539, 1118, 388, 133.06, 'Refunded'),
+    ('TKT-00001171', 5540, 1113, 53, 11.56, 'Reserved'),
+    ('TKT-00001172', 5540, 1113, 53, 11.56, 'Reserved'),
+    ('TKT-00001173', 5541, 1076, 82, 92.14, 'Purchased'),
+    ('TKT-00001174', 5541, 1076, 82, 92.14, 'Purchased'),
+    ('TKT-00001175', 5541, 1076, 82, 92.14, 'Reserved'),
+    ('TKT-00001176', 5541, 1076, 82, 92.14, 'Refunded'),
+    ('TKT-00001177', 5541, 1076, 82, 92.14, 'Refunded'),
+    ('TKT-00001178', 5543, 1199, 82, 151.59, 'Refunded'),
+    ('TKT-00001179', 5543, 1199, 82, 151.59, 'Refunded'),
+    ('TKT-00001180', 5545, 1186, 142, 367.01, 'Reserved'),
+    ('TKT-00001181', 5549, 1173, 424, 15.85, 'Refunded'),
+    ('TKT-00001182', 5549, 1173, 424, 15.85, 'Purchased'),
+    ('TKT-00001183', 5549, 1173, 424, 15.85, 'Refunded'),
+    ('TKT-00001184', 5550, 1033, 221, 150.67, 'Refunded'),
+    ('TKT-00001185', 5550, 1033, 221, 150.67, 'Purchased'),
+    ('TKT-00001186', 5550, 1033, 221, 150.67, 'Refunded'),
+    ('TKT-00001187', 5552, 1183, 251, 145.88, 'Refunded'),
+    ('TKT-00001188', 5553, 1146, 234, 53.87, 'Purchased'),
+    ('TKT-00001189', 5553, 1146, 234, 53.87, 'Purchased'),
+    ('TKT-00001190', 5553, 1146, 234, 53.87, 'Reserved'),
+    ('TKT-00001191', 5553, 1146, 234, 53.87, 'Refunded'),
+    ('TKT-00001192', 5554, 1018, 190, 370.69, 'Purchased'),
+    ('TKT-00001193', 5555, 1176, 396, 130.98, 'Refunded'),
+    ('TKT-00001194', 5557, 1198, 326, 55.2, 'Purchased'),
+    ('TKT-00001195', 5557, 1198, 326, 55.2, 'Refunded'),
+    ('TKT-00001196', 5557, 1198, 326, 55.2, 'Reserved'),
+    ('TKT-00001197', 5557, 1198, 326, 55.2, 'Purchased'),
+    ('TKT-00001198', 5558, 1097, 234, 134.66, 'Reserved'),
+    ('TKT-00001199', 5560, 1082, 142, 424.53, 'Refunded'),
+    ('TKT-00001200', 5561, 1144, 268, 102.2, 'Purchased'),
+    ('TKT-00001201', 5562, 1160, 6, 18.66, 'Refunded'),
+    ('TKT-00001202', 5562, 1160, 6, 18.66, 'Reserved'),
+    ('TKT-00001203', 5562, 1160, 6, 18.66, 'Reserved'),
+    ('TKT-00001204', 5562, 1160, 6, 18.66, 'Refunded'),
+    ('TKT-00001205', 5562, 1160, 6, 18.66, 'Purchased'),
+    ('TKT-00001206', 5564, 1120, 109, 274.2, 'Refunded'),
+    ('TKT-00001207', 5565, 1066, 473, 374.9, 'Purchased'),
+    ('TKT-00001208', 5566, 1053, 6, 124.02, 'Refunded'),
+    ('TKT-00001209', 5566, 1053, 6, 124.02, 'Purchased'),
+    ('TKT-00001210', 5566, 1053, 6, 124.02, 'Reserved'),
+    ('TKT-00001211', 5566, 1053, 6, 124.02, 'Refunded'),
+    ('TKT-00001212', 5567, 1115, 108, 47.06, 'Reserved'),
+    ('TKT-00001213', 5567, 1115, 108, 47.06, 'Refunded'),
+    ('TKT-00001214', 5567, 1115, 108, 47.06, 'Purchased'),
+    ('TKT-00001215', 5567, 1115, 108, 47.06, 'Reserved'),
+    ('TKT-00001216', 5569, 1198, 459, 11.44, 'Purchased'),
+    ('TKT-00001217', 5569, 1198, 459, 11.44, 'Purchased'),
+    ('TKT-00001218', 5569, 1198, 459, 11.44, 'Reserved'),
+    ('TKT-00001219', 5569, 1198, 459, 11.44, 'Reserved'),
+    ('TKT-00001220', 5569, 1198, 459, 11.44, 'Purchased'),
+    ('TKT-00001221', 5570, 1150, 98, 48.19, 'Reserved'),
+    ('TKT-00001222', 5570, 1150, 98, 48.19, 'Refunded'),
+    ('TKT-00001223', 5570, 1150, 98, 48.19, 'Refunded'),
+    ('TKT-00001224', 5570, 1150, 98, 48.19, 'Reserved'),
+    ('TKT-00001225', 5570, 1150, 98, 48.19, 'Refunded'),
+    ('TKT-00001226', 5571, 1172, 150, 102.31, 'Refunded'),
+    ('TKT-00001227', 5571, 1172, 150, 102.31, 'Refunded'),
+    ('TKT-00001228', 5571, 1172, 150, 102.31, 'Reserved'),
+    ('TKT-00001229', 5571, 1172, 150, 102.31, 'Refunded'),
+    ('TKT-00001230', 5572, 1084, 98, 438.28, 'Refunded'),
+    ('TKT-00001231', 5573, 1168, 325, 189.72, 'Refunded'),
+    ('TKT-00001232', 5573, 1168, 325, 189.72, 'Purchased'),
+    ('TKT-00001233', 5574, 1084, 162, 109.68, 'Purchased'),
+    ('TKT-00001234', 5574, 1084, 162, 109.68, 'Reserved'),
+    ('TKT-00001235', 5575, 1076, 424, 78.06, 'Purchased'),
+    ('TKT-00001236', 5575, 1076, 424, 78.06, 'Purchased'),
+    ('TKT-00001237', 5578, 1028, 196, 43.33, 'Refunded'),
+    ('TKT-00001238', 5578, 1028, 196, 43.33, 'Reserved'),
+    ('TKT-00001239', 5578, 1028, 196, 43.33, 'Reserved'),
+    ('TKT-00001240', 5578, 1028, 196, 43.33, 'Purchased'),
+    ('TKT-00001241', 5579, 1192, 424, 56.57, 'Refunded'),
+    ('TKT-00001242', 5579, 1192, 424, 56.57, 'Purchased'),
+    ('TKT-00001243', 5579, 1192, 424, 56.57, 'Refunded'),
+    ('TKT-00001244', 5579, 1192, 424, 56.57, 'Purchased'),
+    ('TKT-00001245', 5579, 1192, 424, 56.57, 'Refunded'),
+    ('TKT-00001246', 5580, 1069, 240, 51.14, 'Refunded'),
+    ('TKT-00001247', 5580, 1069, 240, 51.14, 'Purchased'),
+    ('TKT-00001248', 5581, 1108, 463, 57.33, 'Reserved'),
+    ('TKT-00001249', 5581, 1108, 463, 57.33, 'Purchased'),
+    ('TKT-00001250', 5581, 1108, 463, 57.33, 'Reserved'),
+    ('TKT-00001251', 5581, 1108, 463, 57.33, 'Refunded'),
+    ('TKT-00001252', 5582, 1097, 411, 85.08, 'Purchased'),
+    ('TKT-00001253', 5582, 1097, 411, 85.08, 'Purchased'),
+    ('TKT-00001254', 5582, 1097, 411, 85.08, 'Refunded'),
+    ('TKT-00001255', 5582, 1097, 411, 85.08, 'Reserved'),
+    ('TKT-00001256', 5583, 1120, 217, 166.88, 'Refunded'),
+    ('TKT-00001257', 5584, 1045, 7, 89.08, 'Reserved'),
+    ('TKT-00001258', 5584, 1045, 7, 89.08, 'Purchased'),
+    ('TKT-00001259', 5584, 1045, 7, 89.08, 'Reserved'),
+    ('TKT-00001260', 5584, 1045, 7, 89.08, 'Reserved'),
+    ('TKT-00001261', 5585, 1168, 109, 234.26, 'Reserved'),
+    ('TKT-00001262', 5585, 1168, 109, 234.26, 'Reserved'),
+    ('TKT-00001263', 5586, 1179, 414, 65.7, 'Purchased'),
+    ('TKT-00001264', 5586, 1179, 414, 65.7, 'Refunded'),
+    ('TKT-00001265', 5588, 1036, 76, 257.01, 'Refunded'),
+    ('TKT-00001266', 5589, 1029, 117, 12.54, 'Reserved'),
+    ('TKT-00001267', 5589, 1029, 117, 12.54, 'Purchased'),
+    ('TKT-00001268', 5589, 1029, 117, 12.54, 'Refunded'),
+    ('TKT-00001269', 5589, 1029, 117, 12.54, 'Refunded'),
+    ('TKT-00001270', 5590, 1192, 153, 107.08, 'Refunded'),
+    ('TKT-00001271', 5591, 1077, 121, 73.94, 'Refunded'),
+    ('TKT-00001272', 5591, 1077, 121, 73.94, 'Refunded'),
+    ('TKT-00001273', 5591, 1077, 121, 73.94, 'Reserved'),
+    ('TKT-00001274', 5592, 1074, 242, 70.54, 'Reserved'),
+    ('TKT-00001275', 5592, 1074, 242, 70.54, 'Refunded'),
+    ('TKT-00001276', 5592, 1074, 242, 70.54, 'Purchased'),
+    ('TKT-00001277', 5592, 1074, 242, 70.54, 'Purchased'),
+    ('TKT-00001278', 5592, 1074, 242, 70.54, 'Purchased'),
+    ('TKT-00001279', 5593, 1164, 329, 157.98, 'Refunded'),
+    ('TKT-00001280', 5593, 1164, 329, 157.98, 'Refunded'),
+    ('TKT-00001281', 5593, 1164, 329, 157.98, 'Refunded'),
+    ('TKT-00001282', 5597, 1186, 78, 153.52, 'Purchased'),
+    ('TKT-00001283', 5597, 1186, 78, 153.52, 'Refunded'),
+    ('TKT-00001284', 5605, 1104, 430, 23.28, 'Purchased'),
+    ('TKT-00001285', 5605, 1104, 430, 23.28, 'Reserved'),
+    ('TKT-00001286', 5605, 1104, 430, 23.28, 'Purchased'),
+    ('TKT-00001287', 5605, 1104, 430, 23.28, 'Purchased'),
+    ('TKT-00001288', 5606, 1183, 473, 278.47, 'Purchased'),
+    ('TKT-00001289', 5608, 1150, 98, 86.38, 'Refunded'),
+    ('TKT-00001290', 5608, 1150, 98, 86.38, 'Purchased'),
+    ('TKT-00001291', 5609, 1174, 489, 99.07, 'Reserved'),
+    ('TKT-00001292', 5611, 1199, 487, 136.6, 'Purchased'),
+    ('TKT-00001293', 5611, 1199, 487, 136.6, 'Reserved'),
+    ('TKT-00001294', 5611, 1199, 487, 136.6, 'Refunded'),
+    ('TKT-00001295', 5614, 1001, 348, 353.25, 'Refunded'),
+    ('TKT-00001296', 5615, 1164, 231, 130.36, 'Refunded'),
+    ('TKT-00001297', 5616, 1181, 418, 38.59, 'Purchased'),
+    ('TKT-00001298', 5616, 1181, 418, 38.59, 'Purchased'),
+    ('TKT-00001299', 5616, 1181, 418, 38.59, 'Reserved'),
+    ('TKT-00001300', 5616, 1181, 418, 38.59, 'Purchased'),
+    ('TKT-00001301', 5616, 1181, 418, 38.59, 'Reserved'),
+    ('TKT-00001302', 5617, 1137, 102, 136.58, 'Reserved'),
+    ('TKT-00001303', 5618, 1142, 285, 46.89, 'Refunded'),
+    ('TKT-00001304', 5618, 1142, 285, 46.89, 'Purchased'),
+    ('TKT-00001305', 5619, 1018, 276, 128.53, 'Reserved'),
+    ('TKT-00001306', 5620, 1090, 114, 372.18, 'Reserved'),
+    ('TKT-00001307', 5621, 1141, 268, 82.25, 'Reserved'),
+    ('TKT-00001308', 5621, 1141, 268, 82.25, 'Refunded'),
+    ('TKT-00001309', 5621, 1141, 268, 82.25, 'Reserved'),
+    ('TKT-00001310', 5622, 1115, 299, 81.21, 'Refunded'),
+    ('TKT-00001311', 5622, 1115, 299, 81.21, 'Refunded'),
+    ('TKT-00001312', 5622, 1115, 299, 81.21, 'Reserved'),
+    ('TKT-00001313', 5622, 1115, 299, 81.21, 'Purchased'),
+    ('TKT-00001314', 5623, 1179, 402, 227.18, 'Purchased'),
+    ('TKT-00001315', 5623, 1179, 402, 227.18, 'Refunded'),
+    ('TKT-00001316', 5624, 1135, 453, 157.19, 'Reserved'),
+    ('TKT-00001317', 5624, 1135, 453, 157.19, 'Refunded'),
+    ('TKT-00001318', 5625, 1057, 147, 215.14, 'Reserved'),
+    ('TKT-00001319', 5625, 1057, 147, 215.14, 'Purchased'),
+    ('TKT-00001320', 5626, 1160, 365, 80.94, 'Refunded'),
+    ('TKT-00001321', 5626, 1160, 365, 80.94, 'Reserved'),
+    ('TKT-00001322', 5626, 1160, 365, 80.94, 'Reserved'),
+    ('TKT-00001323', 5627, 1027, 265, 14.86, 'Purchased'),
+    ('TKT-00001324', 5627, 1027, 265, 14.86, 'Reserved'),
+    ('TKT-00001325', 5628, 1141, 43, 107.19, 'Refunded'),
+    ('TKT-00001326', 5628, 1141, 43, 107.19, 'Purchased'),
+    ('TKT-00001327', 5628, 1141, 43, 107.19, 'Reserved'),
+    ('TKT-00001328', 5628, 1141, 43, 107.19, 'Purchased'),
+    ('TKT-00001329', 5629, 1148, 273, 80.7, 'Purchased'),
+    ('TKT-00001330', 5629, 1148, 273, 80.7, 'Reserved'),
+    ('TKT-00001331', 5629, 1148, 273, 80.7, 'Refunded'),
+    ('TKT-00001332', 5629, 1148, 273, 80.7, 'Purchased'),
+    ('TKT-00001333', 5629, 1148, 273, 80.7, 'Refunded'),
+    ('TKT-00001334', 5630, 1022, 414, 58.44, 'Refunded'),
+    ('TKT-00001335', 5630, 1022, 414, 58.44, 'Reserved'),
+    ('TKT-00001336', 5630, 1022, 414, 58.44, 'Refunded'),
+    ('TKT-00001337', 5630, 1022, 414, 58.44, 'Refunded'),
+    ('TKT-00001338', 5631, 1035, 317, 26.75, 'Reserved'),
+    ('TKT-00001339', 5631, 1035, 317, 26.75, 'Reserved'),
+    ('TKT-00001340', 5631, 1035, 317, 26.75, 'Purchased'),
+    ('TKT-00001341', 5631, 1035, 317, 26.75, 'Refunded'),
+    ('TKT-00001342', 5633, 1185, 348, 57.53, 'Refunded'),
+    ('TKT-00001343', 5633, 1185, 348, 57.53, 'Purchased'),
+    ('TKT-00001344', 5633, 1185, 348, 57.53, 'Reserved'),
+    ('TKT-00001345', 5634, 1039, 322, 74.18, 'Purchased'),
+    ('TKT-00001346', 5634, 1039, 322, 74.18, 'Reserved'),
+    ('TKT-00001347', 5634, 1039, 322, 74.18, 'Reserved'),
+    ('TKT-00001348', 5634, 1039, 322, 74.18, 'Reserved'),
+    ('TKT-00001349', 5635, 1034, 9, 106.11, 'Reserved'),
+    ('TKT-00001350', 5635, 1034, 9, 106.11, 'Reserved'),
+    ('TKT-00001351', 5635, 1034, 9, 106.11, 'Purchased'),
+    ('TKT-00001352', 5636, 1037, 153, 49.25, 'Reserved'),
+    ('TKT-00001353', 5636, 1037, 153, 49.25, 'Purchased'),
+    ('TKT-00001354', 5636, 1037, 153, 49.25, 'Purchased'),
+    ('TKT-00001355', 5636, 1037, 153, 49.25, 'Purchased'),
+    ('TKT-00001356', 5638, 1003, 322, 161.91, 'Refunded'),
+    ('TKT-00001357', 5638, 1003, 322, 161.91, 'Refunded'),
+    ('TKT-00001358', 5638, 1003, 322, 161.91, 'Refunded'),
+    ('TKT-00001359', 5640, 1028, 473, 84.37, 'Refunded'),
+    ('TKT-00001360', 5640, 1028, 473, 84.37, 'Reserved'),
+    ('TKT-00001361', 5640, 1028, 473, 84.37, 'Reserved'),
+    ('TKT-00001362', 5640, 1028, 473, 84.37, 'Purchased'),
+    ('TKT-00001363', 5640, 1028, 473, 84.37, 'Purchased'),
+    ('TKT-00001364', 5642, 1028, 141, 265.95, 'Refunded'),
+    ('TKT-00001365', 5643, 1115, 396, 259.17, 'Refunded'),
+    ('TKT-00001366', 5644, 1076, 327, 113.39, 'Reserved'),
+    ('TKT-00001367', 5644, 1076, 327, 113.39, 'Refunded'),
+    ('TKT-00001368', 5644, 1076, 327, 113.39, 'Reserved'),
+    ('TKT-00001369', 5644, 1076, 327, 113.39, 'Reserved'),
+    ('TKT-00001370', 5645, 1150, 386, 282.1, 'Refunded'),
+    ('TKT-00001371', 5647, 1128, 251, 92.04, 'Reserved'),
+    ('TKT-00001372', 5647, 1128, 251, 92.04, 'Refunded'),
+    ('TKT-00001373', 5648, 1066, 122, 56.77, 'Refunded'),
+    ('TKT-00001374', 5648, 1066, 122, 56.77, 'Refunded'),
+    ('TKT-00001375', 5648, 1066, 122, 56.77, 'Purchased'),
+    ('TKT-00001376', 5648, 1066, 122, 56.77, 'Reserved'),
+    ('TKT-00001377', 5648, 1066, 122, 56.77, 'Refunded'),
+    ('TKT-00001378', 5649, 1128, 6, 47.25, 'Purchased'),
+    ('TKT-00001379', 5649, 1128, 6, 47.25, 'Refunded'),
+    ('TKT-00001380', 5649, 1128, 6, 47.25, 'Refunded'),
+    ('TKT-00001381', 5649, 1128, 6, 47.25, 'Purchased'),
+    ('TKT-00001382', 5649, 1128, 6, 47.25, 'Reserved'),
+    ('TKT-00001383', 5650, 1160, 221, 77.82, 'Reserved'),
+    ('TKT-00001384', 5652, 1148, 251, 48.67, 'Reserved'),
+    ('TKT-00001385', 5652, 1148, 251, 48.67, 'Refunded'),
+    ('TKT-00001386', 5652, 1148, 251, 48.67, 'Reserved'),
+    ('TKT-00001387', 5652, 1148, 251, 48.67, 'Purchased'),
+    ('TKT-00001388', 5653, 1148, 450, 146.8, 'Purchased'),
+    ('TKT-00001389', 5653, 1148, 450, 146.8, 'Purchased'),
+    ('TKT-00001390', 5654, 1150, 447, 49.05, 'Reserved'),
+    ('TKT-00001391', 5654, 1150, 447, 49.05, 'Reserved'),
+    ('TKT-00001392', 5654, 1150, 447, 49.05, 'Refunded'),
+    ('TKT-00001393', 5654, 1150, 447, 49.05, 'Purchased'),
+    ('TKT-00001394', 5654, 1150, 447, 49.05, 'Reserved'),
+    ('TKT-00001395', 5656, 1149, 87, 150.29, 'Purchased'),
+    ('TKT-00001396', 5658, 1170, 276, 140.04, 'Refunded'),
+    ('TKT-00001397', 5658, 1170, 276, 140.04, 'Purchased'),
+    ('TKT-00001398', 5660, 1063, 267, 444.68, 'Reserved'),
+    ('TKT-00001399', 5661, 1048, 276, 73.77, 'Purchased'),
+    ('TKT-00001400', 5661, 1048, 276, 73.77, 'Reserved'),
+    ('TKT-00001401', 5661, 1048, 276, 73.77, 'Refunded'),
+    ('TKT-00001402', 5662, 1173, 133, 78.46, 'Purchased'),
+    ('TKT-00001403', 5662, 1173, 133, 78.46, 'Refunded'),
+    ('TKT-00001404', 5662, 1173, 133, 78.46, 'Purchased'),
+    ('TKT-00001405', 5662, 1173, 133, 78.46, 'Purchased'),
+    ('TKT-00001406', 5662, 1173, 133, 78.46, 'Refunded'),
+    ('TKT-00001407', 5663, 1128, 222, 112.19, 'Purchased'),
+    ('TKT-00001408', 5663, 1128, 222, 112.19, 'Refunded'),
+    ('TKT-00001409', 5663, 1128, 222, 112.19, 'Reserved'),
+    ('TKT-00001410', 5665, 1028, 447, 110.93, 'Purchased'),
+    ('TKT-00001411', 5665, 1028, 447, 110.93, 'Refunded'),
+    ('TKT-00001412', 5665, 1028, 447, 110.93, 'Reserved'),
+    ('TKT-00001413', 5665, 1028, 447, 110.93, 'Reserved'),
+    ('TKT-00001414', 5667, 1060, 329, 45.22, 'Refunded'),
+    ('TKT-00001415', 5667, 1060, 329, 45.22, 'Refunded'),
+    ('TKT-00001416', 5667, 1060, 329, 45.22, 'Refunded'),
+    ('TKT-00001417', 5667, 1060, 329, 45.22, 'Refunded'),
+    ('TKT-00001418', 5667, 1060, 329, 45.22, 'Purchased'),
+    ('TKT-00001419', 5668, 1103, 26, 86.7, 'Reserved'),
+    ('TKT-00001420', 5668, 1103, 26, 86.7, 'Reserved'),
+    ('TKT-00001421', 5668, 1103, 26, 86.7, 'Refunded'),
+    ('TKT-00001422', 5668, 1103, 26, 86.7, 'Purchased'),
+    ('TKT-00001423', 5668, 1103, 26, 86.7, 'Reserved'),
+    ('TKT-00001424', 5669, 1069, 181, 41.6, 'Reserved'),
+    ('TKT-00001425', 5669, 1069, 181, 41.6, 'Reserved'),
+    ('TKT-00001426', 5669, 1069, 181, 41.6, 'Reserved'),
+    ('TKT-00001427', 5669, 1069, 181, 41.6, 'Purchased'),
+    ('TKT-00001428', 5670, 1137, 314, 104.24, 'Refunded'),
+    ('TKT-00001429', 5670, 1137, 314, 104.24, 'Purchased'),
+    ('TKT-00001430', 5670, 1137, 314, 104.24, 'Purchased'),
+    ('TKT-00001431', 5670, 1137, 314, 104.24, 'Purchased'),
+    ('TKT-00001432', 5671, 1112, 131, 92.98, 'Refunded'),
+    ('TKT-00001433', 5671, 1112, 131, 92.98, 'Reserved'),
+    ('TKT-00001434', 5671, 1112, 131, 92.98, 'Purchased'),
+    ('TKT-00001435', 5671, 1112, 131, 92.98, 'Refunded'),
+    ('TKT-00001436', 5672, 1155, 117, 88.26, 'Refunded'),
+    ('TKT-00001437', 5672, 1155, 117, 88.26, 'Refunded'),
+    ('TKT-00001438', 5672, 1155, 117, 88.26, 'Reserved'),
+    ('TKT-00001439', 5672, 1155, 117, 88.26, 'Refunded'),
+    ('TKT-00001440', 5672, 1155, 117, 88.26, 'Reserved'),
+    ('TKT-00001441', 5673, 1103, 423, 28.15, 'Purchased'),
+    ('TKT-00001442', 5674, 1023, 157, 80.0, 'Purchased'),
+    ('TKT-00001443', 5674, 1023, 157, 80.0, 'Purchased'),
+    ('TKT-00001444', 5674, 1023, 157, 80.0, 'Refunded'),
+    ('TKT-00001445', 5674, 1023, 157, 80.0, 'Refunded'),
+    ('TKT-00001446', 5675, 1022, 178, 108.04, 'Refunded'),
+    ('TKT-00001447', 5675, 1022, 178, 108.04, 'Purchased'),
+    ('TKT-00001448', 5675, 1022, 178, 108.04, 'Refunded'),
+    ('TKT-00001449', 5675, 1022, 178, 108.04, 'Refunded'),
+    ('TKT-00001450', 5677, 1108, 386, 14.3, 'Reserved'),
+    ('TKT-00001451', 5677, 1108, 386, 14.3, 'Reserved'),
+    ('TKT-00001452', 5677, 1108, 386, 14.3, 'Purchased'),
+    ('TKT-00001453', 5677, 1108, 386, 14.3, 'Reserved'),
+    ('TKT-00001454', 5677, 1108, 386, 14.3, 'Purchased'),
+    ('TKT-00001455', 5678, 1019, 40, 214.61, 'Purchased'),
+    ('TKT-00001456', 5679, 1142, 185, 388.89, 'Refunded'),
+    ('TKT-00001457', 5682, 1120, 234, 44.19, 'Purchased'),
+    ('TKT-00001458', 5682, 1120, 234, 44.19, 'Purchased'),
+    ('TKT-00001459', 5682, 1120, 234, 44.19, 'Reserved'),
+    ('TKT-00001460', 5682, 1120, 234, 44.19, 'Refunded'),
+    ('TKT-00001461', 5682, 1120, 234, 44.19, 'Refunded'),
+    ('TKT-00001462', 5683, 1182, 377, 24.28, 'Purchased'),
+    ('TKT-00001463', 5683, 1182, 377, 24.28, 'Reserved'),
+    ('TKT-00001464', 5683, 1182, 377, 24.28, 'Purchased'),
+    ('TKT-00001465', 5683, 1182, 377, 24.28, 'Refunded'),
+    ('TKT-00001466', 5684, 1089, 265, 157.84, 'Refunded'),
+    ('TKT-00001467', 5684, 1089, 265, 157.84, 'Purchased'),
+    ('TKT-00001468', 5685, 1023, 240, 34.82, 'Purchased'),
+    ('TKT-00001469', 5685, 1023, 240, 34.82, 'Purchased'),
+    ('TKT-00001470', 5685, 1023, 240, 34.82, 'Purchased'),
+    ('TKT-00001471', 5685, 1023, 240, 34.82, 'Reserved'),
+    ('TKT-00001472', 5686, 1056, 89, 221.58, 'Refunded'),
+    ('TKT-00001473', 5686, 1056, 89, 221.58, 'Refunded'),
+    ('TKT-00001474', 5687, 1118, 23, 21.4, 'Purchased'),
+    ('TKT-00001475', 5687, 1118, 23, 21.4, 'Purchased'),
+    ('TKT-00001476', 5687, 1118, 23, 21.4, 'Purchased'),
+    ('TKT-00001477', 5687, 1118, 23, 21.4, 'Reserved'),
+    ('TKT-00001478', 5687, 1118, 23, 21.4, 'Refunded'),
+    ('TKT-00001479', 5689, 1047, 76, 38.67, 'Purchased'),
+    ('TKT-00001480', 5689, 1047, 76, 38.67, 'Purchased'),
+    ('TKT-00001481', 5689, 1047, 76, 38.67, 'Reserved'),
+    ('TKT-00001482', 5689, 1047, 76, 38.67, 'Purchased'),
+    ('TKT-00001483', 5689, 1047, 76, 38.67, 'Reserved'),
+    ('TKT-00001484', 5690, 1099, 296, 124.82, 'Reserved'),
+    ('TKT-00001485', 5690, 1099, 296, 124.82, 'Reserved'),
+    ('TKT-00001486', 5691, 1177, 142, 135.78, 'Reserved'),
+    ('TKT-00001487', 5691, 1177, 142, 135.78, 'Reserved'),
+    ('TKT-00001488', 5696, 1135, 327, 78.96, 'Reserved'),
+    ('TKT-00001489', 5696, 1135, 327, 78.96, 'Purchased'),
+    ('TKT-00001490', 5696, 1135, 327, 78.96, 'Reserved'),
+    ('TKT-00001491', 5696, 1135, 327, 78.96, 'Purchased'),
+    ('TKT-00001492', 5696, 1135, 327, 78.96, 'Reserved'),
+    ('TKT-00001493', 5697, 1104, 352, 86.82, 'Refunded'),
+    ('TKT-00001494', 5697, 1104, 352, 86.82, 'Reserved'),
+    ('TKT-00001495', 5697, 1104, 352, 86.82, 'Reserved'),
+    ('TKT-00001496', 5698, 1044, 131, 39.63, 'Refunded'),
+    ('TKT-00001497', 5698, 1044, 131, 39.63, 'Purchased'),
+    ('TKT-00001498', 5698, 1044, 131, 39.63, 'Refunded'),
+    ('TKT-00001499', 5699, 1125, 23, 123.37, 'Purchased'),
+    ('TKT-00001500', 5700, 1054, 265, 135.93, 'Purchased'),
+    ('TKT-00001501', 5700, 1054, 265, 135.93, 'Purchased'),
+    ('TKT-00001502', 5701, 1168, 123, 69.49, 'Reserved'),
+    ('TKT-00001503', 5701, 1168, 123, 69.49, 'Reserved'),
+    ('TKT-00001504', 5701, 1168, 123, 69.49, 'Reserved'),
+    ('TKT-00001505', 5701, 1168, 123, 69.49, 'Reserved'),
+    ('TKT-00001506', 5701, 1168, 123, 69.49, 'Reserved'),
+    ('TKT-00001507', 5702, 1115, 388, 44.33, 'Purchased'),
+    ('TKT-00001508', 5702, 1115, 388, 44.33, 'Refunded'),
+    ('TKT-00001509', 5702, 1115, 388, 44.33, 'Reserved'),
+    ('TKT-00001510', 5702, 1115, 388, 44.33, 'Reserved'),
+    ('TKT-00001511', 5703, 1111, 204, 103.53, 'Reserved'),
+    ('TKT-00001512', 5703, 1111, 204, 103.53, 'Reserved'),
+    ('TKT-00001513', 5703, 1111, 204, 103.53, 'Refunded'),
+    ('TKT-00001514', 5703, 1111, 204, 103.53, 'Reserved'),
+    ('TKT-00001515', 5704, 1035, 451, 124.32, 'Purchased'),
+    ('TKT-00001516', 5704, 1035, 451, 124.32, 'Purchased'),
+    ('TKT-00001517', 5704, 1035, 451, 124.32, 'Refunded'),
+    ('TKT-00001518', 5705, 1045, 379, 27.11, 'Purchased'),
+    ('TKT-00001519', 5705, 1045, 379, 27.11, 'Reserved'),
+    ('TKT-00001520', 5705, 1045, 379, 27.11, 'Reserved'),
+    ('TKT-00001521', 5705, 1045, 379, 27.11, 'Purchased'),
+    ('TKT-00001522', 5706, 1062, 121, 55.8, 'Refunded'),
+    ('TKT-00001523', 5706, 1062, 121, 55.8, 'Reserved'),
+    ('TKT-00001524', 5706, 1062, 121, 55.8, 'Purchased'),
+    ('TKT-00001525', 5706, 1062, 121, 55.8, 'Refunded'),
+    ('TKT-00001526', 5706, 1062, 121, 55.8, 'Purchased'),
+    ('TKT-00001527', 5707, 1128, 14, 102.02, 'Refunded'),
+    ('TKT-00001528', 5708, 1067, 211, 166.58, 'Refunded'),
+    ('TKT-00001529', 5708, 1067, 211, 166.58, 'Purchased'),
+    ('TKT-00001530', 5708, 1067, 211, 166.58, 'Reserved'),
+    ('TKT-00001531', 5710, 1024, 468, 41.79, 'Refunded'),
+    ('TKT-00001532', 5710, 1024, 468, 41.79, 'Reserved'),
+    ('TKT-00001533', 5710, 1024, 468, 41.79, 'Reserved'),
+    ('TKT-00001534', 5710, 1024, 468, 41.79, 'Purchased'),
+    ('TKT-00001535', 5710, 1024, 468, 41.79, 'Refunded'),
+    ('TKT-00001536', 5711, 1074, 475, 163.88, 'Refunded'),
+    ('TKT-00001537', 5712, 1177, 413, 74.46, 'Reserved'),
+    ('TKT-00001538', 5712, 1177, 413, 74.46, 'Reserved'),
+    ('TKT-00001539', 5712, 1177, 413, 74.46, 'Purchased'),
+    ('TKT-00001540', 5712, 1177, 413, 74.46, 'Refunded'),
+    ('TKT-00001541', 5712, 1177, 413, 74.46, 'Refunded'),
+    ('TKT-00001542', 5713, 1142, 217, 44.62, 'Refunded'),
+    ('TKT-00001543', 5713, 1142, 217, 44.62, 'Reserved'),
+    ('TKT-00001544', 5713, 1142, 217, 44.62, 'Reserved'),
+    ('TKT-00001545', 5713, 1142, 217, 44.62, 'Reserved'),
+    ('TKT-00001546', 5714, 1161, 43, 116.6, 'Reserved'),
+    ('TKT-00001547', 5715, 1161, 153, 59.26, 'Purchased'),
+    ('TKT-00001548', 5715, 1161, 153, 59.26, 'Refunded'),
+    ('TKT-00001549', 5715, 1161, 153, 59.26, 'Purchased'),
+    ('TKT-00001550', 5715, 1161, 153, 59.26, 'Reserved'),
+    ('TKT-00001551', 5716, 1147, 238, 90.15, 'Refunded'),
+    ('TKT-00001552', 5716, 1147, 238, 90.15, 'Refunded'),
+    ('TKT-00001553', 5716, 1147, 238, 90.15, 'Reserved'),
+    ('TKT-00001554', 5717, 1146, 148, 84.57, 'Purchased'),
+    ('TKT-00001555', 5717, 1146, 148, 84.57, 'Reserved'),
+    ('TKT-00001556', 5717, 1146, 148, 84.57, 'Reserved'),
+    ('TKT-00001557', 5717, 1146, 148, 84.57, 'Reserved'),
+    ('TKT-00001558', 5719, 1085, 133, 15.36, 'Reserved'),
+    ('TKT-00001559', 5719, 1085, 133, 15.36, 'Reserved'),
+    ('TKT-00001560', 5719, 1085, 133, 15.36, 'Purchased'),
+    ('TKT-00001561', 5719, 1085, 133, 15.36, 'Purchased'),
+    ('TKT-00001562', 5720, 1062, 27, 101.34, 'Refunded'),
+    ('TKT-00001563', 5720, 1062, 27, 101.34, 'Reserved'),
+    ('TKT-00001564', 5720, 1062, 27, 101.34, 'Refunded'),
+    ('TKT-00001565', 5721, 1034, 14, 49.81, 'Purchased'),
+    ('TKT-00001566', 5722, 1174, 490, 95.13, 'Refunded'),
+    ('TKT-00001567', 5722, 1174, 490, 95.13, 'Purchased'),
+    ('TKT-00001568', 5722, 1174, 490, 95.13, 'Refunded'),
+    ('TKT-00001569', 5722, 1174, 490, 95.13, 'Refunded'),
+    ('TKT-00001570', 5722, 1174, 490, 95.13, 'Reserved'),
+    ('TKT-00001571', 5723, 1134, 480, 69.4, 'Reserved'),
+    ('TKT-00001572', 5723, 1134, 480, 69.4, 'Purchased'),
+    ('TKT-00001573', 5723, 1134, 480, 69.4, 'Purchased'),
+    ('TKT-00001574', 5723, 1134, 480, 69.4, 'Refunded'),
+    ('TKT-00001575', 5725, 1174, 27, 117.48, 'Purchased'),
+    ('TKT-00001576', 5725, 1174, 27, 117.48, 'Reserved'),
+    ('TKT-00001577', 5725, 1174, 27, 117.48, 'Purchased'),
+    ('TKT-00001578', 5725, 1174, 27, 117.48, 'Refunded'),
+    ('TKT-00001579', 5726, 1122, 26, 145.51, 'Reserved'),
+    ('TKT-00001580', 5726, 1122, 26, 145.51, 'Purchased'),
+    ('TKT-00001581', 5727, 1085, 142, 22.92, 'Purchased'),
+    ('TKT-00001582', 5727, 1085, 142, 22.92, 'Purchased'),
+    ('TKT-00001583', 5727, 1085, 142, 22.92, 'Reserved'),
+    ('TKT-00001584', 5727, 1085, 142, 22.92, 'Reserved'),
+    ('TKT-00001585', 5727, 1085, 142, 22.92, 'Refunded'),
+    ('TKT-00001586', 5729, 1029, 424, 67.58, 'Refunded'),
+    ('TKT-00001587', 5729, 1029, 424, 67.58, 'Refunded'),
+    ('TKT-00001588', 5729, 1029, 424, 67.58, 'Purchased'),
+    ('TKT-00001589', 5729, 1029, 424, 67.58, 'Purchased'),
+    ('TKT-00001590', 5729, 1029, 424, 67.58, 'Refunded'),
+    ('TKT-00001591', 5730, 1122, 133, 10.12, 'Reserved'),
+    ('TKT-00001592', 5730, 1122, 133, 10.12, 'Refunded'),
+    ('TKT-00001593', 5730, 1122, 133, 10.12, 'Refunded'),
+    ('TKT-00001594', 5730, 1122, 133, 10.12, 'Purchased'),
+    ('TKT-00001595', 5731, 1027, 123, 40.85, 'Purchased'),
+    ('TKT-00001596', 5731, 1027, 123, 40.85, 'Reserved'),
+    ('TKT-00001597', 5731, 1027, 123, 40.85, 'Reserved'),
+    ('TKT-00001598', 5731, 1027, 123, 40.85, 'Refunded'),
+    ('TKT-00001599', 5733, 1156, 43, 197.77, 'Reserved'),
+    ('TKT-00001600', 5733, 1156, 43, 197.77, 'Refunded'),
+    ('TKT-00001601', 5735, 1125, 62, 225.91, 'Refunded'),
+    ('TKT-00001602', 5735, 1125, 62, 225.91, 'Reserved'),
+    ('TKT-00001603', 5736, 1168, 82, 79.82, 'Purchased'),
+    ('TKT-00001604', 5738, 1148, 282, 34.65, 'Purchased'),
+    ('TKT-00001605', 5738, 1148, 282, 34.65, 'Refunded'),
+    ('TKT-00001606', 5738, 1148, 282, 34.65, 'Reserved'),
+    ('TKT-00001607', 5738, 1148, 282, 34.65, 'Purchased'),
+    ('TKT-00001608', 5740, 1186, 286, 111.62, 'Refunded'),
+    ('TKT-00001609', 5740, 1186, 286, 111.62, 'Refunded'),
+    ('TKT-00001610', 5740, 1186, 286, 111.62, 'Purchased'),
+    ('TKT-00001611', 5742, 1027, 238, 88.71, 'Reserved'),
+    ('TKT-00001612', 5742, 1027, 238, 88.71, 'Purchased'),
+    ('TKT-00001613', 5742, 1027, 238, 88.71, 'Purchased'),
+    ('TKT-00001614', 5742, 1027, 238, 88.71, 'Reserved'),
+    ('TKT-00001615', 5742, 1027, 238, 88.71, 'Reserved'),
+    ('TKT-00001616', 5744, 1081, 243, 76.03, 'Purchased'),
+    ('TKT-00001617', 5744, 1081, 243, 76.03, 'Refunded'),
+    ('TKT-00001618', 5744, 1081, 243, 76.03, 'Refunded'),
+    ('TKT-00001619', 5744, 1081, 243, 76.03, 'Reserved'),
+    ('TKT-00001620', 5745, 1107, 490, 51.38, 'Refunded'),
+    ('TKT-00001621', 5745, 1107, 490, 51.38, 'Purchased'),
+    ('TKT-00001622', 5747, 1128, 396, 6.29, 'Reserved'),
+    ('TKT-00001623', 5747, 1128, 396, 6.29, 'Refunded'),
+    ('TKT-00001624', 5747, 1128, 396, 6.29, 'Reserved'),
+    ('TKT-00001625', 5747, 1128, 396, 6.29, 'Reserved'),
+    ('TKT-00001626', 5747, 1128, 396, 6.29, 'Refunded'),
+    ('TKT-00001627', 5748, 1108, 156, 77.62, 'Reserved'),
+    ('TKT-00001628', 5748, 1108, 156, 77.62, 'Purchased'),
+    ('TKT-00001629', 5748, 1108, 156, 77.62, 'Refunded'),
+    ('TKT-00001630', 5748, 1108, 156, 77.62, 'Purchased'),
+    ('TKT-00001631', 5748, 1108, 156, 77.62, 'Refunded'),
+    ('TKT-00001632', 5751, 1014, 151, 391.19, 'Purchased'),
+    ('TKT-00001633', 5752, 1127, 354, 293.08, 'Refunded'),
+    ('TKT-00001634', 5754, 1168, 465, 54.49, 'Purchased'),
+    ('TKT-00001635', 5754, 1168, 465, 54.49, 'Reserved'),
+    ('TKT-00001636', 5754, 1168, 465, 54.49, 'Purchased'),
+    ('TKT-00001637', 5754, 1168, 465, 54.49, 'Purchased'),
+    ('TKT-00001638', 5755, 1053, 89, 72.24, 'Refunded'),
+    ('TKT-00001639', 5755, 1053, 89, 72.24, 'Purchased'),
+    ('TKT-00001640', 5756, 1165, 201, 29.4, 'Refunded'),
+    ('TKT-00001641', 5758, 1128, 156, 17.24, 'Purchased'),
+    ('TKT-00001642', 5758, 1128, 156, 17.24, 'Reserved'),
+    ('TKT-00001643', 5759, 1116, 296, 33.59, 'Reserved'),
+    ('TKT-00001644', 5759, 1116, 296, 33.59, 'Refunded'),
+    ('TKT-00001645', 5759, 1116, 296, 33.59, 'Reserved'),
+    ('TKT-00001646', 5762, 1141, 270, 16.88, 'Refunded'),
+    ('TKT-00001647', 5762, 1141, 270, 16.88, 'Purchased'),
+    ('TKT-00001648', 5762, 1141, 270, 16.88, 'Reserved'),
+    ('TKT-00001649', 5762, 1141, 270, 16.88, 'Refunded'),
+    ('TKT-00001650', 5765, 1170, 377, 49.24, 'Purchased'),
+    ('TKT-00001651', 5765, 1170, 377, 49.24, 'Refunded'),
+    ('TKT-00001652', 5765, 1170, 377, 49.24, 'Refunded'),
+    ('TKT-00001653', 5765, 1170, 377, 49.24, 'Reserved'),
+    ('TKT-00001654', 5765, 1170, 377, 49.24, 'Purchased'),
+    ('TKT-00001655', 5767, 1199, 480, 20.94, 'Purchased'),
+    ('TKT-00001656', 5767, 1199, 480, 20.94, 'Reserved'),
+    ('TKT-00001657', 5767, 1199, 480, 20.94, 'Refunded'),
+    ('TKT-00001658', 5767, 1199, 480, 20.94, 'Refunded'),
+    ('TKT-00001659', 5767, 1199, 480, 20.94, 'Refunded'),
+    ('TKT-00001660', 5771, 1066, 109, 23.49, 'Purchased'),
+    ('TKT-00001661', 5771, 1066, 109, 23.49, 'Refunded'),
+    ('TKT-00001662', 5771, 1066, 109, 23.49, 'Purchased'),
+    ('TKT-00001663', 5774, 1168, 329, 115.96, 'Purchased'),
+    ('TKT-00001664', 5774, 1168, 329, 115.96, 'Reserved'),
+    ('TKT-00001665', 5776, 1176, 185, 23.05, 'Purchased'),
+    ('TKT-00001666', 5779, 1165, 302, 89.8, 'Purchased'),
+    ('TKT-00001667', 5779, 1165, 302, 89.8, 'Reserved'),
+    ('TKT-00001668', 5780, 1164, 299, 239.42, 'Purchased'),
+    ('TKT-00001669', 5780, 1164, 299, 239.42, 'Purchased'),
+    ('TKT-00001670', 5781, 1164, 406, 131.81, 'Reserved'),
+    ('TKT-00001671', 5781, 1164, 406, 131.81, 'Reserved'),
+    ('TKT-00001672', 5781, 1164, 406, 131.81, 'Reserved'),
+    ('TKT-00001673', 5782, 1135, 242, 41.93, 'Refunded'),
+    ('TKT-00001674', 5782, 1135, 242, 41.93, 'Refunded'),
+    ('TKT-00001675', 5782, 1135, 242, 41.93, 'Reserved'),
+    ('TKT-00001676', 5783, 1199, 315, 195.66, 'Reserved'),
+    ('TKT-00001677', 5783, 1199, 315, 195.66, 'Purchased'),
+    ('TKT-00001678', 5784, 1135, 201, 97.46, 'Reserved'),
+    ('TKT-00001679', 5784, 1135, 201, 97.46, 'Purchased'),
+    ('TKT-00001680', 5784, 1135, 201, 97.46, 'Reserved'),
+    ('TKT-00001681', 5784, 1135, 201, 97.46, 'Reserved'),
+    ('TKT-00001682', 5784, 1135, 201, 97.46, 'Purchased'),
+    ('TKT-00001683', 5786, 1183, 467, 118.82, 'Reserved'),
+    ('TKT-00001684', 5786, 1183, 467, 118.82, 'Reserved'),
+    ('TKT-00001685', 5786, 1183, 467, 118.82, 'Reserved'),
+    ('TKT-00001686', 5786, 1183, 467, 118.82, 'Reserved'),
+    ('TKT-00001687', 5787, 1146, 98, 115.9, 'Refunded'),
+    ('TKT-00001688', 5787, 1146, 98, 115.9, 'Reserved'),
+    ('TKT-00001689', 5787, 1146, 98, 115.9, 'Purchased'),
+    ('TKT-00001690', 5787, 1146, 98, 115.9, 'Refunded'),
+    ('TKT-00001691', 5790, 1138, 489, 89.95, 'Reserved'),
+    ('TKT-00001692', 5790, 1138, 489, 89.95, 'Refunded'),
+    ('TKT-00001693', 5790, 1138, 489, 89.95, 'Purchased'),
+    ('TKT-00001694', 5791, 1158, 117, 89.8, 'Reserved'),
+    ('TKT-00001695', 5791, 1158, 117, 89.8, 'Reserved'),
+    ('TKT-00001696', 5792, 1025, 242, 66.16, 'Reserved'),
+    ('TKT-00001697', 5792, 1025, 242, 66.16, 'Reserved'),
+    ('TKT-00001698', 5793, 1019, 481, 106.6, 'Purchased'),
+    ('TKT-00001699', 5793, 1019, 481, 106.6, 'Reserved'),
+    ('TKT-00001700', 5793, 1019, 481, 106.6, 'Reserved'),
+    ('TKT-00001701', 5793, 1019, 481, 106.6, 'Purchased'),
+    ('TKT-00001702', 5794, 1111, 57, 6.38, 'Reserved'),
+    ('TKT-00001703', 5794, 1111, 57, 6.38, 'Refunded'),
+    ('TKT-00001704', 5794, 1111, 57, 6.38, 'Reserved'),
+    ('TKT-00001705', 5794, 1111, 57, 6.38, 'Reserved'),
+    ('TKT-00001706', 5794, 1111, 57, 6.38, 'Reserved'),
+    ('TKT-00001707', 5795, 1190, 123, 19.37, 'Reserved'),
+    ('TKT-00001708', 5795, 1190, 123, 19.37, 'Refunded'),
+    ('TKT-00001709', 5795, 1190, 123, 19.37, 'Reserved'),
+    ('TKT-00001710', 5795, 1190, 123, 19.37, 'Refunded'),
+    ('TKT-00001711', 5797, 1099, 240, 98.99, 'Purchased'),
+    ('TKT-00001712', 5797, 1099, 240, 98.99, 'Reserved'),
+    ('TKT-00001713', 5797, 1099, 240, 98.99, 'Reserved'),
+    ('TKT-00001714', 5797, 1099, 240, 98.99, 'Refunded'),
+    ('TKT-00001715', 5798, 1064, 465, 320.06, 'Purchased'),
+    ('TKT-00001716', 5799, 1186, 317, 54.12, 'Reserved'),
+    ('TKT-00001717', 5799, 1186, 317, 54.12, 'Reserved'),
+    ('TKT-00001718', 5799, 1186, 317, 54.12, 'Reserved'),
+    ('TKT-00001719', 5799, 1186, 317, 54.12, 'Purchased'),
+    ('TKT-00001720', 5799, 1186, 317, 54.12, 'Reserved'),
+    ('TKT-00001721', 5800, 1141, 148, 196.94, 'Purchased'),
+    ('TKT-00001722', 5800, 1141, 148, 196.94, 'Refunded'),
+    ('TKT-00001723', 5801, 1173, 35, 239.22, 'Reserved'),
+    ('TKT-00001724', 5801, 1173, 35, 239.22, 'Refunded'),
+    ('TKT-00001725', 5803, 1084, 282, 236.8, 'Purchased'),
+    ('TKT-00001726', 5803, 1084, 282, 236.8, 'Purchased'),
+    ('TKT-00001727', 5805, 1157, 212, 495.45, 'Purchased'),
+    ('TKT-00001728', 5806, 1150, 197, 103.66, 'Refunded'),
+    ('TKT-00001729', 5806, 1150, 197, 103.66, 'Reserved'),
+    ('TKT-00001730', 5807, 1066, 396, 16.55, 'Refunded'),
+    ('TKT-00001731', 5807, 1066, 396, 16.55, 'Purchased'),
+    ('TKT-00001732', 5807, 1066, 396, 16.55, 'Reserved'),
+    ('TKT-00001733', 5807, 1066, 396, 16.55, 'Refunded'),
+    ('TKT-00001734', 5807, 1066, 396, 16.55, 'Purchased'),
+    ('TKT-00001735', 5808, 1150, 284, 164.61, 'Reserved'),
+    ('TKT-00001736', 5808, 1150, 284, 164.61, 'Reserved'),
+    ('TKT-00001737', 5808, 1150, 284, 164.61, 'Reserved'),
+    ('TKT-00001738', 5811, 1035, 79, 64.23, 'Reserved'),
+    ('TKT-00001739', 5811, 1035, 79, 64.23, 'Purchased'),
+    ('TKT-00001740', 5812, 1038, 430, 7.05, 'Refunded'),
+    ('TKT-00001741', 5812, 1038, 430, 7.05, 'Refunded'),
+    ('TKT-00001742', 5812, 1038, 430, 7.05, 'Reserved'),
+    ('TKT-00001743', 5812, 1038, 430, 7.05, 'Reserved'),
+    ('TKT-00001744', 5812, 1038, 430, 7.05, 'Refunded'),
+    ('TKT-00001745', 5815, 1002, 444, 21.93, 'Purchased'),
+    ('TKT-00001746', 5815, 1002, 444, 21.93, 'Refunded'),
+    ('TKT-00001747', 5815, 1002, 444, 21.93, 'Purchased'),
+    ('TKT-00001748', 5815, 1002, 444, 21.93, 'Purchased'),
+    ('TKT-00001749', 5820, 1064, 211, 43.5, 'Purchased'),
+    ('TKT-00001750', 5820, 1064, 211, 43.5, 'Purchased'),
+    ('TKT-00001751', 5820, 1064, 211, 43.5, 'Purchased'),
+    ('TKT-00001752', 5820, 1064, 211, 43.5, 'Purchased'),
+    ('TKT-00001753', 5821, 1150, 193, 108.62, 'Refunded'),
+    ('TKT-00001754', 5821, 1150, 193, 108.62, 'Refunded'),
+    ('TKT-00001755', 5821, 1150, 193, 108.62, 'Refunded'),
+    ('TKT-00001756', 5822, 1068, 379, 52.23, 'Reserved'),
+    ('TKT-00001757', 5822, 1068, 379, 52.23, 'Reserved'),
+    ('TKT-00001758', 5822, 1068, 379, 52.23, 'Reserved'),
+    ('TKT-00001759', 5822, 1068, 379, 52.23, 'Reserved'),
+    ('TKT-00001760', 5824, 1176, 364, 75.94, 'Refunded'),
+    ('TKT-00001761', 5824, 1176, 364, 75.94, 'Purchased'),
+    ('TKT-00001762', 5824, 1176, 364, 75.94, 'Refunded'),
+    ('TKT-00001763', 5824, 1176, 364, 75.94, 'Reserved'),
+    ('TKT-00001764', 5827, 1042, 475, 75.74, 'Reserved'),
+    ('TKT-00001765', 5827, 1042, 475, 75.74, 'Refunded'),
+    ('TKT-00001766', 5827, 1042, 475, 75.74, 'Purchased'),
+    ('TKT-00001767', 5828, 1142, 7, 15.22, 'Purchased'),
+    ('TKT-00001768', 5828, 1142, 7, 15.22, 'Purchased'),
+    ('TKT-00001769', 5828, 1142, 7, 15.22, 'Purchased'),
+    ('TKT-00001770', 5829, 1148, 251, 71.81, 'Purchased'),
+    ('TKT-00001771', 5829, 1148, 251, 71.81, 'Refunded'),
+    ('TKT-00001772', 5829, 1148, 251, 71.81, 'Refunded'),
+    ('TKT-00001773', 5829, 1148, 251, 71.81, 'Reserved'),
+    ('TKT-00001774', 5829, 1148, 251, 71.81, 'Purchased'),
+    ('TKT-00001775', 5830, 1089, 142, 72.4, 'Reserved'),
+    ('TKT-00001776', 5830, 1089, 142, 72.4, 'Refunded'),
+    ('TKT-00001777', 5830, 1089, 142, 72.4, 'Refunded'),
+    ('TKT-00001778', 5830, 1089, 142, 72.4, 'Refunded'),
+    ('TKT-00001779', 5831, 1058, 329, 178.4, 'Reserved'),
+    ('TKT-00001780', 5833, 1160, 123, 67.42, 'Refunded'),
+    ('TKT-00001781', 5833, 1160, 123, 67.42, 'Reserved'),
+    ('TKT-00001782', 5834, 1027, 109, 59.56, 'Purchased'),
+    ('TKT-00001783', 5834, 1027, 109, 59.56, 'Refunded'),
+    ('TKT-00001784', 5835, 1150, 322, 150.25, 'Refunded'),
+    ('TKT-00001785', 5835, 1150, 322, 150.25, 'Refunded'),
+    ('TKT-00001786', 5835, 1150, 322, 150.25, 'Purchased'),
+    ('TKT-00001787', 5836, 1108, 460, 38.1, 'Purchased'),
+    ('TKT-00001788', 5836, 1108, 460, 38.1, 'Reserved'),
+    ('TKT-00001789', 5836, 1108, 460, 38.1, 'Refunded'),
+    ('TKT-00001790', 5837, 1108, 76, 25.36, 'Refunded'),
+    ('TKT-00001791', 5837, 1108, 76, 25.36, 'Reserved'),
+    ('TKT-00001792', 5839, 1022, 71, 12.16, 'Reserved'),
+    ('TKT-00001793', 5839, 1022, 71, 12.16, 'Reserved'),
+    ('TKT-00001794', 5839, 1022, 71, 12.16, 'Refunded'),
+    ('TKT-00001795', 5839, 1022, 71, 12.16, 'Refunded'),
+    ('TKT-00001796', 5840, 1120, 166, 56.43, 'Purchased'),
+    ('TKT-00001797', 5840, 1120, 166, 56.43, 'Purchased'),
+    ('TKT-00001798', 5840, 1120, 166, 56.43, 'Reserved'),
+    ('TKT-00001799', 5842, 1146, 62, 33.68, 'Purchased'),
+    ('TKT-00001800', 5842, 1146, 62, 33.68, 'Reserved'),
+    ('TKT-00001801', 5842, 1146, 62, 33.68, 'Reserved'),
+    ('TKT-00001802', 5842, 1146, 62, 33.68, 'Purchased'),
+    ('TKT-00001803', 5842, 1146, 62, 33.68, 'Purchased'),
+    ('TKT-00001804', 5843, 1156, 478, 455.01, 'Refunded'),
+    ('TKT-00001805', 5845, 1164, 133, 148.94, 'Reserved'),
+    ('TKT-00001806', 5845, 1164, 133, 148.94, 'Reserved'),
+    ('TKT-00001807', 5845, 1164, 133, 148.94, 'Refunded'),
+    ('TKT-00001808', 5846, 1158, 45, 60.98, 'Refunded'),
+    ('TKT-00001809', 5846, 1158, 45, 60.98, 'Reserved'),
+    ('TKT-00001810', 5846, 1158, 45, 60.98, 'Purchased'),
+    ('TKT-00001811', 5847, 1132, 121, 93.41, 'Reserved'),
+    ('TKT-00001812', 5847, 1132, 121, 93.41, 'Purchased'),
+    ('TKT-00001813', 5847, 1132, 121, 93.41, 'Reserved'),
+    ('TKT-00001814', 5847, 1132, 121, 93.41, 'Reserved'),
+    ('TKT-00001815', 5847, 1132, 121, 93.41, 'Reserved'),
+    ('TKT-00001816', 5848, 1164, 322, 55.34, 'Purchased'),
+    ('TKT-00001817', 5848, 1164, 322, 55.34, 'Reserved'),
+    ('TKT-00001818', 5848, 1164, 322, 55.34, 'Reserved'),
+    ('TKT-00001819', 5849, 1022, 423, 89.31, 'Purchased'),
+    ('TKT-00001820', 5849, 1022, 423, 89.31, 'Purchased'),
+    ('TKT-00001821', 5849, 1022, 423, 89.31, 'Purchased'),
+    ('TKT-00001822', 5849, 1022, 423, 89.31, 'Reserved'),
+    ('TKT-00001823', 5851, 1078, 481, 189.26, 'Purchased'),
+    ('TKT-00001824', 5851, 1078, 481, 189.26, 'Reserved'),
+    ('TKT-00001825', 5852, 1156, 354, 49.83, 'Refunded'),
+    ('TKT-00001826', 5852, 1156, 354, 49.83, 'Purchased'),
+    ('TKT-00001827', 5852, 1156, 354, 49.83, 'Refunded'),
+    ('TKT-00001828', 5853, 1164, 267, 28.37, 'Refunded'),
+    ('TKT-00001829', 5855, 1108, 299, 166.36, 'Refunded'),
+    ('TKT-00001830', 5855, 1108, 299, 166.36, 'Refunded'),
+    ('TKT-00001831', 5856, 1164, 102, 75.69, 'Refunded'),
+    ('TKT-00001832', 5856, 1164, 102, 75.69, 'Purchased'),
+    ('TKT-00001833', 5856, 1164, 102, 75.69, 'Refunded'),
+    ('TKT-00001834', 5856, 1164, 102, 75.69, 'Reserved'),
+    ('TKT-00001835', 5856, 1164, 102, 75.69, 'Reserved'),
+    ('TKT-00001836', 5857, 1054, 449, 200.14, 'Refunded'),
+    ('TKT-00001837', 5857, 1054, 449, 200.14, 'Reserved'),
+    ('TKT-00001838', 5860, 1164, 489, 133.37, 'Reserved'),
+    ('TKT-00001839', 5860, 1164, 489, 133.37, 'Reserved'),
+    ('TKT-00001840', 5861, 1113, 178, 188.12, 'Reserved'),
+    ('TKT-00001841', 5862, 1108, 325, 36.61, 'Purchased'),
+    ('TKT-00001842', 5862, 1108, 325, 36.61, 'Purchased'),
+    ('TKT-00001843', 5862, 1108, 325, 36.61, 'Purchased'),
+    ('TKT-00001844', 5862, 1108, 325, 36.61, 'Refunded'),
+    ('TKT-00001845', 5863, 1192, 148, 248.22, 'Reserved'),
+    ('TKT-00001846', 5863, 1192, 148, 248.22, 'Purchased'),
+    ('TKT-00001847', 5864, 1146, 9, 84.13, 'Reserved'),
+    ('TKT-00001848', 5864, 1146, 9, 84.13, 'Purchased'),
+    ('TKT-00001849', 5864, 1146, 9, 84.13, 'Reserved'),
+    ('TKT-00001850', 5864, 1146, 9, 84.13, 'Refunded'),
+    ('TKT-00001851', 5864, 1146, 9, 84.13, 'Refunded'),
+    ('TKT-00001852', 5865, 1146, 270, 58.78, 'Refunded'),
+    ('TKT-00001853', 5865, 1146, 270, 58.78, 'Refunded'),
+    ('TKT-00001854', 5865, 1146, 270, 58.78, 'Purchased'),
+    ('TKT-00001855', 5865, 1146, 270, 58.78, 'Purchased'),
+    ('TKT-00001856', 5866, 1116, 26, 59.92, 'Purchased'),
+    ('TKT-00001857', 5866, 1116, 26, 59.92, 'Reserved'),
+    ('TKT-00001858', 5869, 1090, 429, 25.31, 'Refunded'),
+    ('TKT-00001859', 5869, 1090, 429, 25.31, 'Refunded'),
+    ('TKT-00001860', 5870, 1018, 154, 261.75, 'Refunded'),
+    ('TKT-00001861', 5871, 1142, 217, 301.4, 'Reserved'),
+    ('TKT-00001862', 5872, 1135, 148, 243.58, 'Refunded'),
+    ('TKT-00001863', 5873, 1106, 228, 13.54, 'Refunded'),
+    ('TKT-00001864', 5873, 1106, 228, 13.54, 'Refunded'),
+    ('TKT-00001865', 5873, 1106, 228, 13.54, 'Purchased'),
+    ('TKT-00001866', 5873, 1106, 228, 13.54, 'Refunded'),
+    ('TKT-00001867', 5874, 1044, 285, 103.54, 'Reserved'),
+    ('TKT-00001868', 5874, 1044, 285, 103.54, 'Purchased'),
+    ('TKT-00001869', 5874, 1044, 285, 103.54, 'Refunded'),
+    ('TKT-00001870', 5875, 1105, 61, 163.01, 'Refunded'),
+    ('TKT-00001871', 5875, 1105, 61, 163.01, 'Reserved'),
+    ('TKT-00001872', 5876, 1096, 365, 157.85, 'Purchased'),
+    ('TKT-00001873', 5876, 1096, 365, 157.85, 'Refunded'),
+    ('TKT-00001874', 5876, 1096, 365, 157.85, 'Refunded'),
+    ('TKT-00001875', 5877, 1108, 87, 49.01, 'Reserved'),
+    ('TKT-00001876', 5877, 1108, 87, 49.01, 'Reserved'),
+    ('TKT-00001877', 5877, 1108, 87, 49.01, 'Purchased'),
+    ('TKT-00001878', 5877, 1108, 87, 49.01, 'Reserved'),
+    ('TKT-00001879', 5877, 1108, 87, 49.01, 'Reserved'),
+    ('TKT-00001880', 5879, 1036, 317, 428.13, 'Purchased'),
+    ('TKT-00001881', 5880, 1075, 122, 53.9, 'Refunded'),
+    ('TKT-00001882', 5880, 1075, 122, 53.9, 'Purchased'),
+    ('TKT-00001883', 5880, 1075, 122, 53.9, 'Reserved'),
+    ('TKT-00001884', 5880, 1075, 122, 53.9, 'Reserved'),
+    ('TKT-00001885', 5881, 1099, 181, 43.43, 'Reserved'),
+    ('TKT-00001886', 5882, 1164, 467, 119.86, 'Refunded'),
+    ('TKT-00001887', 5882, 1164, 467, 119.86, 'Purchased'),
+    ('TKT-00001888', 5882, 1164, 467, 119.86, 'Reserved'),
+    ('TKT-00001889', 5882, 1164, 467, 119.86, 'Refunded'),
+    ('TKT-00001890', 5883, 1023, 26, 112.35, 'Reserved'),
+    ('TKT-00001891', 5883, 1023, 26, 112.35, 'Refunded'),
+    ('TKT-00001892', 5883, 1023, 26, 112.35, 'Purchased'),
+    ('TKT-00001893', 5883, 1023, 26, 112.35, 'Purchased'),
+    ('TKT-00001894', 5884, 1075, 418, 27.15, 'Refunded'),
+    ('TKT-00001895', 5884, 1075, 418, 27.15, 'Purchased'),
+    ('TKT-00001896', 5884, 1075, 418, 27.15, 'Reserved'),
+    ('TKT-00001897', 5884, 1075, 418, 27.15, 'Purchased'),
+    ('TKT-00001898', 5884, 1075, 418, 27.15, 'Purchased'),
+    ('TKT-00001899', 5885, 1164, 252, 256.53, 'Reserved'),
+    ('TKT-00001900', 5887, 1164, 282, 87.82, 'Refunded'),
+    ('TKT-00001901', 5887, 1164, 282, 87.82, 'Refunded'),
+    ('TKT-00001902', 5887, 1164, 282, 87.82, 'Refunded'),
+    ('TKT-00001903', 5887, 1164, 282, 87.82, 'Refunded'),
+    ('TKT-00001904', 5889, 1161, 23, 90.81, 'Purchased'),
+    ('TKT-00001905', 5889, 1161, 23, 90.81, 'Reserved'),
+    ('TKT-00001906', 5889, 1161, 23, 90.81, 'Reserved'),
+    ('TKT-00001907', 5889, 1161, 23, 90.81, 'Purchased'),
+    ('TKT-00001908', 5890, 1124, 299, 160.55, 'Purchased'),
+    ('TKT-00001909', 5890, 1124, 299, 160.55, 'Purchased'),
+    ('TKT-00001910', 5891, 1182, 189, 47.25, 'Purchased'),
+    ('TKT-00001911', 5891, 1182, 189, 47.25, 'Reserved'),
+    ('TKT-00001912', 5891, 1182, 189, 47.25, 'Reserved'),
+    ('TKT-00001913', 5893, 1107, 311, 96.8, 'Refunded'),
+    ('TKT-00001914', 5893, 1107, 311, 96.8, 'Purchased'),
+    ('TKT-00001915', 5893, 1107, 311, 96.8, 'Reserved'),
+    ('TKT-00001916', 5893, 1107, 311, 96.8, 'Reserved'),
+    ('TKT-00001917', 5893, 1107, 311, 96.8, 'Reserved'),
+    ('TKT-00001918', 5894, 1150, 238, 286.09, 'Refunded'),
+    ('TKT-00001919', 5895, 1090, 400, 59.46, 'Refunded'),
+    ('TKT-00001920', 5895, 1090, 400, 59.46, 'Reserved'),
+    ('TKT-00001921', 5895, 1090, 400, 59.46, 'Reserved'),
+    ('TKT-00001922', 5895, 1090, 400, 59.46, 'Reserved'),
+    ('TKT-00001923', 5896, 1187, 445, 20.4, 'Purchased'),
+    ('TKT-00001924', 5896, 1187, 445, 20.4, 'Reserved'),
+    ('TKT-00001925', 5896, 1187, 445, 20.4, 'Reserved'),
+    ('TKT-00001926', 5896, 1187, 445, 20.4, 'Reserved'),
+    ('TKT-00001927', 5897, 1023, 151, 41.68, 'Purchased'),
+    ('TKT-00001928', 5897, 1023, 151, 41.68, 'Refunded'),
+    ('TKT-00001929', 5897, 1023, 151, 41.68, 'Refunded'),
+    ('TKT-00001930', 5900, 1148, 259, 67.27, 'Refunded'),
+    ('TKT-00001931', 5900, 1148, 259, 67.27, 'Purchased'),
+    ('TKT-00001932', 5900, 1148, 259, 67.27, 'Reserved'),
+    ('TKT-00001933', 5900, 1148, 259, 67.27, 'Purchased'),
+    ('TKT-00001934', 5900, 1148, 259, 67.27, 'Reserved'),
+    ('TKT-00001935', 5901, 1057, 272, 35.97, 'Purchased'),
+    ('TKT-00001936', 5901, 1057, 272, 35.97, 'Refunded'),
+    ('TKT-00001937', 5901, 1057, 272, 35.97, 'Refunded'),
+    ('TKT-00001938', 5901, 1057, 272, 35.97, 'Refunded'),
+    ('TKT-00001939', 5901, 1057, 272, 35.97, 'Refunded'),
+    ('TKT-00001940', 5904, 1090, 71, 474.45, 'Refunded'),
+    ('TKT-00001941', 5906, 1173, 147, 39.68, 'Refunded'),
+    ('TKT-00001942', 5906, 1173, 147, 39.68, 'Refunded'),
+    ('TKT-00001943', 5908, 1150, 189, 243.01, 'Purchased'),
+    ('TKT-00001944', 5909, 1132, 449, 94.45, 'Purchased'),
+    ('TKT-00001945', 5909, 1132, 449, 94.45, 'Refunded'),
+    ('TKT-00001946', 5909, 1132, 449, 94.45, 'Refunded'),
+    ('TKT-00001947', 5909, 1132, 449, 94.45, 'Refunded'),
+    ('TKT-00001948', 5911, 1054, 190, 92.69, 'Reserved'),
+    ('TKT-00001949', 5919, 1115, 481, 68.25, 'Refunded'),
+    ('TKT-00001950', 5919, 1115, 481, 68.25, 'Reserved'),
+    ('TKT-00001951', 5920, 1188, 15, 225.72, 'Refunded'),
+    ('TKT-00001952', 5920, 1188, 15, 225.72, 'Purchased'),
+    ('TKT-00001953', 5921, 1012, 273, 139.18, 'Refunded'),
+    ('TKT-00001954', 5921, 1012, 273, 139.18, 'Purchased'),
+    ('TKT-00001955', 5922, 1096, 35, 84.74, 'Purchased'),
+    ('TKT-00001956', 5922, 1096, 35, 84.74, 'Reserved'),
+    ('TKT-00001957', 5923, 1099, 98, 32.31, 'Refunded'),
+    ('TKT-00001958', 5923, 1099, 98, 32.31, 'Purchased'),
+    ('TKT-00001959', 5923, 1099, 98, 32.31, 'Refunded'),
+    ('TKT-00001960', 5923, 1099, 98, 32.31, 'Reserved'),
+    ('TKT-00001961', 5924, 1099, 102, 10.73, 'Reserved'),
+    ('TKT-00001962', 5924, 1099, 102, 10.73, 'Reserved'),
+    ('TKT-00001963', 5924, 1099, 102, 10.73, 'Purchased'),
+    ('TKT-00001964', 5924, 1099, 102, 10.73, 'Purchased'),
+    ('TKT-00001965', 5925, 1122, 348, 439.7, 'Purchased'),
+    ('TKT-00001966', 5926, 1081, 178, 186.49, 'Purchased'),
+    ('TKT-00001967', 5926, 1081, 178, 186.49, 'Refunded'),
+    ('TKT-00001968', 5927, 1060, 472, 38.36, 'Purchased'),
+    ('TKT-00001969', 5927, 1060, 472, 38.36, 'Reserved'),
+    ('TKT-00001970', 5927, 1060, 472, 38.36, 'Reserved'),
+    ('TKT-00001971', 5927, 1060, 472, 38.36, 'Refunded'),
+    ('TKT-00001972', 5929, 1149, 480, 119.92, 'Reserved'),
+    ('TKT-00001973', 5929, 1149, 480, 119.92, 'Refunded'),
+    ('TKT-00001974', 5929, 1149, 480, 119.92, 'Purchased'),
+    ('TKT-00001975', 5929, 1149, 480, 119.92, 'Reserved'),
+    ('TKT-00001976', 5930, 1049, 374, 138.72, 'Refunded'),
+    ('TKT-00001977', 5930, 1049, 374, 138.72, 'Refunded'),
+    ('TKT-00001978', 5930, 1049, 374, 138.72, 'Refunded'),
+    ('TKT-00001979', 5932, 1022, 396, 46.58, 'Purchased'),
+    ('TKT-00001980', 5932, 1022, 396, 46.58, 'Purchased'),
+    ('TKT-00001981', 5932, 1022, 396, 46.58, 'Refunded'),
+    ('TKT-00001982', 5932, 1022, 396, 46.58, 'Purchased'),
+    ('TKT-00001983', 5933, 1183, 441, 7.6, 'Refunded'),
+    ('TKT-00001984', 5933, 1183, 441, 7.6, 'Refunded'),
+    ('TKT-00001985', 5933, 1183, 441, 7.6, 'Refunded'),
+    ('TKT-00001986', 5936, 1085, 451, 91.34, 'Purchased'),
+    ('TKT-00001987', 5936, 1085, 451, 91.34, 'Refunded'),
+    ('TKT-00001988', 5936, 1085, 451, 91.34, 'Refunded'),
+    ('TKT-00001989', 5936, 1085, 451, 91.34, 'Purchased'),
+    ('TKT-00001990', 5936, 1085, 451, 91.34, 'Purchased'),
+    ('TKT-00001991', 5937, 1069, 148, 115.02, 'Purchased'),
+    ('TKT-00001992', 5937, 1069, 148, 115.02, 'Reserved'),
+    ('TKT-00001993', 5937, 1069, 148, 115.02, 'Refunded'),
+    ('TKT-00001994', 5938, 1075, 78, 82.79, 'Refunded'),
+    ('TKT-00001995', 5938, 1075, 78, 82.79, 'Refunded'),
+    ('TKT-00001996', 5938, 1075, 78, 82.79, 'Refunded'),
+    ('TKT-00001997', 5938, 1075, 78, 82.79, 'Purchased'),
+    ('TKT-00001998', 5939, 1120, 472, 91.82, 'Refunded'),
+    ('TKT-00001999', 5941, 1111, 322, 111.44, 'Refunded'),
+    ('TKT-00002000', 5941, 1111, 322, 111.44, 'Refunded'),
+    ('TKT-00002001', 5942, 1148, 151, 83.15, 'Refunded'),
+    ('TKT-00002002', 5942, 1148, 151, 83.15, 'Refunded'),
+    ('TKT-00002003', 5942, 1148, 151, 83.15, 'Purchased'),
+    ('TKT-00002004', 5942, 1148, 151, 83.15, 'Reserved'),
+    ('TKT-00002005', 5943, 1111, 254, 75.05, 'Refunded'),
+    ('TKT-00002006', 5943, 1111, 254, 75.05, 'Reserved'),
+    ('TKT-00002007', 5943, 1111, 254, 75.05, 'Purchased'),
+    ('TKT-00002008', 5943, 1111, 254, 75.05, 'Reserved'),
+    ('TKT-00002009', 5944, 1036, 71, 65.0, 'Refunded'),
+    ('TKT-00002010', 5944, 1036, 71, 65.0, 'Refunded'),
+    ('TKT-00002011', 5944, 1036, 71, 65.0, 'Reserved'),
+    ('TKT-00002012', 5945, 1078, 222, 18.7, 'Refunded'),
+    ('TKT-00002013', 5945, 1078, 222, 18.7, 'Refunded'),
+    ('TKT-00002014', 5945, 1078, 222, 18.7, 'Reserved'),
+    ('TKT-00002015', 5945, 1078, 222, 18.7, 'Reserved'),
+    ('TKT-00002016', 5945, 1078, 222, 18.7, 'Refunded'),
+    ('TKT-00002017', 5946, 1176, 62, 422.73, 'Reserved'),
+    ('TKT-00002018', 5947, 1034, 26, 161.43, 'Reserved'),
+    ('TKT-00002019', 5947, 1034, 26, 161.43, 'Reserved'),
+    ('TKT-00002020', 5947, 1034, 26, 161.43, 'Reserved'),
+    ('TKT-00002021', 5948, 1122, 280, 138.04, 'Refunded'),
+    ('TKT-00002022', 5948, 1122, 280, 138.04, 'Reserved'),
+    ('TKT-00002023', 5948, 1122, 280, 138.04, 'Refunded'),
+    ('TKT-00002024', 5950, 1150, 293, 6.91, 'Reserved'),
+    ('TKT-00002025', 5950, 1150, 293, 6.91, 'Refunded'),
+    ('TKT-00002026', 5950, 1150, 293, 6.91, 'Refunded'),
+    ('TKT-00002027', 5951, 1043, 470, 44.94, 'Reserved'),
+    ('TKT-00002028', 5951, 1043, 470, 44.94, 'Reserved'),
+    ('TKT-00002029', 5951, 1043, 470, 44.94, 'Reserved'),
+    ('TKT-00002030', 5951, 1043, 470, 44.94, 'Purchased'),
+    ('TKT-00002031', 5953, 1156, 354, 6.47, 'Reserved'),
+    ('TKT-00002032', 5953, 1156, 354, 6.47, 'Reserved'),
+    ('TKT-00002033', 5953, 1156, 354, 6.47, 'Reserved'),
+    ('TKT-00002034', 5953, 1156, 354, 6.47, 'Refunded'),
+    ('TKT-00002035', 5953, 1156, 354, 6.47, 'Reserved'),
+    ('TKT-00002036', 5955, 1111, 352, 63.29, 'Reserved'),
+    ('TKT-00002037', 5955, 1111, 352, 63.29, 'Reserved'),
+    ('TKT-00002038', 5955, 1111, 352, 63.29, 'Purchased'),
+    ('TKT-00002039', 5955, 1111, 352, 63.29, 'Reserved'),
+    ('TKT-00002040', 5955, 1111, 352, 63.29, 'Refunded'),
+    ('TKT-00002041', 5956, 1122, 114, 82.31, 'Refunded'),
+    ('TKT-00002042', 5956, 1122, 114, 82.31, 'Purchased'),
+    ('TKT-00002043', 5956, 1122, 114, 82.31, 'Purchased'),
+    ('TKT-00002044', 5956, 1122, 114, 82.31, 'Reserved'),
+    ('TKT-00002045', 5956, 1122, 114, 82.31, 'Refunded'),
+    ('TKT-00002046', 5957, 1124, 487, 135.18, 'Purchased'),
+    ('TKT-00002047', 5957, 1124, 487, 135.18, 'Reserved'),
+    ('TKT-00002048', 5957, 1124, 487, 135.18, 'Reserved'),
+    ('TKT-00002049', 5959, 1150, 164, 224.36, 'Refunded'),
+    ('TKT-00002050', 5959, 1150, 164, 224.36, 'Purchased'),
+    ('TKT-00002051', 5960, 1198, 348, 70.48, 'Purchased'),
+    ('TKT-00002052', 5960, 1198, 348, 70.48, 'Reserved'),
+    ('TKT-00002053', 5960, 1198, 348, 70.48, 'Purchased'),
+    ('TKT-00002054', 5961, 1014, 150, 31.23, 'Refunded'),
+    ('TKT-00002055', 5961, 1014, 150, 31.23, 'Purchased'),
+    ('TKT-00002056', 5961, 1014, 150, 31.23, 'Refunded'),
+    ('TKT-00002057', 5961, 1014, 150, 31.23, 'Purchased'),
+    ('TKT-00002058', 5961, 1014, 150, 31.23, 'Reserved'),
+    ('TKT-00002059', 5963, 1019, 372, 225.38, 'Refunded'),
+    ('TKT-00002060', 5963, 1019, 372, 225.38, 'Refunded'),
+    ('TKT-00002061', 5964, 1099, 465, 280.7, 'Purchased'),
+    ('TKT-00002062', 5965, 1108, 474, 107.43, 'Reserved'),
+    ('TKT-00002063', 5965, 1108, 474, 107.43, 'Reserved'),
+    ('TKT-00002064', 5965, 1108, 474, 107.43, 'Reserved'),
+    ('TKT-00002065', 5965, 1108, 474, 107.43, 'Reserved'),
+    ('TKT-00002066', 5966, 1036, 259, 86.26, 'Purchased'),
+    ('TKT-00002067', 5966, 1036, 259, 86.26, 'Purchased'),
+    ('TKT-00002068', 5966, 1036, 259, 86.26, 'Refunded'),
+    ('TKT-00002069', 5966, 1036, 259, 86.26, 'Refunded'),
+    ('TKT-00002070', 5967, 1199, 449, 58.79, 'Purchased'),
+    ('TKT-00002071', 5967, 1199, 449, 58.79, 'Purchased'),
+    ('TKT-00002072', 5967, 1199, 449, 58.79, 'Purchased'),
+    ('TKT-00002073', 5967, 1199, 449, 58.79, 'Purchased'),
+    ('TKT-00002074', 5968, 1138, 98, 129.17, 'Purchased'),
+    ('TKT-00002075', 5969, 1123, 369, 20.69, 'Refunded'),
+    ('TKT-00002076', 5969, 1123, 369, 20.69, 'Purchased'),
+    ('TKT-00002077', 5969, 1123, 369, 20.69, 'Purchased'),
+    ('TKT-00002078', 5969, 1123, 369, 20.69, 'Purchased'),
+    ('TKT-00002079', 5969, 1123, 369, 20.69, 'Reserved'),
+    ('TKT-00002080', 5970, 1168, 172, 34.27, 'Reserved'),
+    ('TKT-00002081', 5971, 1046, 487, 97.94, 'Refunded'),
+    ('TKT-00002082', 5971, 1046, 487, 97.94, 'Purchased'),
+    ('TKT-00002083', 5971, 1046, 487, 97.94, 'Purchased'),
+    ('TKT-00002084', 5971, 1046, 487, 97.94, 'Reserved'),
+    ('TKT-00002085', 5971, 1046, 487, 97.94, 'Reserved'),
+    ('TKT-00002086', 5972, 1142, 123, 133.43, 'Purchased'),
+    ('TKT-00002087', 5972, 1142, 123, 133.43, 'Reserved'),
+    ('TKT-00002088', 5972, 1142, 123, 133.43, 'Refunded'),
+    ('TKT-00002089', 5973, 1038, 314, 89.53, 'Purchased'),
+    ('TKT-00002090', 5973, 1038, 314, 89.53, 'Refunded'),
+    ('TKT-00002091', 5973, 1038, 314, 89.53, 'Reserved'),
+    ('TKT-00002092', 5973, 1038, 314, 89.53, 'Refunded'),
+    ('TKT-00002093', 5973, 1038, 314, 89.53, 'Reserved'),
+    ('TKT-00002094', 5974, 1094, 71, 229.26, 'Reserved'),
+    ('TKT-00002095', 5974, 1094, 71, 229.26, 'Refunded'),
+    ('TKT-00002096', 5975, 1069, 156, 217.98, 'Reserved'),
+    ('TKT-00002097', 5975, 1069, 156, 217.98, 'Purchased'),
+    ('TKT-00002098', 5976, 1075, 468, 44.94, 'Refunded'),
+    ('TKT-00002099', 5976, 1075, 468, 44.94, 'Refunded'),
+    ('TKT-00002100', 5977, 1190, 71, 74.48, 'Refunded'),
+    ('TKT-00002101', 5977, 1190, 71, 74.48, 'Reserved'),
+    ('TKT-00002102', 5977, 1190, 71, 74.48, 'Reserved'),
+    ('TKT-00002103', 5977, 1190, 71, 74.48, 'Purchased'),
+    ('TKT-00002104', 5977, 1190, 71, 74.48, 'Reserved'),
+    ('TKT-00002105', 5978, 1190, 276, 122.13, 'Purchased'),
+    ('TKT-00002106', 5978, 1190, 276, 122.13, 'Purchased'),
+    ('TKT-00002107', 5978, 1190, 276, 122.13, 'Refunded'),
+    ('TKT-00002108', 5978, 1190, 276, 122.13, 'Refunded'),
+    ('TKT-00002109', 5979, 1058, 108, 88.64, 'Refunded'),
+    ('TKT-00002110', 5979, 1058, 108, 88.64, 'Purchased'),
+    ('TKT-00002111', 5979, 1058, 108, 88.64, 'Reserved'),
+    ('TKT-00002112', 5979, 1058, 108, 88.64, 'Refunded'),
+    ('TKT-00002113', 5979, 1058, 108, 88.64, 'Reserved'),
+    ('TKT-00002114', 5983, 1188, 87, 235.73, 'Reserved'),
+    ('TKT-00002115', 5983, 1188, 87, 235.73, 'Reserved'),
+    ('TKT-00002116', 5984, 1076, 257, 463.95, 'Reserved'),
+    ('TKT-00002117', 5986, 1074, 208, 49.65, 'Refunded'),
+    ('TKT-00002118', 5986, 1074, 208, 49.65, 'Reserved'),
+    ('TKT-00002119', 5986, 1074, 208, 49.65, 'Refunded'),
+    ('TKT-00002120', 5986, 1074, 208, 49.65, 'Purchased'),
+    ('TKT-00002121', 5986, 1074, 208, 49.65, 'Refunded'),
+    ('TKT-00002122', 5987, 1134, 7, 71.38, 'Reserved'),
+    ('TKT-00002123', 5988, 1158, 497, 101.82, 'Reserved'),
+    ('TKT-00002124', 5988, 1158, 497, 101.82, 'Reserved'),
+    ('TKT-00002125', 5988, 1158, 497, 101.82, 'Purchased'),
+    ('TKT-00002126', 5989, 1068, 162, 48.88, 'Refunded'),
+    ('TKT-00002127', 5989, 1068, 162, 48.88, 'Purchased'),
+    ('TKT-00002128', 5989, 1068, 162, 48.88, 'Purchased'),
+    ('TKT-00002129', 5989, 1068, 162, 48.88, 'Purchased'),
+    ('TKT-00002130', 5989, 1068, 162, 48.88, 'Reserved'),
+    ('TKT-00002131', 5990, 1168, 35, 227.98, 'Reserved'),
+    ('TKT-00002132', 5990, 1168, 35, 227.98, 'Reserved'),
+    ('TKT-00002133', 5991, 1192, 246, 94.24, 'Purchased'),
+    ('TKT-00002134', 5991, 1192, 246, 94.24, 'Purchased'),
+    ('TKT-00002135', 5991, 1192, 246, 94.24, 'Refunded'),
+    ('TKT-00002136', 5991, 1192, 246, 94.24, 'Refunded'),
+    ('TKT-00002137', 5991, 1192, 246, 94.24, 'Refunded'),
+    ('TKT-00002138', 5992, 1147, 251, 122.7, 'Reserved'),
+    ('TKT-00002139', 5992, 1147, 251, 122.7, 'Refunded'),
+    ('TKT-00002140', 5992, 1147, 251, 122.7, 'Refunded'),
+    ('TKT-00002141', 5992, 1147, 251, 122.7, 'Reserved'),
+    ('TKT-00002142', 5993, 1160, 162, 78.39, 'Purchased'),
+    ('TKT-00002143', 5993, 1160, 162, 78.39, 'Reserved'),
+    ('TKT-00002144', 5993, 1160, 162, 78.39, 'Purchased'),
+    ('TKT-00002145', 5993, 1160, 162, 78.39, 'Purchased'),
+    ('TKT-00002146', 5993, 1160, 162, 78.39, 'Reserved'),
+    ('TKT-00002147', 5994, 1176, 489, 41.93, 'Reserved'),
+    ('TKT-00002148', 5994, 1176, 489, 41.93, 'Purchased'),
+    ('TKT-00002149', 5994, 1176, 489, 41.93, 'Reserved'),
+    ('TKT-00002150', 5994, 1176, 489, 41.93, 'Purchased'),
+    ('TKT-00002151', 5995, 1142, 45, 7.18, 'Reserved'),
+    ('TKT-00002152', 5995, 1142, 45, 7.18, 'Purchased'),
+    ('TKT-00002153', 5995, 1142, 45, 7.18, 'Reserved'),
+    ('TKT-00002154', 5995, 1142, 45, 7.18, 'Reserved'),
+    ('TKT-00002155', 5995, 1142, 45, 7.18, 'Refunded'),
+    ('TKT-00002156', 5996, 1183, 45, 218.1, 'Refunded'),
+    ('TKT-00002157', 5996, 1183, 45, 218.1, 'Reserved'),
+    ('TKT-00002158', 5997, 1173, 301, 92.15, 'Reserved'),
+    ('TKT-00002159', 5997, 1173, 301, 92.15, 'Purchased'),
+    ('TKT-00002160', 5997, 1173, 301, 92.15, 'Refunded'),
+    ('TKT-00002161', 5999, 1164, 480, 96.36, 'Refunded'),
+    ('TKT-00002162', 5999, 1164, 480, 96.36, 'Refunded'),
+    ('TKT-00002163', 5999, 1164, 480, 96.36, 'Purchased'),
+    ('TKT-00002164', 5999, 1164, 480, 96.36, 'Purchased'),
+    ('TKT-00002165', 6000, 1010, 151, 64.29, 'Refunded'),
+    ('TKT-00002166', 6000, 1010, 151, 64.29, 'Reserved'),
+    ('TKT-00002167', 6000, 1010, 151, 64.29, 'Reserved'),
+    ('TKT-00002168', 6000, 1010, 151, 64.29, 'Reserved'),
+    ('TKT-00002169', 6000, 1010, 151, 64.29, 'Purchased');
+
+INSERT INTO `event_sales_summary` (`event_id`, `purchased_count`, `reserved_count`, `refunded_count`, `purchased_revenue`) VALUES
+    (1001, 2, 0, 4, 68.64),
+    (1002, 5, 4, 4, 231.67),
+    (1003, 0, 0, 3, 0.0),
+    (1004, 0, 0, 0, 0.0),
+    (1005, 0, 0, 0, 0.0),
+    (1006, 0, 0, 0, 0.0),
+    (1007, 0, 0, 0, 0.0),
+    (1008, 0, 0, 0, 0.0),
+    (1009, 0, 0, 0, 0.0),
+    (1010, 5, 3, 4, 483.49),
+    (1011, 0, 0, 0, 0.0),
+    (1012, 2, 0, 2, 361.87),
+    (1013, 1, 1, 2, 55.91),
+    (1014, 7, 3, 4, 1007.21),
+    (1015, 0, 0, 0, 0.0),
+    (1016, 2, 0, 3, 27.42),
+    (1017, 3, 5, 3, 39.87),
+    (1018, 5, 4, 5, 639.3),
+    (1019, 5, 5, 5, 565.51),
+    (1020, 0, 0, 0, 0.0),
+    (1021, 0, 0, 0, 0.0),
+    (1022, 12, 10, 15, 740.7),
+    (1023, 14, 4, 7, 1113.58),
+    (1024, 4, 3, 4, 519.5),
+    (1025, 0, 2, 0, 0.0),
+    (1026, 6, 2, 2, 309.37),
+    (1027, 5, 6, 2, 292.69),
+    (1028, 4, 8, 6, 323.0),
+    (1029, 5, 7, 9, 369.76),
+    (1030, 0, 0, 0, 0.0),
+    (1031, 0, 0, 0, 0.0),
+    (1032, 8, 0, 6, 230.52),
+    (1033, 3, 1, 3, 366.65),
+    (1034, 4, 9, 5, 281.64),
+    (1035, 5, 3, 4, 377.26),
+    (1036, 3, 3, 7, 600.65),
+    (1037, 8, 8, 3, 324.08),
+    (1038, 9, 8, 11, 970.59),
+    (1039, 4, 7, 1, 352.3),
+    (1040, 2, 1, 1, 162.88),
+    (1041, 0, 0, 0, 0.0),
+    (1042, 2, 1, 4, 92.97),
+    (1043, 2, 3, 0, 441.64),
+    (1044, 7, 7, 10, 399.77),
+    (1045, 4, 7, 1, 229.05),
+    (1046, 8, 3, 7, 619.32),
+    (1047, 6, 6, 7, 238.95),
+    (1048, 3, 6, 3, 298.51),
+    (1049, 1, 0, 3, 147.31),
+    (1050, 0, 0, 0, 0.0),
+    (1051, 0, 0, 0, 0.0),
+    (1052, 0, 0, 0, 0.0),
+    (1053, 6, 3, 7, 458.56),
+    (1054, 4, 4, 5, 370.96),
+    (1055, 1, 2, 1, 18.62),
+    (1056, 8, 4, 6, 294.41),
+    (1057, 2, 3, 5, 251.11),
+    (1058, 1, 3, 2, 88.64),
+    (1059, 1, 1, 1, 29.76),
+    (1060, 3, 5, 8, 118.64),
+    (1061, 0, 0, 0, 0.0),
+    (1062, 3, 4, 5, 216.96),
+    (1063, 0, 1, 1, 0.0),
+    (1064, 7, 0, 6, 626.71),
+    (1065, 0, 1, 1, 0.0),
+    (1066, 11, 4, 11, 1282.43),
+    (1067, 1, 1, 1, 166.58),
+    (1068, 6, 6, 3, 653.66),
+    (1069, 6, 6, 3, 553.32),
+    (1070, 0, 0, 0, 0.0),
+    (1071, 3, 1, 3, 66.09),
+    (1072, 0, 0, 0, 0.0),
+    (1073, 2, 3, 2, 219.77),
+    (1074, 8, 4, 6, 577.13),
+    (1075, 7, 4, 8, 311.0),
+    (1076, 6, 12, 5, 508.04),
+    (1077, 1, 4, 2, 25.96),
+    (1078, 3, 4, 5, 329.36),
+    (1079, 2, 0, 2, 99.96),
+    (1080, 1, 3, 1, 45.0),
+    (1081, 2, 1, 3, 262.52),
+    (1082, 3, 4, 4, 180.05),
+    (1083, 0, 0, 0, 0.0),
+    (1084, 11, 5, 9, 680.56),
+    (1085, 8, 5, 3, 408.4),
+    (1086, 0, 0, 0, 0.0),
+    (1087, 0, 0, 0, 0.0),
+    (1088, 0, 0, 0, 0.0),
+    (1089, 3, 2, 6, 233.98),
+    (1090, 3, 18, 14, 353.79),
+    (1091, 0, 0, 0, 0.0),
+    (1092, 0, 0, 0, 0.0),
+    (1093, 0, 0, 0, 0.0),
+    (1094, 2, 6, 3, 115.8),
+    (1095, 0, 0, 0, 0.0),
+    (1096, 2, 1, 2, 242.59),
+    (1097, 3, 2, 1, 385.41),
+    (1098, 0, 0, 0, 0.0),
+    (1099, 6, 9, 5, 545.76),
+    (1100, 0, 0, 0, 0.0),
+    (1101, 0, 0, 0, 0.0),
+    (1102, 0, 0, 0, 0.0),
+    (1103, 5, 6, 8, 207.58),
+    (1104, 6, 7, 4, 202.59),
+    (1105, 5, 7, 3, 465.36),
+    (1106, 2, 0, 4, 190.49),
+    (1107, 8, 3, 4, 411.58),
+    (1108, 11, 17, 10, 905.54),
+    (1109, 0, 0, 0, 0.0),
+    (1110, 0, 0, 0, 0.0),
+    (1111, 10, 16, 10, 628.33),
+    (1112, 1, 3, 2, 92.98),
+    (1113, 3, 7, 2, 113.8),
+    (1114, 0, 0, 0, 0.0),
+    (1115, 3, 6, 6, 172.6),
+    (1116, 3, 7, 3, 137.98),
+    (1117, 2, 1, 1, 63.92),
+    (1118, 3, 4, 6, 64.2),
+    (1119, 0, 0, 0, 0.0),
+    (1120, 4, 5, 7, 201.24),
+    (1121, 0, 0, 0, 0.0),
+    (1122, 9, 7, 8, 1401.46),
+    (1123, 6, 3, 5, 301.29),
+    (1124, 4, 5, 3, 486.94),
+    (1125, 8, 6, 4, 644.26),
+    (1126, 0, 0, 0, 0.0),
+    (1127, 1, 3, 3, 191.11),
+    (1128, 7, 13, 12, 817.92),
+    (1129, 0, 0, 0, 0.0),
+    (1130, 2, 1, 1, 139.12),
+    (1131, 0, 0, 0, 0.0),
+    (1132, 2, 4, 3, 187.86),
+    (1133, 1, 2, 1, 91.39),
+    (1134, 4, 3, 1, 309.22),
+    (1135, 12, 12, 13, 997.32),
+    (1136, 0, 0, 0, 0.0),
+    (1137, 4, 5, 8, 356.31),
+    (1138, 6, 3, 3, 570.94),
+    (1139, 0, 0, 0, 0.0),
+    (1140, 2, 2, 1, 165.61),
+    (1141, 11, 16, 15, 937.91),
+    (1142, 16, 24, 17, 1323.2),
+    (1143, 0, 0, 0, 0.0),
+    (1144, 6, 2, 2, 318.67),
+    (1145, 0, 0, 0, 0.0),
+    (1146, 20, 20, 14, 1657.88),
+    (1147, 0, 3, 4, 0.0),
+    (1148, 21, 15, 14, 1526.45),
+    (1149, 5, 5, 6, 632.64),
+    (1150, 15, 20, 21, 1948.83),
+    (1151, 0, 0, 0, 0.0),
+    (1152, 5, 1, 2, 376.28),
+    (1153, 0, 0, 0, 0.0),
+    (1154, 0, 0, 0, 0.0),
+    (1155, 0, 3, 6, 0.0),
+    (1156, 5, 7, 9, 193.07),
+    (1157, 4, 6, 5, 594.57),
+    (1158, 4, 7, 5, 381.96),
+    (1159, 0, 0, 0, 0.0),
+    (1160, 7, 10, 10, 735.85),
+    (1161, 13, 9, 6, 601.02),
+    (1162, 0, 0, 0, 0.0),
+    (1163, 0, 0, 0, 0.0),
+    (1164, 12, 18, 22, 1299.36),
+    (1165, 6, 2, 3, 528.43),
+    (1166, 0, 0, 0, 0.0),
+    (1167, 0, 0, 0, 0.0),
+    (1168, 10, 14, 4, 927.51),
+    (1169, 0, 0, 0, 0.0),
+    (1170, 5, 3, 6, 316.1),
+    (1171, 6, 1, 1, 1065.73),
+    (1172, 3, 3, 5, 364.12),
+    (1173, 14, 8, 15, 1192.52),
+    (1174, 3, 4, 4, 330.09),
+    (1175, 6, 12, 8, 625.43),
+    (1176, 6, 8, 8, 343.1),
+    (1177, 5, 4, 3, 502.3),
+    (1178, 0, 0, 0, 0.0),
+    (1179, 10, 4, 11, 547.29),
+    (1180, 0, 0, 0, 0.0),
+    (1181, 5, 2, 0, 537.37),
+    (1182, 6, 6, 1, 253.43),
+    (1183, 2, 12, 7, 334.27),
+    (1184, 0, 0, 0, 0.0),
+    (1185, 5, 5, 6, 274.03),
+    (1186, 6, 6, 7, 636.4),
+    (1187, 5, 5, 2, 361.58),
+    (1188, 2, 4, 3, 233.41),
+    (1189, 0, 0, 0, 0.0),
+    (1190, 5, 6, 9, 377.0),
+    (1191, 0, 0, 0, 0.0),
+    (1192, 5, 1, 7, 549.84),
+    (1193, 0, 0, 0, 0.0),
+    (1194, 0, 0, 0, 0.0),
+    (1195, 2, 1, 5, 155.78),
+    (1196, 3, 2, 1, 289.82),
+    (1197, 0, 0, 0, 0.0),
+    (1198, 8, 5, 2, 343.73),
+    (1199, 9, 5, 7, 1010.81),
+    (1200, 0, 0, 0, 0.0);
+
+INSERT INTO `event_inventory` (`event_id`, `remaining`) VALUES
+    (1001, 6053),
+    (1002, 10152),
+    (1003, 1436),
+    (1004, 3233),
+    (1005, 1805),
+    (1006, 1129),
+    (1007, 1084),
+    (1008, 3220),
+    (1009, 4815),
+    (1010, 1142),
+    (1011, 3878),
+    (1012, 162),
+    (1013, 4375),
+    (1014, 1368),
+    (1015, 4559),
+    (1016, 9484),
+    (1017, 4040),
+    (1018, 2261),
+    (1019, 538),
+    (1020, 400),
+    (1021, 2786),
+    (1022, 2096),
+    (1023, 10364),
+    (1024, 3565),
+    (1025, 410),
+    (1026, 2861),
+    (1027, 576),
+    (1028, 150),
+    (1029, 2880),
+    (1030, 6760),
+    (1031, 9411),
+    (1032, 7322),
+    (1033, 691),
+    (1034, 1615),
+    (1035, 438),
+    (1036, 6189),
+    (1037, 4092),
+    (1038, 2222),
+    (1039, 3965),
+    (1040, 2523),
+    (1041, 1992),
+    (1042, 3904),
+    (1043, 2965),
+    (1044, 4558),
+    (1045, 1047),
+    (1046, 12618),
+    (1047, 1348),
+    (1048, 4571),
+    (1049, 4506),
+    (1050, 3303),
+    (1051, 1667),
+    (1052, 6767),
+    (1053, 3506),
+    (1054, 72),
+    (1055, 1809),
+    (1056, 1445),
+    (1057, 2373),
+    (1058, 3843),
+    (1059, 2110),
+    (1060, 6782),
+    (1061, 1004),
+    (1062, 1590),
+    (1063, 1162),
+    (1064, 5112),
+    (1065, 5415),
+    (1066, 7161),
+    (1067, 3882),
+    (1068, 10410),
+    (1069, 2773),
+    (1070, 6888),
+    (1071, 3611),
+    (1072, 4010),
+    (1073, 4461),
+    (1074, 1769),
+    (1075, 8773),
+    (1076, 3418),
+    (1077, 1613),
+    (1078, 6041),
+    (1079, 48),
+    (1080, 6596),
+    (1081, 6770),
+    (1082, 2097),
+    (1083, 5478),
+    (1084, 9977),
+    (1085, 2737),
+    (1086, 6809),
+    (1087, 8119),
+    (1088, 150),
+    (1089, 1444),
+    (1090, 4199),
+    (1091, 408),
+    (1092, 7736),
+    (1093, 2081),
+    (1094, 2804),
+    (1095, 4496),
+    (1096, 3106),
+    (1097, 1983),
+    (1098, 2988),
+    (1099, 499),
+    (1100, 308),
+    (1101, 3866),
+    (1102, 1661),
+    (1103, 320),
+    (1104, 2293),
+    (1105, 2246),
+    (1106, 4633),
+    (1107, 272),
+    (1108, 10379),
+    (1109, 547),
+    (1110, 6503),
+    (1111, 2403),
+    (1112, 2907),
+    (1113, 3027),
+    (1114, 4944),
+    (1115, 4743),
+    (1116, 4867),
+    (1117, 8069),
+    (1118, 6140),
+    (1119, 149),
+    (1120, 4593),
+    (1121, 2213),
+    (1122, 2357),
+    (1123, 2721),
+    (1124, 7321),
+    (1125, 5651),
+    (1126, 5105),
+    (1127, 11273),
+    (1128, 2104),
+    (1129, 1925),
+    (1130, 6768),
+    (1131, 5140),
+    (1132, 1089),
+    (1133, 7301),
+    (1134, 6231),
+    (1135, 2022),
+    (1136, 490),
+    (1137, 3762),
+    (1138, 2242),
+    (1139, 5748),
+    (1140, 4785),
+    (1141, 3162),
+    (1142, 1813),
+    (1143, 2185),
+    (1144, 1452),
+    (1145, 6414),
+    (1146, 5155),
+    (1147, 7563),
+    (1148, 956),
+    (1149, 4372),
+    (1150, 1559),
+    (1151, 1783),
+    (1152, 512),
+    (1153, 1177),
+    (1154, 1957),
+    (1155, 1853),
+    (1156, 2943),
+    (1157, 116),
+    (1158, 10626),
+    (1159, 1622),
+    (1160, 478),
+    (1161, 2347),
+    (1162, 7777),
+    (1163, 1026),
+    (1164, 1072),
+    (1165, 4220),
+    (1166, 410),
+    (1167, 3321),
+    (1168, 815),
+    (1169, 228),
+    (1170, 2593),
+    (1171, 5013),
+    (1172, 1086),
+    (1173, 5868),
+    (1174, 3892),
+    (1175, 6450),
+    (1176, 2015),
+    (1177, 3721),
+    (1178, 1924),
+    (1179, 10039),
+    (1180, 2175),
+    (1181, 6218),
+    (1182, 4891),
+    (1183, 12406),
+    (1184, 356),
+    (1185, 6185),
+    (1186, 1909),
+    (1187, 7690),
+    (1188, 1447),
+    (1189, 5561),
+    (1190, 7004),
+    (1191, 6097),
+    (1192, 1915),
+    (1193, 172),
+    (1194, 526),
+    (1195, 411),
+    (1196, 2375),
+    (1197, 962),
+    (1198, 3291),
+    (1199, 2133),
+    (1200, 6672);
+
+INSERT INTO `daily_event_revenue` (`revenue_date`, `event_id`, `ticket_count`, `revenue`) VALUES
+    ('2026-04-18', 1022, 4, 181.56),
+    ('2026-04-18', 1165, 1, 29.4),
+    ('2026-04-18', 1168, 2, 455.96),
+    ('2026-04-18', 1187, 4, 81.6),
+    ('2026-04-19', 1022, 4, 432.16),
+    ('2026-04-19', 1090, 2, 49.52),
+    ('2026-04-19', 1141, 3, 454.05),
+    ('2026-04-20', 1022, 3, 285.99),
+    ('2026-04-20', 1036, 4, 345.04),
+    ('2026-04-20', 1047, 3, 116.1),
+    ('2026-04-20', 1063, 1, 224.04),
+    ('2026-04-20', 1066, 5, 82.75),
+    ('2026-04-20', 1164, 3, 309.09),
+    ('2026-04-20', 1168, 2, 379.44),
+    ('2026-04-21', 1039, 4, 296.72),
+    ('2026-04-21', 1135, 1, 447.36),
+    ('2026-04-21', 1182, 1, 48.91),
+    ('2026-04-22', 1023, 3, 280.53),
+    ('2026-04-22', 1028, 4, 173.32),
+    ('2026-04-22', 1085, 2, 115.64),
+    ('2026-04-22', 1090, 1, 349.39),
+    ('2026-04-22', 1099, 4, 449.2),
+    ('2026-04-22', 1150, 2, 483.44),
+    ('2026-04-22', 1177, 2, 271.56),
+    ('2026-04-22', 1192, 5, 282.85),
+    ('2026-04-23', 1022, 2, 210.1),
+    ('2026-04-23', 1099, 4, 395.96),
+    ('2026-04-23', 1103, 5, 433.5),
+    ('2026-04-23', 1150, 3, 450.75),
+    ('2026-04-24', 1053, 4, 271.04),
+    ('2026-04-24', 1105, 4, 433.72),
+    ('2026-04-24', 1173, 2, 82.32),
+    ('2026-04-25', 1066, 3, 311.22),
+    ('2026-04-25', 1122, 4, 76.48),
+    ('2026-04-25', 1164, 2, 266.74),
+    ('2026-04-26', 1001, 1, 353.25),
+    ('2026-04-26', 1082, 1, 424.53),
+    ('2026-04-26', 1135, 4, 206.0),
+    ('2026-04-27', 1103, 5, 292.85),
+    ('2026-04-27', 1122, 3, 414.12),
+    ('2026-04-27', 1124, 2, 321.1),
+    ('2026-04-27', 1144, 1, 102.2),
+    ('2026-04-27', 1173, 4, 424.08),
+    ('2026-04-28', 1078, 2, 378.52),
+    ('2026-04-29', 1044, 3, 118.89),
+    ('2026-04-29', 1045, 3, 257.25),
+    ('2026-04-29', 1171, 2, 336.72),
+    ('2026-04-30', 1097, 4, 340.32),
+    ('2026-04-30', 1135, 3, 476.61),
+    ('2026-04-30', 1156, 5, 32.35),
+    ('2026-04-30', 1173, 3, 173.19),
+    ('2026-05-01', 1078, 3, 210.15),
+    ('2026-05-01', 1146, 4, 806.31),
+    ('2026-05-01', 1164, 4, 479.44),
+    ('2026-05-02', 1036, 4, 309.92),
+    ('2026-05-02', 1122, 1, 302.34),
+    ('2026-05-02', 1142, 4, 178.48),
+    ('2026-05-03', 1053, 4, 253.56),
+    ('2026-05-03', 1066, 4, 421.84),
+    ('2026-05-03', 1104, 5, 361.85),
+    ('2026-05-03', 1111, 5, 316.45),
+    ('2026-05-04', 1040, 1, 172.46),
+    ('2026-05-04', 1096, 2, 169.48),
+    ('2026-05-04', 1120, 1, 274.2),
+    ('2026-05-04', 1171, 2, 267.42),
+    ('2026-05-04', 1173, 3, 47.55),
+    ('2026-05-05', 1132, 5, 467.05),
+    ('2026-05-05', 1176, 1, 422.73),
+    ('2026-05-05', 1179, 2, 266.58),
+    ('2026-05-05', 1185, 2, 476.64),
+    ('2026-05-06', 1032, 5, 177.3),
+    ('2026-05-06', 1038, 5, 652.04),
+    ('2026-05-07', 1056, 1, 351.86),
+    ('2026-05-07', 1097, 1, 134.66),
+    ('2026-05-07', 1134, 1, 71.38),
+    ('2026-05-07', 1142, 1, 301.4),
+    ('2026-05-07', 1146, 3, 153.42),
+    ('2026-05-07', 1171, 1, 460.35),
+    ('2026-05-07', 1183, 1, 278.47),
+    ('2026-05-08', 1125, 1, 123.37),
+    ('2026-05-09', 1073, 4, 365.76),
+    ('2026-05-09', 1155, 5, 441.3),
+    ('2026-05-09', 1160, 5, 391.95),
+    ('2026-05-09', 1190, 4, 77.48),
+    ('2026-05-10', 1125, 1, 310.53),
+    ('2026-05-11', 1117, 4, 127.84),
+    ('2026-05-11', 1124, 3, 405.54),
+    ('2026-05-11', 1147, 4, 490.8),
+    ('2026-05-12', 1045, 4, 108.44),
+    ('2026-05-12', 1046, 5, 354.0),
+    ('2026-05-12', 1065, 1, 435.87),
+    ('2026-05-12', 1120, 1, 80.68),
+    ('2026-05-12', 1177, 4, 427.84),
+    ('2026-05-13', 1085, 4, 61.44),
+    ('2026-05-13', 1120, 3, 169.29),
+    ('2026-05-13', 1175, 3, 328.35),
+    ('2026-05-14', 1076, 5, 460.7),
+    ('2026-05-14', 1160, 3, 242.82),
+    ('2026-05-15', 1037, 4, 197.0),
+    ('2026-05-15', 1066, 1, 336.82),
+    ('2026-05-15', 1077, 3, 221.82),
+    ('2026-05-15', 1084, 4, 30.12),
+    ('2026-05-15', 1085, 5, 114.6),
+    ('2026-05-15', 1176, 1, 130.98),
+    ('2026-05-16', 1115, 4, 177.32),
+    ('2026-05-16', 1199, 2, 303.18),
+    ('2026-05-17', 1157, 1, 495.45),
+    ('2026-05-17', 1170, 2, 143.86),
+    ('2026-05-18', 1158, 4, 438.32),
+    ('2026-05-18', 1164, 6, 864.28),
+    ('2026-05-18', 1168, 1, 34.27),
+    ('2026-05-19', 1019, 3, 85.77),
+    ('2026-05-19', 1148, 4, 111.4),
+    ('2026-05-20', 1027, 2, 119.12),
+    ('2026-05-20', 1142, 1, 476.19),
+    ('2026-05-20', 1149, 1, 150.29),
+    ('2026-05-20', 1150, 5, 240.95),
+    ('2026-05-20', 1187, 4, 408.52),
+    ('2026-05-21', 1053, 2, 348.44),
+    ('2026-05-21', 1065, 1, 295.0),
+    ('2026-05-21', 1105, 2, 326.02),
+    ('2026-05-21', 1135, 2, 314.38),
+    ('2026-05-21', 1150, 4, 70.68),
+    ('2026-05-22', 1141, 2, 393.88),
+    ('2026-05-22', 1185, 3, 172.59),
+    ('2026-05-23', 1090, 2, 439.86),
+    ('2026-05-23', 1179, 5, 109.65),
+    ('2026-05-24', 1085, 5, 456.7),
+    ('2026-05-24', 1148, 2, 132.9),
+    ('2026-05-24', 1165, 2, 179.6),
+    ('2026-05-25', 1054, 4, 198.2),
+    ('2026-05-25', 1135, 5, 394.8),
+    ('2026-05-25', 1142, 3, 75.15),
+    ('2026-05-25', 1188, 2, 471.46),
+    ('2026-05-26', 1071, 5, 110.15),
+    ('2026-05-26', 1160, 5, 38.45),
+    ('2026-05-27', 1144, 5, 46.55),
+    ('2026-05-27', 1172, 2, 398.32),
+    ('2026-05-28', 1186, 5, 270.6),
+    ('2026-05-29', 1010, 2, 243.2),
+    ('2026-05-29', 1013, 4, 223.64),
+    ('2026-05-29', 1018, 1, 128.53),
+    ('2026-05-29', 1048, 1, 143.71),
+    ('2026-05-30', 1076, 5, 419.1),
+    ('2026-05-30', 1090, 1, 325.95),
+    ('2026-05-31', 1022, 4, 357.24),
+    ('2026-05-31', 1045, 4, 356.32),
+    ('2026-05-31', 1160, 2, 134.84),
+    ('2026-05-31', 1199, 2, 391.32),
+    ('2026-06-01', 1115, 2, 136.5),
+    ('2026-06-01', 1186, 2, 307.04),
+    ('2026-06-02', 1064, 4, 458.2),
+    ('2026-06-02', 1066, 3, 70.47),
+    ('2026-06-02', 1073, 3, 384.99),
+    ('2026-06-02', 1090, 5, 362.65),
+    ('2026-06-02', 1135, 4, 214.8),
+    ('2026-06-02', 1146, 5, 168.4),
+    ('2026-06-02', 1188, 2, 451.44),
+    ('2026-06-03', 1001, 5, 171.6),
+    ('2026-06-03', 1062, 1, 319.34),
+    ('2026-06-03', 1094, 2, 458.52),
+    ('2026-06-03', 1141, 4, 67.52),
+    ('2026-06-03', 1199, 4, 235.16),
+    ('2026-06-04', 1014, 1, 391.19),
+    ('2026-06-04', 1056, 3, 232.47),
+    ('2026-06-04', 1082, 3, 352.41),
+    ('2026-06-04', 1090, 1, 372.18),
+    ('2026-06-05', 1096, 3, 473.55),
+    ('2026-06-05', 1135, 2, 73.92),
+    ('2026-06-05', 1183, 1, 145.88),
+    ('2026-06-06', 1124, 1, 459.0),
+    ('2026-06-07', 1029, 4, 419.4),
+    ('2026-06-07', 1079, 4, 199.92),
+    ('2026-06-07', 1122, 1, 305.28),
+    ('2026-06-07', 1135, 1, 243.58),
+    ('2026-06-07', 1150, 1, 286.09),
+    ('2026-06-07', 1173, 3, 440.37),
+    ('2026-06-07', 1190, 5, 145.65),
+    ('2026-06-08', 1023, 4, 139.28),
+    ('2026-06-08', 1034, 3, 130.74),
+    ('2026-06-08', 1125, 4, 86.32),
+    ('2026-06-08', 1174, 1, 99.07),
+    ('2026-06-09', 1107, 4, 153.12),
+    ('2026-06-09', 1127, 1, 293.08),
+    ('2026-06-09', 1141, 5, 297.25),
+    ('2026-06-09', 1183, 2, 126.68),
+    ('2026-06-10', 1019, 4, 426.4),
+    ('2026-06-10', 1123, 4, 425.12),
+    ('2026-06-10', 1140, 3, 72.99),
+    ('2026-06-11', 1022, 4, 186.32),
+    ('2026-06-11', 1075, 4, 331.16),
+    ('2026-06-11', 1094, 1, 262.44),
+    ('2026-06-11', 1128, 3, 385.15),
+    ('2026-06-11', 1135, 3, 125.79),
+    ('2026-06-11', 1141, 1, 61.49),
+    ('2026-06-11', 1142, 2, 345.94),
+    ('2026-06-11', 1170, 5, 246.2),
+    ('2026-06-11', 1190, 2, 121.42),
+    ('2026-06-12', 1026, 5, 94.9),
+    ('2026-06-12', 1036, 3, 195.0),
+    ('2026-06-12', 1071, 1, 164.02),
+    ('2026-06-12', 1107, 2, 112.38),
+    ('2026-06-12', 1111, 5, 31.9),
+    ('2026-06-12', 1118, 5, 107.0),
+    ('2026-06-12', 1122, 5, 411.55),
+    ('2026-06-12', 1150, 1, 282.1),
+    ('2026-06-12', 1168, 5, 347.45),
+    ('2026-06-13', 1018, 1, 128.8),
+    ('2026-06-13', 1034, 1, 329.92),
+    ('2026-06-13', 1064, 1, 320.06),
+    ('2026-06-13', 1149, 2, 243.84),
+    ('2026-06-13', 1160, 1, 309.64),
+    ('2026-06-13', 1174, 4, 469.92),
+    ('2026-06-14', 1028, 4, 443.72),
+    ('2026-06-14', 1037, 5, 107.15),
+    ('2026-06-14', 1076, 1, 463.95),
+    ('2026-06-14', 1186, 5, 313.8),
+    ('2026-06-15', 1080, 4, 180.0),
+    ('2026-06-15', 1106, 1, 419.64),
+    ('2026-06-15', 1137, 5, 370.15),
+    ('2026-06-15', 1173, 4, 234.4),
+    ('2026-06-16', 1039, 4, 370.28),
+    ('2026-06-16', 1108, 4, 146.44),
+    ('2026-06-16', 1150, 2, 207.32),
+    ('2026-06-17', 1069, 4, 255.16),
+    ('2026-06-18', 1036, 1, 428.13),
+    ('2026-06-18', 1062, 3, 316.08),
+    ('2026-06-18', 1099, 1, 43.43),
+    ('2026-06-18', 1108, 4, 429.72),
+    ('2026-06-18', 1176, 4, 308.12),
+    ('2026-06-19', 1038, 5, 447.65),
+    ('2026-06-19', 1128, 2, 414.92),
+    ('2026-06-19', 1198, 5, 57.2),
+    ('2026-06-20', 1018, 3, 276.81),
+    ('2026-06-20', 1024, 5, 208.95),
+    ('2026-06-21', 1148, 4, 332.6),
+    ('2026-06-21', 1168, 3, 395.64),
+    ('2026-06-21', 1186, 3, 334.86),
+    ('2026-06-21', 1198, 4, 220.8),
+    ('2026-06-22', 1103, 2, 34.16),
+    ('2026-06-22', 1175, 2, 109.62),
+    ('2026-06-22', 1183, 4, 475.28),
+    ('2026-06-23', 1081, 2, 372.98),
+    ('2026-06-23', 1111, 2, 222.88),
+    ('2026-06-23', 1140, 2, 282.56),
+    ('2026-06-23', 1187, 4, 139.16),
+    ('2026-06-24', 1137, 3, 130.77),
+    ('2026-06-25', 1010, 5, 496.0),
+    ('2026-06-25', 1022, 4, 233.76),
+    ('2026-06-25', 1128, 1, 40.5),
+    ('2026-06-25', 1134, 4, 277.6),
+    ('2026-06-25', 1142, 2, 93.78),
+    ('2026-06-25', 1168, 2, 231.92),
+    ('2026-06-26', 1089, 4, 289.6),
+    ('2026-06-26', 1107, 2, 102.76),
+    ('2026-06-26', 1158, 3, 182.94),
+    ('2026-06-26', 1164, 5, 378.45),
+    ('2026-06-27', 1048, 2, 257.44),
+    ('2026-06-27', 1068, 1, 218.42),
+    ('2026-06-27', 1075, 4, 215.6),
+    ('2026-06-27', 1142, 1, 388.89),
+    ('2026-06-28', 1028, 1, 265.95),
+    ('2026-06-28', 1089, 2, 315.68),
+    ('2026-06-28', 1104, 4, 120.76),
+    ('2026-06-28', 1164, 3, 473.94),
+    ('2026-06-29', 1076, 5, 275.7),
+    ('2026-06-29', 1137, 4, 416.96),
+    ('2026-06-29', 1141, 4, 33.16),
+    ('2026-06-29', 1146, 5, 374.45),
+    ('2026-06-29', 1183, 2, 436.2),
+    ('2026-06-30', 1141, 4, 428.76),
+    ('2026-06-30', 1176, 4, 303.76),
+    ('2026-06-30', 1185, 1, 482.33),
+    ('2026-07-01', 1046, 5, 489.7),
+    ('2026-07-01', 1054, 1, 92.69),
+    ('2026-07-01', 1099, 1, 280.7),
+    ('2026-07-01', 1111, 4, 300.2),
+    ('2026-07-01', 1130, 4, 278.24),
+    ('2026-07-02', 1057, 1, 107.07),
+    ('2026-07-02', 1059, 3, 89.28),
+    ('2026-07-02', 1175, 5, 451.35),
+    ('2026-07-02', 1181, 5, 192.95),
+    ('2026-07-02', 1182, 3, 141.75),
+    ('2026-07-02', 1186, 1, 273.57),
+    ('2026-07-02', 1196, 4, 441.2),
+    ('2026-07-03', 1066, 1, 374.9),
+    ('2026-07-03', 1068, 5, 531.5),
+    ('2026-07-03', 1108, 5, 388.1),
+    ('2026-07-03', 1124, 4, 122.64),
+    ('2026-07-03', 1142, 1, 209.76),
+    ('2026-07-04', 1018, 4, 209.64),
+    ('2026-07-04', 1038, 3, 365.07),
+    ('2026-07-04', 1150, 2, 448.72),
+    ('2026-07-04', 1183, 3, 471.12),
+    ('2026-07-05', 1038, 2, 450.44),
+    ('2026-07-05', 1105, 1, 200.28),
+    ('2026-07-05', 1127, 2, 492.36),
+    ('2026-07-05', 1128, 1, 102.02),
+    ('2026-07-05', 1175, 3, 390.57),
+    ('2026-07-06', 1034, 3, 353.76),
+    ('2026-07-06', 1054, 2, 271.86),
+    ('2026-07-06', 1122, 3, 44.31),
+    ('2026-07-06', 1150, 5, 245.25),
+    ('2026-07-07', 1076, 2, 156.12),
+    ('2026-07-07', 1134, 3, 255.63),
+    ('2026-07-08', 1014, 2, 232.64),
+    ('2026-07-08', 1040, 3, 244.32),
+    ('2026-07-08', 1144, 4, 377.08),
+    ('2026-07-08', 1160, 1, 65.85),
+    ('2026-07-09', 1026, 2, 70.62),
+    ('2026-07-09', 1033, 3, 452.01),
+    ('2026-07-09', 1039, 4, 371.92),
+    ('2026-07-09', 1104, 1, 164.81),
+    ('2026-07-09', 1127, 1, 276.7),
+    ('2026-07-10', 1029, 4, 50.16),
+    ('2026-07-10', 1182, 4, 97.12),
+    ('2026-07-11', 1068, 5, 244.4),
+    ('2026-07-11', 1128, 3, 336.57),
+    ('2026-07-11', 1164, 1, 28.37),
+    ('2026-07-11', 1168, 4, 217.96),
+    ('2026-07-12', 1012, 2, 445.38),
+    ('2026-07-12', 1027, 5, 443.55),
+    ('2026-07-12', 1084, 3, 211.14),
+    ('2026-07-12', 1142, 4, 143.04),
+    ('2026-07-13', 1179, 5, 79.45),
+    ('2026-07-14', 1128, 2, 34.48),
+    ('2026-07-14', 1135, 4, 343.92),
+    ('2026-07-14', 1164, 3, 446.82),
+    ('2026-07-15', 1002, 4, 419.44),
+    ('2026-07-15', 1074, 5, 248.25),
+    ('2026-07-15', 1192, 5, 471.2),
+    ('2026-07-16', 1037, 5, 181.9),
+    ('2026-07-16', 1064, 4, 174.0),
+    ('2026-07-16', 1068, 4, 208.92),
+    ('2026-07-16', 1146, 2, 202.28),
+    ('2026-07-16', 1147, 3, 270.45),
+    ('2026-07-16', 1150, 4, 44.48),
+    ('2026-07-17', 1081, 4, 304.12),
+    ('2026-07-17', 1105, 5, 120.55),
+    ('2026-07-17', 1141, 4, 485.72),
+    ('2026-07-17', 1142, 5, 128.3),
+    ('2026-07-18', 1038, 4, 393.08),
+    ('2026-07-18', 1044, 5, 86.55),
+    ('2026-07-18', 1080, 1, 314.94),
+    ('2026-07-19', 1035, 4, 107.0),
+    ('2026-07-19', 1044, 4, 487.52),
+    ('2026-07-19', 1057, 2, 430.28),
+    ('2026-07-19', 1067, 3, 499.74),
+    ('2026-07-19', 1099, 2, 249.64),
+    ('2026-07-19', 1105, 3, 285.66),
+    ('2026-07-19', 1108, 5, 71.5),
+    ('2026-07-19', 1146, 8, 573.4),
+    ('2026-07-19', 1156, 4, 146.28),
+    ('2026-07-19', 1173, 3, 276.45),
+    ('2026-07-19', 1179, 2, 109.0),
+    ('2026-07-20', 1038, 5, 35.25),
+    ('2026-07-20', 1104, 3, 260.46),
+    ('2026-07-20', 1118, 5, 380.9),
+    ('2026-07-20', 1124, 2, 427.52),
+    ('2026-07-20', 1156, 2, 395.54),
+    ('2026-07-21', 1028, 2, 383.2),
+    ('2026-07-21', 1089, 5, 190.35),
+    ('2026-07-21', 1135, 5, 487.3),
+    ('2026-07-22', 1090, 5, 53.9),
+    ('2026-07-22', 1120, 5, 220.95),
+    ('2026-07-23', 1048, 4, 228.32),
+    ('2026-07-23', 1060, 4, 140.24),
+    ('2026-07-23', 1090, 1, 474.45),
+    ('2026-07-23', 1133, 4, 365.56),
+    ('2026-07-23', 1156, 3, 149.49),
+    ('2026-07-23', 1161, 5, 144.2),
+    ('2026-07-24', 1099, 4, 42.92),
+    ('2026-07-24', 1125, 5, 344.3),
+    ('2026-07-24', 1148, 5, 276.75),
+    ('2026-07-25', 1002, 3, 187.41),
+    ('2026-07-25', 1043, 1, 396.7),
+    ('2026-07-25', 1056, 2, 486.14),
+    ('2026-07-26', 1074, 2, 213.16),
+    ('2026-07-26', 1156, 2, 166.28),
+    ('2026-07-27', 1138, 1, 129.17),
+    ('2026-07-27', 1174, 5, 475.65),
+    ('2026-07-27', 1175, 5, 203.1),
+    ('2026-07-28', 1029, 5, 337.9),
+    ('2026-07-28', 1084, 2, 473.6),
+    ('2026-07-29', 1053, 2, 144.48),
+    ('2026-07-29', 1057, 5, 179.85),
+    ('2026-07-29', 1060, 3, 379.59),
+    ('2026-07-29', 1090, 2, 88.72),
+    ('2026-07-29', 1148, 2, 305.28),
+    ('2026-07-29', 1165, 2, 302.16),
+    ('2026-07-29', 1171, 3, 254.4),
+    ('2026-07-30', 1034, 3, 318.33),
+    ('2026-07-30', 1075, 2, 89.88),
+    ('2026-07-30', 1123, 5, 133.3),
+    ('2026-07-30', 1148, 4, 194.68),
+    ('2026-07-31', 1172, 5, 412.4),
+    ('2026-08-01', 1024, 1, 331.71),
+    ('2026-08-01', 1108, 4, 229.32),
+    ('2026-08-01', 1175, 5, 213.95),
+    ('2026-08-02', 1023, 3, 428.37),
+    ('2026-08-02', 1024, 1, 173.5),
+    ('2026-08-02', 1074, 5, 352.7),
+    ('2026-08-02', 1150, 5, 439.8),
+    ('2026-08-02', 1157, 3, 232.83),
+    ('2026-08-02', 1160, 5, 93.3),
+    ('2026-08-03', 1054, 4, 345.16),
+    ('2026-08-03', 1158, 4, 395.76),
+    ('2026-08-03', 1188, 5, 38.45),
+    ('2026-08-04', 1025, 2, 132.32),
+    ('2026-08-04', 1170, 2, 132.78),
+    ('2026-08-04', 1173, 1, 175.72),
+    ('2026-08-05', 1023, 4, 449.4),
+    ('2026-08-05', 1064, 4, 72.4),
+    ('2026-08-06', 1069, 2, 435.96),
+    ('2026-08-06', 1106, 1, 176.95),
+    ('2026-08-06', 1148, 5, 403.5),
+    ('2026-08-06', 1149, 2, 311.86),
+    ('2026-08-06', 1179, 2, 454.36),
+    ('2026-08-08', 1019, 1, 214.61),
+    ('2026-08-08', 1028, 2, 29.28),
+    ('2026-08-08', 1037, 5, 222.45),
+    ('2026-08-08', 1142, 5, 231.15),
+    ('2026-08-08', 1172, 4, 409.24),
+    ('2026-08-09', 1035, 2, 128.46),
+    ('2026-08-09', 1137, 4, 409.28),
+    ('2026-08-09', 1142, 5, 35.9),
+    ('2026-08-09', 1146, 1, 298.91),
+    ('2026-08-10', 1014, 5, 498.85),
+    ('2026-08-10', 1034, 1, 49.81),
+    ('2026-08-10', 1056, 2, 443.16),
+    ('2026-08-10', 1066, 5, 283.85),
+    ('2026-08-10', 1127, 1, 191.11),
+    ('2026-08-10', 1132, 4, 377.8),
+    ('2026-08-11', 1022, 4, 390.4),
+    ('2026-08-12', 1054, 2, 400.28),
+    ('2026-08-12', 1120, 1, 91.82),
+    ('2026-08-12', 1168, 5, 259.5),
+    ('2026-08-13', 1075, 4, 185.72),
+    ('2026-08-13', 1149, 4, 479.68),
+    ('2026-08-13', 1168, 2, 468.52),
+    ('2026-08-13', 1190, 4, 488.52),
+    ('2026-08-14', 1111, 4, 414.12),
+    ('2026-08-14', 1164, 4, 351.28),
+    ('2026-08-15', 1043, 4, 179.76),
+    ('2026-08-15', 1179, 4, 72.4),
+    ('2026-08-15', 1199, 3, 409.8),
+    ('2026-08-16', 1090, 2, 128.04),
+    ('2026-08-16', 1150, 5, 248.45),
+    ('2026-08-16', 1183, 3, 22.8),
+    ('2026-08-17', 1044, 3, 172.8),
+    ('2026-08-17', 1090, 4, 237.84),
+    ('2026-08-17', 1146, 4, 141.0),
+    ('2026-08-17', 1174, 1, 446.96),
+    ('2026-08-17', 1181, 2, 421.6),
+    ('2026-08-17', 1186, 2, 383.24),
+    ('2026-08-19', 1017, 2, 72.24),
+    ('2026-08-19', 1029, 4, 445.92),
+    ('2026-08-19', 1032, 5, 170.45),
+    ('2026-08-19', 1044, 3, 310.62),
+    ('2026-08-19', 1111, 5, 332.45),
+    ('2026-08-19', 1141, 4, 376.04),
+    ('2026-08-19', 1146, 4, 215.48),
+    ('2026-08-20', 1033, 4, 431.96),
+    ('2026-08-20', 1199, 4, 61.08),
+    ('2026-08-21', 1042, 3, 227.22),
+    ('2026-08-21', 1173, 2, 478.44),
+    ('2026-08-21', 1177, 1, 420.83),
+    ('2026-08-21', 1179, 3, 41.07),
+    ('2026-08-22', 1017, 4, 499.68),
+    ('2026-08-22', 1125, 2, 451.82),
+    ('2026-08-22', 1150, 3, 20.73),
+    ('2026-08-22', 1152, 1, 479.8),
+    ('2026-08-23', 1046, 3, 496.2),
+    ('2026-08-23', 1062, 3, 304.02),
+    ('2026-08-23', 1084, 4, 70.28),
+    ('2026-08-23', 1103, 4, 71.68),
+    ('2026-08-23', 1125, 3, 459.24),
+    ('2026-08-23', 1128, 1, 475.75),
+    ('2026-08-23', 1161, 1, 116.6),
+    ('2026-08-23', 1195, 3, 264.54),
+    ('2026-08-24', 1112, 2, 469.04),
+    ('2026-08-24', 1173, 2, 79.36),
+    ('2026-08-25', 1111, 4, 130.4),
+    ('2026-08-25', 1150, 1, 442.64),
+    ('2026-08-25', 1168, 1, 79.82),
+    ('2026-08-26', 1069, 4, 166.4),
+    ('2026-08-26', 1146, 5, 36.0),
+    ('2026-08-26', 1150, 1, 294.47),
+    ('2026-08-26', 1182, 5, 262.7),
+    ('2026-08-27', 1042, 4, 68.92),
+    ('2026-08-27', 1044, 4, 446.4),
+    ('2026-08-27', 1128, 5, 452.35),
+    ('2026-08-27', 1138, 4, 157.88),
+    ('2026-08-27', 1146, 5, 420.65),
+    ('2026-08-27', 1185, 2, 160.96),
+    ('2026-08-28', 1014, 5, 156.15),
+    ('2026-08-28', 1076, 1, 346.7),
+    ('2026-08-28', 1082, 5, 156.45),
+    ('2026-08-29', 1014, 1, 237.7),
+    ('2026-08-29', 1069, 2, 102.28),
+    ('2026-08-29', 1074, 1, 163.88),
+    ('2026-08-29', 1104, 4, 93.12),
+    ('2026-08-29', 1176, 5, 416.1),
+    ('2026-08-30', 1019, 5, 344.25),
+    ('2026-08-30', 1108, 6, 712.48),
+    ('2026-08-30', 1111, 5, 176.5),
+    ('2026-08-30', 1158, 2, 179.6),
+    ('2026-08-31', 1049, 1, 147.31),
+    ('2026-08-31', 1115, 4, 188.24),
+    ('2026-08-31', 1142, 3, 400.29),
+    ('2026-08-31', 1161, 4, 363.24),
+    ('2026-09-01', 1047, 4, 46.56),
+    ('2026-09-01', 1108, 2, 50.72),
+    ('2026-09-02', 1038, 4, 283.36),
+    ('2026-09-02', 1062, 5, 279.0),
+    ('2026-09-02', 1116, 2, 119.84),
+    ('2026-09-02', 1122, 2, 291.02),
+    ('2026-09-02', 1146, 4, 333.84),
+    ('2026-09-02', 1150, 3, 377.76),
+    ('2026-09-03', 1077, 4, 103.84),
+    ('2026-09-03', 1078, 5, 93.5),
+    ('2026-09-03', 1128, 5, 236.25),
+    ('2026-09-03', 1149, 3, 456.75),
+    ('2026-09-03', 1164, 1, 130.36),
+    ('2026-09-04', 1024, 4, 292.0),
+    ('2026-09-04', 1084, 4, 38.04),
+    ('2026-09-04', 1122, 1, 439.7),
+    ('2026-09-04', 1192, 2, 496.44),
+    ('2026-09-05', 1018, 1, 261.75),
+    ('2026-09-05', 1142, 4, 359.64),
+    ('2026-09-05', 1152, 4, 82.08),
+    ('2026-09-06', 1017, 5, 66.45),
+    ('2026-09-06', 1019, 2, 450.76),
+    ('2026-09-06', 1066, 4, 476.8),
+    ('2026-09-07', 1047, 2, 395.76),
+    ('2026-09-07', 1099, 4, 129.24),
+    ('2026-09-07', 1149, 3, 315.27),
+    ('2026-09-07', 1176, 1, 23.05),
+    ('2026-09-08', 1016, 5, 68.55),
+    ('2026-09-08', 1018, 1, 370.69),
+    ('2026-09-08', 1056, 5, 60.05),
+    ('2026-09-08', 1058, 1, 178.4),
+    ('2026-09-08', 1118, 3, 399.18),
+    ('2026-09-08', 1142, 3, 45.66),
+    ('2026-09-08', 1164, 3, 306.87),
+    ('2026-09-09', 1057, 2, 293.3),
+    ('2026-09-09', 1183, 3, 167.4),
+    ('2026-09-10', 1026, 3, 325.68),
+    ('2026-09-10', 1036, 1, 257.01),
+    ('2026-09-10', 1053, 4, 496.08),
+    ('2026-09-10', 1055, 4, 74.48),
+    ('2026-09-10', 1107, 2, 74.46),
+    ('2026-09-10', 1115, 1, 259.17),
+    ('2026-09-10', 1141, 1, 25.59),
+    ('2026-09-10', 1146, 4, 463.6),
+    ('2026-09-10', 1148, 3, 128.91),
+    ('2026-09-10', 1161, 9, 259.19),
+    ('2026-09-10', 1196, 2, 138.44),
+    ('2026-09-11', 1048, 2, 192.04),
+    ('2026-09-11', 1113, 5, 112.55),
+    ('2026-09-11', 1137, 1, 136.58),
+    ('2026-09-11', 1138, 3, 409.32),
+    ('2026-09-12', 1148, 5, 336.35),
+    ('2026-09-12', 1149, 1, 227.52),
+    ('2026-09-12', 1170, 2, 280.08),
+    ('2026-09-12', 1177, 5, 372.3),
+    ('2026-09-13', 1035, 3, 372.96),
+    ('2026-09-13', 1106, 4, 54.16),
+    ('2026-09-13', 1186, 1, 367.01),
+    ('2026-09-14', 1071, 1, 400.54),
+    ('2026-09-14', 1090, 3, 369.24),
+    ('2026-09-14', 1116, 3, 100.77),
+    ('2026-09-15', 1120, 4, 228.24),
+    ('2026-09-15', 1127, 2, 312.88),
+    ('2026-09-15', 1157, 5, 50.0),
+    ('2026-09-16', 1060, 5, 226.1),
+    ('2026-09-16', 1097, 1, 215.25),
+    ('2026-09-16', 1128, 5, 31.45),
+    ('2026-09-16', 1138, 1, 203.41),
+    ('2026-09-17', 1164, 4, 467.44),
+    ('2026-09-17', 1185, 3, 228.3),
+    ('2026-09-18', 1048, 3, 221.31),
+    ('2026-09-18', 1160, 1, 77.82),
+    ('2026-09-19', 1003, 3, 485.73),
+    ('2026-09-19', 1156, 1, 455.01),
+    ('2026-09-19', 1192, 1, 107.08),
+    ('2026-09-20', 1120, 1, 166.88),
+    ('2026-09-20', 1152, 3, 472.08),
+    ('2026-09-21', 1022, 4, 39.72),
+    ('2026-09-21', 1084, 4, 82.12),
+    ('2026-09-22', 1107, 5, 484.0),
+    ('2026-09-22', 1112, 4, 371.92),
+    ('2026-09-22', 1138, 3, 269.85),
+    ('2026-09-22', 1164, 1, 322.03),
+    ('2026-09-22', 1170, 3, 116.37),
+    ('2026-09-22', 1179, 2, 131.4),
+    ('2026-09-22', 1198, 3, 174.15),
+    ('2026-09-23', 1078, 2, 315.98),
+    ('2026-09-23', 1094, 4, 288.32),
+    ('2026-09-24', 1111, 2, 252.4),
+    ('2026-09-24', 1142, 5, 102.2),
+    ('2026-09-25', 1027, 2, 29.72),
+    ('2026-09-25', 1047, 5, 498.3),
+    ('2026-09-25', 1108, 2, 434.6),
+    ('2026-09-25', 1113, 1, 188.12),
+    ('2026-09-25', 1158, 3, 305.46),
+    ('2026-09-25', 1175, 1, 278.77),
+    ('2026-09-26', 1116, 3, 380.43),
+    ('2026-09-26', 1150, 3, 493.83),
+    ('2026-09-26', 1157, 1, 416.35),
+    ('2026-09-26', 1176, 4, 167.72),
+    ('2026-09-27', 1044, 2, 85.0),
+    ('2026-09-27', 1046, 5, 114.1),
+    ('2026-09-27', 1084, 1, 438.28),
+    ('2026-09-28', 1165, 1, 133.35),
+    ('2026-09-29', 1148, 2, 293.6),
+    ('2026-09-29', 1173, 5, 68.65),
+    ('2026-09-30', 1084, 2, 219.36),
+    ('2026-09-30', 1183, 2, 176.72),
+    ('2026-10-01', 1113, 2, 23.12),
+    ('2026-10-01', 1157, 5, 57.55),
+    ('2026-10-02', 1123, 5, 103.45),
+    ('2026-10-02', 1141, 3, 235.89),
+    ('2026-10-02', 1150, 1, 243.01),
+    ('2026-10-03', 1012, 2, 278.36),
+    ('2026-10-03', 1023, 3, 125.04),
+    ('2026-10-03', 1027, 4, 163.4),
+    ('2026-10-03', 1056, 5, 63.2),
+    ('2026-10-03', 1060, 4, 153.44),
+    ('2026-10-03', 1075, 5, 135.75),
+    ('2026-10-03', 1103, 2, 380.22),
+    ('2026-10-03', 1141, 3, 246.75),
+    ('2026-10-03', 1142, 5, 90.05),
+    ('2026-10-03', 1164, 1, 256.53),
+    ('2026-10-04', 1094, 4, 231.6),
+    ('2026-10-04', 1108, 2, 332.72),
+    ('2026-10-05', 1161, 4, 346.08),
+    ('2026-10-05', 1164, 3, 395.43),
+    ('2026-10-06', 1028, 5, 421.85),
+    ('2026-10-06', 1035, 3, 112.92),
+    ('2026-10-06', 1069, 3, 345.06),
+    ('2026-10-06', 1090, 4, 422.08),
+    ('2026-10-06', 1125, 2, 236.14),
+    ('2026-10-06', 1164, 5, 238.65),
+    ('2026-10-07', 1090, 2, 50.62),
+    ('2026-10-07', 1103, 1, 28.15),
+    ('2026-10-07', 1135, 1, 66.93),
+    ('2026-10-07', 1142, 3, 188.31),
+    ('2026-10-07', 1155, 4, 344.64),
+    ('2026-10-07', 1160, 1, 427.1),
+    ('2026-10-07', 1161, 5, 198.3),
+    ('2026-10-08', 1034, 4, 328.56),
+    ('2026-10-08', 1135, 2, 137.54),
+    ('2026-10-08', 1195, 5, 338.0),
+    ('2026-10-08', 1199, 1, 407.18),
+    ('2026-10-09', 1010, 5, 321.45),
+    ('2026-10-09', 1045, 1, 438.07),
+    ('2026-10-09', 1058, 5, 443.2),
+    ('2026-10-09', 1084, 1, 362.59),
+    ('2026-10-09', 1115, 4, 324.84),
+    ('2026-10-09', 1128, 4, 236.48),
+    ('2026-10-09', 1168, 1, 142.86),
+    ('2026-10-09', 1175, 2, 22.6),
+    ('2026-10-10', 1185, 5, 149.8),
+    ('2026-10-11', 1002, 2, 122.04),
+    ('2026-10-11', 1023, 4, 337.24),
+    ('2026-10-11', 1049, 3, 416.16),
+    ('2026-10-11', 1063, 1, 444.68),
+    ('2026-10-11', 1141, 4, 244.72),
+    ('2026-10-11', 1148, 5, 166.05),
+    ('2026-10-11', 1198, 3, 211.44),
+    ('2026-10-12', 1032, 4, 41.0),
+    ('2026-10-12', 1148, 4, 138.6),
+    ('2026-10-12', 1156, 4, 140.2),
+    ('2026-10-12', 1164, 3, 166.02),
+    ('2026-10-13', 1022, 4, 48.64),
+    ('2026-10-13', 1029, 4, 442.32),
+    ('2026-10-13', 1076, 4, 453.56),
+    ('2026-10-13', 1082, 2, 384.28),
+    ('2026-10-13', 1116, 5, 195.15),
+    ('2026-10-14', 1018, 3, 94.98),
+    ('2026-10-14', 1122, 4, 40.48),
+    ('2026-10-14', 1148, 5, 359.05),
+    ('2026-10-14', 1176, 2, 147.9),
+    ('2026-10-14', 1190, 5, 372.4),
+    ('2026-10-15', 1034, 3, 484.29),
+    ('2026-10-15', 1074, 5, 348.8),
+    ('2026-10-15', 1150, 3, 325.86),
+    ('2026-10-15', 1160, 3, 494.07),
+    ('2026-10-15', 1199, 5, 104.7),
+    ('2026-10-16', 1023, 4, 320.0),
+    ('2026-10-16', 1108, 1, 356.69),
+    ('2026-10-17', 1002, 4, 87.72),
+    ('2026-10-17', 1047, 5, 193.35),
+    ('2026-10-17', 1108, 3, 114.3),
+    ('2026-10-17', 1113, 4, 275.12),
+    ('2026-10-17', 1150, 2, 172.76),
+    ('2026-10-17', 1165, 5, 227.45),
+    ('2026-10-17', 1173, 5, 392.3);
 
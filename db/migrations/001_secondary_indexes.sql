@@ -0,0 +1,66 @@
+-- ============================================================
+-- File: 001_secondary_indexes.sql
+-- Purpose:
+--   Adds composite and covering indexes for the hot paths in
+--   db/analysis and db/automation:
+--     1) Upcoming published events, ordered by start time
+--     2) Tickets per event and status (GetEventSalesSummary)
+--     3) Orders per user
+--     4) Venues per city
+--     5) User listings ordered by last, first name
+--
+-- Notes:
+--   - Tickets per user keep the FK index on ticket(user_id): a wider
+--     (user_id, event_id) index measured no fewer rows read (the
+--     lookups need price and order_id from the row anyway), so it was
+--     only extra insert cost.
+--   - Apply once on top of db/schema.sql; roll back with
+--     001_secondary_indexes_down.sql.
+--   - Indexes whose leading column is an FK column replace the index
+--     InnoDB created for that FK (it is dropped automatically).
+--   - Every ticket insert now maintains a wider event index instead of
+--     the single-column one; see 001_secondary_indexes.md for the
+--     measured query and insert cost.
+--   - SQLite stand-in: 001_secondary_indexes_sqlite.sql.
+-- ============================================================
+
+USE eventify_db;
+
+-- ------------------------------------------------------------
+-- EVENT
+-- ------------------------------------------------------------
+-- WHERE status = 'Published' AND start_time > NOW() ORDER BY start_time:
+-- equality on status, then a range scan already sorted by start_time (no filesort)
+CREATE INDEX IX_EventStatusStart ON event (status, start_time);
+
+-- ------------------------------------------------------------
+-- TICKET
+-- ------------------------------------------------------------
+-- WHERE event_id = ? AND status = 'Purchased', COUNT(*) / SUM(price):
+-- covering, so sales summaries never touch the clustered rows.
+-- Replaces the FK index on event_id.
+CREATE INDEX IX_TicketEventStatus ON ticket (event_id, status, price);
+
+-- ------------------------------------------------------------
+-- ORDERS
+-- ------------------------------------------------------------
+-- WHERE user_id = ? (order history): covering, newest-first capable.
+-- Replaces the FK index on user_id.
+CREATE INDEX IX_OrderUserDate ON orders (user_id, order_date, status, total_amount);
+
+-- ------------------------------------------------------------
+-- VENUE
+-- ------------------------------------------------------------
+-- WHERE city = ? (upcoming events in a city)
+CREATE INDEX IX_VenueCity ON venue (city);
+
+-- ------------------------------------------------------------
+-- USER
+-- ------------------------------------------------------------
+-- ORDER BY last_name, first_name (full listing)
+CREATE INDEX IX_UserName ON user (last_name, first_name);
+
+-- WHERE status = ? [AND role = ?] ORDER BY last_name, first_name
+CREATE INDEX IX_UserStatusRoleName ON user (status, role, last_name, first_name);
+
+ANALYZE TABLE event, ticket, orders, venue, user;
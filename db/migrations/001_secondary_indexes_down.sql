@@ -0,0 +1,23 @@
+-- ============================================================
+-- File: 001_secondary_indexes_down.sql
+-- Purpose:
+--   Rolls back 001_secondary_indexes.sql.
+--
+-- Notes:
+--   - The plain FK indexes are recreated before the composite ones
+--     are dropped; InnoDB refuses to drop the last index usable by an FK.
+-- ============================================================
+
+USE eventify_db;
+
+CREATE INDEX FK_TicketEvent ON ticket (event_id);
+CREATE INDEX FK_OrderUser ON orders (user_id);
+
+DROP INDEX IX_EventStatusStart ON event;
+DROP INDEX IX_TicketEventStatus ON ticket;
+DROP INDEX IX_OrderUserDate ON orders;
+DROP INDEX IX_VenueCity ON venue;
+DROP INDEX IX_UserName ON user;
+DROP INDEX IX_UserStatusRoleName ON user;
+
+ANALYZE TABLE event, ticket, orders, venue, user;
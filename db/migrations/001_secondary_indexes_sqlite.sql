@@ -0,0 +1,25 @@
+-- ============================================================
+-- File: 001_secondary_indexes_sqlite.sql
+-- Purpose:
+--   SQLite stand-in for 001_secondary_indexes.sql (same index names
+--   and columns), used by seeds/measure_indexes.py.
+--
+-- Notes:
+--   - SQLite never drops indexes implicitly, so the replaced FK indexes
+--     from schema_sqlite.sql are dropped here explicitly.
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS IX_EventStatusStart ON event (status, start_time);
+
+CREATE INDEX IF NOT EXISTS IX_TicketEventStatus ON ticket (event_id, status, price);
+DROP INDEX IF EXISTS FK_TicketEvent;
+
+CREATE INDEX IF NOT EXISTS IX_OrderUserDate ON orders (user_id, order_date, status, total_amount);
+DROP INDEX IF EXISTS FK_OrderUser;
+
+CREATE INDEX IF NOT EXISTS IX_VenueCity ON venue (city);
+
+CREATE INDEX IF NOT EXISTS IX_UserName ON user (last_name, first_name);
+CREATE INDEX IF NOT EXISTS IX_UserStatusRoleName ON user (status, role, last_name, first_name);
+
+ANALYZE;
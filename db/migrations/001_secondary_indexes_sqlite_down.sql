@@ -0,0 +1,18 @@
+-- ============================================================
+-- File: 001_secondary_indexes_sqlite_down.sql
+-- Purpose:
+--   Rolls back 001_secondary_indexes_sqlite.sql (restores the FK
+--   indexes from schema_sqlite.sql).
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS FK_TicketEvent ON ticket (event_id);
+CREATE INDEX IF NOT EXISTS FK_OrderUser ON orders (user_id);
+
+DROP INDEX IF EXISTS IX_EventStatusStart;
+DROP INDEX IF EXISTS IX_TicketEventStatus;
+DROP INDEX IF EXISTS IX_OrderUserDate;
+DROP INDEX IF EXISTS IX_VenueCity;
+DROP INDEX IF EXISTS IX_UserName;
+DROP INDEX IF EXISTS IX_UserStatusRoleName;
+
+ANALYZE;
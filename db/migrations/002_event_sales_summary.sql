@@ -0,0 +1,43 @@
+-- ============================================================
+-- File: 002_event_sales_summary.sql
+-- Purpose:
+--   Adds event_sales_summary (per-event ticket counters) to an
+--   existing eventify_db and fills it from the current tickets.
+--
+-- Notes:
+--   - Fresh installs get the table from db/schema.sql instead.
+--   - Afterwards (re)source db/automation/triggers.sql and
+--     db/automation/procedures.sql for the sales_summary_* triggers,
+--     RebuildEventSalesSummary() and the new GetEventSalesSummary().
+--   - Run while no tickets are being sold: sales made between this
+--     backfill and the trigger install are not counted until
+--     CALL RebuildEventSalesSummary(NULL) is run.
+-- ============================================================
+
+USE eventify_db;
+
+CREATE TABLE IF NOT EXISTS event_sales_summary (
+    event_id INT PRIMARY KEY COMMENT 'FK to event',
+    purchased_count INT NOT NULL DEFAULT 0,
+    reserved_count INT NOT NULL DEFAULT 0,
+    refunded_count INT NOT NULL DEFAULT 0,
+    purchased_revenue DECIMAL(12, 2) NOT NULL DEFAULT 0
+        COMMENT 'Sum of price over Purchased tickets',
+    CONSTRAINT FK_SalesSummaryEvent FOREIGN KEY (event_id) REFERENCES event(event_id) ON DELETE CASCADE,
+    CONSTRAINT CHK_SalesSummaryCounts CHECK (purchased_count >= 0 AND reserved_count >= 0 AND refunded_count >= 0)
+) ENGINE=InnoDB;
+
+-- Backfill: one row per event, zero counts for events without tickets
+REPLACE INTO event_sales_summary (event_id, purchased_count, reserved_count, refunded_count, purchased_revenue)
+SELECT
+    e.event_id,
+    COALESCE(SUM(t.status = 'Purchased'), 0),
+    COALESCE(SUM(t.status = 'Reserved'), 0),
+    COALESCE(SUM(t.status = 'Refunded'), 0),
+    COALESCE(SUM(IF(t.status = 'Purchased', t.price, 0)), 0)
+FROM
+    event e
+LEFT JOIN
+    ticket t ON e.event_id = t.event_id
+GROUP BY
+    e.event_id;
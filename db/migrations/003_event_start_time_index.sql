@@ -0,0 +1,13 @@
+-- ============================================================
+-- File: 003_event_start_time_index.sql
+-- Purpose:
+--   Supports GetSalesSummaryByDateWindow(): a range on start_time
+--   across every status. IX_EventStatusStart (001) leads with
+--   status, so it cannot serve this range on its own.
+-- ============================================================
+
+USE eventify_db;
+
+CREATE INDEX IX_EventStartTime ON event (start_time);
+
+ANALYZE TABLE event;
@@ -0,0 +1,33 @@
+-- ============================================================
+-- File: 004_event_inventory.sql
+-- Purpose:
+--   Adds event_inventory (seats left per event) to an existing
+--   eventify_db and fills it from the current tickets.
+--
+-- Notes:
+--   - Fresh installs get the table from db/schema.sql instead.
+--   - Afterwards (re)source db/automation/triggers.sql: ticket
+--     inserts fail with 'Event is sold out' for events without an
+--     inventory row, so the backfill must come first.
+--   - Events that are already oversold start at 0 remaining.
+-- ============================================================
+
+USE eventify_db;
+
+CREATE TABLE IF NOT EXISTS event_inventory (
+    event_id INT PRIMARY KEY COMMENT 'FK to event',
+    remaining INT NOT NULL COMMENT 'Seats still available',
+    CONSTRAINT FK_InventoryEvent FOREIGN KEY (event_id) REFERENCES event(event_id) ON DELETE CASCADE,
+    CONSTRAINT CHK_InventoryRemaining CHECK (remaining >= 0)
+) ENGINE=InnoDB;
+
+REPLACE INTO event_inventory (event_id, remaining)
+SELECT
+    e.event_id,
+    GREATEST(0, e.capacity - COUNT(t.ticket_id))
+FROM
+    event e
+LEFT JOIN
+    ticket t ON e.event_id = t.event_id AND t.status IN ('Purchased', 'Reserved')
+GROUP BY
+    e.event_id, e.capacity;
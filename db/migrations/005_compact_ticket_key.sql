@@ -0,0 +1,168 @@
+-- ============================================================
+-- File: 005_compact_ticket_key.sql
+-- Purpose:
+--   OPT-IN. Replaces the VARCHAR(50) ticket primary key of
+--   db/schema.sql with a BIGINT surrogate key. The string ids
+--   (TKT-00000001, ...) are kept as the unique ticket_code.
+--   db/schema.sql keeps the VARCHAR key as the default.
+--
+-- Notes:
+--   - Why: InnoDB clusters ticket on its PK and copies the PK into
+--     every secondary index, so an 8-byte key should shrink each
+--     ticket index. The new UNIQUE ticket_code index costs about what
+--     three secondary indexes save.
+--   - Not measured on MySQL/InnoDB. The only measurement is SQLite
+--     (005_compact_ticket_key.md): 7% smaller and 17% faster inserts
+--     with the 12-character TKT-%08d ids, but a larger and slower
+--     table with the older 9-character ids. Run
+--     `python seeds/measure_ticket_key.py --engine mysql` on your
+--     server and apply this only if it shows a gain.
+--   - Limits once applied:
+--       * Only PurchaseTickets() and ListEventTicketsPage() are
+--         redefined below. Re-sourcing db/automation/procedures.sql
+--         puts back the VARCHAR versions; re-run this file's
+--         procedure section afterwards.
+--       * ListEventTicketsPage() now takes the last page's numeric
+--         ticket_id.
+--       * The seeds/ tools (generator, loaders, dumps, replay and
+--         stress scripts, user_lifecycle_demo.sql and the trigger test
+--         in db/analysis/ticket_queries.sql) only write the default
+--         layout. Do not load generated data into a migrated database.
+--       * db/schema_partitioned.sql assumes the default layout.
+--   - Existing tickets are numbered in their old (string) key order.
+--   - Rebuilds the table: run during a maintenance window.
+-- ============================================================
+
+USE eventify_db;
+
+ALTER TABLE ticket
+    DROP PRIMARY KEY,
+    CHANGE COLUMN ticket_id ticket_code VARCHAR(50) NOT NULL
+        COMMENT 'Human-readable ticket code (e.g. TKT-00000001)',
+    ADD COLUMN ticket_id BIGINT UNSIGNED NOT NULL AUTO_INCREMENT FIRST,
+    ADD PRIMARY KEY (ticket_id),
+    ADD CONSTRAINT UQ_TicketCode UNIQUE (ticket_code);
+
+ANALYZE TABLE ticket;
+
+
+-- ------------------------------------------------------------
+-- Procedures that name ticket's key columns
+-- ------------------------------------------------------------
+
+DROP PROCEDURE IF EXISTS PurchaseTickets;
+DROP PROCEDURE IF EXISTS ListEventTicketsPage;
+
+DELIMITER //
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `PurchaseTickets`(
+    IN p_user_id INT,
+    IN p_event_id INT,
+    IN p_qty INT,
+    IN p_unit_price DECIMAL(10, 2)
+)
+BEGIN
+    DECLARE v_event_status VARCHAR(50);
+    DECLARE v_order_id INT;
+    DECLARE v_remaining INT;
+
+    -- Bad arguments fail before the procedure touches any transaction,
+    -- so they leave the caller's work alone
+    IF p_qty IS NULL OR p_qty < 1 OR p_qty > 100 THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Error: Ticket quantity must be between 1 and 100.';
+    END IF;
+    IF p_unit_price IS NULL OR p_unit_price < 0 THEN
+        SIGNAL SQLSTATE '45000'
+        SET MESSAGE_TEXT = 'Error: Ticket price must be non-negative.';
+    END IF;
+
+    purchase: BEGIN
+        -- From here on any failure undoes the whole order; the handler only
+        -- covers this block, i.e. the procedure's own transaction
+        DECLARE EXIT HANDLER FOR SQLEXCEPTION
+        BEGIN
+            ROLLBACK;
+            RESIGNAL;
+        END;
+
+        START TRANSACTION;
+
+        SELECT status INTO v_event_status
+        FROM event
+        WHERE event_id = p_event_id;
+
+        IF v_event_status IS NULL THEN
+            SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'Error: Event does not exist.';
+        END IF;
+        IF v_event_status = 'Completed' OR v_event_status = 'Canceled' THEN
+            SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'Error: Cannot purchase a ticket for an event that is Canceled or Completed.';
+        END IF;
+
+        SELECT remaining INTO v_remaining
+        FROM event_inventory
+        WHERE event_id = p_event_id
+        FOR UPDATE;
+
+        IF COALESCE(v_remaining, 0) < p_qty THEN
+            SIGNAL SQLSTATE '45000'
+            SET MESSAGE_TEXT = 'Error: Not enough tickets left for this event.';
+        END IF;
+
+        INSERT INTO orders (user_id, total_amount, order_date, status)
+        VALUES (p_user_id, p_qty * p_unit_price, NOW(), 'Completed');
+        SET v_order_id = LAST_INSERT_ID();
+
+        -- ticket_id auto-increments; the string id becomes ticket_code
+        INSERT INTO ticket (ticket_code, order_id, event_id, user_id, price, status)
+        WITH RECURSIVE seq (n) AS (
+            SELECT 1
+            UNION ALL
+            SELECT n + 1 FROM seq WHERE n < p_qty
+        )
+        SELECT CONCAT('TKT-', v_order_id, '-', n), v_order_id, p_event_id, p_user_id, p_unit_price, 'Purchased'
+        FROM seq;
+
+        COMMIT;
+    END purchase;
+
+    SELECT order_id, ticket_id, ticket_code
+    FROM ticket
+    WHERE order_id = v_order_id
+    ORDER BY ticket_id;
+END //
+
+CREATE DEFINER=`root`@`localhost` PROCEDURE `ListEventTicketsPage`(
+    IN p_event_id INT,
+    IN p_after_ticket_id BIGINT UNSIGNED,
+    IN p_page_size INT
+)
+BEGIN
+    DECLARE v_page_size INT DEFAULT LEAST(GREATEST(COALESCE(p_page_size, 50), 1), 500);
+
+    SELECT
+        page.ticket_id,
+        page.ticket_code,
+        page.status,
+        page.price,
+        u.user_id,
+        u.first_name,
+        u.last_name,
+        u.email
+    FROM
+        (
+            SELECT ticket_id, ticket_code, status, price, user_id
+            FROM ticket
+            WHERE event_id = p_event_id AND ticket_id > COALESCE(p_after_ticket_id, 0)
+            ORDER BY ticket_id
+            LIMIT v_page_size
+        ) page
+    JOIN
+        user u ON u.user_id = page.user_id
+    ORDER BY
+        page.ticket_id;
+END //
+
+DELIMITER ;
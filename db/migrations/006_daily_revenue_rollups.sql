@@ -0,0 +1,49 @@
+-- ============================================================
+-- File: 006_daily_revenue_rollups.sql
+-- Purpose:
+--   Adds daily_event_revenue (revenue per order day and event) to an
+--   existing eventify_db and backfills it from all order history.
+--   Category revenue is grouped from it through event_category at
+--   query time, so it is never stale and no sale upserts a shared
+--   per-category row.
+--
+-- Notes:
+--   - Fresh installs get the tables from db/schema.sql instead.
+--   - Afterwards (re)source db/automation/procedures.sql and then
+--     db/automation/triggers.sql for ApplyRevenueDelta(),
+--     ApplyOrderRevenue(), RefreshRevenueRollups() and the
+--     revenue_* triggers.
+--   - Orders changed between this backfill and the trigger install
+--     are picked up by CALL RefreshRevenueRollups(NULL, NULL).
+-- ============================================================
+
+USE eventify_db;
+
+CREATE TABLE IF NOT EXISTS daily_event_revenue (
+    revenue_date DATE NOT NULL COMMENT 'DATE(orders.order_date)',
+    event_id INT NOT NULL COMMENT 'FK to event',
+    ticket_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(14, 2) NOT NULL DEFAULT 0 COMMENT 'Sum of ticket price',
+    PRIMARY KEY (revenue_date, event_id),
+    INDEX IX_EventRevenue (event_id, revenue),
+    CONSTRAINT FK_EventRevenueEvent FOREIGN KEY (event_id) REFERENCES event(event_id) ON DELETE CASCADE
+) ENGINE=InnoDB;
+
+-- Earlier drafts of this migration also kept a per-category rollup
+DROP TABLE IF EXISTS daily_category_revenue;
+
+-- Backfill: tickets of Completed orders, per order day
+REPLACE INTO daily_event_revenue (revenue_date, event_id, ticket_count, revenue)
+SELECT
+    DATE(o.order_date),
+    t.event_id,
+    COUNT(*),
+    SUM(t.price)
+FROM
+    orders o
+JOIN
+    ticket t ON t.order_id = o.order_id
+WHERE
+    o.status = 'Completed'
+GROUP BY
+    DATE(o.order_date), t.event_id;
@@ -0,0 +1,44 @@
+-- ============================================================
+-- File: 007_keyset_pagination_indexes.sql
+-- Purpose:
+--   Seek indexes for the keyset-paginated listing procedures in
+--   db/automation/procedures.sql:
+--     1) ListUsersPage:           users by last, first name
+--     2) ListOrganizerEventsPage: one organizer's events by start time
+--     3) ListEventTicketsPage:    one event's tickets by ticket_id
+--
+-- Notes:
+--   - Apply after 001_secondary_indexes.sql. IX_UserListing starts
+--     with IX_UserName's columns, so IX_UserName is dropped.
+--   - Each index is only the listing's filter and sort order plus the
+--     tie-breaking PK. A page is one index range read of page-size
+--     entries with no filesort, followed by page-size PK lookups for the
+--     other returned columns, whichever page it is. The returned columns
+--     are left out on purpose: they would copy most of each row into the
+--     index and slow every insert (ticket most of all).
+--   - IX_EventOrganizerStart replaces the FK index on organizer_id.
+--   - SQLite stand-in: 007_keyset_pagination_indexes_sqlite.sql.
+-- ============================================================
+
+USE eventify_db;
+
+-- ------------------------------------------------------------
+-- USER
+-- ------------------------------------------------------------
+-- ORDER BY last_name, first_name, user_id, seek on that triple
+CREATE INDEX IX_UserListing ON user (last_name, first_name, user_id);
+DROP INDEX IX_UserName ON user;
+
+-- ------------------------------------------------------------
+-- EVENT
+-- ------------------------------------------------------------
+-- WHERE organizer_id = ? ORDER BY start_time, event_id
+CREATE INDEX IX_EventOrganizerStart ON event (organizer_id, start_time, event_id);
+
+-- ------------------------------------------------------------
+-- TICKET
+-- ------------------------------------------------------------
+-- WHERE event_id = ? AND ticket_id > ? ORDER BY ticket_id
+CREATE INDEX IX_TicketEventPage ON ticket (event_id, ticket_id);
+
+ANALYZE TABLE user, event, ticket;
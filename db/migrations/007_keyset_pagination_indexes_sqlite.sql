@@ -0,0 +1,20 @@
+-- ============================================================
+-- File: 007_keyset_pagination_indexes_sqlite.sql
+-- Purpose:
+--   SQLite stand-in for 007_keyset_pagination_indexes.sql (same
+--   index names and columns).
+--
+-- Notes:
+--   - SQLite never drops indexes implicitly, so the replaced FK index
+--     from schema_sqlite.sql is dropped here explicitly.
+-- ============================================================
+
+CREATE INDEX IF NOT EXISTS IX_UserListing ON user (last_name, first_name, user_id);
+DROP INDEX IF EXISTS IX_UserName;
+
+CREATE INDEX IF NOT EXISTS IX_EventOrganizerStart ON event (organizer_id, start_time, event_id);
+DROP INDEX IF EXISTS FK_EventOrganizer;
+
+CREATE INDEX IF NOT EXISTS IX_TicketEventPage ON ticket (event_id, ticket_id);
+
+ANALYZE;
@@ -11,6 +11,11 @@ SET NAMES utf8mb4;
 SET FOREIGN_KEY_CHECKS = 0;
 
 -- Drop tables if they exist to allow for clean re-creation
+-- (daily_category_revenue only exists in installs from before it was dropped)
+DROP TABLE IF EXISTS daily_category_revenue;
+DROP TABLE IF EXISTS daily_event_revenue;
+DROP TABLE IF EXISTS event_inventory;
+DROP TABLE IF EXISTS event_sales_summary;
 DROP TABLE IF EXISTS ticket;
 DROP TABLE IF EXISTS orders;
 DROP TABLE IF EXISTS event_category;
@@ -82,7 +87,7 @@ CREATE TABLE event (
     -- Constraints
     CONSTRAINT CHK_EventTime CHECK (start_time < end_time),
     CONSTRAINT CHK_EventCapacity CHECK (capacity >= 0),
-    -- Note: The check capacity <= venue.capacity is typically enforced by application logic or a trigger.
+    -- Note: capacity <= venue.capacity is enforced by the check_event_capacity_* triggers.
 
     -- Status constraint
     CONSTRAINT CHK_EventStatus CHECK (status IN ('Draft', 'Published', 'Completed', 'Canceled'))
@@ -140,5 +145,58 @@ CREATE TABLE ticket (
     CONSTRAINT CHK_TicketStatus CHECK (status IN ('Reserved', 'Purchased', 'Refunded'))
 ) ENGINE=InnoDB;
 
+-- 5. DERIVED TABLES (Maintained by triggers in db/automation/triggers.sql)
+
+
+-- 5.1. EVENT_SALES_SUMMARY Table (PK: event_id)
+-- Running ticket counts per event, so sales summaries are a PK lookup
+-- instead of a COUNT over ticket. Rebuild with RebuildEventSalesSummary().
+CREATE TABLE event_sales_summary (
+    event_id INT PRIMARY KEY COMMENT 'FK to event',
+    purchased_count INT NOT NULL DEFAULT 0,
+    reserved_count INT NOT NULL DEFAULT 0,
+    refunded_count INT NOT NULL DEFAULT 0,
+    purchased_revenue DECIMAL(12, 2) NOT NULL DEFAULT 0
+        COMMENT 'Sum of price over Purchased tickets',
+
+    -- Foreign Key
+    CONSTRAINT FK_SalesSummaryEvent FOREIGN KEY (event_id) REFERENCES event(event_id) ON DELETE CASCADE,
+
+    -- Constraints
+    CONSTRAINT CHK_SalesSummaryCounts CHECK (purchased_count >= 0 AND reserved_count >= 0 AND refunded_count >= 0)
+) ENGINE=InnoDB;
+
+-- 5.2. EVENT_INVENTORY Table (PK: event_id)
+-- Seats left per event (capacity minus Purchased/Reserved tickets). Ticket
+-- triggers take and return seats here under a row lock on this one row.
+CREATE TABLE event_inventory (
+    event_id INT PRIMARY KEY COMMENT 'FK to event',
+    remaining INT NOT NULL COMMENT 'Seats still available',
+
+    -- Foreign Key
+    CONSTRAINT FK_InventoryEvent FOREIGN KEY (event_id) REFERENCES event(event_id) ON DELETE CASCADE,
+
+    -- Constraints
+    CONSTRAINT CHK_InventoryRemaining CHECK (remaining >= 0)
+) ENGINE=InnoDB;
+
+-- 5.3. DAILY_EVENT_REVENUE Table (PK: revenue_date, event_id)
+-- Revenue per order day and event: tickets of Completed orders, counted on
+-- DATE(order_date). Backfill with RefreshRevenueRollups().
+CREATE TABLE daily_event_revenue (
+    revenue_date DATE NOT NULL COMMENT 'DATE(orders.order_date)',
+    event_id INT NOT NULL COMMENT 'FK to event',
+    ticket_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(14, 2) NOT NULL DEFAULT 0 COMMENT 'Sum of ticket price',
+
+    PRIMARY KEY (revenue_date, event_id),
+    -- All-time totals per event read this index only
+    INDEX IX_EventRevenue (event_id, revenue),
+
+    -- Foreign Key
+    CONSTRAINT FK_EventRevenueEvent FOREIGN KEY (event_id) REFERENCES event(event_id) ON DELETE CASCADE
+) ENGINE=InnoDB;
+
+
 -- Re-enable foreign key checks
 SET FOREIGN_KEY_CHECKS = 1;
@@ -0,0 +1,144 @@
+-- ============================================================
+-- File: schema_partitioned.sql
+-- Purpose:
+--   Partitioned variant of the two unbounded tables. Run after
+--   db/schema.sql: it replaces orders and ticket with
+--     - orders: RANGE COLUMNS(order_date), one partition per month
+--     - ticket: HASH(event_id), 16 partitions
+--   so date-window order queries and one-event ticket queries only
+--   read the partitions they need.
+--
+-- Notes:
+--   - InnoDB does not support foreign keys on partitioned tables, so
+--     FK_OrderUser, FK_TicketOrder, FK_TicketEvent and FK_TicketUser
+--     are gone. The ticket -> orders cascade is gone with them: delete
+--     an order's tickets before the order (the order triggers still
+--     correct the derived tables). After bulk loads, check integrity
+--     with anti-joins (e.g. tickets whose order_id has no orders row).
+--   - Every unique key must contain the partitioning column. The PKs
+--     become (order_id, order_date) and (ticket_id, event_id), so the
+--     table itself only keeps ticket_id unique per event. Global
+--     uniqueness moves to ticket_id_registry, an unpartitioned
+--     (ticket_id PK, event_id) table kept in step by the triggers
+--     below: inserting a ticket_id that exists for any event fails
+--     with a duplicate-key error. It costs one extra PK insert per
+--     ticket, and it maps a ticket_id to its event (and so to its
+--     partition) for lookups by id.
+--   - TRUNCATE TABLE ticket does not fire the triggers: truncate
+--     ticket_id_registry with it.
+--   - Lookups that do not filter on the partitioning column (orders by
+--     user, tickets by order or user) probe every partition's local index.
+--   - The monthly partitions below cover the generator's data
+--     (2025-01 .. 2026-12), older orders go to p_history. Later months
+--     are not listed here: source
+--     db/automation/partition_maintenance.sql and CALL
+--     AddOrderPartitions(3) right after this file, then let its
+--     monthly event (roll_order_partitions) keep three months ahead.
+--     New months are split off pmax, which should stay empty. Orders
+--     that land there are moved at the next split.
+--   - Re-source db/automation/triggers.sql afterwards (dropping a
+--     table drops its triggers).
+--   - Compare with the unpartitioned schema using
+--     python seeds/measure_partitioning.py
+-- ============================================================
+
+USE eventify_db;
+
+SET FOREIGN_KEY_CHECKS = 0;
+
+DROP TABLE IF EXISTS ticket;
+DROP TABLE IF EXISTS orders;
+
+
+-- 4.1. ORDERS Table (PK: order_id, order_date)
+CREATE TABLE orders (
+    order_id INT AUTO_INCREMENT,
+    user_id INT NOT NULL COMMENT 'References user (Buyer), not enforced',
+    total_amount DECIMAL(10, 2) NOT NULL,
+    order_date DATETIME DEFAULT CURRENT_TIMESTAMP NOT NULL COMMENT 'Partitioning column',
+    status ENUM('Pending', 'Completed', 'Refunded') NOT NULL,
+
+    PRIMARY KEY (order_id, order_date),
+    INDEX FK_OrderUser (user_id),
+
+    -- Constraints
+    CONSTRAINT CHK_OrderAmount CHECK (total_amount >= 0),
+    CONSTRAINT CHK_OrderStatus CHECK (status IN ('Pending', 'Completed', 'Refunded'))
+) ENGINE=InnoDB
+PARTITION BY RANGE COLUMNS (order_date) (
+    PARTITION p_history VALUES LESS THAN ('2025-01-01'),
+    PARTITION p202501 VALUES LESS THAN ('2025-02-01'),
+    PARTITION p202502 VALUES LESS THAN ('2025-03-01'),
+    PARTITION p202503 VALUES LESS THAN ('2025-04-01'),
+    PARTITION p202504 VALUES LESS THAN ('2025-05-01'),
+    PARTITION p202505 VALUES LESS THAN ('2025-06-01'),
+    PARTITION p202506 VALUES LESS THAN ('2025-07-01'),
+    PARTITION p202507 VALUES LESS THAN ('2025-08-01'),
+    PARTITION p202508 VALUES LESS THAN ('2025-09-01'),
+    PARTITION p202509 VALUES LESS THAN ('2025-10-01'),
+    PARTITION p202510 VALUES LESS THAN ('2025-11-01'),
+    PARTITION p202511 VALUES LESS THAN ('2025-12-01'),
+    PARTITION p202512 VALUES LESS THAN ('2026-01-01'),
+    PARTITION p202601 VALUES LESS THAN ('2026-02-01'),
+    PARTITION p202602 VALUES LESS THAN ('2026-03-01'),
+    PARTITION p202603 VALUES LESS THAN ('2026-04-01'),
+    PARTITION p202604 VALUES LESS THAN ('2026-05-01'),
+    PARTITION p202605 VALUES LESS THAN ('2026-06-01'),
+    PARTITION p202606 VALUES LESS THAN ('2026-07-01'),
+    PARTITION p202607 VALUES LESS THAN ('2026-08-01'),
+    PARTITION p202608 VALUES LESS THAN ('2026-09-01'),
+    PARTITION p202609 VALUES LESS THAN ('2026-10-01'),
+    PARTITION p202610 VALUES LESS THAN ('2026-11-01'),
+    PARTITION p202611 VALUES LESS THAN ('2026-12-01'),
+    PARTITION p202612 VALUES LESS THAN ('2027-01-01'),
+    PARTITION pmax VALUES LESS THAN (MAXVALUE)
+);
+
+-- 4.2. TICKET Table (PK: ticket_id, event_id)
+CREATE TABLE ticket (
+    ticket_id VARCHAR(50) NOT NULL COMMENT 'String identifier, unique per event only (see Notes)',
+    order_id INT NOT NULL COMMENT 'References orders, not enforced',
+    event_id INT NOT NULL COMMENT 'References event, not enforced. Partitioning column',
+    user_id INT NOT NULL COMMENT 'References user (Owner/Attendee), not enforced',
+    price DECIMAL(10, 2) NOT NULL,
+    status ENUM('Reserved', 'Purchased', 'Refunded') NOT NULL,
+
+    PRIMARY KEY (ticket_id, event_id),
+    INDEX FK_TicketOrder (order_id),
+    INDEX FK_TicketEvent (event_id),
+    INDEX FK_TicketUser (user_id),
+
+    -- Constraints
+    CONSTRAINT CHK_TicketPrice CHECK (price >= 0),
+    CONSTRAINT CHK_TicketStatus CHECK (status IN ('Reserved', 'Purchased', 'Refunded'))
+) ENGINE=InnoDB
+PARTITION BY HASH (event_id) PARTITIONS 16;
+
+-- 4.3. TICKET_ID_REGISTRY Table (PK: ticket_id)
+-- Not partitioned, so its PK keeps ticket_id unique across all events
+DROP TABLE IF EXISTS ticket_id_registry;
+CREATE TABLE ticket_id_registry (
+    ticket_id VARCHAR(50) PRIMARY KEY,
+    event_id INT NOT NULL COMMENT 'The ticket''s event, i.e. its ticket partition'
+) ENGINE=InnoDB;
+
+-- One statement each, so this file still runs without DELIMITER
+CREATE TRIGGER ticket_id_registry_after_insert
+AFTER INSERT ON ticket
+FOR EACH ROW
+    INSERT INTO ticket_id_registry (ticket_id, event_id) VALUES (NEW.ticket_id, NEW.event_id);
+
+CREATE TRIGGER ticket_id_registry_after_update
+AFTER UPDATE ON ticket
+FOR EACH ROW
+    UPDATE ticket_id_registry
+    SET ticket_id = NEW.ticket_id, event_id = NEW.event_id
+    WHERE ticket_id = OLD.ticket_id
+        AND (NEW.ticket_id <> OLD.ticket_id OR NEW.event_id <> OLD.event_id);
+
+CREATE TRIGGER ticket_id_registry_after_delete
+AFTER DELETE ON ticket
+FOR EACH ROW
+    DELETE FROM ticket_id_registry WHERE ticket_id = OLD.ticket_id;
+
+SET FOREIGN_KEY_CHECKS = 1;
@@ -0,0 +1,147 @@
+-- ============================================================
+-- File: schema_sqlite.sql
+-- Purpose:
+--   Local SQLite stand-in for db/schema.sql, used by the Python
+--   loader and benchmark tooling when no MySQL server is around.
+--
+-- Notes:
+--   - Same tables, columns, keys and CHECK constraints as schema.sql.
+--   - ENUM columns become TEXT + CHECK. COLLATE NOCASE mirrors MySQL's
+--     case-insensitive ENUM matching ('organizer' = 'Organizer').
+--   - DATETIME values are stored as 'YYYY-MM-DD HH:MM:SS' text.
+--   - Run with PRAGMA foreign_keys = ON to enforce the FKs.
+-- ============================================================
+
+DROP TABLE IF EXISTS daily_category_revenue;
+DROP TABLE IF EXISTS daily_event_revenue;
+DROP TABLE IF EXISTS event_inventory;
+DROP TABLE IF EXISTS event_sales_summary;
+DROP TABLE IF EXISTS ticket;
+DROP TABLE IF EXISTS orders;
+DROP TABLE IF EXISTS event_category;
+DROP TABLE IF EXISTS category;
+DROP TABLE IF EXISTS event;
+DROP TABLE IF EXISTS venue;
+DROP TABLE IF EXISTS user;
+
+
+-- 1. CORE TABLES (No FKs)
+
+CREATE TABLE user (
+    user_id INTEGER PRIMARY KEY,
+    first_name VARCHAR(100) NOT NULL,
+    last_name VARCHAR(100) NOT NULL,
+    email VARCHAR(255) NOT NULL UNIQUE,
+    role TEXT NOT NULL COLLATE NOCASE,
+    status TEXT NOT NULL COLLATE NOCASE DEFAULT 'Active',
+    CONSTRAINT CHK_UserRole CHECK (role IN ('Attendee', 'Organizer', 'Admin')),
+    CONSTRAINT CHK_UserStatus CHECK (status IN ('Active', 'Suspended'))
+);
+
+CREATE TABLE venue (
+    venue_id INTEGER PRIMARY KEY,
+    name VARCHAR(255) NOT NULL,
+    capacity INT NOT NULL,
+    address VARCHAR(255),
+    city VARCHAR(100),
+    CONSTRAINT CHK_VenueCapacity CHECK (capacity >= 0),
+    CONSTRAINT UQ_VenueLocation UNIQUE (name, address, city)
+);
+
+CREATE TABLE category (
+    category_id INTEGER PRIMARY KEY,
+    name VARCHAR(100) NOT NULL,
+    CONSTRAINT UQ_CategoryName UNIQUE (name)
+);
+
+
+-- 2. INTERMEDIATE TABLES (Requires user and venue FKs)
+
+CREATE TABLE event (
+    event_id INTEGER PRIMARY KEY,
+    organizer_id INT NOT NULL REFERENCES user(user_id) ON DELETE CASCADE,
+    venue_id INT NOT NULL REFERENCES venue(venue_id) ON DELETE RESTRICT,
+    title VARCHAR(255) NOT NULL,
+    description TEXT,
+    start_time DATETIME NOT NULL,
+    end_time DATETIME NOT NULL,
+    capacity INT NOT NULL,
+    status TEXT NOT NULL COLLATE NOCASE,
+    CONSTRAINT CHK_EventTime CHECK (start_time < end_time),
+    CONSTRAINT CHK_EventCapacity CHECK (capacity >= 0),
+    CONSTRAINT CHK_EventStatus CHECK (status IN ('Draft', 'Published', 'Completed', 'Canceled'))
+);
+
+CREATE TABLE event_category (
+    event_id INT NOT NULL REFERENCES event(event_id) ON DELETE CASCADE,
+    category_id INT NOT NULL REFERENCES category(category_id) ON DELETE CASCADE,
+    PRIMARY KEY (event_id, category_id)
+);
+
+
+-- 3. DEPENDENT TABLES (Requires event and user FKs)
+
+CREATE TABLE orders (
+    order_id INTEGER PRIMARY KEY,
+    user_id INT NOT NULL REFERENCES user(user_id) ON DELETE RESTRICT,
+    total_amount DECIMAL(10, 2) NOT NULL,
+    order_date DATETIME NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    status TEXT NOT NULL COLLATE NOCASE,
+    CONSTRAINT CHK_OrderAmount CHECK (total_amount >= 0),
+    CONSTRAINT CHK_OrderStatus CHECK (status IN ('Pending', 'Completed', 'Refunded'))
+);
+
+CREATE TABLE ticket (
+    ticket_id VARCHAR(50) PRIMARY KEY,
+    order_id INT NOT NULL REFERENCES orders(order_id) ON DELETE CASCADE,
+    event_id INT NOT NULL REFERENCES event(event_id) ON DELETE RESTRICT,
+    user_id INT NOT NULL REFERENCES user(user_id) ON DELETE RESTRICT,
+    price DECIMAL(10, 2) NOT NULL,
+    status TEXT NOT NULL COLLATE NOCASE,
+    CONSTRAINT CHK_TicketPrice CHECK (price >= 0),
+    CONSTRAINT CHK_TicketStatus CHECK (status IN ('Reserved', 'Purchased', 'Refunded'))
+);
+
+
+-- 4. DERIVED TABLES
+-- Triggers are left out of the stand-in (like the ticket status trigger);
+-- the generator loads event_sales_summary, event_inventory and the daily
+-- revenue rollups along with the other tables.
+
+CREATE TABLE event_sales_summary (
+    event_id INTEGER PRIMARY KEY REFERENCES event(event_id) ON DELETE CASCADE,
+    purchased_count INT NOT NULL DEFAULT 0,
+    reserved_count INT NOT NULL DEFAULT 0,
+    refunded_count INT NOT NULL DEFAULT 0,
+    purchased_revenue DECIMAL(12, 2) NOT NULL DEFAULT 0,
+    CONSTRAINT CHK_SalesSummaryCounts CHECK (purchased_count >= 0 AND reserved_count >= 0 AND refunded_count >= 0)
+);
+
+CREATE TABLE event_inventory (
+    event_id INTEGER PRIMARY KEY REFERENCES event(event_id) ON DELETE CASCADE,
+    remaining INT NOT NULL,
+    CONSTRAINT CHK_InventoryRemaining CHECK (remaining >= 0)
+);
+
+CREATE TABLE daily_event_revenue (
+    revenue_date DATE NOT NULL,
+    event_id INT NOT NULL REFERENCES event(event_id) ON DELETE CASCADE,
+    ticket_count INT NOT NULL DEFAULT 0,
+    revenue DECIMAL(14, 2) NOT NULL DEFAULT 0,
+    PRIMARY KEY (revenue_date, event_id)
+);
+CREATE INDEX IX_EventRevenue ON daily_event_revenue (event_id, revenue);
+
+
+-- 5. FOREIGN KEY INDEXES
+-- InnoDB creates an index for every FK column that is not already the
+-- leading column of another index; SQLite does not, so they are listed here
+-- to give both engines the same starting set of indexes.
+
+CREATE INDEX FK_EventOrganizer ON event (organizer_id);
+CREATE INDEX FK_EventVenue ON event (venue_id);
+CREATE INDEX FK_ECCategoryID ON event_category (category_id);
+CREATE INDEX FK_OrderUser ON orders (user_id);
+CREATE INDEX FK_TicketOrder ON ticket (order_id);
+CREATE INDEX FK_TicketEvent ON ticket (event_id);
+CREATE INDEX FK_TicketUser ON ticket (user_id);
@@ -0,0 +1,350 @@
+import argparse
+import hashlib
+import json
+import os
+import sqlite3
+import sys
+import time
+from datetime import datetime
+
+import generate_data_v3 as generator
+from db_loader import mysql_connector
+from generate import table_sizes
+
+# =================================================================
+# Query Benchmark Harness for db/analysis/*.sql
+# =================================================================
+# Generates a dataset per scale factor, loads it into a local engine (SQLite
+# stand-in or MySQL), runs every named SELECT from the analysis files N times
+# and records p50/p99 latency, rows returned, rows scanned and the EXPLAIN
+# plan. Results are compared to a stored baseline so regressions fail loudly.
+#
+#   python seeds/benchmark_queries.py --scale-factors 1 10 --repeat 20
+#   python seeds/benchmark_queries.py --scale-factors 1 10 --update-baseline
+
+REPO_ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+ANALYSIS_DIR = os.path.join(REPO_ROOT, 'db', 'analysis')
+QUERY_FILES = ['event_queries.sql', 'ticket_queries.sql', 'user_queries.sql']
+DEFAULT_BASELINE = os.path.join(ANALYSIS_DIR, 'benchmark_baseline.json')
+
+# Fixed inputs so every run benchmarks the exact same dataset
+BENCH_SEED = 42
+BENCH_REFERENCE_TIME = datetime(2026, 1, 1)
+
+# A query regresses when its p50 grows past baseline * (1 + tolerance) and by
+# more than the minimum delta (sub-millisecond queries are mostly timer noise)
+DEFAULT_LATENCY_TOLERANCE = 0.5
+DEFAULT_MIN_DELTA_MS = 1.0
+
+MYSQL_TABLES = [
+    'daily_event_revenue', 'event_inventory', 'event_sales_summary',
+    'ticket', 'orders', 'event_category', 'event', 'category', 'venue', 'user',
+]
+
+
+# -----------------------------------------------------------------
+# Query discovery
+# -----------------------------------------------------------------
+
+def parse_query_file(path):
+    """Splits an analysis file into (name, sql) pairs; the name is the first line of the comment block right above each statement."""
+    with open(path, encoding='utf-8') as f:
+        text = f.read()
+
+    queries = []
+    for chunk in text.split(';'):
+        comments = []
+        sql_lines = []
+        block_ended = False
+        for line in chunk.strip().splitlines():
+            stripped = line.strip()
+            if not sql_lines and (stripped.startswith('#') or stripped.startswith('--')):
+                # A comment block followed by another one belongs to the file, not the statement
+                if block_ended:
+                    comments = []
+                    block_ended = False
+                comments.append(stripped.lstrip('#-').strip())
+            elif not sql_lines and not stripped:
+                block_ended = bool(comments)
+            elif stripped or sql_lines:
+                sql_lines.append(line)
+        sql = '\n'.join(sql_lines).strip()
+        if not sql:
+            continue
+        name = next((c for c in comments if c), sql.split('\n')[0])
+        queries.append((name, sql))
+    return queries
+
+
+def load_queries(engine):
+    """Returns {'file: name': sql} for every benchmarkable statement (SELECTs, plus CALLs on MySQL)."""
+    queries = {}
+    for filename in QUERY_FILES:
+        stem = os.path.splitext(filename)[0]
+        for name, sql in parse_query_file(os.path.join(ANALYSIS_DIR, filename)):
+            keyword = sql.split(None, 1)[0].upper()
+            if keyword == 'SELECT' or (keyword == 'CALL' and engine == 'mysql'):
+                queries[f"{stem}: {name}"] = sql
+    return queries
+
+
+# -----------------------------------------------------------------
+# Engines
+# -----------------------------------------------------------------
+
+class SQLiteEngine:
+    """SQLite stand-in: MySQL's NOW() and CONCAT() are registered as functions."""
+
+    name = 'sqlite'
+
+    def __init__(self, path):
+        self.path = path
+        self.conn = None
+
+    def load(self, scale_factor, reuse=False):
+        if not (reuse and os.path.exists(self.path)):
+            generator.main(dataset_config(scale_factor, 'sqlite', self.path))
+        self.conn = sqlite3.connect(self.path)
+        self.conn.create_function('NOW', 0, lambda: BENCH_REFERENCE_TIME.strftime('%Y-%m-%d %H:%M:%S'))
+        self.conn.create_function('CONCAT', -1, lambda *parts: ''.join('' if p is None else str(p) for p in parts))
+        self.conn.execute('ANALYZE')
+
+    def run(self, sql, params=()):
+        return self.conn.execute(sql, params).fetchall()
+
+    def execute_script(self, path):
+        with open(path, encoding='utf-8') as f:
+            self.conn.executescript(f.read())
+        self.conn.commit()
+
+    def scan_count(self, sql):
+        """SQLite keeps no per-query row counter, so VM steps are counted as the scan-work proxy."""
+        steps = [0]
+
+        def count():
+            steps[0] += 1
+            return 0
+        self.conn.set_progress_handler(count, 1)
+        try:
+            self.run(sql)
+        finally:
+            self.conn.set_progress_handler(None, 0)
+        return steps[0]
+
+    def explain(self, sql):
+        return [row[-1] for row in self.conn.execute('EXPLAIN QUERY PLAN ' + sql).fetchall()]
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+
+
+class MySQLEngine:
+    """Local MySQL with db/schema.sql applied; tables are truncated and reloaded per scale factor."""
+
+    name = 'mysql'
+
+    def __init__(self, mysql_config):
+        self.mysql_config = mysql_config
+        self.connect = mysql_connector(**mysql_config)
+        self.conn = None
+
+    def load(self, scale_factor, reuse=False):
+        self.conn = self.connect()
+        cursor = self.conn.cursor()
+        # NOW() returns the reference time, so results are comparable across runs
+        cursor.execute('SET timestamp = %s', (int(BENCH_REFERENCE_TIME.timestamp()),))
+        if reuse:
+            return
+
+        cursor.execute('SET FOREIGN_KEY_CHECKS = 0')
+        for table_name in MYSQL_TABLES:
+            cursor.execute(f'TRUNCATE TABLE `{table_name}`')
+        # db/schema_partitioned.sql only; its triggers do not see the TRUNCATE of ticket
+        cursor.execute("SELECT TABLE_NAME FROM information_schema.TABLES "
+                       "WHERE TABLE_SCHEMA = DATABASE() AND TABLE_NAME = 'ticket_id_registry'")
+        for (table_name,) in cursor.fetchall():
+            cursor.execute(f'TRUNCATE TABLE `{table_name}`')
+        cursor.execute('SET FOREIGN_KEY_CHECKS = 1')
+        self.conn.commit()
+
+        # Load before installing db/automation/triggers.sql: the sales trigger rejects historical tickets
+        config = dataset_config(scale_factor, 'mysql', None)
+        config.mysql_config = self.mysql_config
+        generator.main(config)
+        cursor.execute('ANALYZE TABLE ' + ', '.join(f'`{t}`' for t in MYSQL_TABLES))
+        cursor.fetchall()
+
+    def run(self, sql, params=None):
+        cursor = self.conn.cursor()
+        cursor.execute(sql, params)
+        rows = cursor.fetchall()
+        while cursor.nextset():
+            pass
+        return rows
+
+    def execute_script(self, path):
+        """Runs a ;-separated SQL file statement by statement (no DELIMITER blocks)."""
+        with open(path, encoding='utf-8') as f:
+            statements = [s.strip() for s in f.read().split(';')]
+        cursor = self.conn.cursor()
+        for statement in statements:
+            if any(line.strip() and not line.strip().startswith('--') for line in statement.splitlines()):
+                cursor.execute(statement)
+                if cursor.description:
+                    cursor.fetchall()
+        self.conn.commit()
+
+    def scan_count(self, sql):
+        """Sum of the session Handler_read_* counters: rows the storage engine actually read."""
+        cursor = self.conn.cursor()
+        cursor.execute('FLUSH STATUS')
+        self.run(sql)
+        cursor.execute("SHOW SESSION STATUS LIKE 'Handler_read%%'")
+        return sum(int(value) for _, value in cursor.fetchall())
+
+    def explain(self, sql):
+        if sql.split(None, 1)[0].upper() == 'CALL':
+            return []
+        cursor = self.conn.cursor()
+        cursor.execute('EXPLAIN FORMAT=TREE ' + sql)
+        return [row[0] for row in cursor.fetchall()]
+
+    def close(self):
+        if self.conn:
+            self.conn.close()
+
+
+def dataset_config(scale_factor, output_format, output_path):
+    sizes = table_sizes(scale_factor)
+    return generator.GenerationConfig(
+        num_users=sizes['users'],
+        num_venues=sizes['venues'],
+        num_events=sizes['events'],
+        num_orders=sizes['orders'],
+        num_popular_events=sizes['popular_events'],
+        master_seed=BENCH_SEED,
+        reference_time=BENCH_REFERENCE_TIME,
+        output_format=output_format,
+        output_path=output_path,
+        # The fixed dataset is validated by generate.py; a benchmark load only
+        # has to be the same every time
+        validate=False,
+    )
+
+
+# -----------------------------------------------------------------
+# Measurement
+# -----------------------------------------------------------------
+
+def percentile(sorted_values, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    index = max(0, min(len(sorted_values) - 1, round(fraction * len(sorted_values) + 0.5) - 1))
+    return sorted_values[index]
+
+
+def benchmark_query(engine, sql, repeat):
+    rows = engine.run(sql)  # warm-up, also gives the result for the checksum
+    latencies = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        engine.run(sql)
+        latencies.append((time.perf_counter() - start) * 1000)
+    latencies.sort()
+
+    return {
+        'rows': len(rows),
+        'checksum': hashlib.sha256(repr(rows).encode('utf-8')).hexdigest()[:16],
+        'p50_ms': round(percentile(latencies, 0.50), 3),
+        'p99_ms': round(percentile(latencies, 0.99), 3),
+        'rows_scanned': engine.scan_count(sql),
+        'plan': engine.explain(sql),
+    }
+
+
+def compare_to_baseline(results, baseline, tolerance, min_delta_ms=DEFAULT_MIN_DELTA_MS):
+    """Returns a list of human-readable regressions (changed results or slower p50)."""
+    problems = []
+    for scale_key, queries in results.items():
+        for name, result in queries.items():
+            expected = baseline.get(scale_key, {}).get(name)
+            if expected is None:
+                continue
+            if result['checksum'] != expected['checksum'] or result['rows'] != expected['rows']:
+                problems.append(f"[{scale_key}] {name}: result changed ({expected['rows']} -> {result['rows']} rows)")
+            slower_by = result['p50_ms'] - expected['p50_ms']
+            if result['p50_ms'] > expected['p50_ms'] * (1 + tolerance) and slower_by > min_delta_ms:
+                problems.append(f"[{scale_key}] {name}: p50 {expected['p50_ms']}ms -> {result['p50_ms']}ms")
+    return problems
+
+
+def print_results(scale_key, queries):
+    print(f"\n--- {scale_key} ---")
+    print(f"{'query':<72}{'rows':>8}{'p50 ms':>10}{'p99 ms':>10}{'scanned':>12}")
+    for name, r in queries.items():
+        print(f"{name[:70]:<72}{r['rows']:>8}{r['p50_ms']:>10}{r['p99_ms']:>10}{r['rows_scanned']:>12}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmark db/analysis queries across dataset scale factors.")
+    parser.add_argument('--scale-factors', type=float, nargs='+', default=[1, 10])
+    parser.add_argument('--repeat', type=int, default=10, help="Timed runs per query (default: %(default)s)")
+    parser.add_argument('--engine', choices=['sqlite', 'mysql'], default='sqlite')
+    parser.add_argument('--data-dir', default=os.path.join(REPO_ROOT, 'db'),
+                        help="Where SQLite datasets are kept (default: db/)")
+    parser.add_argument('--reuse', action='store_true', help="Reuse already loaded datasets instead of regenerating")
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE)
+    parser.add_argument('--update-baseline', action='store_true', help="Store this run as the new baseline")
+    parser.add_argument('--tolerance', type=float, default=DEFAULT_LATENCY_TOLERANCE,
+                        help="Allowed p50 slowdown before failing, as a fraction (default: %(default)s)")
+    parser.add_argument('--min-delta-ms', type=float, default=DEFAULT_MIN_DELTA_MS,
+                        help="Ignore p50 slowdowns smaller than this many milliseconds (default: %(default)s)")
+    parser.add_argument('--report', default=None, help="Also write the full results (with plans) as JSON")
+    for key, value in generator.MYSQL_CONFIG.items():
+        parser.add_argument(f'--mysql-{key}', default=value)
+    args = parser.parse_args(argv)
+
+    queries = load_queries(args.engine)
+    results = {}
+    for scale_factor in args.scale_factors:
+        scale_key = f"{args.engine}/sf{scale_factor:g}"
+        if args.engine == 'sqlite':
+            engine = SQLiteEngine(os.path.join(args.data_dir, f"bench_sf{scale_factor:g}.sqlite3"))
+        else:
+            engine = MySQLEngine({key: getattr(args, f'mysql_{key}') for key in generator.MYSQL_CONFIG})
+        try:
+            engine.load(scale_factor, reuse=args.reuse)
+            results[scale_key] = {name: benchmark_query(engine, sql, args.repeat) for name, sql in queries.items()}
+        finally:
+            engine.close()
+        print_results(scale_key, results[scale_key])
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(results, f, indent=2)
+
+    baseline = {}
+    if os.path.exists(args.baseline):
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+
+    if args.update_baseline:
+        for scale_key, scale_results in results.items():
+            baseline[scale_key] = {name: {k: v for k, v in r.items() if k != 'plan'} for name, r in scale_results.items()}
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump(baseline, f, indent=2, sort_keys=True)
+        print(f"\n✅ Baseline updated: {args.baseline}")
+        return 0
+
+    problems = compare_to_baseline(results, baseline, args.tolerance, args.min_delta_ms)
+    if problems:
+        print("\n❌ REGRESSIONS AGAINST BASELINE:")
+        for problem in problems:
+            print(f"  - {problem}")
+        return 1
+    print("\n✅ No regressions against baseline." if baseline else "\n(No baseline yet; run with --update-baseline.)")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,316 @@
+from array import array
+from datetime import date, timedelta
+from itertools import chain
+
+import numpy as np
+
+# =================================================================
+# Compact Columnar Tables
+# =================================================================
+# A generated table used to be a list with one dict per row, so every row
+# repeated its column names and carried a few hundred bytes of object
+# overhead. A ColumnTable stores each column in the smallest container that
+# fits it instead:
+#   - ids: a range (every shard covers a contiguous id range), no storage
+#   - numbers: array('q') / array('d'), 8 bytes per value
+#   - statuses and roles: CodeColumn, 1-byte codes into a tuple of interned strings
+#   - datetimes: DateTimeColumn, int64 epoch seconds formatted on the way out
+#   - values built from other columns (ticket_id, email, title): DerivedColumn
+#   - free text: a plain list; pooled Faker text is shared, not copied
+# Writers read rows() as tuples in column order, so no per-row dict is ever built.
+# Tables loaded from the dataset cache (seeds/dataset_cache.py) keep their
+# numbers in MappedColumns and their text in TextColumns, both read straight
+# from memory-mapped files.
+
+# Rows formatted per NumPy call when a DateTimeColumn is iterated
+DATETIME_CHUNK_ROWS = 4096
+# Rows converted to Python values at a time when a mapped column is iterated
+MAPPED_CHUNK_ROWS = 65536
+
+
+def int_column(values):
+    """array('q') from a NumPy array or any iterable of ints."""
+    if isinstance(values, np.ndarray):
+        return array('q', values.astype(np.int64, copy=False).tobytes())
+    return array('q', values)
+
+
+def float_column(values):
+    """array('d') from a NumPy array or any iterable of floats."""
+    if isinstance(values, np.ndarray):
+        return array('d', values.astype(np.float64, copy=False).tobytes())
+    return array('d', values)
+
+
+EPOCH = date(1970, 1, 1)
+
+
+def as_numpy(column):
+    """Zero-copy NumPy view of an array column (ranges are materialized)."""
+    if isinstance(column, range):
+        return np.arange(column.start, column.stop, column.step, dtype=np.int64)
+    if isinstance(column, array):
+        return np.frombuffer(column, dtype=np.dtype(column.typecode))
+    if isinstance(column, MappedColumn):
+        return column.values
+    return np.asarray(column)
+
+
+def epoch_day_to_date(day):
+    """'YYYY-MM-DD' for a count of days since 1970-01-01 (see DateTimeColumn.days())."""
+    return (EPOCH + timedelta(days=day)).isoformat()
+
+
+class CodeColumn:
+    """A low-cardinality string column: one byte per row indexing a tuple of distinct values."""
+
+    def __init__(self, values, codes):
+        self.values = tuple(values)
+        if isinstance(codes, np.ndarray):
+            codes = array('B', codes.astype(np.uint8).tobytes())
+        self.codes = codes
+
+    @classmethod
+    def encode(cls, column, values=None):
+        """Encodes a column of strings; values fixes the domain (default: first-seen order)."""
+        values = tuple(dict.fromkeys(column if values is None else values))
+        index = {value: code for code, value in enumerate(values)}
+        return cls(values, array('B', [index[value] for value in column]))
+
+    def mask(self, value):
+        """NumPy boolean array marking the rows equal to value."""
+        if value not in self.values:
+            return np.zeros(len(self.codes), dtype=bool)
+        return as_numpy(self.codes) == self.values.index(value)
+
+    def __len__(self):
+        return len(self.codes)
+
+    def __iter__(self):
+        return map(self.values.__getitem__, self.codes)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return CodeColumn(self.values, self.codes[index])
+        return self.values[self.codes[index]]
+
+    def __setitem__(self, index, value):
+        if value not in self.values:
+            self.values += (value,)
+        self.codes[index] = self.values.index(value)
+
+    @classmethod
+    def concat(cls, columns):
+        values = tuple(dict.fromkeys(value for column in columns for value in column.values))
+        codes = array('B')
+        for column in columns:
+            if column.values == values[:len(column.values)]:
+                codes.extend(column.codes)
+            else:
+                remap = [values.index(value) for value in column.values]
+                codes.extend(remap[code] for code in column.codes)
+        return cls(values, codes)
+
+
+class DateTimeColumn:
+    """DATETIME values as int64 epoch seconds, formatted as 'YYYY-MM-DD HH:MM:SS' when read."""
+
+    def __init__(self, seconds):
+        self.seconds = seconds
+
+    @classmethod
+    def from_datetime64(cls, values):
+        return cls(int_column(np.asarray(values, dtype='datetime64[s]').astype(np.int64)))
+
+    @classmethod
+    def parse(cls, texts):
+        """From 'YYYY-MM-DD HH:MM:SS' strings (or datetimes)."""
+        return cls.from_datetime64(np.array([str(text) for text in texts], dtype='datetime64[s]'))
+
+    def days(self):
+        """Whole days since the epoch per row, as a NumPy array (the DATE part)."""
+        return as_numpy(self.seconds) // 86400
+
+    def __len__(self):
+        return len(self.seconds)
+
+    def _format(self, start, stop):
+        values = as_numpy(self.seconds)[start:stop].astype('datetime64[s]')
+        return [text.replace('T', ' ') for text in np.datetime_as_string(values, unit='s').tolist()]
+
+    def __iter__(self):
+        for start in range(0, len(self.seconds), DATETIME_CHUNK_ROWS):
+            yield from self._format(start, start + DATETIME_CHUNK_ROWS)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return DateTimeColumn(self.seconds[index])
+        index = range(len(self.seconds))[index]
+        return self._format(index, index + 1)[0]
+
+    @classmethod
+    def concat(cls, columns):
+        return cls(concat_columns([column.seconds for column in columns]))
+
+
+class DerivedColumn:
+    """A column computed from other columns when read, e.g. ticket_id from the ticket number.
+
+    function must be a module-level function so tables still pickle to shard workers.
+    """
+
+    def __init__(self, function, *sources):
+        self.function = function
+        self.sources = sources
+
+    def __len__(self):
+        return len(self.sources[0])
+
+    def __iter__(self):
+        return map(self.function, *self.sources)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return DerivedColumn(self.function, *(source[index] for source in self.sources))
+        return self.function(*(source[index] for source in self.sources))
+
+    @classmethod
+    def concat(cls, columns):
+        sources = zip(*(column.sources for column in columns))
+        return cls(columns[0].function, *(concat_columns(list(parts)) for parts in sources))
+
+
+class MappedColumn:
+    """A fixed-width column over a NumPy array, e.g. a read-only np.memmap; reads as Python ints/floats."""
+
+    def __init__(self, values):
+        self.values = values
+
+    def __len__(self):
+        return len(self.values)
+
+    def __iter__(self):
+        for start in range(0, len(self.values), MAPPED_CHUNK_ROWS):
+            yield from self.values[start:start + MAPPED_CHUNK_ROWS].tolist()
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return MappedColumn(self.values[index])
+        return self.values[index].item()
+
+
+class TextColumn:
+    """Strings stored as one UTF-8 byte buffer plus len + 1 int64 offsets into it (both may be memory-mapped)."""
+
+    def __init__(self, offsets, data):
+        self.offsets = offsets
+        self.data = data
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __iter__(self):
+        for start in range(0, len(self), MAPPED_CHUNK_ROWS):
+            # One bytes copy per chunk, then plain Python slicing per value
+            offsets = self.offsets[start:start + MAPPED_CHUNK_ROWS + 1]
+            base = int(offsets[0])
+            buffer = self.data[base:int(offsets[-1])].tobytes()
+            ends = (offsets - base).tolist()
+            yield from (buffer[begin:end].decode('utf-8') for begin, end in zip(ends, ends[1:]))
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            rows = range(len(self))[index]
+            if rows.step != 1:
+                raise ValueError("TextColumn slices must be contiguous")
+            return TextColumn(self.offsets[rows.start:max(rows.start, rows.stop) + 1], self.data)
+        index = range(len(self))[index]
+        return self.data[int(self.offsets[index]):int(self.offsets[index + 1])].tobytes().decode('utf-8')
+
+
+def concat_columns(columns):
+    """Joins same-kind columns end to end; adjacent ranges stay a range."""
+    first = columns[0]
+    if isinstance(first, range):
+        if all(isinstance(c, range) and c.step == 1 for c in columns) and \
+                all(a.stop == b.start for a, b in zip(columns, columns[1:])):
+            return range(first.start, columns[-1].stop)
+        return array('q', chain.from_iterable(columns))
+    if isinstance(first, array):
+        joined = array(first.typecode)
+        for column in columns:
+            joined.extend(column)
+        return joined
+    if isinstance(first, list):
+        return list(chain.from_iterable(columns))
+    return type(first).concat(columns)
+
+
+class ColumnTable:
+    """One table's rows, stored column by column (see the module notes for the column kinds)."""
+
+    def __init__(self, **columns):
+        lengths = {len(column) for column in columns.values()}
+        if len(lengths) > 1:
+            raise ValueError(f"Columns differ in length: {dict((name, len(c)) for name, c in columns.items())}")
+        self._columns = columns
+
+    @property
+    def columns(self):
+        return list(self._columns)
+
+    def __len__(self):
+        return len(next(iter(self._columns.values()))) if self._columns else 0
+
+    def __getitem__(self, name):
+        return self._columns[name]
+
+    def column_map(self):
+        return dict(self._columns)
+
+    def rows(self):
+        """Every row as a tuple in column order."""
+        return zip(*self._columns.values())
+
+    def row(self, index):
+        """One row as a dict (for samples and lookups, not for bulk reads)."""
+        return {name: column[index] for name, column in self._columns.items()}
+
+    def slice(self, start, stop):
+        return ColumnTable(**{name: column[start:stop] for name, column in self._columns.items()})
+
+    @classmethod
+    def concat(cls, tables):
+        tables = [table for table in tables if len(table)] or tables[:1]
+        if len(tables) == 1:
+            return tables[0]
+        return cls(**{name: concat_columns([table[name] for table in tables]) for name in tables[0].columns})
+
+
+class TableStream:
+    """A table that arrives as a sequence of ColumnTable chunks (e.g. one per ticket shard)."""
+
+    def __init__(self, columns, chunks):
+        self.columns = list(columns)
+        self.chunks = chunks
+
+    def rows(self):
+        return chain.from_iterable(chunk.rows() for chunk in self.chunks)
+
+
+def table_rows(rows):
+    """(column names, iterator of value tuples) for whatever a writer is handed.
+
+    ColumnTables and TableStreams are read column-wise; any other iterable is
+    taken to yield row dicts (the derived tables, external callers). Column
+    names are None when a dict iterable turns out to be empty.
+    """
+    if isinstance(rows, (ColumnTable, TableStream)):
+        return rows.columns, iter(rows.rows())
+    rows = iter(rows)
+    first = next(rows, None)
+    if first is None:
+        return None, iter(())
+    # Get column names from the first dictionary
+    columns = list(first.keys())
+    return columns, chain([tuple(first.values())], (tuple(row[col] for col in columns) for row in rows))
@@ -0,0 +1,333 @@
+import hashlib
+import json
+import os
+import shutil
+from array import array
+from importlib import import_module
+from itertools import islice
+
+import numpy as np
+
+from columnar import (
+    CodeColumn, ColumnTable, DateTimeColumn, DerivedColumn, MappedColumn, TableStream, TextColumn,
+    table_rows,
+)
+from sql_writer import TABLE_ORDER
+
+# =================================================================
+# On-Disk Dataset Cache (Memory-Mappable Columns)
+# =================================================================
+# Benchmarks and fixtures regenerate the same dataset again and again. With a
+# cache directory, a run stores every generated table under a hash of
+# everything the rows depend on (table sizes, seed, shard count, reference
+# time, value domains, skew settings and the generator's own source). A
+# later run with the same key maps the stored columns back in and streams
+# them into any output writer without generating anything.
+#
+# Layout of one entry, <cache_dir>/<key>/:
+#   meta.json             tables, column kinds, row counts and the run's manifest
+#   <table>.<column>.bin  raw little-endian column data, opened with np.memmap
+# Text columns are a .offsets.bin (int64) plus a .data.bin (UTF-8 bytes).
+# Entries are written to a temporary directory and renamed into place, so a
+# crashed run never leaves half an entry behind.
+
+CACHE_VERSION = 1
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache', 'datasets')
+
+# Rows buffered per chunk when a row-dict table (the derived tables) is cached
+CHUNK_ROWS = 65536
+
+# array typecode -> on-disk dtype
+ARRAY_DTYPES = {'q': '<i8', 'd': '<f8', 'B': 'u1'}
+
+
+def cache_key(params):
+    """Short hex digest of a JSON-serializable description of a dataset."""
+    payload = json.dumps(params, sort_keys=True, default=str).encode('utf-8')
+    return hashlib.sha256(payload).hexdigest()[:24]
+
+
+def source_digest(paths):
+    """Digest of source files, so editing the generator invalidates its cached datasets."""
+    digest = hashlib.sha256()
+    for path in paths:
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def function_name(function):
+    return f"{function.__module__}:{function.__qualname__}"
+
+
+def resolve_function(name):
+    module, qualname = name.split(':')
+    return getattr(import_module(module), qualname)
+
+
+def python_column(values):
+    """Typed column for a list of Python values, by the type of the first one."""
+    first = values[0]
+    if isinstance(first, int):
+        return array('q', values)
+    if isinstance(first, float):
+        return array('d', values)
+    if isinstance(first, str):
+        return values
+    raise TypeError(f"Cannot cache values of type {type(first).__name__}")
+
+
+def table_chunks(rows):
+    """A table as a sequence of ColumnTables, batching row-dict iterables into CHUNK_ROWS rows."""
+    if isinstance(rows, ColumnTable):
+        yield rows
+        return
+    if isinstance(rows, TableStream):
+        yield from rows.chunks
+        return
+    columns, values = table_rows(rows)
+    while columns:
+        batch = list(islice(values, CHUNK_ROWS))
+        if not batch:
+            return
+        yield ColumnTable(**{name: python_column(list(column)) for name, column in zip(columns, zip(*batch))})
+
+# -----------------------------------------------------------------
+# Writing: one sink per column, appended to chunk by chunk
+# -----------------------------------------------------------------
+
+
+class ArraySink:
+    def __init__(self, directory, filename, dtype):
+        self.filename = filename
+        self.dtype = dtype
+        self.length = 0
+        self._file = open(os.path.join(directory, filename), 'wb')
+
+    def append(self, column):
+        if isinstance(column, MappedColumn):
+            values = column.values.astype(self.dtype, copy=False)
+        else:
+            values = np.frombuffer(column, dtype=np.dtype(column.typecode)).astype(self.dtype, copy=False)
+        self._file.write(values.tobytes())
+        self.length += len(values)
+
+    def close(self):
+        self._file.close()
+        return {'kind': 'array', 'file': self.filename, 'dtype': self.dtype, 'length': self.length}
+
+
+class RangeSink:
+    def __init__(self):
+        self.start = self.stop = None
+
+    def append(self, column):
+        if self.start is None:
+            self.start, self.stop = column.start, column.start
+        if column.start != self.stop or column.step != 1:
+            raise ValueError("Cached id ranges must continue each other")
+        self.stop = column.stop
+
+    def close(self):
+        return {'kind': 'range', 'start': self.start, 'stop': self.stop}
+
+
+class CodeSink:
+    def __init__(self, directory, filename):
+        self.values = []
+        self.codes = ArraySink(directory, filename, 'u1')
+
+    def append(self, column):
+        for value in column.values:
+            if value not in self.values:
+                self.values.append(value)
+        remap = np.array([self.values.index(value) for value in column.values], dtype=np.uint8)
+        codes = column.codes.values if isinstance(column.codes, MappedColumn) else np.frombuffer(column.codes, dtype=np.uint8)
+        self.codes.append(MappedColumn(remap[codes]))
+
+    def close(self):
+        return {'kind': 'code', 'values': self.values, 'codes': self.codes.close()}
+
+
+class DateTimeSink:
+    def __init__(self, directory, filename):
+        self.seconds = ArraySink(directory, filename, '<i8')
+
+    def append(self, column):
+        self.seconds.append(column.seconds)
+
+    def close(self):
+        return {'kind': 'datetime', 'seconds': self.seconds.close()}
+
+
+class TextSink:
+    def __init__(self, directory, filename):
+        self.offsets = ArraySink(directory, filename + '.offsets.bin', '<i8')
+        self.data_filename = filename + '.data.bin'
+        self.data = open(os.path.join(directory, self.data_filename), 'wb')
+        self.size = 0
+        self.offsets.append(array('q', [0]))
+
+    def append(self, column):
+        offsets = array('q')
+        for value in column:
+            encoded = value.encode('utf-8')
+            self.data.write(encoded)
+            self.size += len(encoded)
+            offsets.append(self.size)
+        self.offsets.append(offsets)
+
+    def close(self):
+        self.data.close()
+        return {'kind': 'text', 'offsets': self.offsets.close(), 'data': self.data_filename}
+
+
+class DerivedSink:
+    def __init__(self, directory, filename, column):
+        self.function = function_name(column.function)
+        self.sources = [column_sink(directory, f"{filename}.{index}", source) for index, source in enumerate(column.sources)]
+
+    def append(self, column):
+        for sink, source in zip(self.sources, column.sources):
+            sink.append(source)
+
+    def close(self):
+        return {'kind': 'derived', 'function': self.function, 'sources': [sink.close() for sink in self.sources]}
+
+
+def column_sink(directory, filename, column):
+    """The sink for a column, chosen by the kind of its first chunk."""
+    if isinstance(column, range):
+        return RangeSink()
+    if isinstance(column, array):
+        return ArraySink(directory, filename + '.bin', ARRAY_DTYPES[column.typecode])
+    if isinstance(column, MappedColumn):
+        return ArraySink(directory, filename + '.bin', column.values.dtype.str)
+    if isinstance(column, CodeColumn):
+        return CodeSink(directory, filename + '.bin')
+    if isinstance(column, DateTimeColumn):
+        return DateTimeSink(directory, filename + '.bin')
+    if isinstance(column, DerivedColumn):
+        return DerivedSink(directory, filename, column)
+    if isinstance(column, (list, TextColumn)):
+        return TextSink(directory, filename)
+    raise TypeError(f"Cannot cache a column of type {type(column).__name__}")
+
+
+class DatasetCacheWriter:
+    """Writes one cache entry; call commit() once every table is written to make it visible."""
+
+    def __init__(self, cache_dir, key):
+        self.path = os.path.join(cache_dir, key)
+        self.tmp_path = f"{self.path}.tmp-{os.getpid()}"
+        self.row_counts = {}
+        self.tables = {}
+        shutil.rmtree(self.tmp_path, ignore_errors=True)
+        os.makedirs(self.tmp_path)
+
+    def write_table(self, table_name, rows):
+        """Consumes a ColumnTable / TableStream (or an iterable of row dicts) and returns the number of rows written."""
+        sinks = None
+        row_count = 0
+        for chunk in table_chunks(rows):
+            if sinks is None:
+                sinks = {name: column_sink(self.tmp_path, f"{table_name}.{name}", chunk[name]) for name in chunk.columns}
+            for name, sink in sinks.items():
+                sink.append(chunk[name])
+            row_count += len(chunk)
+        columns = {name: sink.close() for name, sink in (sinks or {}).items()}
+        self.tables[table_name] = {'rows': row_count, 'columns': columns}
+        self.row_counts[table_name] = row_count
+        return row_count
+
+    def write_tables(self, tables):
+        """Writes a {table_name: rows} mapping in TABLE_ORDER (streamed derived tables are complete only after ticket)."""
+        for table_name in TABLE_ORDER:
+            if table_name in tables:
+                self.write_table(table_name, tables[table_name])
+        return self.row_counts
+
+    def commit(self, manifest):
+        """Writes meta.json and moves the entry into place; a concurrent run's identical entry wins."""
+        meta = {'version': CACHE_VERSION, 'tables': self.tables, 'row_counts': self.row_counts, 'manifest': manifest}
+        with open(os.path.join(self.tmp_path, 'meta.json'), 'w', encoding='utf-8') as f:
+            json.dump(meta, f, indent=1)
+        try:
+            os.rename(self.tmp_path, self.path)
+        except OSError:
+            if not os.path.exists(os.path.join(self.path, 'meta.json')):
+                raise
+            shutil.rmtree(self.tmp_path, ignore_errors=True)
+
+    def abort(self):
+        shutil.rmtree(self.tmp_path, ignore_errors=True)
+
+# -----------------------------------------------------------------
+# Reading: memory-map every column
+# -----------------------------------------------------------------
+
+
+def map_array(directory, spec):
+    if not spec['length']:
+        return np.zeros(0, dtype=spec['dtype'])
+    return np.memmap(os.path.join(directory, spec['file']), dtype=spec['dtype'], mode='r', shape=(spec['length'],))
+
+
+def load_column(directory, spec):
+    kind = spec['kind']
+    if kind == 'range':
+        return range(spec['start'], spec['stop'])
+    if kind == 'array':
+        return MappedColumn(map_array(directory, spec))
+    if kind == 'code':
+        return CodeColumn(spec['values'], MappedColumn(map_array(directory, spec['codes'])))
+    if kind == 'datetime':
+        return DateTimeColumn(MappedColumn(map_array(directory, spec['seconds'])))
+    if kind == 'text':
+        data_path = os.path.join(directory, spec['data'])
+        if os.path.getsize(data_path):
+            data = np.memmap(data_path, dtype=np.uint8, mode='r')
+        else:
+            data = np.zeros(0, dtype=np.uint8)
+        return TextColumn(map_array(directory, spec['offsets']), data)
+    if kind == 'derived':
+        return DerivedColumn(resolve_function(spec['function']), *(load_column(directory, source) for source in spec['sources']))
+    raise ValueError(f"Unknown cached column kind {kind!r}")
+
+
+class CachedDataset:
+    """A cache entry: read-only ColumnTables over memory-mapped files, plus the run's manifest."""
+
+    def __init__(self, path):
+        self.path = path
+        with open(os.path.join(path, 'meta.json'), encoding='utf-8') as f:
+            meta = json.load(f)
+        if meta.get('version') != CACHE_VERSION:
+            raise ValueError(f"{path}: unsupported dataset cache version {meta.get('version')!r}")
+        self.row_counts = meta['row_counts']
+        self.manifest = meta['manifest']
+        self.tables = {
+            table_name: ColumnTable(**{name: load_column(path, spec) for name, spec in table['columns'].items()})
+            for table_name, table in meta['tables'].items()
+        }
+
+
+class DatasetCache:
+    """A directory of cached datasets, one subdirectory per key."""
+
+    def __init__(self, cache_dir=DEFAULT_CACHE_DIR):
+        self.cache_dir = cache_dir
+
+    def path(self, key):
+        return os.path.join(self.cache_dir, key)
+
+    def load(self, key):
+        """The cached dataset for key, or None on a miss."""
+        path = self.path(key)
+        if not os.path.exists(os.path.join(path, 'meta.json')):
+            return None
+        return CachedDataset(path)
+
+    def writer(self, key):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        return DatasetCacheWriter(self.cache_dir, key)
@@ -0,0 +1,291 @@
+import os
+import queue
+import sqlite3
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from itertools import islice
+
+from columnar import table_rows
+
+# =================================================================
+# Direct-to-Database Loader (DB-API executemany + connection pool)
+# =================================================================
+# Rows go straight from the generator into the database, skipping the
+# intermediate dump file. Works with any DB-API driver: sqlite3 as a local
+# stand-in (db/schema_sqlite.sql) and PyMySQL against MySQL.
+
+# Tables in the same stage have no FKs on each other and load concurrently;
+# each stage only starts once every table it references is fully loaded.
+LOAD_STAGES = [
+    ['user', 'venue', 'category'],
+    ['event'],
+    ['event_category', 'orders'],
+    ['ticket'],
+    ['event_sales_summary', 'event_inventory', 'daily_event_revenue'],
+]
+
+# Every FK of db/schema.sql as (constraint, child table, column, parent table, parent key)
+FOREIGN_KEYS = [
+    ('FK_EventOrganizer', 'event', 'organizer_id', 'user', 'user_id'),
+    ('FK_EventVenue', 'event', 'venue_id', 'venue', 'venue_id'),
+    ('FK_ECCategoryID', 'event_category', 'category_id', 'category', 'category_id'),
+    ('FK_ECEventID', 'event_category', 'event_id', 'event', 'event_id'),
+    ('FK_OrderUser', 'orders', 'user_id', 'user', 'user_id'),
+    ('FK_TicketOrder', 'ticket', 'order_id', 'orders', 'order_id'),
+    ('FK_TicketEvent', 'ticket', 'event_id', 'event', 'event_id'),
+    ('FK_TicketUser', 'ticket', 'user_id', 'user', 'user_id'),
+    ('FK_SalesSummaryEvent', 'event_sales_summary', 'event_id', 'event', 'event_id'),
+    ('FK_InventoryEvent', 'event_inventory', 'event_id', 'event', 'event_id'),
+    ('FK_EventRevenueEvent', 'daily_event_revenue', 'event_id', 'event', 'event_id'),
+]
+
+DEFAULT_BATCH_ROWS = 5000
+DEFAULT_POOL_SIZE = 4
+
+# Recomputes the derived rows of a set of events from ticket (generic SQL, runs on
+# both engines); '{ids}' is a placeholder list
+REFRESH_DERIVED_STATEMENTS = [
+    "DELETE FROM event_sales_summary WHERE event_id IN ({ids})",
+    "INSERT INTO event_sales_summary (event_id, purchased_count, reserved_count, refunded_count, purchased_revenue) "
+    "SELECT e.event_id, "
+    "SUM(CASE WHEN t.status = 'Purchased' THEN 1 ELSE 0 END), "
+    "SUM(CASE WHEN t.status = 'Reserved' THEN 1 ELSE 0 END), "
+    "SUM(CASE WHEN t.status = 'Refunded' THEN 1 ELSE 0 END), "
+    "COALESCE(SUM(CASE WHEN t.status = 'Purchased' THEN t.price END), 0) "
+    "FROM event e LEFT JOIN ticket t ON t.event_id = e.event_id "
+    "WHERE e.event_id IN ({ids}) GROUP BY e.event_id",
+    "DELETE FROM event_inventory WHERE event_id IN ({ids})",
+    "INSERT INTO event_inventory (event_id, remaining) "
+    "SELECT e.event_id, CASE WHEN e.capacity > COUNT(t.ticket_id) THEN e.capacity - COUNT(t.ticket_id) ELSE 0 END "
+    "FROM event e LEFT JOIN ticket t ON t.event_id = e.event_id AND t.status IN ('Purchased', 'Reserved') "
+    "WHERE e.event_id IN ({ids}) GROUP BY e.event_id, e.capacity",
+]
+REFRESH_CHUNK_EVENTS = 500
+
+# Recomputes the daily revenue rollup from one order day on; '{p}' is the placeholder
+REFRESH_ROLLUP_STATEMENTS = [
+    "DELETE FROM daily_event_revenue WHERE revenue_date >= {p}",
+    "INSERT INTO daily_event_revenue (revenue_date, event_id, ticket_count, revenue) "
+    "SELECT DATE(o.order_date), t.event_id, COUNT(*), SUM(t.price) "
+    "FROM orders o JOIN ticket t ON t.order_id = o.order_id "
+    "WHERE o.status = 'Completed' AND o.order_date >= {p} GROUP BY DATE(o.order_date), t.event_id",
+]
+
+SQLITE_SCHEMA = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'db', 'schema_sqlite.sql')
+
+
+# -----------------------------------------------------------------
+# Connections
+# -----------------------------------------------------------------
+
+def sqlite_connector(path):
+    """Returns a connect() for a SQLite file (one file, many connections, FKs enforced)."""
+    def connect():
+        conn = sqlite3.connect(path, timeout=60, check_same_thread=False)
+        conn.execute("PRAGMA foreign_keys = ON")
+        conn.execute("PRAGMA journal_mode = WAL")
+        return conn
+    connect.paramstyle = sqlite3.paramstyle
+    return connect
+
+
+def mysql_connector(**connect_kwargs):
+    """Returns a connect() for MySQL via PyMySQL (e.g. host, user, password, database)."""
+    try:
+        import pymysql
+    except ImportError as e:
+        raise ImportError("Loading into MySQL needs PyMySQL: pip install PyMySQL") from e
+
+    def connect():
+        return pymysql.connect(charset='utf8mb4', autocommit=False, **connect_kwargs)
+    connect.paramstyle = pymysql.paramstyle
+    return connect
+
+
+def create_sqlite_schema(path, schema_path=SQLITE_SCHEMA):
+    """(Re)creates the SQLite stand-in tables from db/schema_sqlite.sql."""
+    with open(schema_path, encoding='utf-8') as f:
+        schema_sql = f.read()
+    # sqlite3 creates the file but not its directory
+    os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+    conn = sqlite3.connect(path)
+    try:
+        conn.executescript(schema_sql)
+        conn.commit()
+    finally:
+        conn.close()
+
+
+class ConnectionPool:
+    """A fixed number of open connections handed out one at a time."""
+
+    def __init__(self, connect, size=DEFAULT_POOL_SIZE):
+        # '?' for qmark drivers (sqlite3), '%s' for format/pyformat drivers (PyMySQL)
+        self.placeholder = '?' if getattr(connect, 'paramstyle', 'qmark') == 'qmark' else '%s'
+        self._connections = queue.Queue()
+        self._all = []
+        for _ in range(size):
+            conn = connect()
+            self._all.append(conn)
+            self._connections.put(conn)
+
+    @contextmanager
+    def connection(self):
+        """Blocks until a connection is free; returns it to the pool afterwards."""
+        conn = self._connections.get()
+        try:
+            yield conn
+        finally:
+            self._connections.put(conn)
+
+    def configure(self, statements):
+        """Runs session statements (e.g. SET SESSION ...) on every connection; call while none is handed out."""
+        for conn in self._all:
+            cursor = conn.cursor()
+            try:
+                for statement in statements:
+                    cursor.execute(statement)
+            finally:
+                cursor.close()
+
+    def close(self):
+        for conn in self._all:
+            conn.close()
+
+
+# -----------------------------------------------------------------
+# Loader
+# -----------------------------------------------------------------
+
+class DatabaseLoader:
+    """Loads {table_name: rows} into a database with batched executemany, one transaction per batch."""
+
+    def __init__(self, pool, batch_rows=DEFAULT_BATCH_ROWS):
+        self.pool = pool
+        self.batch_rows = batch_rows
+        self.row_counts = {}
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def load_table(self, table_name, rows):
+        """Consumes a ColumnTable / TableStream (or an iterable of row dicts) and returns the number of rows loaded."""
+        start = time.perf_counter()
+        columns, rows = table_rows(rows)
+        row_count = 0
+        if columns is not None:
+            placeholders = ', '.join([self.pool.placeholder] * len(columns))
+            statement = f"INSERT INTO `{table_name}` ({', '.join(f'`{col}`' for col in columns)}) VALUES ({placeholders})"
+
+        while True:
+            batch = list(islice(rows, self.batch_rows))
+            if not batch:
+                break
+
+            with self.pool.connection() as conn:
+                cursor = conn.cursor()
+                try:
+                    cursor.executemany(statement, batch)
+                    conn.commit()
+                except Exception:
+                    conn.rollback()
+                    raise
+                finally:
+                    cursor.close()
+
+            row_count += len(batch)
+
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            self.row_counts[table_name] = row_count
+            self.stats[table_name] = {
+                'rows': row_count,
+                'seconds': round(elapsed, 3),
+                'rows_per_sec': round(row_count / elapsed, 1) if elapsed > 0 else None,
+            }
+        return row_count
+
+    def write_tables(self, tables):
+        """Loads a {table_name: rows} mapping stage by stage, tables within a stage concurrently."""
+        for stage in LOAD_STAGES:
+            stage_tables = [name for name in stage if name in tables]
+            if not stage_tables:
+                continue
+            with ThreadPoolExecutor(max_workers=len(stage_tables)) as executor:
+                futures = [executor.submit(self.load_table, name, tables[name]) for name in stage_tables]
+                for future in futures:
+                    future.result()
+        return self.row_counts
+
+    def print_report(self):
+        print(f"{'table':<16}{'rows':>12}{'seconds':>10}{'rows/sec':>14}")
+        for stage in LOAD_STAGES:
+            for table_name in stage:
+                if table_name in self.stats:
+                    s = self.stats[table_name]
+                    print(f"{table_name:<16}{s['rows']:>12}{s['seconds']:>10}{s['rows_per_sec'] or 0:>14}")
+
+
+def refresh_derived_tables(pool, event_ids, chunk_events=REFRESH_CHUNK_EVENTS):
+    """Rebuilds event_sales_summary and event_inventory for the given events, one transaction per chunk.
+
+    Used after an append load, when only some events gained tickets.
+    """
+    event_ids = sorted(set(event_ids))
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            for i in range(0, len(event_ids), chunk_events):
+                chunk = event_ids[i:i + chunk_events]
+                ids = ', '.join([pool.placeholder] * len(chunk))
+                for statement in REFRESH_DERIVED_STATEMENTS:
+                    cursor.execute(statement.format(ids=ids), chunk)
+                conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+    return len(event_ids)
+
+
+def refresh_revenue_rollups(pool, from_date):
+    """Rebuilds the daily revenue rollups for every order day from from_date ('YYYY-MM-DD') on, in one transaction."""
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            for statement in REFRESH_ROLLUP_STATEMENTS:
+                cursor.execute(statement.format(p=pool.placeholder), (from_date,))
+            cursor.execute(f"SELECT COUNT(DISTINCT revenue_date) FROM daily_event_revenue WHERE revenue_date >= {pool.placeholder}",
+                           (from_date,))
+            refreshed, = cursor.fetchone()
+            conn.commit()
+        except Exception:
+            conn.rollback()
+            raise
+        finally:
+            cursor.close()
+    return refreshed
+
+
+def count_orphans(pool, foreign_keys=FOREIGN_KEYS):
+    """{constraint: rows whose FK value has no parent row}, for every FK in one UNION ALL query.
+
+    The check a load with FOREIGN_KEY_CHECKS = 0 skipped: each branch is an
+    anti-join probing the parent's primary key, so it is one pass per child table.
+    """
+    query = '\nUNION ALL\n'.join(
+        f"SELECT '{name}', COUNT(*) FROM `{child}` c "
+        f"WHERE NOT EXISTS (SELECT 1 FROM `{parent}` p WHERE p.`{key}` = c.`{column}`)"
+        for name, child, column, parent, key in foreign_keys
+    )
+    with pool.connection() as conn:
+        cursor = conn.cursor()
+        try:
+            cursor.execute(query)
+            orphans = {name: int(count) for name, count in cursor.fetchall()}
+            conn.commit()
+        finally:
+            cursor.close()
+    return orphans
@@ -0,0 +1,121 @@
+import os
+from datetime import datetime
+
+from columnar import table_rows
+from sql_writer import TABLE_ORDER
+
+# =================================================================
+# Delimited (TSV/CSV) Export + LOAD DATA Loader Script
+# =================================================================
+# LOAD DATA INFILE is by far the fastest way to bulk-load MySQL. Each table
+# is written to its own file (with a header line), plus a load_data.sql that
+# imports them in FK order with FK and unique checks switched off.
+
+FORMATS = {
+    'tsv': {'delimiter': '\t', 'extension': 'tsv'},
+    'csv': {'delimiter': ',', 'extension': 'csv'},
+}
+
+
+def format_delimited_value(value, delimiter):
+    """Formats one Python value for LOAD DATA: escaped strings/dates, \\N for NULL, numbers as-is."""
+    if isinstance(value, (str, datetime)):
+        # Backslash is LOAD DATA's escape character, so it is always doubled first
+        text = str(value).replace('\\', '\\\\')
+        if delimiter == '\t':
+            return text.replace('\t', '\\t').replace('\n', '\\n').replace('\r', '\\r')
+        # CSV: enclose in double quotes and double any embedded quote
+        return '"' + text.replace('"', '""') + '"'
+    elif value is None:
+        return "\\N"
+    else:
+        return str(value)
+
+
+class DelimitedWriter:
+    """Writes each table to <output_dir>/<table>.<tsv|csv> and a matching load_data.sql."""
+
+    def __init__(self, output_dir, fmt='tsv'):
+        self.output_dir = output_dir
+        self.delimiter = FORMATS[fmt]['delimiter']
+        self.extension = FORMATS[fmt]['extension']
+        self.row_counts = {}
+        self.columns = {}
+        os.makedirs(output_dir, exist_ok=True)
+
+    def table_filename(self, table_name):
+        return f"{table_name}.{self.extension}"
+
+    def write_table(self, table_name, rows):
+        """Consumes a ColumnTable / TableStream (or an iterable of row dicts) and returns the number of rows written."""
+        path = os.path.join(self.output_dir, self.table_filename(table_name))
+        columns, rows = table_rows(rows)
+        row_count = 0
+
+        with open(path, 'w', encoding='utf-8', newline='') as f:
+            for values in rows:
+                if row_count == 0:
+                    # The column names become the header line
+                    f.write(self.delimiter.join(columns) + '\n')
+                f.write(self.delimiter.join(format_delimited_value(value, self.delimiter) for value in values) + '\n')
+                row_count += 1
+
+        self.row_counts[table_name] = row_count
+        if row_count:
+            self.columns[table_name] = columns
+        return row_count
+
+    def write_tables(self, tables):
+        """Writes a {table_name: rows} mapping in FK-safe TABLE_ORDER, then the loader script."""
+        for table_name in TABLE_ORDER:
+            if table_name in tables:
+                self.write_table(table_name, tables[table_name])
+        self.write_load_script()
+        return self.row_counts
+
+    def write_load_script(self, database='eventify_db'):
+        """Writes load_data.sql, which LOADs every exported table in FK order.
+
+        Paths are relative, so run it from the export directory:
+            mysql --local-infile=1 -u root -p < load_data.sql
+        """
+        if self.delimiter == '\t':
+            field_options = "FIELDS TERMINATED BY '\\t' ESCAPED BY '\\\\'"
+        else:
+            field_options = "FIELDS TERMINATED BY ',' OPTIONALLY ENCLOSED BY '\"' ESCAPED BY '\\\\'"
+
+        lines = [
+            f"USE {database};",
+            "",
+            "-- Bulk-load settings: skip FK/unique checks and commit once per table",
+            "SET FOREIGN_KEY_CHECKS = 0;",
+            "SET UNIQUE_CHECKS = 0;",
+            "SET AUTOCOMMIT = 0;",
+            "",
+        ]
+        # Order of loading is kept FK-safe even though checks are off
+        for table_name in TABLE_ORDER:
+            if table_name not in self.columns:
+                continue
+            column_list = ', '.join(f'`{col}`' for col in self.columns[table_name])
+            lines += [
+                f"LOAD DATA LOCAL INFILE '{self.table_filename(table_name)}'",
+                f"    INTO TABLE `{table_name}`",
+                "    CHARACTER SET utf8mb4",
+                f"    {field_options}",
+                "    LINES TERMINATED BY '\\n'",
+                "    IGNORE 1 LINES",
+                f"    ({column_list});",
+                "COMMIT;",
+                "",
+            ]
+        lines += [
+            "-- Restore normal checking",
+            "SET AUTOCOMMIT = 1;",
+            "SET UNIQUE_CHECKS = 1;",
+            "SET FOREIGN_KEY_CHECKS = 1;",
+            "",
+        ]
+
+        with open(os.path.join(self.output_dir, 'load_data.sql'), 'w', encoding='utf-8') as f:
+            f.write('\n'.join(lines))
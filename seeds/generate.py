@@ -0,0 +1,169 @@
+import argparse
+import sys
+from datetime import datetime
+
+import generate_data_v3 as generator
+from dataset_cache import DEFAULT_CACHE_DIR
+from profiling import PROFILE_MODES
+from split_writer import COMPRESSIONS
+from validator import DataValidationError
+
+# =================================================================
+# Eventify Data Generator: Scale-Factor Entry Point
+# =================================================================
+# One parameterized entry point for every generator version. Dataset size is
+# set with a TPC-style scale factor: every table grows in fixed ratios from
+# SF1 (the v3 defaults) up to SF1000, so benchmark datasets have a known size.
+#
+#   python seeds/generate.py --scale-factor 10 --seed 42 --output db/dummy_data_sf10.sql
+#   python seeds/generate.py -s 100 --seed 7 --format tsv --output db/export_sf100 --shards 32
+#   python seeds/generate.py -s 100 --seed 7 --format split --compress gzip --chunk-rows 500000
+#   python seeds/import_split.py db/split --connections 8
+#
+# Append mode grows an existing dataset by one more period of events, orders
+# and tickets (sizes from --scale-factor; users, venues and categories stay):
+#
+#   python seeds/generate.py -s 0.1 --allow-small --format sqlite --append-from database --reference-date 2026-02-01
+#   python seeds/generate.py -s 0.1 --allow-small --append-from db/dummy_data.sql.manifest.json -o db/growth_feb.sql
+#
+# --profile reports wall time, rows/sec and peak RSS per phase as JSON next to
+# the output (e.g. db/dummy_data_sf10.sql.profile.json); 'cprofile' or
+# 'sample' also capture call stacks into a .prof / .folded file beside it:
+#
+#   python seeds/generate.py -s 10 --seed 42 -o db/dummy_data_sf10.sql --profile
+#   python seeds/generate.py -s 10 --seed 42 -o db/dummy_data_sf10.sql --workers 1 --profile sample
+#
+# --cache keeps each fixed-seed dataset as memory-mapped columns under
+# seeds/.cache/datasets; rerunning the same size, seed, shards and reference
+# date (in any --format) skips generation and only writes:
+#
+#   python seeds/generate.py -s 100 --seed 42 --reference-date 2026-01-01 --cache --format sqlite
+#
+# Every row is checked against the schema constraints and the trigger rules
+# (seeds/validator.py). Violations in the tables held in memory are reported
+# before anything is written; the streamed tables (ticket, derived) are checked
+# as they are written, and their violations are reported afterwards with no
+# manifest saved. --skip-validation writes without checking.
+
+# Rows per table at SF1; categories are a fixed list and do not scale
+SF1_TABLE_SIZES = {
+    'users': 500,
+    'venues': 50,
+    'events': 200,
+    'orders': 1000,
+}
+# 10% of events are "hits" that receive most ticket sales
+POPULAR_EVENT_SHARE = 0.1
+
+MIN_SCALE_FACTOR = 1
+MAX_SCALE_FACTOR = 1000
+
+
+def table_sizes(scale_factor):
+    """Row counts for every scaled table at the given scale factor."""
+    sizes = {table: max(1, round(rows * scale_factor)) for table, rows in SF1_TABLE_SIZES.items()}
+    sizes['popular_events'] = max(1, round(sizes['events'] * POPULAR_EVENT_SHARE))
+    return sizes
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(description="Generate Eventify dummy data at a given scale factor.")
+    parser.add_argument('-s', '--scale-factor', type=float, default=1,
+                        help=f"Dataset size multiplier, SF{MIN_SCALE_FACTOR} to SF{MAX_SCALE_FACTOR} (default: 1)")
+    parser.add_argument('--seed', type=int, default=None,
+                        help="Master seed; the same seed, shard count and reference date give identical output")
+    parser.add_argument('-o', '--output', default=None,
+                        help="Output file (sql), directory (tsv/csv/split) or database file (sqlite)")
+    parser.add_argument('--format', choices=['sql', 'tsv', 'csv', 'split', 'sqlite', 'mysql'], default='sql',
+                        help="Output format (default: sql); 'split' writes per-table files for seeds/import_split.py")
+    parser.add_argument('--compress', choices=COMPRESSIONS, default=generator.SPLIT_COMPRESS,
+                        help="Compress the --format split files")
+    parser.add_argument('--chunk-rows', type=int, default=generator.SPLIT_CHUNK_ROWS,
+                        help="Rows per --format split file, 0 = one file per table (default: %(default)s)")
+    parser.add_argument('--shards', type=int, default=generator.NUM_SHARDS,
+                        help="ID-range shards per table (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=generator.NUM_WORKERS,
+                        help="Worker processes (default: one per CPU core)")
+    parser.add_argument('--reference-date', type=datetime.fromisoformat, default=None,
+                        help="'Now' for relative dates, e.g. 2026-01-01 (default: today at midnight)")
+    parser.add_argument('--allow-small', action='store_true',
+                        help=f"Allow scale factors below SF{MIN_SCALE_FACTOR}, e.g. 0.1 for quick fixtures")
+    parser.add_argument('--append-from', default=None, metavar='MANIFEST|database',
+                        help="Add new events, orders and tickets to an existing dataset, continuing its ids; "
+                             "'database' reads the state from the --format sqlite/mysql target")
+    parser.add_argument('--manifest', default=None,
+                        help="Where to write this run's manifest (default: next to the output)")
+    parser.add_argument('--profile', nargs='?', const='phases', choices=PROFILE_MODES, default=generator.PROFILE,
+                        help="Write a per-phase time/rows/memory report; 'cprofile' or 'sample' also capture "
+                             "call stacks (default mode: phases)")
+    parser.add_argument('--profile-report', default=None,
+                        help="Where to write the profile report (default: next to the output)")
+    parser.add_argument('--cache', nargs='?', const=DEFAULT_CACHE_DIR, default=generator.CACHE_DIR, metavar='DIR',
+                        help="Reuse (or store) the generated tables in an on-disk dataset cache; needs --seed "
+                             "(default directory: seeds/.cache/datasets)")
+    parser.add_argument('--skip-validation', action='store_true',
+                        help="Write without checking the rows against the schema constraints and triggers")
+
+    mysql = parser.add_argument_group('mysql', "Connection settings for --format mysql")
+    for key, value in generator.MYSQL_CONFIG.items():
+        mysql.add_argument(f'--mysql-{key}', default=value, help=f"(default: {value!r})")
+    return parser
+
+
+def config_from_args(args):
+    """Turns parsed CLI arguments into a GenerationConfig."""
+    sizes = table_sizes(args.scale_factor)
+    return generator.GenerationConfig(
+        num_users=sizes['users'],
+        num_venues=sizes['venues'],
+        num_events=sizes['events'],
+        num_orders=sizes['orders'],
+        num_popular_events=sizes['popular_events'],
+        master_seed=args.seed,
+        num_shards=args.shards,
+        num_workers=args.workers,
+        reference_time=args.reference_date,
+        output_format=args.format,
+        output_path=args.output,
+        mysql_config={key: getattr(args, f'mysql_{key}') for key in generator.MYSQL_CONFIG},
+        append_from=args.append_from,
+        manifest_path=args.manifest,
+        profile=args.profile,
+        profile_path=args.profile_report,
+        cache_dir=args.cache,
+        split_compress=args.compress,
+        split_chunk_rows=args.chunk_rows,
+        validate=not args.skip_validation,
+    )
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    if args.scale_factor > MAX_SCALE_FACTOR or (args.scale_factor < MIN_SCALE_FACTOR and not args.allow_small):
+        parser.error(f"--scale-factor must be between {MIN_SCALE_FACTOR} and {MAX_SCALE_FACTOR} (use --allow-small below SF1)")
+    if args.scale_factor <= 0:
+        parser.error("--scale-factor must be positive")
+    if args.append_from == 'database' and args.format not in ('sqlite', 'mysql'):
+        parser.error("--append-from database needs --format sqlite or mysql")
+    if args.cache and (args.seed is None or args.append_from):
+        parser.error("--cache needs --seed and cannot be combined with --append-from")
+    if args.chunk_rows < 0:
+        parser.error("--chunk-rows must be 0 or positive")
+    if args.append_from and args.format in ('sql', 'tsv', 'csv', 'split') and not args.output:
+        parser.error("--append-from with a file format needs --output, so the base dataset is not overwritten")
+
+    sizes = table_sizes(args.scale_factor)
+    print(f"--- SF{args.scale_factor:g}: " + ', '.join(f"{count} {table}" for table, count in sizes.items()) + " ---")
+    try:
+        return generator.main(config_from_args(args))
+    except DataValidationError as e:
+        # The report is already printed
+        if e.written_to:
+            sys.exit(f"❌ {e}; found while streaming, {e.written_to} was already written and has no manifest.")
+        sys.exit(f"❌ {e}; nothing was written.")
+
+
+if __name__ == '__main__':
+    main()
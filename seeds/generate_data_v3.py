@@ -1,121 +1,272 @@
-from faker import Faker
+from faker import Faker, VERSION as FAKER_VERSION
+import numpy as np
+import os
 import random
-from datetime import datetime, timedelta
+from array import array
+from dataclasses import dataclass, field
+from datetime import date, datetime, time, timedelta
+
+from columnar import (
+    CodeColumn, ColumnTable, DateTimeColumn, DerivedColumn, TableStream,
+    as_numpy, epoch_day_to_date, float_column, int_column,
+)
+from dataset_cache import DatasetCache, cache_key as dataset_cache_key, source_digest
+from db_loader import (
+    ConnectionPool, DatabaseLoader, create_sqlite_schema, mysql_connector,
+    refresh_derived_tables, refresh_revenue_rollups, sqlite_connector,
+)
+from delimited_writer import DelimitedWriter
+from manifest import build_manifest, load_manifest, manifest_from_database, open_events_table, seats_left, write_manifest
+from profiling import PhaseProfiler, format_phase_table
+from registry import EntityRegistry
+from sharding import plan_shards, run_sharded, shard_seed
+from split_writer import SplitDumpWriter
+from sql_writer import StreamingInsertWriter
+from text_pool import TextPool, unique_email
+from validator import DataValidationError, StreamValidator, lookup, validate_tables
+from vectorized import (
+    bounded_capacity_column, choice_column, code_column, datetime_column,
+    make_rng, money_column, randint_column, sample_without_replacement,
+    skewed_start_times, skewed_status_column,
+)
 
 # Initialize Faker
 # Set locale to en_US for consistent American addressing
-fake = Faker('en_US') 
+fake = Faker('en_US')
 
 # --- Configuration ---
-NUM_USERS = 500     
-NUM_VENUES = 50     
-NUM_EVENTS = 200   
-NUM_ORDERS = 1000    
+NUM_USERS = 500
+NUM_VENUES = 50
+NUM_EVENTS = 200
+NUM_ORDERS = 1000
 TICKETS_PER_ORDER_RANGE = (1, 5)
+NUM_POPULAR_EVENTS = 20
+POPULAR_EVENT_WEIGHT = 7  # Extra ticket-pool weight of a popular event
+BASE_EVENT_WEIGHT = 3     # Ticket-pool weight of every event still on sale
+
+# --- SQL Output Configuration ---
+# Each INSERT statement is cut at whichever limit is hit first
+INSERT_BATCH_ROWS = 5000
+INSERT_BATCH_BYTES = 1024 * 1024
+OUTPUT_FILENAME = 'db/dummy_data.sql'
+
+# --- Output Format ---
+# 'sql' writes OUTPUT_FILENAME; 'tsv' / 'csv' write one file per table plus a
+# load_data.sql (LOAD DATA LOCAL INFILE) into EXPORT_DIR; 'split' writes
+# per-table INSERT chunk files plus an import plan into SPLIT_DIR (loaded in
+# parallel by seeds/import_split.py); 'sqlite' / 'mysql' insert the rows
+# directly into a database.
+OUTPUT_FORMAT = 'sql'
+EXPORT_DIR = 'db/export'
+SPLIT_DIR = 'db/split'
+SPLIT_COMPRESS = None           # None or 'gzip'
+SPLIT_CHUNK_ROWS = 1_000_000    # Rows per chunk file; 0 = one file per table
+
+# --- Direct Database Load Configuration ---
+SQLITE_PATH = 'db/eventify.sqlite3'  # Recreated from db/schema_sqlite.sql on every load except appends
+MYSQL_CONFIG = {'host': 'localhost', 'user': 'root', 'password': '', 'database': 'eventify_db'}
+DB_POOL_SIZE = 4
+DB_BATCH_ROWS = 5000
+
+# --- Sharding Configuration ---
+# The same MASTER_SEED, NUM_SHARDS and REFERENCE_TIME always produce a
+# byte-identical dump, whatever NUM_WORKERS is.
+MASTER_SEED = None      # None = pick a new random seed every run
+NUM_SHARDS = 1          # ID ranges per table for users, events, orders and tickets
+NUM_WORKERS = None      # Worker processes; None = one per CPU core
+REFERENCE_TIME = None   # "Now" for relative dates; None = today at midnight
+
+# --- Append Mode ---
+# Every run writes a manifest (next ids, FK targets, events still on sale).
+# An append run starts from a manifest, or from 'database' (the sqlite/mysql
+# target itself), and adds only new events, orders and tickets whose ids
+# continue the existing sequences, with order dates after the previous run.
+APPEND_FROM = None      # None = regenerate everything
+
+# --- Profiling ---
+# 'phases' writes wall time, rows/sec and peak RSS per phase as JSON next to
+# the output; 'cprofile' or 'sample' also capture call stacks (seeds/profiling.py).
+PROFILE = None          # None = no report
+
+# --- Dataset Cache ---
+# With a cache directory, a fixed-seed run stores its tables as memory-mappable
+# columns keyed by a hash of everything the rows depend on (including these
+# source files); a rerun with the same key skips generation (seeds/dataset_cache.py).
+CACHE_DIR = None        # None = always generate
+DATASET_SOURCES = ['generate_data_v3.py', 'vectorized.py', 'text_pool.py', 'sharding.py', 'registry.py', 'columnar.py', 'manifest.py']
+
+# --- Pre-Load Validation ---
+# Every table is checked against the constraints of db/schema.sql and the
+# trigger rules of db/automation/triggers.sql before anything is written;
+# violations are reported all at once and stop the run (seeds/validator.py).
+# Streamed tables (ticket, derived) are checked chunk by chunk as they are
+# written, so their violations stop the run only after the write.
+VALIDATE = True
+
+# --- Text Pool Configuration ---
+# Names, addresses and titles are drawn from fixed pools of pre-sampled Faker
+# values (cached under seeds/.cache) instead of one Faker call per row.
+TEXT_POOL_SIZE = 20000
+TEXT_POOL_SEED = 0
 
 # --- LOCAL FOCUS CONFIGURATION (San Antonio, TX Area) ---
 LOCAL_CITIES = [
-    'San Antonio', 
-    'New Braunfels', 
-    'Boerne', 
-    'San Marcos', 
-    'Seguin', 
-    'Universal City', 
-    'Schertz', 
+    'San Antonio',
+    'New Braunfels',
+    'Boerne',
+    'San Marcos',
+    'Seguin',
+    'Universal City',
+    'Schertz',
     'Cibolo'
-] 
+]
+
+# --- Value Domains ---
+roles = ['Organizer', 'Attendee', 'Admin']
+statuses = ['Active', 'Suspended'] # Using schema status examples
+venue_kinds = ['Community Center', 'Theater', 'Auditorium', 'Convention Hall', 'Park Pavilion']
+category_names = ['Music', 'Tech Conference', 'Food Festival', 'Sport', 'Arts & Theater', 'Workshop', 'Comedy', 'Exhibition']
+event_statuses = ['Draft', 'Published', 'Completed', 'Canceled']
+past_event_statuses_weighted = ['Completed'] * 8 + ['Canceled', 'Draft'] * 1
+future_event_statuses_weighted = ['Published'] * 7 + ['Draft'] * 2 + ['Canceled'] * 1
+order_statuses_weighted = ['Completed'] * 7 + ['Pending'] * 2 + ['Refunded'] * 1
+ticket_statuses = ['Purchased', 'Reserved', 'Refunded']
+
+# --- Relative Date Windows (same spans as Faker's '+1M', '+2y', ...) ---
+MONTH = timedelta(days=30.42)
+YEAR = timedelta(days=365.24)
 
-# --- Data Storage (for PKs) ---
-user_ids = []
-venue_ids = []
-category_ids = []
-event_ids = []
-order_ids = []
+# Shared, read-only inputs for the shard workers (set once per process)
+_shard_context = {}
+
+
+@dataclass
+class GenerationConfig:
+    """One generator run; defaults come from the module constants above (see seeds/generate.py for the CLI)."""
+    num_users: int = NUM_USERS
+    num_venues: int = NUM_VENUES
+    num_events: int = NUM_EVENTS
+    num_orders: int = NUM_ORDERS
+    num_popular_events: int = NUM_POPULAR_EVENTS
+    master_seed: int = MASTER_SEED
+    num_shards: int = NUM_SHARDS
+    num_workers: int = NUM_WORKERS
+    reference_time: datetime = REFERENCE_TIME
+    output_format: str = OUTPUT_FORMAT
+    output_path: str = None  # None = OUTPUT_FILENAME / EXPORT_DIR / SQLITE_PATH for the format
+    insert_batch_rows: int = INSERT_BATCH_ROWS
+    insert_batch_bytes: int = INSERT_BATCH_BYTES
+    db_pool_size: int = DB_POOL_SIZE
+    db_batch_rows: int = DB_BATCH_ROWS
+    mysql_config: dict = field(default_factory=lambda: dict(MYSQL_CONFIG))
+    text_pool_size: int = TEXT_POOL_SIZE
+    text_pool_seed: int = TEXT_POOL_SEED
+    append_from: str = APPEND_FROM
+    manifest_path: str = None  # None = next to the output (see resolved_manifest_path)
+    profile: str = PROFILE
+    profile_path: str = None  # None = next to the output (see resolved_profile_path)
+    cache_dir: str = CACHE_DIR
+    split_compress: str = SPLIT_COMPRESS
+    split_chunk_rows: int = SPLIT_CHUNK_ROWS
+    validate: bool = VALIDATE
+
+    def resolved_output_path(self):
+        if self.output_path:
+            return self.output_path
+        return {'sql': OUTPUT_FILENAME, 'tsv': EXPORT_DIR, 'csv': EXPORT_DIR, 'split': SPLIT_DIR,
+                'sqlite': SQLITE_PATH}.get(self.output_format)
+
+    def sidecar_path(self, name):
+        """Where a file that belongs to the output (manifest, profile report) goes."""
+        if self.output_format == 'mysql':
+            return os.path.join('db', f"{self.mysql_config['database']}.{name}")
+        if self.output_format in ('tsv', 'csv', 'split'):
+            return os.path.join(self.resolved_output_path(), name)
+        return f"{self.resolved_output_path()}.{name}"
+
+    def resolved_manifest_path(self):
+        return self.manifest_path or self.sidecar_path('manifest.json')
+
+    def resolved_profile_path(self):
+        return self.profile_path or self.sidecar_path('profile.json')
 
 # =================================================================
-# SQL Formatting Function
+# Shard Plumbing
 # =================================================================
 
-def dict_to_sql_inserts(table_name, data):
-    """Converts a list of dictionaries into a MySQL INSERT statement string."""
-    if not data:
-        return f"-- No data generated for {table_name}\n"
-
-    # Get column names from the first dictionary
-    columns = list(data[0].keys())
-    
-    # Start the INSERT statement template
-    sql_template = f"INSERT INTO `{table_name}` ({', '.join(f'`{col}`' for col in columns)}) VALUES\n"
-    
-    values_list = []
-    for row in data:
-        # Format values: convert strings/dates to quoted strings, numbers as-is
-        formatted_values = []
-        for col in columns:
-            value = row[col]
-            if isinstance(value, (str, datetime)):
-                # Escape single quotes and wrap in quotes for SQL
-                formatted_values.append(f"'{str(value).replace("'", "''")}'")
-            elif value is None:
-                formatted_values.append("NULL")
-            else:
-                formatted_values.append(str(value))
-        
-        values_list.append(f"    ({', '.join(formatted_values)})")
+def set_shard_context(context):
+    """Pool initializer: stores the FK inputs every shard of a phase needs."""
+    _shard_context.clear()
+    _shard_context.update(context)
 
-    # Combine values and end the statement with a semicolon
-    return sql_template + ',\n'.join(values_list) + ';\n\n'
 
+def seed_generators(seed):
+    """Reseeds Faker (free text) and returns the NumPy generator (all other columns) for one shard."""
+    fake.seed_instance(seed)
+    return make_rng(seed)
 
 # =================================================================
 # 1. CORE TABLES (No FKs)
 # =================================================================
 
 # 1.1. user Table
-print("--- Generating user data ---")
-user_data = []
-roles = ['organizer', 'attendee', 'admin'] 
-statuses = ['Active', 'Suspended'] # Using schema status examples
-for i in range(1, NUM_USERS + 1):
-    user_id = i
-    user_ids.append(user_id)
-    user_data.append({
-        'user_id': user_id,
-        'first_name': fake.first_name(), 
-        'last_name': fake.last_name(),   
-        'email': fake.unique.email(), # Ensure emails are unique
-        'role': random.choice(roles),
-        'status': random.choice(statuses)
-    })
+def generate_user_shard(task):
+    (start_id, stop_id), seed = task
+    rng = seed_generators(seed)
+
+    text_pool = _shard_context['text_pool']
+    size = stop_id - start_id
+    user_ids = range(start_id, stop_id)
+    first_name_column = text_pool.column(rng, 'first_name', size)
+    last_name_column = text_pool.column(rng, 'last_name', size)
+    domain_column = text_pool.column(rng, 'email_domain', size)
+
+    return ColumnTable(
+        user_id=user_ids,
+        first_name=first_name_column,
+        last_name=last_name_column,
+        email=DerivedColumn(unique_email, first_name_column, last_name_column, user_ids, domain_column), # Unique by construction
+        role=code_column(rng, roles, size),
+        status=code_column(rng, statuses, size),
+    )
 
 # 1.2. venue Table
-print("--- Generating venue data ---")
-venue_data = []
-for i in range(1, NUM_VENUES + 1):
-    venue_id = i + 100 
-    venue_ids.append(venue_id)
-    
-    local_city = random.choice(LOCAL_CITIES)
-    
-    venue_data.append({
-        'venue_id': venue_id,
-        'name': local_city + ' ' + random.choice(['Community Center', 'Theater', 'Auditorium', 'Convention Hall', 'Park Pavilion']),
-        'capacity': random.randint(50, 15000),
-        'address': fake.street_address(),
-        'city': local_city 
-    })
+def generate_venues(seed, text_pool, num_venues=NUM_VENUES):
+    rng = seed_generators(seed)
+    seen_locations = set()
+
+    city_column = choice_column(rng, LOCAL_CITIES, num_venues)
+    kind_column = choice_column(rng, venue_kinds, num_venues)
+    capacity_column = randint_column(rng, 50, 15000, num_venues)
+
+    name_column = []
+    address_column = []
+    for local_city, kind in zip(city_column, kind_column):
+        name = local_city + ' ' + kind
+
+        # (name, address, city) is a unique key, so redraw the pooled address on a clash
+        address = text_pool.column(rng, 'street_address', 1)[0]
+        while (name, address, local_city) in seen_locations:
+            address = text_pool.column(rng, 'street_address', 1)[0]
+        seen_locations.add((name, address, local_city))
+
+        name_column.append(name)
+        address_column.append(address)
+
+    return ColumnTable(
+        venue_id=range(101, num_venues + 101),
+        name=name_column,
+        capacity=int_column(capacity_column),
+        address=address_column,
+        city=city_column,
+    )
 
 # 1.3. category Table
-print("--- Generating category data ---")
-category_data = []
-category_names = ['Music', 'Tech Conference', 'Food Festival', 'Sport', 'Arts & Theater', 'Workshop', 'Comedy', 'Exhibition'] 
-for i, name in enumerate(category_names):
-    category_id = i + 1
-    category_ids.append(category_id)
-    category_data.append({
-        'category_id': category_id,
-        'name': name 
-    })
+def generate_categories():
+    return ColumnTable(
+        category_id=range(1, len(category_names) + 1),
+        name=list(category_names),
+    )
 
 # =================================================================
 # 2. EVENT-RELATED TABLES (Requires user and venue FKs)
@@ -123,7 +274,7 @@ for i, name in enumerate(category_names):
 # --- FUNCTION TO GENERATE MEANINGFUL DESCRIPTION ---
 def generate_meaningful_description(title, category_name):
     base_description = f"Join us for {title}, a premier event in the heart of San Antonio! "
-    
+
     # Customize the description based on the category
     if 'Music' in category_name:
         description = base_description + fake.sentence(nb_words=10) + " Featuring local bands, rising stars, and a dynamic sound system. Get your tickets now before they sell out!"
@@ -139,177 +290,722 @@ def generate_meaningful_description(title, category_name):
         description = base_description + "Boost your skills with our hands-on workshop focused on " + fake.word() + " and digital marketing. Bring your laptop and your learning hat! " + fake.sentence(nb_words=7)
     else:
         # Fallback for generic events
-        description = base_description + fake.paragraph(nb_sentences=3) 
-        
+        description = base_description + fake.paragraph(nb_sentences=3)
+
     # Ensure the description doesn't exceed 200 characters
     return description[:200]
 
-# 2.1. event Table
-print("--- Generating event data ---")
-event_data = []
-event_statuses = ['Draft', 'Published', 'Completed', 'Canceled']
-organizer_ids = [u['user_id'] for u in user_data if u['role'] == 'organizer']
-if not organizer_ids:
-    organizer_ids = user_ids
-
-for i in range(1, NUM_EVENTS + 1):
-    event_id = i + 1000
-    event_ids.append(event_id)
-    
+# 2.1. event Table + 2.2. event_category Table (Junction Table)
+def festival_title(catch_phrase):
+    return catch_phrase + ' Festival'
+
+
+def generate_event_shard(task):
+    (start_id, stop_id), seed = task
+    rng = seed_generators(seed)
+
+    now = _shard_context['reference_time']
+    organizer_ids = _shard_context['organizer_ids']
+    venue_capacities = _shard_context['venue_capacities']
+    category_names_by_id = _shard_context['category_names']
+    category_ids = list(category_names_by_id)
+    size = stop_id - start_id
+    event_ids = range(start_id, stop_id)
+
     # --- DATE SKEWING LOGIC ---
-    if random.random() < 0.7:
-        start_time = fake.date_time_between(start_date='+1M', end_date='+2y', tzinfo=None)
-    else:
-        start_time = fake.date_time_between(start_date='-1y', end_date='-1M', tzinfo=None)
-        
-    end_time = start_time + timedelta(hours=random.randint(2, 8))
-    
-    chosen_venue_id = random.choice(venue_ids)
-    chosen_venue_capacity = next((v['capacity'] for v in venue_data if v['venue_id'] == chosen_venue_id), 1000)
-    
-    event_title = fake.catch_phrase() + ' Festival'
-    
-    # --- Category and Description ---
-    random_category_id = random.choice(category_ids)
-    category_info = next(c for c in category_data if c['category_id'] == random_category_id)
-    primary_category_name = category_info['name'] 
-    custom_description = generate_meaningful_description(event_title, primary_category_name)
-    
+    # 70% future (1 month to 2 years out), 30% past (1 year ago to 1 month ago)
+    start_times, is_past = skewed_start_times(rng, (now + MONTH, now + 2 * YEAR), (now - YEAR, now - MONTH), size)
+    end_times = start_times + rng.integers(2, 9, size).astype('timedelta64[h]')
+
+    # --- Venue and capacity (at most 90% of the venue) ---
+    venue_column = choice_column(rng, list(venue_capacities), size)
+    capacity_column = bounded_capacity_column(rng, [venue_capacities[venue_id] for venue_id in venue_column])
+
     # --- STATUS SKEWING LOGIC ---
-    if start_time < datetime.now():
-        status_choice = random.choice(['Completed'] * 8 + ['Canceled', 'Draft'] * 1) 
-    else:
-        status_choice = random.choice(['Published'] * 7 + ['Draft'] * 2 + ['Canceled'] * 1)
-        
-    event_data.append({
-        'event_id': event_id,
-        'organizer_id': random.choice(organizer_ids),
-        'venue_id': chosen_venue_id,
-        'title': event_title,
-        'description': custom_description, 
-        'start_time': start_time.strftime('%Y-%m-%d %H:%M:%S'),
-        'end_time': end_time.strftime('%Y-%m-%d %H:%M:%S'),
-        'capacity': random.randint(50, int(chosen_venue_capacity * 0.9)), 
-        'status': status_choice
-    })
-    
-# 2.2. event_category Table (Junction Table)
-print("--- Generating event_category data ---")
-event_category_data = []
-seen_event_categories = set()
-
-for event in event_data:
-    event_id = event['event_id']
-    
-    min_categories = 1 if event['status'] == 'Published' else 0
-    num_categories = random.randint(min_categories, 2)
-
-    categories_to_assign = random.sample(category_ids, k=num_categories)
-    for category_id in categories_to_assign:
-        key = (event_id, category_id)
-        if key not in seen_event_categories:
-            event_category_data.append({
-                'event_id': event_id,
-                'category_id': category_id
-            })
-            seen_event_categories.add(key)
-
-# --- Hit Event Weighting ---
-NUM_POPULAR_EVENTS = 20
-popular_event_ids = random.sample([e['event_id'] for e in event_data if e['status'] == 'Published'], k=NUM_POPULAR_EVENTS)
-AVAILABLE_TICKET_EVENTS = popular_event_ids * 7 + [e['event_id'] for e in event_data] * 3
+    status_column = skewed_status_column(rng, is_past, past_event_statuses_weighted, future_event_statuses_weighted)
+
+    organizer_column = choice_column(rng, organizer_ids, size)
+    primary_category_column = choice_column(rng, category_ids, size)
+    catch_phrase_column = _shard_context['text_pool'].column(rng, 'catch_phrase', size)
+
+    # Published events need at least one category; the sample never repeats a pair
+    min_categories = [1 if status == 'Published' else 0 for status in status_column]
+    category_samples = sample_without_replacement(rng, category_ids, rng.integers(min_categories, 3))
+
+    # --- Description (the only per-row Faker call) ---
+    description_column = [
+        generate_meaningful_description(festival_title(catch_phrase), category_names_by_id[primary_category_id])
+        for catch_phrase, primary_category_id in zip(catch_phrase_column, primary_category_column)
+    ]
+
+    event_data = ColumnTable(
+        event_id=event_ids,
+        organizer_id=int_column(organizer_column),
+        venue_id=int_column(venue_column),
+        title=DerivedColumn(festival_title, catch_phrase_column),
+        description=description_column,
+        start_time=DateTimeColumn.from_datetime64(start_times),
+        end_time=DateTimeColumn.from_datetime64(end_times),
+        capacity=int_column(capacity_column),
+        status=CodeColumn.encode(status_column, event_statuses),
+    )
+
+    pair_event_ids = array('q')
+    pair_category_ids = array('q')
+    for event_id, categories in zip(event_ids, category_samples):
+        for category_id in categories:
+            pair_event_ids.append(event_id)
+            pair_category_ids.append(category_id)
+    event_category_data = ColumnTable(event_id=pair_event_ids, category_id=pair_category_ids)
+
+    return event_data, event_category_data
 
 # =================================================================
 # 3. ORDER & TICKET TABLES (Requires user, event FKs)
 # =================================================================
 
 # 3.1. orders Table
-print("--- Generating orders data ---")
-order_data = []
-order_statuses_weighted = ['Completed'] * 7 + ['Pending'] * 2 + ['Refunded'] * 1 
-attendee_ids = [u['user_id'] for u in user_data if u['role'] == 'attendee']
-
-for i in range(1, NUM_ORDERS + 1):
-    order_id = i + 5000
-    order_ids.append(order_id)
-    
-    order_data.append({
-        'order_id': order_id,
-        'user_id': random.choice(attendee_ids) if attendee_ids else random.choice(user_ids),
-        'total_amount': round(random.uniform(20.0, 500.0), 2),
-        'order_date': fake.date_time_between(start_date='-6m', end_date='now', tzinfo=None).strftime('%Y-%m-%d %H:%M:%S'),
-        'status': random.choice(order_statuses_weighted)
-    })
+def generate_order_shard(task):
+    (start_id, stop_id), seed = task
+    rng = seed_generators(seed)
+
+    window_start, window_end = _shard_context['order_window']
+    size = stop_id - start_id
+
+    return ColumnTable(
+        order_id=range(start_id, stop_id),
+        user_id=int_column(choice_column(rng, _shard_context['buyer_ids'], size)),
+        total_amount=float_column(money_column(rng, 20.0, 500.0, size)),
+        order_date=DateTimeColumn.from_datetime64(datetime_column(rng, window_start, window_end, size)),
+        status=code_column(rng, order_statuses_weighted, size),
+    )
 
 # 3.2. ticket Table
-print("--- Generating ticket data ---")
-ticket_data = []
-ticket_statuses = ['Purchased', 'Reserved', 'Refunded']
-ticket_counter = 1
-
-for order in order_data:
-    if order['status'] == 'Completed':
-        num_tickets = random.randint(*TICKETS_PER_ORDER_RANGE)
-        
-        available_ticket_events_no_cancel = [
-            eid for eid in AVAILABLE_TICKET_EVENTS 
-            if next(e for e in event_data if e['event_id'] == eid)['status'] != 'Canceled'
-        ]
-
-        if not available_ticket_events_no_cancel: continue
-            
-        event_id = random.choice(available_ticket_events_no_cancel)
-        
-        if order['total_amount'] > 0 and num_tickets > 0:
-            price_per_ticket = round(order['total_amount'] / num_tickets, 2)
-        else:
-            price_per_ticket = 0.00
-            
-        
-        for _ in range(num_tickets):
-            ticket_data.append({
-                'ticket_id': f"TKT-{ticket_counter:05d}",
-                'order_id': order['order_id'],
-                'event_id': event_id,
-                'user_id': order['user_id'],
-                'price': price_per_ticket,
-                'status': random.choice(ticket_statuses)
-            })
-            ticket_counter += 1
+# ticket_id is numbered across shards in merge_ticket_shards()
+TICKET_COLUMNS = ['ticket_id', 'order_id', 'event_id', 'user_id', 'price', 'status']
+
+
+def format_ticket_id(ticket_number):
+    # Zero-padded so the string keys stay in insert order
+    return f"TKT-{ticket_number:08d}"
+
+
+def generate_ticket_shard(task):
+    orders, seed = task
+    rng = seed_generators(seed)
+
+    # Weighted pool of events that can still sell (Completed and Canceled events already excluded)
+    ticket_pool = _shard_context['ticket_pool']
+
+    # Only Completed orders get tickets
+    completed_positions = np.flatnonzero(orders['status'].mask('Completed'))
+    size = len(completed_positions)
+    if not size or not ticket_pool:
+        return ColumnTable(order_id=array('q'), event_id=array('q'), user_id=array('q'), price=array('d'),
+                           status=CodeColumn(ticket_statuses, array('B')))
+
+    ticket_count_column = rng.integers(TICKETS_PER_ORDER_RANGE[0], TICKETS_PER_ORDER_RANGE[1] + 1, size)
+    event_column = choice_column(rng, ticket_pool, size)
+    amounts = as_numpy(orders['total_amount'])[completed_positions]
+    price_column = np.where(amounts > 0, np.round(amounts / ticket_count_column, 2), 0.00)
+    status_column = code_column(rng, ticket_statuses, int(ticket_count_column.sum()))
+
+    # Every order's values repeat once per ticket of the order
+    def per_ticket(values):
+        return np.repeat(np.asarray(values), ticket_count_column)
+
+    return ColumnTable(
+        order_id=int_column(per_ticket(as_numpy(orders['order_id'])[completed_positions])),
+        event_id=int_column(per_ticket(np.asarray(event_column, dtype=np.int64))),
+        user_id=int_column(per_ticket(as_numpy(orders['user_id'])[completed_positions])),
+        price=float_column(per_ticket(price_column)),
+        status=status_column,
+    )
+
+
+def limit_event_seats(shard_results, event_ids, seat_limits):
+    """Yields the shards' ticket tables without the Purchased/Reserved tickets past their event's seat limit.
+
+    seat_limits are the seats each event has left before this run (capacity
+    for new events). check_event_status_before_sale rejects the rest as sold
+    out. Shards are handled in order, so the same tickets are dropped whatever
+    the worker count.
+    """
+    event_ids = np.asarray(event_ids, dtype=np.int64)
+    held = np.zeros(len(event_ids), dtype=np.int64)
+    for shard in shard_results:
+        holds_seat = shard['status'].mask('Purchased') | shard['status'].mask('Reserved')
+        positions = np.flatnonzero(holds_seat)
+        events = lookup(event_ids, as_numpy(shard['event_id'])[positions])
+        # Seat number of every held ticket: seats its event had before this shard plus its rank in the shard
+        order = np.argsort(events, kind='stable')
+        ordered = events[order]
+        rows = np.arange(len(ordered))
+        group_starts = np.maximum.accumulate(np.where(np.r_[True, ordered[1:] != ordered[:-1]][:len(ordered)], rows, 0))
+        seats = np.empty(len(order), dtype=np.int64)
+        seats[order] = held[ordered] + rows - group_starts
+        sold_out = seats >= seat_limits[events]
+        held += np.bincount(events[~sold_out], minlength=len(held))
+        if not sold_out.any():
+            yield shard
+            continue
+        keep = np.ones(len(shard), dtype=bool)
+        keep[positions[sold_out]] = False
+        yield ColumnTable(
+            order_id=int_column(as_numpy(shard['order_id'])[keep]),
+            event_id=int_column(as_numpy(shard['event_id'])[keep]),
+            user_id=int_column(as_numpy(shard['user_id'])[keep]),
+            price=float_column(as_numpy(shard['price'])[keep]),
+            status=CodeColumn(shard['status'].values, as_numpy(shard['status'].codes)[keep]),
+        )
+
+
+def merge_ticket_shards(shard_results, first_ticket_number=1):
+    """Yields the shards' ticket tables in order, numbering them in one global sequence."""
+    ticket_counter = first_ticket_number
+    for shard in shard_results:
+        ticket_numbers = range(ticket_counter, ticket_counter + len(shard))
+        ticket_counter = ticket_numbers.stop
+        yield ColumnTable(ticket_id=DerivedColumn(format_ticket_id, ticket_numbers), **shard.column_map())
+
+# 3.3. event_sales_summary Table (derived from ticket)
+# sales[event_id] = [Purchased, Reserved, Refunded, Purchased revenue]
+SALES_SLOTS = {'Purchased': 0, 'Reserved': 1, 'Refunded': 2}
+NO_SALES = (0, 0, 0, 0.0)
+
+
+def tally_ticket_sales(ticket_chunks, sales):
+    """Passes ticket chunks through unchanged while counting them into sales[event_id]."""
+    for chunk in ticket_chunks:
+        for event_id, status, price in zip(chunk['event_id'], chunk['status'], chunk['price']):
+            counts = sales.get(event_id)
+            if counts is None:
+                counts = sales[event_id] = list(NO_SALES)
+            counts[SALES_SLOTS[status]] += 1
+            if status == 'Purchased':
+                counts[3] += price
+        yield chunk
+
+
+def generate_event_sales_summary(event_ids, sales):
+    """Yields one summary row per event; only iterate once every ticket has passed through tally_ticket_sales()."""
+    for event_id in event_ids:
+        purchased, reserved, refunded, revenue = sales.get(event_id, NO_SALES)
+        yield {
+            'event_id': event_id,
+            'purchased_count': purchased,
+            'reserved_count': reserved,
+            'refunded_count': refunded,
+            'purchased_revenue': round(revenue, 2),
+        }
+
+# 3.4. event_inventory Table (derived from event + ticket)
+def generate_event_inventory(event_data, sales):
+    """Yields the seats left per event (capacity minus Purchased/Reserved, floored at 0 like CHK_InventoryRemaining)."""
+    for event_id, capacity in zip(event_data['event_id'], event_data['capacity']):
+        purchased, reserved, _, _ = sales.get(event_id, NO_SALES)
+        yield {
+            'event_id': event_id,
+            'remaining': max(0, capacity - purchased - reserved),
+        }
+
+# 3.5. daily_event_revenue Table (derived from orders + ticket)
+class RevenueTally:
+    """Ticket count and revenue per (order day, event_id).
+
+    A (day, event_id) group is one packed int key pointing at a slot in two
+    arrays, instead of a tuple key and a [count, amount] list per group.
+    Days are counted from 1970-01-01 (see epoch_day_to_date).
+    """
+
+    EVENT_ID_BITS = 32
+
+    def __init__(self):
+        self.slots = {}                 # packed (day, event_id) -> slot, in first-seen order
+        self.ticket_counts = array('q')
+        self.amounts = array('d')
+
+    def __len__(self):
+        return len(self.slots)
+
+    def add_tickets(self, keys, prices):
+        """Adds tickets one at a time, so every group's amount is summed in ticket order."""
+        slots, ticket_counts, amounts = self.slots, self.ticket_counts, self.amounts
+        for key, price in zip(keys, prices):
+            slot = slots.get(key)
+            if slot is None:
+                slot = slots[key] = len(amounts)
+                ticket_counts.append(0)
+                amounts.append(0.0)
+            ticket_counts[slot] += 1
+            amounts[slot] += price
+
+    def items(self):
+        """((day, event_id), (ticket_count, amount)) per group, in (day, event_id) order."""
+        mask = (1 << self.EVENT_ID_BITS) - 1
+        for key in sorted(self.slots):
+            slot = self.slots[key]
+            yield (key >> self.EVENT_ID_BITS, key & mask), (self.ticket_counts[slot], self.amounts[slot])
+
+
+# Tickets converted to Python ints/floats at a time while tallying revenue
+TALLY_CHUNK_ROWS = 65536
+
+
+def tally_ticket_revenue(ticket_chunks, order_data, revenue):
+    """Passes ticket chunks through while adding tickets of Completed orders into a RevenueTally.
+
+    order_data's ids must be one range.
+    """
+    first_order_id = order_data['order_id'].start
+    order_days = order_data['order_date'].days()
+    order_completed = order_data['status'].mask('Completed')
+    for chunk in ticket_chunks:
+        positions = as_numpy(chunk['order_id']) - first_order_id
+        completed = order_completed[positions]
+        keys = (order_days[positions][completed] << RevenueTally.EVENT_ID_BITS) | as_numpy(chunk['event_id'])[completed]
+        prices = as_numpy(chunk['price'])[completed]
+        for start in range(0, len(keys), TALLY_CHUNK_ROWS):
+            revenue.add_tickets(keys[start:start + TALLY_CHUNK_ROWS].tolist(),
+                                prices[start:start + TALLY_CHUNK_ROWS].tolist())
+        yield chunk
+
+
+def generate_daily_event_revenue(revenue):
+    """Yields one rollup row per (day, event); only iterate once every ticket has passed through tally_ticket_revenue()."""
+    for (day, event_id), (ticket_count, amount) in revenue.items():
+        yield {'revenue_date': epoch_day_to_date(day), 'event_id': event_id, 'ticket_count': ticket_count, 'revenue': round(amount, 2)}
 
 # =================================================================
-# 4. REVIEW AND OUTPUT (Display a sample and generate SQL)
+# 4. GENERATE, REVIEW AND OUTPUT
 # =================================================================
 
-print("\n--- SAMPLE OUTPUT ---")
-print(f"Total users generated: {len(user_data)}")
-print(f"Sample user: {user_data[0]}") # Will now show first_name and last_name
-print(f"Total events generated: {len(event_data)}")
-print(f"Sample event: {event_data[0]}")
-print(f"Total orders generated: {len(order_data)}")
-print(f"Sample order: {order_data[0]}")
-print(f"Total tickets generated: {len(ticket_data)}")
-print(f"Sample ticket: {ticket_data[0]}")
-
-
-# 4.1. Generate SQL
-print("\n--- Generating SQL INSERT Statements ---")
-sql_output = ""
-
-# Order of insertion is CRITICAL due to FK constraints
-sql_output += dict_to_sql_inserts("user", user_data)
-sql_output += dict_to_sql_inserts("venue", venue_data)
-sql_output += dict_to_sql_inserts("category", category_data)
-sql_output += dict_to_sql_inserts("event", event_data)
-sql_output += dict_to_sql_inserts("event_category", event_category_data)
-sql_output += dict_to_sql_inserts("orders", order_data)
-sql_output += dict_to_sql_inserts("ticket", ticket_data)
-
-# 4.2. Save to a file
-output_filename = 'db/dummy_data.sql'
-try:
-    with open(output_filename, 'w', encoding='utf-8') as f:
-        f.write(sql_output)
-    print(f"✅ Success! SQL data saved to {output_filename}. Ready for database import.")
-except IOError as e:
-    print(f"❌ Error saving file: {e}")
\ No newline at end of file
+def load_append_base(config, output_path):
+    """The manifest an append run continues from; append_from='database' reads it from the sqlite/mysql target."""
+    if config.append_from != 'database':
+        return load_manifest(config.append_from)
+    if config.output_format == 'sqlite':
+        if not os.path.exists(output_path):
+            raise FileNotFoundError(f"Cannot append: {output_path} does not exist")
+        connect = sqlite_connector(output_path)
+    elif config.output_format == 'mysql':
+        connect = mysql_connector(**config.mysql_config)
+    else:
+        raise ValueError("append_from='database' needs output_format 'sqlite' or 'mysql'")
+    conn = connect()
+    try:
+        return manifest_from_database(conn, '?' if connect.paramstyle == 'qmark' else '%s')
+    finally:
+        conn.close()
+
+
+@dataclass
+class GenerationRun:
+    """What writing and the manifest need from a generator run besides its tables."""
+    master_seed: int
+    reference_time: datetime
+    next_ids: dict
+    order_window: tuple
+    event_ids: object        # ids of this run's new events
+    num_orders: int
+    ticket_sales: dict       # filled while the ticket table streams to the writer
+    organizer_ids: object
+    buyer_ids: object
+    venue_capacities: dict
+    category_names: dict
+    registry: EntityRegistry
+    popular_event_ids: list
+
+    def manifest(self, ticket_count):
+        return build_manifest(
+            master_seed=self.master_seed,
+            reference_time=self.reference_time,
+            next_ids={
+                'event': self.next_ids['event'] + len(self.event_ids),
+                'orders': self.next_ids['orders'] + self.num_orders,
+                'ticket': self.next_ids['ticket'] + ticket_count,
+            },
+            organizer_ids=self.organizer_ids,
+            buyer_ids=self.buyer_ids,
+            venue_capacities=self.venue_capacities,
+            category_names=self.category_names,
+            events=self.registry.events.rows(),
+            popular_event_ids=self.popular_event_ids,
+            ticket_sales=self.ticket_sales,
+        )
+
+
+def dataset_cache_params(config, master_seed, reference_time):
+    """Everything the generated rows depend on; the dataset cache key is a hash of this."""
+    here = os.path.dirname(os.path.abspath(__file__))
+    return {
+        'sizes': {
+            'users': config.num_users,
+            'venues': config.num_venues,
+            'events': config.num_events,
+            'orders': config.num_orders,
+            'popular_events': config.num_popular_events,
+        },
+        'master_seed': master_seed,
+        'num_shards': config.num_shards,
+        'reference_time': reference_time.isoformat(sep=' '),
+        'text_pool': {'size': config.text_pool_size, 'seed': config.text_pool_seed, 'faker': FAKER_VERSION},
+        'local_cities': LOCAL_CITIES,
+        'category_names': category_names,
+        'value_domains': [roles, statuses, venue_kinds, event_statuses, ticket_statuses],
+        'skew': {
+            'past_event_statuses': past_event_statuses_weighted,
+            'future_event_statuses': future_event_statuses_weighted,
+            'order_statuses': order_statuses_weighted,
+            'tickets_per_order': TICKETS_PER_ORDER_RANGE,
+            'event_weights': [POPULAR_EVENT_WEIGHT, BASE_EVENT_WEIGHT],
+        },
+        'code': source_digest([os.path.join(here, name) for name in DATASET_SOURCES]),
+        'numpy': np.__version__,
+    }
+
+
+def generate_tables(config, profiler, master_seed, reference_time, append_base=None):
+    """Generates every table of one run; returns ({table_name: rows}, GenerationRun).
+
+    ticket and the derived tables are lazy streams, so the returned tables can
+    be consumed only once and in TABLE_ORDER (every writer does both).
+    """
+    if append_base is None:
+        next_ids = {'event': 1001, 'orders': 5001, 'ticket': 1}
+        phase_prefix = ''
+        order_window = (reference_time - 6 * MONTH, reference_time)
+        # Every row is registered so FK lookups and eligibility filters are O(1)
+        registry = EntityRegistry()
+    else:
+        previous_time = append_base['reference_time']
+        if reference_time <= previous_time:
+            raise ValueError(f"Append reference time {reference_time} must be after the dataset's {previous_time}")
+        next_ids = append_base['next_ids']
+        # Fresh shard seeds per append, so a reused master seed never repeats earlier rows
+        phase_prefix = f"append@{previous_time:%Y%m%d%H%M%S}:"
+        order_window = (previous_time + timedelta(seconds=1), reference_time)
+        registry = EntityRegistry()
+        print(f"--- Appending after {previous_time}: events from {next_ids['event']}, "
+              f"orders from {next_ids['orders']}, tickets from {next_ids['ticket']} ---")
+
+    with profiler.phase('text pool') as phase:
+        text_pool = TextPool.load_or_build(config.text_pool_size, seed=config.text_pool_seed)
+        phase.rows = config.text_pool_size
+
+    def tasks(phase, first_id, count):
+        return [(id_range, shard_seed(master_seed, phase_prefix + phase, index))
+                for index, id_range in enumerate(plan_shards(first_id, count, config.num_shards))]
+
+    if append_base is None:
+        # 1.1. user Table
+        print("--- Generating user data ---")
+        with profiler.phase('user') as phase:
+            user_data = ColumnTable.concat(list(run_sharded(generate_user_shard, tasks('user', 1, config.num_users),
+                                                            config.num_workers, set_shard_context, ({'text_pool': text_pool},))))
+            registry.add_users(user_data)
+            phase.rows = len(user_data)
+
+        # 1.2. venue Table
+        print("--- Generating venue data ---")
+        with profiler.phase('venue') as phase:
+            venue_data = generate_venues(shard_seed(master_seed, 'venue', 0), text_pool, config.num_venues)
+            registry.add_venues(venue_data)
+            phase.rows = len(venue_data)
+
+        # 1.3. category Table
+        print("--- Generating category data ---")
+        with profiler.phase('category') as phase:
+            category_data = generate_categories()
+            registry.add_categories(category_data)
+            phase.rows = len(category_data)
+
+        organizer_ids = registry.user_ids_with_role('Organizer') or registry.user_ids
+        buyer_ids = registry.user_ids_with_role('Attendee') or registry.user_ids
+        venue_capacities = {venue_id: registry.venue_capacity(venue_id) for venue_id in registry.venue_ids}
+        category_names_by_id = {category_id: registry.category_name(category_id) for category_id in registry.category_ids}
+    else:
+        # Users, venues and categories already exist; new rows only reference them
+        user_data = venue_data = category_data = None
+        organizer_ids = append_base['organizer_ids']
+        buyer_ids = append_base['buyer_ids']
+        venue_capacities = append_base['venue_capacities']
+        category_names_by_id = append_base['category_names']
+        # Existing events still on sale go into the ticket pool ahead of the new ones
+        registry.add_events(open_events_table(append_base['open_events']))
+
+    # 2.1. event Table + 2.2. event_category Table
+    print("--- Generating event and event_category data ---")
+    event_context = {
+        'reference_time': reference_time,
+        'text_pool': text_pool,
+        'organizer_ids': organizer_ids,
+        'venue_capacities': venue_capacities,
+        'category_names': category_names_by_id,
+    }
+    with profiler.phase('event + event_category') as phase:
+        event_shards = list(run_sharded(generate_event_shard, tasks('event', next_ids['event'], config.num_events),
+                                        config.num_workers, set_shard_context, (event_context,)))
+        event_data = ColumnTable.concat([events for events, _ in event_shards])
+        event_category_data = ColumnTable.concat([event_categories for _, event_categories in event_shards])
+        del event_shards
+        registry.add_events(event_data)
+        phase.rows = len(event_data) + len(event_category_data)
+
+    # --- Hit Event Weighting ---
+    # An append keeps the earlier hits that are still on sale and adds new ones
+    published_event_ids = [event_id for event_id, status in zip(event_data['event_id'], event_data['status']) if status == 'Published']
+    popular_rng = make_rng(shard_seed(master_seed, phase_prefix + 'popular', 0))
+    popular_event_ids = popular_rng.choice(published_event_ids, size=min(config.num_popular_events, len(published_event_ids)), replace=False).tolist()
+    if append_base:
+        popular_event_ids = [event_id for event_id in append_base['popular_event_ids'] if event_id in registry.events] + popular_event_ids
+    # Popular events weigh 7 + 3, all others 3; Completed and Canceled events are kept out of the pool
+    registry.set_ticket_weights(popular_event_ids, popular_weight=POPULAR_EVENT_WEIGHT, base_weight=BASE_EVENT_WEIGHT)
+
+    # 3.1. orders Table
+    print("--- Generating orders data ---")
+    order_context = {
+        'order_window': order_window,
+        'buyer_ids': buyer_ids,
+    }
+    with profiler.phase('orders') as phase:
+        order_data = ColumnTable.concat(list(run_sharded(generate_order_shard, tasks('orders', next_ids['orders'], config.num_orders),
+                                                         config.num_workers, set_shard_context, (order_context,))))
+        registry.add_orders(order_data)
+        phase.rows = len(order_data)
+
+    print("\n--- SAMPLE OUTPUT ---")
+    if user_data is not None:
+        print(f"Total users generated: {len(user_data)}")
+        print(f"Sample user: {user_data.row(0)}") # Will now show first_name and last_name
+    print(f"Total events generated: {len(event_data)}")
+    print(f"Sample event: {event_data.row(0)}")
+    print(f"Total orders generated: {len(order_data)}")
+    print(f"Sample order: {order_data.row(0)}")
+
+    # 3.2. ticket Table
+    # Tickets are the largest table: each shard covers the tickets of one order
+    # range and is streamed into the SQL writer as soon as it is ready.
+    first_order_id = next_ids['orders']
+    ticket_tasks = [(order_data.slice(start - first_order_id, stop - first_order_id), seed)
+                    for (start, stop), seed in tasks('ticket', first_order_id, config.num_orders)]
+    ticket_context = {'ticket_pool': registry.ticket_pool()}
+    ticket_shards = run_sharded(generate_ticket_shard, ticket_tasks, config.num_workers, set_shard_context, (ticket_context,))
+
+    # 3.3. - 3.5. event_sales_summary, event_inventory and the daily revenue
+    # rollup are counted while tickets stream past; every writer handles
+    # them after ticket, so the counters are complete by then
+    ticket_sales = {}
+    ticket_revenue = RevenueTally()
+    # Existing events only have the seats the base says are left
+    seat_limits = registry.events.column('capacity')
+    if append_base:
+        seat_limits[:len(append_base['open_events'])] = [seats_left(event) for event in append_base['open_events'].values()]
+    ticket_shards = limit_event_seats(ticket_shards, registry.event_ids, seat_limits)
+    ticket_chunks = tally_ticket_revenue(
+        tally_ticket_sales(merge_ticket_shards(ticket_shards, next_ids['ticket']), ticket_sales),
+        order_data, ticket_revenue,
+    )
+
+    tables = {
+        'user': user_data,
+        'venue': venue_data,
+        'category': category_data,
+        'event': event_data,
+        'event_category': event_category_data,
+        'orders': order_data,
+        # Charges chunk generation to the 'ticket' phase, not the writer's (no-op without --profile)
+        'ticket': TableStream(TICKET_COLUMNS, profiler.iterate('ticket', ticket_chunks, size=len)),
+        'event_sales_summary': generate_event_sales_summary(registry.event_ids, ticket_sales),
+        'event_inventory': generate_event_inventory(event_data, ticket_sales),
+        'daily_event_revenue': generate_daily_event_revenue(ticket_revenue),
+    }
+    if append_base:
+        # Only new rows are written; the derived rows of existing events change
+        # in place (see the refresh below, or the triggers for file imports)
+        for table_name in ('user', 'venue', 'category', 'event_sales_summary', 'event_inventory',
+                           'daily_event_revenue'):
+            del tables[table_name]
+    # Like ticket, the derived tables are produced while the writer consumes
+    # them; their generation time is charged to their own phase
+    for table_name in ('event_sales_summary', 'event_inventory', 'daily_event_revenue'):
+        if table_name in tables:
+            tables[table_name] = profiler.iterate(table_name, tables[table_name])
+
+    return tables, GenerationRun(
+        master_seed=master_seed,
+        reference_time=reference_time,
+        next_ids=next_ids,
+        order_window=order_window,
+        event_ids=event_data['event_id'],
+        num_orders=len(order_data),
+        ticket_sales=ticket_sales,
+        organizer_ids=organizer_ids,
+        buyer_ids=buyer_ids,
+        venue_capacities=venue_capacities,
+        category_names=category_names_by_id,
+        registry=registry,
+        popular_event_ids=popular_event_ids,
+    )
+
+
+def main(config=None):
+    config = config or GenerationConfig()
+    output_path = config.resolved_output_path()
+    profiler = PhaseProfiler(config.profile)
+    profiler.start()
+    append_base = None
+    if config.append_from:
+        with profiler.phase('append base'):
+            append_base = load_append_base(config, output_path)
+
+    if config.master_seed is not None:
+        master_seed = config.master_seed
+    elif append_base and append_base['master_seed'] is not None:
+        master_seed = append_base['master_seed']
+    else:
+        master_seed = random.randrange(2**32)
+    reference_time = config.reference_time or datetime.combine(date.today(), time())
+    print(f"--- Master seed {master_seed}, {config.num_shards} shard(s), reference time {reference_time} ---")
+
+    # A cached dataset is only reusable when the seed is fixed and nothing is appended
+    cache = cache_key = None
+    if config.cache_dir:
+        if append_base is not None or config.master_seed is None:
+            print("--- Dataset cache skipped: it needs a fixed seed and no --append-from ---")
+        else:
+            cache = DatasetCache(config.cache_dir)
+            cache_key = dataset_cache_key(dataset_cache_params(config, master_seed, reference_time))
+
+    run = manifest = cache_status = None
+    cached = cache.load(cache_key) if cache else None
+    if cached is not None:
+        cache_status = 'hit'
+        print(f"--- Loaded dataset {cache_key} from the cache ({cached.path}) ---")
+    else:
+        tables, run = generate_tables(config, profiler, master_seed, reference_time, append_base)
+        if cache:
+            # Store first, then write from the stored columns like any later hit
+            with profiler.phase('cache save') as phase:
+                cache_writer = cache.writer(cache_key)
+                try:
+                    phase.rows = sum(cache_writer.write_tables(tables).values())
+                    cache_writer.commit(run.manifest(cache_writer.row_counts['ticket']))
+                except BaseException:
+                    cache_writer.abort()
+                    raise
+            cached = cache.load(cache_key)
+            cache_status = 'saved'
+            print(f"--- Saved dataset {cache_key} to the cache ({cached.path}) ---")
+    if cached is not None:
+        tables, manifest = cached.tables, cached.manifest
+
+    stream_validator = None
+    if config.validate:
+        with profiler.phase('validate') as phase:
+            # Tables in memory (generated, or mapped from the cache) are checked before anything is written
+            report = validate_tables(tables, append_base)
+            phase.rows = report.rows
+        print(report.format())
+        if not report.ok:
+            raise DataValidationError(report)
+        # Streams are checked while the writer reads them, never held whole
+        stream_validator = StreamValidator(tables, append_base)
+        tables = stream_validator.wrap(tables)
+
+    try:
+        with profiler.phase(f"write {config.output_format}") as write_phase:
+            if config.output_format == 'sql':
+                # 4.1. Stream SQL INSERT statements straight to the file
+                print("\n--- Generating ticket data and SQL INSERT Statements ---")
+                with open(output_path, 'w', encoding='utf-8') as f:
+                    f.write("USE eventify_db;\n\n")
+                    writer = StreamingInsertWriter(f, max_rows=config.insert_batch_rows, max_bytes=config.insert_batch_bytes)
+                    # write_tables() keeps the FK-safe order: user -> ... -> orders -> ticket
+                    writer.write_tables(tables)
+                saved_to = output_path
+            elif config.output_format in ('sqlite', 'mysql'):
+                # 4.1. Or insert straight into the database, skipping the dump file
+                print(f"\n--- Generating ticket data and loading into {config.output_format} ---")
+                if config.output_format == 'sqlite':
+                    if append_base is None:
+                        create_sqlite_schema(output_path)
+                    pool = ConnectionPool(sqlite_connector(output_path), config.db_pool_size)
+                    saved_to = output_path
+                else:
+                    # Expects db/schema.sql to be loaded already
+                    pool = ConnectionPool(mysql_connector(**config.mysql_config), config.db_pool_size)
+                    saved_to = config.mysql_config['database']
+                try:
+                    writer = DatabaseLoader(pool, batch_rows=config.db_batch_rows)
+                    writer.write_tables(tables)
+                    if append_base:
+                        with profiler.phase('refresh derived tables'):
+                            touched_event_ids = list(run.event_ids) + list(run.ticket_sales)
+                            refreshed = refresh_derived_tables(pool, touched_event_ids)
+                            print(f"--- Refreshed event_sales_summary / event_inventory for {refreshed} events ---")
+                            refreshed = refresh_revenue_rollups(pool, run.order_window[0].strftime('%Y-%m-%d'))
+                            print(f"--- Refreshed the daily revenue rollup for {refreshed} days ---")
+                    writer.print_report()
+                finally:
+                    pool.close()
+            elif config.output_format == 'split':
+                # 4.1. Or write per-table INSERT chunk files plus import_plan.json
+                print("\n--- Generating ticket data and per-table SQL files ---")
+                writer = SplitDumpWriter(output_path, compress=config.split_compress, chunk_rows=config.split_chunk_rows,
+                                         max_rows=config.insert_batch_rows, max_bytes=config.insert_batch_bytes)
+                writer.write_tables(tables)
+                saved_to = output_path
+            else:
+                # 4.1. Or write one delimited file per table plus load_data.sql
+                print(f"\n--- Generating ticket data and {config.output_format.upper()} files ---")
+                writer = DelimitedWriter(output_path, config.output_format)
+                writer.write_tables(tables)
+                saved_to = output_path
+        write_phase.rows = sum(writer.row_counts.values())
+        if stream_validator is not None and stream_validator.report.tables:
+            print(stream_validator.report.format())
+            if not stream_validator.report.ok:
+                # No manifest, so nothing is appended to the invalid output
+                raise DataValidationError(stream_validator.report, written_to=saved_to)
+        if append_base and config.output_format in ('sql', 'tsv', 'csv', 'split'):
+            print("Note: import into a database with db/automation/triggers.sql installed, "
+                  "so event_sales_summary, event_inventory and the revenue rollup follow the new tickets.")
+
+        manifest_path = config.resolved_manifest_path()
+        write_manifest(manifest_path, manifest or run.manifest(writer.row_counts['ticket']))
+        print(f"Total tickets generated: {writer.row_counts['ticket']}")
+        print(f"✅ Success! Data saved to {saved_to}. Ready for database import.")
+        print(f"Manifest for --append-from: {manifest_path}")
+
+        profiler.stop()
+        if profiler.enabled:
+            profile_path = config.resolved_profile_path()
+            report = profiler.write_report(profile_path, {
+                'generator': 'generate_data_v3',
+                'output_format': config.output_format,
+                'append': bool(append_base),
+                'master_seed': master_seed,
+                'reference_time': reference_time.isoformat(sep=' '),
+                'num_users': config.num_users,
+                'num_venues': config.num_venues,
+                'num_events': config.num_events,
+                'num_orders': config.num_orders,
+                'num_shards': config.num_shards,
+                'num_workers': config.num_workers,
+                'profile': config.profile,
+                'dataset_cache': cache_status,
+                'validate': config.validate,
+            }, writer.row_counts)
+            print("\n--- PHASE PROFILE ---")
+            print(format_phase_table(report))
+            print(f"Profile report: {profile_path}")
+            if report['capture']:
+                print(f"Call-stack capture: {report['capture']['path']}")
+        return writer.row_counts
+    except IOError as e:
+        print(f"❌ Error saving file: {e}")
+
+
+if __name__ == '__main__':
+    main()
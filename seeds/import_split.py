@@ -0,0 +1,168 @@
+import argparse
+import os
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import generate_data_v3 as generator
+from db_loader import ConnectionPool, count_orphans, create_sqlite_schema, mysql_connector, sqlite_connector
+from split_writer import load_plan, open_dump
+
+# =================================================================
+# Parallel Import of a Split Dump + Post-Load FK Validation
+# =================================================================
+# Loads a dump written by `seeds/generate.py --format split` over several
+# connections at once. Every connection runs with FOREIGN_KEY_CHECKS = 0,
+# so the FK order stops mattering: all chunk files of all tables are queued
+# together, largest first, and each file is one transaction. Afterwards a
+# single set-based query counts the rows of every FK that have no parent
+# row (the check the load skipped); any orphan fails the import.
+#
+# MySQL needs db/schema.sql loaded and the db/automation triggers NOT yet
+# installed (as for db/dummy_data.sql): the ticket triggers read event rows
+# that may not be loaded yet, and the dump already carries the derived tables.
+#
+#   python seeds/generate.py -s 100 --seed 42 --format split --compress gzip --chunk-rows 500000 -o db/split
+#   python seeds/import_split.py db/split --connections 8
+#   python seeds/import_split.py db/split --engine sqlite --sqlite-path db/eventify.sqlite3
+
+DEFAULT_CONNECTIONS = 4
+
+# Session settings per engine while loading (restored before validating)
+LOAD_SESSION = {
+    'mysql': ["SET SESSION FOREIGN_KEY_CHECKS = 0", "SET SESSION UNIQUE_CHECKS = 0"],
+    'sqlite': ["PRAGMA foreign_keys = OFF"],
+}
+RESTORE_SESSION = {
+    'mysql': ["SET SESSION FOREIGN_KEY_CHECKS = 1", "SET SESSION UNIQUE_CHECKS = 1"],
+    'sqlite': ["PRAGMA foreign_keys = ON"],
+}
+
+
+def read_statements(path):
+    """Yields the INSERT statements of a dump file.
+
+    StreamingInsertWriter puts one row per line and ends each statement on a
+    line ending in ';'; generated values never contain newlines.
+    """
+    lines = []
+    with open_dump(path) as f:
+        for line in f:
+            if not lines and (not line.strip() or line.startswith('--')):
+                continue
+            lines.append(line)
+            if line.rstrip().endswith(';'):
+                yield ''.join(lines).rstrip().rstrip(';')
+                lines = []
+    if lines:
+        yield ''.join(lines).rstrip()
+
+
+class SplitImporter:
+    """Loads the chunk files of an import plan concurrently, one transaction per file."""
+
+    def __init__(self, pool, directory):
+        self.pool = pool
+        self.directory = directory
+        self.stats = {}
+        self._lock = threading.Lock()
+
+    def load_file(self, table_name, chunk):
+        start = time.perf_counter()
+        statement_count = 0
+        with self.pool.connection() as conn:
+            cursor = conn.cursor()
+            try:
+                for statement in read_statements(os.path.join(self.directory, chunk['file'])):
+                    cursor.execute(statement)
+                    statement_count += 1
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cursor.close()
+        elapsed = time.perf_counter() - start
+        with self._lock:
+            s = self.stats.setdefault(table_name, {'files': 0, 'rows': 0, 'statements': 0, 'seconds': 0.0})
+            s['files'] += 1
+            s['rows'] += chunk['rows']
+            s['statements'] += statement_count
+            s['seconds'] += elapsed
+        return chunk['rows']
+
+    def load(self, plan, workers):
+        """Loads every file of the plan; returns the wall-clock seconds."""
+        chunks = [(table['table'], chunk) for table in plan['tables'] for chunk in table['files']]
+        # Largest files first, so one big ticket chunk does not start last
+        chunks.sort(key=lambda item: item[1]['rows'], reverse=True)
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(self.load_file, table_name, chunk) for table_name, chunk in chunks]
+            for future in futures:
+                future.result()
+        return time.perf_counter() - start
+
+    def print_report(self, plan, elapsed):
+        print(f"{'table':<24}{'files':>7}{'statements':>12}{'rows':>12}{'busy seconds':>14}")
+        for table in plan['tables']:
+            s = self.stats.get(table['table'])
+            if s:
+                print(f"{table['table']:<24}{s['files']:>7}{s['statements']:>12}{s['rows']:>12}{s['seconds']:>14.3f}")
+        total_rows = sum(s['rows'] for s in self.stats.values())
+        print(f"{'total':<24}{'':>7}{'':>12}{total_rows:>12}{elapsed:>14.3f}  ({total_rows / elapsed if elapsed else 0:.0f} rows/sec wall)")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Load a split dump in parallel, then validate every foreign key.")
+    parser.add_argument('directory', help="Output directory of seeds/generate.py --format split")
+    parser.add_argument('--connections', type=int, default=DEFAULT_CONNECTIONS,
+                        help="Concurrent connections (default: %(default)s)")
+    parser.add_argument('--engine', choices=['mysql', 'sqlite'], default='mysql')
+    parser.add_argument('--sqlite-path', default=generator.SQLITE_PATH,
+                        help="Recreated from db/schema_sqlite.sql before loading")
+    parser.add_argument('--skip-validation', action='store_true', help="Do not run the post-load FK check")
+    for key, value in generator.MYSQL_CONFIG.items():
+        parser.add_argument(f'--mysql-{key}', default=value)
+    args = parser.parse_args(argv)
+
+    plan = load_plan(args.directory)
+    if args.engine == 'sqlite':
+        create_sqlite_schema(args.sqlite_path)
+        connect = sqlite_connector(args.sqlite_path)
+    else:
+        # Expects db/schema.sql to be loaded already
+        connect = mysql_connector(**{key: getattr(args, f'mysql_{key}') for key in generator.MYSQL_CONFIG})
+
+    files = sum(len(table['files']) for table in plan['tables'])
+    print(f"--- Loading {files} files of {len(plan['tables'])} tables over {args.connections} connections, "
+          f"FK checks off ---")
+    pool = ConnectionPool(connect, args.connections)
+    try:
+        pool.configure(LOAD_SESSION[args.engine])
+        importer = SplitImporter(pool, args.directory)
+        elapsed = importer.load(plan, args.connections)
+        pool.configure(RESTORE_SESSION[args.engine])
+        importer.print_report(plan, elapsed)
+
+        if args.skip_validation:
+            print("⚠️  FK validation skipped")
+            return 0
+        start = time.perf_counter()
+        orphans = count_orphans(pool)
+        print(f"--- FK validation: {len(orphans)} constraints checked in {time.perf_counter() - start:.3f}s ---")
+    finally:
+        pool.close()
+
+    violations = {name: count for name, count in orphans.items() if count}
+    for name, count in violations.items():
+        print(f"❌ {name}: {count} rows without a parent row")
+    if violations:
+        return 1
+    print("✅ Import finished; every foreign key has its parent row.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
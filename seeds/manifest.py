@@ -0,0 +1,157 @@
+import json
+import os
+from datetime import datetime
+
+from columnar import CodeColumn, ColumnTable, DateTimeColumn, int_column
+
+# =================================================================
+# Generation Manifest (state for append mode)
+# =================================================================
+# Every generator run records where its ID sequences stopped and which rows
+# a later run may reference (organizers, buyers, venues, categories and the
+# events that can still sell tickets). An append run continues the dataset
+# from this manifest, or from the same facts read out of a loaded database.
+
+MANIFEST_VERSION = 1
+
+# Events an appended order may still buy tickets for (the sale trigger rejects the rest)
+OPEN_EVENT_STATUSES = ('Published', 'Draft')
+
+# Without a manifest, the most-sold open events are treated as the hits
+POPULAR_EVENT_SHARE = 0.1
+
+DATETIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Generated ticket ids are 'TKT-' plus an 8-digit number; PurchaseTickets() ids ('TKT-<order>-<n>') are not numbered
+GENERATED_TICKET_ID = "ticket_id LIKE 'TKT-________' AND ticket_id NOT LIKE 'TKT-%-%'"
+
+
+def seats_left(event):
+    """Seats an open event can still sell; manifests written before 'remaining' existed only know the capacity."""
+    return event.get('remaining', event['capacity'])
+
+
+def build_manifest(master_seed, reference_time, next_ids, organizer_ids, buyer_ids,
+                   venue_capacities, category_names, events, popular_event_ids, ticket_sales=None):
+    """Collects the state an append run needs; only events still open after reference_time are kept.
+
+    ticket_sales ({event_id: [Purchased, Reserved, ...]}) holds the tickets of
+    this run; their seats are taken off each event's seats left.
+    """
+    cutoff = reference_time.strftime(DATETIME_FORMAT)
+    ticket_sales = ticket_sales or {}
+    open_events = {}
+    for event in events:
+        if event['status'] in OPEN_EVENT_STATUSES and str(event['start_time']) > cutoff:
+            purchased, reserved = ticket_sales.get(event['event_id'], (0, 0))[:2]
+            open_events[event['event_id']] = {
+                'status': event['status'],
+                'start_time': str(event['start_time']),
+                'capacity': event['capacity'],
+                'remaining': max(0, seats_left(event) - purchased - reserved),
+            }
+    return {
+        'version': MANIFEST_VERSION,
+        'master_seed': master_seed,
+        'reference_time': cutoff,
+        'next_ids': dict(next_ids),
+        'organizer_ids': list(organizer_ids),
+        'buyer_ids': list(buyer_ids),
+        'venue_capacities': dict(venue_capacities),
+        'category_names': dict(category_names),
+        'open_events': open_events,
+        'popular_event_ids': [event_id for event_id in popular_event_ids if event_id in open_events],
+    }
+
+
+def write_manifest(path, manifest):
+    """Writes the manifest as JSON (atomically, so a crashed run never leaves half a file)."""
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def load_manifest(path):
+    """Reads a manifest and restores what JSON cannot carry (int dict keys, datetimes)."""
+    with open(path, encoding='utf-8') as f:
+        manifest = json.load(f)
+    if manifest.get('version') != MANIFEST_VERSION:
+        raise ValueError(f"{path}: unsupported manifest version {manifest.get('version')!r}")
+    return normalize_manifest(manifest)
+
+
+def normalize_manifest(manifest):
+    """Turns a JSON-shaped manifest back into Python types (int ids, datetime reference)."""
+    manifest['reference_time'] = datetime.strptime(str(manifest['reference_time']), DATETIME_FORMAT)
+    for key in ('venue_capacities', 'category_names', 'open_events'):
+        manifest[key] = {int(k): v for k, v in manifest[key].items()}
+    return manifest
+
+
+def open_events_table(open_events):
+    """The manifest's open events as a ColumnTable, ready for EntityRegistry.add_events()."""
+    return ColumnTable(
+        event_id=int_column(open_events),
+        status=CodeColumn.encode([event['status'] for event in open_events.values()]),
+        start_time=DateTimeColumn.parse(event['start_time'] for event in open_events.values()),
+        capacity=int_column(event['capacity'] for event in open_events.values()),
+        remaining=int_column(seats_left(event) for event in open_events.values()),
+    )
+
+
+def manifest_from_database(conn, placeholder='?'):
+    """Builds the same manifest from a loaded database (any DB-API connection with schema.sql tables).
+
+    The newest order date stands in for the previous run's reference time,
+    the best-selling open events become the hit events, and event_inventory
+    says how many seats each open event has left.
+    """
+    cursor = conn.cursor()
+
+    def scalar(sql, params=()):
+        cursor.execute(sql, params)
+        return cursor.fetchone()[0]
+
+    def rows(sql, params=()):
+        cursor.execute(sql, params)
+        return cursor.fetchall()
+
+    # Empty tables continue at the generator's usual first ids. Zero-padded
+    # ticket ids sort numerically, so the largest one holds the last number
+    last_ticket_id = scalar(f"SELECT MAX(ticket_id) FROM ticket WHERE {GENERATED_TICKET_ID}")
+    next_ids = {
+        'event': scalar("SELECT COALESCE(MAX(event_id) + 1, 1001) FROM event"),
+        'orders': scalar("SELECT COALESCE(MAX(order_id) + 1, 5001) FROM orders"),
+        'ticket': int(last_ticket_id[4:]) + 1 if last_ticket_id else 1,
+    }
+    reference_time = scalar("SELECT MAX(order_date) FROM orders")
+    if reference_time is None:
+        raise ValueError("Cannot append: the database has no orders to continue from")
+    if isinstance(reference_time, str):
+        reference_time = datetime.strptime(reference_time, DATETIME_FORMAT)
+
+    status_list = ', '.join(f"'{status}'" for status in OPEN_EVENT_STATUSES)
+    open_event_rows = rows(
+        "SELECT e.event_id, e.status, e.start_time, e.capacity, COALESCE(i.remaining, e.capacity) FROM event e "
+        "LEFT JOIN event_sales_summary s ON s.event_id = e.event_id "
+        "LEFT JOIN event_inventory i ON i.event_id = e.event_id "
+        f"WHERE e.status IN ({status_list}) AND e.start_time > {placeholder} "
+        "ORDER BY COALESCE(s.purchased_count, 0) DESC, e.event_id",
+        (reference_time.strftime(DATETIME_FORMAT),),
+    )
+    events = [{'event_id': event_id, 'status': status, 'start_time': start_time, 'capacity': capacity, 'remaining': remaining}
+              for event_id, status, start_time, capacity, remaining in open_event_rows]
+    popular_event_ids = [event['event_id'] for event in events[:max(1, round(len(events) * POPULAR_EVENT_SHARE))]]
+
+    return normalize_manifest(build_manifest(
+        master_seed=None,
+        reference_time=reference_time,
+        next_ids=next_ids,
+        organizer_ids=[r[0] for r in rows("SELECT user_id FROM user WHERE LOWER(role) = 'organizer' ORDER BY user_id")],
+        buyer_ids=[r[0] for r in rows("SELECT user_id FROM user WHERE LOWER(role) = 'attendee' ORDER BY user_id")],
+        venue_capacities=dict(rows("SELECT venue_id, capacity FROM venue ORDER BY venue_id")),
+        category_names=dict(rows("SELECT category_id, name FROM category ORDER BY category_id")),
+        events=events,
+        popular_event_ids=popular_event_ids,
+    ))
@@ -0,0 +1,248 @@
+import argparse
+import os
+import re
+import statistics
+import sys
+import time
+
+import generate_data_v3 as generator
+from benchmark_queries import REPO_ROOT, MySQLEngine, SQLiteEngine, benchmark_query, load_queries
+
+# =================================================================
+# Index Migration Evidence: Before/After EXPLAIN, Timing, Insert Cost
+# =================================================================
+# Loads one (large) benchmark dataset, measures the hot queries without the
+# migration's indexes, applies the migration, measures again, and times a
+# bulk ticket insert in both states. The result is a markdown report that
+# is kept next to the migration.
+#
+#   python seeds/measure_indexes.py --scale-factor 50
+#   python seeds/measure_indexes.py --engine mysql --scale-factor 100 --reuse
+
+MIGRATIONS_DIR = os.path.join(REPO_ROOT, 'db', 'migrations')
+MIGRATION = '001_secondary_indexes'
+
+# The query paths the migration was designed for (fixed ids match db/analysis)
+HOT_QUERIES = {
+    'Upcoming published events by start time':
+        "SELECT * FROM event WHERE status = 'Published' AND start_time > NOW() ORDER BY start_time",
+    'Sales summary for one event (GetEventSalesSummary)':
+        "SELECT e.title, e.capacity, COUNT(t.ticket_id), e.capacity - COUNT(t.ticket_id) "
+        "FROM event e LEFT JOIN ticket t ON e.event_id = t.event_id AND t.status = 'Purchased' "
+        "WHERE e.event_id = 1050 GROUP BY e.event_id, e.title, e.capacity",
+    'Tickets owned by one user':
+        "SELECT t.ticket_id, t.order_id, t.price, e.title, e.start_time "
+        "FROM ticket t JOIN event e ON t.event_id = e.event_id WHERE t.user_id = 21",
+    'Orders placed by one user':
+        "SELECT order_id, total_amount, order_date, status FROM orders WHERE user_id = 21",
+    'Venues in one city':
+        "SELECT * FROM venue WHERE city = 'New Braunfels'",
+    'All users by last, first name':
+        "SELECT * FROM user ORDER BY last_name, first_name",
+    'Active admins by last, first name':
+        "SELECT first_name, last_name, email FROM user WHERE status = 'Active' AND role = 'Admin' "
+        "ORDER BY last_name, first_name",
+}
+
+# db/analysis looks up user_id 21, which a generated dataset need not give any
+# tickets or orders; the per-user paths are measured for the busiest attendee
+SAMPLE_USER_FILTER = re.compile(r'\buser_id\s*=\s*21\b')
+
+# Why a query reads more rows with the migration's indexes (keyed by query name)
+SCAN_REGRESSION_NOTES = {
+    'event_queries: Upcoming Events in a Specific City (New Braunfels)':
+        "The planner now drives from IX_EventStatusStart: it walks every upcoming Published event "
+        "in start_time order and checks each one's venue city, which saves the sort but reads more "
+        "rows than scanning venues and sorting the few matches. IX_VenueCity is not the cause (it "
+        "is not used here); IX_EventStatusStart stays for the upcoming-events listings above, "
+        "which read far fewer rows with it.",
+}
+
+DEFAULT_INSERT_ROWS = 20000
+INSERT_BATCH_ROWS = 1000
+# Insert timing is noisy, so the median of several rolled-back runs is reported
+INSERT_RUNS = 5
+
+
+def busiest_attendee(engine):
+    """The Attendee with the most tickets (lowest id on ties), so the per-user queries return rows."""
+    return engine.run(
+        "SELECT t.user_id FROM ticket t JOIN user u ON u.user_id = t.user_id WHERE u.role = 'Attendee' "
+        "GROUP BY t.user_id ORDER BY COUNT(*) DESC, t.user_id LIMIT 1"
+    )[0][0]
+
+
+def bind_sample_user(queries, user_id):
+    """The queries with the fixed user_id 21 replaced by user_id."""
+    return {name: SAMPLE_USER_FILTER.sub(f"user_id = {user_id}", sql) for name, sql in queries.items()}
+
+
+def migration_path(engine, direction='up'):
+    suffix = '_sqlite' if engine.name == 'sqlite' else ''
+    suffix += '_down' if direction == 'down' else ''
+    return os.path.join(MIGRATIONS_DIR, f"{MIGRATION}{suffix}.sql")
+
+
+# -----------------------------------------------------------------
+# Measurements
+# -----------------------------------------------------------------
+
+def index_sizes(engine):
+    """{table.index: bytes} for every secondary index of the schema tables."""
+    if engine.name == 'sqlite':
+        rows = engine.run(
+            "SELECT m.tbl_name || '.' || m.name, SUM(s.pgsize) FROM sqlite_master m "
+            "JOIN dbstat s ON s.name = m.name WHERE m.type = 'index' GROUP BY m.name ORDER BY 1"
+        )
+    else:
+        rows = engine.run(
+            "SELECT CONCAT(table_name, '.', index_name), stat_value * @@innodb_page_size "
+            "FROM mysql.innodb_index_stats WHERE database_name = DATABASE() "
+            "AND stat_name = 'size' AND index_name <> 'PRIMARY' ORDER BY 1"
+        )
+    return {name: int(size) for name, size in rows}
+
+
+def time_ticket_inserts(engine, num_rows):
+    """Inserts num_rows tickets for one Published event in batches, then rolls them back; returns rows/sec."""
+    event_id, = engine.run("SELECT event_id FROM event WHERE status = 'Published' ORDER BY event_id LIMIT 1")[0]
+    order_id, user_id = engine.run("SELECT order_id, user_id FROM orders ORDER BY order_id LIMIT 1")[0]
+    placeholder = '?' if engine.name == 'sqlite' else '%s'
+    statement = (
+        "INSERT INTO ticket (ticket_id, order_id, event_id, user_id, price, status) "
+        f"VALUES ({', '.join([placeholder] * 6)})"
+    )
+    rows = [(f"IDX-{n:07d}", order_id, event_id, user_id, 25.00, 'Purchased') for n in range(num_rows)]
+
+    cursor = engine.conn.cursor()
+    start = time.perf_counter()
+    try:
+        for i in range(0, num_rows, INSERT_BATCH_ROWS):
+            cursor.executemany(statement, rows[i:i + INSERT_BATCH_ROWS])
+        elapsed = time.perf_counter() - start
+    finally:
+        engine.conn.rollback()
+        cursor.close()
+    return round(num_rows / elapsed, 1)
+
+
+def measure(engine, queries, repeat, insert_rows):
+    return {
+        'queries': {name: benchmark_query(engine, sql, repeat) for name, sql in queries.items()},
+        'insert_rows_per_sec': statistics.median(time_ticket_inserts(engine, insert_rows) for _ in range(INSERT_RUNS)),
+        'index_sizes': index_sizes(engine),
+    }
+
+
+# -----------------------------------------------------------------
+# Report
+# -----------------------------------------------------------------
+
+def format_report(engine_name, scale_factor, insert_rows, user_id, before, after):
+    lines = [
+        f"# {MIGRATION}: measured effect",
+        "",
+        f"Generated by `python seeds/measure_indexes.py` on {engine_name}, SF{scale_factor:g} "
+        f"(seed and reference date from seeds/benchmark_queries.py).",
+        "",
+        f"Per-user queries look up user_id {user_id}, the Attendee with the most tickets, "
+        f"instead of the user_id 21 written in db/analysis.",
+        "",
+        "## Query latency and work",
+        "",
+        "| query | rows | p50 before (ms) | p50 after (ms) | scanned before | scanned after | plan |",
+        "|---|---:|---:|---:|---:|---:|---|",
+    ]
+    unchanged, more_scanned = [], []
+    for name, b in before['queries'].items():
+        a = after['queries'][name]
+        same = a['plan'] == b['plan'] and a['rows_scanned'] == b['rows_scanned']
+        lines.append(f"| {name} | {a['rows']} | {b['p50_ms']} | {a['p50_ms']} | {b['rows_scanned']} | {a['rows_scanned']} "
+                     f"| {'same' if same else 'changed'} |")
+        if same:
+            unchanged.append(name)
+        elif a['rows_scanned'] > b['rows_scanned']:
+            more_scanned.append(name)
+
+    slowdown = 1 - after['insert_rows_per_sec'] / before['insert_rows_per_sec']
+    lines += [
+        "",
+        "Rows scanned are Handler_read_* counters on MySQL and VM steps on SQLite.",
+        f"{len(unchanged)} queries run the same plan over the same rows before and after; "
+        "their p50 differences are timer noise, not an effect of the indexes.",
+        "",
+        "## Ticket insert cost",
+        "",
+        f"{insert_rows} ticket rows inserted in batches of {INSERT_BATCH_ROWS}, then rolled back "
+        f"(median of {INSERT_RUNS} runs).",
+        "",
+        "| | rows/sec |",
+        "|---|---:|",
+        f"| before | {before['insert_rows_per_sec']} |",
+        f"| after | {after['insert_rows_per_sec']} |",
+        f"| change | {-slowdown:+.1%} |",
+        "",
+        "## Index sizes (bytes)",
+        "",
+        "| index | before | after |",
+        "|---|---:|---:|",
+    ]
+    for name in sorted(set(before['index_sizes']) | set(after['index_sizes'])):
+        lines.append(f"| {name} | {before['index_sizes'].get(name, '-')} | {after['index_sizes'].get(name, '-')} |")
+
+    if more_scanned:
+        lines += ["", "## Queries that read more rows", ""]
+        for name in more_scanned:
+            note = SCAN_REGRESSION_NOTES.get(name, "Not explained yet; see the plans below.")
+            lines.append(f"- **{name}**: {note}")
+
+    lines += ["", "## Plans", ""]
+    for name, b in before['queries'].items():
+        lines += [f"### {name}", "", "Before:", "```"] + b['plan'] + ["```", "After:", "```"]
+        lines += after['queries'][name]['plan'] + ["```", ""]
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=f"Measure {MIGRATION} before and after on a generated dataset.")
+    parser.add_argument('-s', '--scale-factor', type=float, default=50)
+    parser.add_argument('--repeat', type=int, default=10, help="Timed runs per query (default: %(default)s)")
+    parser.add_argument('--insert-rows', type=int, default=DEFAULT_INSERT_ROWS)
+    parser.add_argument('--engine', choices=['sqlite', 'mysql'], default='sqlite')
+    parser.add_argument('--data-dir', default=os.path.join(REPO_ROOT, 'db'),
+                        help="Where SQLite datasets are kept (default: db/)")
+    parser.add_argument('--reuse', action='store_true', help="Reuse an already loaded dataset instead of regenerating")
+    parser.add_argument('--report', default=os.path.join(MIGRATIONS_DIR, f"{MIGRATION}.md"))
+    for key, value in generator.MYSQL_CONFIG.items():
+        parser.add_argument(f'--mysql-{key}', default=value)
+    args = parser.parse_args(argv)
+
+    if args.engine == 'sqlite':
+        engine = SQLiteEngine(os.path.join(args.data_dir, f"bench_sf{args.scale_factor:g}.sqlite3"))
+    else:
+        engine = MySQLEngine({key: getattr(args, f'mysql_{key}') for key in generator.MYSQL_CONFIG})
+
+    try:
+        engine.load(args.scale_factor, reuse=args.reuse)
+        user_id = busiest_attendee(engine)
+        queries = bind_sample_user({**HOT_QUERIES, **load_queries(engine.name)}, user_id)
+        # A reused dataset may already carry the indexes
+        if any(name.endswith('.IX_EventStatusStart') for name in index_sizes(engine)):
+            engine.execute_script(migration_path(engine, 'down'))
+        print(f"--- Before {MIGRATION} ---")
+        before = measure(engine, queries, args.repeat, args.insert_rows)
+        engine.execute_script(migration_path(engine))
+        print(f"--- After {MIGRATION} ---")
+        after = measure(engine, queries, args.repeat, args.insert_rows)
+    finally:
+        engine.close()
+
+    report = format_report(engine.name, args.scale_factor, args.insert_rows, user_id, before, after)
+    with open(args.report, 'w', encoding='utf-8') as f:
+        f.write(report + '\n')
+    print(f"✅ Report written: {args.report}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
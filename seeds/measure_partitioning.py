@@ -0,0 +1,155 @@
+import argparse
+import os
+import sys
+
+import generate_data_v3 as generator
+from benchmark_queries import REPO_ROOT, MySQLEngine, benchmark_query, load_queries
+
+# =================================================================
+# Partitioning Evidence: Pruning Check and Benchmark vs. schema.sql
+# =================================================================
+# Loads the same benchmark dataset twice into MySQL, first on db/schema.sql
+# and then with db/schema_partitioned.sql applied on top. Every db/analysis
+# query (plus a few date/event-bound hot paths) runs on both. The report
+# shows latency, rows read and, from EXPLAIN's `partitions` column, how many
+# partitions of orders and ticket each query actually touched.
+#
+#   python seeds/measure_partitioning.py --scale-factor 50
+#
+# The database is left on the partitioned schema. Re-source db/schema.sql
+# (and the automation scripts) to go back.
+
+SCHEMA = os.path.join(REPO_ROOT, 'db', 'schema.sql')
+PARTITIONED_SCHEMA = os.path.join(REPO_ROOT, 'db', 'schema_partitioned.sql')
+PARTITIONED_TABLES = ['orders', 'ticket']
+DEFAULT_REPORT = os.path.join(REPO_ROOT, 'db', 'analysis', 'partitioning_benchmark.md')
+
+# Access paths partitioning is meant for (dates match BENCH_REFERENCE_TIME)
+HOT_QUERIES = {
+    'Completed revenue of one month of orders':
+        "SELECT SUM(t.price) FROM orders o JOIN ticket t ON t.order_id = o.order_id "
+        "WHERE o.status = 'Completed' AND o.order_date >= '2025-12-01' AND o.order_date < '2026-01-01'",
+    'Last week of orders':
+        "SELECT order_id, user_id, total_amount FROM orders "
+        "WHERE order_date >= '2025-12-25' AND order_date < '2026-01-01' ORDER BY order_date",
+    'Purchased tickets of one event':
+        "SELECT COUNT(*), SUM(price) FROM ticket WHERE event_id = 1050 AND status = 'Purchased'",
+    'Tickets of one order':
+        "SELECT ticket_id, event_id, price FROM ticket WHERE order_id = 5100",
+}
+
+
+def apply_schemas(engine, paths):
+    engine.conn = engine.connect()
+    try:
+        for path in paths:
+            engine.execute_script(path)
+    finally:
+        engine.close()
+
+
+def partition_totals(engine):
+    rows = engine.run(
+        "SELECT TABLE_NAME, COUNT(*) FROM information_schema.PARTITIONS "
+        "WHERE TABLE_SCHEMA = DATABASE() AND PARTITION_NAME IS NOT NULL GROUP BY TABLE_NAME"
+    )
+    return {table: int(count) for table, count in rows}
+
+
+def partitions_read(engine, sql):
+    """{table: partitions read} from EXPLAIN's partitions column (None for CALLs)."""
+    if sql.split(None, 1)[0].upper() == 'CALL':
+        return None
+    cursor = engine.conn.cursor()
+    cursor.execute('EXPLAIN ' + sql)
+    columns = [d[0] for d in cursor.description]
+    read = {}
+    for row in cursor.fetchall():
+        record = dict(zip(columns, row))
+        if record.get('table') in PARTITIONED_TABLES and record.get('partitions'):
+            read[record['table']] = len(record['partitions'].split(','))
+    return read
+
+
+def measure(engine, queries, repeat, partitioned):
+    results = {}
+    for name, sql in queries.items():
+        results[name] = benchmark_query(engine, sql, repeat)
+        if partitioned:
+            results[name]['partitions'] = partitions_read(engine, sql)
+    return results
+
+
+def format_pruning(read, totals):
+    if read is None:
+        return 'n/a (CALL)'
+    if not read:
+        return '-'
+    return ', '.join(f"{table} {count}/{totals.get(table, '?')}" for table, count in sorted(read.items()))
+
+
+def format_report(scale_factor, before, after, totals):
+    lines = [
+        "# Partitioned orders/ticket vs. db/schema.sql",
+        "",
+        f"Generated by `python seeds/measure_partitioning.py` on MySQL, SF{scale_factor:g} "
+        "(seed and reference date from seeds/benchmark_queries.py).",
+        f"orders: RANGE COLUMNS(order_date), {totals.get('orders', '?')} partitions. "
+        f"ticket: HASH(event_id), {totals.get('ticket', '?')} partitions.",
+        "",
+        "| query | rows | p50 plain (ms) | p50 partitioned (ms) | read plain | read partitioned | partitions read |",
+        "|---|---:|---:|---:|---:|---:|---|",
+    ]
+    mismatches = []
+    for name, b in before.items():
+        a = after[name]
+        if a['checksum'] != b['checksum']:
+            mismatches.append(name)
+        lines.append(f"| {name} | {a['rows']} | {b['p50_ms']} | {a['p50_ms']} | {b['rows_scanned']} | "
+                     f"{a['rows_scanned']} | {format_pruning(a.get('partitions'), totals)} |")
+    lines += [
+        "",
+        "Rows read are the session Handler_read_* counters. `orders 1/26` means EXPLAIN listed one of "
+        "26 partitions: the query was pruned. A full count means every partition's local index was probed.",
+    ]
+    if mismatches:
+        lines += ["", "**Results differ between the schemas:** " + ', '.join(mismatches)]
+    return '\n'.join(lines), mismatches
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Check partition pruning and benchmark the partitioned schema.")
+    parser.add_argument('-s', '--scale-factor', type=float, default=50)
+    parser.add_argument('--repeat', type=int, default=10, help="Timed runs per query (default: %(default)s)")
+    parser.add_argument('--report', default=DEFAULT_REPORT)
+    for key, value in generator.MYSQL_CONFIG.items():
+        parser.add_argument(f'--mysql-{key}', default=value)
+    args = parser.parse_args(argv)
+
+    mysql_config = {key: getattr(args, f'mysql_{key}') for key in generator.MYSQL_CONFIG}
+    queries = dict(HOT_QUERIES)
+    queries.update(load_queries('mysql'))
+
+    results = {}
+    for label, schemas in (('plain', [SCHEMA]), ('partitioned', [SCHEMA, PARTITIONED_SCHEMA])):
+        print(f"--- {label}: {', '.join(os.path.basename(path) for path in schemas)} ---")
+        engine = MySQLEngine(mysql_config)
+        apply_schemas(engine, schemas)
+        try:
+            engine.load(args.scale_factor)
+            results[label] = measure(engine, queries, args.repeat, partitioned=(label == 'partitioned'))
+            if label == 'partitioned':
+                totals = partition_totals(engine)
+        finally:
+            engine.close()
+
+    report, mismatches = format_report(args.scale_factor, results['plain'], results['partitioned'], totals)
+    with open(args.report, 'w', encoding='utf-8') as f:
+        f.write(report + '\n')
+    print(report)
+    print(f"✅ Report written: {args.report}")
+    return 1 if mismatches else 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,194 @@
+import argparse
+import os
+import statistics
+import sys
+import time
+
+import generate_data_v3 as generator
+from benchmark_queries import REPO_ROOT, MySQLEngine, SQLiteEngine
+from measure_indexes import MIGRATIONS_DIR
+
+# =================================================================
+# Ticket Key Comparison: VARCHAR(50) vs. BIGINT Primary Key
+# =================================================================
+# Evidence for the opt-in db/migrations/005_compact_ticket_key.sql. Copies the tickets of one benchmark dataset into two side tables, one per
+# key layout, with the same secondary indexes as ticket (FK + migration 001),
+# timing the inserts, then compares table and index sizes. SQLite uses a
+# WITHOUT ROWID table for the string key, which clusters rows on the PK the
+# way InnoDB does.
+#
+#   python seeds/measure_ticket_key.py --scale-factor 50
+#   python seeds/measure_ticket_key.py --engine mysql --scale-factor 100 --reuse
+
+MIGRATION = '005_compact_ticket_key'
+
+INSERT_BATCH_ROWS = 1000
+INSERT_RUNS = 3
+
+# {layout: {engine: CREATE TABLE ...}}; '{t}' is the side table's name
+LAYOUTS = {
+    'varchar_pk': {
+        'sqlite': "CREATE TABLE {t} (ticket_id VARCHAR(50) PRIMARY KEY, order_id INT NOT NULL, "
+                  "event_id INT NOT NULL, user_id INT NOT NULL, price DECIMAL(10, 2) NOT NULL, "
+                  "status TEXT NOT NULL COLLATE NOCASE) WITHOUT ROWID",
+        'mysql': "CREATE TABLE {t} (ticket_id VARCHAR(50) PRIMARY KEY, order_id INT NOT NULL, "
+                 "event_id INT NOT NULL, user_id INT NOT NULL, price DECIMAL(10, 2) NOT NULL, "
+                 "status ENUM('Reserved', 'Purchased', 'Refunded') NOT NULL) ENGINE=InnoDB",
+    },
+    'bigint_pk': {
+        'sqlite': "CREATE TABLE {t} (ticket_id INTEGER PRIMARY KEY, ticket_code VARCHAR(50) NOT NULL UNIQUE, "
+                  "order_id INT NOT NULL, event_id INT NOT NULL, user_id INT NOT NULL, "
+                  "price DECIMAL(10, 2) NOT NULL, status TEXT NOT NULL COLLATE NOCASE)",
+        'mysql': "CREATE TABLE {t} (ticket_id BIGINT UNSIGNED AUTO_INCREMENT PRIMARY KEY, "
+                 "ticket_code VARCHAR(50) NOT NULL UNIQUE, order_id INT NOT NULL, event_id INT NOT NULL, "
+                 "user_id INT NOT NULL, price DECIMAL(10, 2) NOT NULL, "
+                 "status ENUM('Reserved', 'Purchased', 'Refunded') NOT NULL) ENGINE=InnoDB",
+    },
+}
+
+# Same secondary indexes as ticket after db/migrations/001_secondary_indexes.sql
+SECONDARY_INDEXES = [
+    "CREATE INDEX {t}_order ON {t} (order_id)",
+    "CREATE INDEX {t}_event_status ON {t} (event_id, status, price)",
+    "CREATE INDEX {t}_user ON {t} (user_id)",
+]
+
+
+def side_table(layout):
+    return f"ticket_key_{layout}"
+
+
+def source_rows(engine, layout):
+    """Ticket rows in the layout's column order; the BIGINT layout numbers them in string key order, as 005 does."""
+    rows = engine.run("SELECT ticket_id, order_id, event_id, user_id, price, status FROM ticket ORDER BY ticket_id")
+    if layout == 'varchar_pk':
+        return [tuple(row) for row in rows]
+    return [(number,) + tuple(row) for number, row in enumerate(rows, 1)]
+
+
+def create_side_table(engine, layout):
+    table = side_table(layout)
+    cursor = engine.conn.cursor()
+    cursor.execute(f"DROP TABLE IF EXISTS {table}")
+    cursor.execute(LAYOUTS[layout][engine.name].format(t=table))
+    for statement in SECONDARY_INDEXES:
+        cursor.execute(statement.format(t=table))
+    engine.conn.commit()
+
+
+def time_inserts(engine, layout, rows):
+    """(Re)creates the side table, inserts every row in committed batches; returns rows/sec."""
+    create_side_table(engine, layout)
+    table = side_table(layout)
+    placeholder = '?' if engine.name == 'sqlite' else '%s'
+    statement = f"INSERT INTO {table} VALUES ({', '.join([placeholder] * len(rows[0]))})"
+
+    cursor = engine.conn.cursor()
+    start = time.perf_counter()
+    for i in range(0, len(rows), INSERT_BATCH_ROWS):
+        cursor.executemany(statement, rows[i:i + INSERT_BATCH_ROWS])
+        engine.conn.commit()
+    elapsed = time.perf_counter() - start
+    return round(len(rows) / elapsed, 1)
+
+
+def table_sizes(engine, layout):
+    """Bytes of the clustered table and of each secondary index of a side table."""
+    table = side_table(layout)
+    if engine.name == 'sqlite':
+        # A WITHOUT ROWID table's b-tree is keyed on its PK, so the table entry is the clustered data either way
+        sizes = engine.run(
+            "SELECT m.name, SUM(s.pgsize) FROM sqlite_master m JOIN dbstat s ON s.name = m.name "
+            "WHERE m.tbl_name = ? GROUP BY m.name", (table,)
+        )
+        clustered_name = table
+    else:
+        engine.run(f"ANALYZE TABLE {table}")
+        sizes = engine.run(
+            "SELECT index_name, stat_value * @@innodb_page_size FROM mysql.innodb_index_stats "
+            "WHERE database_name = DATABASE() AND table_name = %s AND stat_name = 'size'", (table,)
+        )
+        clustered_name = 'PRIMARY'
+
+    result = {'table': 0, 'indexes': 0, 'per_index': {}}
+    for name, size in sizes:
+        if name == clustered_name:
+            result['table'] = int(size)
+            continue
+        # The UNIQUE ticket_code index is auto-named by both engines
+        label = name.replace(f"{table}_", '') if name.startswith(table) else 'ticket_code (unique)'
+        result['per_index'][label] = int(size)
+        result['indexes'] += int(size)
+    return result
+
+
+def format_report(engine_name, scale_factor, num_rows, results):
+    old, new = results['varchar_pk'], results['bigint_pk']
+    lines = [
+        f"# {MIGRATION}: measured effect",
+        "",
+        f"Generated by `python seeds/measure_ticket_key.py` on {engine_name}, SF{scale_factor:g} "
+        f"({num_rows} tickets, each key layout with the FK and migration 001 ticket indexes).",
+        "",
+        "| | VARCHAR(50) PK | BIGINT PK + UNIQUE ticket_code | change |",
+        "|---|---:|---:|---:|",
+    ]
+    for key, label in (('table', 'clustered table (bytes)'), ('indexes', 'secondary indexes (bytes)'),
+                       ('total', 'total (bytes)'), ('rows_per_sec', 'insert rows/sec')):
+        lines.append(f"| {label} | {old[key]} | {new[key]} | {new[key] / old[key] - 1:+.1%} |")
+    lines += ["", "| secondary index (bytes) | VARCHAR(50) PK | BIGINT PK | change |", "|---|---:|---:|---:|"]
+    for name in sorted(set(old['per_index']) | set(new['per_index'])):
+        before, after = old['per_index'].get(name), new['per_index'].get(name)
+        change = f"{after / before - 1:+.1%}" if before and after else "new"
+        lines.append(f"| {name} | {before or '-'} | {after or '-'} | {change} |")
+    lines += [
+        "",
+        f"Inserts: batches of {INSERT_BATCH_ROWS} rows, one commit per batch, median of {INSERT_RUNS} runs. "
+        "Both layouts hold the generator's `TKT-%08d` ids (as ticket_id or ticket_code).",
+        "The BIGINT layout also carries the ticket_code UNIQUE index, which is counted above.",
+    ]
+    if engine_name == 'sqlite':
+        lines.append("Measured on SQLite only; the InnoDB result, which 005 is meant for, needs `--engine mysql`.")
+    return '\n'.join(lines)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Compare ticket table/index size and insert rate for both key layouts.")
+    parser.add_argument('-s', '--scale-factor', type=float, default=50)
+    parser.add_argument('--engine', choices=['sqlite', 'mysql'], default='sqlite')
+    parser.add_argument('--data-dir', default=os.path.join(REPO_ROOT, 'db'),
+                        help="Where SQLite datasets are kept (default: db/)")
+    parser.add_argument('--reuse', action='store_true', help="Reuse an already loaded dataset instead of regenerating")
+    parser.add_argument('--report', default=os.path.join(MIGRATIONS_DIR, f"{MIGRATION}.md"))
+    for key, value in generator.MYSQL_CONFIG.items():
+        parser.add_argument(f'--mysql-{key}', default=value)
+    args = parser.parse_args(argv)
+
+    if args.engine == 'sqlite':
+        engine = SQLiteEngine(os.path.join(args.data_dir, f"bench_sf{args.scale_factor:g}.sqlite3"))
+    else:
+        engine = MySQLEngine({key: getattr(args, f'mysql_{key}') for key in generator.MYSQL_CONFIG})
+
+    results = {}
+    try:
+        engine.load(args.scale_factor, reuse=args.reuse)
+        for layout in LAYOUTS:
+            print(f"--- {layout} ---")
+            rows = source_rows(engine, layout)
+            rows_per_sec = statistics.median(time_inserts(engine, layout, rows) for _ in range(INSERT_RUNS))
+            sizes = table_sizes(engine, layout)
+            results[layout] = dict(sizes, total=sizes['table'] + sizes['indexes'], rows_per_sec=rows_per_sec)
+            print(f"{results[layout]['total']} bytes, {rows_per_sec} rows/sec")
+        for layout in LAYOUTS:
+            engine.run(f"DROP TABLE IF EXISTS {side_table(layout)}")
+    finally:
+        engine.close()
+
+    with open(args.report, 'w', encoding='utf-8') as f:
+        f.write(format_report(args.engine, args.scale_factor, len(rows), results) + '\n')
+    print(f"✅ Report written: {args.report}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
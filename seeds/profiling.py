@@ -0,0 +1,302 @@
+import cProfile
+import json
+import multiprocessing
+import os
+import platform
+import pstats
+import subprocess
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from datetime import datetime
+
+try:
+    import resource
+except ImportError:  # Windows: no getrusage
+    resource = None
+
+# =================================================================
+# Generator Profiling: Per-Phase Time, Rows/sec and Peak RSS
+# =================================================================
+# PhaseProfiler times every generation phase (users, venues, events, orders,
+# tickets, writing the output, ...), counts the rows it produced and tracks
+# the resident memory of the process while it runs. Optionally the whole run
+# is also captured with cProfile or with a built-in stack sampler. The JSON
+# report lands next to the output, so runs can be compared across versions
+# and scale factors.
+#
+# Shard workers run in child processes: their time counts towards the phase
+# that waits for them, their memory only towards peak_rss_children_bytes,
+# and the profilers do not see them (use --workers 1 to capture them).
+
+REPORT_VERSION = 1
+
+# 'phases' = timings and memory only; 'cprofile' / 'sample' also capture call stacks
+PROFILE_MODES = ('phases', 'cprofile', 'sample')
+
+RSS_INTERVAL = 0.05       # Seconds between RSS readings
+SAMPLE_INTERVAL = 0.005   # Seconds between stack samples in 'sample' mode
+TOP_FUNCTIONS = 25        # Hottest functions listed in the report
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def current_rss():
+    """Resident set size of this process in bytes, or None where /proc is not available."""
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError):
+        return None
+
+
+def peak_rss(who='self'):
+    """Lifetime peak RSS in bytes of this process ('self') or its largest finished child ('children')."""
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF if who == 'self' else resource.RUSAGE_CHILDREN).ru_maxrss
+    # ru_maxrss is in kilobytes on Linux and in bytes on macOS
+    return peak if sys.platform == 'darwin' else peak * 1024
+
+
+def git_commit():
+    """The checked-out commit of this repository, so reports can be matched to code versions."""
+    try:
+        return subprocess.run(['git', 'rev-parse', 'HEAD'], cwd=REPO_ROOT, capture_output=True,
+                              text=True, timeout=5, check=True).stdout.strip()
+    except (OSError, subprocess.SubprocessError):
+        return None
+
+
+class PhaseStats:
+    """Accumulated time, rows and memory of one named phase (a phase may be entered many times)."""
+
+    __slots__ = ('name', 'seconds', 'child_seconds', 'rows', 'rss_start_bytes', 'peak_rss_bytes')
+
+    def __init__(self, name):
+        self.name = name
+        self.seconds = 0.0
+        self.child_seconds = 0.0
+        self.rows = 0
+        self.rss_start_bytes = None
+        self.peak_rss_bytes = None
+
+    def observe_rss(self, rss):
+        if rss is not None and (self.peak_rss_bytes is None or rss > self.peak_rss_bytes):
+            self.peak_rss_bytes = rss
+
+    def to_dict(self):
+        # Time spent in nested phases (e.g. ticket generation while the writer pulls rows) is not this phase's own
+        self_seconds = max(self.seconds - self.child_seconds, 0.0)
+        return {
+            'name': self.name,
+            'seconds': round(self.seconds, 4),
+            'self_seconds': round(self_seconds, 4),
+            'rows': self.rows,
+            'rows_per_sec': round(self.rows / self_seconds, 1) if self.rows and self_seconds else None,
+            'rss_start_bytes': self.rss_start_bytes,
+            'peak_rss_bytes': self.peak_rss_bytes,
+        }
+
+
+class PhaseProfiler:
+    """Times named phases of one generator run; with mode=None it only keeps the bookkeeping, no sampling or report."""
+
+    def __init__(self, mode=None):
+        if mode is not None and mode not in PROFILE_MODES:
+            raise ValueError(f"Unknown profile mode {mode!r} (expected one of {', '.join(PROFILE_MODES)})")
+        self.mode = mode
+        self.phases = {}
+        self.started_at = None
+        self.total_seconds = None
+        self._stack = []
+        self._start = None
+        self._main_thread = None
+        self._stop_sampling = threading.Event()
+        self._sampler = None
+        self._cprofile = None
+        self._stack_samples = {}
+
+    @property
+    def enabled(self):
+        return self.mode is not None
+
+    def start(self):
+        self.started_at = datetime.now()
+        self._start = time.perf_counter()
+        if not self.enabled:
+            return
+        self._main_thread = threading.get_ident()
+        self._sampler = threading.Thread(target=self._sample_loop, name='phase-profiler', daemon=True)
+        self._sampler.start()
+        if self.mode == 'cprofile':
+            self._cprofile = cProfile.Profile()
+            self._cprofile.enable()
+
+    def stop(self):
+        self.total_seconds = time.perf_counter() - self._start
+        if self._cprofile is not None:
+            self._cprofile.disable()
+        if self._sampler is not None:
+            self._stop_sampling.set()
+            self._sampler.join()
+
+    # -----------------------------------------------------------------
+    # Phases
+    # -----------------------------------------------------------------
+
+    def _enter(self, name):
+        phase = self.phases.get(name)
+        if phase is None:
+            phase = self.phases[name] = PhaseStats(name)
+        if self.enabled:
+            rss = current_rss()
+            if phase.rss_start_bytes is None:
+                phase.rss_start_bytes = rss
+            phase.observe_rss(rss)
+        self._stack.append(phase)
+        return phase
+
+    def _exit(self, phase, elapsed):
+        self._stack.pop()
+        phase.seconds += elapsed
+        if self._stack:
+            self._stack[-1].child_seconds += elapsed
+        if self.enabled:
+            phase.observe_rss(current_rss())
+
+    @contextmanager
+    def phase(self, name):
+        """Times a block; set `.rows` on the yielded PhaseStats to get rows/sec."""
+        phase = self._enter(name)
+        start = time.perf_counter()
+        try:
+            yield phase
+        finally:
+            self._exit(phase, time.perf_counter() - start)
+
+    def iterate(self, name, rows, size=None):
+        """Charges the time spent producing each item of a lazy iterable to its own phase.
+
+        Streamed tables (tickets, derived tables) are generated while the
+        writer consumes them, so this separates generation from writing.
+        Items count as one row each, or as size(item) rows (e.g. len for
+        table chunks). Disabled profilers return the iterable untouched.
+        """
+        if not self.enabled:
+            return rows
+        return self._timed_rows(name, iter(rows), size)
+
+    def _timed_rows(self, name, rows, size):
+        while True:
+            phase = self._enter(name)
+            start = time.perf_counter()
+            try:
+                row = next(rows)
+            except StopIteration:
+                return
+            finally:
+                self._exit(phase, time.perf_counter() - start)
+            phase.rows += size(row) if size else 1
+            yield row
+
+    # -----------------------------------------------------------------
+    # Sampling (background thread)
+    # -----------------------------------------------------------------
+
+    def _sample_loop(self):
+        interval = SAMPLE_INTERVAL if self.mode == 'sample' else RSS_INTERVAL
+        while not self._stop_sampling.wait(interval):
+            rss = current_rss()
+            active = tuple(self._stack)
+            for phase in active:
+                phase.observe_rss(rss)
+            if self.mode == 'sample':
+                frame = sys._current_frames().get(self._main_thread)
+                if frame is not None:
+                    key = self._folded_stack(frame, active[-1].name if active else None)
+                    self._stack_samples[key] = self._stack_samples.get(key, 0) + 1
+
+    @staticmethod
+    def _folded_stack(frame, phase_name):
+        """Root-to-leaf 'file:function' frames joined by ';' (flamegraph.pl's collapsed format)."""
+        frames = []
+        while frame is not None:
+            code = frame.f_code
+            frames.append(f"{os.path.basename(code.co_filename)}:{code.co_name}")
+            frame = frame.f_back
+        frames.append(f"phase:{phase_name or '-'}")
+        return ';'.join(reversed(frames))
+
+    # -----------------------------------------------------------------
+    # Report
+    # -----------------------------------------------------------------
+
+    def _write_capture(self, report_path):
+        """Writes the cProfile stats or folded stacks next to the report; returns the report's 'capture' entry."""
+        base = os.path.splitext(report_path)[0]
+        if self.mode == 'cprofile':
+            path = base + '.prof'
+            self._cprofile.dump_stats(path)
+            stats = pstats.Stats(self._cprofile).stats
+            ranked = sorted(stats.items(), key=lambda item: item[1][3], reverse=True)[:TOP_FUNCTIONS]
+            top = [{'function': f"{os.path.basename(filename)}:{line}({name})", 'calls': calls,
+                    'self_seconds': round(tottime, 4), 'cumulative_seconds': round(cumtime, 4)}
+                   for (filename, line, name), (_, calls, tottime, cumtime, _) in ranked]
+            return {'mode': 'cprofile', 'path': path, 'top_cumulative': top,
+                    'hint': f"python -m pstats {path}  (or snakeviz)"}
+        if self.mode == 'sample':
+            path = base + '.folded'
+            with open(path, 'w', encoding='utf-8') as f:
+                for key, count in sorted(self._stack_samples.items()):
+                    f.write(f"{key} {count}\n")
+            total = sum(self._stack_samples.values())
+            leaves = {}
+            for key, count in self._stack_samples.items():
+                leaf = key.rsplit(';', 1)[-1]
+                leaves[leaf] = leaves.get(leaf, 0) + count
+            top = [{'function': leaf, 'samples': count, 'share': round(count / total, 4)}
+                   for leaf, count in sorted(leaves.items(), key=lambda item: item[1], reverse=True)[:TOP_FUNCTIONS]]
+            return {'mode': 'sample', 'path': path, 'interval_seconds': SAMPLE_INTERVAL, 'samples': total,
+                    'top_self': top, 'hint': f"flamegraph.pl {path} > flame.svg  (or speedscope)"}
+        return None
+
+    def build_report(self, run, row_counts):
+        """The JSON-ready report: environment, run parameters, totals and one entry per phase."""
+        # Read before git_commit() forks a child, which would count towards RUSAGE_CHILDREN
+        peak_self, peak_children = peak_rss('self'), peak_rss('children')
+        return {
+            'version': REPORT_VERSION,
+            'started_at': self.started_at.isoformat(timespec='seconds'),
+            'git_commit': git_commit(),
+            'python': platform.python_version(),
+            'platform': platform.platform(),
+            'cpu_count': multiprocessing.cpu_count(),
+            'run': run,
+            'total_seconds': round(self.total_seconds, 4),
+            'peak_rss_bytes': peak_self,
+            'peak_rss_children_bytes': peak_children,
+            'row_counts': dict(row_counts),
+            'phases': [phase.to_dict() for phase in self.phases.values()],
+        }
+
+    def write_report(self, path, run, row_counts):
+        """Writes the JSON report (and any capture file beside it); returns the report."""
+        report = self.build_report(run, row_counts)
+        report['capture'] = self._write_capture(path)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=1)
+        return report
+
+
+def format_phase_table(report):
+    """Console summary of a report: one line per phase."""
+    mb = 1024 * 1024
+    lines = [f"{'phase':<28}{'seconds':>10}{'self':>10}{'rows':>11}{'rows/sec':>12}{'peak RSS MB':>13}"]
+    for phase in report['phases']:
+        peak = f"{phase['peak_rss_bytes'] / mb:.1f}" if phase['peak_rss_bytes'] else '-'
+        lines.append(f"{phase['name']:<28}{phase['seconds']:>10.3f}{phase['self_seconds']:>10.3f}"
+                     f"{phase['rows']:>11}{phase['rows_per_sec'] or '-':>12}{peak:>13}")
+    lines.append(f"{'total':<28}{report['total_seconds']:>10.3f}")
+    return '\n'.join(lines)
@@ -0,0 +1,178 @@
+from array import array
+from collections import defaultdict
+
+import numpy as np
+
+from columnar import as_numpy
+
+# =================================================================
+# In-Memory Entity Registry
+# =================================================================
+# Every generated table is registered here so that FK lookups and
+# eligibility filters are index hits instead of list scans. Rows stay in
+# their ColumnTables (seeds/columnar.py); the registry only keeps where each
+# id lives, which for a contiguous id range is one (start, stop) entry.
+
+
+class TableIndex:
+    """Id -> (table, position) over registered ColumnTables."""
+
+    def __init__(self, id_column):
+        self.id_column = id_column
+        self.ids = array('q')
+        self._tables = []
+        self._segments = []   # (first_id, stop_id, table) for tables whose ids are a range
+        self._positions = {}  # id -> (table, position) for tables with scattered ids
+
+    def add(self, table):
+        ids = table[self.id_column]
+        if isinstance(ids, range) and ids.step == 1:
+            self._segments.append((ids.start, ids.stop, table))
+        else:
+            for position, entity_id in enumerate(ids):
+                self._positions[entity_id] = (table, position)
+        self.ids.extend(ids)
+        self._tables.append(table)
+
+    def locate(self, entity_id):
+        hit = self._positions.get(entity_id)
+        if hit is not None:
+            return hit
+        # One segment per generation phase, so this scan stays short
+        for first_id, stop_id, table in self._segments:
+            if first_id <= entity_id < stop_id:
+                return table, entity_id - first_id
+        raise KeyError(entity_id)
+
+    def __contains__(self, entity_id):
+        try:
+            self.locate(entity_id)
+        except KeyError:
+            return False
+        return True
+
+    def __len__(self):
+        return len(self.ids)
+
+    def column(self, name):
+        """One numeric column of every registered row as a NumPy array, aligned with ids."""
+        if not self._tables:
+            return np.zeros(0, dtype=np.int64)
+        return np.concatenate([as_numpy(table[name]) for table in self._tables])
+
+    def value(self, entity_id, column):
+        table, position = self.locate(entity_id)
+        return table[column][position]
+
+    def row(self, entity_id):
+        table, position = self.locate(entity_id)
+        return table.row(position)
+
+    def rows(self):
+        """Every registered row as a dict, in registration order (built one at a time)."""
+        for table in self._tables:
+            columns = table.columns
+            for values in table.rows():
+                yield dict(zip(columns, values))
+
+
+class EntityRegistry:
+    """Id-indexed views over generated tables plus precomputed eligible-event pools."""
+
+    def __init__(self, ticket_excluded_statuses=('Canceled', 'Completed')):
+        # --- Primary indexes (id -> table position) ---
+        self.users = TableIndex('user_id')
+        self.venues = TableIndex('venue_id')
+        self.categories = TableIndex('category_id')
+        self.events = TableIndex('event_id')
+        self.orders = TableIndex('order_id')
+
+        # --- Secondary indexes ---
+        self._user_ids_by_role = defaultdict(lambda: array('q'))
+
+        # --- Weighted ticket pool ---
+        # Each eligible event appears `weight` times in the pool, so a uniform
+        # pick from the pool is a weighted pick over events. check_event_status_before_sale
+        # rejects tickets for Completed and Canceled events, so neither is eligible.
+        self.ticket_excluded_statuses = set(ticket_excluded_statuses)
+        self._ticket_pool = array('q')
+
+    # --- PK lists, in registration order (used for random picks) ---
+
+    @property
+    def user_ids(self):
+        return self.users.ids
+
+    @property
+    def venue_ids(self):
+        return self.venues.ids
+
+    @property
+    def category_ids(self):
+        return self.categories.ids
+
+    @property
+    def event_ids(self):
+        return self.events.ids
+
+    @property
+    def order_ids(self):
+        return self.orders.ids
+
+    # -----------------------------------------------------------------
+    # Registration
+    # -----------------------------------------------------------------
+
+    def add_users(self, table):
+        self.users.add(table)
+        for user_id, role in zip(table['user_id'], table['role']):
+            self._user_ids_by_role[role].append(user_id)
+
+    def add_venues(self, table):
+        self.venues.add(table)
+
+    def add_categories(self, table):
+        self.categories.add(table)
+
+    def add_events(self, table):
+        self.events.add(table)
+
+    def add_orders(self, table):
+        self.orders.add(table)
+
+    # -----------------------------------------------------------------
+    # Lookups
+    # -----------------------------------------------------------------
+
+    def user_ids_with_role(self, role):
+        return self._user_ids_by_role.get(role, array('q'))
+
+    def venue_capacity(self, venue_id, default=1000):
+        if venue_id not in self.venues:
+            return default
+        return self.venues.value(venue_id, 'capacity')
+
+    def category_name(self, category_id):
+        return self.categories.value(category_id, 'name')
+
+    def event_status(self, event_id):
+        return self.events.value(event_id, 'status')
+
+    # -----------------------------------------------------------------
+    # Weighted ticket-event pool
+    # -----------------------------------------------------------------
+
+    def set_ticket_weights(self, popular_event_ids, popular_weight=7, base_weight=3):
+        """Builds the eligible ticket pool once: every event gets base_weight, hits get popular_weight more."""
+        weights = dict.fromkeys(self.event_ids, base_weight)
+        for event_id in popular_event_ids:
+            weights[event_id] += popular_weight
+
+        self._ticket_pool = array('q')
+        for event_id, weight in weights.items():
+            if self.event_status(event_id) not in self.ticket_excluded_statuses:
+                self._ticket_pool.extend([event_id] * weight)
+
+    def ticket_pool(self):
+        """Returns a copy of the weighted pool, e.g. to ship to shard worker processes."""
+        return list(self._ticket_pool)
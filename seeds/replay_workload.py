@@ -0,0 +1,313 @@
+import argparse
+import json
+import os
+import queue
+import sqlite3
+import sys
+import threading
+import time
+from collections import Counter, defaultdict
+
+import generate_data_v3 as generator
+from benchmark_queries import percentile
+from db_loader import mysql_connector, sqlite_connector
+from manifest import manifest_from_database, open_events_table
+from registry import EntityRegistry
+from vectorized import make_rng
+
+# =================================================================
+# Checkout Workload Replay: Target Rate, Latency Percentiles
+# =================================================================
+# Turns the generator's order and ticket distributions (buyers, order
+# statuses, tickets per order, the popular-event skew) into a timestamped
+# stream of checkouts and replays it against a loaded database: a pool of
+# worker connections, an open-loop dispatcher that releases each operation
+# at its scheduled time, and a report of throughput, p50/p95/p99 latency,
+# trigger rejections and deadlocks.
+#
+# A checkout is the db/automation/user_lifecycle_demo.sql path: one orders
+# INSERT plus one ticket INSERT per seat (each fires the ticket triggers),
+# in one transaction. --mode procedure uses CALL PurchaseTickets instead.
+# MySQL runs need db/schema.sql, the triggers and procedures installed;
+# SQLite runs have no triggers and only exercise the inserts.
+#
+#   python seeds/replay_workload.py --orders 20000 --rate 500 --workers 16
+#   python seeds/replay_workload.py --engine sqlite --sqlite-path db/eventify.sqlite3 --rate 0
+
+DEFAULT_ORDERS = 10000
+DEFAULT_RATE = 200       # Scheduled checkouts per second; 0 = as fast as the workers go
+DEFAULT_WORKERS = 8
+MAX_LOCK_RETRIES = 3
+
+# MySQL error numbers: SIGNAL from a trigger/procedure, and the two transient lock errors
+ER_SIGNAL_EXCEPTION = 1644
+ER_LOCK_WAIT_TIMEOUT = 1205
+ER_LOCK_DEADLOCK = 1213
+
+
+# -----------------------------------------------------------------
+# Workload stream
+# -----------------------------------------------------------------
+
+def build_stream(state, num_orders, seed, rate):
+    """Generates num_orders checkout operations, each with its scheduled offset in seconds.
+
+    Orders and tickets come from the generator's own shard functions, so
+    buyers, order statuses, seats per order and the event skew match a
+    generated dataset. Arrivals are a Poisson process at `rate` per second.
+    """
+    # Same pool as an append run: events still on sale, hits weighted up
+    registry = EntityRegistry(ticket_excluded_statuses=('Canceled', 'Completed'))
+    registry.add_events(open_events_table(state['open_events']))
+    registry.set_ticket_weights(state['popular_event_ids'], popular_weight=7, base_weight=3)
+    if not registry.ticket_pool():
+        raise ValueError("No events are on sale after the newest order date; nothing to replay")
+
+    reference_time = state['reference_time']
+    generator.set_shard_context({
+        'order_window': (reference_time, reference_time + generator.MONTH),
+        'buyer_ids': state['buyer_ids'],
+        'ticket_pool': registry.ticket_pool(),
+    })
+    orders = generator.generate_order_shard(((0, num_orders), seed))
+    tickets = generator.generate_ticket_shard((orders, seed + 1))
+    tickets_by_order = defaultdict(list)
+    for order_id, event_id, price, status in zip(tickets['order_id'], tickets['event_id'], tickets['price'], tickets['status']):
+        tickets_by_order[order_id].append((event_id, price, status))
+
+    rng = make_rng(seed + 2)
+    offsets = rng.exponential(1 / rate, num_orders).cumsum().tolist() if rate > 0 else [0.0] * num_orders
+    return [
+        {
+            'offset': offset,
+            'user_id': user_id,
+            'total_amount': total_amount,
+            'status': status,
+            'tickets': tickets_by_order[order_id],
+        }
+        for order_id, user_id, total_amount, status, offset in zip(
+            orders['order_id'], orders['user_id'], orders['total_amount'], orders['status'], offsets)
+    ]
+
+
+# -----------------------------------------------------------------
+# Replay
+# -----------------------------------------------------------------
+
+def classify_error(error):
+    """Maps a driver error to a report bucket; None for errors that should abort the run."""
+    code = error.args[0] if error.args and isinstance(error.args[0], int) else None
+    message = str(error)
+    if code == ER_SIGNAL_EXCEPTION:
+        if 'sold out' in message or 'Not enough tickets' in message:
+            return 'rejected: sold out'
+        if 'Canceled or Completed' in message:
+            return 'rejected: event closed'
+        return 'rejected: other'
+    if code == ER_LOCK_DEADLOCK:
+        return 'deadlock'
+    if code == ER_LOCK_WAIT_TIMEOUT or (isinstance(error, sqlite3.OperationalError) and 'locked' in message):
+        return 'lock timeout'
+    return None
+
+
+class Replayer:
+    """Runs a workload stream over `num_workers` connections and collects per-operation outcomes."""
+
+    def __init__(self, connect, num_workers, mode, run_id):
+        self.connect = connect
+        self.num_workers = num_workers
+        self.mode = mode
+        self.run_id = run_id
+        self.placeholder = '?' if getattr(connect, 'paramstyle', 'qmark') == 'qmark' else '%s'
+        self.latencies = []
+        self.outcomes = Counter()
+        self.tickets_sold = 0
+        self.order_ids = []
+        self.max_lag = 0.0
+        self.errors = []
+        self._lock = threading.Lock()
+
+    def checkout(self, cursor, op):
+        """One purchase; returns the new order id and the number of tickets stored."""
+        if self.mode == 'procedure' and op['tickets'] and op['status'] == 'Completed':
+            event_id, price, _ = op['tickets'][0]
+            cursor.execute(f"CALL PurchaseTickets({', '.join([self.placeholder] * 4)})",
+                           (op['user_id'], event_id, len(op['tickets']), price))
+            rows = cursor.fetchall()
+            while cursor.nextset():
+                pass
+            return rows[0][0], len(rows)
+
+        p = self.placeholder
+        cursor.execute(
+            f"INSERT INTO orders (user_id, total_amount, order_date, status) VALUES ({p}, {p}, CURRENT_TIMESTAMP, {p})",
+            (op['user_id'], op['total_amount'], op['status']),
+        )
+        order_id = cursor.lastrowid
+        if op['tickets']:
+            cursor.executemany(
+                f"INSERT INTO ticket (ticket_id, order_id, event_id, user_id, price, status) VALUES ({p}, {p}, {p}, {p}, {p}, {p})",
+                [(f"RPL-{self.run_id}-{order_id}-{n}", order_id, event_id, op['user_id'], price, status)
+                 for n, (event_id, price, status) in enumerate(op['tickets'], 1)],
+            )
+        return order_id, len(op['tickets'])
+
+    def worker(self, work):
+        conn = self.connect()
+        cursor = conn.cursor()
+        try:
+            while True:
+                op = work.get()
+                if op is None:
+                    return
+                for attempt in range(MAX_LOCK_RETRIES + 1):
+                    start = time.perf_counter()
+                    try:
+                        order_id, sold = self.checkout(cursor, op)
+                        conn.commit()
+                        outcome = 'committed'
+                    except Exception as e:
+                        conn.rollback()
+                        outcome = classify_error(e)
+                        if outcome is None:
+                            with self._lock:
+                                self.errors.append(repr(e))
+                            outcome, order_id, sold = 'failed', None, 0
+                    elapsed = time.perf_counter() - start
+                    with self._lock:
+                        self.outcomes[outcome] += 1
+                        if outcome == 'committed':
+                            self.latencies.append(elapsed)
+                            self.tickets_sold += sold
+                            self.order_ids.append(order_id)
+                    if outcome not in ('deadlock', 'lock timeout'):
+                        break
+        finally:
+            cursor.close()
+            conn.close()
+
+    def run(self, stream):
+        """Releases every operation at its scheduled offset; returns the wall time in seconds."""
+        work = queue.Queue()
+        workers = [threading.Thread(target=self.worker, args=(work,), daemon=True) for _ in range(self.num_workers)]
+        for thread in workers:
+            thread.start()
+
+        start = time.perf_counter()
+        for op in stream:
+            delay = op['offset'] - (time.perf_counter() - start)
+            if delay > 0:
+                time.sleep(delay)
+            else:
+                # Workers (or the database) are not keeping up with the schedule
+                self.max_lag = max(self.max_lag, -delay)
+            work.put(op)
+        for _ in workers:
+            work.put(None)
+        for thread in workers:
+            thread.join()
+        return time.perf_counter() - start
+
+    def cleanup(self):
+        """Deletes the replayed orders and their tickets (the order triggers give the seats back)."""
+        conn = self.connect()
+        cursor = conn.cursor()
+        try:
+            for i in range(0, len(self.order_ids), 500):
+                chunk = self.order_ids[i:i + 500]
+                ids = ', '.join([self.placeholder] * len(chunk))
+                cursor.execute(f"DELETE FROM ticket WHERE order_id IN ({ids})", chunk)
+                cursor.execute(f"DELETE FROM orders WHERE order_id IN ({ids})", chunk)
+            conn.commit()
+        finally:
+            cursor.close()
+            conn.close()
+
+
+def summarize(replayer, num_ops, rate, elapsed):
+    latencies = sorted(replayer.latencies)
+    committed = replayer.outcomes['committed']
+    summary = {
+        'operations': num_ops,
+        'target_ops_per_sec': rate or None,
+        'achieved_ops_per_sec': round(num_ops / elapsed, 1) if elapsed > 0 else None,
+        'committed_per_sec': round(committed / elapsed, 1) if elapsed > 0 else None,
+        'tickets_sold': replayer.tickets_sold,
+        'seconds': round(elapsed, 3),
+        'max_schedule_lag_ms': round(replayer.max_lag * 1000, 1),
+        'outcomes': dict(replayer.outcomes),
+    }
+    if latencies:
+        for label, fraction in (('p50', 0.50), ('p95', 0.95), ('p99', 0.99)):
+            summary[f'{label}_ms'] = round(percentile(latencies, fraction) * 1000, 3)
+        summary['max_ms'] = round(latencies[-1] * 1000, 3)
+    return summary
+
+
+def print_summary(summary):
+    for key in ('operations', 'target_ops_per_sec', 'achieved_ops_per_sec', 'committed_per_sec', 'tickets_sold',
+                'seconds', 'p50_ms', 'p95_ms', 'p99_ms', 'max_ms', 'max_schedule_lag_ms'):
+        if key in summary:
+            print(f"{key:<24}{summary[key] if summary[key] is not None else '-':>12}")
+    print("--- outcomes (lock errors are retried and counted per attempt) ---")
+    for outcome, count in sorted(summary['outcomes'].items()):
+        print(f"{outcome:<24}{count:>12}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Replay a generated checkout workload against a database.")
+    parser.add_argument('--orders', type=int, default=DEFAULT_ORDERS, help="Checkouts to replay (default: %(default)s)")
+    parser.add_argument('--rate', type=float, default=DEFAULT_RATE,
+                        help="Target checkouts per second, 0 = unthrottled (default: %(default)s)")
+    parser.add_argument('--workers', type=int, default=DEFAULT_WORKERS, help="Concurrent connections (default: %(default)s)")
+    parser.add_argument('--mode', choices=['statements', 'procedure'], default='statements',
+                        help="Row-by-row INSERTs (as in user_lifecycle_demo.sql) or CALL PurchaseTickets")
+    parser.add_argument('--seed', type=int, default=None, help="Workload seed (default: random)")
+    parser.add_argument('--engine', choices=['mysql', 'sqlite'], default='mysql')
+    parser.add_argument('--sqlite-path', default=generator.SQLITE_PATH)
+    parser.add_argument('--cleanup', action='store_true', help="Delete the replayed orders and tickets afterwards")
+    parser.add_argument('--report', default=None, help="Also write the summary as JSON to this path")
+    for key, value in generator.MYSQL_CONFIG.items():
+        parser.add_argument(f'--mysql-{key}', default=value)
+    args = parser.parse_args(argv)
+
+    if args.engine == 'sqlite':
+        if args.mode == 'procedure':
+            parser.error("--mode procedure needs --engine mysql")
+        if not os.path.exists(args.sqlite_path):
+            parser.error(f"{args.sqlite_path} does not exist; load one with seeds/generate.py --format sqlite")
+        connect = sqlite_connector(args.sqlite_path)
+    else:
+        connect = mysql_connector(**{key: getattr(args, f'mysql_{key}') for key in generator.MYSQL_CONFIG})
+
+    seed = args.seed if args.seed is not None else int(time.time())
+    conn = connect()
+    try:
+        state = manifest_from_database(conn, '?' if connect.paramstyle == 'qmark' else '%s')
+    finally:
+        conn.close()
+    stream = build_stream(state, args.orders, seed, args.rate)
+    print(f"--- {len(stream)} checkouts over {len(state['open_events'])} open events "
+          f"({len(state['popular_event_ids'])} hits), seed {seed}, {args.workers} workers, mode {args.mode} ---")
+
+    replayer = Replayer(connect, args.workers, args.mode, run_id=seed)
+    elapsed = replayer.run(stream)
+    summary = summarize(replayer, len(stream), args.rate, elapsed)
+    summary.update(engine=args.engine, mode=args.mode, workers=args.workers, seed=seed)
+    print_summary(summary)
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(summary, f, indent=2)
+    if args.cleanup:
+        replayer.cleanup()
+
+    if replayer.errors:
+        print(f"\n❌ {len(replayer.errors)} checkouts failed with unexpected errors, e.g. {replayer.errors[0]}")
+        return 1
+    print("\n✅ Replay finished.")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
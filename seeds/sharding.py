@@ -0,0 +1,53 @@
+import hashlib
+import multiprocessing
+
+# =================================================================
+# Sharded Generation Helpers
+# =================================================================
+# A shard is a contiguous ID range generated from its own seed. Shard seeds
+# are derived from the master seed, the phase name and the shard index, so
+# the same master seed and shard count always give the same rows no matter
+# how many worker processes run them or in which order they finish.
+
+
+def shard_seed(master_seed, phase, shard_index):
+    """Derives a stable 64-bit seed for one shard of one generation phase."""
+    digest = hashlib.sha256(f"{master_seed}:{phase}:{shard_index}".encode('utf-8')).digest()
+    return int.from_bytes(digest[:8], 'big')
+
+
+def plan_shards(first_id, count, num_shards):
+    """Splits `count` IDs starting at first_id into at most num_shards contiguous (start, stop) ranges."""
+    num_shards = max(1, min(num_shards, count)) if count else 1
+    base, extra = divmod(count, num_shards)
+
+    ranges = []
+    start = first_id
+    for index in range(num_shards):
+        stop = start + base + (1 if index < extra else 0)
+        ranges.append((start, stop))
+        start = stop
+    return ranges
+
+
+def run_sharded(worker, tasks, num_workers=None, initializer=None, initargs=()):
+    """Runs worker(task) for every task and yields the results in task order.
+
+    With one worker (or one task) everything runs in this process, otherwise a
+    process pool is used. Results always come back in task order, so merging
+    them is deterministic.
+    """
+    tasks = list(tasks)
+    if num_workers is None:
+        num_workers = multiprocessing.cpu_count()
+    num_workers = min(num_workers, len(tasks))
+
+    if num_workers <= 1:
+        if initializer is not None:
+            initializer(*initargs)
+        for task in tasks:
+            yield worker(task)
+        return
+
+    with multiprocessing.Pool(num_workers, initializer=initializer, initargs=initargs) as pool:
+        yield from pool.imap(worker, tasks)
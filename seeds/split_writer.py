@@ -0,0 +1,109 @@
+import gzip
+import json
+import os
+from itertools import chain, islice
+
+from columnar import table_rows
+from sql_writer import DEFAULT_MAX_BYTES, DEFAULT_MAX_ROWS, TABLE_ORDER, StreamingInsertWriter
+
+# =================================================================
+# Per-Table Split SQL Dump (Optionally Compressed and Chunked)
+# =================================================================
+# A single dummy_data.sql has to be replayed serially in FK order. The split
+# dump writes every table to its own files instead, cutting large tables
+# into chunks of chunk_rows rows:
+#
+#   <output_dir>/user.000.sql[.gz]
+#   <output_dir>/ticket.000.sql[.gz], ticket.001.sql[.gz], ...
+#   <output_dir>/import_plan.json   tables, files and row counts in FK order
+#
+# Files hold plain multi-row INSERTs (no USE, no session settings), so each
+# one loads on its own: `mysql eventify_db < user.000.sql`, or all of them
+# in parallel with seeds/import_split.py, which turns FK checks off while
+# loading and validates every FK afterwards.
+
+PLAN_VERSION = 1
+PLAN_FILENAME = 'import_plan.json'
+
+COMPRESSIONS = ('gzip',)
+DEFAULT_CHUNK_ROWS = 1_000_000
+GZIP_LEVEL = 3  # Most of gzip -9's ratio on INSERT text at a fraction of the CPU
+
+
+def open_dump(path, mode='rt'):
+    """Opens a dump file for text I/O, gzip-compressed if its name ends in .gz."""
+    if path.endswith('.gz'):
+        # compresslevel only matters when writing
+        return gzip.open(path, mode, compresslevel=GZIP_LEVEL, encoding='utf-8')
+    return open(path, mode, encoding='utf-8')
+
+
+def load_plan(directory):
+    with open(os.path.join(directory, PLAN_FILENAME), encoding='utf-8') as f:
+        plan = json.load(f)
+    if plan.get('version') != PLAN_VERSION:
+        raise ValueError(f"{directory}: unsupported import plan version {plan.get('version')!r}")
+    return plan
+
+
+class SplitDumpWriter:
+    """Writes each table to <output_dir>/<table>.<NNN>.sql[.gz] chunk files plus import_plan.json."""
+
+    def __init__(self, output_dir, compress=None, chunk_rows=DEFAULT_CHUNK_ROWS,
+                 max_rows=DEFAULT_MAX_ROWS, max_bytes=DEFAULT_MAX_BYTES):
+        if compress is not None and compress not in COMPRESSIONS:
+            raise ValueError(f"Unknown compression {compress!r} (expected one of {', '.join(COMPRESSIONS)})")
+        self.output_dir = output_dir
+        self.compress = compress
+        self.chunk_rows = chunk_rows  # 0 / None = one file per table
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.row_counts = {}
+        self.files = {}
+        os.makedirs(output_dir, exist_ok=True)
+
+    def chunk_filename(self, table_name, index):
+        return f"{table_name}.{index:03d}.sql" + ('.gz' if self.compress == 'gzip' else '')
+
+    def write_table(self, table_name, rows):
+        """Consumes a ColumnTable / TableStream (or an iterable of row dicts) and returns the number of rows written."""
+        columns, rows = table_rows(rows)
+        files = []
+        row_count = 0
+        while True:
+            # Only open a chunk file once there is a row to put in it
+            first = next(rows, None)
+            if first is None:
+                break
+            chunk = chain([first], islice(rows, self.chunk_rows - 1) if self.chunk_rows else rows)
+            filename = self.chunk_filename(table_name, len(files))
+            with open_dump(os.path.join(self.output_dir, filename), 'wt') as f:
+                chunk_count = StreamingInsertWriter(f, self.max_rows, self.max_bytes).write_rows(table_name, columns, chunk)
+            files.append({'file': filename, 'rows': chunk_count})
+            row_count += chunk_count
+
+        self.files[table_name] = files
+        self.row_counts[table_name] = row_count
+        return row_count
+
+    def write_tables(self, tables):
+        """Writes a {table_name: rows} mapping in TABLE_ORDER, then the import plan."""
+        for table_name in TABLE_ORDER:
+            if table_name in tables:
+                self.write_table(table_name, tables[table_name])
+        self.write_plan()
+        return self.row_counts
+
+    def write_plan(self):
+        """import_plan.json: every table's chunk files in FK-safe order, for seeds/import_split.py."""
+        plan = {
+            'version': PLAN_VERSION,
+            'compress': self.compress,
+            'chunk_rows': self.chunk_rows,
+            'tables': [
+                {'table': table_name, 'rows': self.row_counts[table_name], 'files': self.files[table_name]}
+                for table_name in TABLE_ORDER if table_name in self.files
+            ],
+        }
+        with open(os.path.join(self.output_dir, PLAN_FILENAME), 'w', encoding='utf-8') as f:
+            json.dump(plan, f, indent=1)
@@ -0,0 +1,94 @@
+from datetime import datetime
+
+from columnar import table_rows
+
+# =================================================================
+# SQL Formatting & Streaming INSERT Writer
+# =================================================================
+
+# Order of insertion is CRITICAL due to FK constraints
+TABLE_ORDER = [
+    'user', 'venue', 'category', 'event', 'event_category', 'orders', 'ticket',
+    'event_sales_summary', 'event_inventory', 'daily_event_revenue',
+]
+
+# Keep every statement far below MySQL's max_allowed_packet (4MB on 5.7, 64MB on 8.0)
+DEFAULT_MAX_ROWS = 5000
+DEFAULT_MAX_BYTES = 1024 * 1024
+
+
+def format_sql_value(value):
+    """Formats one Python value as a MySQL literal: quoted strings/dates, NULL, numbers as-is."""
+    if isinstance(value, (str, datetime)):
+        # Escape single quotes and wrap in quotes for SQL
+        return "'" + str(value).replace("'", "''") + "'"
+    elif value is None:
+        return "NULL"
+    else:
+        return str(value)
+
+
+class StreamingInsertWriter:
+    """Writes rows straight to a file as multi-row INSERTs, cutting a new statement every max_rows rows or max_bytes bytes."""
+
+    def __init__(self, f, max_rows=DEFAULT_MAX_ROWS, max_bytes=DEFAULT_MAX_BYTES):
+        self.f = f
+        self.max_rows = max_rows
+        self.max_bytes = max_bytes
+        self.row_counts = {}
+        self.statement_counts = {}
+
+    def write_table(self, table_name, rows):
+        """Consumes a ColumnTable / TableStream (or an iterable of row dicts) and returns the number of rows written."""
+        columns, rows = table_rows(rows)
+        return self.write_rows(table_name, columns, rows)
+
+    def write_rows(self, table_name, columns, rows):
+        """Writes value tuples in `columns` order (see table_rows()); returns the number of rows written."""
+        if columns is not None:
+            header = f"INSERT INTO `{table_name}` ({', '.join(f'`{col}`' for col in columns)}) VALUES\n"
+        rows_in_statement = 0
+        bytes_in_statement = 0
+        row_count = 0
+        statement_count = 0
+
+        for values in rows:
+            line = f"    ({', '.join(map(format_sql_value, values))})"
+            line_bytes = len(line.encode('utf-8'))
+
+            # Close the running statement before it grows past either limit
+            if rows_in_statement and (
+                rows_in_statement >= self.max_rows
+                or bytes_in_statement + line_bytes + 2 > self.max_bytes
+            ):
+                self.f.write(';\n\n')
+                rows_in_statement = 0
+
+            if rows_in_statement == 0:
+                self.f.write(header)
+                self.f.write(line)
+                bytes_in_statement = len(header.encode('utf-8')) + line_bytes
+                statement_count += 1
+            else:
+                self.f.write(',\n')
+                self.f.write(line)
+                bytes_in_statement += line_bytes + 2
+
+            rows_in_statement += 1
+            row_count += 1
+
+        if row_count:
+            self.f.write(';\n\n')
+        else:
+            self.f.write(f"-- No data generated for {table_name}\n")
+
+        self.row_counts[table_name] = row_count
+        self.statement_counts[table_name] = statement_count
+        return row_count
+
+    def write_tables(self, tables):
+        """Writes a {table_name: rows} mapping in FK-safe TABLE_ORDER."""
+        for table_name in TABLE_ORDER:
+            if table_name in tables:
+                self.write_table(table_name, tables[table_name])
+        return self.row_counts
@@ -0,0 +1,184 @@
+import argparse
+import sys
+import threading
+import time
+from datetime import datetime, timedelta
+
+import generate_data_v3 as generator
+from db_loader import mysql_connector
+
+# =================================================================
+# Capacity Stress Test: Concurrent Buyers vs. event_inventory
+# =================================================================
+# Creates one Published event with a small capacity, then lets many
+# concurrent buyers (one connection each) insert single tickets until the
+# triggers in db/automation/triggers.sql report the event sold out. Passes
+# only if exactly `capacity` tickets were sold. Needs MySQL with
+# db/schema.sql and db/automation/triggers.sql installed.
+#
+#   python seeds/stress_capacity.py --buyers 100 --capacity 500
+
+# Stock MySQL allows 151 connections; raise max_connections for bigger runs
+DEFAULT_BUYERS = 100
+DEFAULT_CAPACITY = 500
+
+# MySQL error numbers: SIGNAL from a trigger, and the two transient lock errors
+ER_SIGNAL_EXCEPTION = 1644
+ER_LOCK_WAIT_TIMEOUT = 1205
+ER_LOCK_DEADLOCK = 1213
+
+
+def create_fixture(conn, capacity, run_id):
+    """Creates an organizer, a venue and a Published event sized `capacity`; returns their ids."""
+    cursor = conn.cursor()
+    cursor.execute(
+        "INSERT INTO user (first_name, last_name, email, role, status) VALUES (%s, %s, %s, 'Organizer', 'Active')",
+        ('Stress', 'Organizer', f"stress.{run_id}@example.com"),
+    )
+    user_id = cursor.lastrowid
+    cursor.execute(
+        "INSERT INTO venue (name, capacity, address, city) VALUES (%s, %s, %s, %s)",
+        (f"Stress Venue {run_id}", capacity, '1 Load Test Way', 'Austin'),
+    )
+    venue_id = cursor.lastrowid
+    start = datetime.now().replace(microsecond=0) + timedelta(days=30)
+    cursor.execute(
+        "INSERT INTO event (organizer_id, venue_id, title, description, start_time, end_time, capacity, status) "
+        "VALUES (%s, %s, %s, %s, %s, %s, %s, 'Published')",
+        (user_id, venue_id, f"Stress On-Sale {run_id}", 'Capacity stress test', start, start + timedelta(hours=3), capacity),
+    )
+    event_id = cursor.lastrowid
+    conn.commit()
+    return user_id, venue_id, event_id
+
+
+def drop_fixture(conn, user_id, venue_id, event_id):
+    """Deletes everything the run created (tickets go with their orders)."""
+    cursor = conn.cursor()
+    cursor.execute("DELETE FROM orders WHERE user_id = %s", (user_id,))
+    cursor.execute("DELETE FROM ticket WHERE event_id = %s", (event_id,))
+    cursor.execute("DELETE FROM event WHERE event_id = %s", (event_id,))
+    cursor.execute("DELETE FROM venue WHERE venue_id = %s", (venue_id,))
+    cursor.execute("DELETE FROM user WHERE user_id = %s", (user_id,))
+    conn.commit()
+
+
+class Buyer(threading.Thread):
+    """One connection buying single tickets, one transaction each, until the event is sold out."""
+
+    def __init__(self, connect, index, run_id, user_id, event_id, start_barrier):
+        super().__init__(daemon=True)
+        self.connect = connect
+        self.index = index
+        self.run_id = run_id
+        self.user_id = user_id
+        self.event_id = event_id
+        self.start_barrier = start_barrier
+        self.sold = 0
+        self.rejected = 0
+        self.retries = 0
+        self.error = None
+
+    def run(self):
+        conn = self.connect()
+        try:
+            cursor = conn.cursor()
+            cursor.execute(
+                "INSERT INTO orders (user_id, total_amount, order_date, status) VALUES (%s, 0, NOW(), 'Completed')",
+                (self.user_id,),
+            )
+            order_id = cursor.lastrowid
+            conn.commit()
+
+            self.start_barrier.wait()
+            while True:
+                ticket_id = f"STRESS-{self.run_id}-{self.index}-{self.sold + self.retries}"
+                try:
+                    cursor.execute(
+                        "INSERT INTO ticket (ticket_id, order_id, event_id, user_id, price, status) "
+                        "VALUES (%s, %s, %s, %s, 25.00, 'Purchased')",
+                        (ticket_id, order_id, self.event_id, self.user_id),
+                    )
+                    conn.commit()
+                    self.sold += 1
+                except Exception as e:
+                    conn.rollback()
+                    code = e.args[0] if e.args else None
+                    if code == ER_SIGNAL_EXCEPTION and 'sold out' in str(e):
+                        self.rejected += 1
+                        return
+                    if code in (ER_LOCK_WAIT_TIMEOUT, ER_LOCK_DEADLOCK):
+                        self.retries += 1
+                        continue
+                    raise
+        except Exception as e:
+            self.error = e
+        finally:
+            conn.close()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Concurrent ticket buyers against one event; fails on any oversell.")
+    parser.add_argument('--buyers', type=int, default=DEFAULT_BUYERS, help="Concurrent connections (default: %(default)s)")
+    parser.add_argument('--capacity', type=int, default=DEFAULT_CAPACITY, help="Event capacity (default: %(default)s)")
+    parser.add_argument('--keep', action='store_true', help="Keep the test event and its tickets afterwards")
+    for key, value in generator.MYSQL_CONFIG.items():
+        parser.add_argument(f'--mysql-{key}', default=value)
+    args = parser.parse_args(argv)
+
+    connect = mysql_connector(**{key: getattr(args, f'mysql_{key}') for key in generator.MYSQL_CONFIG})
+    run_id = int(time.time())
+    admin = connect()
+    user_id, venue_id, event_id = create_fixture(admin, args.capacity, run_id)
+    print(f"--- Event {event_id}: capacity {args.capacity}, {args.buyers} concurrent buyers ---")
+
+    try:
+        start_barrier = threading.Barrier(args.buyers + 1, timeout=120)
+        buyers = [Buyer(connect, index, run_id, user_id, event_id, start_barrier) for index in range(args.buyers)]
+        for buyer in buyers:
+            buyer.start()
+        start_barrier.wait()
+        start = time.perf_counter()
+        for buyer in buyers:
+            buyer.join()
+        elapsed = time.perf_counter() - start
+
+        errors = [buyer.error for buyer in buyers if buyer.error]
+        sold = sum(buyer.sold for buyer in buyers)
+        cursor = admin.cursor()
+        cursor.execute(
+            "SELECT COUNT(*) FROM ticket WHERE event_id = %s AND status IN ('Purchased', 'Reserved')", (event_id,)
+        )
+        stored, = cursor.fetchone()
+        cursor.execute("SELECT remaining FROM event_inventory WHERE event_id = %s", (event_id,))
+        remaining, = cursor.fetchone()
+        admin.commit()
+
+        print(f"{'sold (committed)':<24}{sold:>10}")
+        print(f"{'tickets stored':<24}{stored:>10}")
+        print(f"{'inventory remaining':<24}{remaining:>10}")
+        print(f"{'sold-out rejections':<24}{sum(b.rejected for b in buyers):>10}")
+        print(f"{'lock retries':<24}{sum(b.retries for b in buyers):>10}")
+        print(f"{'seconds':<24}{elapsed:>10.3f}")
+        print(f"{'inserts/sec':<24}{sold / elapsed if elapsed > 0 else 0:>10.1f}")
+
+        problems = [f"buyer failed: {e}" for e in errors]
+        if stored > args.capacity:
+            problems.append(f"OVERSOLD by {stored - args.capacity}")
+        if not (sold == stored == args.capacity and remaining == 0):
+            problems.append(f"expected {args.capacity} sold / 0 remaining, got {sold} committed, {stored} stored, {remaining} remaining")
+        if problems:
+            print("\n❌ CAPACITY CHECK FAILED:")
+            for problem in problems:
+                print(f"  - {problem}")
+            return 1
+        print("\n✅ Zero oversells: exactly capacity tickets sold.")
+        return 0
+    finally:
+        if not args.keep:
+            drop_fixture(admin, user_id, venue_id, event_id)
+        admin.close()
+
+
+if __name__ == '__main__':
+    sys.exit(main())
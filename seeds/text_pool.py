@@ -0,0 +1,68 @@
+import json
+import os
+import re
+
+from faker import Faker, VERSION as FAKER_VERSION
+
+# =================================================================
+# Pre-Pooled Faker Text
+# =================================================================
+# Calling Faker once per row dominates runtime at millions of rows. Instead,
+# each text field is sampled once into a fixed-size pool (cached on disk) and
+# rows draw from the pools with NumPy index sampling.
+
+# Field name -> Faker call used to fill its pool
+POOL_FIELDS = {
+    'first_name': lambda fake: fake.first_name(),
+    'last_name': lambda fake: fake.last_name(),
+    'street_address': lambda fake: fake.street_address(),
+    'catch_phrase': lambda fake: fake.catch_phrase(),
+    'email_domain': lambda fake: fake.safe_domain_name(),
+}
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache')
+
+_EMAIL_UNSAFE = re.compile(r'[^a-z0-9.]')
+
+
+class TextPool:
+    """Fixed pools of pre-sampled Faker values, drawn from by index."""
+
+    def __init__(self, pools):
+        self.pools = pools
+
+    @classmethod
+    def build(cls, size, seed=0, locale='en_US'):
+        """Samples `size` values per field from a Faker seeded with `seed`."""
+        fake = Faker(locale)
+        fake.seed_instance(seed)
+        return cls({name: [factory(fake) for _ in range(size)] for name, factory in POOL_FIELDS.items()})
+
+    @classmethod
+    def load_or_build(cls, size, seed=0, locale='en_US', cache_dir=DEFAULT_CACHE_DIR):
+        """Loads the pools from the on-disk cache, building and caching them on first use."""
+        filename = f"text_pool_{locale}_seed{seed}_size{size}_faker{FAKER_VERSION}.json"
+        path = os.path.join(cache_dir, filename)
+
+        if os.path.exists(path):
+            with open(path, encoding='utf-8') as f:
+                return cls(json.load(f))
+
+        pool = cls.build(size, seed, locale)
+        os.makedirs(cache_dir, exist_ok=True)
+        # Write to a temp file first so a crashed run never leaves a half-written cache
+        with open(path + '.tmp', 'w', encoding='utf-8') as f:
+            json.dump(pool.pools, f)
+        os.replace(path + '.tmp', path)
+        return pool
+
+    def column(self, rng, name, size):
+        """Draws `size` values of one field with replacement."""
+        pool = self.pools[name]
+        return [pool[i] for i in rng.integers(0, len(pool), size).tolist()]
+
+
+def unique_email(first_name, last_name, user_id, domain):
+    """Builds an email that is unique by construction: the user_id is part of the local part."""
+    local = _EMAIL_UNSAFE.sub('', f"{first_name}.{last_name}".lower())
+    return f"{local}{user_id}@{domain}"
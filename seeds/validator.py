@@ -0,0 +1,504 @@
+import time
+from array import array
+from dataclasses import dataclass, field
+
+import numpy as np
+
+from columnar import CodeColumn, ColumnTable, DateTimeColumn, MappedColumn, TableStream, as_numpy
+from dataset_cache import table_chunks
+from db_loader import FOREIGN_KEYS
+from manifest import seats_left
+from sql_writer import TABLE_ORDER
+
+# =================================================================
+# Pre-Load Validation Against db/schema.sql and the Triggers
+# =================================================================
+# A row that breaks a schema rule used to surface only as an error deep into
+# a long import. The validator checks every generated table and reports every
+# violated rule at once:
+#   - ENUM columns and CHECK constraints
+#   - primary keys and UNIQUE keys (email, venue name/address/city, ...)
+#   - every FK of db_loader.FOREIGN_KEYS
+#   - the rules of db/automation/triggers.sql: no tickets for Completed or
+#     Canceled events, no more Purchased/Reserved tickets per event than it
+#     has seats left (the "sold out" check), no event larger than its venue
+# Each rule is one vectorized pass over whole columns: FKs and lookups are
+# sorted-key probes (np.searchsorted), keys are sorted once and compared with
+# their neighbours, and text keys are compared by hash first.
+#
+# Tables held in memory are checked before anything is written. Streamed
+# tables (ticket, the derived tables) are never held whole: StreamValidator
+# checks each chunk as the writer reads it, carries keys and seat counts from
+# chunk to chunk, and reports once the streams have been written. Across
+# chunks, text keys are compared by hash only.
+#
+# An append run only writes new rows; its parents come from the manifest, and
+# an existing event's new tickets are checked against the seats the manifest
+# says it has left.
+
+# ENUM columns: (rule, table, column, allowed values); ENUMs without a named CHECK go by column
+ENUM_CHECKS = [
+    ('CHK_UserRole', 'user', 'role', ('Attendee', 'Organizer', 'Admin')),
+    ('user.status ENUM', 'user', 'status', ('Active', 'Suspended')),
+    ('CHK_EventStatus', 'event', 'status', ('Draft', 'Published', 'Completed', 'Canceled')),
+    ('CHK_OrderStatus', 'orders', 'status', ('Pending', 'Completed', 'Refunded')),
+    ('CHK_TicketStatus', 'ticket', 'status', ('Reserved', 'Purchased', 'Refunded')),
+]
+
+# CHECK (column >= 0) constraints: (rule, table, column)
+NON_NEGATIVE_CHECKS = [
+    ('CHK_VenueCapacity', 'venue', 'capacity'),
+    ('CHK_EventCapacity', 'event', 'capacity'),
+    ('CHK_OrderAmount', 'orders', 'total_amount'),
+    ('CHK_TicketPrice', 'ticket', 'price'),
+    ('CHK_SalesSummaryCounts', 'event_sales_summary', 'purchased_count'),
+    ('CHK_SalesSummaryCounts', 'event_sales_summary', 'reserved_count'),
+    ('CHK_SalesSummaryCounts', 'event_sales_summary', 'refunded_count'),
+    ('CHK_InventoryRemaining', 'event_inventory', 'remaining'),
+]
+
+# Primary and UNIQUE keys: (rule, table, columns)
+UNIQUE_KEYS = [
+    ('user PRIMARY KEY', 'user', ('user_id',)),
+    ('user.email UNIQUE', 'user', ('email',)),
+    ('venue PRIMARY KEY', 'venue', ('venue_id',)),
+    ('UQ_VenueLocation', 'venue', ('name', 'address', 'city')),
+    ('category PRIMARY KEY', 'category', ('category_id',)),
+    ('UQ_CategoryName', 'category', ('name',)),
+    ('event PRIMARY KEY', 'event', ('event_id',)),
+    ('event_category PRIMARY KEY', 'event_category', ('event_id', 'category_id')),
+    ('orders PRIMARY KEY', 'orders', ('order_id',)),
+    ('ticket PRIMARY KEY', 'ticket', ('ticket_id',)),
+    ('event_sales_summary PRIMARY KEY', 'event_sales_summary', ('event_id',)),
+    ('event_inventory PRIMARY KEY', 'event_inventory', ('event_id',)),
+    ('daily_event_revenue PRIMARY KEY', 'daily_event_revenue', ('revenue_date', 'event_id')),
+]
+
+# Event statuses check_event_status_before_sale refuses to sell tickets for
+CLOSED_EVENT_STATUSES = ('Completed', 'Canceled')
+# Ticket statuses that take a seat from event_inventory
+SEAT_HOLDING_STATUSES = ('Purchased', 'Reserved')
+
+MAX_EXAMPLES = 3  # Offending rows quoted per violated rule
+
+
+class DataValidationError(ValueError):
+    """Raised when generated data breaks a schema rule; carries the full ValidationReport.
+
+    written_to names the output when the violations were found in streamed
+    tables, i.e. only after they had been written.
+    """
+
+    def __init__(self, report, written_to=None):
+        super().__init__(f"{len(report.violations)} schema rule(s) violated by {report.violation_rows} rows")
+        self.report = report
+        self.written_to = written_to
+
+
+@dataclass
+class Violation:
+    rule: str
+    table: str
+    rows: int
+    examples: list
+
+
+@dataclass
+class ValidationReport:
+    tables: int = 0
+    rows: int = 0
+    rules: int = 0
+    seconds: float = 0.0
+    violations: list = field(default_factory=list)
+
+    @property
+    def ok(self):
+        return not self.violations
+
+    @property
+    def violation_rows(self):
+        return sum(violation.rows for violation in self.violations)
+
+    def format(self):
+        lines = [f"--- Validated {self.rows} rows of {self.tables} tables against {self.rules} rules "
+                 f"in {self.seconds:.3f}s ---"]
+        for violation in self.violations:
+            lines.append(f"❌ {violation.rule} ({violation.table}): {violation.rows} rows, "
+                         f"e.g. {'; '.join(violation.examples)}")
+        if self.ok:
+            lines.append("✅ Every row passes the schema constraints and trigger rules.")
+        return '\n'.join(lines)
+
+
+# -----------------------------------------------------------------
+# Column helpers
+# -----------------------------------------------------------------
+
+
+def is_hashed(column):
+    return not isinstance(column, (range, array, MappedColumn, CodeColumn, DateTimeColumn))
+
+
+def key_array(column):
+    """int64 per row, equal for equal values; text is hashed, so equal keys still need an exact look."""
+    if isinstance(column, CodeColumn):
+        return as_numpy(column.codes).astype(np.int64)
+    if isinstance(column, DateTimeColumn):
+        return as_numpy(column.seconds)
+    if not is_hashed(column):
+        return as_numpy(column)
+    return np.fromiter(map(hash, column), dtype=np.int64, count=len(column))
+
+
+def code_column(column):
+    return column if isinstance(column, CodeColumn) else CodeColumn.encode(column)
+
+
+def lookup(keys, values):
+    """Position of every value in keys (unsorted), or -1 where a value is not a key."""
+    if not len(keys):
+        return np.full(len(values), -1, dtype=np.int64)
+    order = np.argsort(keys, kind='stable')
+    sorted_keys = keys[order]
+    at = np.minimum(np.searchsorted(sorted_keys, values), len(keys) - 1)
+    return np.where(sorted_keys[at] == values, order[at], -1)
+
+
+def row_keys(table, columns):
+    """One int64 per row for a key of one or more columns (see key_array); several columns are hashed together."""
+    keys = [key_array(table[name]) for name in columns]
+    if len(keys) == 1:
+        return keys[0]
+    return np.fromiter(map(hash, zip(*(key.tolist() for key in keys))), dtype=np.int64, count=len(table))
+
+
+def duplicate_rows(table, columns):
+    """Positions of rows whose key repeats an earlier row's key."""
+    if len(columns) == 1 and isinstance(table[columns[0]], range):
+        return np.zeros(0, dtype=np.int64)  # An id range never repeats
+    keys = [key_array(table[name]) for name in columns]
+    order = np.lexsort(keys[::-1])
+    same = np.ones(max(len(order) - 1, 0), dtype=bool)
+    for key in keys:
+        ordered = key[order]
+        same &= ordered[1:] == ordered[:-1]
+    repeats = order[1:][same]
+    if not any(is_hashed(table[name]) for name in columns) or not len(repeats):
+        return np.sort(repeats)
+    # Equal hashes: compare the actual values of the few rows involved
+    seen = set()
+    duplicates = []
+    for position in np.union1d(order[:-1][same], repeats).tolist():
+        value = tuple(table[name][position] for name in columns)
+        if value in seen:
+            duplicates.append(position)
+        seen.add(value)
+    return np.array(duplicates, dtype=np.int64)
+
+# -----------------------------------------------------------------
+# Validator
+# -----------------------------------------------------------------
+
+
+class DataValidator:
+    """Runs every rule over the ColumnTables of a {table_name: rows} mapping; streams are left to StreamValidator."""
+
+    def __init__(self, tables, base=None):
+        self.tables = {name: table for name, table in tables.items() if isinstance(table, ColumnTable) and len(table)}
+        self.base = base
+        # Tables whose rules run; any other table only serves as FK parent or event facts
+        self.checked = set(self.tables)
+        self.report = ValidationReport(tables=len(self.tables), rows=sum(len(table) for table in self.tables.values()))
+
+    def validate(self):
+        start = time.perf_counter()
+        self.run_rules()
+        self.report.seconds = time.perf_counter() - start
+        return self.report
+
+    def run_rules(self):
+        for rule, table_name, column, values in ENUM_CHECKS:
+            self.check_enum(rule, table_name, column, values)
+        for rule, table_name, column in NON_NEGATIVE_CHECKS:
+            self.check_non_negative(rule, table_name, column)
+        self.check_event_times()
+        for rule, table_name, columns in UNIQUE_KEYS:
+            self.check_unique(rule, table_name, columns)
+        for rule, child, column, parent, key in FOREIGN_KEYS:
+            self.check_foreign_key(rule, child, column, parent, key)
+        self.check_event_capacity()
+        self.check_ticket_sales()
+
+    def add(self, rule, table_name, positions, describe, rows=None):
+        """Records a rule as checked, and as violated when positions is not empty (rows defaults to their count)."""
+        self.report.rules += 1
+        if len(positions):
+            examples = [describe(position) for position in positions[:MAX_EXAMPLES].tolist()]
+            self.report.violations.append(Violation(rule, table_name, len(positions) if rows is None else rows, examples))
+
+    def describe_row(self, table_name, *columns):
+        """Formats an offending row by its first (id) column and the checked columns."""
+        table = self.tables[table_name]
+        names = list(dict.fromkeys([table.columns[0], *columns]))
+        return lambda position: ' '.join(f"{name}={table[name][position]!r}" for name in names)
+
+    def base_ids(self, table_name):
+        """Ids an append run may reference without writing them (from the manifest)."""
+        if self.base is None:
+            return []
+        if table_name == 'user':
+            return list(self.base['organizer_ids']) + list(self.base['buyer_ids'])
+        return list({
+            'venue': self.base['venue_capacities'],
+            'category': self.base['category_names'],
+            'event': self.base['open_events'],
+        }.get(table_name, ()))
+
+    def parent_keys(self, table_name, key):
+        ids = [as_numpy(self.tables[table_name][key])] if table_name in self.tables else []
+        return np.concatenate(ids + [np.array(self.base_ids(table_name), dtype=np.int64)])
+
+    def venue_capacities(self):
+        """(venue ids, capacities) of written and manifest venues."""
+        venues = self.tables.get('venue')
+        base = self.base['venue_capacities'] if self.base else {}
+        ids = [np.array(list(base), dtype=np.int64)]
+        capacities = [np.array(list(base.values()), dtype=np.int64)]
+        if venues is not None:
+            ids.append(as_numpy(venues['venue_id']))
+            capacities.append(as_numpy(venues['capacity']))
+        return np.concatenate(ids), np.concatenate(capacities)
+
+    def event_facts(self):
+        """(event ids, seats left before the tickets, closed-for-sale flags) of written and manifest events."""
+        events = self.tables.get('event')
+        base = self.base['open_events'] if self.base else {}
+        ids = [np.array(list(base), dtype=np.int64)]
+        seats = [np.array([seats_left(event) for event in base.values()], dtype=np.int64)]
+        closed = [np.array([event['status'] in CLOSED_EVENT_STATUSES for event in base.values()], dtype=bool)]
+        if events is not None:
+            status = code_column(events['status'])
+            ids.append(as_numpy(events['event_id']))
+            seats.append(as_numpy(events['capacity']))
+            closed.append(np.isin(as_numpy(status.codes), [code for code, value in enumerate(status.values)
+                                                          if value in CLOSED_EVENT_STATUSES]))
+        return np.concatenate(ids), np.concatenate(seats), np.concatenate(closed)
+
+    # --- Column rules ---
+
+    def check_enum(self, rule, table_name, column, values):
+        if table_name not in self.checked:
+            return
+        codes = code_column(self.tables[table_name][column])
+        allowed = [code for code, value in enumerate(codes.values) if value in values]
+        bad = np.flatnonzero(~np.isin(as_numpy(codes.codes), allowed))
+        self.add(rule, table_name, bad, self.describe_row(table_name, column))
+
+    def check_non_negative(self, rule, table_name, column):
+        if table_name not in self.checked:
+            return
+        bad = np.flatnonzero(as_numpy(self.tables[table_name][column]) < 0)
+        self.add(rule, table_name, bad, self.describe_row(table_name, column))
+
+    def check_event_times(self):
+        if 'event' not in self.checked:
+            return
+        events = self.tables['event']
+        bad = np.flatnonzero(as_numpy(events['start_time'].seconds) >= as_numpy(events['end_time'].seconds))
+        self.add('CHK_EventTime', 'event', bad, self.describe_row('event', 'start_time', 'end_time'))
+
+    def check_unique(self, rule, table_name, columns):
+        if table_name not in self.checked:
+            return
+        bad = duplicate_rows(self.tables[table_name], columns)
+        self.add(rule, table_name, bad, self.describe_row(table_name, *columns))
+
+    def check_foreign_key(self, rule, child, column, parent, key):
+        if child not in self.checked:
+            return
+        values = as_numpy(self.tables[child][column])
+        bad = np.flatnonzero(lookup(self.parent_keys(parent, key), values) < 0)
+        self.add(rule, child, bad, self.describe_row(child, column))
+
+    # --- Trigger rules (db/automation/triggers.sql) ---
+
+    def check_event_capacity(self):
+        """check_event_capacity_before_insert: an event holds at most its venue's capacity."""
+        if 'event' not in self.checked:
+            return
+        events = self.tables['event']
+        venue_ids, venue_capacities = self.venue_capacities()
+        at = lookup(venue_ids, as_numpy(events['venue_id']))
+        known = at >= 0  # Unknown venues are FK_EventVenue violations
+        bad = np.flatnonzero(known & (as_numpy(events['capacity']) > venue_capacities[np.maximum(at, 0)]))
+        describe_event = self.describe_row('event', 'venue_id', 'capacity')
+        capacity_of = dict(zip(venue_ids.tolist(), venue_capacities.tolist()))
+        self.add('check_event_capacity_before_insert', 'event', bad,
+                 lambda position: f"{describe_event(position)} venue capacity={capacity_of[events['venue_id'][position]]}")
+
+    def check_ticket_sales(self):
+        """check_event_status_before_sale: no tickets for Completed/Canceled events, no seat beyond those left."""
+        if 'ticket' not in self.checked:
+            return
+        self.check_sold_out(self.check_ticket_events())
+
+    def check_ticket_events(self):
+        """Flags tickets for closed events; returns the seats the tickets hold per event of event_facts()."""
+        tickets = self.tables['ticket']
+        event_ids, _, closed = self.event_facts()
+        at = lookup(event_ids, as_numpy(tickets['event_id']))
+        known = at >= 0  # Unknown events are FK_TicketEvent violations
+        bad = np.flatnonzero(known & closed[np.maximum(at, 0)])
+        describe_ticket = self.describe_row('ticket', 'event_id')
+        self.add('check_event_status_before_sale', 'ticket', bad,
+                 lambda position: f"{describe_ticket(position)} event status={self.event_status(tickets['event_id'][position])!r}")
+
+        status = code_column(tickets['status'])
+        holds_seat = np.isin(as_numpy(status.codes), [code for code, value in enumerate(status.values)
+                                                      if value in SEAT_HOLDING_STATUSES])
+        return np.bincount(at[known & holds_seat], minlength=len(event_ids))
+
+    def check_sold_out(self, held):
+        event_ids, seats, _ = self.event_facts()
+        oversold = np.flatnonzero(held > seats)
+        # The tickets past each event's seats are the ones the trigger would reject
+        self.add('check_event_status_before_sale (sold out)', 'ticket', oversold,
+                 lambda event: f"event_id={event_ids[event]} {held[event]} seats held, {seats[event]} left",
+                 rows=int((held - seats)[oversold].sum()))
+
+    def event_status(self, event_id):
+        events = self.tables.get('event')
+        if events is not None:
+            at = lookup(as_numpy(events['event_id']), np.array([event_id], dtype=np.int64))[0]
+            if at >= 0:
+                return events['status'][int(at)]
+        return self.base['open_events'][event_id]['status']
+
+
+class ChunkValidator(DataValidator):
+    """Checks the chunks of one streamed table; keys and held seats carry over from chunk to chunk.
+
+    Every stream gets its own ChunkValidator, so a writer may read several
+    streams at once (DatabaseLoader loads a stage's tables in parallel).
+    """
+
+    def __init__(self, tables, base, table_name):
+        super().__init__(tables, base)
+        self.table_name = table_name
+        self.checked = {table_name}
+        self.report = ValidationReport()
+        self.first_chunk = True
+        self.seen_keys = {}  # rule -> keys of the chunks read so far
+        self.held = None     # seats held per event_facts() event, summed over ticket chunks
+
+    def check_chunks(self, chunks):
+        for chunk in chunks:
+            start = time.perf_counter()
+            self.tables[self.table_name] = chunk
+            if self.first_chunk:
+                self.report.tables += 1
+            self.report.rows += len(chunk)
+            self.run_rules()
+            self.first_chunk = False
+            self.report.seconds += time.perf_counter() - start
+            yield chunk
+        if self.held is not None:
+            self.first_chunk = True
+            self.check_sold_out(self.held)
+
+    def add(self, rule, table_name, positions, describe, rows=None):
+        """Counts a rule on the first chunk only, and folds its violations on every chunk into one."""
+        if self.first_chunk:
+            self.report.rules += 1
+        if not len(positions):
+            return
+        examples = [describe(position) for position in positions[:MAX_EXAMPLES].tolist()]
+        rows = len(positions) if rows is None else rows
+        for violation in self.report.violations:
+            if (violation.rule, violation.table) == (rule, table_name):
+                violation.rows += rows
+                violation.examples = (violation.examples + examples)[:MAX_EXAMPLES]
+                return
+        self.report.violations.append(Violation(rule, table_name, rows, examples))
+
+    def check_unique(self, rule, table_name, columns):
+        """Also flags rows whose key an earlier chunk already had."""
+        if table_name not in self.checked:
+            return
+        table = self.tables[table_name]
+        keys = row_keys(table, columns)
+        seen = self.seen_keys.get(rule)
+        bad = duplicate_rows(table, columns)
+        if seen is not None:
+            bad = np.union1d(bad, np.flatnonzero(np.isin(keys, seen)))
+            keys = np.concatenate([seen, keys])
+        self.seen_keys[rule] = keys
+        self.add(rule, table_name, bad, self.describe_row(table_name, *columns))
+
+    def check_ticket_sales(self):
+        """Checks closed events per chunk; the seats held add up until the stream ends (see check_chunks)."""
+        if 'ticket' not in self.checked:
+            return
+        held = self.check_ticket_events()
+        self.held = held if self.held is None else self.held + held
+
+
+class StreamValidator:
+    """Checks the streamed tables of a {table_name: rows} mapping chunk by chunk while a writer reads them.
+
+    Run validate_tables() on the same mapping first: the ColumnTables are only
+    used here as FK parents and event facts. Each stream is checked by its own
+    ChunkValidator; report is complete once the writer has read every stream.
+    """
+
+    def __init__(self, tables, base=None):
+        self.tables = tables
+        self.base = base
+        self.reports = {}  # table_name -> its ChunkValidator's report
+
+    def wrap(self, tables):
+        """The mapping with every stream replaced by one that is checked as it is read."""
+        wrapped = {}
+        for table_name, rows in tables.items():
+            if rows is None or isinstance(rows, ColumnTable):
+                wrapped[table_name] = rows
+            elif isinstance(rows, TableStream):
+                wrapped[table_name] = TableStream(rows.columns, self.check_chunks(table_name, rows.chunks))
+            else:
+                wrapped[table_name] = self.check_rows(table_name, rows)
+        return wrapped
+
+    def check_chunks(self, table_name, chunks):
+        validator = ChunkValidator(self.tables, self.base, table_name)
+        self.reports[table_name] = validator.report
+        return validator.check_chunks(chunks)
+
+    def check_rows(self, table_name, rows):
+        """Checks a row-dict iterable (the derived tables) in chunks and passes the rows on."""
+        for chunk in self.check_chunks(table_name, table_chunks(rows)):
+            for values in chunk.rows():
+                yield dict(zip(chunk.columns, values))
+
+    @property
+    def report(self):
+        """All streams' reports as one, in TABLE_ORDER whatever order the writer finished them in."""
+        report = ValidationReport()
+        for table_name in TABLE_ORDER:
+            part = self.reports.get(table_name)
+            if part is None:
+                continue
+            report.tables += part.tables
+            report.rows += part.rows
+            report.rules += part.rules
+            report.seconds += part.seconds
+            report.violations.extend(part.violations)
+        return report
+
+
+def validate_tables(tables, base=None):
+    """Checks the ColumnTables of {table_name: rows} against db/schema.sql and the triggers; returns a ValidationReport.
+
+    base is an append run's manifest: the ids and events its new rows may reference.
+    Streamed tables are skipped; StreamValidator checks them while they are written.
+    """
+    return DataValidator(tables, base).validate()
@@ -0,0 +1,88 @@
+import numpy as np
+
+from columnar import CodeColumn
+
+# =================================================================
+# Vectorized Column Generation (NumPy)
+# =================================================================
+# Numeric, categorical and date columns are drawn as whole arrays in one
+# call per column. Weighted choices take the same repeated-value lists the
+# generator has always used (e.g. ['Completed'] * 7 + ['Pending'] * 2 + ...),
+# so a uniform pick over the list keeps the exact same distribution.
+# Every function returns plain Python lists (via tolist()) unless noted, so
+# rows never carry NumPy scalars into the SQL writer.
+
+
+def make_rng(seed):
+    """Creates the NumPy generator for one shard."""
+    return np.random.default_rng(seed)
+
+
+def choice_column(rng, values, size):
+    """Uniform pick from `values` (a weighted list stays weighted), size times."""
+    values = np.asarray(values)
+    return values[rng.integers(0, len(values), size)].tolist()
+
+
+def code_column(rng, values, size):
+    """choice_column() as a CodeColumn (1-byte codes); draws exactly the same picks."""
+    domain = list(dict.fromkeys(values))
+    lookup = np.array([domain.index(value) for value in values], dtype=np.uint8)
+    return CodeColumn(domain, lookup[rng.integers(0, len(values), size)])
+
+
+def randint_column(rng, low, high, size):
+    """Inclusive integer range, like random.randint(low, high)."""
+    return rng.integers(low, high + 1, size).tolist()
+
+
+def money_column(rng, low, high, size):
+    """Uniform amounts rounded to cents, like round(random.uniform(low, high), 2)."""
+    return np.round(rng.uniform(low, high, size), 2).tolist()
+
+
+def datetime_column(rng, start, end, size):
+    """Uniform datetimes between start and end, as a NumPy datetime64[s] array."""
+    start = np.datetime64(start, 's')
+    span = int((np.datetime64(end, 's') - start) / np.timedelta64(1, 's'))
+    return start + rng.integers(0, span, size).astype('timedelta64[s]')
+
+
+def skewed_start_times(rng, future_window, past_window, size, future_share=0.7):
+    """Start times split future_share / (1 - future_share) between two (start, end) windows.
+
+    Returns the datetime64 array and a boolean array marking the past ones.
+    """
+    is_future = rng.random(size) < future_share
+    future_times = datetime_column(rng, *future_window, size)
+    past_times = datetime_column(rng, *past_window, size)
+    return np.where(is_future, future_times, past_times), ~is_future
+
+
+def skewed_status_column(rng, is_past, past_statuses, future_statuses):
+    """Picks from past_statuses where is_past is set and from future_statuses elsewhere."""
+    size = len(is_past)
+    past_choice = np.asarray(past_statuses)[rng.integers(0, len(past_statuses), size)]
+    future_choice = np.asarray(future_statuses)[rng.integers(0, len(future_statuses), size)]
+    return np.where(is_past, past_choice, future_choice).tolist()
+
+
+def bounded_capacity_column(rng, venue_capacities, ratio=0.9, floor=50):
+    """Event capacities in [floor, int(venue capacity * ratio)] (tiny venues lower the floor)."""
+    upper = (np.asarray(venue_capacities, dtype=np.float64) * ratio).astype(np.int64)
+    lower = np.minimum(floor, upper)
+    return rng.integers(lower, upper + 1).tolist()
+
+
+def sample_without_replacement(rng, values, counts):
+    """For each count in {0, 1, 2}, picks that many distinct entries of values (like random.sample)."""
+    values = np.asarray(values)
+    size = len(counts)
+    first = rng.integers(0, len(values), size)
+    # Offsetting by 1..len-1 guarantees the second pick differs from the first
+    second = (first + rng.integers(1, max(len(values), 2), size)) % len(values)
+
+    samples = []
+    for count, a, b in zip(np.asarray(counts).tolist(), values[first].tolist(), values[second].tolist()):
+        samples.append([a, b][:count])
+    return samples
@@ -0,0 +1,68 @@
+import os
+import sys
+import threading
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'seeds'))
+
+from columnar import ColumnTable, TableStream, int_column  # noqa: E402
+from validator import StreamValidator  # noqa: E402
+
+CHUNKS = 4
+EVENTS_PER_CHUNK = 5
+
+
+def summary_chunk(event_ids):
+    return ColumnTable(
+        event_id=int_column(event_ids),
+        purchased_count=int_column([1] * len(event_ids)),
+        reserved_count=int_column([0] * len(event_ids)),
+        refunded_count=int_column([0] * len(event_ids)),
+    )
+
+
+def inventory_chunk(event_ids):
+    return ColumnTable(event_id=int_column(event_ids), remaining=int_column([10] * len(event_ids)))
+
+
+def event_id_chunks():
+    return [list(range(1001 + i * EVENTS_PER_CHUNK, 1001 + (i + 1) * EVENTS_PER_CHUNK)) for i in range(CHUNKS)]
+
+
+def test_streams_read_at_the_same_time_are_checked_separately():
+    event_ids = [event_id for chunk in event_id_chunks() for event_id in chunk]
+    summary_chunks = [summary_chunk(ids) for ids in event_id_chunks()]
+    # The last summary chunk repeats an event of the first one
+    summary_chunks[-1] = summary_chunk(event_id_chunks()[-1][:-1] + [1001])
+    tables = {
+        'event': ColumnTable(event_id=int_column(event_ids)),
+        'event_sales_summary': TableStream(list(summary_chunks[0].columns), iter(summary_chunks)),
+        'event_inventory': TableStream(['event_id', 'remaining'], iter(inventory_chunk(ids) for ids in event_id_chunks())),
+    }
+    validator = StreamValidator(tables)
+    wrapped = validator.wrap(tables)
+
+    # Both streams advance chunk by chunk in lockstep, like DatabaseLoader's stage threads
+    barrier = threading.Barrier(2)
+    errors = []
+
+    def consume(table_name):
+        try:
+            for _ in wrapped[table_name].chunks:
+                barrier.wait(timeout=10)
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+            barrier.abort()
+
+    threads = [threading.Thread(target=consume, args=(name,)) for name in ('event_sales_summary', 'event_inventory')]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert not errors
+    report = validator.report
+    assert report.tables == 2
+    assert report.rows == 2 * CHUNKS * EVENTS_PER_CHUNK
+    assert [(v.rule, v.table, v.rows) for v in report.violations] == [
+        ('event_sales_summary PRIMARY KEY', 'event_sales_summary', 1),
+    ]